@@ -105,43 +105,69 @@ PyAPI_FUNC(Py_ssize_t) _Py_GetAllocatedBlocks(void);
 #ifdef WITH_PYMALLOC
 #ifndef Py_LIMITED_API
 PyAPI_FUNC(void) _PyObject_DebugMallocStats(FILE *out);
+
+/* Upper bound of the number of pymalloc size classes */
+#define _PyObject_MAX_SIZE_CLASSES 64
+
+typedef struct {
+    /* arena and pool sizes in bytes */
+    size_t arena_size;
+    size_t pool_size;
+
+    /* number of arenas allocated since startup, number of arenas returned
+       to the system, peak and current number of allocated arenas */
+    size_t arenas_allocated_total;
+    size_t arenas_reclaimed;
+    size_t arenas_highwater;
+    size_t arenas_allocated_current;
+
+    /* number of empty pools in the allocated arenas */
+    size_t free_pools;
+
+    /* number of entries used in classes */
+    unsigned int nclasses;
+
+    /* per size class: block size, number of pools, number of allocated
+       and free blocks in these pools */
+    struct {
+        size_t block_size;
+        size_t pools;
+        size_t blocks;
+        size_t free_blocks;
+    } classes[_PyObject_MAX_SIZE_CLASSES];
+} _PyObject_MallocStats;
+
+/* Get statistics on the arenas and pools of pymalloc. */
+PyAPI_FUNC(void) _PyObject_GetMallocStats(_PyObject_MallocStats *stats);
 #endif /* #ifndef Py_LIMITED_API */
-#ifdef PYMALLOC_DEBUG   /* WITH_PYMALLOC && PYMALLOC_DEBUG */
-PyAPI_FUNC(void *) _PyObject_DebugMalloc(size_t nbytes);
-PyAPI_FUNC(void *) _PyObject_DebugRealloc(void *p, size_t nbytes);
-PyAPI_FUNC(void) _PyObject_DebugFree(void *p);
-PyAPI_FUNC(void) _PyObject_DebugDumpAddress(const void *p);
-PyAPI_FUNC(void) _PyObject_DebugCheckAddress(const void *p);
-PyAPI_FUNC(void *) _PyObject_DebugMallocApi(char api, size_t nbytes);
-PyAPI_FUNC(void *) _PyObject_DebugReallocApi(char api, void *p, size_t nbytes);
-PyAPI_FUNC(void) _PyObject_DebugFreeApi(char api, void *p);
-PyAPI_FUNC(void) _PyObject_DebugCheckAddressApi(char api, const void *p);
-PyAPI_FUNC(void *) _PyMem_DebugMalloc(size_t nbytes);
-PyAPI_FUNC(void *) _PyMem_DebugRealloc(void *p, size_t nbytes);
-PyAPI_FUNC(void) _PyMem_DebugFree(void *p);
-#define PyObject_MALLOC         _PyObject_DebugMalloc
-#define PyObject_Malloc         _PyObject_DebugMalloc
-#define PyObject_REALLOC        _PyObject_DebugRealloc
-#define PyObject_Realloc        _PyObject_DebugRealloc
-#define PyObject_FREE           _PyObject_DebugFree
-#define PyObject_Free           _PyObject_DebugFree
-
-#else   /* WITH_PYMALLOC && ! PYMALLOC_DEBUG */
+#endif  /* WITH_PYMALLOC */
+
 #define PyObject_MALLOC         PyObject_Malloc
 #define PyObject_REALLOC        PyObject_Realloc
 #define PyObject_FREE           PyObject_Free
-#endif
-
-#else   /* ! WITH_PYMALLOC */
-#define PyObject_MALLOC         PyMem_MALLOC
-#define PyObject_REALLOC        PyMem_REALLOC
-#define PyObject_FREE           PyMem_FREE
-
-#endif  /* WITH_PYMALLOC */
 
 #define PyObject_Del            PyObject_Free
 #define PyObject_DEL            PyObject_FREE
 
+#ifndef Py_LIMITED_API
+typedef struct {
+    /* user context passed as the first argument to the 2 functions */
+    void *ctx;
+
+    /* allocate an arena of size bytes */
+    void* (*alloc) (void *ctx, size_t size);
+
+    /* free an arena */
+    void (*free) (void *ctx, void *ptr, size_t size);
+} PyObjectArenaAllocator;
+
+/* Get the arena allocator. */
+PyAPI_FUNC(void) PyObject_GetArenaAllocator(PyObjectArenaAllocator *allocator);
+
+/* Set the arena allocator. */
+PyAPI_FUNC(void) PyObject_SetArenaAllocator(PyObjectArenaAllocator *allocator);
+#endif
+
 /*
  * Generic object allocator interface
  * ==================================
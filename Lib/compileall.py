@@ -13,27 +13,16 @@ See module py_compile for details of the actual byte-compilation.
 import os
 import sys
 import errno
+import functools
 import imp
+import io
 import py_compile
 import struct
 
 __all__ = ["compile_dir","compile_file","compile_path"]
 
-def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None,
-                quiet=False, legacy=False, optimize=-1):
-    """Byte-compile all modules in the given directory tree.
-
-    Arguments (only dir is required):
-
-    dir:       the directory to byte-compile
-    maxlevels: maximum recursion level (default 10)
-    ddir:      the directory that will be prepended to the path to the
-               file as it is compiled into each byte-code file.
-    force:     if True, force compilation, even if timestamps are up-to-date
-    quiet:     if True, be quiet during compilation
-    legacy:    if True, produce legacy pyc paths instead of PEP 3147 paths
-    optimize:  optimization level or -1 for level of the interpreter
-    """
+def _walk_dir(dir, ddir=None, maxlevels=10, quiet=False):
+    """Yield (fullname, ddir) for the files below dir, in sorted order."""
     if not quiet:
         print('Listing {!r}...'.format(dir))
     try:
@@ -42,7 +31,6 @@ def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None,
         print("Can't list {!r}".format(dir))
         names = []
     names.sort()
-    success = 1
     for name in names:
         if name == '__pycache__':
             continue
@@ -52,16 +40,90 @@ def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None,
         else:
             dfile = None
         if not os.path.isdir(fullname):
-            if not compile_file(fullname, ddir, force, rx, quiet,
-                                legacy, optimize):
-                success = 0
+            yield fullname, ddir
         elif (maxlevels > 0 and name != os.curdir and name != os.pardir and
               os.path.isdir(fullname) and not os.path.islink(fullname)):
-            if not compile_dir(fullname, maxlevels - 1, dfile, force, rx,
-                               quiet, legacy, optimize):
+            yield from _walk_dir(fullname, dfile, maxlevels - 1, quiet)
+
+def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None,
+                quiet=False, legacy=False, optimize=-1, workers=1):
+    """Byte-compile all modules in the given directory tree.
+
+    Arguments (only dir is required):
+
+    dir:       the directory to byte-compile
+    maxlevels: maximum recursion level (default 10)
+    ddir:      the directory that will be prepended to the path to the
+               file as it is compiled into each byte-code file.
+    force:     if True, force compilation, even if timestamps are up-to-date
+    quiet:     if True, be quiet during compilation
+    legacy:    if True, produce legacy pyc paths instead of PEP 3147 paths
+    optimize:  optimization level or -1 for level of the interpreter
+    workers:   maximum number of parallel workers; 0 means one per CPU
+    """
+    if workers is not None and workers < 0:
+        raise ValueError('workers must be greater or equal to 0')
+    files = _walk_dir(dir, ddir, maxlevels, quiet)
+    if workers is not None and workers != 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+        except ImportError:
+            # No multiprocessing support: compile serially
+            pass
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers or None)
+            return _compile_files_parallel(executor, files, force, rx, quiet,
+                                           legacy, optimize)
+    success = 1
+    for fullname, fddir in files:
+        if not compile_file(fullname, fddir, force, rx, quiet,
+                            legacy, optimize):
+            success = 0
+    return success
+
+def _compile_files_parallel(executor, files, force, rx, quiet, legacy,
+                            optimize):
+    files = list(files)
+    compile_one = functools.partial(_compile_file_captured, force=force,
+                                    rx=rx, quiet=quiet, legacy=legacy,
+                                    optimize=optimize,
+                                    encoding=sys.stdout.encoding)
+    success = 1
+    with executor:
+        # The results come back in order, so the output is the same as
+        # when compiling serially, whichever worker finishes first.
+        for ok, output in executor.map(compile_one,
+                                       [fullname for fullname, _ in files],
+                                       [fddir for _, fddir in files]):
+            if output:
+                sys.stdout.write(output)
+            if not ok:
                 success = 0
     return success
 
+class _CapturedOutput(io.StringIO):
+    # compile_file() needs the encoding of the real stdout to escape the
+    # error messages it prints.
+    def __init__(self, encoding):
+        super().__init__()
+        self._encoding = encoding
+
+    @property
+    def encoding(self):
+        return self._encoding
+
+def _compile_file_captured(fullname, ddir, force, rx, quiet, legacy,
+                           optimize, encoding):
+    # Run compile_file() in a worker, returning what it printed so that the
+    # parent process can output it.
+    stdout = sys.stdout
+    sys.stdout = _CapturedOutput(encoding or 'utf-8')
+    try:
+        ok = compile_file(fullname, ddir, force, rx, quiet, legacy, optimize)
+        return ok, sys.stdout.getvalue()
+    finally:
+        sys.stdout = stdout
+
 def compile_file(fullname, ddir=None, force=False, rx=None, quiet=False,
                  legacy=False, optimize=-1):
     """Byte-compile one file.
@@ -188,6 +250,9 @@ def main():
                         help=('add all the files and directories listed in '
                               'FILE to the list considered for compilation; '
                               'if "-", names are read from stdin'))
+    parser.add_argument('-j', '--workers', default=1, type=int,
+                        help=('run up to WORKERS compilations in parallel '
+                              'processes; 0 means one per CPU'))
     parser.add_argument('compile_dest', metavar='FILE|DIR', nargs='*',
                         help=('zero or more file and directory names '
                               'to compile; if no arguments given, defaults '
@@ -199,6 +264,8 @@ def main():
     if (args.ddir and (len(compile_dests) != 1
             or not os.path.isdir(compile_dests[0]))):
         parser.exit('-d destdir requires exactly one directory argument')
+    if args.workers < 0:
+        parser.error('the number of workers must be greater or equal to 0')
     if args.rx:
         import re
         args.rx = re.compile(args.rx)
@@ -224,7 +291,7 @@ def main():
                 else:
                     if not compile_dir(dest, args.maxlevels, args.ddir,
                                        args.force, args.rx, args.quiet,
-                                       args.legacy):
+                                       args.legacy, workers=args.workers):
                         success = False
             return success
         else:
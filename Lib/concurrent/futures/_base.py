@@ -4,6 +4,7 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 import collections
+import itertools
 import logging
 import threading
 import time
@@ -53,6 +54,11 @@ class TimeoutError(Error):
     """The operation exceeded the given deadline."""
     pass
 
+class BrokenExecutor(RuntimeError):
+    """
+    Raised when a executor has become non-functional after a severe failure.
+    """
+
 class _Waiter(object):
     """Provides the event that wait() and as_completed() block on."""
     def __init__(self):
@@ -135,40 +141,50 @@ class _AllCompletedWaiter(_Waiter):
         super().add_cancelled(future)
         self._decrement_pending_calls()
 
-class _AcquireFutures(object):
-    """A context manager that does an ordered acquire of Future conditions."""
-
-    def __init__(self, futures):
-        self.futures = sorted(futures, key=id)
-
-    def __enter__(self):
-        for future in self.futures:
-            future._condition.acquire()
-
-    def __exit__(self, *args):
-        for future in self.futures:
-            future._condition.release()
-
-def _create_and_install_waiters(fs, return_when):
+def _create_waiter(return_when, pending_count):
     if return_when == _AS_COMPLETED:
-        waiter = _AsCompletedWaiter()
+        return _AsCompletedWaiter()
     elif return_when == FIRST_COMPLETED:
-        waiter = _FirstCompletedWaiter()
+        return _FirstCompletedWaiter()
+    elif return_when == FIRST_EXCEPTION:
+        return _AllCompletedWaiter(pending_count, stop_on_exception=True)
+    elif return_when == ALL_COMPLETED:
+        return _AllCompletedWaiter(pending_count, stop_on_exception=False)
     else:
-        pending_count = sum(
-                f._state not in [CANCELLED_AND_NOTIFIED, FINISHED] for f in fs)
+        raise ValueError("Invalid return condition: %r" % return_when)
 
-        if return_when == FIRST_EXCEPTION:
-            waiter = _AllCompletedWaiter(pending_count, stop_on_exception=True)
-        elif return_when == ALL_COMPLETED:
-            waiter = _AllCompletedWaiter(pending_count, stop_on_exception=False)
-        else:
-            raise ValueError("Invalid return condition: %r" % return_when)
+def _install_waiter(fs, waiter):
+    """Attaches the waiter to each future in fs that is not done yet.
 
+    The futures are locked one at a time, so there is no need to hold all
+    of them at once. A future that completed since the caller last looked
+    at it is reported to the waiter directly instead.
+
+    Returns:
+        The list of futures that the waiter was attached to.
+    """
+    installed = []
     for f in fs:
-        f._waiters.append(waiter)
+        with f._lock:
+            if f._state not in [CANCELLED_AND_NOTIFIED, FINISHED]:
+                if f._waiters is None:
+                    f._waiters = []
+                f._waiters.append(waiter)
+                installed.append(f)
+                continue
+        # A done future never changes state again.
+        if f._state == CANCELLED_AND_NOTIFIED:
+            waiter.add_cancelled(f)
+        elif f._exception is not None:
+            waiter.add_exception(f)
+        else:
+            waiter.add_result(f)
+    return installed
 
-    return waiter
+def _remove_waiter(fs, waiter):
+    for f in fs:
+        with f._lock:
+            f._waiters.remove(waiter)
 
 def as_completed(fs, timeout=None):
     """An iterator over the given futures that yields each as it completes.
@@ -181,7 +197,8 @@ def as_completed(fs, timeout=None):
 
     Returns:
         An iterator that yields the given Futures as they complete (finished or
-        cancelled).
+        cancelled). If any given Futures are duplicated, they will be returned
+        once.
 
     Raises:
         TimeoutError: If the entire result iterator could not be generated
@@ -190,12 +207,16 @@ def as_completed(fs, timeout=None):
     if timeout is not None:
         end_time = timeout + time.time()
 
-    with _AcquireFutures(fs):
-        finished = set(
-                f for f in fs
-                if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
-        pending = set(fs) - finished
-        waiter = _create_and_install_waiters(fs, _AS_COMPLETED)
+    fs = set(fs)
+    total_futures = len(fs)
+    # Reading the state without the lock is fine here: a done future stays
+    # done, and _install_waiter() checks the others again under their lock.
+    finished = set(
+            f for f in fs
+            if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
+    pending = fs - finished
+    waiter = _create_waiter(_AS_COMPLETED, len(pending))
+    installed = _install_waiter(pending, waiter)
 
     try:
         yield from finished
@@ -208,7 +229,7 @@ def as_completed(fs, timeout=None):
                 if wait_timeout < 0:
                     raise TimeoutError(
                             '%d (of %d) futures unfinished' % (
-                            len(pending), len(fs)))
+                            len(pending), total_futures))
 
             waiter.event.wait(wait_timeout)
 
@@ -222,8 +243,7 @@ def as_completed(fs, timeout=None):
                 pending.remove(future)
 
     finally:
-        for f in fs:
-            f._waiters.remove(waiter)
+        _remove_waiter(installed, waiter)
 
 DoneAndNotDoneFutures = collections.namedtuple(
         'DoneAndNotDoneFutures', 'done not_done')
@@ -251,43 +271,78 @@ def wait(fs, timeout=None, return_when=ALL_COMPLETED):
         completed. The second set, named 'not_done', contains uncompleted
         futures.
     """
-    with _AcquireFutures(fs):
-        done = set(f for f in fs
-                   if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
-        not_done = set(fs) - done
-
-        if (return_when == FIRST_COMPLETED) and done:
-            return DoneAndNotDoneFutures(done, not_done)
-        elif (return_when == FIRST_EXCEPTION) and done:
-            if any(f for f in done
-                   if not f.cancelled() and f.exception() is not None):
-                return DoneAndNotDoneFutures(done, not_done)
-
-        if len(done) == len(fs):
+    fs = set(fs)
+    # See as_completed() for why the state can be read without the lock.
+    done = set(f for f in fs
+               if f._state in [CANCELLED_AND_NOTIFIED, FINISHED])
+    not_done = fs - done
+
+    if (return_when == FIRST_COMPLETED) and done:
+        return DoneAndNotDoneFutures(done, not_done)
+    elif (return_when == FIRST_EXCEPTION) and done:
+        if any(f for f in done
+               if not f.cancelled() and f.exception() is not None):
             return DoneAndNotDoneFutures(done, not_done)
 
-        waiter = _create_and_install_waiters(fs, return_when)
+    if not not_done:
+        return DoneAndNotDoneFutures(done, not_done)
 
-    waiter.event.wait(timeout)
-    for f in fs:
-        f._waiters.remove(waiter)
+    waiter = _create_waiter(return_when, len(not_done))
+    installed = _install_waiter(not_done, waiter)
+    try:
+        waiter.event.wait(timeout)
+    finally:
+        _remove_waiter(installed, waiter)
 
     done.update(waiter.finished_futures)
-    return DoneAndNotDoneFutures(done, set(fs) - done)
+    return DoneAndNotDoneFutures(done, fs - done)
 
 class Future(object):
     """Represents the result of an asynchronous computation."""
 
+    # A future is created for every submitted call, so keep it small: there
+    # is no instance dictionary, and the condition, the waiter list and the
+    # callback list are only created when something needs them.
+    __slots__ = ('_lock', '_cond', '_state', '_result', '_exception',
+                 '_waiters', '_done_callbacks', '__weakref__')
+
     def __init__(self):
         """Initializes the future. Should not be called by clients."""
-        self._condition = threading.Condition()
+        self._lock = threading.Lock()
+        self._cond = None
         self._state = PENDING
         self._result = None
         self._exception = None
-        self._waiters = []
-        self._done_callbacks = []
+        self._waiters = None
+        self._done_callbacks = None
+
+    def _get_condition(self):
+        # Must be called with self._lock held, so that a thread completing
+        # the future either sees the condition or is not yet able to run.
+        if self._cond is None:
+            self._cond = threading.Condition(self._lock)
+        return self._cond
+
+    @property
+    def _condition(self):
+        """The condition protecting the state of the future.
+
+        It is built on the future's lock and created on first use.
+        """
+        cond = self._cond
+        if cond is None:
+            with self._lock:
+                cond = self._get_condition()
+        return cond
+
+    def _notify_all(self):
+        # Must be called with self._lock held.
+        if self._cond is not None:
+            self._cond.notify_all()
 
     def _invoke_callbacks(self):
+        if not self._done_callbacks:
+            return
         for callback in self._done_callbacks:
             try:
                 callback(self)
@@ -295,7 +350,7 @@ class Future(object):
                 LOGGER.exception('exception calling callback for %r', self)
 
     def __repr__(self):
-        with self._condition:
+        with self._lock:
             if self._state == FINISHED:
                 if self._exception:
                     return '<Future at %s state=%s raised %s>' % (
@@ -317,7 +372,7 @@ class Future(object):
         Returns True if the future was cancelled, False otherwise. A future
         cannot be cancelled if it is running or has already completed.
         """
-        with self._condition:
+        with self._lock:
             if self._state in [RUNNING, FINISHED]:
                 return False
 
@@ -325,25 +380,23 @@ class Future(object):
                 return True
 
             self._state = CANCELLED
-            self._condition.notify_all()
+            self._notify_all()
 
         self._invoke_callbacks()
         return True
 
+    # Reading the state is atomic, so the queries below don't need the lock.
     def cancelled(self):
         """Return True if the future has cancelled."""
-        with self._condition:
-            return self._state in [CANCELLED, CANCELLED_AND_NOTIFIED]
+        return self._state in [CANCELLED, CANCELLED_AND_NOTIFIED]
 
     def running(self):
         """Return True if the future is currently executing."""
-        with self._condition:
-            return self._state == RUNNING
+        return self._state == RUNNING
 
     def done(self):
         """Return True of the future was cancelled or finished executing."""
-        with self._condition:
-            return self._state in [CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED]
+        return self._state in [CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED]
 
     def __get_result(self):
         if self._exception:
@@ -362,8 +415,10 @@ class Future(object):
                 cancelled then the callable will be called immediately. These
                 callables are called in the order that they were added.
         """
-        with self._condition:
+        with self._lock:
             if self._state not in [CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED]:
+                if self._done_callbacks is None:
+                    self._done_callbacks = []
                 self._done_callbacks.append(fn)
                 return
         fn(self)
@@ -384,13 +439,21 @@ class Future(object):
                 timeout.
             Exception: If the call raised then that exception will be raised.
         """
-        with self._condition:
+        # Fast path: the result is stored before the state is set to
+        # FINISHED, and a done future never changes again.
+        state = self._state
+        if state == FINISHED:
+            return self.__get_result()
+        elif state in [CANCELLED, CANCELLED_AND_NOTIFIED]:
+            raise CancelledError()
+
+        with self._lock:
             if self._state in [CANCELLED, CANCELLED_AND_NOTIFIED]:
                 raise CancelledError()
             elif self._state == FINISHED:
                 return self.__get_result()
 
-            self._condition.wait(timeout)
+            self._get_condition().wait(timeout)
 
             if self._state in [CANCELLED, CANCELLED_AND_NOTIFIED]:
                 raise CancelledError()
@@ -416,14 +479,20 @@ class Future(object):
             TimeoutError: If the future didn't finish executing before the given
                 timeout.
         """
-
-        with self._condition:
+        # See result() for the fast path.
+        state = self._state
+        if state == FINISHED:
+            return self._exception
+        elif state in [CANCELLED, CANCELLED_AND_NOTIFIED]:
+            raise CancelledError()
+
+        with self._lock:
             if self._state in [CANCELLED, CANCELLED_AND_NOTIFIED]:
                 raise CancelledError()
             elif self._state == FINISHED:
                 return self._exception
 
-            self._condition.wait(timeout)
+            self._get_condition().wait(timeout)
 
             if self._state in [CANCELLED, CANCELLED_AND_NOTIFIED]:
                 raise CancelledError()
@@ -456,12 +525,13 @@ class Future(object):
             RuntimeError: if this method was already called or if set_result()
                 or set_exception() was called.
         """
-        with self._condition:
+        with self._lock:
             if self._state == CANCELLED:
                 self._state = CANCELLED_AND_NOTIFIED
-                for waiter in self._waiters:
-                    waiter.add_cancelled(self)
-                # self._condition.notify_all() is not necessary because
+                if self._waiters:
+                    for waiter in self._waiters:
+                        waiter.add_cancelled(self)
+                # self._notify_all() is not necessary because
                 # self.cancel() triggers a notification.
                 return False
             elif self._state == PENDING:
@@ -478,12 +548,13 @@ class Future(object):
 
         Should only be used by Executor implementations and unit tests.
         """
-        with self._condition:
+        with self._lock:
             self._result = result
             self._state = FINISHED
-            for waiter in self._waiters:
-                waiter.add_result(self)
-            self._condition.notify_all()
+            if self._waiters:
+                for waiter in self._waiters:
+                    waiter.add_result(self)
+            self._notify_all()
         self._invoke_callbacks()
 
     def set_exception(self, exception):
@@ -491,12 +562,13 @@ class Future(object):
 
         Should only be used by Executor implementations and unit tests.
         """
-        with self._condition:
+        with self._lock:
             self._exception = exception
             self._state = FINISHED
-            for waiter in self._waiters:
-                waiter.add_exception(self)
-            self._condition.notify_all()
+            if self._waiters:
+                for waiter in self._waiters:
+                    waiter.add_exception(self)
+            self._notify_all()
         self._invoke_callbacks()
 
 class Executor(object):
@@ -513,7 +585,7 @@ class Executor(object):
         """
         raise NotImplementedError()
 
-    def map(self, fn, *iterables, timeout=None):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
         """Returns a iterator equivalent to map(fn, iter).
 
         Args:
@@ -521,6 +593,15 @@ class Executor(object):
                 passed iterables.
             timeout: The maximum number of seconds to wait. If None, then there
                 is no limit on the wait time.
+            chunksize: The size of the chunks the iterable will be broken into
+                before being passed to a child process. This argument is only
+                used by ProcessPoolExecutor; it is ignored by
+                ThreadPoolExecutor.
+            buffersize: The maximum number of submitted calls whose results
+                have not been yielded yet. If None, then all the calls are
+                submitted before the first result is returned; otherwise the
+                iterables are consumed lazily, one new call being submitted
+                for each result yielded.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -531,21 +612,45 @@ class Executor(object):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if buffersize is not None and buffersize < 1:
+            raise ValueError("buffersize must be None or >= 1.")
+
         if timeout is not None:
             end_time = timeout + time.time()
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        args_iter = zip(*iterables)
+        if buffersize is None:
+            fs = [self.submit(fn, *args) for args in args_iter]
+        else:
+            fs = collections.deque(
+                self.submit(fn, *args)
+                for args in itertools.islice(args_iter, buffersize))
+
+        # While calls remain to be submitted, the iterator keeps the executor
+        # alive, even if the caller no longer refers to it.
+        executor = self if buffersize is not None else None
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
         def result_iterator():
+            nonlocal executor
             try:
-                for future in fs:
+                # Reverse to pop the futures in submission order, and drop
+                # them once their result has been yielded.
+                fs.reverse()
+                while fs:
+                    if executor is not None:
+                        args = next(args_iter, None)
+                        if args is None:
+                            executor = None
+                        else:
+                            fs.appendleft(executor.submit(fn, *args))
                     if timeout is None:
-                        yield future.result()
+                        yield fs.pop().result()
                     else:
-                        yield future.result(end_time - time.time())
+                        yield fs.pop().result(end_time - time.time())
             finally:
+                executor = None
                 for future in fs:
                     future.cancel()
         return result_iterator()
@@ -49,6 +49,8 @@ import atexit
 import os
 from concurrent.futures import _base
 import queue
+from functools import partial
+import itertools
 import multiprocessing
 from multiprocessing.queues import SimpleQueue, Full
 from multiprocessing.connection import wait
@@ -95,10 +97,11 @@ class _WorkItem(object):
         self.kwargs = kwargs
 
 class _ResultItem(object):
-    def __init__(self, work_id, exception=None, result=None):
+    def __init__(self, work_id, exception=None, result=None, exit_pid=None):
         self.work_id = work_id
         self.exception = exception
         self.result = result
+        self.exit_pid = exit_pid
 
 class _CallItem(object):
     def __init__(self, work_id, fn, args, kwargs):
@@ -107,7 +110,28 @@ class _CallItem(object):
         self.args = args
         self.kwargs = kwargs
 
-def _process_worker(call_queue, result_queue):
+def _get_chunks(*iterables, chunksize):
+    """Iterates over zip()ed iterables in chunks."""
+    it = zip(*iterables)
+    while True:
+        chunk = tuple(itertools.islice(it, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+def _process_chunk(fn, chunk):
+    """Processes a chunk of an iterable passed to map.
+
+    Runs the function passed to map() on a chunk of the iterable passed to
+    map, so that the whole chunk is sent to a worker process as a single
+    call.
+
+    This function is run in a separate process.
+    """
+    return [fn(*args) for args in chunk]
+
+def _process_worker(call_queue, result_queue, initializer, initargs,
+                    max_tasks=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -117,23 +141,58 @@ def _process_worker(call_queue, result_queue):
             evaluated by the worker.
         result_queue: A multiprocessing.Queue of _ResultItems that will written
             to by the worker.
-        shutdown: A multiprocessing.Event that will be set as a signal to the
-            worker that it should exit when call_queue is empty.
+        initializer: A callable initializer, or None
+        initargs: A tuple of args for the initializer
+        max_tasks: The number of calls evaluated before the worker exits, or
+            None to never exit before the executor is shut down.
     """
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        except BaseException:
+            _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+            # The parent will notice that the process stopped and
+            # mark the pool broken
+            return
+    num_tasks = 0
+    exit_pid = None
     while True:
         call_item = call_queue.get(block=True)
         if call_item is None:
             # Wake up queue management thread
             result_queue.put(os.getpid())
             return
+        if max_tasks is not None:
+            num_tasks += 1
+            if num_tasks >= max_tasks:
+                exit_pid = os.getpid()
         try:
             r = call_item.fn(*call_item.args, **call_item.kwargs)
         except BaseException as e:
             result_queue.put(_ResultItem(call_item.work_id,
-                                         exception=e))
+                                         exception=e,
+                                         exit_pid=exit_pid))
         else:
             result_queue.put(_ResultItem(call_item.work_id,
-                                         result=r))
+                                         result=r,
+                                         exit_pid=exit_pid))
+        if exit_pid is not None:
+            # The result, sent before exiting, tells the queue management
+            # thread to replace this worker.
+            return
+
+def _start_process(processes, call_queue, result_queue, initializer,
+                   initargs, max_tasks):
+    """Starts a worker process and registers it in processes."""
+    p = multiprocessing.Process(
+            target=_process_worker,
+            args=(call_queue,
+                  result_queue,
+                  initializer,
+                  initargs,
+                  max_tasks))
+    p.start()
+    processes[p.pid] = p
 
 def _add_call_item_to_queue(pending_work_items,
                             work_ids,
@@ -177,7 +236,8 @@ def _queue_management_worker(executor_reference,
                              pending_work_items,
                              work_ids_queue,
                              call_queue,
-                             result_queue):
+                             result_queue,
+                             start_process):
     """Manages the communication between this process and the worker processes.
 
     This function is run in a local thread.
@@ -195,6 +255,8 @@ def _queue_management_worker(executor_reference,
             derived from _WorkItems for processing by the process workers.
         result_queue: A multiprocessing.Queue of _ResultItems generated by the
             process workers.
+        start_process: A callable starting a new worker process, used to
+            replace the workers exiting after max_tasks_per_child calls.
     """
     executor = None
 
@@ -216,6 +278,7 @@ def _queue_management_worker(executor_reference,
     reader = result_queue._reader
 
     while True:
+        process_exited = False
         _add_call_item_to_queue(pending_work_items,
                                 work_ids_queue,
                                 call_queue)
@@ -268,8 +331,16 @@ def _queue_management_worker(executor_reference,
                     work_item.future.set_result(result_item.result)
                 # Delete references to object. See issue16284
                 del work_item
+            if result_item.exit_pid is not None:
+                # The worker exited after max_tasks_per_child calls
+                p = processes.pop(result_item.exit_pid)
+                p.join()
+                process_exited = True
         # Check whether we should start shutting down.
         executor = executor_reference()
+        # Replace a worker which exited as long as there is work to do.
+        if process_exited and (not shutting_down() or pending_work_items):
+            start_process()
         # No more work items can be added if:
         #   - The interpreter is shutting down OR
         #   - The executor that owns this worker has been collected OR
@@ -312,7 +383,7 @@ def _check_system_limits():
     raise NotImplementedError(_system_limited)
 
 
-class BrokenProcessPool(RuntimeError):
+class BrokenProcessPool(_base.BrokenExecutor):
     """
     Raised when a process in a ProcessPoolExecutor terminated abruptly
     while a future was in the running state.
@@ -320,13 +391,20 @@ class BrokenProcessPool(RuntimeError):
 
 
 class ProcessPoolExecutor(_base.Executor):
-    def __init__(self, max_workers=None):
+    def __init__(self, max_workers=None, initializer=None, initargs=(),
+                 max_tasks_per_child=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
             max_workers: The maximum number of processes that can be used to
                 execute the given calls. If None or not given then as many
                 worker processes will be created as the machine has processors.
+            initializer: A callable used to initialize worker processes.
+            initargs: A tuple of arguments to pass to the initializer.
+            max_tasks_per_child: The maximum number of calls a worker process
+                can complete before it will exit and be replaced with a fresh
+                worker process. The default of None means worker processes
+                live as long as the executor.
         """
         _check_system_limits()
 
@@ -335,6 +413,18 @@ class ProcessPoolExecutor(_base.Executor):
         else:
             self._max_workers = max_workers
 
+        if initializer is not None and not callable(initializer):
+            raise TypeError("initializer must be a callable")
+        self._initializer = initializer
+        self._initargs = initargs
+
+        if max_tasks_per_child is not None:
+            if not isinstance(max_tasks_per_child, int):
+                raise TypeError("max_tasks_per_child must be an integer")
+            elif max_tasks_per_child <= 0:
+                raise ValueError("max_tasks_per_child must be >= 1")
+        self._max_tasks_per_child = max_tasks_per_child
+
         # Make the call queue slightly larger than the number of processes to
         # prevent the worker processes from idling. But don't make it too big
         # because futures in the call queue cannot be cancelled.
@@ -372,19 +462,26 @@ class ProcessPoolExecutor(_base.Executor):
                           self._pending_work_items,
                           self._work_ids,
                           self._call_queue,
-                          self._result_queue))
+                          self._result_queue,
+                          partial(_start_process,
+                                  self._processes,
+                                  self._call_queue,
+                                  self._result_queue,
+                                  self._initializer,
+                                  self._initargs,
+                                  self._max_tasks_per_child)))
             self._queue_management_thread.daemon = True
             self._queue_management_thread.start()
             _threads_queues[self._queue_management_thread] = self._result_queue
 
     def _adjust_process_count(self):
         for _ in range(len(self._processes), self._max_workers):
-            p = multiprocessing.Process(
-                    target=_process_worker,
-                    args=(self._call_queue,
-                          self._result_queue))
-            p.start()
-            self._processes[p.pid] = p
+            _start_process(self._processes,
+                           self._call_queue,
+                           self._result_queue,
+                           self._initializer,
+                           self._initargs,
+                           self._max_tasks_per_child)
 
     def submit(self, fn, *args, **kwargs):
         with self._shutdown_lock:
@@ -407,6 +504,40 @@ class ProcessPoolExecutor(_base.Executor):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
+    def map(self, fn, *iterables, timeout=None, chunksize=1,
+            buffersize=None):
+        """Returns an iterator equivalent to map(fn, iter).
+
+        Args:
+            fn: A callable that will take as many arguments as there are
+                passed iterables.
+            timeout: The maximum number of seconds to wait. If None, then there
+                is no limit on the wait time.
+            chunksize: If greater than one, the iterables will be chopped into
+                chunks of size chunksize and submitted to the process pool.
+                If set to one, the items in the list will be sent one at a
+                time.
+            buffersize: The maximum number of submitted chunks whose results
+                have not been yielded yet. If None, then all the chunks are
+                submitted before the first result is returned.
+
+        Returns:
+            An iterator equivalent to: map(func, *iterables) but the calls may
+            be evaluated out-of-order.
+
+        Raises:
+            TimeoutError: If the entire result iterator could not be generated
+                before the given timeout.
+            Exception: If fn(*args) raises for any values.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1.")
+
+        results = super().map(partial(_process_chunk, fn),
+                              _get_chunks(*iterables, chunksize=chunksize),
+                              timeout=timeout, buffersize=buffersize)
+        return itertools.chain.from_iterable(results)
+
     def shutdown(self, wait=True):
         with self._shutdown_lock:
             self._shutdown_thread = True
@@ -57,14 +57,39 @@ class _WorkItem(object):
         else:
             self.future.set_result(result)
 
-def _worker(executor_reference, work_queue):
+def _worker(executor_reference, work_queue, initializer, initargs,
+            idle_timeout=None):
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        except BaseException:
+            _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+            executor = executor_reference()
+            if executor is not None:
+                executor._initializer_failed()
+            return
     try:
         while True:
-            work_item = work_queue.get(block=True)
+            try:
+                work_item = work_queue.get(block=True, timeout=idle_timeout)
+            except queue.Empty:
+                executor = executor_reference()
+                if executor is None or executor._retire_idle_worker():
+                    return
+                del executor
+                continue
             if work_item is not None:
+                executor = executor_reference()
+                if executor is not None:
+                    executor._worker_started_item()
+                del executor
                 work_item.run()
                 # Delete references to object. See issue16284
                 del work_item
+                executor = executor_reference()
+                if executor is not None:
+                    executor._worker_finished_item()
+                del executor
                 continue
             executor = executor_reference()
             # Exit if:
@@ -79,22 +104,57 @@ def _worker(executor_reference, work_queue):
     except BaseException:
         _base.LOGGER.critical('Exception in worker', exc_info=True)
 
+class BrokenThreadPool(_base.BrokenExecutor):
+    """
+    Raised when a worker thread in a ThreadPoolExecutor failed initializing.
+    """
+
 class ThreadPoolExecutor(_base.Executor):
-    def __init__(self, max_workers):
+    def __init__(self, max_workers, initializer=None, initargs=(),
+                 idle_timeout=None, min_workers=0):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
             max_workers: The maximum number of threads that can be used to
                 execute the given calls.
+            initializer: A callable used to initialize worker threads.
+            initargs: A tuple of arguments to pass to the initializer.
+            idle_timeout: The number of seconds after which a thread that
+                has been waiting for work exits, unless only min_workers
+                threads are left. If None, threads never exit on their own.
+            min_workers: The number of threads that are kept alive when they
+                are idle.
         """
+        if initializer is not None and not callable(initializer):
+            raise TypeError("initializer must be a callable")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be greater than 0")
+        if not 0 <= min_workers <= max_workers:
+            raise ValueError("min_workers must be between 0 and max_workers")
+
         self._max_workers = max_workers
+        self._min_workers = min_workers
+        self._idle_timeout = idle_timeout
         self._work_queue = queue.Queue()
         self._threads = set()
+        self._broken = False
         self._shutdown = False
         self._shutdown_lock = threading.Lock()
+        self._initializer = initializer
+        self._initargs = initargs
+        # Both counters are protected by _shutdown_lock. _queued_items is the
+        # number of work items not picked up by a worker yet and _idle_workers
+        # the number of workers ready to pick one up. A worker updates both
+        # at once, so that a submit() racing with it still sees whether the
+        # queued items outnumber the idle workers.
+        self._queued_items = 0
+        self._idle_workers = 0
 
     def submit(self, fn, *args, **kwargs):
         with self._shutdown_lock:
+            if self._broken:
+                raise BrokenThreadPool(self._broken)
+
             if self._shutdown:
                 raise RuntimeError('cannot schedule new futures after shutdown')
 
@@ -102,31 +162,94 @@ class ThreadPoolExecutor(_base.Executor):
             w = _WorkItem(f, fn, args, kwargs)
 
             self._work_queue.put(w)
+            self._queued_items += 1
             self._adjust_thread_count()
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
     def _adjust_thread_count(self):
+        # Must be called with _shutdown_lock held. An idle worker will take
+        # the new work item, so only start a thread if there are none left.
+        if self._queued_items <= self._idle_workers:
+            return
+
         # When the executor gets lost, the weakref callback will wake up
         # the worker threads.
         def weakref_cb(_, q=self._work_queue):
             q.put(None)
-        # TODO(bquinlan): Should avoid creating new threads if there are more
-        # idle threads than items in the work queue.
         if len(self._threads) < self._max_workers:
             t = threading.Thread(target=_worker,
                                  args=(weakref.ref(self, weakref_cb),
-                                       self._work_queue))
+                                       self._work_queue,
+                                       self._initializer,
+                                       self._initargs,
+                                       self._idle_timeout))
             t.daemon = True
             t.start()
             self._threads.add(t)
+            self._idle_workers += 1
             _threads_queues[t] = self._work_queue
 
+    def _worker_started_item(self):
+        with self._shutdown_lock:
+            self._queued_items -= 1
+            self._idle_workers -= 1
+
+    def _worker_finished_item(self):
+        with self._shutdown_lock:
+            self._idle_workers += 1
+
+    def _retire_idle_worker(self):
+        # Called by a worker that waited idle_timeout seconds for work.
+        # Returns True if the worker should exit.
+        with self._shutdown_lock:
+            if (len(self._threads) <= self._min_workers or
+                self._idle_workers <= self._queued_items):
+                return False
+            self._threads.discard(threading.current_thread())
+            self._idle_workers -= 1
+            return True
+
+    def get_stats(self):
+        """Return a dictionary of counters describing the thread pool.
+
+        The dictionary has the following keys: ``'workers'``, the number of
+        worker threads; ``'active'``, the number of threads running a call;
+        ``'idle'``, the number of threads waiting for work; and ``'queued'``,
+        the number of calls not picked up by a thread yet.
+        """
+        with self._shutdown_lock:
+            workers = len(self._threads)
+            return {
+                'workers': workers,
+                'active': workers - self._idle_workers,
+                'idle': self._idle_workers,
+                'queued': self._queued_items,
+            }
+
+    def _initializer_failed(self):
+        with self._shutdown_lock:
+            self._broken = ('A thread initializer failed, the thread pool '
+                            'is not usable anymore')
+            # Drain work queue and mark pending futures failed
+            while True:
+                try:
+                    work_item = self._work_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if work_item is not None:
+                    work_item.future.set_exception(
+                        BrokenThreadPool(self._broken))
+            if self._shutdown:
+                # Don't lose the sentinel telling the other workers to exit
+                self._work_queue.put(None)
+
     def shutdown(self, wait=True):
         with self._shutdown_lock:
             self._shutdown = True
             self._work_queue.put(None)
+            threads = list(self._threads)
         if wait:
-            for t in self._threads:
+            for t in threads:
                 t.join()
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
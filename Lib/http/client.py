@@ -56,6 +56,15 @@ Note: this enforcement is applied by the HTTPConnection class. The
       requests cannot be placed into the pipeline until it is known that
       the server will NOT be closing the connection.
 
+A connection created with pipelining=True also accepts putrequest() in the
+Request-sent states, as long as the new request and all the requests
+still waiting for their response are idempotent (GET, HEAD, PUT, DELETE,
+OPTIONS or TRACE).  getresponse() then returns the responses in the order
+the requests were sent, each once the previous one has been read.  If a
+response closes the connection, getresponse() raises ResponseNotReady for
+each request that was pipelined behind it, and those requests must be sent
+again.
+
 Logical State                  __state            __response
 -------------                  -------            ----------
 Idle                           _CS_IDLE           None
@@ -92,6 +101,10 @@ _CS_IDLE = 'Idle'
 _CS_REQ_STARTED = 'Request-started'
 _CS_REQ_SENT = 'Request-sent'
 
+# methods whose requests may be pipelined (RFC 2616, section 8.1.2.2)
+_IDEMPOTENT_METHODS = frozenset(
+    ('GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS', 'TRACE'))
+
 # status codes
 # informational
 CONTINUE = 100
@@ -312,6 +325,12 @@ class HTTPResponse(io.RawIOBase):
         self.length = _UNKNOWN          # number of bytes left in response
         self.will_close = _UNKNOWN      # conn will close at end of response
 
+        # Called with a single argument when the response is closed: True
+        # if the whole response was read, so that the connection can carry
+        # another request, False otherwise.  Used by connection pools.
+        self._on_close = None
+        self._complete = False          # was the whole response read?
+
     def _read_status(self):
         line = str(self.fp.readline(_MAXLINE + 1), "iso-8859-1")
         if len(line) > _MAXLINE:
@@ -455,9 +474,18 @@ class HTTPResponse(io.RawIOBase):
         return True
 
     def close(self):
+        self._close_conn(complete=False)
+
+    def _close_conn(self, complete=True):
+        # Close the "file"; complete is true when the end of the response
+        # has been reached.
         if self.fp:
             self.fp.close()
             self.fp = None
+            self._complete = complete
+            callback, self._on_close = self._on_close, None
+            if callback is not None:
+                callback(complete)
 
     # These implementations are for the benefit of io.BufferedReader.
 
@@ -490,7 +518,7 @@ class HTTPResponse(io.RawIOBase):
             return b""
 
         if self._method == "HEAD":
-            self.close()
+            self._close_conn()
             return b""
 
         if amt is not None:
@@ -509,7 +537,7 @@ class HTTPResponse(io.RawIOBase):
             else:
                 s = self._safe_read(self.length)
                 self.length = 0
-            self.close()        # we read everything
+            self._close_conn()        # we read everything
             return s
 
     def readinto(self, b):
@@ -517,7 +545,7 @@ class HTTPResponse(io.RawIOBase):
             return 0
 
         if self._method == "HEAD":
-            self.close()
+            self._close_conn()
             return 0
 
         if self.chunked:
@@ -535,10 +563,10 @@ class HTTPResponse(io.RawIOBase):
         if self.length is not None:
             self.length -= n
             if not self.length:
-                self.close()
+                self._close_conn()
         else:
             if not n:
-                self.close()
+                self._close_conn()
         return n
 
     def _read_next_chunk_size(self):
@@ -592,7 +620,7 @@ class HTTPResponse(io.RawIOBase):
         self._read_and_discard_trailer()
 
         # we read everything; close the "file"
-        self.close()
+        self._close_conn()
 
         return b''.join(value)
 
@@ -633,7 +661,7 @@ class HTTPResponse(io.RawIOBase):
         self._read_and_discard_trailer()
 
         # we read everything; close the "file"
-        self.close()
+        self._close_conn()
 
         return total_bytes
 
@@ -710,6 +738,44 @@ class HTTPResponse(io.RawIOBase):
     def getcode(self):
         return self.status
 
+class _PipelineReader:
+    """The buffered reader of a pipelining connection.
+
+    Successive responses must read from the same buffer, since each one may
+    read ahead into the next.  The reader is used in place of the socket
+    when a response is created, and is closed once the connection and all
+    the responses using it have closed their file.
+    """
+
+    def __init__(self, sock):
+        self._fp = sock.makefile("rb")
+        self._users = 1     # the connection
+
+    def makefile(self, mode, bufsize=None):
+        self._users += 1
+        return _PipelineReaderFile(self)
+
+    def release(self):
+        self._users -= 1
+        if not self._users:
+            self._fp.close()
+
+
+class _PipelineReaderFile:
+    """A response's view of a _PipelineReader."""
+
+    def __init__(self, reader):
+        self._reader = reader
+
+    def __getattr__(self, name):
+        return getattr(self._reader._fp, name)
+
+    def close(self):
+        if self._reader is not None:
+            reader, self._reader = self._reader, None
+            reader.release()
+
+
 class HTTPConnection:
 
     _http_vsn = 11
@@ -721,17 +787,24 @@ class HTTPConnection:
     debuglevel = 0
 
     def __init__(self, host, port=None, strict=_strict_sentinel,
-                 timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_address=None):
+                 timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_address=None,
+                 *, pipelining=False):
         if strict is not _strict_sentinel:
             warnings.warn("the 'strict' argument isn't supported anymore; "
                 "http.client now always assumes HTTP/1.x compliant servers.",
                 DeprecationWarning, 2)
         self.timeout = timeout
         self.source_address = source_address
+        self.pipelining = pipelining
         self.sock = None
         self._buffer = []
         self.__response = None
         self.__state = _CS_IDLE
+        # methods of the requests sent, waiting for getresponse()
+        self.__pending = collections.deque()
+        # number of pipelined requests lost when the connection closed
+        self.__unanswered = 0
+        self.__reader = None
         self._method = None
         self._tunnel_host = None
         self._tunnel_port = None
@@ -812,6 +885,9 @@ class HTTPConnection:
 
     def close(self):
         """Close the connection to the HTTP server."""
+        if self.__reader:
+            self.__reader.release()
+            self.__reader = None
         if self.sock:
             self.sock.close()   # close it manually... there may be other refs
             self.sock = None
@@ -819,6 +895,25 @@ class HTTPConnection:
             self.__response.close()
             self.__response = None
         self.__state = _CS_IDLE
+        self.__pending.clear()
+        self.__unanswered = 0
+
+    def _abandon_pending(self):
+        # Close the connection; the requests waiting for a response will
+        # never get one.
+        unanswered = len(self.__pending)
+        self.close()
+        self.__unanswered = unanswered
+
+    def _forget_response(self):
+        # If a prior response has been completed, then forget about it.
+        if self.__response and self.__response.isclosed():
+            complete = getattr(self.__response, '_complete', True)
+            self.__response = None
+            if self.__pending and not complete:
+                # the rest of the response is still in the way of the
+                # responses to the pipelined requests
+                self._abandon_pending()
 
     def send(self, data):
         """Send `data' to the server.
@@ -834,28 +929,8 @@ class HTTPConnection:
 
         if self.debuglevel > 0:
             print("send:", repr(data))
-        blocksize = 8192
         if hasattr(data, "read") :
-            if self.debuglevel > 0:
-                print("sendIng a read()able")
-            encode = False
-            try:
-                mode = data.mode
-            except AttributeError:
-                # io.BytesIO and other file-like objects don't have a `mode`
-                # attribute.
-                pass
-            else:
-                if "b" not in mode:
-                    encode = True
-                    if self.debuglevel > 0:
-                        print("encoding file using iso-8859-1")
-            while 1:
-                datablock = data.read(blocksize)
-                if not datablock:
-                    break
-                if encode:
-                    datablock = datablock.encode("iso-8859-1")
+            for datablock in self._read_readable(data):
                 self.sock.sendall(datablock)
 
         try:
@@ -868,6 +943,67 @@ class HTTPConnection:
                 raise TypeError("data should be a bytes-like object "
                                 "or an iterable, got %r" % type(data))
 
+    def _read_readable(self, readable):
+        """Yield the blocks of bytes read from the file-like readable."""
+        blocksize = 8192
+        if self.debuglevel > 0:
+            print("sendIng a read()able")
+        encode = False
+        try:
+            mode = readable.mode
+        except AttributeError:
+            # io.BytesIO and other file-like objects don't have a `mode`
+            # attribute.
+            pass
+        else:
+            if "b" not in mode:
+                encode = True
+                if self.debuglevel > 0:
+                    print("encoding file using iso-8859-1")
+        while 1:
+            datablock = readable.read(blocksize)
+            if not datablock:
+                break
+            if encode:
+                datablock = datablock.encode("iso-8859-1")
+            yield datablock
+
+    def _send_chunked(self, message_body):
+        """Send message_body with the chunked transfer coding.
+
+        message_body may be a bytes-like object, a file-like object or an
+        iterable of bytes-like objects, which is sent without being held
+        in memory as a whole.
+        """
+        if hasattr(message_body, "read"):
+            chunks = self._read_readable(message_body)
+        else:
+            try:
+                memoryview(message_body)
+            except TypeError:
+                try:
+                    chunks = iter(message_body)
+                except TypeError:
+                    raise TypeError("message_body should be a bytes-like "
+                                    "object, a file or an iterable, got %r"
+                                    % type(message_body))
+            else:
+                chunks = (message_body,)
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("iso-8859-1")
+            size = memoryview(chunk).nbytes
+            if not size:
+                # an empty chunk would end the body
+                continue
+            if self.debuglevel > 0:
+                print("send chunk:", size)
+            self.send(("%X\r\n" % size).encode("ascii"))
+            self.send(chunk)
+            self.send(b"\r\n")
+        # the last chunk, with no trailer
+        self.send(b"0\r\n\r\n")
+
     def _output(self, s):
         """Add a line of output to the current request buffer.
 
@@ -875,7 +1011,7 @@ class HTTPConnection:
         """
         self._buffer.append(s)
 
-    def _send_output(self, message_body=None):
+    def _send_output(self, message_body=None, encode_chunked=False):
         """Send the currently buffered request and clear the buffer.
 
         Appends an extra \\r\\n to the buffer.
@@ -887,11 +1023,13 @@ class HTTPConnection:
         # If msg and message_body are sent in a single send() call,
         # it will avoid performance problems caused by the interaction
         # between delayed ack and the Nagle algorithm.
-        if isinstance(message_body, bytes):
+        if isinstance(message_body, bytes) and not encode_chunked:
             msg += message_body
             message_body = None
         self.send(msg)
-        if message_body is not None:
+        if message_body is not None and encode_chunked:
+            self._send_chunked(message_body)
+        elif message_body is not None:
             # message_body was not a string (i.e. it is a file), and
             # we must run the risk of Nagle.
             self.send(message_body)
@@ -907,9 +1045,7 @@ class HTTPConnection:
         """
 
         # if a prior response has been completed, then forget about it.
-        if self.__response and self.__response.isclosed():
-            self.__response = None
-
+        self._forget_response()
 
         # in certain cases, we cannot issue another request on this connection.
         # this occurs when:
@@ -928,9 +1064,15 @@ class HTTPConnection:
         # Note: if a prior response exists, then we *can* start a new request.
         #       We are not allowed to begin fetching the response to this new
         #       request, however, until that prior response is complete.
+        # With pipelining, idempotent requests may also be sent before the
+        # responses to previous idempotent requests have been received.
         #
         if self.__state == _CS_IDLE:
             self.__state = _CS_REQ_STARTED
+        elif (self.__state == _CS_REQ_SENT and self.pipelining and
+              method in _IDEMPOTENT_METHODS and
+              _IDEMPOTENT_METHODS.issuperset(self.__pending)):
+            self.__state = _CS_REQ_STARTED
         else:
             raise CannotSendRequest(self.__state)
 
@@ -1032,27 +1174,32 @@ class HTTPConnection:
         header = header + b': ' + value
         self._output(header)
 
-    def endheaders(self, message_body=None):
+    def endheaders(self, message_body=None, *, encode_chunked=False):
         """Indicate that the last header line has been sent to the server.
 
         This method sends the request to the server.  The optional message_body
         argument can be used to pass a message body associated with the
         request.  The message body will be sent in the same packet as the
         message headers if it is a string, otherwise it is sent as a separate
-        packet.
+        packet.  If encode_chunked is true, the message body is sent with
+        the chunked transfer coding; the Transfer-Encoding header must then
+        have been sent.
         """
         if self.__state == _CS_REQ_STARTED:
             self.__state = _CS_REQ_SENT
         else:
             raise CannotSendHeader()
-        self._send_output(message_body)
+        self.__pending.append(self._method)
+        self._send_output(message_body, encode_chunked=encode_chunked)
 
-    def request(self, method, url, body=None, headers={}):
+    def request(self, method, url, body=None, headers={}, *,
+                encode_chunked=False):
         """Send a complete request to the server."""
-        self._send_request(method, url, body, headers)
+        self._send_request(method, url, body, headers, encode_chunked)
 
     def _set_content_length(self, body):
-        # Set the content-length based on the body.
+        # Set the content-length based on the body.  Return False if the
+        # length of the body could not be determined.
         thelen = None
         try:
             thelen = str(len(body))
@@ -1065,10 +1212,12 @@ class HTTPConnection:
                 # Don't send a length if this failed
                 if self.debuglevel > 0: print("Cannot stat!!")
 
-        if thelen is not None:
-            self.putheader('Content-Length', thelen)
+        if thelen is None:
+            return False
+        self.putheader('Content-Length', thelen)
+        return True
 
-    def _send_request(self, method, url, body, headers):
+    def _send_request(self, method, url, body, headers, encode_chunked=False):
         # Honor explicitly requested Host: and Accept-Encoding: headers.
         header_names = dict.fromkeys([k.lower() for k in headers])
         skips = {}
@@ -1079,15 +1228,21 @@ class HTTPConnection:
 
         self.putrequest(method, url, **skips)
 
-        if body is not None and ('content-length' not in header_names):
-            self._set_content_length(body)
+        if (body is not None and 'content-length' not in header_names and
+            'transfer-encoding' not in header_names):
+            if (not self._set_content_length(body) and
+                self._http_vsn == 11):
+                # Stream bodies of unknown length (iterables, pipes...)
+                # with the chunked transfer coding.
+                self.putheader('Transfer-Encoding', 'chunked')
+                encode_chunked = True
         for hdr, value in headers.items():
             self.putheader(hdr, value)
         if isinstance(body, str):
             # RFC 2616 Section 3.7.1 says that text default has a
             # default charset of iso-8859-1.
             body = body.encode('iso-8859-1')
-        self.endheaders(body)
+        self.endheaders(body, encode_chunked=encode_chunked)
 
     def getresponse(self):
         """Get the response from the server.
@@ -1104,8 +1259,13 @@ class HTTPConnection:
         """
 
         # if a prior response has been completed, then forget about it.
-        if self.__response and self.__response.isclosed():
-            self.__response = None
+        self._forget_response()
+
+        if self.__unanswered:
+            # a pipelined request which was lost when the connection closed
+            self.__unanswered -= 1
+            raise ResponseNotReady("the connection was closed before the "
+                                   "request was answered")
 
         # if a prior response exists, then it must be completed (otherwise, we
         # cannot read this response's header to determine the connection-close
@@ -1125,19 +1285,28 @@ class HTTPConnection:
         if self.__state != _CS_REQ_SENT or self.__response:
             raise ResponseNotReady(self.__state)
 
+        sock = self.sock
+        if self.pipelining:
+            if self.__reader is None:
+                self.__reader = _PipelineReader(self.sock)
+            sock = self.__reader
+        method = self.__pending.popleft()
         if self.debuglevel > 0:
-            response = self.response_class(self.sock, self.debuglevel,
-                                           method=self._method)
+            response = self.response_class(sock, self.debuglevel,
+                                           method=method)
         else:
-            response = self.response_class(self.sock, method=self._method)
+            response = self.response_class(sock, method=method)
 
         response.begin()
         assert response.will_close != _UNKNOWN
-        self.__state = _CS_IDLE
+        if self.__pending:
+            self.__state = _CS_REQ_SENT
+        else:
+            self.__state = _CS_IDLE
 
         if response.will_close:
             # this effectively passes the connection to the response
-            self.close()
+            self._abandon_pending()
         else:
             # remember this, so we can tell when it is complete
             self.__response = response
@@ -1158,9 +1327,11 @@ else:
 
         def __init__(self, host, port=None, key_file=None, cert_file=None,
                      strict=_strict_sentinel, timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
-                     source_address=None, *, context=None, check_hostname=None):
+                     source_address=None, *, context=None, check_hostname=None,
+                     pipelining=False):
             super(HTTPSConnection, self).__init__(host, port, strict, timeout,
-                                                  source_address)
+                                                  source_address,
+                                                  pipelining=pipelining)
             self.key_file = key_file
             self.cert_file = cert_file
             if context is None:
@@ -82,25 +82,31 @@ XXX To do:
 
 __version__ = "0.6"
 
-__all__ = ["HTTPServer", "BaseHTTPRequestHandler"]
+__all__ = ["HTTPServer", "SelectorHTTPServer", "BaseHTTPRequestHandler"]
 
+import datetime
 import html
 import email.message
 import email.parser
+import email.utils
 import http.client
 import io
 import mimetypes
 import os
 import posixpath
+import re
 import select
+import selectors
 import shutil
 import socket # For gethostbyaddr()
 import socketserver
+import stat
 import sys
 import time
 import urllib.parse
 import copy
 import argparse
+import collections
 
 
 # Default error message template
@@ -138,6 +144,319 @@ class HTTPServer(socketserver.TCPServer):
         self.server_port = port
 
 
+class SelectorHTTPServer(HTTPServer):
+
+    """HTTP server handling all its connections in a single thread.
+
+    Instead of blocking on one connection at a time, the server makes
+    every accepted socket non-blocking and registers it with the
+    selector of the serve_forever() loop.  Request lines and headers
+    are parsed incrementally as bytes arrive, so an idle keep-alive
+    connection only costs its socket and a small buffer.
+
+    Once a request is complete (including a body announced with a
+    Content-Length header), the RequestHandlerClass instance runs its
+    do_*() method with rfile reading the buffered body and wfile
+    writing to a buffer that is then sent without blocking.  The
+    handler's setup(), handle() and finish() methods are not called,
+    and do_*() methods must not block, since they hold up every other
+    connection of the server.
+
+    The handler's timeout attribute, if not None, is the number of
+    seconds a connection may stay idle before the server closes it.
+
+    """
+
+    # Largest accepted request line plus headers, in bytes.
+    max_header_size = 65536 + 8192
+
+    def __init__(self, server_address, RequestHandlerClass,
+                 bind_and_activate=True):
+        """Constructor.  May be extended, do not override."""
+        HTTPServer.__init__(self, server_address, RequestHandlerClass,
+                            bind_and_activate)
+        # Maps the open connections to None, least recently active first.
+        self._connections = collections.OrderedDict()
+
+    def serve_forever(self, poll_interval=0.5):
+        try:
+            HTTPServer.serve_forever(self, poll_interval)
+        finally:
+            # The selector is gone: drop the connections it watched.
+            for conn in list(self._connections):
+                conn.close()
+
+    def process_request(self, request, client_address):
+        """Start watching the new connection for requests.
+
+        Outside of serve_forever(), e.g. when handle_request() is
+        used, the request is handled synchronously.
+        """
+        if self._selector is None:
+            HTTPServer.process_request(self, request, client_address)
+            return
+        request.setblocking(False)
+        conn = _SelectorConnection(self, request, client_address)
+        self._connections[conn] = None
+        conn.register(self._selector)
+
+    def _select_timeout(self, poll_interval):
+        # Wake up in time to close the connection that expires first.
+        timeout = self.RequestHandlerClass.timeout
+        if timeout is None or not self._connections:
+            return poll_interval
+        oldest = next(iter(self._connections))
+        expires_in = max(oldest.last_activity + timeout - time.monotonic(), 0)
+        if poll_interval is None:
+            return expires_in
+        return min(poll_interval, expires_in)
+
+    def service_actions(self):
+        """Close connections idle for longer than the handler timeout."""
+        HTTPServer.service_actions(self)
+        timeout = self.RequestHandlerClass.timeout
+        if timeout is None:
+            return
+        deadline = time.monotonic() - timeout
+        # The connections are ordered by last activity, so stop at the
+        # first one that has not expired.
+        while self._connections:
+            conn = next(iter(self._connections))
+            if conn.last_activity >= deadline:
+                break
+            conn.close()
+
+    def server_close(self):
+        HTTPServer.server_close(self)
+        for conn in list(self._connections):
+            conn.close()
+
+
+class _SelectorConnection:
+
+    """State of one connection of a SelectorHTTPServer."""
+
+    def __init__(self, server, sock, client_address):
+        self.server = server
+        self.sock = sock
+        self.client_address = client_address
+        self.selector = None
+        self.events = 0
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        # Offset of the first input byte not yet scanned for the end of
+        # the request head, and whether the request line was seen.
+        self.scanned = 0
+        self.got_requestline = False
+        # Handler of the request whose body is being read, if any.
+        self.handler = None
+        self.body_length = 0
+        self.close_when_sent = False
+        self.last_activity = time.monotonic()
+
+    def register(self, selector):
+        self.selector = selector
+        self.events = selectors.EVENT_READ
+        selector.register(self.sock, self.events, self.handle_event)
+
+    def set_events(self, events):
+        if events != self.events and self.selector is not None:
+            self.events = events
+            self.selector.modify(self.sock, events, self.handle_event)
+
+    def close(self):
+        if self.selector is not None:
+            try:
+                self.selector.unregister(self.sock)
+            except (KeyError, ValueError):
+                # The selector was closed along with serve_forever().
+                pass
+            self.selector = None
+            self.server._connections.pop(self, None)
+            self.server.shutdown_request(self.sock)
+
+    def handle_event(self, sock, events):
+        self.last_activity = time.monotonic()
+        self.server._connections.move_to_end(self)
+        if events & selectors.EVENT_WRITE:
+            self.process()
+        elif events & selectors.EVENT_READ:
+            self.receive_input()
+
+    def receive_input(self):
+        try:
+            data = self.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self.close()
+            return
+        if not data:
+            self.close()
+            return
+        self.inbuf += data
+        self.process()
+
+    def send_output(self):
+        """Send as much buffered output as possible.
+
+        Return True if the output buffer is now empty.
+        """
+        try:
+            sent = self.sock.send(self.outbuf)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self.close()
+            return False
+        del self.outbuf[:sent]
+        return not self.outbuf
+
+    def process(self):
+        """Send pending output and handle complete requests.
+
+        Requests are handled one at a time: the next one is only looked
+        at once the response to the previous one has been sent.
+        """
+        while self.selector is not None:
+            if self.outbuf:
+                if not self.send_output():
+                    self.set_events(selectors.EVENT_WRITE)
+                    return
+            elif self.close_when_sent:
+                self.close()
+            elif self.handler is None:
+                head = self.read_head()
+                if head is not None:
+                    self.start_request(head)
+                elif not self.close_when_sent:
+                    break
+            elif len(self.inbuf) >= self.body_length:
+                body = bytes(self.inbuf[:self.body_length])
+                del self.inbuf[:self.body_length]
+                self.finish_request(body)
+            else:
+                break
+        self.set_events(selectors.EVENT_READ)
+
+    def read_head(self):
+        """Remove the request line and headers from the input buffer.
+
+        Return them as bytes, or None if they are not complete yet.
+        """
+        buf = self.inbuf
+        while True:
+            eol = buf.find(b'\n', self.scanned)
+            if eol < 0:
+                if len(buf) > self.server.max_header_size:
+                    self.reject(431 if self.got_requestline else 414)
+                return None
+            line = buf[self.scanned:eol + 1]
+            self.scanned = eol + 1
+            if not self.got_requestline:
+                self.got_requestline = True
+                # Without an HTTP version, there are no headers to wait
+                # for; parse_request() rejects or handles the line.
+                if len(line.split()) != 3:
+                    break
+            elif line in (b'\r\n', b'\n'):
+                break
+        head = bytes(buf[:self.scanned])
+        del buf[:self.scanned]
+        self.scanned = 0
+        self.got_requestline = False
+        return head
+
+    def new_handler(self, rfile):
+        cls = self.server.RequestHandlerClass
+        handler = cls.__new__(cls)
+        handler.request = handler.connection = self.sock
+        handler.client_address = self.client_address
+        handler.server = self.server
+        handler.rfile = rfile
+        handler.wfile = io.BytesIO()
+        handler.close_connection = 1
+        return handler
+
+    def take_output(self, handler, close):
+        self.outbuf += handler.wfile.getvalue()
+        handler.wfile.seek(0)
+        handler.wfile.truncate()
+        if close:
+            self.close_when_sent = True
+
+    def reject(self, code):
+        """Answer an oversized request head with an error and close."""
+        handler = self.new_handler(io.BytesIO())
+        handler.requestline = ''
+        handler.request_version = ''
+        handler.command = ''
+        handler.send_error(code)
+        self.take_output(handler, True)
+        self.inbuf.clear()
+        self.scanned = 0
+
+    def parse_head(self, handler):
+        """Parse the request head read by handler.rfile.
+
+        Return True if the request is valid and its body should now be
+        read, False if an error was sent back (or the request line was
+        blank).
+        """
+        handler.raw_requestline = handler.rfile.readline(65537)
+        if len(handler.raw_requestline) > 65536:
+            handler.requestline = ''
+            handler.request_version = ''
+            handler.command = ''
+            handler.send_error(414)
+            return False
+        if not handler.parse_request():
+            return False
+        length = handler.headers.get('Content-Length')
+        encoding = handler.headers.get('Transfer-Encoding', 'identity')
+        if length is None and encoding.lower() != 'identity':
+            # Only bodies of known length are buffered.
+            handler.send_error(411)
+            return False
+        try:
+            self.body_length = int(length or 0)
+            if self.body_length < 0:
+                raise ValueError
+        except ValueError:
+            handler.send_error(400, "Bad Content-Length (%r)" % length)
+            return False
+        return True
+
+    def start_request(self, head):
+        handler = self.new_handler(io.BytesIO(head))
+        try:
+            if self.parse_head(handler):
+                self.handler = handler
+                # Send any "100 Continue" interim response right away.
+                self.take_output(handler, False)
+            else:
+                self.take_output(handler, True)
+        except Exception:
+            self.server.handle_error(self.sock, self.client_address)
+            self.close()
+
+    def finish_request(self, body):
+        """Run the handler method of the request."""
+        handler, self.handler = self.handler, None
+        handler.rfile = io.BytesIO(body)
+        try:
+            mname = 'do_' + handler.command
+            if not hasattr(handler, mname):
+                handler.send_error(501, "Unsupported method (%r)" %
+                                        handler.command)
+            else:
+                getattr(handler, mname)()
+            self.take_output(handler, handler.close_connection)
+        except Exception:
+            self.server.handle_error(self.sock, self.client_address)
+            self.close()
+
+
 class BaseHTTPRequestHandler(socketserver.StreamRequestHandler):
 
     """HTTP request handler base class.
@@ -664,16 +983,28 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
     The GET and HEAD requests are identical except that the HEAD
     request omits the actual contents of the file.
 
+    Files are served with ETag and Last-Modified validators, so
+    If-None-Match and If-Modified-Since requests can be answered with
+    304 (Not Modified), and a single "bytes" Range is answered with 206
+    (Partial Content).  Where possible, file data is written to the
+    connection with os.sendfile().
+
     """
 
     server_version = "SimpleHTTP/" + __version__
 
+    # The (first, last) byte offsets selected by send_head(), or None to
+    # copy the whole file.
+    _byte_range = None
+
     def do_GET(self):
         """Serve a GET request."""
         f = self.send_head()
         if f:
-            self.copyfile(f, self.wfile)
-            f.close()
+            try:
+                self.copyfile(f, self.wfile)
+            finally:
+                f.close()
 
     def do_HEAD(self):
         """Serve a HEAD request."""
@@ -692,6 +1023,7 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
         None, in which case the caller has nothing further to do.
 
         """
+        self._byte_range = None
         path = self.translate_path(self.path)
         f = None
         if os.path.isdir(path):
@@ -714,13 +1046,81 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
         except OSError:
             self.send_error(404, "File not found")
             return None
-        self.send_response(200)
-        self.send_header("Content-type", ctype)
-        fs = os.fstat(f.fileno())
-        self.send_header("Content-Length", str(fs[6]))
-        self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
-        self.end_headers()
-        return f
+        try:
+            fs = os.fstat(f.fileno())
+            size = fs.st_size
+            etag = '"%x-%x"' % (fs.st_mtime_ns, size)
+            last_modified = self.date_time_string(fs.st_mtime)
+            if self._not_modified(etag, fs.st_mtime):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", last_modified)
+                self.end_headers()
+                f.close()
+                return None
+            byte_range = None
+            if_range = self.headers.get("If-Range")
+            if (self.headers.get("Range") is not None and
+                if_range in (None, etag, last_modified)):
+                try:
+                    byte_range = _parse_byte_range(self.headers["Range"],
+                                                   size)
+                except ValueError:
+                    self.send_response(416)
+                    self.send_header("Content-Range", "bytes */%d" % size)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    f.close()
+                    return None
+            if byte_range is None:
+                self.send_response(200)
+                self.send_header("Content-Length", str(size))
+            else:
+                first, last = byte_range
+                self.send_response(206)
+                self.send_header("Content-Range",
+                                 "bytes %d-%d/%d" % (first, last, size))
+                self.send_header("Content-Length", str(last - first + 1))
+                f.seek(first)
+                self._byte_range = byte_range
+            self.send_header("Content-type", ctype)
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("ETag", etag)
+            self.send_header("Accept-Ranges", "bytes")
+            self.end_headers()
+            return f
+        except:
+            f.close()
+            raise
+
+    def _not_modified(self, etag, mtime):
+        """Return True if the request's validators match the file.
+
+        If-None-Match takes precedence over If-Modified-Since, as
+        required by RFC 2616 section 14.26.
+
+        """
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            for tag in if_none_match.split(","):
+                tag = tag.strip()
+                if tag.startswith("W/"):
+                    # Weak comparison is fine for GET and HEAD
+                    tag = tag[2:]
+                if tag == "*" or tag == etag:
+                    return True
+            return False
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is not None:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, IndexError, OverflowError, ValueError):
+                # ignore ill-formed dates
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=datetime.timezone.utc)
+            return int(mtime) <= since.timestamp()
+        return False
 
     def list_directory(self, path):
         """Helper to produce a directory listing (absent index.html).
@@ -801,13 +1201,97 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
         argument is a file object open for writing (or
         anything with a write() method).
 
+        If send_head() selected a byte range, only the bytes of that
+        range are copied.  When SOURCE is a regular file and DESTINATION
+        writes straight to the connection's socket, the data is sent
+        with os.sendfile() and never copied through user space.
+
         The only reason for overriding this would be to change
         the block size or perhaps to replace newlines by CRLF
         -- note however that this the default server uses this
         to copy binary data as well.
 
         """
-        shutil.copyfileobj(source, outputfile)
+        if self._byte_range is None:
+            count = None
+        else:
+            first, last = self._byte_range
+            count = last - first + 1
+        sock = self._sendfile_socket(source, outputfile)
+        if sock is not None:
+            offset = source.tell()
+            if count is None:
+                count = max(os.fstat(source.fileno()).st_size - offset, 0)
+            outputfile.flush()
+            if self._sendfile(sock, source, offset, count):
+                return
+        if count is None:
+            shutil.copyfileobj(source, outputfile)
+            return
+        while count > 0:
+            buf = source.read(min(count, 16*1024))
+            if not buf:
+                break
+            outputfile.write(buf)
+            count -= len(buf)
+
+    def _sendfile_socket(self, source, outputfile):
+        """Return the socket os.sendfile() can write SOURCE to, or None."""
+        if not hasattr(os, "sendfile") or outputfile is not self.wfile:
+            return None
+        raw = getattr(outputfile, "raw", outputfile)
+        if (not isinstance(raw, socket.SocketIO) or
+            not isinstance(self.connection, socket.socket) or
+            self.connection.gettimeout() == 0.0):
+            return None
+        try:
+            mode = os.fstat(source.fileno()).st_mode
+        except (AttributeError, OSError, ValueError):
+            # io.UnsupportedOperation is both an OSError and a ValueError
+            return None
+        if not stat.S_ISREG(mode):
+            return None
+        return self.connection
+
+    def _sendfile(self, sock, source, offset, count):
+        """Send COUNT bytes of SOURCE, starting at OFFSET, to SOCK.
+
+        Return False if os.sendfile() refused the descriptors before
+        anything was sent, so that the caller can fall back to copying.
+
+        """
+        start = offset
+        timeout = sock.gettimeout()
+        selector = None
+        try:
+            while count > 0:
+                try:
+                    sent = os.sendfile(sock.fileno(), source.fileno(),
+                                       offset, min(count, _SENDFILE_BLOCKSIZE))
+                except InterruptedError:
+                    continue
+                except BlockingIOError:
+                    # sockets with a timeout are non-blocking at the OS level
+                    if selector is None:
+                        selector = selectors.DefaultSelector()
+                        selector.register(sock, selectors.EVENT_WRITE)
+                    if not selector.select(timeout) and timeout is not None:
+                        raise socket.timeout("timed out")
+                    continue
+                except OSError:
+                    if offset == start:
+                        return False
+                    raise
+                if sent == 0:
+                    # the file was truncated under us
+                    break
+                offset += sent
+                count -= sent
+            return True
+        finally:
+            if selector is not None:
+                selector.close()
+            source.seek(offset)
 
     def guess_type(self, path):
         """Guess the type of a file.
@@ -844,6 +1328,44 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
         })
 
 
+# Maximum number of bytes handed to a single os.sendfile() call
+_SENDFILE_BLOCKSIZE = 1 << 30
+
+_byte_range_re = re.compile(r'bytes\s*=\s*(\d*)\s*-\s*(\d*)$',
+                            re.ASCII | re.IGNORECASE)
+
+def _parse_byte_range(value, size):
+    """Parse a Range header value for an entity of SIZE bytes.
+
+    Return a (first, last) tuple of inclusive byte offsets, or None if
+    the header must be ignored because it is syntactically invalid or
+    asks for several ranges (multipart/byteranges responses are not
+    supported).  Raise ValueError if the range cannot be satisfied.
+
+    """
+    m = _byte_range_re.match(value.strip())
+    if m is None:
+        return None
+    first, last = m.groups()
+    if not first:
+        if not last:
+            return None
+        # suffix range: the final LAST bytes of the entity
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise ValueError("unsatisfiable range: %r" % value)
+        return max(size - suffix, 0), size - 1
+    first = int(first)
+    last = int(last) if last else None
+    if last is not None and last < first:
+        return None
+    if first >= size:
+        raise ValueError("unsatisfiable range: %r" % value)
+    if last is None or last >= size:
+        last = size - 1
+    return first, last
+
+
 # Utilities for CGIHTTPRequestHandler
 
 def _url_collapse_path(path):
@@ -846,19 +846,14 @@ class _LoaderBasics:
         # propagate even when source is available.
         return data[12:]
 
-    @module_for_loader
-    def _load_module(self, module, *, sourceless=False):
-        """Helper for load_module able to handle either source or sourceless
-        loading."""
+    def _init_module_attrs(self, module):
+        """Set the import-related attributes of the module (__file__,
+        __cached__, __package__, __path__ and __loader__)."""
         name = module.__name__
-        code_object = self.get_code(name)
         module.__file__ = self.get_filename(name)
-        if not sourceless:
-            try:
-                module.__cached__ = cache_from_source(module.__file__)
-            except NotImplementedError:
-                module.__cached__ = module.__file__
-        else:
+        try:
+            module.__cached__ = cache_from_source(module.__file__)
+        except NotImplementedError:
             module.__cached__ = module.__file__
         module.__package__ = name
         if self.is_package(name):
@@ -866,7 +861,18 @@ class _LoaderBasics:
         else:
             module.__package__ = module.__package__.rpartition('.')[0]
         module.__loader__ = self
+
+    def exec_module(self, module):
+        """Execute the module's code in the module's namespace."""
+        code_object = self.get_code(module.__name__)
         _call_with_frames_removed(exec, code_object, module.__dict__)
+
+    @module_for_loader
+    def _load_module(self, module):
+        """Helper for load_module able to handle either source or sourceless
+        loading."""
+        self._init_module_attrs(module)
+        self.exec_module(module)
         return module
 
 
@@ -1093,7 +1099,11 @@ class SourcelessFileLoader(FileLoader, _LoaderBasics):
     """Loader which handles sourceless file imports."""
 
     def load_module(self, fullname):
-        return self._load_module(fullname, sourceless=True)
+        return self._load_module(fullname)
+
+    def _init_module_attrs(self, module):
+        super()._init_module_attrs(module)
+        module.__cached__ = module.__file__
 
     def get_code(self, fullname):
         path = self.get_filename(fullname)
@@ -1232,6 +1242,57 @@ class NamespaceLoader:
         return module
 
 
+# Directory index #############################################################
+
+# An optional on-disk snapshot of directory listings, named by the
+# PYTHONIMPORTINDEX environment variable and written by
+# importlib.util.write_path_index().  It maps directory paths to
+# (mtime, file names, directory names) tuples; FileFinder only trusts an
+# entry while the directory's mtime is unchanged, and then uses it instead
+# of listing the directory and stat()ing the candidate files.
+
+_PATH_INDEX_MAGIC = b'PYIX\x01\x00\r\n'
+
+_path_index = None
+
+
+def _path_index_filename():
+    """Return the name of the directory index file, or None."""
+    if sys.flags.ignore_environment:
+        return None
+    if _os.__name__ == 'nt':
+        return _os.environ.get('PYTHONIMPORTINDEX') or None
+    return _os.environ.get(b'PYTHONIMPORTINDEX') or None
+
+
+def _get_path_index():
+    """Return the directory index, reading it on first use.
+
+    A missing or invalid index file gives an empty index.
+
+    """
+    global _path_index
+    if _path_index is None:
+        index = {}
+        filename = _path_index_filename()
+        if filename is not None:
+            try:
+                with _io.FileIO(filename, 'r') as file:
+                    data = file.read()
+            except OSError:
+                data = b''
+            if data[:len(_PATH_INDEX_MAGIC)] == _PATH_INDEX_MAGIC:
+                try:
+                    loaded = marshal.loads(data[len(_PATH_INDEX_MAGIC):])
+                except (EOFError, ValueError, TypeError):
+                    pass
+                else:
+                    if isinstance(loaded, dict):
+                        index = loaded
+        _path_index = index
+    return _path_index
+
+
 # Finders #####################################################################
 
 class PathFinder:
@@ -1241,7 +1302,10 @@ class PathFinder:
     @classmethod
     def invalidate_caches(cls):
         """Call the invalidate_caches() method on all path entry finders
-        stored in sys.path_importer_caches (where implemented)."""
+        stored in sys.path_importer_caches (where implemented), and forget
+        the directory index so that it is read again."""
+        global _path_index
+        _path_index = None
         for finder in sys.path_importer_cache.values():
             if hasattr(finder, 'invalidate_caches'):
                 finder.invalidate_caches()
@@ -1347,6 +1411,10 @@ class FileFinder:
         self._path_mtime = -1
         self._path_cache = set()
         self._relaxed_path_cache = set()
+        # Names of the files and directories in the path, when known from the
+        # directory index
+        self._path_files = None
+        self._path_dirs = None
 
     def invalidate_caches(self):
         """Invalidate the directory mtime."""
@@ -1364,19 +1432,22 @@ class FileFinder:
         except OSError:
             mtime = -1
         if mtime != self._path_mtime:
-            self._fill_cache()
+            self._fill_cache(mtime)
             self._path_mtime = mtime
         # tail_module keeps the original casing, for __file__ and friends
         if _relax_case():
             cache = self._relaxed_path_cache
             cache_module = tail_module.lower()
+            indexed = False
         else:
             cache = self._path_cache
             cache_module = tail_module
+            indexed = self._path_dirs is not None
         # Check if the module is the name of a directory (and thus a package).
         if cache_module in cache:
             base_path = _path_join(self.path, tail_module)
-            if _path_isdir(base_path):
+            if (cache_module in self._path_dirs if indexed
+                    else _path_isdir(base_path)):
                 for suffix, loader in self._loaders:
                     init_filename = '__init__' + suffix
                     full_path = _path_join(base_path, init_filename)
@@ -1390,20 +1461,35 @@ class FileFinder:
         for suffix, loader in self._loaders:
             if cache_module + suffix in cache:
                 full_path = _path_join(self.path, tail_module + suffix)
-                if _path_isfile(full_path):
+                if (cache_module + suffix in self._path_files if indexed
+                        else _path_isfile(full_path)):
                     return (loader(fullname, full_path), [])
         if is_namespace:
             return (None, [base_path])
         return (None, [])
 
-    def _fill_cache(self):
-        """Fill the cache of potential modules and packages for this directory."""
+    def _fill_cache(self, mtime=None):
+        """Fill the cache of potential modules and packages for this directory.
+
+        If the directory index has an entry for the directory matching its
+        current *mtime*, the directory is not listed again.
+
+        """
         path = self.path
-        try:
-            contents = _os.listdir(path)
-        except FileNotFoundError:
-            # Directory has been removed since last import
-            contents = []
+        self._path_files = self._path_dirs = None
+        entry = _get_path_index().get(path) if mtime is not None else None
+        if entry is not None and entry[0] == mtime:
+            contents = entry[1] | entry[2]
+            # The file names can't be used as is with case-insensitive
+            # suffixes
+            if not sys.platform.startswith('win'):
+                self._path_files, self._path_dirs = entry[1], entry[2]
+        else:
+            try:
+                contents = _os.listdir(path)
+            except FileNotFoundError:
+                # Directory has been removed since last import
+                contents = []
         # We store two cached versions, to handle runtime changes of the
         # PYTHONCASEOK environment variable.
         if not sys.platform.startswith('win'):
@@ -1438,7 +1524,9 @@ class FileFinder:
         """
         def path_hook_for_FileFinder(path):
             """Path hook for importlib.machinery.FileFinder."""
-            if not _path_isdir(path):
+            # Directories in the index are not checked again: FileFinder
+            # copes with them disappearing
+            if path not in _get_path_index() and not _path_isdir(path):
                 raise ImportError("only directories are supported", path=path)
             return cls(path, *loader_details)
 
@@ -4,6 +4,13 @@ from ._bootstrap import module_for_loader
 from ._bootstrap import set_loader
 from ._bootstrap import set_package
 from ._bootstrap import _resolve_name
+from ._bootstrap import _PATH_INDEX_MAGIC, _write_atomic
+
+import marshal
+import os
+import stat
+import sys
+import types
 
 
 def resolve_name(name, package):
@@ -19,3 +26,139 @@ def resolve_name(name, package):
             break
         level += 1
     return _resolve_name(name[level:], package, level)
+
+
+def _index_directory(path, index):
+    try:
+        # Taken before listing, so that a concurrent change invalidates
+        # the entry
+        mtime = os.stat(path).st_mtime
+        names = os.listdir(path)
+    except OSError:
+        return
+    files = set()
+    dirs = set()
+    for name in names:
+        try:
+            mode = os.stat(os.path.join(path, name)).st_mode
+        except OSError:
+            continue
+        if stat.S_ISDIR(mode):
+            dirs.add(name)
+        elif stat.S_ISREG(mode):
+            files.add(name)
+    index[path] = (mtime, frozenset(files), frozenset(dirs))
+    for name in sorted(dirs):
+        subdir = os.path.join(path, name)
+        # Only directories which can be packages are descended into
+        if name.isidentifier() and not os.path.islink(subdir):
+            _index_directory(subdir, index)
+
+
+def write_path_index(filename, paths=None):
+    """Write a directory index for the import system to filename.
+
+    The index records the contents of the directories in paths (sys.path by
+    default) and of the potential package directories below them.  It is
+    used when the PYTHONIMPORTINDEX environment variable names filename.
+
+    """
+    if paths is None:
+        paths = sys.path
+    index = {}
+    for path in paths:
+        # The current directory is not indexed, it depends on the process
+        if isinstance(path, str) and path and path not in index:
+            _index_directory(path, index)
+    _write_atomic(filename, _PATH_INDEX_MAGIC + marshal.dumps(index))
+
+
+class _Module(types.ModuleType):
+
+    """The class a lazy module switches to once it has been loaded."""
+
+
+class _LazyModule(_Module):
+
+    """A module whose code is executed upon first attribute access."""
+
+    def __getattribute__(self, attr):
+        """Trigger the load of the module and return the attribute.
+
+        Attributes already present in the namespace, i.e. the ones set by the
+        loader before execution, are returned without triggering the load so
+        that the import system can inspect the module.
+
+        """
+        namespace = object.__getattribute__(self, '__dict__')
+        if attr in namespace:
+            return namespace[attr]
+        # Stop triggering this method.
+        self.__class__ = _Module
+        name = namespace['__name__']
+        namespace['__initializing__'] = True
+        try:
+            namespace['__loader__'].exec_module(self)
+        except:
+            if sys.modules.get(name) is self:
+                del sys.modules[name]
+            raise
+        finally:
+            namespace['__initializing__'] = False
+        return getattr(self, attr)
+
+    def __delattr__(self, attr):
+        """Trigger the load and then perform the deletion."""
+        # To trigger the load and raise an exception if the attribute
+        # doesn't exist.
+        self.__getattribute__(attr)
+        delattr(self, attr)
+
+
+class LazyLoader:
+
+    """A loader that creates a module which defers its execution until the
+    first attribute access."""
+
+    @staticmethod
+    def __check_eager_loader(loader):
+        if not hasattr(loader, 'exec_module'):
+            raise TypeError('loader must define exec_module()')
+
+    @classmethod
+    def factory(cls, loader):
+        """Construct a callable which returns the lazy loader wrapping an
+        instance of loader."""
+        cls.__check_eager_loader(loader)
+        return lambda *args, **kwargs: cls(loader(*args, **kwargs))
+
+    def __init__(self, loader):
+        self.__check_eager_loader(loader)
+        self.loader = loader
+
+    def load_module(self, fullname):
+        """Create the module and put it in sys.modules without executing it.
+
+        A module which is already in sys.modules is reloaded eagerly by the
+        wrapped loader.
+
+        """
+        if fullname in sys.modules:
+            return self.loader.load_module(fullname)
+        module = _LazyModule(fullname)
+        init_module_attrs = getattr(self.loader, '_init_module_attrs', None)
+        if init_module_attrs is not None:
+            init_module_attrs(module)
+        else:
+            module.__loader__ = self.loader
+            try:
+                is_package = self.loader.is_package(fullname)
+            except (ImportError, AttributeError):
+                pass
+            else:
+                module.__package__ = fullname
+                if not is_package:
+                    module.__package__ = fullname.rpartition('.')[0]
+        module.__initializing__ = False
+        sys.modules[fullname] = module
+        return module
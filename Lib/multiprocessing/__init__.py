@@ -24,7 +24,8 @@ __all__ = [
     'allow_connection_pickling', 'BufferTooShort', 'TimeoutError',
     'Lock', 'RLock', 'Semaphore', 'BoundedSemaphore', 'Condition',
     'Event', 'Barrier', 'Queue', 'SimpleQueue', 'JoinableQueue', 'Pool',
-    'Value', 'Array', 'RawValue', 'RawArray', 'SUBDEBUG', 'SUBWARNING',
+    'Value', 'Array', 'RawValue', 'RawArray', 'SharedMemory', 'SharedArray',
+    'SUBDEBUG', 'SUBWARNING',
     ]
 
 __author__ = 'R. Oudkerk (r.m.oudkerk@gmail.com)'
@@ -221,12 +222,13 @@ def SimpleQueue():
     from multiprocessing.queues import SimpleQueue
     return SimpleQueue()
 
-def Pool(processes=None, initializer=None, initargs=(), maxtasksperchild=None):
+def Pool(processes=None, initializer=None, initargs=(), maxtasksperchild=None,
+         scheduling='static'):
     '''
     Returns a process pool object
     '''
     from multiprocessing.pool import Pool
-    return Pool(processes, initializer, initargs, maxtasksperchild)
+    return Pool(processes, initializer, initargs, maxtasksperchild, scheduling)
 
 def RawValue(typecode_or_type, *args):
     '''
@@ -256,6 +258,20 @@ def Array(typecode_or_type, size_or_initializer, *, lock=True):
     from multiprocessing.sharedctypes import Array
     return Array(typecode_or_type, size_or_initializer, lock=lock)
 
+def SharedMemory(name=None, create=False, size=0):
+    '''
+    Returns a named shared memory segment
+    '''
+    from multiprocessing.heap import SharedMemory
+    return SharedMemory(name, create, size)
+
+def SharedArray(typecode, size_or_initializer, *, name=None):
+    '''
+    Returns an array stored in a named shared memory segment
+    '''
+    from multiprocessing.heap import SharedArray
+    return SharedArray(typecode, size_or_initializer, name=name)
+
 #
 #
 #
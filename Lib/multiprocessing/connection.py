@@ -112,6 +112,15 @@ def address_type(address):
 
 class _ConnectionBase:
     _handle = None
+    # Buffers exposed through pickle.PickleBuffer which are at least this
+    # large are sent out-of-band by send()
+    _out_of_band_threshold = 64 * 1024
+    # A message sent by send() which carries out-of-band buffers starts with
+    # this byte, which is not a pickle opcode, followed by the number of
+    # buffers and the sizes of the pickle and of each buffer.  The whole
+    # object is still a single message, so a failure to unpickle it cannot
+    # leave its buffers behind in the pipe.
+    _out_of_band_marker = b'\xff'
 
     def __init__(self, handle, readable=True, writable=True):
         handle = handle.__index__()
@@ -203,8 +212,28 @@ class _ConnectionBase:
         self._check_closed()
         self._check_writable()
         buf = io.BytesIO()
-        ForkingPickler(buf, pickle.HIGHEST_PROTOCOL).dump(obj)
-        self._send_bytes(buf.getbuffer())
+        buffers = []
+        def buffer_callback(pickle_buffer):
+            # Large buffers are sent as separate messages following the
+            # pickle, rather than being copied into it.
+            m = pickle_buffer.raw()
+            if m.nbytes < self._out_of_band_threshold:
+                return True
+            buffers.append(m)
+            return False
+        ForkingPickler(buf, pickle.HIGHEST_PROTOCOL,
+                       buffer_callback=buffer_callback).dump(obj)
+        if not buffers:
+            self._send_bytes(buf.getbuffer())
+            return
+        sizes = [buf.tell()] + [m.nbytes for m in buffers]
+        header = (self._out_of_band_marker +
+                  struct.pack("!i%dQ" % len(sizes), len(buffers), *sizes))
+        self._send_chunks([header, buf.getbuffer()] + buffers)
+
+    def _send_chunks(self, chunks):
+        # Send the concatenation of chunks as a single message
+        self._send_bytes(b''.join(chunks))
 
     def recv_bytes(self, maxlength=None):
         """
@@ -249,7 +278,18 @@ class _ConnectionBase:
         self._check_closed()
         self._check_readable()
         buf = self._recv_bytes()
-        return pickle.loads(buf.getbuffer())
+        m = buf.getbuffer()
+        if m[:1] != self._out_of_band_marker:
+            return pickle.loads(m)
+        nbuffers, = struct.unpack_from("!i", m, 1)
+        offset = 1 + struct.calcsize("!i")
+        sizes = struct.unpack_from("!%dQ" % (nbuffers + 1), m, offset)
+        offset += struct.calcsize("!%dQ" % (nbuffers + 1))
+        views = []
+        for size in sizes:
+            views.append(m[offset:offset + size])
+            offset += size
+        return pickle.loads(views[0], buffers=views[1:])
 
     def poll(self, timeout=0.0):
         """Whether there is any input available to be read"""
@@ -397,6 +437,14 @@ class Connection(_ConnectionBase):
         if n > 0:
             self._send(buf)
 
+    def _send_chunks(self, chunks):
+        # Write the chunks one after the other instead of joining them, so
+        # that large out-of-band buffers are not copied
+        self._send(struct.pack("!i", sum(len(c) for c in chunks)))
+        for c in chunks:
+            if len(c) > 0:
+                self._send(c)
+
     def _recv_bytes(self, maxsize=None):
         buf = self._recv(4)
         size, = struct.unpack("!i", buf.getvalue())
@@ -137,8 +137,8 @@ def Manager():
 def shutdown():
     pass
 
-def Pool(processes=None, initializer=None, initargs=()):
+def Pool(processes=None, initializer=None, initargs=(), scheduling='static'):
     from multiprocessing.pool import ThreadPool
-    return ThreadPool(processes, initializer, initargs)
+    return ThreadPool(processes, initializer, initargs, scheduling)
 
 JoinableQueue = Queue
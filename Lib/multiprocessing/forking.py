@@ -35,8 +35,8 @@ from copyreg import dispatch_table
 
 class ForkingPickler(Pickler):
     _extra_reducers = {}
-    def __init__(self, *args):
-        Pickler.__init__(self, *args)
+    def __init__(self, *args, **kwds):
+        Pickler.__init__(self, *args, **kwds)
         self.dispatch_table = dispatch_table.copy()
         self.dispatch_table.update(self._extra_reducers)
     @classmethod
@@ -7,10 +7,13 @@
 # Licensed to PSF under a Contributor Agreement.
 #
 
+import array
 import bisect
 import mmap
 import os
+import struct
 import sys
+import tempfile
 import threading
 import itertools
 
@@ -18,7 +21,7 @@ import _multiprocessing
 from multiprocessing.util import Finalize, info
 from multiprocessing.forking import assert_spawning
 
-__all__ = ['BufferWrapper']
+__all__ = ['BufferWrapper', 'SharedMemory', 'SharedArray']
 
 #
 # Inheirtable class which wraps an mmap, and from which blocks can be allocated
@@ -221,3 +224,229 @@ class BufferWrapper(object):
     def create_memoryview(self):
         (arena, start, stop), size = self._state
         return memoryview(arena.buffer)[start:start+size]
+
+#
+# Named shared memory segments: unlike arenas, which can only be inherited
+# by child processes, these can be attached to by name from any process
+#
+
+class SharedMemory(object):
+    '''
+    A block of shared memory identified by a name
+
+    With *create* true a new segment of *size* bytes is created (and given
+    a unique name if *name* is None), otherwise the existing segment called
+    *name* is attached to.  The memory is available as a memoryview through
+    the *buf* attribute.  Pickling the object only transfers its name, the
+    segment is attached to again when it is unpickled.
+    '''
+
+    _counter = itertools.count()
+
+    def __init__(self, name=None, create=False, size=0):
+        if create:
+            if size <= 0:
+                raise ValueError("'size' must be a positive number when "
+                                 "creating a segment")
+        elif name is None:
+            raise ValueError("'name' can only be None when creating a segment")
+        if name is not None and (not name or os.sep in name or
+                                 (os.altsep and os.altsep in name)):
+            raise ValueError('invalid segment name: %r' % (name,))
+        self._mmap = None
+        self._open(name, create, size)
+        self.buf = memoryview(self._mmap)
+
+    @classmethod
+    def _new_name(cls):
+        return 'pym-%d-%d' % (os.getpid(), next(cls._counter))
+
+    if sys.platform == 'win32':
+
+        def _open(self, name, create, size):
+            if create:
+                while True:
+                    tagname = self._new_name() if name is None else name
+                    buffer = mmap.mmap(-1, size, tagname=tagname)
+                    if _winapi.GetLastError() == 0:
+                        break
+                    buffer.close()
+                    if name is not None:
+                        raise FileExistsError(
+                            'shared memory segment %r already exists' % name)
+            else:
+                # A mapping object cannot be queried for its size, so it
+                # must be given when attaching
+                if size <= 0:
+                    raise ValueError("'size' is required to attach to a "
+                                     "segment on Windows")
+                tagname = name
+                buffer = mmap.mmap(-1, size, tagname=tagname)
+                if _winapi.GetLastError() != _winapi.ERROR_ALREADY_EXISTS:
+                    buffer.close()
+                    raise FileNotFoundError(
+                        'no shared memory segment called %r' % name)
+            self._mmap = buffer
+            self.name = tagname
+            self.size = size
+
+        def _unlink(self):
+            # The mapping goes away with the last handle to it
+            pass
+
+    else:
+
+        # Prefer a memory backed filesystem for the segments
+        _dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+        @classmethod
+        def _path(cls, name):
+            return os.path.join(cls._dir or tempfile.gettempdir(), name)
+
+        def _open(self, name, create, size):
+            if create:
+                flags = os.O_RDWR | os.O_CREAT | os.O_EXCL
+                while True:
+                    tagname = self._new_name() if name is None else name
+                    try:
+                        fd = os.open(self._path(tagname), flags, 0o600)
+                    except FileExistsError:
+                        if name is not None:
+                            raise
+                    else:
+                        break
+                try:
+                    os.ftruncate(fd, size)
+                except:
+                    os.close(fd)
+                    os.unlink(self._path(tagname))
+                    raise
+            else:
+                tagname = name
+                fd = os.open(self._path(tagname), os.O_RDWR)
+                if size <= 0:
+                    size = os.fstat(fd).st_size
+            try:
+                self._mmap = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+            self.name = tagname
+            self.size = size
+
+        def _unlink(self):
+            os.unlink(self._path(self.name))
+
+    def close(self):
+        '''
+        Detach from the segment; it is not destroyed
+        '''
+        if self._mmap is not None:
+            self.buf.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def unlink(self):
+        '''
+        Destroy the segment once every process has closed it
+
+        No process can attach to the segment afterwards.  This should be
+        called exactly once, usually by the process which created it.
+        '''
+        self._unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __reduce__(self):
+        return self.__class__, (self.name, False, self.size)
+
+    def __repr__(self):
+        return '%s(%r, size=%d)' % (type(self).__name__, self.name, self.size)
+
+#
+# Typed array living in a named shared memory segment
+#
+
+class SharedArray(object):
+    '''
+    A one dimensional array of typecode *typecode* stored in shared memory
+
+    If *size_or_initializer* is an integer a zeroed array of that length is
+    created, otherwise it is a sequence (or array) used to initialize the
+    array.  Items are accessed through the memoryview in the *view*
+    attribute or by indexing the array.  A pickled SharedArray attaches to
+    the same memory when it is unpickled, in any process.
+    '''
+
+    def __init__(self, typecode, size_or_initializer, *, name=None,
+                 _shm=None):
+        itemsize = struct.calcsize(typecode)
+        if _shm is None:
+            if isinstance(size_or_initializer, int):
+                length, initializer = size_or_initializer, None
+            else:
+                initializer = size_or_initializer
+                length = len(initializer)
+            # Zero-length segments cannot be mapped
+            _shm = SharedMemory(name, create=True,
+                                size=max(length, 1) * itemsize)
+        else:
+            length, initializer = size_or_initializer, None
+        if length:
+            view = _shm.buf[:length * itemsize].cast(typecode)
+        else:
+            # Empty memoryviews cannot be cast
+            view = memoryview(array.array(typecode))
+        if initializer is not None:
+            view[:] = array.array(typecode, initializer)
+        self.shm = _shm
+        self.typecode = typecode
+        self.view = view
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def __len__(self):
+        return len(self.view)
+
+    def __getitem__(self, index):
+        return self.view[index]
+
+    def __setitem__(self, index, value):
+        self.view[index] = value
+
+    def tolist(self):
+        return self.view.tolist()
+
+    def close(self):
+        '''
+        Detach from the underlying segment
+        '''
+        self.view.release()
+        self.shm.close()
+
+    def unlink(self):
+        '''
+        Destroy the underlying segment; see SharedMemory.unlink()
+        '''
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __reduce__(self):
+        return _rebuild_shared_array, (self.typecode, len(self), self.shm)
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.typecode,
+                               self.tolist())
+
+def _rebuild_shared_array(typecode, length, shm):
+    return SharedArray(typecode, length, _shm=shm)
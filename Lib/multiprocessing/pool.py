@@ -30,6 +30,13 @@ RUN = 0
 CLOSE = 1
 TERMINATE = 2
 
+#
+# Ways of splitting the input of imap() and imap_unordered() into chunks
+#
+
+STATIC = 'static'
+GUIDED = 'guided'
+
 #
 # Miscellaneous
 #
@@ -112,7 +119,9 @@ class Pool(object):
     Process = Process
 
     def __init__(self, processes=None, initializer=None, initargs=(),
-                 maxtasksperchild=None):
+                 maxtasksperchild=None, scheduling=STATIC):
+        if scheduling not in (STATIC, GUIDED):
+            raise ValueError('scheduling must be %r or %r' % (STATIC, GUIDED))
         self._setup_queues()
         self._taskqueue = queue.Queue()
         self._cache = {}
@@ -120,6 +129,7 @@ class Pool(object):
         self._maxtasksperchild = maxtasksperchild
         self._initializer = initializer
         self._initargs = initargs
+        self._scheduling = scheduling
 
         if processes is None:
             try:
@@ -256,7 +266,7 @@ class Pool(object):
             return result
         else:
             assert chunksize > 1
-            task_batches = Pool._get_tasks(func, iterable, chunksize)
+            task_batches = self._get_chunked_tasks(func, iterable, chunksize)
             result = IMapIterator(self._cache)
             self._taskqueue.put((((result._job, i, mapstar, (x,), {})
                      for i, x in enumerate(task_batches)), result._set_length))
@@ -275,7 +285,7 @@ class Pool(object):
             return result
         else:
             assert chunksize > 1
-            task_batches = Pool._get_tasks(func, iterable, chunksize)
+            task_batches = self._get_chunked_tasks(func, iterable, chunksize)
             result = IMapUnorderedIterator(self._cache)
             self._taskqueue.put((((result._job, i, mapstar, (x,), {})
                      for i, x in enumerate(task_batches)), result._set_length))
@@ -443,6 +453,30 @@ class Pool(object):
                 return
             yield (func, x)
 
+    @staticmethod
+    def _get_guided_tasks(func, it, size, processes):
+        # Like _get_tasks(), but once fewer than size * processes items are
+        # left, each chunk only holds 1/processes of them.  The last chunks
+        # get smaller and smaller, so that they are spread over the workers
+        # instead of one worker finishing a long chunk while the others idle.
+        it = iter(it)
+        lookahead = size * processes
+        items = collections.deque()
+        while 1:
+            items.extend(itertools.islice(it, lookahead + size - len(items)))
+            if not items:
+                return
+            if len(items) > lookahead:
+                n = size
+            else:
+                n = -(-len(items) // processes)
+            yield (func, tuple(items.popleft() for i in range(n)))
+
+    def _get_chunked_tasks(self, func, it, size):
+        if self._scheduling == GUIDED:
+            return Pool._get_guided_tasks(func, it, size, self._processes)
+        return Pool._get_tasks(func, it, size)
+
     def __reduce__(self):
         raise NotImplementedError(
               'pool objects cannot be passed between processes or pickled'
@@ -707,8 +741,10 @@ class ThreadPool(Pool):
 
     from .dummy import Process
 
-    def __init__(self, processes=None, initializer=None, initargs=()):
-        Pool.__init__(self, processes, initializer, initargs)
+    def __init__(self, processes=None, initializer=None, initargs=(),
+                 scheduling=STATIC):
+        Pool.__init__(self, processes, initializer, initargs,
+                      scheduling=scheduling)
 
     def _setup_queues(self):
         self._inqueue = queue.Queue()
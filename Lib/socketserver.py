@@ -21,6 +21,7 @@ For request-based servers (including socket-based):
         - synchronous (one request is handled at a time)
         - forking (each request is handled by a new process)
         - threading (each request is handled by a new thread)
+        - pooled threading (each request is queued for a pool of threads)
 
 The classes in this module favor the server type that is simplest to
 write: a synchronous TCP/IP server.  This is bad class design, but
@@ -130,10 +131,15 @@ __version__ = "0.4"
 
 
 import socket
-import select
+import selectors
 import sys
 import os
-import errno
+import queue
+import signal
+try:
+    from time import monotonic as _time
+except ImportError:
+    from time import time as _time
 try:
     import threading
 except ImportError:
@@ -142,20 +148,16 @@ except ImportError:
 __all__ = ["TCPServer","UDPServer","ForkingUDPServer","ForkingTCPServer",
            "ThreadingUDPServer","ThreadingTCPServer","BaseRequestHandler",
            "StreamRequestHandler","DatagramRequestHandler",
-           "ThreadingMixIn", "ForkingMixIn"]
+           "ThreadingMixIn", "ForkingMixIn", "ThreadPoolMixIn",
+           "PreForkingMixIn"]
 if hasattr(socket, "AF_UNIX"):
     __all__.extend(["UnixStreamServer","UnixDatagramServer",
                     "ThreadingUnixStreamServer",
                     "ThreadingUnixDatagramServer"])
 
-def _eintr_retry(func, *args):
-    """restart a system call interrupted by EINTR"""
-    while True:
-        try:
-            return func(*args)
-        except OSError as e:
-            if e.errno != errno.EINTR:
-                raise
+# DefaultSelector picks epoll or kqueue over poll and select when the
+# platform has them; all selectors return early, without error, on EINTR.
+_ServerSelector = selectors.DefaultSelector
 
 class BaseServer:
 
@@ -167,7 +169,7 @@ class BaseServer:
     - serve_forever(poll_interval=0.5)
     - shutdown()
     - handle_request()  # if you do not use serve_forever()
-    - fileno() -> int   # for select()
+    - fileno() -> int   # for selectors
 
     Methods that may be overridden:
 
@@ -210,6 +212,8 @@ class BaseServer:
         self.RequestHandlerClass = RequestHandlerClass
         self.__is_shut_down = threading.Event()
         self.__shutdown_request = False
+        self.__wakeup = None
+        self._selector = None
 
     def server_activate(self):
         """Called by constructor to activate the server.
@@ -222,27 +226,63 @@ class BaseServer:
     def serve_forever(self, poll_interval=0.5):
         """Handle one request at a time until shutdown.
 
-        Polls for shutdown every poll_interval seconds. Ignores
-        self.timeout. If you need to do periodic tasks, do them in
-        another thread.
+        Waits at most poll_interval seconds for a request before calling
+        service_actions() again; shutdown() wakes the loop up at once.
+        If poll_interval is None, the loop only wakes up when a request
+        arrives or shutdown() is called.  Ignores self.timeout. If you
+        need to do periodic tasks, do them in another thread.
+
+        While the loop runs, self._selector is the selector it waits on.
+        Subclasses may register more file objects with it, passing a
+        callable as data; it is called with the file object and the
+        ready events.
         """
         self.__is_shut_down.clear()
         try:
-            while not self.__shutdown_request:
-                # XXX: Consider using another file descriptor or
-                # connecting to the socket to wake this up instead of
-                # polling. Polling reduces our responsiveness to a
-                # shutdown request and wastes cpu at all other times.
-                r, w, e = _eintr_retry(select.select, [self], [], [],
-                                       poll_interval)
-                if self in r:
-                    self._handle_request_noblock()
-
-                self.service_actions()
+            with _ServerSelector() as selector:
+                self._selector = selector
+                selector.register(self, selectors.EVENT_READ)
+                wakeup = self.__open_wakeup()
+                if wakeup is not None:
+                    selector.register(wakeup[0], selectors.EVENT_READ)
+                elif poll_interval is None:
+                    # Without a wakeup channel, shutdown() can only be
+                    # noticed by polling.
+                    poll_interval = 0.5
+
+                while not self.__shutdown_request:
+                    ready = selector.select(self._select_timeout(poll_interval))
+                    for key, events in ready:
+                        if key.fileobj is self:
+                            self._handle_request_noblock()
+                        elif key.data is not None:
+                            key.data(key.fileobj, events)
+                    self.service_actions()
         finally:
+            self._selector = None
+            self.__close_wakeup()
             self.__shutdown_request = False
             self.__is_shut_down.set()
 
+    def __open_wakeup(self):
+        """Create the socket pair used by shutdown() to wake serve_forever().
+
+        Returns None on platforms without socket.socketpair().
+        """
+        if not hasattr(socket, 'socketpair'):
+            return None
+        wakeup = socket.socketpair()
+        for sock in wakeup:
+            sock.setblocking(False)
+        self.__wakeup = wakeup
+        return wakeup
+
+    def __close_wakeup(self):
+        wakeup, self.__wakeup = self.__wakeup, None
+        if wakeup is not None:
+            for sock in wakeup:
+                sock.close()
+
     def shutdown(self):
         """Stops the serve_forever loop.
 
@@ -251,8 +291,21 @@ class BaseServer:
         deadlock.
         """
         self.__shutdown_request = True
+        wakeup = self.__wakeup
+        if wakeup is not None:
+            try:
+                wakeup[1].send(b'\0')
+            except OSError:
+                # The loop is already exiting and closed the socket pair,
+                # or a wakeup byte is already pending.
+                pass
         self.__is_shut_down.wait()
 
+    def _select_timeout(self, poll_interval):
+        # How long each wait of the serve_forever() loop may last.
+        # Subclasses with deadlines of their own may shorten it.
+        return poll_interval
+
     def service_actions(self):
         """Called by the serve_forever() loop.
 
@@ -284,18 +337,30 @@ class BaseServer:
             timeout = self.timeout
         elif self.timeout is not None:
             timeout = min(timeout, self.timeout)
-        fd_sets = _eintr_retry(select.select, [self], [], [], timeout)
-        if not fd_sets[0]:
-            self.handle_timeout()
-            return
+        if timeout is not None:
+            deadline = _time() + timeout
+
+        # The selector returns an empty list when it is interrupted by a
+        # signal, so wait again until the timeout has really expired.
+        with _ServerSelector() as selector:
+            selector.register(self, selectors.EVENT_READ)
+            while True:
+                ready = selector.select(timeout)
+                if ready:
+                    break
+                if timeout is not None:
+                    timeout = deadline - _time()
+                    if timeout < 0:
+                        self.handle_timeout()
+                        return
         self._handle_request_noblock()
 
     def _handle_request_noblock(self):
         """Handle one request, without blocking.
 
-        I assume that select.select has returned that the socket is
-        readable before this function was called, so there should be
-        no risk of blocking in get_request().
+        I assume that the selector has reported the socket as readable
+        before this function was called, so there should be no risk of
+        blocking in get_request().
         """
         try:
             request, client_address = self.get_request()
@@ -404,6 +469,7 @@ class TCPServer(BaseServer):
     - socket_type
     - request_queue_size (only for stream sockets)
     - allow_reuse_address
+    - allow_reuse_port
 
     Instance variables:
 
@@ -421,6 +487,8 @@ class TCPServer(BaseServer):
 
     allow_reuse_address = False
 
+    allow_reuse_port = False
+
     def __init__(self, server_address, RequestHandlerClass, bind_and_activate=True):
         """Constructor.  May be extended, do not override."""
         BaseServer.__init__(self, server_address, RequestHandlerClass)
@@ -438,6 +506,8 @@ class TCPServer(BaseServer):
         """
         if self.allow_reuse_address:
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.allow_reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
         self.socket.bind(self.server_address)
         self.server_address = self.socket.getsockname()
 
@@ -593,6 +663,107 @@ class ForkingMixIn:
                     os._exit(1)
 
 
+class PreForkingMixIn:
+
+    """Mix-in class to handle requests in long-lived child processes.
+
+    serve_forever() forks the given number of processes up front; each
+    of them accepts and handles requests from the listening socket they
+    share with the parent, in its own serve_forever() loop.  The parent
+    process accepts nothing: it watches its children every
+    poll_interval seconds and replaces the ones that died.  shutdown()
+    terminates the children with SIGTERM.
+    """
+
+    # Number of child processes; None means the number of CPUs.
+    processes = None
+    # Whether to replace children that exit while serving.
+    respawn_children = True
+    # Pids of the running children
+    active_children = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prefork_stop = threading.Event()
+        self._prefork_done = threading.Event()
+
+    def _prefork_count(self):
+        if self.processes is not None:
+            return self.processes
+        try:
+            return max(os.sysconf('SC_NPROCESSORS_ONLN'), 1)
+        except (ValueError, OSError, AttributeError):
+            return 1
+
+    def _spawn_child(self, poll_interval):
+        pid = os.fork()
+        if pid:
+            self.active_children.add(pid)
+            return
+        # Child process.
+        # This must never return, hence os._exit()!
+        try:
+            self.active_children = None
+            super().serve_forever(poll_interval)
+        except:
+            try:
+                import traceback
+                traceback.print_exc()
+            finally:
+                os._exit(1)
+        os._exit(0)
+
+    def serve_forever(self, poll_interval=0.5):
+        """Fork the child processes and replace them until shutdown."""
+        if poll_interval is None:
+            poll_interval = 0.5
+        self._prefork_done.clear()
+        self.active_children = set()
+        try:
+            for i in range(self._prefork_count()):
+                self._spawn_child(poll_interval)
+            while not self._prefork_stop.wait(poll_interval):
+                self.collect_children()
+                if self.respawn_children:
+                    while len(self.active_children) < self._prefork_count():
+                        self._spawn_child(poll_interval)
+                self.service_actions()
+        finally:
+            self._stop_children()
+            self._prefork_stop.clear()
+            self._prefork_done.set()
+
+    def collect_children(self):
+        """Internal routine to reap children that have exited."""
+        for pid in list(self.active_children):
+            try:
+                pid, status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                # Reaped by someone else.
+                self.active_children.discard(pid)
+                continue
+            if pid:
+                self.active_children.discard(pid)
+
+    def _stop_children(self):
+        for pid in self.active_children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self.active_children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self.active_children.clear()
+
+    def shutdown(self):
+        """Stop the children and wait for serve_forever() to return."""
+        self._prefork_stop.set()
+        self._prefork_done.wait()
+
+
 class ThreadingMixIn:
     """Mix-in class to handle each request in a new thread."""
 
@@ -621,6 +792,175 @@ class ThreadingMixIn:
         t.start()
 
 
+class ThreadPoolMixIn:
+
+    """Mix-in class to handle requests in a bounded pool of threads.
+
+    Accepted requests wait in a queue of at most max_queue_size entries
+    until one of the worker threads picks them up.  min_workers threads
+    are kept running; up to max_workers are started while every worker
+    is busy, and the extra ones exit after idling for
+    worker_idle_timeout seconds.  Setting min_workers to max_workers
+    gives a fixed-size pool.
+
+    When the queue is full, overflow decides what happens to a new
+    request: 'block' makes the serving loop wait for room, 'reject'
+    hands the new request to handle_overflow(), and 'shed' hands the
+    oldest queued request to handle_overflow() to make room for the new
+    one.
+    """
+
+    min_workers = 1
+    max_workers = 16
+    max_queue_size = 64
+    overflow = 'block'
+    worker_idle_timeout = 60.0
+
+    # Decides how worker threads will act upon termination of the
+    # main process
+    daemon_threads = False
+
+    # Number of requests passed to handle_overflow()
+    rejected_requests = 0
+
+    # Created by _start_pool() when the first request comes in.
+    _pool_queue = None
+
+    def _start_pool(self):
+        if self.overflow not in ('block', 'reject', 'shed'):
+            raise ValueError("unknown overflow policy: %r" % (self.overflow,))
+        if not 0 < self.min_workers <= self.max_workers:
+            raise ValueError("need 0 < min_workers <= max_workers")
+        self._pool_lock = threading.Lock()
+        self._pool_threads = set()
+        self._busy_workers = 0
+        self._pool_queue = queue.Queue(self.max_queue_size)
+        with self._pool_lock:
+            for i in range(self.min_workers):
+                self._start_worker()
+
+    def _start_worker(self):
+        # Called with _pool_lock held.
+        t = threading.Thread(target=self._pool_worker)
+        t.daemon = self.daemon_threads
+        self._pool_threads.add(t)
+        t.start()
+
+    def _pool_worker(self):
+        while True:
+            try:
+                item = self._pool_queue.get(timeout=self.worker_idle_timeout)
+            except queue.Empty:
+                with self._pool_lock:
+                    if (len(self._pool_threads) > self.min_workers and
+                        self._pool_queue.empty()):
+                        self._pool_threads.discard(threading.current_thread())
+                        return
+                continue
+            if item is None:
+                # Sentinel put by server_close().
+                return
+            with self._pool_lock:
+                self._busy_workers += 1
+            try:
+                self.process_request_thread(*item)
+            finally:
+                with self._pool_lock:
+                    self._busy_workers -= 1
+
+    def process_request_thread(self, request, client_address):
+        """Same as in BaseServer but in a worker thread.
+
+        In addition, exception handling is done here.
+
+        """
+        try:
+            self.finish_request(request, client_address)
+            self.shutdown_request(request)
+        except:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+
+    def process_request(self, request, client_address):
+        """Queue the request for the worker threads."""
+        if self._pool_queue is None:
+            self._start_pool()
+        item = (request, client_address)
+        if self.overflow == 'block':
+            self._pool_queue.put(item)
+        else:
+            while True:
+                try:
+                    self._pool_queue.put_nowait(item)
+                    break
+                except queue.Full:
+                    if self.overflow == 'reject':
+                        self._overflow(item)
+                        return
+                try:
+                    self._overflow(self._pool_queue.get_nowait())
+                except queue.Empty:
+                    pass
+        with self._pool_lock:
+            idle = len(self._pool_threads) - self._busy_workers
+            if (self._pool_queue.qsize() > idle and
+                len(self._pool_threads) < self.max_workers):
+                self._start_worker()
+
+    def _overflow(self, item):
+        self.rejected_requests += 1
+        try:
+            self.handle_overflow(*item)
+        finally:
+            self.shutdown_request(item[0])
+
+    def handle_overflow(self, request, client_address):
+        """Called for a request dropped because the queue is full.
+
+        The request is shut down afterwards.  May be overridden, for
+        instance to send a "server busy" reply.
+        """
+        pass
+
+    @property
+    def queue_depth(self):
+        """Number of requests waiting for a worker thread."""
+        if self._pool_queue is None:
+            return 0
+        return self._pool_queue.qsize()
+
+    @property
+    def worker_count(self):
+        """Number of running worker threads."""
+        if self._pool_queue is None:
+            return 0
+        return len(self._pool_threads)
+
+    @property
+    def busy_workers(self):
+        """Number of worker threads currently handling a request."""
+        if self._pool_queue is None:
+            return 0
+        return self._busy_workers
+
+    def server_close(self):
+        """Stop the worker threads once the queued requests are handled.
+
+        Unless daemon_threads is true, wait for them to exit.
+        """
+        super().server_close()
+        if self._pool_queue is None:
+            return
+        with self._pool_lock:
+            threads = list(self._pool_threads)
+            self._pool_threads.clear()
+        for t in threads:
+            self._pool_queue.put(None)
+        if not self.daemon_threads:
+            for t in threads:
+                t.join()
+
+
 class ForkingUDPServer(ForkingMixIn, UDPServer): pass
 class ForkingTCPServer(ForkingMixIn, TCPServer): pass
 
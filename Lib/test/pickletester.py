@@ -822,6 +822,18 @@ class AbstractPickleTests(unittest.TestCase):
                            (3, 2): pickle.TUPLE2,
                            (3, 3): pickle.TUPLE3,
                            (3, 4): pickle.TUPLE,
+
+                           (4, 0): pickle.EMPTY_TUPLE,
+                           (4, 1): pickle.TUPLE1,
+                           (4, 2): pickle.TUPLE2,
+                           (4, 3): pickle.TUPLE3,
+                           (4, 4): pickle.TUPLE,
+
+                           (5, 0): pickle.EMPTY_TUPLE,
+                           (5, 1): pickle.TUPLE1,
+                           (5, 2): pickle.TUPLE2,
+                           (5, 3): pickle.TUPLE3,
+                           (5, 4): pickle.TUPLE,
                           }
         a = ()
         b = (1,)
@@ -842,16 +854,22 @@ class AbstractPickleTests(unittest.TestCase):
                            (1, None): pickle.NONE,
                            (2, None): pickle.NONE,
                            (3, None): pickle.NONE,
+                           (4, None): pickle.NONE,
+                           (5, None): pickle.NONE,
 
                            (0, True): pickle.INT,
                            (1, True): pickle.INT,
                            (2, True): pickle.NEWTRUE,
                            (3, True): pickle.NEWTRUE,
+                           (4, True): pickle.NEWTRUE,
+                           (5, True): pickle.NEWTRUE,
 
                            (0, False): pickle.INT,
                            (1, False): pickle.INT,
                            (2, False): pickle.NEWFALSE,
                            (3, False): pickle.NEWFALSE,
+                           (4, False): pickle.NEWFALSE,
+                           (5, False): pickle.NEWFALSE,
                           }
         for proto in protocols:
             for x in None, False, True:
@@ -1016,6 +1034,90 @@ class AbstractPickleTests(unittest.TestCase):
             self.assertEqual(y.abc, 666)
             self.assertEqual(x.__dict__, y.__dict__)
 
+    def test_complex_newobj_ex(self):
+        x = ComplexNewObjEx.__new__(ComplexNewObjEx, 0xface)  # avoid __init__
+        x.abc = 666
+        for proto in protocols:
+            s = self.dumps(x, proto)
+            self.assertEqual(opcode_in_pickle(pickle.NEWOBJ_EX, s), proto >= 4)
+            y = self.loads(s)   # will raise TypeError if __init__ called
+            self.assertEqual(type(y), ComplexNewObjEx)
+            self.assertEqual(y, 0xface)
+            self.assertEqual(y.abc, 666)
+            self.assertEqual(x.__dict__, y.__dict__)
+
+    def test_set_chunking(self):
+        n = 10  # too small to chunk
+        x = set(range(n))
+        for proto in protocols:
+            s = self.dumps(x, proto)
+            y = self.loads(s)
+            self.assertEqual(x, y)
+            num_additems = count_opcode(pickle.ADDITEMS, s)
+            if proto < 4:
+                self.assertEqual(num_additems, 0)
+            else:
+                self.assertEqual(num_additems, 1)
+
+        n = 2500  # expect at least two chunks when proto >= 4
+        x = set(range(n))
+        for proto in protocols:
+            s = self.dumps(x, proto)
+            y = self.loads(s)
+            self.assertEqual(x, y)
+            num_additems = count_opcode(pickle.ADDITEMS, s)
+            if proto < 4:
+                self.assertEqual(num_additems, 0)
+            else:
+                self.assertGreaterEqual(num_additems, 2)
+
+    def test_frozenset(self):
+        for x in frozenset(), frozenset(range(10)), frozenset('abc'):
+            for proto in protocols:
+                s = self.dumps(x, proto)
+                y = self.loads(s)
+                self.assertEqual(type(y), frozenset)
+                self.assertEqual(x, y)
+                self.assertEqual(opcode_in_pickle(pickle.FROZENSET, s),
+                                 proto >= 4)
+
+    def test_recursive_frozenset(self):
+        i = object.__new__(SimpleNewObj)  # hashable, avoid __init__
+        x = frozenset([i])
+        i.attr = x
+        for proto in protocols:
+            if proto < 4:
+                continue
+            s = self.dumps(x, proto)
+            y = self.loads(s)
+            self.assertEqual(type(y), frozenset)
+            self.assertEqual(len(y), 1)
+            self.assertTrue(list(y)[0].attr is y)
+
+    def test_nested_names(self):
+        for obj in (Nested.A, Nested.A.B, Nested.A.B.C):
+            for proto in protocols:
+                if proto < 4:
+                    self.assertRaises(pickle.PicklingError,
+                                      self.dumps, obj, proto)
+                    continue
+                s = self.dumps(obj, proto)
+                self.assertTrue(opcode_in_pickle(pickle.STACK_GLOBAL, s))
+                self.assertIs(self.loads(s), obj)
+
+    def test_local_names(self):
+        class Local:
+            pass
+        for proto in protocols:
+            self.assertRaises(pickle.PicklingError, self.dumps, Local, proto)
+
+    def test_short_binunicode(self):
+        for proto in protocols:
+            s = self.dumps('abc', proto)
+            self.assertEqual(self.loads(s), 'abc')
+            self.assertEqual(opcode_in_pickle(pickle.SHORT_BINUNICODE, s),
+                             proto >= 4)
+
     def test_newobj_list_slots(self):
         x = SlotList([1, 2, 3])
         x.foo = 42
@@ -1163,6 +1265,53 @@ class AbstractPickleTests(unittest.TestCase):
             self.assertEqual(len(loaded), len(data))
             self.assertEqual(loaded, data)
 
+    def check_frame_opcodes(self, pickled):
+        """
+        Check the arguments of FRAME opcodes in a protocol 4+ pickle.
+        """
+        frame_opcode_size = 9
+        last_arg = last_pos = None
+        for op, arg, pos in pickletools.genops(pickled):
+            if op.name != 'FRAME':
+                continue
+            if last_pos is not None:
+                # The previous frame's size should be equal to the number
+                # of bytes up to the current frame.
+                frame_size = pos - last_pos - frame_opcode_size
+                self.assertEqual(frame_size, last_arg)
+            last_arg, last_pos = arg, pos
+        if last_arg is not None:
+            # The last frame extends to the end of the pickle.
+            self.assertEqual(len(pickled) - last_pos - frame_opcode_size,
+                             last_arg)
+
+    def test_framing_many_objects(self):
+        obj = list(range(10**5))
+        for proto in range(4, pickle.HIGHEST_PROTOCOL + 1):
+            pickled = self.dumps(obj, proto)
+            unpickled = self.loads(pickled)
+            self.assertEqual(obj, unpickled)
+            n_frames = count_opcode(pickle.FRAME, pickled)
+            self.assertGreaterEqual(n_frames, 2)
+            bytes_per_frame = len(pickled) / n_frames
+            self.assertGreater(bytes_per_frame,
+                               pickle._Framer._FRAME_SIZE_TARGET / 2)
+            self.assertLessEqual(bytes_per_frame,
+                                 pickle._Framer._FRAME_SIZE_TARGET * 1)
+            self.check_frame_opcodes(pickled)
+
+    def test_framing_large_objects(self):
+        N = 1024 * 1024
+        obj = [b'x' * N, b'y' * N, 'z' * N]
+        for proto in range(4, pickle.HIGHEST_PROTOCOL + 1):
+            pickled = self.dumps(obj, proto)
+            unpickled = self.loads(pickled)
+            self.assertEqual(obj, unpickled)
+            # Large payloads are written outside of any frame.
+            n_frames = count_opcode(pickle.FRAME, pickled)
+            self.assertLessEqual(n_frames, len(obj) + 1)
+            self.assertLess(len(pickled), 3 * N + 100)
+
     def test_empty_bytestring(self):
         # issue 11286
         empty = self.loads(b'\x80\x03U\x00q\x00.', encoding='koi8-r')
@@ -1174,7 +1323,10 @@ class AbstractPickleTests(unittest.TestCase):
             sizes = [len(self.dumps(2**n, proto)) for n in range(70)]
             # the size function is monotonic
             self.assertEqual(sorted(sizes), sizes)
-            if proto >= 2:
+            if proto >= 4:
+                # allow for the FRAME header
+                self.assertLessEqual(sizes[-1], 14 + 9)
+            elif proto >= 2:
                 self.assertLessEqual(sizes[-1], 14)
 
     def check_negative_32b_binXXX(self, dumped):
@@ -1245,13 +1397,22 @@ class BigmemPickleTests(unittest.TestCase):
 
     @bigmemtest(size=_4G, memuse=1 + 1, dry_run=False)
     def test_huge_bytes_64b(self, size):
-        data = b"a" * size
+        data = b"acbd" * (size // 4)
         try:
             for proto in protocols:
                 if proto < 3:
                     continue
-                with self.assertRaises((ValueError, OverflowError)):
-                    self.dumps(data, protocol=proto)
+                if proto < 4:
+                    with self.assertRaises((ValueError, OverflowError)):
+                        self.dumps(data, protocol=proto)
+                    continue
+                # Protocol 4 has a dedicated 64-bit length opcode
+                try:
+                    pickled = self.dumps(data, protocol=proto)
+                    self.assertTrue(b"acbd" in pickled[:30])
+                    self.assertTrue(b"acbd" in pickled[-15:])
+                finally:
+                    pickled = None
         finally:
             data = None
 
@@ -1273,17 +1434,26 @@ class BigmemPickleTests(unittest.TestCase):
             data = None
 
     # BINUNICODE (protocols 1, 2 and 3) cannot carry more than
-    # 2**32 - 1 bytes of utf-8 encoded unicode.
+    # 2**32 - 1 bytes of utf-8 encoded unicode. BINUNICODE8 (protocol 4)
+    # can.
 
-    @bigmemtest(size=_4G, memuse=1 + ascii_char_size, dry_run=False)
+    @bigmemtest(size=_4G, memuse=2 + ascii_char_size, dry_run=False)
     def test_huge_str_64b(self, size):
-        data = "a" * size
+        data = "abcd" * (size // 4)
         try:
             for proto in protocols:
                 if proto == 0:
                     continue
-                with self.assertRaises((ValueError, OverflowError)):
-                    self.dumps(data, protocol=proto)
+                if proto < 4:
+                    with self.assertRaises((ValueError, OverflowError)):
+                        self.dumps(data, protocol=proto)
+                    continue
+                try:
+                    pickled = self.dumps(data, protocol=proto)
+                    self.assertTrue(b"abcd" in pickled[:30])
+                    self.assertTrue(b"abcd" in pickled[-15:])
+                finally:
+                    pickled = None
         finally:
             data = None
 
@@ -1366,6 +1536,20 @@ class SimpleNewObj(object):
         # raise an error, to make sure this isn't called
         raise TypeError("SimpleNewObj.__init__() didn't expect to get called")
 
+class ComplexNewObjEx(int):
+    def __init__(self, *args, **kwargs):
+        # raise an error, to make sure this isn't called
+        raise TypeError("ComplexNewObjEx.__init__() didn't expect to get "
+                        "called")
+    def __getnewargs_ex__(self):
+        return ('%X' % self,), {'base': 16}
+
+class Nested:
+    class A:
+        class B:
+            class C:
+                pass
+
 class BadGetattr:
     def __getattr__(self, key):
         self.foo
@@ -1401,7 +1585,7 @@ class AbstractPickleModuleTests(unittest.TestCase):
 
     def test_highest_protocol(self):
         # Of course this needs to be changed when HIGHEST_PROTOCOL changes.
-        self.assertEqual(pickle.HIGHEST_PROTOCOL, 3)
+        self.assertEqual(pickle.HIGHEST_PROTOCOL, 5)
 
     def test_callapi(self):
         f = io.BytesIO()
@@ -1618,6 +1802,96 @@ class AbstractPicklerUnpicklerObjectTests(unittest.TestCase):
                 unpickler = self.unpickler_class(f)
                 self.assertEqual(unpickler.load(), data)
 
+    def _dump_with_buffers(self, obj, proto, buffer_callback):
+        f = io.BytesIO()
+        pickler = self.pickler_class(f, protocol=proto,
+                                     buffer_callback=buffer_callback)
+        pickler.dump(obj)
+        return f.getvalue()
+
+    def _load_with_buffers(self, data, buffers):
+        f = io.BytesIO(data)
+        return self.unpickler_class(f, buffers=buffers).load()
+
+    def test_bytearray_proto5(self):
+        for obj in (bytearray(), bytearray(b'xyz'), bytearray(100000)):
+            f = io.BytesIO()
+            self.pickler_class(f, protocol=5).dump(obj)
+            pickled = f.getvalue()
+            self.assertIn(pickle.BYTEARRAY8, pickled)
+            unpickled = self.unpickler_class(io.BytesIO(pickled)).load()
+            self.assertEqual(unpickled, obj)
+            self.assertIs(type(unpickled), bytearray)
+
+    def test_buffer_callback_protocol(self):
+        for proto in range(5):
+            self.assertRaises(ValueError, self.pickler_class, io.BytesIO(),
+                              protocol=proto, buffer_callback=list.append)
+
+    def test_picklebuffer_in_band(self):
+        for data in (b'abcd', bytearray(b'abcd')):
+            pb = pickle.PickleBuffer(data)
+            pickled = self._dump_with_buffers(pb, 5, lambda b: True)
+            unpickled = self._load_with_buffers(pickled, None)
+            self.assertEqual(unpickled, data)
+            self.assertIs(type(unpickled), type(data))
+            # Without a callback buffers are always serialized in-band
+            f = io.BytesIO()
+            self.pickler_class(f, protocol=5).dump(pb)
+            unpickled = self.unpickler_class(io.BytesIO(f.getvalue())).load()
+            self.assertEqual(unpickled, data)
+        # PickleBuffer objects need protocol 5
+        for proto in range(5):
+            f = io.BytesIO()
+            pickler = self.pickler_class(f, protocol=proto)
+            self.assertRaises(pickle.PicklingError, pickler.dump,
+                              pickle.PickleBuffer(b'abcd'))
+
+    def test_picklebuffer_out_of_band(self):
+        for data, readonly in ((b'abcd', True), (bytearray(b'abcd'), False)):
+            buffers = []
+            obj = [pickle.PickleBuffer(data), 42]
+            pickled = self._dump_with_buffers(obj, 5, buffers.append)
+            self.assertEqual(len(buffers), 1)
+            self.assertNotIn(b'abcd', pickled)
+            self.assertEqual(count_opcode(pickle.NEXT_BUFFER, pickled), 1)
+            self.assertEqual(count_opcode(pickle.READONLY_BUFFER, pickled),
+                             int(readonly))
+            unpickled = self._load_with_buffers(pickled, buffers)
+            self.assertEqual(unpickled[1], 42)
+            # The buffer object is returned as is
+            self.assertIs(unpickled[0], buffers[0])
+            self.assertEqual(bytes(unpickled[0]), b'abcd')
+            # A writable buffer given back for a read-only one is exposed
+            # through a read-only memoryview
+            unpickled = self._load_with_buffers(pickled,
+                                                [bytearray(b'abcd')])
+            m = memoryview(unpickled[0])
+            self.assertEqual(m.readonly, readonly)
+            self.assertEqual(bytes(m), b'abcd')
+
+    def test_picklebuffer_missing_buffers(self):
+        buffers = []
+        pickled = self._dump_with_buffers(
+            [pickle.PickleBuffer(b'a'), pickle.PickleBuffer(b'b')],
+            5, buffers.append)
+        self.assertEqual(len(buffers), 2)
+        with self.assertRaises(pickle.UnpicklingError):
+            self._load_with_buffers(pickled, None)
+        with self.assertRaises(pickle.UnpicklingError):
+            self._load_with_buffers(pickled, buffers[:1])
+        unpickled = self._load_with_buffers(pickled, iter(buffers))
+        self.assertEqual([bytes(b) for b in unpickled], [b'a', b'b'])
+
+    def test_picklebuffer_non_contiguous(self):
+        m = memoryview(b'abcdefgh')[::2]
+        pb = pickle.PickleBuffer(m)
+        self.assertRaises(BufferError, pb.raw)
+        f = io.BytesIO()
+        self.assertRaises(pickle.PicklingError,
+                          self.pickler_class(f, protocol=5).dump, pb)
+
+
 
 # Tests for dispatch_table attribute
 
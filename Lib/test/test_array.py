@@ -94,6 +94,20 @@ class ArrayReconstructorTest(unittest.TestCase):
         self.assertRaises(ValueError, array_reconstructor,
                           array.array, "d", 16, b"a")
 
+    def test_buffers(self):
+        # Any bytes-like object is accepted, e.g. out-of-band pickle buffers
+        raw = struct.pack('<ii', 1, -2)
+        for items in (bytearray(raw), memoryview(raw)):
+            a = array_reconstructor(array.array, 'i', SIGNED_INT32_LE, items)
+            self.assertEqual(a, array.array('i', [1, -2]))
+        raw = struct.pack('>ii', 1, -2)
+        a = array_reconstructor(array.array, 'i', SIGNED_INT32_BE,
+                                bytearray(raw))
+        self.assertEqual(a, array.array('i', [1, -2]))
+        self.assertRaises(ValueError, array_reconstructor,
+                          array.array, "d", IEEE_754_DOUBLE_LE,
+                          bytearray(b"a"))
+
     def test_numbers(self):
         testcases = (
             (['B', 'H', 'I', 'L'], UNSIGNED_INT8, '=BBBB',
@@ -252,7 +266,7 @@ class BaseTest(unittest.TestCase):
         a = array.array(self.typecode, self.example)
         for protocol in range(3):
             self.assertIs(a.__reduce_ex__(protocol)[0], array.array)
-        for protocol in range(3, pickle.HIGHEST_PROTOCOL):
+        for protocol in range(3, pickle.HIGHEST_PROTOCOL + 1):
             self.assertIs(a.__reduce_ex__(protocol)[0], array_reconstructor)
 
     def test_pickle(self):
@@ -285,6 +299,16 @@ class BaseTest(unittest.TestCase):
             self.assertEqual(a.x, b.x)
             self.assertEqual(type(a), type(b))
 
+    def test_pickle_out_of_band(self):
+        a = array.array(self.typecode, self.example)
+        buffers = []
+        pickled = pickle.dumps(a, 5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(bytes(buffers[0].raw()), a.tobytes())
+        b = pickle.loads(pickled, buffers=buffers)
+        self.assertEqual(a, b)
+        self.assertEqual(type(a), type(b))
+
     def test_iterator_pickle(self):
         data = array.array(self.typecode, self.example)
         orgit = iter(data)
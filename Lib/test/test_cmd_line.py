@@ -4,6 +4,7 @@
 
 import test.support, unittest
 import os
+import re
 import sys
 import subprocess
 import tempfile
@@ -62,6 +63,32 @@ class CmdLineTest(unittest.TestCase):
         opts = eval(out.splitlines()[0])
         self.assertEqual(opts, {'a': True, 'b': 'c,d=e'})
 
+    def check_importtime(self, err):
+        lines = err.decode('ascii').splitlines()
+        self.assertEqual(lines[0],
+                         'import time: self [us] | cumulative | imported package')
+        imports = {}
+        for line in lines[1:]:
+            match = re.match(r'import time: +(\d+) \| +(\d+) \| ( *)(\S+)$',
+                             line)
+            self.assertIsNotNone(match, line)
+            self_time, cumulative, indent, name = match.groups()
+            self.assertLessEqual(int(self_time), int(cumulative))
+            imports[name] = len(indent)
+        # Nested imports are reported first, further indented
+        names = [line.rpartition(' ')[2] for line in lines[1:]]
+        self.assertLess(names.index('json.decoder'), names.index('json'))
+        self.assertGreater(imports['json.decoder'], imports['json'])
+
+    def test_importtime(self):
+        rc, out, err = assert_python_ok('-X', 'importtime', '-c', 'import json')
+        self.check_importtime(err)
+        rc, out, err = assert_python_ok('-c', 'import json',
+                                        PYTHONPROFILEIMPORTTIME='1')
+        self.check_importtime(err)
+        rc, out, err = assert_python_ok('-c', 'import json')
+        self.assertNotIn(b'import time:', err)
+
     def test_run_module(self):
         # Test expected operation of the '-m' switch
         # Switch needs an argument
@@ -107,6 +107,44 @@ class CompileallTests(unittest.TestCase):
                                        debug_override=not optimize)
         self.assertTrue(os.path.isfile(cached3))
 
+    def test_workers(self):
+        compileall.compile_dir(self.directory, quiet=True, workers=2)
+        self.assertTrue(os.path.isfile(self.bc_path))
+        self.assertTrue(os.path.isfile(self.bc_path2))
+        self.assertTrue(os.path.isfile(imp.cache_from_source(
+            self.source_path3)))
+        with self.assertRaises(ValueError):
+            compileall.compile_dir(self.directory, workers=-1)
+
+    def test_workers_output(self):
+        # The output and the result don't depend on the number of workers
+        bad = os.path.join(self.subdirectory, '_bad.py')
+        with open(bad, 'w') as file:
+            file.write('x = (\n')
+        results = []
+        for workers in (1, 2, 0):
+            shutil.rmtree(os.path.join(self.directory, '__pycache__'),
+                          ignore_errors=True)
+            shutil.rmtree(os.path.join(self.subdirectory, '__pycache__'),
+                          ignore_errors=True)
+            orig_stdout = sys.stdout
+            sys.stdout = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+            try:
+                ok = compileall.compile_dir(self.directory, workers=workers)
+                sys.stdout.flush()
+                output = sys.stdout.buffer.getvalue().decode('utf-8')
+            finally:
+                sys.stdout = orig_stdout
+            results.append((ok, output))
+        self.assertEqual(results[0][0], 0)
+        self.assertIn('_bad.py', results[0][1])
+        # Listing messages come first when compiling in parallel
+        for ok, output in results[1:]:
+            self.assertEqual(ok, results[0][0])
+            self.assertEqual(sorted(output.splitlines()),
+                             sorted(results[0][1].splitlines()))
+            self.assertEqual(output, results[1][1])
+
 
 class EncodingTest(unittest.TestCase):
     """Issue 6716: compileall should escape source code when printing errors
@@ -351,6 +389,18 @@ class CommandLineTests(unittest.TestCase):
         self.assertCompiled(self.initfn)
         self.assertCompiled(self.barfn)
 
+    def test_workers(self):
+        bingfn = script_helper.make_script(self.pkgdir, 'bing', 'syntax(error')
+        rc, out, err = self.assertRunNotOK('-j', '2', self.pkgdir)
+        self.assertRegex(out, b'rror')
+        self.assertNotCompiled(bingfn)
+        self.assertCompiled(self.initfn)
+        self.assertCompiled(self.barfn)
+
+    def test_negative_workers(self):
+        rc, out, err = self.assertRunNotOK('-j', '-1', self.pkgdir)
+        self.assertRegex(err, b'number of workers')
+
     def test_invalid_arg_produces_message(self):
         out = self.assertRunOK('badfilename')
         self.assertRegex(out, b"Can't list 'badfilename'")
@@ -11,6 +11,9 @@ test.support.import_module('threading')
 
 from test.script_helper import assert_python_ok
 
+import itertools
+import logging
+import os
 import sys
 import threading
 import time
@@ -21,6 +24,7 @@ from concurrent import futures
 from concurrent.futures._base import (
     PENDING, RUNNING, CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED, Future)
 from concurrent.futures.process import BrokenProcessPool
+from concurrent.futures.thread import BrokenThreadPool
 
 
 def create_future(state=PENDING, exception=None, result=None):
@@ -43,6 +47,10 @@ def mul(x, y):
     return x * y
 
 
+def get_pid(x):
+    return os.getpid()
+
+
 def sleep_and_raise(t):
     time.sleep(t)
     raise Exception('this is an exception')
@@ -58,13 +66,31 @@ class MyObject(object):
         pass
 
 
+INITIALIZER_STATUS = 'uninitialized'
+
+def init(x):
+    global INITIALIZER_STATUS
+    INITIALIZER_STATUS = x
+
+def get_init_status():
+    return INITIALIZER_STATUS
+
+def init_fail():
+    # Keep the critical log message of the worker out of the test output
+    logging.getLogger('concurrent.futures').disabled = True
+    time.sleep(0.1)  # let some futures be scheduled
+    raise ValueError('error in initializer')
+
+
 class ExecutorMixin:
     worker_count = 5
+    executor_kwargs = {}
 
     def setUp(self):
         self.t1 = time.time()
         try:
-            self.executor = self.executor_type(max_workers=self.worker_count)
+            self.executor = self.executor_type(max_workers=self.worker_count,
+                                               **self.executor_kwargs)
         except NotImplementedError as e:
             self.skipTest(str(e))
         self._prime_executor()
@@ -127,10 +153,12 @@ class ThreadPoolShutdownTest(ThreadPoolMixin, ExecutorShutdownTest):
         pass
 
     def test_threads_terminate(self):
-        self.executor.submit(mul, 21, 2)
-        self.executor.submit(mul, 6, 7)
-        self.executor.submit(mul, 3, 14)
+        # Block the calls, otherwise an idle worker may run the next one.
+        event = threading.Event()
+        for _ in range(3):
+            self.executor.submit(event.wait)
         self.assertEqual(len(self.executor._threads), 3)
+        event.set()
         self.executor.shutdown()
         for t in self.executor._threads:
             t.join()
@@ -350,6 +378,12 @@ class AsCompletedTests(unittest.TestCase):
                               SUCCESSFUL_FUTURE]),
                          completed_futures)
 
+    def test_duplicate_futures(self):
+        # Duplicate futures should not raise exceptions or be yielded twice.
+        future1 = self.executor.submit(time.sleep, 0.1)
+        completed = [f for f in futures.as_completed([future1, future1])]
+        self.assertEqual(len(completed), 1)
+
 
 class ThreadPoolAsCompletedTests(ThreadPoolMixin, AsCompletedTests):
     pass
@@ -395,6 +429,43 @@ class ExecutorTest(unittest.TestCase):
 
         self.assertEqual([None, None], results)
 
+    def test_map_buffersize(self):
+        consumed = []
+        def args():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+        results = self.executor.map(abs, args(), buffersize=3)
+        self.assertEqual(len(consumed), 3)
+        self.assertEqual(next(results), 0)
+        # One new call is submitted for each result retrieved
+        self.assertEqual(len(consumed), 4)
+        self.assertEqual(list(results), list(range(1, 10)))
+        self.assertEqual(consumed, list(range(10)))
+
+    def test_map_buffersize_on_infinite_iterable(self):
+        results = self.executor.map(str, itertools.count(), buffersize=2)
+        self.assertEqual(list(itertools.islice(results, 5)),
+                         ['0', '1', '2', '3', '4'])
+
+    def test_map_buffersize_exception(self):
+        i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5],
+                              buffersize=2)
+        self.assertEqual(i.__next__(), (0, 1))
+        self.assertEqual(i.__next__(), (0, 1))
+        self.assertRaises(ZeroDivisionError, i.__next__)
+
+    def test_map_buffersize_without_executor_reference(self):
+        # The iterator keeps the executor alive while it submits calls.
+        results = self.executor_type(max_workers=2).map(
+            abs, range(-10, 10), buffersize=2)
+        test.support.gc_collect()
+        self.assertEqual(list(results), [abs(i) for i in range(-10, 10)])
+
+    def test_map_invalid_buffersize(self):
+        self.assertRaises(ValueError, self.executor.map, str, [1, 2],
+                          buffersize=0)
+
     def test_shutdown_race_issue12456(self):
         # Issue #12456: race condition at shutdown where trying to post a
         # sentinel in the call queue blocks (the queue is full while processes
@@ -430,8 +501,133 @@ class ThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest):
         self.executor.shutdown(wait=True)
         self.assertCountEqual(finished, range(10))
 
+    def _wait_for_stats(self, executor, key, value):
+        deadline = time.time() + 10
+        while executor.get_stats()[key] != value:
+            self.assertLess(time.time(), deadline,
+                            "timed out waiting for %s == %r" % (key, value))
+            time.sleep(0.01)
+
+    def test_idle_worker_reused(self):
+        executor = futures.ThreadPoolExecutor(max_workers=5)
+        try:
+            for i in range(10):
+                self.assertEqual(executor.submit(abs, -i).result(), i)
+                self._wait_for_stats(executor, 'idle', 1)
+            self.assertEqual(len(executor._threads), 1)
+        finally:
+            executor.shutdown(wait=True)
+
+    def test_get_stats(self):
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            event = threading.Event()
+            f1 = executor.submit(event.wait)
+            f2 = executor.submit(abs, -1)
+            self._wait_for_stats(executor, 'active', 1)
+            self.assertEqual(executor.get_stats(),
+                             {'workers': 1, 'active': 1, 'idle': 0,
+                              'queued': 1})
+            event.set()
+            self.assertEqual(f2.result(), 1)
+            self._wait_for_stats(executor, 'idle', 1)
+            self.assertEqual(executor.get_stats(),
+                             {'workers': 1, 'active': 0, 'idle': 1,
+                              'queued': 0})
+        finally:
+            executor.shutdown(wait=True)
+
+    def test_idle_timeout(self):
+        executor = futures.ThreadPoolExecutor(max_workers=4, idle_timeout=0.1,
+                                              min_workers=1)
+        try:
+            event = threading.Event()
+            fs = [executor.submit(event.wait) for _ in range(4)]
+            self._wait_for_stats(executor, 'active', 4)
+            event.set()
+            futures.wait(fs)
+            self._wait_for_stats(executor, 'workers', 1)
+            # The remaining worker is kept and still runs calls.
+            time.sleep(0.3)
+            self.assertEqual(len(executor._threads), 1)
+            self.assertEqual(executor.submit(abs, -2).result(), 2)
+        finally:
+            executor.shutdown(wait=True)
+
+    def test_invalid_idle_timeout(self):
+        self.assertRaises(ValueError, futures.ThreadPoolExecutor, 1,
+                          idle_timeout=0)
+        self.assertRaises(ValueError, futures.ThreadPoolExecutor, 1,
+                          idle_timeout=-1)
+        self.assertRaises(ValueError, futures.ThreadPoolExecutor, 1,
+                          min_workers=2)
+        self.assertRaises(ValueError, futures.ThreadPoolExecutor, 1,
+                          min_workers=-1)
+
 
 class ProcessPoolExecutorTest(ProcessPoolMixin, ExecutorTest):
+    def test_map_chunksize(self):
+        def bad_map():
+            list(self.executor.map(pow, range(40), range(40), chunksize=-1))
+
+        ref = list(map(pow, range(40), range(40)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=6)),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=50)),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=40)),
+            ref)
+        self.assertRaises(ValueError, bad_map)
+
+    def test_max_tasks_per_child(self):
+        executor = self.executor_type(1, max_tasks_per_child=3)
+        self.addCleanup(executor.shutdown)
+        f1 = executor.submit(os.getpid)
+        original_pid = f1.result()
+        # The worker pid remains the same as the worker could be reused
+        f2 = executor.submit(os.getpid)
+        self.assertEqual(f2.result(), original_pid)
+        self.assertEqual(len(executor._processes), 1)
+        f3 = executor.submit(os.getpid)
+        self.assertEqual(f3.result(), original_pid)
+
+        # A new worker is spawned, with a statistically different pid,
+        # while the previous was reaped.
+        f4 = executor.submit(os.getpid)
+        new_pid = f4.result()
+        self.assertNotEqual(original_pid, new_pid)
+        self.assertEqual(len(executor._processes), 1)
+
+    def test_max_tasks_per_child_map(self):
+        executor = self.executor_type(3, max_tasks_per_child=2)
+        self.addCleanup(executor.shutdown)
+        self.assertEqual(list(executor.map(abs, range(-50, 0))),
+                         list(range(50, 0, -1)))
+        pids = set(executor.map(get_pid, range(12)))
+        self.assertGreaterEqual(len(pids), 6)
+
+    def test_max_tasks_per_child_shutdown(self):
+        # Pending calls are completed by replacement workers during shutdown
+        executor = self.executor_type(2, max_tasks_per_child=1)
+        fs = [executor.submit(abs, -i) for i in range(10)]
+        executor.shutdown(wait=True)
+        self.assertEqual([f.result() for f in fs], list(range(10)))
+
+    def test_invalid_max_tasks_per_child(self):
+        self.assertRaises(ValueError, self.executor_type, 1,
+                          max_tasks_per_child=0)
+        self.assertRaises(TypeError, self.executor_type, 1,
+                          max_tasks_per_child=1.5)
+
+    def test_map_chunksize_buffersize(self):
+        results = self.executor.map(str, itertools.count(), chunksize=4,
+                                    buffersize=2)
+        self.assertEqual(list(itertools.islice(results, 10)),
+                         [str(i) for i in range(10)])
+
     def test_killed_child(self):
         # When a child process is abruptly terminated, the whole pool gets
         # "broken".
@@ -445,6 +641,77 @@ class ProcessPoolExecutorTest(ProcessPoolMixin, ExecutorTest):
         self.assertRaises(BrokenProcessPool, self.executor.submit, pow, 2, 8)
 
 
+class InitializerMixin(ExecutorMixin):
+    worker_count = 2
+
+    def setUp(self):
+        global INITIALIZER_STATUS
+        INITIALIZER_STATUS = 'uninitialized'
+        self.executor_kwargs = dict(initializer=init,
+                                    initargs=('initialized',))
+        super().setUp()
+
+    def test_initializer(self):
+        futures = [self.executor.submit(get_init_status)
+                   for _ in range(self.worker_count)]
+
+        for f in futures:
+            self.assertEqual(f.result(), 'initialized')
+
+
+class FailingInitializerMixin(ExecutorMixin):
+    worker_count = 2
+
+    def setUp(self):
+        self.executor_kwargs = dict(initializer=init_fail)
+        logger = logging.getLogger('concurrent.futures')
+        self.addCleanup(setattr, logger, 'disabled', logger.disabled)
+        super().setUp()
+
+    def _prime_executor(self):
+        pass
+
+    def test_initializer(self):
+        try:
+            future = self.executor.submit(get_init_status)
+        except futures.BrokenExecutor:
+            # Perhaps the executor is already broken
+            pass
+        else:
+            with self.assertRaises(futures.BrokenExecutor):
+                future.result()
+        # At some point, the executor should break
+        t1 = time.time()
+        while not self.executor._broken:
+            if time.time() - t1 > 5:
+                self.fail("executor not broken after 5 s.")
+            time.sleep(0.01)
+        # ... and from this point submit() is guaranteed to fail
+        with self.assertRaises(futures.BrokenExecutor):
+            self.executor.submit(get_init_status)
+
+
+class ThreadPoolInitializerTest(InitializerMixin, ThreadPoolMixin,
+                                unittest.TestCase):
+    pass
+
+
+class ProcessPoolInitializerTest(InitializerMixin, ProcessPoolMixin,
+                                 unittest.TestCase):
+    pass
+
+
+class ThreadPoolFailingInitializerTest(FailingInitializerMixin,
+                                       ThreadPoolMixin, unittest.TestCase):
+    def test_broken_thread_pool(self):
+        self.assertRaises(BrokenThreadPool, self.executor.submit(abs, 1).result)
+
+
+class ProcessPoolFailingInitializerTest(FailingInitializerMixin,
+                                        ProcessPoolMixin, unittest.TestCase):
+    pass
+
+
 class FutureTests(unittest.TestCase):
     def test_done_callback_with_result(self):
         callback_result = None
@@ -667,6 +934,36 @@ class FutureTests(unittest.TestCase):
 
         self.assertTrue(isinstance(f1.exception(timeout=5), OSError))
 
+    def test_no_instance_dict(self):
+        f = Future()
+        self.assertFalse(hasattr(f, '__dict__'))
+        self.assertRaises(AttributeError, setattr, f, 'foo', 1)
+        # Futures can still be weakly referenced.
+        self.assertIs(weakref.ref(f)(), f)
+
+    def test_condition_created_lazily(self):
+        f = Future()
+        f.add_done_callback(lambda future: None)
+        f.set_running_or_notify_cancel()
+        f.set_result(42)
+        self.assertEqual(f.result(), 42)
+        self.assertEqual(f.exception(), None)
+        self.assertIsNone(f._cond)
+
+        f = create_future(state=PENDING)
+        self.assertRaises(futures.TimeoutError, f.result, timeout=0)
+        self.assertIsNotNone(f._cond)
+
+    def test_waiters_removed(self):
+        f = create_future(state=PENDING)
+        futures.wait([f, SUCCESSFUL_FUTURE], timeout=0)
+        self.assertEqual(f._waiters, [])
+        self.assertEqual(list(futures.as_completed([SUCCESSFUL_FUTURE])),
+                         [SUCCESSFUL_FUTURE])
+        self.assertRaises(futures.TimeoutError, list,
+                          futures.as_completed([f], timeout=0))
+        self.assertEqual(f._waiters, [])
+
 @test.support.reap_threads
 def test_main():
     try:
@@ -679,6 +976,10 @@ def test_main():
                                   FutureTests,
                                   ProcessPoolShutdownTest,
                                   ThreadPoolShutdownTest,
+                                  ThreadPoolInitializerTest,
+                                  ProcessPoolInitializerTest,
+                                  ThreadPoolFailingInitializerTest,
+                                  ProcessPoolFailingInitializerTest,
                                   )
     finally:
         test.support.reap_children()
@@ -616,10 +616,16 @@ class GCTests(unittest.TestCase):
         for st in stats:
             self.assertIsInstance(st, dict)
             self.assertEqual(set(st),
-                             {"collected", "collections", "uncollectable"})
+                             {"collected", "collections", "uncollectable",
+                              "examined", "duration", "max_duration",
+                              "skipped"})
             self.assertGreaterEqual(st["collected"], 0)
             self.assertGreaterEqual(st["collections"], 0)
             self.assertGreaterEqual(st["uncollectable"], 0)
+            self.assertGreaterEqual(st["examined"], 0)
+            self.assertGreaterEqual(st["duration"], st["max_duration"])
+            self.assertGreaterEqual(st["max_duration"], 0.0)
+            self.assertGreaterEqual(st["skipped"], 0)
         # Check that collection counts are incremented correctly
         if gc.isenabled():
             self.addCleanup(gc.enable)
@@ -636,6 +642,47 @@ class GCTests(unittest.TestCase):
         self.assertEqual(new[1]["collections"], old[1]["collections"])
         self.assertEqual(new[2]["collections"], old[2]["collections"] + 1)
 
+    def test_get_stats_examined(self):
+        if gc.isenabled():
+            self.addCleanup(gc.enable)
+            gc.disable()
+        gc.collect()
+        old = gc.get_stats()
+        objs = [[] for i in range(100)]
+        gc.collect(0)
+        new = gc.get_stats()
+        # The young generation held at least the new lists
+        self.assertGreaterEqual(new[0]["examined"] - old[0]["examined"], 100)
+        self.assertGreaterEqual(new[0]["duration"], old[0]["duration"])
+        gc.collect(2)
+        newer = gc.get_stats()
+        # A full collection examines every tracked object
+        self.assertGreaterEqual(newer[2]["examined"] - new[2]["examined"],
+                                len(gc.get_objects()) - 10)
+        del objs
+
+    def test_skipped_full_collections(self):
+        # A full collection is skipped while the number of objects awaiting
+        # their first full collection is small compared to the number of
+        # long-lived objects (issue #4074)
+        if gc.isenabled():
+            self.addCleanup(gc.enable)
+            gc.disable()
+        self.addCleanup(gc.set_threshold, *gc.get_threshold())
+        objs = [[] for i in range(10000)]
+        gc.collect()
+        old = gc.get_stats()
+        gc.set_threshold(5, 1, 1)
+        young = []
+        gc.enable()
+        for i in range(1000):
+            young.append([])
+        gc.disable()
+        new = gc.get_stats()
+        self.assertGreater(new[2]["skipped"], old[2]["skipped"])
+        self.assertEqual(new[2]["collections"], old[2]["collections"])
+        del objs, young
+
 
 class GCCallbackTests(unittest.TestCase):
     def setUp(self):
@@ -714,6 +761,11 @@ class GCCallbackTests(unittest.TestCase):
             self.assertTrue("generation" in info)
             self.assertTrue("collected" in info)
             self.assertTrue("uncollectable" in info)
+            self.assertTrue("examined" in info)
+            self.assertTrue("duration" in info)
+            if v[1] == "stop":
+                self.assertGreater(info["examined"], 0)
+                self.assertGreaterEqual(info["duration"], 0.0)
 
     def test_collect_generation(self):
         self.preclean()
@@ -283,6 +283,36 @@ class BasicTest(TestCase):
         if resp.read():
             self.fail("Did not expect response from HEAD request")
 
+    def test_on_close(self):
+        # The _on_close hook tells whether the whole response was read
+        body = ('HTTP/1.1 200 OK\r\n'
+                'Content-Length: 4\r\n'
+                '\r\n'
+                'Text')
+        chunked = ('HTTP/1.1 200 OK\r\n'
+                   'Transfer-Encoding: chunked\r\n'
+                   '\r\n'
+                   '4\r\nText\r\n0\r\n\r\n')
+        read_all = lambda r: r.read()
+        read_4 = lambda r: r.read(4)
+        close = lambda r: r.close()
+        for text, method, read, complete in [
+                (body, "GET", read_all, True),
+                (body, "GET", read_4, True),
+                (body, "HEAD", read_all, True),
+                (chunked, "GET", read_all, True),
+                (chunked, "GET", read_4, True),
+                (body, "GET", close, False),
+                (chunked, "GET", close, False)]:
+            calls = []
+            resp = client.HTTPResponse(FakeSocket(text), method=method)
+            resp.begin()
+            resp._on_close = calls.append
+            read(resp)
+            resp.read()
+            resp.close()
+            self.assertEqual(calls, [complete], (text, method))
+
     def test_readinto_head(self):
         # Test that the library doesn't attempt to read any data
         # from a HEAD request.  (Tickles SF bug #622042.)
@@ -822,6 +852,134 @@ class RequestBodyTest(TestCase):
             self.assertEqual("5", message.get("content-length"))
             self.assertEqual(b'body\xc1', f.read())
 
+    def read_chunked(self, f):
+        chunks = []
+        while True:
+            size = int(f.readline(), 16)
+            if not size:
+                break
+            chunks.append(f.read(size))
+            self.assertEqual(f.read(2), b"\r\n")
+        self.assertEqual(f.read(), b"\r\n")
+        return chunks
+
+    def test_iterable_body_chunked(self):
+        def body():
+            yield b"first"
+            yield b""
+            yield bytearray(b"second")
+        self.conn.request("PUT", "/url", body())
+        message, f = self.get_headers_and_fp()
+        self.assertEqual("chunked", message.get("transfer-encoding"))
+        self.assertIsNone(message.get("content-length"))
+        self.assertEqual([b"first", b"second"], self.read_chunked(f))
+
+    def test_unsized_file_body_chunked(self):
+        # file-like objects without a file descriptor have no known size
+        self.conn.request("PUT", "/url", io.BytesIO(b"body" * 5000))
+        message, f = self.get_headers_and_fp()
+        self.assertEqual("chunked", message.get("transfer-encoding"))
+        self.assertEqual(b"body" * 5000, b"".join(self.read_chunked(f)))
+
+    def test_explicit_chunked(self):
+        self.conn.request("PUT", "/url", b"body",
+                          {"Transfer-Encoding": "chunked"},
+                          encode_chunked=True)
+        message, f = self.get_headers_and_fp()
+        self.assertEqual("chunked", message.get("transfer-encoding"))
+        self.assertIsNone(message.get("content-length"))
+        self.assertEqual([b"body"], self.read_chunked(f))
+
+    def test_explicit_length_not_chunked(self):
+        self.conn.request("PUT", "/url", iter([b"bo", b"dy"]),
+                          {"Content-Length": "4"})
+        message, f = self.get_headers_and_fp()
+        self.assertIsNone(message.get("transfer-encoding"))
+        self.assertEqual(b"body", f.read())
+
+
+class PipeliningTest(TestCase):
+
+    class Socket(FakeSocket):
+        def close(self):
+            pass
+
+    def response(self, body, *headers):
+        return ("HTTP/1.1 200 OK\r\n" +
+                "".join(h + "\r\n" for h in headers) +
+                "Content-Length: %d\r\n\r\n%s" % (len(body), body))
+
+    def connection(self, *responses):
+        conn = client.HTTPConnection("example.com", pipelining=True)
+        conn.sock = self.Socket("".join(responses))
+        return conn
+
+    def test_pipelining(self):
+        # a HEAD response has no body
+        head = "HTTP/1.1 200 OK\r\nContent-Length: 6\r\n\r\n"
+        conn = self.connection(self.response("first"), head,
+                               self.response("third"))
+        conn.request("GET", "/first")
+        conn.request("HEAD", "/second")
+        conn.request("GET", "/third")
+        self.assertEqual(conn.sock.data.count(b"HTTP/1.1\r\n"), 3)
+        first = conn.getresponse()
+        # responses are read in order
+        self.assertRaises(client.ResponseNotReady, conn.getresponse)
+        self.assertEqual(first.read(), b"first")
+        second = conn.getresponse()
+        self.assertEqual(second.getheader("Content-Length"), "6")
+        self.assertEqual(second.read(), b"")
+        third = conn.getresponse()
+        self.assertEqual(third.read(), b"third")
+        self.assertRaises(client.ResponseNotReady, conn.getresponse)
+
+    def test_reading_response_while_pipelining(self):
+        conn = self.connection(self.response("first"),
+                               self.response("second"))
+        conn.request("GET", "/first")
+        first = conn.getresponse()
+        conn.request("GET", "/second")
+        self.assertEqual(first.read(), b"first")
+        self.assertEqual(conn.getresponse().read(), b"second")
+
+    def test_not_idempotent(self):
+        conn = self.connection()
+        conn.request("POST", "/", b"body")
+        self.assertRaises(client.CannotSendRequest, conn.request, "GET", "/")
+        conn = self.connection()
+        conn.request("GET", "/")
+        self.assertRaises(client.CannotSendRequest,
+                          conn.request, "POST", "/", b"body")
+
+    def test_disabled(self):
+        conn = self.connection()
+        conn.pipelining = False
+        conn.request("GET", "/")
+        self.assertRaises(client.CannotSendRequest, conn.request, "GET", "/")
+
+    def test_connection_closed(self):
+        conn = self.connection(self.response("first", "Connection: close"),
+                               self.response("second"))
+        conn.request("GET", "/first")
+        conn.request("GET", "/second")
+        conn.request("GET", "/third")
+        first = conn.getresponse()
+        self.assertEqual(first.read(), b"first")
+        # the server did not answer the following requests
+        self.assertRaises(client.ResponseNotReady, conn.getresponse)
+        self.assertRaises(client.ResponseNotReady, conn.getresponse)
+        self.assertIsNone(conn.sock)
+
+    def test_response_not_read(self):
+        conn = self.connection(self.response("first"),
+                               self.response("second"))
+        conn.request("GET", "/first")
+        conn.request("GET", "/second")
+        conn.getresponse().close()
+        self.assertRaises(client.ResponseNotReady, conn.getresponse)
+        self.assertIsNone(conn.sock)
+
 
 class HTTPResponseTest(TestCase):
 
@@ -861,7 +1019,7 @@ class HTTPResponseTest(TestCase):
 def test_main(verbose=None):
     support.run_unittest(HeaderTests, OfflineTest, BasicTest, TimeoutTest,
                          HTTPSTest, RequestBodyTest, SourceAddressTest,
-                         HTTPResponseTest)
+                         PipeliningTest, HTTPResponseTest)
 
 if __name__ == '__main__':
     test_main()
@@ -5,14 +5,17 @@ Josip Dzolonga, and Michael Otteneder for the 2007/08 GHOP contest.
 """
 
 from http.server import BaseHTTPRequestHandler, HTTPServer, \
-     SimpleHTTPRequestHandler, CGIHTTPRequestHandler
+     SimpleHTTPRequestHandler, CGIHTTPRequestHandler, SelectorHTTPServer
 from http import server
 
 import os
 import sys
+import errno
 import re
 import base64
 import shutil
+import socket
+import time
 import urllib.parse
 import http.client
 import tempfile
@@ -35,10 +38,12 @@ class TestServerThread(threading.Thread):
     def __init__(self, test_object, request_handler):
         threading.Thread.__init__(self)
         self.request_handler = request_handler
+        self.server_class = test_object.server_class
         self.test_object = test_object
 
     def run(self):
-        self.server = HTTPServer(('localhost', 0), self.request_handler)
+        self.server = self.server_class(('localhost', 0),
+                                        self.request_handler)
         self.test_object.HOST, self.test_object.PORT = self.server.socket.getsockname()
         self.test_object.server_started.set()
         self.test_object = None
@@ -52,6 +57,8 @@ class TestServerThread(threading.Thread):
 
 
 class BaseTestCase(unittest.TestCase):
+    server_class = HTTPServer
+
     def setUp(self):
         self._threads = support.threading_setup()
         os.environ = support.EnvironmentVarGuard()
@@ -223,6 +230,170 @@ class BaseHTTPServerTestCase(BaseTestCase):
         self.assertEqual(int(res.getheader('Content-Length')), len(data))
 
 
+class SelectorHTTPServerTestCase(BaseHTTPServerTestCase):
+    server_class = SelectorHTTPServer
+
+    class request_handler(BaseHTTPServerTestCase.request_handler):
+        def do_ECHO(self):
+            body = self.rfile.read()
+            self.send_response(200)
+            self.send_header('Content-Length', len(body))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_BOOM(self):
+            raise RuntimeError('handler failure')
+
+    def setUp(self):
+        BaseHTTPServerTestCase.setUp(self)
+        self.addCleanup(self.con.close)
+
+    def connect(self):
+        sock = socket.create_connection((self.HOST, self.PORT))
+        self.addCleanup(sock.close)
+        sock.settimeout(10)
+        return sock
+
+    def read_responses(self, sock, count):
+        responses = []
+        for i in range(count):
+            res = http.client.HTTPResponse(sock)
+            res.begin()
+            responses.append((res.status, res.read()))
+        return responses
+
+    def test_many_keep_alive_connections(self):
+        connections = []
+        for i in range(50):
+            con = http.client.HTTPConnection(self.HOST, self.PORT)
+            self.addCleanup(con.close)
+            connections.append(con)
+        for i, con in enumerate(connections):
+            con.request('ECHO', '/', body=str(i).encode('ascii'))
+        for i, con in enumerate(connections):
+            res = con.getresponse()
+            self.assertEqual(res.status, 200)
+            self.assertEqual(res.read(), str(i).encode('ascii'))
+            con.request('ECHO', '/', body=b'again')
+        for con in connections:
+            self.assertEqual(con.getresponse().read(), b'again')
+
+    def test_incremental_request(self):
+        sock = self.connect()
+        request = (b'ECHO / HTTP/1.1\r\nHost: localhost\r\n'
+                   b'Content-Length: 5\r\n\r\nhello')
+        for i in range(len(request)):
+            sock.sendall(request[i:i + 1])
+        self.assertEqual(self.read_responses(sock, 1), [(200, b'hello')])
+
+    def test_pipelined_requests(self):
+        sock = self.connect()
+        sock.sendall(b'ECHO / HTTP/1.1\r\nContent-Length: 5\r\n\r\nfirst'
+                     b'ECHO / HTTP/1.1\r\nContent-Length: 6\r\n\r\nsecond'
+                     b'ECHO / HTTP/1.1\r\nConnection: close\r\n\r\n')
+        data = b''
+        while True:
+            chunk = sock.recv(1024)
+            if not chunk:
+                break
+            data += chunk
+        self.assertEqual(data.count(b'HTTP/1.1 200 OK\r\n'), 3)
+        self.assertLess(data.index(b'\r\n\r\nfirst'),
+                        data.index(b'\r\n\r\nsecond'))
+        self.assertTrue(data.endswith(b'Content-Length: 0\r\n\r\n'))
+
+    def test_many_pipelined_requests(self):
+        sock = self.connect()
+        request = b'ECHO / HTTP/1.1\r\nContent-Length: 1\r\n\r\nx'
+        sock.sendall(request * 2000 +
+                     b'ECHO / HTTP/1.1\r\nConnection: close\r\n\r\n')
+        data = b''
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+        self.assertEqual(data.count(b'HTTP/1.1 200 OK\r\n'), 2001)
+
+    def test_expect_100_continue(self):
+        sock = self.connect()
+        sock.sendall(b'ECHO / HTTP/1.1\r\nContent-Length: 4\r\n'
+                     b'Expect: 100-continue\r\n\r\n')
+        # The interim response is sent before the body is read.
+        self.assertEqual(sock.recv(100), b'HTTP/1.1 100 Continue\r\n')
+        sock.sendall(b'body')
+        self.assertEqual(self.read_responses(sock, 1), [(200, b'body')])
+
+    def test_chunked_body_rejected(self):
+        sock = self.connect()
+        sock.sendall(b'ECHO / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n'
+                     b'\r\n0\r\n\r\n')
+        status, body = self.read_responses(sock, 1)[0]
+        self.assertEqual(status, 411)
+
+    def test_header_too_large(self):
+        sock = self.connect()
+        sock.sendall(b'GET / HTTP/1.1\r\n')
+        header = b'X-Padding: ' + b'x' * 1000 + b'\r\n'
+        try:
+            for i in range(SelectorHTTPServer.max_header_size // 1000 + 1):
+                sock.sendall(header)
+        except OSError:
+            # The server may close the connection before we are done.
+            pass
+        status, body = self.read_responses(sock, 1)[0]
+        self.assertEqual(status, 431)
+
+    def test_handler_exception(self):
+        self.thread.server.handle_error = lambda request, address: None
+        sock = self.connect()
+        sock.sendall(b'BOOM / HTTP/1.1\r\n\r\n')
+        self.assertEqual(sock.recv(100), b'')
+        # The server keeps serving other connections.
+        self.con.request('ECHO', '/', body=b'still up')
+        self.assertEqual(self.con.getresponse().read(), b'still up')
+
+
+class SelectorHTTPServerIdleTestCase(unittest.TestCase):
+    class request_handler(NoLogRequestHandler, BaseHTTPRequestHandler):
+        timeout = 0.5
+
+    def setUp(self):
+        self._threads = support.threading_setup()
+        self.server = SelectorHTTPServer(('localhost', 0),
+                                         self.request_handler)
+        # Without a poll interval, only the connection deadlines wake up
+        # the loop of a quiet server.
+        self.thread = threading.Thread(target=self.server.serve_forever,
+                                       kwargs={'poll_interval': None})
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.thread.join()
+        self.server.server_close()
+        support.threading_cleanup(*self._threads)
+
+    def connect(self):
+        sock = socket.create_connection(self.server.server_address)
+        self.addCleanup(sock.close)
+        sock.settimeout(10)
+        return sock
+
+    def test_idle_connection_closed(self):
+        idle = self.connect()
+        active = self.connect()
+        start = time.monotonic()
+        # Keep one connection busy past the timeout of the other.
+        for i in range(8):
+            active.sendall(b'G')
+            time.sleep(0.1)
+        self.assertEqual(idle.recv(100), b'')
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(len(self.server._connections), 1)
+        self.assertEqual(active.recv(100), b'')
+
+
 class SimpleHTTPServerTestCase(BaseTestCase):
     class request_handler(NoLogRequestHandler, SimpleHTTPRequestHandler):
         pass
@@ -297,6 +468,153 @@ class SimpleHTTPServerTestCase(BaseTestCase):
         response = self.request('/', method='GETs')
         self.check_status_and_reason(response, 501)
 
+    def test_validators(self):
+        response = self.request(self.tempdir_name + '/test')
+        self.check_status_and_reason(response, 200, data=self.data)
+        self.assertIsNotNone(response.getheader('etag'))
+        self.assertIsNotNone(response.getheader('last-modified'))
+        self.assertEqual(response.getheader('accept-ranges'), 'bytes')
+
+    def test_if_none_match(self):
+        url = self.tempdir_name + '/test'
+        etag = self.request(url).getheader('etag')
+        response = self.request(url, headers={'If-None-Match': etag})
+        self.check_status_and_reason(response, 304)
+        self.assertEqual(response.read(), b'')
+        self.assertEqual(response.getheader('etag'), etag)
+        response = self.request(url, headers={'If-None-Match': '"x", *'})
+        self.check_status_and_reason(response, 304)
+        response = self.request(url, headers={'If-None-Match': 'W/' + etag})
+        self.check_status_and_reason(response, 304)
+        response = self.request(url, headers={'If-None-Match': '"other"'})
+        self.check_status_and_reason(response, 200, data=self.data)
+        # If-None-Match takes precedence over If-Modified-Since
+        response = self.request(url, headers={
+            'If-None-Match': '"other"',
+            'If-Modified-Since': 'Fri, 31 Dec 9999 23:59:59 GMT'})
+        self.check_status_and_reason(response, 200, data=self.data)
+
+    def test_if_modified_since(self):
+        url = self.tempdir_name + '/test'
+        last_modified = self.request(url).getheader('last-modified')
+        response = self.request(url,
+                                headers={'If-Modified-Since': last_modified})
+        self.check_status_and_reason(response, 304)
+        response = self.request(url, headers={
+            'If-Modified-Since': 'Thu, 01 Jan 1970 00:00:00 GMT'})
+        self.check_status_and_reason(response, 200, data=self.data)
+        response = self.request(url, method='HEAD',
+                                headers={'If-Modified-Since': last_modified})
+        self.check_status_and_reason(response, 304)
+        response = self.request(url,
+                                headers={'If-Modified-Since': 'garbage'})
+        self.check_status_and_reason(response, 200, data=self.data)
+
+    def test_range(self):
+        url = self.tempdir_name + '/test'
+        size = len(self.data)
+        for spec, first, last in [('bytes=0-5', 0, 5),
+                                  ('bytes=7-', 7, size - 1),
+                                  ('bytes=-3', size - 3, size - 1),
+                                  ('bytes=-1000', 0, size - 1),
+                                  ('bytes=3-1000', 3, size - 1)]:
+            response = self.request(url, headers={'Range': spec})
+            self.check_status_and_reason(response, 206,
+                                         data=self.data[first:last+1])
+            self.assertEqual(response.getheader('content-range'),
+                             'bytes %d-%d/%d' % (first, last, size), spec)
+            self.assertEqual(response.getheader('content-length'),
+                             str(last - first + 1), spec)
+        response = self.request(url, method='HEAD',
+                                headers={'Range': 'bytes=2-4'})
+        self.check_status_and_reason(response, 206)
+        self.assertEqual(response.getheader('content-length'), '3')
+
+    def test_unsatisfiable_range(self):
+        url = self.tempdir_name + '/test'
+        for spec in ['bytes=%d-' % len(self.data), 'bytes=-0']:
+            response = self.request(url, headers={'Range': spec})
+            self.check_status_and_reason(response, 416)
+            self.assertEqual(response.getheader('content-range'),
+                             'bytes */%d' % len(self.data), spec)
+
+    def test_ignored_range(self):
+        # Invalid and multiple ranges are ignored
+        url = self.tempdir_name + '/test'
+        for spec in ['bytes=0-1,4-5', 'bytes=5-2', 'lines=1-2', 'bytes=x-']:
+            response = self.request(url, headers={'Range': spec})
+            self.check_status_and_reason(response, 200, data=self.data)
+
+    def test_if_range(self):
+        url = self.tempdir_name + '/test'
+        response = self.request(url)
+        etag = response.getheader('etag')
+        last_modified = response.getheader('last-modified')
+        for validator in etag, last_modified:
+            response = self.request(url, headers={'Range': 'bytes=0-1',
+                                                  'If-Range': validator})
+            self.check_status_and_reason(response, 206, data=self.data[:2])
+        response = self.request(url, headers={'Range': 'bytes=0-1',
+                                              'If-Range': '"stale"'})
+        self.check_status_and_reason(response, 200, data=self.data)
+
+    def test_large_file(self):
+        data = os.urandom(1024) * 1024
+        with open(os.path.join(self.tempdir, 'large'), 'wb') as f:
+            f.write(data)
+        url = self.tempdir_name + '/large'
+        response = self.request(url)
+        self.check_status_and_reason(response, 200, data=data)
+        response = self.request(url, headers={'Range': 'bytes=1000-99999'})
+        self.check_status_and_reason(response, 206, data=data[1000:100000])
+
+    @unittest.skipUnless(hasattr(os, 'sendfile'), 'requires os.sendfile()')
+    def test_sendfile(self):
+        calls = []
+        def sendfile(*args):
+            calls.append(args)
+            return orig_sendfile(*args)
+        orig_sendfile = os.sendfile
+        os.sendfile = sendfile
+        try:
+            response = self.request(self.tempdir_name + '/test',
+                                    headers={'Range': 'bytes=3-'})
+            self.check_status_and_reason(response, 206, data=self.data[3:])
+        finally:
+            os.sendfile = orig_sendfile
+        self.assertTrue(calls)
+        self.assertEqual(calls[0][2], 3)
+
+    @unittest.skipUnless(hasattr(os, 'sendfile'), 'requires os.sendfile()')
+    def test_sendfile_fallback(self):
+        def sendfile(*args):
+            raise OSError(errno.EINVAL, 'Invalid argument')
+        orig_sendfile = os.sendfile
+        os.sendfile = sendfile
+        try:
+            response = self.request(self.tempdir_name + '/test',
+                                    headers={'Range': 'bytes=3-9'})
+            self.check_status_and_reason(response, 206, data=self.data[3:10])
+        finally:
+            os.sendfile = orig_sendfile
+
+
+class ParseByteRangeTestCase(unittest.TestCase):
+    def test_parse_byte_range(self):
+        parse = server._parse_byte_range
+        self.assertEqual(parse('bytes=0-0', 10), (0, 0))
+        self.assertEqual(parse('bytes=0-', 10), (0, 9))
+        self.assertEqual(parse('bytes=5-20', 10), (5, 9))
+        self.assertEqual(parse('bytes=-4', 10), (6, 9))
+        self.assertEqual(parse('Bytes = 1 - 2', 10), (1, 2))
+        self.assertIsNone(parse('bytes=-', 10))
+        self.assertIsNone(parse('bytes=3-2', 10))
+        self.assertIsNone(parse('bytes=1-2,4-5', 10))
+        self.assertIsNone(parse('bytes=\u0661-2', 10))
+        self.assertRaises(ValueError, parse, 'bytes=10-', 10)
+        self.assertRaises(ValueError, parse, 'bytes=-0', 10)
+        self.assertRaises(ValueError, parse, 'bytes=-1', 0)
+
 
 cgi_file1 = """\
 #!%s
@@ -684,7 +1002,10 @@ def test_main(verbose=None):
         support.run_unittest(
             BaseHTTPRequestHandlerTestCase,
             BaseHTTPServerTestCase,
+            SelectorHTTPServerTestCase,
+            SelectorHTTPServerIdleTestCase,
             SimpleHTTPServerTestCase,
+            ParseByteRangeTestCase,
             CGIHTTPServerTestCase,
             SimpleHTTPRequestHandlerTestCase,
         )
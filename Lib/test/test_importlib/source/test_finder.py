@@ -2,10 +2,16 @@ from .. import abc
 from . import util as source_util
 
 from importlib import machinery
+from importlib import _bootstrap
+import importlib.util
 import errno
 import imp
+import marshal
 import os
 import py_compile
+import sys
+import tempfile
+from test import support, script_helper
 from test.support import make_legacy_pyc
 import unittest
 import warnings
@@ -147,9 +153,92 @@ class FinderTests(abc.FinderTests):
             self.assertIsNotNone(finder.find_module(mod))
         self.assertIsNone(finder.find_module(mod))
 
+
+class PathIndexTests(unittest.TestCase):
+
+    """Tests for the directory index consulted by FileFinder."""
+
+    def setUp(self):
+        self.addCleanup(setattr, _bootstrap, '_path_index',
+                        _bootstrap._path_index)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, self.directory)
+        os.mkdir(os.path.join(self.directory, 'pkg'))
+        for name in ('mod.py', os.path.join('pkg', '__init__.py')):
+            with open(os.path.join(self.directory, name), 'w') as file:
+                file.write('x = 1\n')
+        # Not in the indexed directory, which writing it would modify
+        index_dir = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, index_dir)
+        self.index_file = os.path.join(index_dir, 'index')
+
+    def load_index(self):
+        importlib.util.write_path_index(self.index_file, [self.directory])
+        with open(self.index_file, 'rb') as file:
+            data = file.read()
+        self.assertTrue(data.startswith(_bootstrap._PATH_INDEX_MAGIC))
+        index = marshal.loads(data[len(_bootstrap._PATH_INDEX_MAGIC):])
+        _bootstrap._path_index = index
+        return index
+
+    def get_finder(self):
+        return machinery.FileFinder(self.directory,
+                                    (machinery.SourceFileLoader,
+                                     machinery.SOURCE_SUFFIXES))
+
+    def test_write_path_index(self):
+        index = self.load_index()
+        mtime, files, dirs = index[self.directory]
+        self.assertEqual(mtime, os.stat(self.directory).st_mtime)
+        self.assertEqual(files, {'mod.py'})
+        self.assertEqual(dirs, {'pkg'})
+        pkg = os.path.join(self.directory, 'pkg')
+        self.assertEqual(index[pkg][1:], ({'__init__.py'}, set()))
+
+    @unittest.skipIf(sys.platform.startswith('win'),
+                     'the index only replaces directory listings')
+    def test_index_is_used(self):
+        index = self.load_index()
+        # Pretend a module exists: only the index knows about it
+        mtime, files, dirs = index[self.directory]
+        index[self.directory] = (mtime, files | {'ghost.py'}, dirs)
+        finder = self.get_finder()
+        self.assertIsNotNone(finder.find_module('mod'))
+        self.assertIsNotNone(finder.find_module('pkg'))
+        loader = finder.find_module('ghost')
+        self.assertEqual(loader.path,
+                         os.path.join(self.directory, 'ghost.py'))
+
+    def test_stale_entry_ignored(self):
+        index = self.load_index()
+        mtime, files, dirs = index[self.directory]
+        index[self.directory] = (mtime - 10, files | {'ghost.py'}, dirs)
+        finder = self.get_finder()
+        self.assertIsNotNone(finder.find_module('mod'))
+        self.assertIsNone(finder.find_module('ghost'))
+
+    def test_environment_variable(self):
+        importlib.util.write_path_index(self.index_file, [self.directory])
+        code = ('import sys; sys.path.insert(0, {!r}); import pkg, mod; '
+                'from importlib import _bootstrap; '
+                'assert {!r} in _bootstrap._get_path_index()'.format(
+                    self.directory, self.directory))
+        script_helper.assert_python_ok('-c', code,
+                                       PYTHONIMPORTINDEX=self.index_file)
+        # An invalid index file is ignored
+        with open(self.index_file, 'wb') as file:
+            file.write(b'garbage')
+        code = ('import sys; sys.path.insert(0, {!r}); import pkg, mod; '
+                'from importlib import _bootstrap; '
+                'assert not _bootstrap._get_path_index()'.format(
+                    self.directory))
+        script_helper.assert_python_ok('-c', code,
+                                       PYTHONIMPORTINDEX=self.index_file)
+
+
 def test_main():
     from test.support import run_unittest
-    run_unittest(FinderTests)
+    run_unittest(FinderTests, PathIndexTests)
 
 
 if __name__ == '__main__':
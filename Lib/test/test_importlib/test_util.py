@@ -1,5 +1,6 @@
-from importlib import util
+from importlib import machinery, util
 from . import util as test_util
+from .source import util as source_util
 import imp
 import sys
 import types
@@ -195,12 +196,132 @@ class ResolveNameTests(unittest.TestCase):
             util.resolve_name('..bacon', 'spam')
 
 
+class CollectExecLoader:
+
+    """Loader recording the modules it executes."""
+
+    def __init__(self):
+        self.loaded = []
+
+    def is_package(self, fullname):
+        return False
+
+    def exec_module(self, module):
+        self.loaded.append(module)
+        module.attr = 42
+        module.__name__ = 'changed'
+
+
+class LazyLoaderTests(unittest.TestCase):
+
+    def new_module(self, name='lazy_mod'):
+        loader = CollectExecLoader()
+        lazy_loader = util.LazyLoader(loader)
+        with test_util.uncache(name):
+            module = lazy_loader.load_module(name)
+            self.assertIs(sys.modules[name], module)
+        return loader, module
+
+    def test_init(self):
+        with self.assertRaises(TypeError):
+            util.LazyLoader(object())
+        with self.assertRaises(TypeError):
+            util.LazyLoader.factory(object)
+
+    def test_factory(self):
+        factory = util.LazyLoader.factory(CollectExecLoader)
+        lazy_loader = factory()
+        self.assertIsInstance(lazy_loader, util.LazyLoader)
+        self.assertIsInstance(lazy_loader.loader, CollectExecLoader)
+
+    def test_deferred_execution(self):
+        loader, module = self.new_module()
+        self.assertIsInstance(module, types.ModuleType)
+        self.assertEqual(loader.loaded, [])
+        # Attributes set before execution don't trigger it.
+        self.assertEqual(module.__name__, 'lazy_mod')
+        self.assertIs(module.__loader__, loader)
+        self.assertEqual(module.__package__, '')
+        self.assertEqual(loader.loaded, [])
+        self.assertEqual(module.attr, 42)
+        self.assertEqual(loader.loaded, [module])
+        self.assertEqual(module.__name__, 'changed')
+        # Execution only happens once.
+        module.attr
+        self.assertEqual(len(loader.loaded), 1)
+
+    def test_missing_attribute(self):
+        loader, module = self.new_module()
+        with self.assertRaises(AttributeError):
+            module.missing
+        self.assertEqual(len(loader.loaded), 1)
+
+    def test_delete_attribute(self):
+        loader, module = self.new_module()
+        del module.attr
+        self.assertEqual(len(loader.loaded), 1)
+        self.assertFalse(hasattr(module, 'attr'))
+        loader, module = self.new_module()
+        with self.assertRaises(AttributeError):
+            del module.missing
+
+    def test_failed_execution(self):
+        class BrokenLoader(CollectExecLoader):
+            def exec_module(self, module):
+                raise ZeroDivisionError
+        with test_util.uncache('lazy_mod'):
+            module = util.LazyLoader(BrokenLoader()).load_module('lazy_mod')
+            with self.assertRaises(ZeroDivisionError):
+                module.attr
+            self.assertNotIn('lazy_mod', sys.modules)
+
+    def test_reload_is_eager(self):
+        loader = CollectExecLoader()
+        loader.load_module = lambda fullname: sys.modules[fullname]
+        module = types.ModuleType('lazy_mod')
+        with test_util.uncache('lazy_mod'):
+            sys.modules['lazy_mod'] = module
+            result = util.LazyLoader(loader).load_module('lazy_mod')
+        self.assertIs(result, module)
+
+    def test_import(self):
+        # The import system doesn't trigger the execution.
+        loader = CollectExecLoader()
+        class Finder:
+            def find_module(self, fullname, path=None):
+                if fullname == 'lazy_mod':
+                    return util.LazyLoader(loader)
+        with test_util.uncache('lazy_mod'), \
+             test_util.import_state(meta_path=[Finder()]):
+            module = __import__('lazy_mod')
+            self.assertIs(__import__('lazy_mod'), module)
+            self.assertEqual(loader.loaded, [])
+            self.assertEqual(module.attr, 42)
+            self.assertEqual(loader.loaded, [module])
+
+    def test_source_loader(self):
+        loader = util.LazyLoader.factory(machinery.SourceFileLoader)
+        hook = machinery.FileFinder.path_hook(
+                (loader, machinery.SOURCE_SUFFIXES))
+        with source_util.create_modules('_temp') as mapping:
+            finder = hook(mapping['.root'])
+            with test_util.import_state(meta_path=[], path_hooks=[],
+                                        path_importer_cache={}):
+                lazy_loader = finder.find_module('_temp')
+                module = lazy_loader.load_module('_temp')
+                self.assertIsInstance(lazy_loader, util.LazyLoader)
+                self.assertEqual(module.__file__, mapping['_temp'])
+                self.assertIs(module.__loader__, lazy_loader.loader)
+                self.assertEqual(module.attr, '_temp')
+
+
 def test_main():
     from test import support
     support.run_unittest(
             ModuleForLoaderTests,
             SetPackageTests,
-            ResolveNameTests
+            ResolveNameTests,
+            LazyLoaderTests
         )
 
 
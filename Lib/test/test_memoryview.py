@@ -146,6 +146,17 @@ class AbstractMemoryTests:
             l = m.tolist()
             self.assertEqual(l, list(b"abcdef"))
 
+    def test_toreadonly(self):
+        for tp in self._types:
+            b = tp(self._source)
+            m = self._view(b)
+            mm = m.toreadonly()
+            self.assertTrue(mm.readonly)
+            self.assertTrue(memoryview(mm).readonly)
+            self.assertEqual(mm.tolist(), m.tolist())
+            mm.release()
+            m.tolist()
+
     def test_compare(self):
         # memoryviews can compare for equality with other objects
         # having the buffer interface.
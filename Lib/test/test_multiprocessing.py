@@ -20,6 +20,7 @@ import random
 import logging
 import struct
 import operator
+import pickle
 import test.support
 import test.script_helper
 
@@ -1711,6 +1712,35 @@ class _TestPool(BaseTestCase):
         it = self.pool.imap_unordered(sqr, list(range(1000)), chunksize=53)
         self.assertEqual(sorted(it), list(map(sqr, list(range(1000)))))
 
+    def test_guided_scheduling(self):
+        p = self.Pool(4, scheduling='guided')
+        try:
+            it = p.imap(sqr, list(range(1000)), chunksize=100)
+            self.assertEqual(list(it), list(map(sqr, list(range(1000)))))
+
+            it = p.imap_unordered(sqr, iter(range(1000)), chunksize=53)
+            self.assertEqual(sorted(it), list(map(sqr, list(range(1000)))))
+
+            self.assertEqual(list(p.imap_unordered(sqr, [], chunksize=10)),
+                             [])
+        finally:
+            p.close()
+            p.join()
+        self.assertRaises(ValueError, multiprocessing.Pool, 1,
+                          scheduling='dynamic')
+
+    def test_guided_chunks(self):
+        from multiprocessing.pool import Pool
+        sizes = [len(chunk) for func, chunk in
+                 Pool._get_guided_tasks(sqr, range(100), 10, 4)]
+        self.assertEqual(sum(sizes), 100)
+        # Full chunks until the end of the input is in sight, then chunks
+        # that shrink down to a single item.
+        self.assertEqual(sizes[:7], [10] * 7)
+        self.assertEqual(sizes[7:], sorted(sizes[7:], reverse=True))
+        self.assertLess(max(sizes[7:]), 10)
+        self.assertEqual(sizes[-1], 1)
+
     def test_make_pool(self):
         self.assertRaises(ValueError, multiprocessing.Pool, -1)
         self.assertRaises(ValueError, multiprocessing.Pool, 0)
@@ -2035,6 +2065,13 @@ class _TestManagerRestart(BaseTestCase):
 
 SENTINEL = latin('')
 
+def _raise_runtime_error():
+    raise RuntimeError("cannot unpickle")
+
+class _RaisingReduce(object):
+    def __reduce__(self):
+        return (_raise_runtime_error, ())
+
 class _TestConnection(BaseTestCase):
 
     ALLOWED_TYPES = ('processes', 'threads')
@@ -2136,6 +2173,43 @@ class _TestConnection(BaseTestCase):
             self.assertRaises(OSError, writer.recv)
             self.assertRaises(OSError, writer.poll)
 
+    def test_out_of_band_buffers(self):
+        conn, child_conn = self.Pipe()
+
+        p = self.Process(target=self._echo, args=(child_conn,))
+        p.daemon = True
+        p.start()
+
+        # The large array is sent as a separate message after the pickle,
+        # the small one is copied into the pickle.
+        big = array.array('d', range(100000))
+        small = array.array('i', range(4))
+        conn.send([big, small, big])
+        self.assertEqual(conn.recv(), [big, small, big])
+
+        conn.send_bytes(SENTINEL)                          # tell child to quit
+        child_conn.close()
+        p.join()
+
+    def test_out_of_band_buffers_unpickling_error(self):
+        if self.TYPE != 'processes':
+            return
+
+        a, b = self.Pipe()
+        # The message may not fit in the pipe, so send from another thread.
+        t = threading.Thread(target=lambda: (
+            a.send([_RaisingReduce(), pickle.PickleBuffer(bytearray(100000))]),
+            a.send('next')))
+        t.start()
+        try:
+            self.assertRaises(RuntimeError, b.recv)
+            # The buffer was consumed along with the failed pickle.
+            self.assertEqual(b.recv(), 'next')
+        finally:
+            t.join()
+            a.close()
+            b.close()
+
     def test_spawn_close(self):
         # We test that a pipe connection can be closed by parent
         # process immediately after child is spawned.  On Windows this
@@ -2639,6 +2713,93 @@ class _TestHeap(BaseTestCase):
             a.buddy = b
             b.buddy = a
 
+
+class _TestSharedMemory(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    @classmethod
+    def _double(cls, args):
+        arr, i = args
+        arr[i] *= 2
+        return arr[i]
+
+    def test_shared_memory(self):
+        shm = multiprocessing.SharedMemory(create=True, size=100)
+        self.addCleanup(shm.unlink)
+        self.addCleanup(shm.close)
+        self.assertEqual(shm.size, 100)
+        shm.buf[:5] = b'hello'
+
+        # Attach by name, and through pickling
+        with multiprocessing.SharedMemory(shm.name, size=shm.size) as other:
+            self.assertEqual(bytes(other.buf[:5]), b'hello')
+            other.buf[:5] = b'world'
+        self.assertEqual(bytes(shm.buf[:5]), b'world')
+        other = pickle.loads(pickle.dumps(shm))
+        self.assertEqual(other.name, shm.name)
+        self.assertEqual(bytes(other.buf[:5]), b'world')
+        other.close()
+
+        # The name is taken
+        with self.assertRaises(FileExistsError):
+            multiprocessing.SharedMemory(shm.name, create=True, size=10)
+
+        self.assertRaises(ValueError, multiprocessing.SharedMemory)
+        self.assertRaises(ValueError, multiprocessing.SharedMemory,
+                          create=True, size=0)
+
+    @unittest.skipIf(sys.platform == 'win32',
+                     'segments are destroyed with their last handle')
+    def test_unlink(self):
+        shm = multiprocessing.SharedMemory(create=True, size=10)
+        shm.unlink()
+        # Mappings stay valid after the segment is unlinked
+        shm.buf[0] = 1
+        shm.close()
+        self.assertRaises(FileNotFoundError, multiprocessing.SharedMemory,
+                          shm.name, size=10)
+
+    def test_unrelated_process(self):
+        # A process which did not inherit the segment can attach to it
+        shm = multiprocessing.SharedMemory(create=True, size=10)
+        self.addCleanup(shm.unlink)
+        self.addCleanup(shm.close)
+        code = ('from multiprocessing.heap import SharedMemory\n'
+                'shm = SharedMemory(%r, size=10)\n'
+                'shm.buf[:3] = b"xyz"\n'
+                'shm.close()\n' % shm.name)
+        test.script_helper.assert_python_ok('-c', code)
+        self.assertEqual(bytes(shm.buf[:3]), b'xyz')
+
+    def test_shared_array(self):
+        arr = multiprocessing.SharedArray('d', range(10))
+        self.addCleanup(arr.unlink)
+        self.addCleanup(arr.close)
+        self.assertEqual(len(arr), 10)
+        self.assertEqual(arr[3], 3.0)
+        self.assertEqual(arr.tolist(), [float(i) for i in range(10)])
+
+        # Workers attach to the array when they unpickle it
+        pool = self.Pool(2)
+        try:
+            res = pool.map(self._double, [(arr, i) for i in range(10)])
+        finally:
+            pool.close()
+            pool.join()
+        expected = [2.0 * i for i in range(10)]
+        self.assertEqual(res, expected)
+        self.assertEqual(arr.tolist(), expected)
+
+        zeroed = multiprocessing.SharedArray('i', 4)
+        self.addCleanup(zeroed.unlink)
+        self.addCleanup(zeroed.close)
+        self.assertEqual(zeroed.tolist(), [0] * 4)
+        empty = multiprocessing.SharedArray('i', [])
+        self.addCleanup(empty.unlink)
+        self.addCleanup(empty.close)
+        self.assertEqual(len(empty), 0)
+
 #
 #
 #
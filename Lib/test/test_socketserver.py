@@ -6,11 +6,13 @@ import contextlib
 import imp
 import os
 import select
+import selectors
 import signal
 import socket
-import select
 import errno
+import sys
 import tempfile
+import time
 import unittest
 import socketserver
 
@@ -44,6 +46,11 @@ def receive(sock, n, timeout=20):
     else:
         raise RuntimeError("timed out on %r" % (sock,))
 
+if HAVE_FORKING:
+    class PreForkingTCPServer(socketserver.PreForkingMixIn,
+                              socketserver.TCPServer):
+        processes = 2
+
 if HAVE_UNIX_SOCKETS:
     class ForkingUnixStreamServer(socketserver.ForkingMixIn,
                                   socketserver.UnixStreamServer):
@@ -54,6 +61,15 @@ if HAVE_UNIX_SOCKETS:
         pass
 
 
+class ThreadPoolTCPServer(socketserver.ThreadPoolMixIn,
+                          socketserver.TCPServer):
+    pass
+
+class ThreadPoolUDPServer(socketserver.ThreadPoolMixIn,
+                          socketserver.UDPServer):
+    pass
+
+
 @contextlib.contextmanager
 def simple_subprocess(testcase):
     pid = os.fork()
@@ -175,6 +191,11 @@ class SocketServerTest(unittest.TestCase):
                         socketserver.StreamRequestHandler,
                         self.stream_examine)
 
+    def test_ThreadPoolTCPServer(self):
+        self.run_server(ThreadPoolTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
     if HAVE_FORKING:
         def test_ForkingTCPServer(self):
             with simple_subprocess(self):
@@ -182,6 +203,77 @@ class SocketServerTest(unittest.TestCase):
                                 socketserver.StreamRequestHandler,
                                 self.stream_examine)
 
+    if HAVE_FORKING:
+        def test_PreForkingTCPServer(self):
+            self.run_server(PreForkingTCPServer,
+                            socketserver.StreamRequestHandler,
+                            self.stream_examine)
+
+        @reap_threads
+        def test_PreForkingTCPServer_respawn(self):
+            server = self.make_server(self.pickaddr(socket.AF_INET),
+                                      PreForkingTCPServer,
+                                      socketserver.StreamRequestHandler)
+            t = threading.Thread(target=server.serve_forever,
+                                 kwargs={'poll_interval': 0.01})
+            t.daemon = True  # In case this function raises.
+            t.start()
+            try:
+                for i in range(1000):
+                    children = set(server.active_children or ())
+                    if len(children) == 2:
+                        break
+                    time.sleep(0.01)
+                self.assertEqual(len(children), 2)
+                victim = children.pop()
+                os.kill(victim, signal.SIGKILL)
+                for i in range(1000):
+                    current = set(server.active_children)
+                    if victim not in current and len(current) == 2:
+                        break
+                    time.sleep(0.01)
+                self.assertNotIn(victim, server.active_children)
+                self.assertEqual(len(server.active_children), 2)
+                self.stream_examine(socket.AF_INET, server.server_address)
+            finally:
+                server.shutdown()
+                t.join()
+                server.server_close()
+
+        @reap_threads
+        def test_PreForkingTCPServer_child_error(self):
+            class Server(PreForkingTCPServer):
+                processes = 1
+                respawn_children = False
+                def service_actions(self):
+                    if self.active_children is None:
+                        raise RuntimeError('child failed')
+
+            self.addCleanup(test.support.unlink, test.support.TESTFN)
+            with open(test.support.TESTFN, 'w', buffering=1) as stderr, \
+                 test.support.swap_attr(sys, 'stderr', stderr):
+                server = self.make_server(self.pickaddr(socket.AF_INET),
+                                          Server,
+                                          socketserver.StreamRequestHandler)
+                t = threading.Thread(target=server.serve_forever,
+                                     kwargs={'poll_interval': 0.01})
+                t.daemon = True  # In case this function raises.
+                t.start()
+                try:
+                    for i in range(1000):
+                        with open(test.support.TESTFN) as f:
+                            output = f.read()
+                        if 'child failed' in output:
+                            break
+                        time.sleep(0.01)
+                finally:
+                    server.shutdown()
+                    t.join()
+                    server.server_close()
+            self.assertIn('Traceback', output)
+            self.assertIn('RuntimeError: child failed', output)
+            self.assertEqual(server.active_children, set())
+
     if HAVE_UNIX_SOCKETS:
         def test_UnixStreamServer(self):
             self.run_server(socketserver.UnixStreamServer,
@@ -210,6 +302,11 @@ class SocketServerTest(unittest.TestCase):
                         socketserver.DatagramRequestHandler,
                         self.dgram_examine)
 
+    def test_ThreadPoolUDPServer(self):
+        self.run_server(ThreadPoolUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
     if HAVE_FORKING:
         def test_ForkingUDPServer(self):
             with simple_subprocess(self):
@@ -221,6 +318,7 @@ class SocketServerTest(unittest.TestCase):
     def mocked_select_module(self):
         """Mocks the select.select() call to raise EINTR for first call"""
         old_select = select.select
+        old_selector = socketserver._ServerSelector
 
         class MockSelect:
             def __init__(self):
@@ -230,16 +328,20 @@ class SocketServerTest(unittest.TestCase):
                 self.called += 1
                 if self.called == 1:
                     # raise the exception on first call
-                    raise OSError(errno.EINTR, os.strerror(errno.EINTR))
+                    raise InterruptedError(errno.EINTR,
+                                           os.strerror(errno.EINTR))
                 else:
                     # Return real select value for consecutive calls
                     return old_select(*args)
 
-        select.select = MockSelect()
+        class MockSelector(selectors.SelectSelector):
+            _select = MockSelect()
+
+        socketserver._ServerSelector = MockSelector
         try:
-            yield select.select
+            yield MockSelector._select
         finally:
-            select.select = old_select
+            socketserver._ServerSelector = old_selector
 
     def test_InterruptServerSelectCall(self):
         with self.mocked_select_module() as mock_select:
@@ -249,6 +351,25 @@ class SocketServerTest(unittest.TestCase):
             # Make sure select was called again:
             self.assertGreater(mock_select.called, 1)
 
+    def test_InterruptHandleRequestSelectCall(self):
+        # A signal interrupting the wait must not be taken for a timeout.
+        handled = []
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                handled.append(self.rfile.readline())
+
+        with self.mocked_select_module() as mock_select:
+            server = socketserver.TCPServer((HOST, 0), Handler)
+            server.handle_timeout = lambda: self.fail("handle_timeout called")
+            try:
+                with socket.create_connection(server.server_address) as s:
+                    s.sendall(b"hello\n")
+                    server.handle_request()
+            finally:
+                server.server_close()
+        self.assertGreater(mock_select.called, 1)
+        self.assertEqual(handled, [b"hello\n"])
+
     # Alas, on Linux (at least) recvfrom() doesn't return a meaningful
     # client address so this cannot work:
 
@@ -295,13 +416,143 @@ class SocketServerTest(unittest.TestCase):
             t.join()
             s.server_close()
 
+    @reap_threads
+    @unittest.skipUnless(hasattr(socket, 'socketpair'), 'needs socketpair()')
+    def test_shutdown_without_polling(self):
+        # With poll_interval=None, serve_forever() sleeps until a request
+        # arrives and shutdown() must still wake it up.
+        s = socketserver.TCPServer((HOST, 0),
+                                   socketserver.StreamRequestHandler)
+        calls = []
+        s.service_actions = lambda: calls.append(None)
+        t = threading.Thread(target=s.serve_forever,
+                             kwargs={'poll_interval': None})
+        t.daemon = True  # In case this function raises.
+        t.start()
+        time.sleep(0.2)
+        s.shutdown()
+        t.join()
+        s.server_close()
+        # The loop was woken once, by shutdown().
+        self.assertLessEqual(len(calls), 1)
+
+    def test_handle_request_timeout(self):
+        class MyServer(socketserver.TCPServer):
+            timeout = 0.01
+            timed_out = False
+
+            def handle_timeout(self):
+                self.timed_out = True
+
+        s = MyServer((HOST, 0), socketserver.StreamRequestHandler)
+        try:
+            s.handle_request()
+        finally:
+            s.server_close()
+        self.assertTrue(s.timed_out)
+
+
+@unittest.skipUnless(threading, 'Threading required for this test.')
+class ThreadPoolMixInTest(unittest.TestCase):
+    """Test the worker pool without sockets, using BaseServer."""
+
+    def make_server(self, **attrs):
+        release = threading.Event()
+        handled = []
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                release.wait(10)
+                handled.append(self.request)
+
+        class Server(socketserver.ThreadPoolMixIn, socketserver.BaseServer):
+            def handle_overflow(self, request, client_address):
+                self.dropped.append(request)
+
+        for name, value in attrs.items():
+            setattr(Server, name, value)
+        server = Server(None, Handler)
+        server.dropped = []
+        self.addCleanup(server.server_close)
+        self.addCleanup(release.set)
+        return server, release, handled
+
+    def wait_for(self, predicate):
+        for i in range(1000):
+            if predicate():
+                return
+            time.sleep(0.01)
+        self.fail("timed out")
+
+    def fill(self, server, requests):
+        for request in requests:
+            server.process_request(request, None)
+
+    @reap_threads
+    def test_reject(self):
+        server, release, handled = self.make_server(
+            min_workers=1, max_workers=1, max_queue_size=2, overflow='reject')
+        self.fill(server, [0])
+        self.wait_for(lambda: server.busy_workers == 1)
+        self.fill(server, [1, 2])
+        self.assertEqual(server.queue_depth, 2)
+        server.process_request('extra', None)
+        self.assertEqual(server.dropped, ['extra'])
+        self.assertEqual(server.rejected_requests, 1)
+        release.set()
+        self.wait_for(lambda: len(handled) == 3)
+        self.assertEqual(handled, [0, 1, 2])
+
+    @reap_threads
+    def test_shed(self):
+        server, release, handled = self.make_server(
+            min_workers=1, max_workers=1, max_queue_size=2, overflow='shed')
+        self.fill(server, [0])
+        self.wait_for(lambda: server.busy_workers == 1)
+        self.fill(server, [1, 2])
+        server.process_request('extra', None)
+        # The oldest queued request made room for the new one.
+        self.assertEqual(server.dropped, [1])
+        self.assertEqual(server.queue_depth, 2)
+        release.set()
+        self.wait_for(lambda: len(handled) == 3)
+        self.assertEqual(handled, [0, 2, 'extra'])
+
+    @reap_threads
+    def test_elastic_workers(self):
+        server, release, handled = self.make_server(
+            min_workers=1, max_workers=3, worker_idle_timeout=0.05)
+        self.assertEqual(server.worker_count, 0)
+        self.fill(server, range(5))
+        self.wait_for(lambda: server.busy_workers == 3)
+        self.assertEqual(server.worker_count, 3)
+        self.assertEqual(server.queue_depth, 2)
+        release.set()
+        self.wait_for(lambda: len(handled) == 5)
+        # The extra workers retire once idle.
+        self.wait_for(lambda: server.worker_count == 1)
+
+    @reap_threads
+    def test_server_close_drains_queue(self):
+        server, release, handled = self.make_server(
+            min_workers=2, max_workers=2)
+        self.fill(server, range(4))
+        release.set()
+        server.server_close()
+        self.assertEqual(sorted(handled), [0, 1, 2, 3])
+        self.assertEqual(server.worker_count, 0)
+
+    def test_bad_overflow(self):
+        server, release, handled = self.make_server(overflow='drop')
+        self.assertRaises(ValueError, server.process_request, 0, None)
+
 
 def test_main():
     if imp.lock_held():
         # If the import lock is held, the threads will hang
         raise unittest.SkipTest("can't run when import lock is held")
 
-    test.support.run_unittest(SocketServerTest)
+    test.support.run_unittest(SocketServerTest, ThreadPoolMixInTest)
 
 if __name__ == "__main__":
     test_main()
@@ -642,6 +642,46 @@ class SysModuleTest(unittest.TestCase):
         c = sys.getallocatedblocks()
         self.assertIn(c, range(b - 50, b + 50))
 
+    @unittest.skipUnless(hasattr(sys, "_getmallocstats"),
+                         "sys._getmallocstats unavailable on this build")
+    def test_getmallocstats(self):
+        stats = sys._getmallocstats()
+        self.assertEqual(stats['arenas_allocated_total'],
+                         stats['arenas_reclaimed']
+                         + stats['arenas_allocated_current'])
+        self.assertLessEqual(stats['arenas_allocated_current'],
+                             stats['arenas_highwater'])
+        self.assertGreater(stats['arenas_allocated_current'], 0)
+        self.assertGreater(stats['pool_size'], 0)
+        self.assertGreater(stats['arena_size'], stats['pool_size'])
+        sizes = [size for size, pools, blocks, free in stats['size_classes']]
+        self.assertEqual(sizes, sorted(sizes))
+        self.assertTrue(any(pools for size, pools, blocks, free
+                            in stats['size_classes']))
+        for size, pools, blocks, free in stats['size_classes']:
+            capacity = pools * (stats['pool_size'] // size)
+            self.assertLessEqual(blocks + free, capacity)
+
+    @unittest.skipUnless(hasattr(sys, "_getmallocstats"),
+                         "sys._getmallocstats unavailable on this build")
+    def test_getmallocstats_reclaim(self):
+        # Arenas emptied by freeing many small objects are returned to the
+        # system
+        before = sys._getmallocstats()
+        objs = [object() for i in range(200000)]
+        during = sys._getmallocstats()
+        del objs
+        gc.collect()
+        after = sys._getmallocstats()
+        self.assertGreater(during['arenas_allocated_current'],
+                           before['arenas_allocated_current'])
+        self.assertGreaterEqual(during['arenas_highwater'],
+                                during['arenas_allocated_current'])
+        self.assertLess(after['arenas_allocated_current'],
+                        during['arenas_allocated_current'])
+        self.assertGreater(after['arenas_reclaimed'],
+                           during['arenas_reclaimed'])
+
 
 class SizeofTest(unittest.TestCase):
 
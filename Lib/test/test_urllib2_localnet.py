@@ -2,8 +2,12 @@
 
 import os
 import email
+import socket
+import socketserver
+import urllib.error
 import urllib.parse
 import urllib.request
+import http.client
 import http.server
 import unittest
 import hashlib
@@ -563,9 +567,195 @@ class TestUrlopen(unittest.TestCase):
         self.assertEqual(index + 1, len(lines))
 
 
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    timeout = 10
+
+    def do_GET(self):
+        self.server.clients.append(self.client_address)
+        body = ("%s %s" % self.client_address).encode("ascii")
+        self.send_response(200)
+        if self.path == "/close":
+            self.send_header("Connection", "close")
+        elif self.path == "/drop":
+            # close the connection without telling the client
+            self.close_connection = 1
+        if self.path == "/chunked":
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.write(("%x\r\n" % len(body)).encode("ascii") +
+                             body + b"\r\n0\r\n\r\n")
+            return
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+class KeepAliveServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class ConnectionPoolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = KeepAliveServer(("127.0.0.1", 0), KeepAliveHandler)
+        self.server.clients = []
+        self.addCleanup(self.server.server_close)
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  args=(0.05,))
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.shutdown)
+        self.opener = urllib.request.build_opener(
+            connection_pool=urllib.request.HTTPConnectionPool())
+        self.addCleanup(self.opener.close)
+        self.url = "http://127.0.0.1:%d" % self.server.server_port
+
+    def fetch(self, path="/", data=None):
+        with self.opener.open(self.url + path, data) as response:
+            return response.read()
+
+    def test_reuse(self):
+        first = self.fetch()
+        self.assertEqual(self.fetch(), first)
+        self.assertEqual(self.fetch("/chunked"), first)
+        self.assertEqual(self.fetch("/", b"data"), first)
+        self.assertEqual(len(set(self.server.clients)), 1)
+
+    def test_no_reuse_after_close(self):
+        first = self.fetch("/close")
+        self.assertNotEqual(self.fetch(), first)
+
+    def test_no_reuse_of_unread_response(self):
+        response = self.opener.open(self.url)
+        first = response.read(1)
+        response.close()
+        response = self.opener.open(self.url)
+        self.assertNotEqual(first + response.read(), self.fetch())
+        response.close()
+        self.assertEqual(len(set(self.server.clients)), 2)
+
+    def test_concurrent_responses(self):
+        # a connection is not lent twice
+        first = self.opener.open(self.url)
+        second = self.opener.open(self.url)
+        self.assertNotEqual(first.read(), second.read())
+        first.close()
+        second.close()
+        self.assertEqual(len(self.opener.connection_pool._idle), 1)
+
+    def test_closed_by_server(self):
+        first = self.fetch("/drop")
+        self.assertNotEqual(self.fetch(), first)
+
+    def test_retry_on_stale_connection(self):
+        # the connection is closed after it was checked for reuse
+        first = self.fetch("/drop")
+        self.addCleanup(setattr, urllib.request, "_connection_usable",
+                        urllib.request._connection_usable)
+        urllib.request._connection_usable = lambda conn: True
+        self.assertNotEqual(self.fetch(), first)
+        # non idempotent requests are not sent twice
+        self.fetch("/drop")
+        self.assertRaises((urllib.error.URLError, http.client.HTTPException),
+                          self.fetch, "/", b"data")
+
+    def test_close(self):
+        self.fetch()
+        self.assertEqual(len(self.opener.connection_pool._idle), 1)
+        self.opener.close()
+        self.assertEqual(len(self.opener.connection_pool._idle), 0)
+
+    def test_no_pool(self):
+        self.opener.connection_pool = None
+        first = self.fetch()
+        self.assertNotEqual(self.fetch(), first)
+
+    def test_no_pool_by_default(self):
+        self.opener = urllib.request.build_opener()
+        self.assertIsNone(self.opener.connection_pool)
+        first = self.fetch()
+        self.assertNotEqual(self.fetch(), first)
+        self.assertIsNone(urllib.request.OpenerDirector().connection_pool)
+
+
+class HTTPConnectionPoolTests(unittest.TestCase):
+
+    class FakeConnection:
+        def __init__(self):
+            self.sock, self.peer = socket.socketpair()
+        def close(self):
+            if self.sock:
+                self.sock.close()
+                self.sock = None
+            self.peer.close()
+
+    def test_get_put(self):
+        pool = urllib.request.HTTPConnectionPool()
+        self.assertIsNone(pool.get("key"))
+        conn = self.FakeConnection()
+        pool.put("key", conn)
+        self.assertIsNone(pool.get("other"))
+        self.assertIs(pool.get("key"), conn)
+        self.assertIsNone(pool.get("key"))
+        conn.close()
+
+    def test_max_per_host(self):
+        pool = urllib.request.HTTPConnectionPool(max_per_host=2)
+        conns = [self.FakeConnection() for i in range(3)]
+        for conn in conns:
+            pool.put("key", conn)
+        self.assertIsNone(conns[2].sock)
+        self.assertIs(pool.get("key"), conns[1])
+        self.assertIs(pool.get("key"), conns[0])
+        self.assertIsNone(pool.get("key"))
+        for conn in conns:
+            conn.close()
+
+    def test_idle_timeout(self):
+        pool = urllib.request.HTTPConnectionPool(idle_timeout=-1)
+        conn = self.FakeConnection()
+        pool.put("key", conn)
+        self.assertIsNone(pool.get("key"))
+        self.assertIsNone(conn.sock)
+
+    def test_unusable(self):
+        pool = urllib.request.HTTPConnectionPool()
+        conn = self.FakeConnection()
+        pool.put("key", conn)
+        conn.peer.close()
+        self.assertIsNone(pool.get("key"))
+        self.assertIsNone(conn.sock)
+
+    def test_close(self):
+        pool = urllib.request.HTTPConnectionPool()
+        conn = self.FakeConnection()
+        pool.put("key", conn)
+        pool.close()
+        self.assertIsNone(conn.sock)
+        self.assertIsNone(pool.get("key"))
+
+    def test_finalizer(self):
+        pool = urllib.request.HTTPConnectionPool()
+        conn = self.FakeConnection()
+        pool.put("key", conn)
+        del pool
+        support.gc_collect()
+        self.assertIsNone(conn.sock)
+
+
 @support.reap_threads
 def test_main():
-    support.run_unittest(ProxyAuthTests, TestUrlopen)
+    support.run_unittest(ProxyAuthTests, TestUrlopen, ConnectionPoolTests,
+                         HTTPConnectionPoolTests)
 
 if __name__ == "__main__":
     test_main()
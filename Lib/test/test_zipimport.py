@@ -291,6 +291,25 @@ class UncompressedZipImportTestCase(ImportHooksBaseTestCase):
             z.close()
             os.remove(TEMP_ZIP)
 
+    def testGetDataRewrittenArchive(self):
+        # The archive is read again when it changes on disk
+        try:
+            for data in (b'old data', b'new data, longer than the old one'):
+                with ZipFile(TEMP_ZIP, "w") as z:
+                    z.compression = self.compression
+                    z.writestr("padding.dat", b'p' * 1000)
+                    z.writestr("testdata.dat", data)
+                zipimport._zip_directory_cache.clear()
+                zi = zipimport.zipimporter(TEMP_ZIP)
+                self.assertEqual(zi.get_data("testdata.dat"), data)
+            # A stale directory doesn't read beyond the end of the archive
+            with ZipFile(TEMP_ZIP, "w") as z:
+                z.writestr("testdata.dat", b'')
+            with self.assertRaises((OSError, zipimport.ZipImportError)):
+                zi.get_data("testdata.dat")
+        finally:
+            support.unlink(TEMP_ZIP)
+
     def testImporterAttr(self):
         src = """if 1:  # indent hack
         def get_file():
@@ -90,6 +90,7 @@ import io
 import os
 import posixpath
 import re
+import selectors
 import socket
 import sys
 import time
@@ -98,6 +99,11 @@ import tempfile
 import contextlib
 import warnings
 
+try:
+    import threading as _threading
+except ImportError:
+    import dummy_threading as _threading
+
 
 from urllib.error import URLError, HTTPError, ContentTooShortError
 from urllib.parse import (
@@ -123,7 +129,7 @@ __all__ = [
     'AbstractBasicAuthHandler', 'HTTPBasicAuthHandler', 'ProxyBasicAuthHandler',
     'AbstractDigestAuthHandler', 'HTTPDigestAuthHandler', 'ProxyDigestAuthHandler',
     'HTTPHandler', 'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
-    'UnknownHandler', 'HTTPErrorProcessor',
+    'UnknownHandler', 'HTTPErrorProcessor', 'HTTPConnectionPool',
     # Functions
     'urlopen', 'install_opener', 'build_opener',
     'pathname2url', 'url2pathname', 'getproxies',
@@ -406,6 +412,9 @@ class OpenerDirector:
     def __init__(self):
         client_version = "Python-urllib/%s" % __version__
         self.addheaders = [('User-agent', client_version)]
+        # idle persistent connections, shared by the HTTP(S) handlers;
+        # None means a new connection for each request
+        self.connection_pool = None
         # self.handlers is retained only for backward compatibility
         self.handlers = []
         # manage the individual handlers
@@ -462,8 +471,9 @@ class OpenerDirector:
             handler.add_parent(self)
 
     def close(self):
-        # Only exists for backwards compatibility.
-        pass
+        """Close the idle connections kept in the connection pool."""
+        if self.connection_pool is not None:
+            self.connection_pool.close()
 
     def _call_chain(self, chain, kind, meth_name, *args):
         # Handlers raise an exception if no one else should try to handle
@@ -544,7 +554,7 @@ class OpenerDirector:
 # sense to skip a superclass in favor of a subclass and when it might
 # make sense to include both
 
-def build_opener(*handlers):
+def build_opener(*handlers, connection_pool=None):
     """Create an opener object from a list of handlers.
 
     The opener will use several default handlers, including support
@@ -552,11 +562,15 @@ def build_opener(*handlers):
 
     If any of the handlers passed as arguments are subclasses of the
     default handlers, the default handlers will not be used.
+
+    If connection_pool is an HTTPConnectionPool, the HTTP(S) handlers
+    keep idle connections in it and reuse them.
     """
     def isclass(obj):
         return isinstance(obj, type) or hasattr(obj, "__bases__")
 
     opener = OpenerDirector()
+    opener.connection_pool = connection_pool
     default_classes = [ProxyHandler, UnknownHandler, HTTPHandler,
                        HTTPDefaultErrorHandler, HTTPRedirectHandler,
                        FTPHandler, FileHandler, HTTPErrorProcessor,
@@ -1187,6 +1201,107 @@ class ProxyDigestAuthHandler(BaseHandler, AbstractDigestAuthHandler):
         self.reset_retry_count()
         return retry
 
+def _idempotent(request):
+    """Return True if request can safely be sent a second time."""
+    if request.get_method() not in ("GET", "HEAD", "OPTIONS", "TRACE",
+                                    "PUT", "DELETE"):
+        return False
+    if request.data is None:
+        return True
+    try:
+        memoryview(request.data)
+    except TypeError:
+        # files and iterables cannot be read twice
+        return False
+    return True
+
+class HTTPConnectionPool:
+    """A pool of idle persistent HTTP connections.
+
+    Connections are kept per key, which identifies the connection class,
+    the host and port connected to (the proxy's, if any), the tunnelled
+    host and the connection arguments.  At most max_per_host idle
+    connections are kept per key, and connections idle for more than
+    idle_timeout seconds are closed.  The pool is thread-safe.
+    """
+
+    def __init__(self, max_per_host=4, idle_timeout=60.0):
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self._lock = _threading.Lock()
+        self._idle = {}         # key -> [(release time, connection), ...]
+
+    def _expire(self, now):
+        # Remove the connections idle for too long; called with the lock
+        # held.  The caller closes the returned connections.
+        expired = []
+        deadline = now - self.idle_timeout
+        for key, conns in list(self._idle.items()):
+            while conns and conns[0][0] < deadline:
+                expired.append(conns.pop(0)[1])
+            if not conns:
+                del self._idle[key]
+        return expired
+
+    def get(self, key):
+        """Return an idle connection for key, or None if there is none."""
+        result = None
+        with self._lock:
+            discard = self._expire(time.monotonic())
+            conns = self._idle.get(key)
+            while conns:
+                conn = conns.pop()[1]
+                if _connection_usable(conn):
+                    result = conn
+                    break
+                discard.append(conn)
+            if conns == []:
+                del self._idle[key]
+        for conn in discard:
+            conn.close()
+        return result
+
+    def put(self, key, conn):
+        """Make conn, whose last response has been read, available again.
+
+        The connection is closed instead if key already has max_per_host
+        idle connections.
+        """
+        now = time.monotonic()
+        with self._lock:
+            discard = self._expire(now)
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self.max_per_host:
+                conns.append((now, conn))
+            else:
+                discard.append(conn)
+        for conn in discard:
+            conn.close()
+
+    def close(self):
+        """Close all the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for released, conn in conns:
+                conn.close()
+
+    def __del__(self):
+        self.close()
+
+def _connection_usable(conn):
+    """Return True if the idle connection conn can carry a request."""
+    if conn.sock is None:
+        return False
+    # An idle connection has nothing to read: if it is readable, the
+    # server closed it (or sent garbage).
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(conn.sock, selectors.EVENT_READ)
+            return not selector.select(0)
+    except (OSError, ValueError):
+        return False
+
 class AbstractHTTPHandler(BaseHandler):
 
     def __init__(self, debuglevel=0):
@@ -1239,28 +1354,43 @@ class AbstractHTTPHandler(BaseHandler):
         """Return an HTTPResponse object for the request, using http_class.
 
         http_class must implement the HTTPConnection API from http.client.
+
+        If the parent opener has a connection_pool, idle connections from
+        it are reused, and the connection goes back to the pool once the
+        response has been read completely.
         """
         host = req.host
         if not host:
             raise URLError('no host given')
 
-        # will parse host:port
-        h = http_class(host, timeout=req.timeout, **http_conn_args)
+        pool = getattr(self.parent, 'connection_pool', None)
+        h = None
+        if pool is not None:
+            key = (http_class, host, req._tunnel_host,
+                   tuple(sorted(http_conn_args.items())))
+            h = pool.get(key)
+        if h is not None:
+            h.timeout = req.timeout
+            if req.timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+                h.sock.settimeout(socket.getdefaulttimeout())
+            else:
+                h.sock.settimeout(req.timeout)
+            reused = True
+        else:
+            # will parse host:port
+            h = http_class(host, timeout=req.timeout, **http_conn_args)
+            reused = False
 
         headers = dict(req.unredirected_hdrs)
         headers.update(dict((k, v) for k, v in req.headers.items()
                             if k not in headers))
 
-        # TODO(jhylton): Should this be redesigned to handle
-        # persistent connections?
-
-        # We want to make an HTTP/1.1 request, but the addinfourl
-        # class isn't prepared to deal with a persistent connection.
-        # It will try to read all remaining data from the socket,
-        # which will block while the server waits for the next request.
-        # So make sure the connection gets closed after the (only)
-        # request.
-        headers["Connection"] = "close"
+        if pool is None:
+            # We want to make an HTTP/1.1 request, but without a pool to
+            # hand it back to, the connection would stay open until the
+            # response is garbage collected.  So make sure the connection
+            # gets closed after the (only) request.
+            headers["Connection"] = "close"
         headers = dict((name.title(), val) for name, val in headers.items())
 
         if req._tunnel_host:
@@ -1271,21 +1401,47 @@ class AbstractHTTPHandler(BaseHandler):
                 # Proxy-Authorization should not be sent to origin
                 # server.
                 del headers[proxy_auth_hdr]
-            h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            if not reused:
+                h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
 
-        try:
-            h.request(req.get_method(), req.selector, req.data, headers)
-        except OSError as err: # timeout error
-            h.close()
-            raise URLError(err)
-        else:
-            r = h.getresponse()
+        while True:
+            try:
+                h.request(req.get_method(), req.selector, req.data, headers)
+            except OSError as err: # timeout error
+                h.close()
+                if not (reused and _idempotent(req)):
+                    raise URLError(err)
+            else:
+                try:
+                    r = h.getresponse()
+                except (ConnectionError, http.client.BadStatusLine):
+                    h.close()
+                    if not (reused and _idempotent(req)):
+                        raise
+                else:
+                    break
+            # The server closed the idle connection before it got the
+            # request: send it again, once, on a new connection.
+            h = http_class(host, timeout=req.timeout, **http_conn_args)
+            if req._tunnel_host:
+                h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            reused = False
+
+        if (pool is not None and isinstance(r, http.client.HTTPResponse)
+            and not r.will_close):
+            def release(complete):
+                if complete:
+                    pool.put(key, h)
+                else:
+                    h.close()
+            r._on_close = release
+        elif h.sock:
             # If the server does not send us a 'Connection: close' header,
-            # HTTPConnection assumes the socket should be left open. Manually
-            # mark the socket to be closed when this response object goes away.
-            if h.sock:
-                h.sock.close()
-                h.sock = None
+            # HTTPConnection assumes the socket should be left open.
+            # Manually mark the socket to be closed when this response
+            # object goes away.
+            h.sock.close()
+            h.sock = None
 
         r.url = req.get_full_url()
         # This line replaces the .msg attribute of the HTTPResponse
@@ -1,5 +1,7 @@
 /* This is built as a stand-alone executable by the Makefile, and helps turn
-   Lib/importlib/_bootstrap.py into a frozen module in Python/importlib.h
+   Lib/importlib/_bootstrap.py into a frozen module in Python/importlib.h,
+   and the modules listed in FROZEN_STARTUP_MODULES into frozen modules in
+   Python/frozen_startup.h
 */
 
 #include <Python.h>
@@ -12,6 +14,10 @@
 #include <unistd.h>
 #endif
 
+#ifndef S_ISDIR
+#define S_ISDIR(x) (((x) & S_IFMT) == S_IFDIR)
+#endif
+
 
 /* To avoid a circular dependency on frozen.o, we create our own structure
    of frozen modules instead, left deliberately blank so as to avoid
@@ -30,84 +36,69 @@ struct _frozen *PyImport_FrozenModules;
 
 const char header[] = "/* Auto-generated by Modules/_freeze_importlib.c */";
 
-int
-main(int argc, char *argv[])
+static char *
+read_text(const char *inpath)
 {
-    char *inpath, *outpath;
-    FILE *infile, *outfile = NULL;
+    FILE *infile;
     struct stat st;
-    size_t text_size, data_size, n;
+    size_t text_size, n;
     char *text;
-    unsigned char *data;
-    PyObject *code, *marshalled;
-
-    PyImport_FrozenModules = _PyImport_FrozenModules;
 
-    if (argc != 3) {
-        fprintf(stderr, "need to specify input and output paths\n");
-        return 2;
-    }
-    inpath = argv[1];
-    outpath = argv[2];
     infile = fopen(inpath, "rb");
     if (infile == NULL) {
         fprintf(stderr, "cannot open '%s' for reading\n", inpath);
-        return 1;
+        return NULL;
     }
     if (fstat(fileno(infile), &st)) {
         fclose(infile);
         fprintf(stderr, "cannot fstat '%s'\n", inpath);
-        return 1;
+        return NULL;
     }
     text_size = st.st_size;
     text = (char *) malloc(text_size + 1);
     if (text == NULL) {
         fclose(infile);
         fprintf(stderr, "could not allocate %ld bytes\n", (long) text_size);
-        return 1;
+        return NULL;
     }
     n = fread(text, 1, text_size, infile);
     fclose(infile);
-    infile = NULL;
     if (n < text_size) {
         fprintf(stderr, "read too short: got %ld instead of %ld bytes\n",
                 (long) n, (long) text_size);
-        return 1;
+        free(text);
+        return NULL;
     }
     text[text_size] = '\0';
+    return text;
+}
 
-    Py_NoUserSiteDirectory++;
-    Py_NoSiteFlag++;
-    Py_IgnoreEnvironmentFlag++;
-
-    Py_SetProgramName(L"./_freeze_importlib");
-    /* Don't install importlib, since it could execute outdated bytecode. */
-    _Py_InitializeEx_Private(1, 0);
+/* Compile the source in text and write its marshalled code object to
+   outfile as an array named varname.  Return the size of the data, or -1
+   with an exception set. */
+static Py_ssize_t
+write_frozen(FILE *outfile, const char *qualifier, const char *varname,
+             const char *text, const char *filename)
+{
+    PyObject *code, *marshalled;
+    unsigned char *data;
+    Py_ssize_t data_size, n;
 
-    code = Py_CompileStringExFlags(text, "<frozen importlib._bootstrap>",
-                                   Py_file_input, NULL, 0);
+    code = Py_CompileStringExFlags(text, filename, Py_file_input, NULL, 0);
     if (code == NULL)
-        goto error;
+        return -1;
     marshalled = PyMarshal_WriteObjectToString(code, Py_MARSHAL_VERSION);
     Py_DECREF(code);
     if (marshalled == NULL)
-        goto error;
+        return -1;
 
     assert(PyBytes_CheckExact(marshalled));
     data = (unsigned char *) PyBytes_AS_STRING(marshalled);
     data_size = PyBytes_GET_SIZE(marshalled);
 
-    /* Open the file in text mode. The hg checkout should be using the eol extension,
-       which in turn should cause the EOL style match the C library's text mode */
-    outfile = fopen(outpath, "w");
-    if (outfile == NULL) {
-        fprintf(stderr, "cannot open '%s' for writing\n", outpath);
-        return 1;
-    }
-    fprintf(outfile, "%s\n", header);
-    fprintf(outfile, "unsigned char _Py_M__importlib[] = {\n");
+    fprintf(outfile, "%sunsigned char %s[] = {\n", qualifier, varname);
     for (n = 0; n < data_size; n += 16) {
-        size_t i, end = Py_MIN(n + 16, data_size);
+        Py_ssize_t i, end = Py_MIN(n + 16, data_size);
         fprintf(outfile, "    ");
         for (i = n; i < end; i++) {
             fprintf(outfile, "%d,", (unsigned int) data[i]);
@@ -117,26 +108,193 @@ main(int argc, char *argv[])
     fprintf(outfile, "};\n");
 
     Py_DECREF(marshalled);
+    return data_size;
+}
 
-    Py_Finalize();
-    if (infile)
-        fclose(infile);
-    if (outfile) {
-        if (ferror(outfile)) {
-            fprintf(stderr, "error when writing to '%s'\n", outpath);
-            fclose(outfile);
-            return 1;
-        }
+static void
+initialize(void)
+{
+    Py_NoUserSiteDirectory++;
+    Py_NoSiteFlag++;
+    Py_IgnoreEnvironmentFlag++;
+
+    Py_SetProgramName(L"./_freeze_importlib");
+    /* Don't install importlib, since it could execute outdated bytecode. */
+    _Py_InitializeEx_Private(1, 0);
+}
+
+static int
+close_output(FILE *outfile, const char *outpath)
+{
+    if (ferror(outfile)) {
+        fprintf(stderr, "error when writing to '%s'\n", outpath);
         fclose(outfile);
+        return 1;
     }
+    fclose(outfile);
     return 0;
+}
+
+/* Freeze importlib._bootstrap from inpath into outpath. */
+static int
+freeze_importlib(const char *inpath, const char *outpath)
+{
+    FILE *outfile;
+    char *text;
+
+    text = read_text(inpath);
+    if (text == NULL)
+        return 1;
+
+    initialize();
+
+    /* Open the file in text mode. The hg checkout should be using the eol extension,
+       which in turn should cause the EOL style match the C library's text mode */
+    outfile = fopen(outpath, "w");
+    if (outfile == NULL) {
+        fprintf(stderr, "cannot open '%s' for writing\n", outpath);
+        free(text);
+        Py_Finalize();
+        return 1;
+    }
+    fprintf(outfile, "%s\n", header);
+    if (write_frozen(outfile, "", "_Py_M__importlib", text,
+                     "<frozen importlib._bootstrap>") < 0)
+        goto error;
+    free(text);
+    Py_Finalize();
+    return close_output(outfile, outpath);
 
 error:
     PyErr_Print();
+    free(text);
     Py_Finalize();
-    if (infile)
-        fclose(infile);
-    if (outfile)
-        fclose(outfile);
+    fclose(outfile);
+    return 1;
+}
+
+/* Freeze the named modules, found in the libdir directory, into outpath,
+   which defines the _Py_FROZEN_STARTUP_MODULES macro listing their entries
+   for PyImport_FrozenModules.  A module found as a package's __init__.py is
+   frozen as a package. */
+static int
+freeze_modules(const char *libdir, const char *outpath,
+               int count, char *names[])
+{
+    FILE *outfile;
+    char *path = NULL, *varname = NULL, *filename = NULL, *text = NULL;
+    Py_ssize_t *sizes;
+    int i;
+    size_t j, len;
+
+    sizes = (Py_ssize_t *) malloc(sizeof(Py_ssize_t) * (count + 1));
+    if (sizes == NULL) {
+        fprintf(stderr, "could not allocate the sizes of %d modules\n", count);
+        return 1;
+    }
+    if (count)
+        initialize();
+
+    outfile = fopen(outpath, "w");
+    if (outfile == NULL) {
+        fprintf(stderr, "cannot open '%s' for writing\n", outpath);
+        free(sizes);
+        if (count)
+            Py_Finalize();
+        return 1;
+    }
+    fprintf(outfile, "%s\n", header);
+    for (i = 0; i < count; i++) {
+        const char *name = names[i];
+        struct stat st;
+        int ispackage;
+
+        len = strlen(name);
+        path = (char *) malloc(strlen(libdir) + len + sizeof("/__init__.py") + 1);
+        varname = (char *) malloc(sizeof("_Py_M__") + 2 * len);
+        filename = (char *) malloc(sizeof("<frozen >") + len);
+        if (path == NULL || varname == NULL || filename == NULL) {
+            fprintf(stderr, "could not allocate memory for %s\n", name);
+            goto failed;
+        }
+        /* The module path, with dots replaced by separators */
+        sprintf(path, "%s/%s", libdir, name);
+        for (j = strlen(libdir) + 1; path[j]; j++) {
+            if (path[j] == '.')
+                path[j] = '/';
+        }
+        ispackage = (stat(path, &st) == 0 && S_ISDIR(st.st_mode));
+        strcat(path, ispackage ? "/__init__.py" : ".py");
+        /* The array name, with dots replaced by double underscores */
+        strcpy(varname, "_Py_M__");
+        for (j = 0; j < len; j++) {
+            if (name[j] == '.')
+                strcat(varname, "__");
+            else
+                strncat(varname, &name[j], 1);
+        }
+        sprintf(filename, "<frozen %s>", name);
+
+        text = read_text(path);
+        if (text == NULL)
+            goto failed;
+        sizes[i] = write_frozen(outfile, "static ", varname, text, filename);
+        if (sizes[i] < 0)
+            goto error;
+        if (ispackage)
+            sizes[i] = -sizes[i];
+        free(text);
+        free(path);
+        free(varname);
+        free(filename);
+        text = path = varname = filename = NULL;
+    }
+
+    fprintf(outfile, "\n#define _Py_FROZEN_STARTUP_MODULES");
+    for (i = 0; i < count; i++) {
+        fprintf(outfile, " \\\n    {\"%s\", _Py_M__", names[i]);
+        for (j = 0; names[i][j]; j++) {
+            if (names[i][j] == '.')
+                fprintf(outfile, "__");
+            else
+                fputc(names[i][j], outfile);
+        }
+        fprintf(outfile, ", %ld},", (long) sizes[i]);
+    }
+    fprintf(outfile, "\n");
+
+    free(sizes);
+    if (count)
+        Py_Finalize();
+    return close_output(outfile, outpath);
+
+error:
+    PyErr_Print();
+failed:
+    free(text);
+    free(path);
+    free(varname);
+    free(filename);
+    free(sizes);
+    if (count)
+        Py_Finalize();
+    fclose(outfile);
     return 1;
 }
+
+int
+main(int argc, char *argv[])
+{
+    PyImport_FrozenModules = _PyImport_FrozenModules;
+
+    if (argc >= 4 && strcmp(argv[1], "-m") == 0)
+        return freeze_modules(argv[2], argv[3], argc - 4, argv + 4);
+    if (argc != 3) {
+        fprintf(stderr,
+                "usage: %s input output\n"
+                "       %s -m libdir output [module ...]\n",
+                argv[0], argv[0]);
+        return 2;
+    }
+    return freeze_importlib(argv[1], argv[2]);
+}
@@ -6,7 +6,7 @@ PyDoc_STRVAR(pickle_module_doc,
 
 /* Bump this when new opcodes are added to the pickle protocol. */
 enum {
-    HIGHEST_PROTOCOL = 3,
+    HIGHEST_PROTOCOL = 5,
     DEFAULT_PROTOCOL = 3
 };
 
@@ -71,7 +71,24 @@ enum opcode {
 
     /* Protocol 3 (Python 3.x) */
     BINBYTES       = 'B',
-    SHORT_BINBYTES = 'C'
+    SHORT_BINBYTES = 'C',
+
+    /* Protocol 4 */
+    SHORT_BINUNICODE = '\x8c',
+    BINUNICODE8      = '\x8d',
+    BINBYTES8        = '\x8e',
+    EMPTY_SET        = '\x8f',
+    ADDITEMS         = '\x90',
+    FROZENSET        = '\x91',
+    NEWOBJ_EX        = '\x92',
+    STACK_GLOBAL     = '\x93',
+    MEMOIZE          = '\x94',
+    FRAME            = '\x95',
+
+    /* Protocol 5 */
+    BYTEARRAY8       = '\x96',
+    NEXT_BUFFER      = '\x97',
+    READONLY_BUFFER  = '\x98'
 };
 
 /* These aren't opcodes -- they're ways to pickle bools before protocol 2
@@ -103,7 +120,19 @@ enum {
     MAX_WRITE_BUF_SIZE = 64 * 1024,
 
     /* Prefetch size when unpickling (disabled on unpeekable streams) */
-    PREFETCH = 8192 * 16
+    PREFETCH = 8192 * 16,
+
+    /* Size of the FRAME opcode and its 8-byte length argument. */
+    FRAME_HEADER_SIZE = 9,
+
+    /* Frames smaller than this are not worth the header overhead; they are
+       written without one.  Keep in synch with pickle._Framer. */
+    FRAME_SIZE_MIN = 4,
+
+    /* A frame is committed once it grows past this size.  Objects at least
+       this large are written outside of any frame, straight to the output
+       stream.  Keep in synch with pickle._Framer. */
+    FRAME_SIZE_TARGET = 64 * 1024
 };
 
 /* Exception classes for pickle. These should override the ones defined in
@@ -340,6 +369,13 @@ typedef struct PicklerObject {
     int fix_imports;            /* Indicate whether Pickler should fix
                                    the name of globals for Python 2.x. */
     PyObject *fast_memo;
+    int framing;                /* True when framing is enabled, i.e. while
+                                   dumping with protocol 4 or higher. */
+    Py_ssize_t frame_start;     /* Position in output_buffer where the
+                                   current frame begins. -1 if there
+                                   is no frame currently open. */
+    PyObject *buffer_callback;  /* Callback for out-of-band buffers, or
+                                   NULL */
 } PicklerObject;
 
 typedef struct UnpicklerObject {
@@ -349,7 +385,8 @@ typedef struct UnpicklerObject {
     /* The unpickler memo is just an array of PyObject *s. Using a dict
        is unnecessary, since the keys are contiguous ints. */
     PyObject **memo;
-    Py_ssize_t memo_size;
+    Py_ssize_t memo_size;       /* Capacity of the memo array */
+    Py_ssize_t memo_len;        /* Number of objects in the memo */
 
     PyObject *arg;
     PyObject *pers_func;        /* persistent_load() method, can be NULL. */
@@ -377,6 +414,8 @@ typedef struct UnpicklerObject {
     int proto;                  /* Protocol of the pickle loaded. */
     int fix_imports;            /* Indicate whether Unpickler should fix
                                    the name of globals pickled by Python 2.x. */
+    PyObject *buffers;          /* Iterator of out-of-band buffers, or NULL
+                                   if none were given. */
 } UnpicklerObject;
 
 /* Forward declarations */
@@ -386,6 +425,192 @@ static PyTypeObject Pickler_Type;
 static PyTypeObject Unpickler_Type;
 
 
+/*************************************************************************
+ PickleBuffer: a wrapper around an object exporting the buffer protocol.
+ Pickling it with protocol 5 lets the data be handed to the pickler's
+ buffer_callback, out of the pickle stream, instead of being copied into
+ it. */
+
+typedef struct {
+    PyObject_HEAD
+    /* The view exported by the original object */
+    Py_buffer view;
+    PyObject *weakreflist;
+} PickleBufferObject;
+
+static PyTypeObject PickleBuffer_Type;
+
+#define PickleBuffer_Check(op) (Py_TYPE(op) == &PickleBuffer_Type)
+
+static PyObject *
+PickleBuffer_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    PickleBufferObject *self;
+    PyObject *base;
+
+    if (!_PyArg_NoKeywords("PickleBuffer()", kwds))
+        return NULL;
+    if (!PyArg_ParseTuple(args, "O:PickleBuffer", &base))
+        return NULL;
+
+    self = (PickleBufferObject *)type->tp_alloc(type, 0);
+    if (self == NULL)
+        return NULL;
+    self->view.obj = NULL;
+    self->weakreflist = NULL;
+    if (PyObject_GetBuffer(base, &self->view, PyBUF_FULL_RO) < 0) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+static void
+PickleBuffer_dealloc(PickleBufferObject *self)
+{
+    PyObject_GC_UnTrack(self);
+    if (self->weakreflist != NULL)
+        PyObject_ClearWeakRefs((PyObject *)self);
+    PyBuffer_Release(&self->view);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static int
+PickleBuffer_traverse(PickleBufferObject *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->view.obj);
+    return 0;
+}
+
+static int
+PickleBuffer_clear(PickleBufferObject *self)
+{
+    PyBuffer_Release(&self->view);
+    return 0;
+}
+
+static int
+PickleBuffer_getbuf(PickleBufferObject *self, Py_buffer *view, int flags)
+{
+    if (self->view.obj == NULL) {
+        PyErr_SetString(PyExc_ValueError,
+                        "operation forbidden on released PickleBuffer object");
+        return -1;
+    }
+    return PyObject_GetBuffer(self->view.obj, view, flags);
+}
+
+static PyBufferProcs PickleBuffer_as_buffer = {
+    (getbufferproc)PickleBuffer_getbuf,     /* bf_getbuffer */
+    NULL                                    /* bf_releasebuffer */
+};
+
+PyDoc_STRVAR(PickleBuffer_raw_doc,
+"raw() -> memoryview\n"
+"\n"
+"Return a memoryview of the raw memory underlying this buffer.\n"
+"Will raise BufferError if the buffer isn't contiguous.");
+
+static PyObject *
+PickleBuffer_raw(PickleBufferObject *self, PyObject *noargs)
+{
+    PyObject *m;
+    PyMemoryViewObject *mv;
+
+    if (self->view.obj == NULL) {
+        PyErr_SetString(PyExc_ValueError,
+                        "operation forbidden on released PickleBuffer object");
+        return NULL;
+    }
+    if (self->view.suboffsets != NULL
+        || !PyBuffer_IsContiguous(&self->view, 'A')) {
+        PyErr_SetString(PyExc_BufferError,
+                        "cannot extract raw buffer from non-contiguous buffer");
+        return NULL;
+    }
+    m = PyMemoryView_FromObject((PyObject *)self);
+    if (m == NULL)
+        return NULL;
+    /* Reshape the new view as a flat array of unsigned bytes */
+    mv = (PyMemoryViewObject *)m;
+    mv->view.itemsize = 1;
+    mv->view.format = "B";
+    mv->view.ndim = 1;
+    mv->view.shape = &mv->view.len;
+    mv->view.strides = &mv->view.itemsize;
+    mv->flags = _Py_MEMORYVIEW_C | _Py_MEMORYVIEW_FORTRAN;
+    return m;
+}
+
+PyDoc_STRVAR(PickleBuffer_release_doc,
+"release() -> None\n"
+"\n"
+"Release the underlying buffer exposed by the PickleBuffer object.");
+
+static PyObject *
+PickleBuffer_release(PickleBufferObject *self, PyObject *noargs)
+{
+    PyBuffer_Release(&self->view);
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef PickleBuffer_methods[] = {
+    {"raw", (PyCFunction)PickleBuffer_raw, METH_NOARGS,
+     PickleBuffer_raw_doc},
+    {"release", (PyCFunction)PickleBuffer_release, METH_NOARGS,
+     PickleBuffer_release_doc},
+    {NULL, NULL}
+};
+
+PyDoc_STRVAR(PickleBuffer_doc,
+"PickleBuffer(buffer)\n"
+"\n"
+"Wrapper for potentially out-of-band buffers.  When pickled with\n"
+"protocol 5 or higher, the wrapped buffer is passed to the pickler's\n"
+"buffer_callback and left out of the pickle stream.");
+
+static PyTypeObject PickleBuffer_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "pickle.PickleBuffer",                      /* tp_name */
+    sizeof(PickleBufferObject),                 /* tp_basicsize */
+    0,                                          /* tp_itemsize */
+    (destructor)PickleBuffer_dealloc,           /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_reserved */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    0,                                          /* tp_getattro */
+    0,                                          /* tp_setattro */
+    &PickleBuffer_as_buffer,                    /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,    /* tp_flags */
+    PickleBuffer_doc,                           /* tp_doc */
+    (traverseproc)PickleBuffer_traverse,        /* tp_traverse */
+    (inquiry)PickleBuffer_clear,                /* tp_clear */
+    0,                                          /* tp_richcompare */
+    offsetof(PickleBufferObject, weakreflist),  /* tp_weaklistoffset */
+    0,                                          /* tp_iter */
+    0,                                          /* tp_iternext */
+    PickleBuffer_methods,                       /* tp_methods */
+    0,                                          /* tp_members */
+    0,                                          /* tp_getset */
+    0,                                          /* tp_base */
+    0,                                          /* tp_dict */
+    0,                                          /* tp_descr_get */
+    0,                                          /* tp_descr_set */
+    0,                                          /* tp_dictoffset */
+    0,                                          /* tp_init */
+    0,                                          /* tp_alloc */
+    PickleBuffer_new,                           /* tp_new */
+};
+
+
 /*************************************************************************
  A custom hashtable mapping void* to longs. This is used by the pickler for
  memoization. Using a custom hashtable rather than PyDict allows us to skip
@@ -669,6 +894,7 @@ _Pickler_ClearBuffer(PicklerObject *self)
     if (self->output_buffer == NULL)
         return -1;
     self->output_len = 0;
+    self->frame_start = -1;
     return 0;
 }
 
@@ -701,17 +927,92 @@ _Pickler_FlushToFile(PicklerObject *self)
     return (result == NULL) ? -1 : 0;
 }
 
+static void
+_write_size64(char *out, size_t value)
+{
+    size_t i;
+
+    assert(sizeof(size_t) <= 8);
+
+    for (i = 0; i < sizeof(size_t); i++) {
+        out[i] = (unsigned char)((value >> (8 * i)) & 0xff);
+    }
+    for (i = sizeof(size_t); i < 8; i++) {
+        out[i] = 0;
+    }
+}
+
+/* Fill in the header of the current frame, reserved by _Pickler_Write()
+   when the frame was opened, and close the frame.  Frames too small to be
+   worth a header are merged back into the surrounding output. */
+static int
+_Pickler_CommitFrame(PicklerObject *self)
+{
+    size_t frame_len;
+    char *qdata;
+
+    if (!self->framing || self->frame_start == -1)
+        return 0;
+    frame_len = self->output_len - self->frame_start - FRAME_HEADER_SIZE;
+    qdata = PyBytes_AS_STRING(self->output_buffer) + self->frame_start;
+    if (frame_len >= FRAME_SIZE_MIN) {
+        qdata[0] = FRAME;
+        _write_size64(qdata + 1, frame_len);
+    }
+    else {
+        memmove(qdata, qdata + FRAME_HEADER_SIZE, frame_len);
+        self->output_len -= FRAME_HEADER_SIZE;
+    }
+    self->frame_start = -1;
+    return 0;
+}
+
+/* Called between two opcodes: commit the current frame once it is large
+   enough and, when pickling to a stream, hand it over to the stream so
+   that the whole pickle does not have to be buffered in memory. */
+static int
+_Pickler_OpcodeBoundary(PicklerObject *self)
+{
+    Py_ssize_t frame_len;
+
+    if (!self->framing || self->frame_start == -1)
+        return 0;
+    frame_len = self->output_len - self->frame_start - FRAME_HEADER_SIZE;
+    if (frame_len < FRAME_SIZE_TARGET)
+        return 0;
+    if (_Pickler_CommitFrame(self) < 0)
+        return -1;
+    if (self->write != NULL) {
+        if (_Pickler_FlushToFile(self) < 0)
+            return -1;
+        if (_Pickler_ClearBuffer(self) < 0)
+            return -1;
+    }
+    return 0;
+}
+
 static Py_ssize_t
-_Pickler_Write(PicklerObject *self, const char *s, Py_ssize_t n)
+_Pickler_Write(PicklerObject *self, const char *s, Py_ssize_t data_len)
 {
-    Py_ssize_t i, required;
+    Py_ssize_t i, n, required;
     char *buffer;
+    int need_new_frame;
 
     assert(s != NULL);
+    need_new_frame = (self->framing && self->frame_start == -1);
+
+    if (need_new_frame)
+        n = data_len + FRAME_HEADER_SIZE;
+    else
+        n = data_len;
 
     required = self->output_len + n;
     if (required > self->max_output_len) {
-        if (self->write != NULL && required > MAX_WRITE_BUF_SIZE) {
+        /* While framing, the output is only flushed at opcode boundaries
+           by _Pickler_OpcodeBoundary(), since the frame header is filled
+           in when the frame is committed. */
+        if (!self->framing &&
+            self->write != NULL && required > MAX_WRITE_BUF_SIZE) {
             /* XXX This reallocates a new buffer every time, which is a bit
                wasteful. */
             if (_Pickler_FlushToFile(self) < 0)
@@ -719,7 +1020,8 @@ _Pickler_Write(PicklerObject *self, const char *s, Py_ssize_t n)
             if (_Pickler_ClearBuffer(self) < 0)
                 return -1;
         }
-        if (self->write != NULL && n > MAX_WRITE_BUF_SIZE) {
+        if (!self->framing &&
+            self->write != NULL && n > MAX_WRITE_BUF_SIZE) {
             /* we already flushed above, so the buffer is empty */
             PyObject *result;
             /* XXX we could spare an intermediate copy and pass
@@ -742,17 +1044,79 @@ _Pickler_Write(PicklerObject *self, const char *s, Py_ssize_t n)
         }
     }
     buffer = PyBytes_AS_STRING(self->output_buffer);
-    if (n < 8) {
+    if (need_new_frame) {
+        /* Reserve room for the header of the new frame; it is filled in
+           by _Pickler_CommitFrame(). */
+        self->frame_start = self->output_len;
+        self->output_len += FRAME_HEADER_SIZE;
+    }
+    if (data_len < 8) {
         /* This is faster than memcpy when the string is short. */
-        for (i = 0; i < n; i++) {
+        for (i = 0; i < data_len; i++) {
             buffer[self->output_len + i] = s[i];
         }
     }
     else {
-        memcpy(buffer + self->output_len, s, n);
+        memcpy(buffer + self->output_len, s, data_len);
     }
-    self->output_len += n;
-    return n;
+    self->output_len += data_len;
+    return data_len;
+}
+
+/* Write the header of a counted bytes-like opcode followed by its data.
+   When pickling to a stream, data of at least FRAME_SIZE_TARGET bytes is
+   passed directly to the stream's write() method, outside of any frame,
+   instead of being copied into the output buffer first.  `payload`, if
+   not NULL, is a bytes object holding the data, which spares a copy. */
+static int
+_Pickler_WriteBytes(PicklerObject *self,
+                    const char *header, Py_ssize_t header_size,
+                    const char *data, Py_ssize_t data_size,
+                    PyObject *payload)
+{
+    PyObject *result;
+
+    if (self->write == NULL || data_size < FRAME_SIZE_TARGET) {
+        if (_Pickler_Write(self, header, header_size) < 0)
+            return -1;
+        if (_Pickler_Write(self, data, data_size) < 0)
+            return -1;
+        return 0;
+    }
+
+    if (_Pickler_CommitFrame(self) < 0)
+        return -1;
+    /* Write the header without opening a new frame, then hand the output
+       buffer over to the stream. */
+    {
+        int framing = self->framing;
+        Py_ssize_t status;
+
+        self->framing = 0;
+        status = _Pickler_Write(self, header, header_size);
+        self->framing = framing;
+        if (status < 0)
+            return -1;
+    }
+    if (_Pickler_FlushToFile(self) < 0)
+        return -1;
+    if (_Pickler_ClearBuffer(self) < 0)
+        return -1;
+
+    if (payload == NULL) {
+        payload = PyBytes_FromStringAndSize(data, data_size);
+        if (payload == NULL)
+            return -1;
+    }
+    else {
+        Py_INCREF(payload);
+    }
+    /* _Pickler_FastCall() steals the reference to payload. */
+    result = _Pickler_FastCall(self, self->write, payload);
+    if (result == NULL)
+        return -1;
+    Py_DECREF(result);
+    return 0;
 }
 
 static PicklerObject *
@@ -774,6 +1138,9 @@ _Pickler_New(void)
     self->fast_nesting = 0;
     self->fix_imports = 0;
     self->fast_memo = NULL;
+    self->framing = 0;
+    self->frame_start = -1;
+    self->buffer_callback = NULL;
 
     self->memo = PyMemoTable_New();
     if (self->memo == NULL) {
@@ -823,6 +1190,25 @@ _Pickler_SetProtocol(PicklerObject *self, PyObject *proto_obj,
     return 0;
 }
 
+/* Returns -1 (with an exception set) on failure, 0 on success.  Must be
+   called after _Pickler_SetProtocol(). */
+static int
+_Pickler_SetBufferCallback(PicklerObject *self, PyObject *buffer_callback)
+{
+    if (buffer_callback == Py_None)
+        buffer_callback = NULL;
+    if (buffer_callback != NULL && self->proto < 5) {
+        PyErr_SetString(PyExc_ValueError,
+                        "buffer_callback needs protocol >= 5");
+        return -1;
+    }
+
+    Py_XINCREF(buffer_callback);
+    Py_XDECREF(self->buffer_callback);
+    self->buffer_callback = buffer_callback;
+    return 0;
+}
+
 /* Returns -1 (with an exception set) on failure, 0 on success. This may
    be called once on a freshly created Pickler. */
 static int
@@ -989,6 +1375,12 @@ _Unpickler_Read(UnpicklerObject *self, char **s, Py_ssize_t n)
         PyErr_Format(PyExc_EOFError, "Ran out of input");
         return -1;
     }
+    if (self->next_read_idx < self->prefetched_idx) {
+        /* Part of a frame read from the file is still unconsumed. */
+        PyErr_SetString(UnpicklingError,
+                        "pickle exhausted before end of frame");
+        return -1;
+    }
     num_read = _Unpickler_ReadFromFile(self, n);
     if (num_read < 0)
         return -1;
@@ -1034,6 +1426,12 @@ _Unpickler_Readline(UnpicklerObject *self, char **result)
         }
     }
     if (self->read) {
+        if (self->next_read_idx < self->prefetched_idx) {
+            /* Part of a frame read from the file is still unconsumed. */
+            PyErr_SetString(UnpicklingError,
+                            "pickle exhausted before end of frame");
+            return -1;
+        }
         num_read = _Unpickler_ReadFromFile(self, READ_WHOLE_LINE);
         if (num_read < 0)
             return -1;
@@ -1096,7 +1494,12 @@ _Unpickler_MemoPut(UnpicklerObject *self, Py_ssize_t idx, PyObject *value)
     Py_INCREF(value);
     old_item = self->memo[idx];
     self->memo[idx] = value;
-    Py_XDECREF(old_item);
+    if (old_item != NULL) {
+        Py_DECREF(old_item);
+    }
+    else {
+        self->memo_len++;
+    }
     return 0;
 }
 
@@ -1120,6 +1523,7 @@ _Unpickler_MemoCleanup(UnpicklerObject *self)
     if (self->memo == NULL)
         return;
     self->memo = NULL;
+    self->memo_len = 0;
     i = self->memo_size;
     while (--i >= 0) {
         Py_XDECREF(memo[i]);
@@ -1144,6 +1548,7 @@ _Unpickler_New(void)
     memset(&self->buffer, 0, sizeof(Py_buffer));
 
     self->memo_size = 32;
+    self->memo_len = 0;
     self->memo = _Unpickler_NewMemo(self->memo_size);
     if (self->memo == NULL) {
         Py_DECREF(self);
@@ -1167,6 +1572,7 @@ _Unpickler_New(void)
     self->marks_size = 0;
     self->proto = 0;
     self->fix_imports = 0;
+    self->buffers = NULL;
 
     return self;
 }
@@ -1222,6 +1628,23 @@ _Unpickler_SetInputEncoding(UnpicklerObject *self,
     return 0;
 }
 
+/* Returns -1 (with an exception set) on failure, 0 on success. This may
+   be called once on a freshly created Unpickler. */
+static int
+_Unpickler_SetBuffers(UnpicklerObject *self, PyObject *buffers)
+{
+    if (buffers == NULL || buffers == Py_None) {
+        self->buffers = NULL;
+    }
+    else {
+        self->buffers = PyObject_GetIter(buffers);
+        if (self->buffers == NULL) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
 /* Generate a GET opcode for an object stored in the memo. */
 static int
 memo_get(PicklerObject *self, PyObject *key)
@@ -1270,7 +1693,8 @@ memo_get(PicklerObject *self, PyObject *key)
 }
 
 /* Store an object in the memo, assign it a new unique ID based on the number
-   of objects currently stored in the memo and generate a PUT opcode. */
+   of objects currently stored in the memo and generate a PUT opcode.  With
+   protocol 4, the ID is implicit and a MEMOIZE opcode is generated instead. */
 static int
 memo_put(PicklerObject *self, PyObject *obj)
 {
@@ -1286,7 +1710,11 @@ memo_put(PicklerObject *self, PyObject *obj)
     if (PyMemoTable_Set(self->memo, obj, x) < 0)
         goto error;
 
-    if (!self->bin) {
+    if (self->proto >= 4) {
+        pdata[0] = MEMOIZE;
+        len = 1;
+    }
+    else if (!self->bin) {
         pdata[0] = PUT;
         PyOS_snprintf(pdata + 1, sizeof(pdata) - 1,
                       "%" PY_FORMAT_SIZE_T "d\n", x);
@@ -1324,8 +1752,69 @@ memo_put(PicklerObject *self, PyObject *obj)
     return status;
 }
 
+/* Look up the attribute `name` of `obj`.  If allow_qualname is true, name
+   may be a dotted path (a __qualname__), which is walked from obj. */
+static PyObject *
+getattribute(PyObject *obj, PyObject *name, int allow_qualname)
+{
+    static PyObject *dot_str = NULL;
+    PyObject *dotted_path;
+    Py_ssize_t i, n;
+
+    if (PyUnicode_READY(name) < 0)
+        return NULL;
+    /* Fast path for the common case of a plain name. */
+    if (PyUnicode_FindChar(name, '.', 0, PyUnicode_GET_LENGTH(name), 1) == -1)
+        return PyObject_GetAttr(obj, name);
+
+    if (!allow_qualname) {
+        PyErr_Format(PyExc_AttributeError,
+                     "Can't get qualified attribute %R on %R; "
+                     "use protocols >= 4 to enable support",
+                     name, obj);
+        return NULL;
+    }
+    if (dot_str == NULL) {
+        dot_str = PyUnicode_InternFromString(".");
+        if (dot_str == NULL)
+            return NULL;
+    }
+    dotted_path = PyUnicode_Split(name, dot_str, -1);
+    if (dotted_path == NULL)
+        return NULL;
+    n = PyList_GET_SIZE(dotted_path);
+    Py_INCREF(obj);
+    for (i = 0; i < n; i++) {
+        PyObject *subpath = PyList_GET_ITEM(dotted_path, i);
+        PyObject *tmp;
+
+        if (PyUnicode_CompareWithASCIIString(subpath, "<locals>") == 0) {
+            PyErr_Format(PyExc_AttributeError,
+                         "Can't get local attribute %R on %R", name, obj);
+            Py_DECREF(obj);
+            Py_DECREF(dotted_path);
+            return NULL;
+        }
+        tmp = PyObject_GetAttr(obj, subpath);
+        if (tmp == NULL) {
+            if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+                PyErr_Clear();
+                PyErr_Format(PyExc_AttributeError,
+                             "Can't get attribute %R on %R", name, obj);
+            }
+            Py_DECREF(obj);
+            Py_DECREF(dotted_path);
+            return NULL;
+        }
+        Py_DECREF(obj);
+        obj = tmp;
+    }
+    Py_DECREF(dotted_path);
+    return obj;
+}
+
 static PyObject *
-whichmodule(PyObject *global, PyObject *global_name)
+whichmodule(PyObject *global, PyObject *global_name, int allow_qualname)
 {
     Py_ssize_t i, j;
     static PyObject *module_str = NULL;
@@ -1373,7 +1862,7 @@ whichmodule(PyObject *global, PyObject *global_name)
         if (PyObject_RichCompareBool(module_name, main_str, Py_EQ) == 1)
             continue;
 
-        obj = PyObject_GetAttr(module, global_name);
+        obj = getattribute(module, global_name, allow_qualname);
         if (obj == NULL) {
             if (PyErr_ExceptionMatches(PyExc_AttributeError))
                 PyErr_Clear();
@@ -1766,7 +2255,7 @@ save_bytes(PicklerObject *self, PyObject *obj)
     }
     else {
         Py_ssize_t size;
-        char header[5];
+        char header[9];
         Py_ssize_t len;
 
         size = PyBytes_GET_SIZE(obj);
@@ -1786,16 +2275,19 @@ save_bytes(PicklerObject *self, PyObject *obj)
             header[4] = (unsigned char)((size >> 24) & 0xff);
             len = 5;
         }
+        else if (self->proto >= 4) {
+            header[0] = BINBYTES8;
+            _write_size64(header + 1, size);
+            len = 9;
+        }
         else {
             PyErr_SetString(PyExc_OverflowError,
                             "cannot serialize a bytes object larger than 4GB");
             return -1;          /* string too large */
         }
 
-        if (_Pickler_Write(self, header, len) < 0)
-            return -1;
-
-        if (_Pickler_Write(self, PyBytes_AS_STRING(obj), size) < 0)
+        if (_Pickler_WriteBytes(self, header, len,
+                                PyBytes_AS_STRING(obj), size, obj) < 0)
             return -1;
 
         if (memo_put(self, obj) < 0)
@@ -1805,6 +2297,107 @@ save_bytes(PicklerObject *self, PyObject *obj)
     }
 }
 
+/* Write a BYTEARRAY8 opcode followed by the given data.  Only used with
+   protocol 5 and higher; older protocols reduce bytearray objects. */
+static int
+_save_bytearray_data(PicklerObject *self, PyObject *obj,
+                     const char *data, Py_ssize_t size)
+{
+    char header[9];
+
+    assert(self->proto >= 5);
+    if (size < 0)
+        return -1;
+
+    header[0] = BYTEARRAY8;
+    _write_size64(header + 1, size);
+
+    if (_Pickler_WriteBytes(self, header, 9, data, size, obj) < 0)
+        return -1;
+
+    if (memo_put(self, obj) < 0)
+        return -1;
+
+    return 0;
+}
+
+static int
+save_bytearray(PicklerObject *self, PyObject *obj)
+{
+    return _save_bytearray_data(self, obj, PyByteArray_AS_STRING(obj),
+                                PyByteArray_GET_SIZE(obj));
+}
+
+static int
+save_picklebuffer(PicklerObject *self, PyObject *obj)
+{
+    Py_buffer *view = &((PickleBufferObject *)obj)->view;
+    int in_band = 1;
+
+    if (self->proto < 5) {
+        PyErr_SetString(PicklingError,
+                        "PickleBuffer can only be pickled with protocol >= 5");
+        return -1;
+    }
+    if (view->obj == NULL) {
+        PyErr_SetString(PyExc_ValueError,
+                        "operation forbidden on released PickleBuffer object");
+        return -1;
+    }
+    if (view->suboffsets != NULL || !PyBuffer_IsContiguous(view, 'A')) {
+        PyErr_SetString(PicklingError,
+                        "PickleBuffer can not be pickled when "
+                        "pointing to a non-contiguous buffer");
+        return -1;
+    }
+    if (self->buffer_callback != NULL) {
+        PyObject *ret;
+
+        Py_INCREF(obj);
+        ret = _Pickler_FastCall(self, self->buffer_callback, obj);
+        if (ret == NULL)
+            return -1;
+        in_band = PyObject_IsTrue(ret);
+        Py_DECREF(ret);
+        if (in_band == -1)
+            return -1;
+    }
+    if (in_band) {
+        /* Write data in-band.  The copy is memoized so that it stays alive,
+           and its address unique, while pickling. */
+        PyObject *copy;
+        int status;
+
+        if (view->readonly) {
+            copy = PyBytes_FromStringAndSize(view->buf, view->len);
+            if (copy == NULL)
+                return -1;
+            status = save_bytes(self, copy);
+        }
+        else {
+            copy = PyByteArray_FromStringAndSize(view->buf, view->len);
+            if (copy == NULL)
+                return -1;
+            status = save_bytearray(self, copy);
+        }
+        Py_DECREF(copy);
+        return status;
+    }
+    else {
+        /* Write data out-of-band */
+        const char next_buffer_op = NEXT_BUFFER;
+        const char readonly_buffer_op = READONLY_BUFFER;
+
+        if (_Pickler_Write(self, &next_buffer_op, 1) < 0)
+            return -1;
+        if (view->readonly) {
+            if (_Pickler_Write(self, &readonly_buffer_op, 1) < 0)
+                return -1;
+        }
+    }
+    return 0;
+}
+
 /* A copy of PyUnicode_EncodeRawUnicodeEscape() that also translates
    backslash and newline characters to \uXXXX escapes. */
 static PyObject *
@@ -1879,29 +2472,41 @@ save_unicode(PicklerObject *self, PyObject *obj)
     PyObject *encoded = NULL;
 
     if (self->bin) {
-        char pdata[5];
+        char pdata[9];
+        Py_ssize_t len;
 
         encoded = PyUnicode_AsEncodedString(obj, "utf-8", "surrogatepass");
         if (encoded == NULL)
             goto error;
 
         size = PyBytes_GET_SIZE(encoded);
-        if (size > 0xffffffffL) {
+        if (size < 256 && self->proto >= 4) {
+            pdata[0] = SHORT_BINUNICODE;
+            pdata[1] = (unsigned char)size;
+            len = 2;
+        }
+        else if (size <= 0xffffffffL) {
+            pdata[0] = BINUNICODE;
+            pdata[1] = (unsigned char)(size & 0xff);
+            pdata[2] = (unsigned char)((size >> 8) & 0xff);
+            pdata[3] = (unsigned char)((size >> 16) & 0xff);
+            pdata[4] = (unsigned char)((size >> 24) & 0xff);
+            len = 5;
+        }
+        else if (self->proto >= 4) {
+            pdata[0] = BINUNICODE8;
+            _write_size64(pdata + 1, size);
+            len = 9;
+        }
+        else {
             PyErr_SetString(PyExc_OverflowError,
                             "cannot serialize a string larger than 4GB");
             goto error;          /* string too large */
         }
 
-        pdata[0] = BINUNICODE;
-        pdata[1] = (unsigned char)(size & 0xff);
-        pdata[2] = (unsigned char)((size >> 8) & 0xff);
-        pdata[3] = (unsigned char)((size >> 16) & 0xff);
-        pdata[4] = (unsigned char)((size >> 24) & 0xff);
-
-        if (_Pickler_Write(self, pdata, 5) < 0)
-            goto error;
-
-        if (_Pickler_Write(self, PyBytes_AS_STRING(encoded), size) < 0)
+        if (_Pickler_WriteBytes(self, pdata, len,
+                                PyBytes_AS_STRING(encoded), size,
+                                encoded) < 0)
             goto error;
     }
     else {
@@ -2556,15 +3161,108 @@ save_dict(PicklerObject *self, PyObject *obj)
     return status;
 }
 
+static int
+save_set(PicklerObject *self, PyObject *obj)
+{
+    PyObject *item;
+    int i;
+    Py_ssize_t set_size, ppos = 0;
+    Py_hash_t hash;
+
+    const char empty_set_op = EMPTY_SET;
+    const char mark_op = MARK;
+    const char additems_op = ADDITEMS;
+
+    assert(self->proto >= 4);
+
+    if (_Pickler_Write(self, &empty_set_op, 1) < 0)
+        return -1;
+
+    if (memo_put(self, obj) < 0)
+        return -1;
+
+    set_size = PySet_GET_SIZE(obj);
+    if (set_size == 0)
+        return 0;  /* nothing to do */
+
+    /* Write in batches of BATCHSIZE. */
+    do {
+        i = 0;
+        if (_Pickler_Write(self, &mark_op, 1) < 0)
+            return -1;
+        while (_PySet_NextEntry(obj, &ppos, &item, &hash)) {
+            if (save(self, item, 0) < 0)
+                return -1;
+            if (++i == BATCHSIZE)
+                break;
+        }
+        if (_Pickler_Write(self, &additems_op, 1) < 0)
+            return -1;
+        if (PySet_GET_SIZE(obj) != set_size) {
+            PyErr_Format(
+                PyExc_RuntimeError,
+                "set changed size during iteration");
+            return -1;
+        }
+    } while (i == BATCHSIZE);
+
+    return 0;
+}
+
+static int
+save_frozenset(PicklerObject *self, PyObject *obj)
+{
+    PyObject *item;
+    Py_ssize_t ppos = 0;
+    Py_hash_t hash;
+
+    const char mark_op = MARK;
+    const char frozenset_op = FROZENSET;
+
+    assert(self->proto >= 4);
+
+    if (_Pickler_Write(self, &mark_op, 1) < 0)
+        return -1;
+
+    while (_PySet_NextEntry(obj, &ppos, &item, &hash)) {
+        if (save(self, item, 0) < 0)
+            return -1;
+    }
+
+    /* If the object is already in the memo, this means it is
+       recursive. In this case, throw away everything we put on the
+       stack, and fetch the object back from the memo. */
+    if (PyMemoTable_Get(self->memo, obj)) {
+        const char pop_mark_op = POP_MARK;
+
+        if (_Pickler_Write(self, &pop_mark_op, 1) < 0)
+            return -1;
+        if (memo_get(self, obj) < 0)
+            return -1;
+        return 0;
+    }
+
+    if (_Pickler_Write(self, &frozenset_op, 1) < 0)
+        return -1;
+    if (memo_put(self, obj) < 0)
+        return -1;
+
+    return 0;
+}
+
 static int
 save_global(PicklerObject *self, PyObject *obj, PyObject *name)
 {
     static PyObject *name_str = NULL;
+    static PyObject *qualname_str = NULL;
     PyObject *global_name = NULL;
     PyObject *module_name = NULL;
     PyObject *module = NULL;
     PyObject *cls;
     int status = 0;
+    /* Protocol 4 looks up nested classes and functions by their qualified
+       name. */
+    int allow_qualname = self->proto >= 4;
 
     const char global_op = GLOBAL;
 
@@ -2572,6 +3270,9 @@ save_global(PicklerObject *self, PyObject *obj, PyObject *name)
         name_str = PyUnicode_InternFromString("__name__");
         if (name_str == NULL)
             goto error;
+        qualname_str = PyUnicode_InternFromString("__qualname__");
+        if (qualname_str == NULL)
+            goto error;
     }
 
     if (name) {
@@ -2579,12 +3280,22 @@ save_global(PicklerObject *self, PyObject *obj, PyObject *name)
         Py_INCREF(global_name);
     }
     else {
-        global_name = PyObject_GetAttr(obj, name_str);
-        if (global_name == NULL)
-            goto error;
+        if (allow_qualname) {
+            global_name = PyObject_GetAttr(obj, qualname_str);
+            if (global_name == NULL) {
+                if (!PyErr_ExceptionMatches(PyExc_AttributeError))
+                    goto error;
+                PyErr_Clear();
+            }
+        }
+        if (global_name == NULL) {
+            global_name = PyObject_GetAttr(obj, name_str);
+            if (global_name == NULL)
+                goto error;
+        }
     }
 
-    module_name = whichmodule(obj, global_name);
+    module_name = whichmodule(obj, global_name, allow_qualname);
     if (module_name == NULL)
         goto error;
 
@@ -2603,7 +3314,7 @@ save_global(PicklerObject *self, PyObject *obj, PyObject *name)
                      obj, module_name);
         goto error;
     }
-    cls = PyObject_GetAttr(module, global_name);
+    cls = getattribute(module, global_name, allow_qualname);
     if (cls == NULL) {
         PyErr_Format(PicklingError,
                      "Can't pickle %R: attribute lookup %S.%S failed",
@@ -2688,112 +3399,129 @@ save_global(PicklerObject *self, PyObject *obj, PyObject *name)
         PyObject *(*unicode_encoder)(PyObject *);
 
   gen_global:
-        if (_Pickler_Write(self, &global_op, 1) < 0)
-            goto error;
+        if (self->proto >= 4) {
+            const char stack_global_op = STACK_GLOBAL;
 
-        /* Since Python 3.0 now supports non-ASCII identifiers, we encode both
-           the module name and the global name using UTF-8. We do so only when
-           we are using the pickle protocol newer than version 3. This is to
-           ensure compatibility with older Unpickler running on Python 2.x. */
-        if (self->proto >= 3) {
-            unicode_encoder = PyUnicode_AsUTF8String;
+            if (save(self, module_name, 0) < 0)
+                goto error;
+            if (save(self, global_name, 0) < 0)
+                goto error;
+            if (_Pickler_Write(self, &stack_global_op, 1) < 0)
+                goto error;
         }
         else {
-            unicode_encoder = PyUnicode_AsASCIIString;
-        }
+            if (_Pickler_Write(self, &global_op, 1) < 0)
+                goto error;
 
-        /* For protocol < 3 and if the user didn't request against doing so,
-           we convert module names to the old 2.x module names. */
-        if (self->fix_imports) {
-            PyObject *key;
-            PyObject *item;
+            /* Since Python 3.0 now supports non-ASCII identifiers, we encode
+               both the module name and the global name using UTF-8. We do so
+               only when we are using the pickle protocol newer than version
+               3. This is to ensure compatibility with older Unpickler running
+               on Python 2.x. */
+            if (self->proto >= 3) {
+                unicode_encoder = PyUnicode_AsUTF8String;
+            }
+            else {
+                unicode_encoder = PyUnicode_AsASCIIString;
+            }
 
-            key = PyTuple_Pack(2, module_name, global_name);
-            if (key == NULL)
-                goto error;
-            item = PyDict_GetItemWithError(name_mapping_3to2, key);
-            Py_DECREF(key);
-            if (item) {
-                if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
-                    PyErr_Format(PyExc_RuntimeError,
-                                 "_compat_pickle.REVERSE_NAME_MAPPING values "
-                                 "should be 2-tuples, not %.200s",
-                                 Py_TYPE(item)->tp_name);
+            /* For protocol < 3 and if the user didn't request against doing
+               so, we convert module names to the old 2.x module names. */
+            if (self->fix_imports) {
+                PyObject *key;
+                PyObject *item;
+
+                key = PyTuple_Pack(2, module_name, global_name);
+                if (key == NULL)
                     goto error;
+                item = PyDict_GetItemWithError(name_mapping_3to2, key);
+                Py_DECREF(key);
+                if (item) {
+                    if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
+                        PyErr_Format(PyExc_RuntimeError,
+                                     "_compat_pickle.REVERSE_NAME_MAPPING "
+                                     "values should be 2-tuples, not %.200s",
+                                     Py_TYPE(item)->tp_name);
+                        goto error;
+                    }
+                    Py_CLEAR(module_name);
+                    Py_CLEAR(global_name);
+                    module_name = PyTuple_GET_ITEM(item, 0);
+                    global_name = PyTuple_GET_ITEM(item, 1);
+                    if (!PyUnicode_Check(module_name) ||
+                        !PyUnicode_Check(global_name)) {
+                        PyErr_Format(PyExc_RuntimeError,
+                                     "_compat_pickle.REVERSE_NAME_MAPPING "
+                                     "values should be pairs of str, "
+                                     "not (%.200s, %.200s)",
+                                     Py_TYPE(module_name)->tp_name,
+                                     Py_TYPE(global_name)->tp_name);
+                        goto error;
+                    }
+                    Py_INCREF(module_name);
+                    Py_INCREF(global_name);
                 }
-                Py_CLEAR(module_name);
-                Py_CLEAR(global_name);
-                module_name = PyTuple_GET_ITEM(item, 0);
-                global_name = PyTuple_GET_ITEM(item, 1);
-                if (!PyUnicode_Check(module_name) ||
-                    !PyUnicode_Check(global_name)) {
-                    PyErr_Format(PyExc_RuntimeError,
-                                 "_compat_pickle.REVERSE_NAME_MAPPING values "
-                                 "should be pairs of str, not (%.200s, %.200s)",
-                                 Py_TYPE(module_name)->tp_name,
-                                 Py_TYPE(global_name)->tp_name);
+                else if (PyErr_Occurred()) {
                     goto error;
                 }
-                Py_INCREF(module_name);
-                Py_INCREF(global_name);
-            }
-            else if (PyErr_Occurred()) {
-                goto error;
-            }
 
-            item = PyDict_GetItemWithError(import_mapping_3to2, module_name);
-            if (item) {
-                if (!PyUnicode_Check(item)) {
-                    PyErr_Format(PyExc_RuntimeError,
-                                 "_compat_pickle.REVERSE_IMPORT_MAPPING values "
-                                 "should be strings, not %.200s",
-                                 Py_TYPE(item)->tp_name);
+                item = PyDict_GetItemWithError(import_mapping_3to2,
+                                               module_name);
+                if (item) {
+                    if (!PyUnicode_Check(item)) {
+                        PyErr_Format(PyExc_RuntimeError,
+                                     "_compat_pickle.REVERSE_IMPORT_MAPPING "
+                                     "values should be strings, not %.200s",
+                                     Py_TYPE(item)->tp_name);
+                        goto error;
+                    }
+                    Py_CLEAR(module_name);
+                    module_name = item;
+                    Py_INCREF(module_name);
+                }
+                else if (PyErr_Occurred()) {
                     goto error;
                 }
-                Py_CLEAR(module_name);
-                module_name = item;
-                Py_INCREF(module_name);
             }
-            else if (PyErr_Occurred()) {
+
+            /* Save the name of the module. */
+            encoded = unicode_encoder(module_name);
+            if (encoded == NULL) {
+                if (PyErr_ExceptionMatches(PyExc_UnicodeEncodeError))
+                    PyErr_Format(PicklingError,
+                                 "can't pickle module identifier '%S' using "
+                                 "pickle protocol %i",
+                                 module_name, self->proto);
+                goto error;
+            }
+            if (_Pickler_Write(self, PyBytes_AS_STRING(encoded),
+                              PyBytes_GET_SIZE(encoded)) < 0) {
+                Py_DECREF(encoded);
                 goto error;
             }
-        }
-
-        /* Save the name of the module. */
-        encoded = unicode_encoder(module_name);
-        if (encoded == NULL) {
-            if (PyErr_ExceptionMatches(PyExc_UnicodeEncodeError))
-                PyErr_Format(PicklingError,
-                             "can't pickle module identifier '%S' using "
-                             "pickle protocol %i", module_name, self->proto);
-            goto error;
-        }
-        if (_Pickler_Write(self, PyBytes_AS_STRING(encoded),
-                          PyBytes_GET_SIZE(encoded)) < 0) {
             Py_DECREF(encoded);
-            goto error;
-        }
-        Py_DECREF(encoded);
-        if(_Pickler_Write(self, "\n", 1) < 0)
-            goto error;
+            if(_Pickler_Write(self, "\n", 1) < 0)
+                goto error;
 
-        /* Save the name of the module. */
-        encoded = unicode_encoder(global_name);
-        if (encoded == NULL) {
-            if (PyErr_ExceptionMatches(PyExc_UnicodeEncodeError))
-                PyErr_Format(PicklingError,
-                             "can't pickle global identifier '%S' using "
-                             "pickle protocol %i", global_name, self->proto);
-            goto error;
-        }
-        if (_Pickler_Write(self, PyBytes_AS_STRING(encoded),
-                          PyBytes_GET_SIZE(encoded)) < 0) {
+            /* Save the name of the module. */
+            encoded = unicode_encoder(global_name);
+            if (encoded == NULL) {
+                if (PyErr_ExceptionMatches(PyExc_UnicodeEncodeError))
+                    PyErr_Format(PicklingError,
+                                 "can't pickle global identifier '%S' using "
+                                 "pickle protocol %i",
+                                 global_name, self->proto);
+                goto error;
+            }
+            if (_Pickler_Write(self, PyBytes_AS_STRING(encoded),
+                              PyBytes_GET_SIZE(encoded)) < 0) {
+                Py_DECREF(encoded);
+                goto error;
+            }
             Py_DECREF(encoded);
-            goto error;
+            if(_Pickler_Write(self, "\n", 1) < 0)
+                goto error;
         }
-        Py_DECREF(encoded);
-        if(_Pickler_Write(self, "\n", 1) < 0)
-            goto error;
 
         /* Memoize the object. */
         if (memo_put(self, obj) < 0)
@@ -2924,11 +3652,12 @@ save_reduce(PicklerObject *self, PyObject *args, PyObject *obj)
     PyObject *dictitems = Py_None;
     Py_ssize_t size;
 
-    int use_newobj = self->proto >= 2;
+    int use_newobj = 0, use_newobj_ex = 0;
 
     const char reduce_op = REDUCE;
     const char build_op = BUILD;
     const char newobj_op = NEWOBJ;
+    const char newobj_ex_op = NEWOBJ_EX;
 
     size = PyTuple_Size(args);
     if (size < 2 || size > 5) {
@@ -2974,15 +3703,19 @@ save_reduce(PicklerObject *self, PyObject *args, PyObject *obj)
     }
 
     /* Protocol 2 special case: if callable's name is __newobj__, use
-       NEWOBJ. */
-    if (use_newobj) {
-        static PyObject *newobj_str = NULL, *name_str = NULL;
+       NEWOBJ.  Protocol 4 special case: if it is __newobj_ex__, use
+       NEWOBJ_EX. */
+    if (self->proto >= 2) {
+        static PyObject *newobj_str = NULL, *newobj_ex_str = NULL;
+        static PyObject *name_str = NULL;
         PyObject *name;
 
         if (newobj_str == NULL) {
             newobj_str = PyUnicode_InternFromString("__newobj__");
+            newobj_ex_str = PyUnicode_InternFromString("__newobj_ex__");
             name_str = PyUnicode_InternFromString("__name__");
-            if (newobj_str == NULL || name_str == NULL)
+            if (newobj_str == NULL || newobj_ex_str == NULL ||
+                name_str == NULL)
                 return -1;
         }
 
@@ -2992,15 +3725,72 @@ save_reduce(PicklerObject *self, PyObject *args, PyObject *obj)
                 PyErr_Clear();
             else
                 return -1;
-            use_newobj = 0;
-        }
-        else {
-            use_newobj = PyUnicode_Check(name) &&
-                         PyUnicode_Compare(name, newobj_str) == 0;
-            Py_DECREF(name);
         }
+        else {
+            if (PyUnicode_Check(name)) {
+                use_newobj = PyUnicode_Compare(name, newobj_str) == 0;
+                use_newobj_ex = (self->proto >= 4 &&
+                                 PyUnicode_Compare(name, newobj_ex_str) == 0);
+            }
+            Py_DECREF(name);
+        }
+    }
+    if (use_newobj_ex) {
+        PyObject *cls;
+        PyObject *args;
+        PyObject *kwargs;
+
+        if (Py_SIZE(argtup) != 3) {
+            PyErr_Format(PicklingError,
+                         "length of the NEWOBJ_EX argument tuple must be "
+                         "exactly 3, not %zd", Py_SIZE(argtup));
+            return -1;
+        }
+
+        cls = PyTuple_GET_ITEM(argtup, 0);
+        if (!PyType_Check(cls)) {
+            PyErr_Format(PicklingError,
+                         "first item from NEWOBJ_EX argument tuple must "
+                         "be a class, not %.200s", Py_TYPE(cls)->tp_name);
+            return -1;
+        }
+        args = PyTuple_GET_ITEM(argtup, 1);
+        if (!PyTuple_Check(args)) {
+            PyErr_Format(PicklingError,
+                         "second item from NEWOBJ_EX argument tuple must "
+                         "be a tuple, not %.200s", Py_TYPE(args)->tp_name);
+            return -1;
+        }
+        kwargs = PyTuple_GET_ITEM(argtup, 2);
+        if (!PyDict_Check(kwargs)) {
+            PyErr_Format(PicklingError,
+                         "third item from NEWOBJ_EX argument tuple must "
+                         "be a dict, not %.200s", Py_TYPE(kwargs)->tp_name);
+            return -1;
+        }
+
+        if (obj != NULL) {
+            PyObject *obj_class = get_class(obj);
+            int p;
+
+            if (obj_class == NULL)
+                return -1;
+            p = obj_class != cls;    /* true iff a problem */
+            Py_DECREF(obj_class);
+            if (p) {
+                PyErr_SetString(PicklingError, "args[0] from "
+                                "__newobj_ex__ args has the wrong class");
+                return -1;
+            }
+        }
+
+        if (save(self, cls, 0) < 0 ||
+            save(self, args, 0) < 0 ||
+            save(self, kwargs, 0) < 0 ||
+            _Pickler_Write(self, &newobj_ex_op, 1) < 0)
+            return -1;
     }
-    if (use_newobj) {
+    else if (use_newobj) {
         PyObject *cls;
         PyObject *newargtup;
         PyObject *obj_class;
@@ -3188,6 +3978,22 @@ save(PicklerObject *self, PyObject *obj, int pers_save)
         status = save_tuple(self, obj);
         goto done;
     }
+    else if (type == &PySet_Type && self->proto >= 4) {
+        status = save_set(self, obj);
+        goto done;
+    }
+    else if (type == &PyFrozenSet_Type && self->proto >= 4) {
+        status = save_frozenset(self, obj);
+        goto done;
+    }
+    else if (type == &PyByteArray_Type && self->proto >= 5) {
+        status = save_bytearray(self, obj);
+        goto done;
+    }
+    else if (type == &PickleBuffer_Type) {
+        status = save_picklebuffer(self, obj);
+        goto done;
+    }
     else if (type == &PyType_Type) {
         status = save_global(self, obj, NULL);
         goto done;
@@ -3305,6 +4111,8 @@ save(PicklerObject *self, PyObject *obj, int pers_save)
         status = -1;
     }
   done:
+    if (status >= 0 && _Pickler_OpcodeBoundary(self) < 0)
+        status = -1;
     Py_LeaveRecursiveCall();
     Py_XDECREF(reduce_func);
     Py_XDECREF(reduce_value);
@@ -3325,12 +4133,17 @@ dump(PicklerObject *self, PyObject *obj)
         header[1] = (unsigned char)self->proto;
         if (_Pickler_Write(self, header, 2) < 0)
             return -1;
+        if (self->proto >= 4)
+            self->framing = 1;
     }
 
     if (save(self, obj, 0) < 0 ||
-        _Pickler_Write(self, &stop_op, 1) < 0)
+        _Pickler_Write(self, &stop_op, 1) < 0 ||
+        _Pickler_CommitFrame(self) < 0) {
+        self->framing = 0;
         return -1;
-
+    }
+    self->framing = 0;
     return 0;
 }
 
@@ -3403,6 +4216,7 @@ Pickler_dealloc(PicklerObject *self)
     Py_XDECREF(self->dispatch_table);
     Py_XDECREF(self->arg);
     Py_XDECREF(self->fast_memo);
+    Py_XDECREF(self->buffer_callback);
 
     PyMemoTable_Del(self->memo);
 
@@ -3417,6 +4231,7 @@ Pickler_traverse(PicklerObject *self, visitproc visit, void *arg)
     Py_VISIT(self->dispatch_table);
     Py_VISIT(self->arg);
     Py_VISIT(self->fast_memo);
+    Py_VISIT(self->buffer_callback);
     return 0;
 }
 
@@ -3429,6 +4244,7 @@ Pickler_clear(PicklerObject *self)
     Py_CLEAR(self->dispatch_table);
     Py_CLEAR(self->arg);
     Py_CLEAR(self->fast_memo);
+    Py_CLEAR(self->buffer_callback);
 
     if (self->memo != NULL) {
         PyMemoTable *memo = self->memo;
@@ -3440,12 +4256,12 @@ Pickler_clear(PicklerObject *self)
 
 
 PyDoc_STRVAR(Pickler_doc,
-"Pickler(file, protocol=None)"
+"Pickler(file, protocol=None, *, fix_imports=True, buffer_callback=None)"
 "\n"
 "This takes a binary file for writing a pickle data stream.\n"
 "\n"
 "The optional protocol argument tells the pickler to use the\n"
-"given protocol; supported protocols are 0, 1, 2, 3.  The default\n"
+"given protocol; supported protocols are 0 to 5.  The default\n"
 "protocol is 3; a backward-incompatible protocol designed for\n"
 "Python 3.0.\n"
 "\n"
@@ -3461,20 +4277,28 @@ PyDoc_STRVAR(Pickler_doc,
 "\n"
 "If fix_imports is True and protocol is less than 3, pickle will try to\n"
 "map the new Python 3.x names to the old module names used in Python\n"
-"2.x, so that the pickle data stream is readable with Python 2.x.\n");
+"2.x, so that the pickle data stream is readable with Python 2.x.\n"
+"\n"
+"If buffer_callback is not None, it is called with each PickleBuffer\n"
+"object met while pickling.  If it returns a false value, the buffer\n"
+"is left out of the pickle stream (out-of-band); otherwise it is\n"
+"serialized in-band.  buffer_callback requires protocol 5 or higher.\n");
 
 static int
 Pickler_init(PicklerObject *self, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"file", "protocol", "fix_imports", 0};
+    static char *kwlist[] = {"file", "protocol", "fix_imports",
+                             "buffer_callback", 0};
     PyObject *file;
     PyObject *proto_obj = NULL;
     PyObject *fix_imports = Py_True;
+    PyObject *buffer_callback = NULL;
     _Py_IDENTIFIER(persistent_id);
     _Py_IDENTIFIER(dispatch_table);
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:Pickler",
-                                     kwlist, &file, &proto_obj, &fix_imports))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|OOO:Pickler",
+                                     kwlist, &file, &proto_obj, &fix_imports,
+                                     &buffer_callback))
         return -1;
 
     /* In case of multiple __init__() calls, clear previous content. */
@@ -3484,6 +4308,9 @@ Pickler_init(PicklerObject *self, PyObject *args, PyObject *kwds)
     if (_Pickler_SetProtocol(self, proto_obj, fix_imports) < 0)
         return -1;
 
+    if (_Pickler_SetBufferCallback(self, buffer_callback) < 0)
+        return -1;
+
     if (_Pickler_SetOutputStream(self, file) < 0)
         return -1;
 
@@ -3954,17 +4781,26 @@ load_bool(UnpicklerObject *self, PyObject *boolean)
  * as a C Py_ssize_t, or -1 if it's higher than PY_SSIZE_T_MAX.
  */
 static Py_ssize_t
-calc_binsize(char *bytes, int size)
+calc_binsize(char *bytes, int nbytes)
 {
     unsigned char *s = (unsigned char *)bytes;
+    int i;
     size_t x = 0;
 
-    assert(size == 4);
+    assert(nbytes == 4 || nbytes == 8);
 
-    x =  (size_t) s[0];
-    x |= (size_t) s[1] << 8;
-    x |= (size_t) s[2] << 16;
-    x |= (size_t) s[3] << 24;
+    if (nbytes > (int)sizeof(size_t)) {
+        /* The 64-bit sizes of BINBYTES8, BINUNICODE8 and FRAME can't be
+           represented on 32-bit platforms. */
+        for (i = (int)sizeof(size_t); i < nbytes; i++) {
+            if (s[i])
+                return -1;
+        }
+        nbytes = (int)sizeof(size_t);
+    }
+    for (i = 0; i < nbytes; i++) {
+        x |= (size_t) s[i] << (8 * i);
+    }
 
     if (x > PY_SSIZE_T_MAX)
         return -1;
@@ -4213,16 +5049,16 @@ load_string(UnpicklerObject *self)
 }
 
 static int
-load_binbytes(UnpicklerObject *self)
+load_counted_binbytes(UnpicklerObject *self, int nbytes)
 {
     PyObject *bytes;
     Py_ssize_t x;
     char *s;
 
-    if (_Unpickler_Read(self, &s, 4) < 0)
+    if (_Unpickler_Read(self, &s, nbytes) < 0)
         return -1;
 
-    x = calc_binsize(s, 4);
+    x = calc_binsize(s, nbytes);
     if (x < 0) {
         PyErr_Format(PyExc_OverflowError,
                      "BINBYTES exceeds system's maximum size of %zd bytes",
@@ -4241,6 +5077,86 @@ load_binbytes(UnpicklerObject *self)
     return 0;
 }
 
+static int
+load_bytearray8(UnpicklerObject *self)
+{
+    PyObject *bytearray;
+    Py_ssize_t size;
+    char *s;
+
+    if (_Unpickler_Read(self, &s, 8) < 0)
+        return -1;
+
+    size = calc_binsize(s, 8);
+    if (size < 0) {
+        PyErr_Format(PyExc_OverflowError,
+                     "BYTEARRAY8 exceeds system's maximum size of %zd bytes",
+                     PY_SSIZE_T_MAX);
+        return -1;
+    }
+
+    if (_Unpickler_Read(self, &s, size) < 0)
+        return -1;
+    bytearray = PyByteArray_FromStringAndSize(s, size);
+    if (bytearray == NULL)
+        return -1;
+
+    PDATA_PUSH(self->stack, bytearray, -1);
+    return 0;
+}
+
+static int
+load_next_buffer(UnpicklerObject *self)
+{
+    PyObject *buf;
+
+    if (self->buffers == NULL) {
+        PyErr_SetString(UnpicklingError,
+                        "pickle stream refers to out-of-band data "
+                        "but no *buffers* argument was given");
+        return -1;
+    }
+    buf = PyIter_Next(self->buffers);
+    if (buf == NULL) {
+        if (!PyErr_Occurred()) {
+            PyErr_SetString(UnpicklingError,
+                            "not enough out-of-band buffers");
+        }
+        return -1;
+    }
+
+    PDATA_PUSH(self->stack, buf, -1);
+    return 0;
+}
+
+static int
+load_readonly_buffer(UnpicklerObject *self)
+{
+    Py_ssize_t len = Py_SIZE(self->stack);
+    PyObject *obj, *view;
+
+    if (len <= 0) {
+        return stack_underflow();
+    }
+
+    obj = self->stack->data[len - 1];
+    view = PyMemoryView_FromObject(obj);
+    if (view == NULL) {
+        return -1;
+    }
+    if (!PyMemoryView_GET_BUFFER(view)->readonly) {
+        /* Original object is writable */
+        PyMemoryView_GET_BUFFER(view)->readonly = 1;
+        self->stack->data[len - 1] = view;
+        Py_DECREF(obj);
+    }
+    else {
+        /* Original object is read-only, no need to replace it */
+        Py_DECREF(view);
+    }
+    return 0;
+}
+
 static int
 load_short_binbytes(UnpicklerObject *self)
 {
@@ -4338,16 +5254,39 @@ load_unicode(UnpicklerObject *self)
 }
 
 static int
-load_binunicode(UnpicklerObject *self)
+load_short_binunicode(UnpicklerObject *self)
 {
     PyObject *str;
     Py_ssize_t size;
     char *s;
 
-    if (_Unpickler_Read(self, &s, 4) < 0)
+    if (_Unpickler_Read(self, &s, 1) < 0)
+        return -1;
+
+    size = (unsigned char)s[0];
+
+    if (_Unpickler_Read(self, &s, size) < 0)
+        return -1;
+
+    str = PyUnicode_DecodeUTF8(s, size, "surrogatepass");
+    if (str == NULL)
+        return -1;
+
+    PDATA_PUSH(self->stack, str, -1);
+    return 0;
+}
+
+static int
+load_counted_binunicode(UnpicklerObject *self, int nbytes)
+{
+    PyObject *str;
+    Py_ssize_t size;
+    char *s;
+
+    if (_Unpickler_Read(self, &s, nbytes) < 0)
         return -1;
 
-    size = calc_binsize(s, 4);
+    size = calc_binsize(s, nbytes);
     if (size < 0) {
         PyErr_Format(PyExc_OverflowError,
                      "BINUNICODE exceeds system's maximum size of %zd bytes",
@@ -4427,6 +5366,40 @@ load_empty_dict(UnpicklerObject *self)
     return 0;
 }
 
+static int
+load_empty_set(UnpicklerObject *self)
+{
+    PyObject *set;
+
+    if ((set = PySet_New(NULL)) == NULL)
+        return -1;
+    PDATA_PUSH(self->stack, set, -1);
+    return 0;
+}
+
+static int
+load_frozenset(UnpicklerObject *self)
+{
+    PyObject *items;
+    PyObject *frozenset;
+    Py_ssize_t i;
+
+    if ((i = marker(self)) < 0)
+        return -1;
+
+    items = Pdata_poptuple(self->stack, i);
+    if (items == NULL)
+        return -1;
+
+    frozenset = PyFrozenSet_New(items);
+    Py_DECREF(items);
+    if (frozenset == NULL)
+        return -1;
+
+    PDATA_PUSH(self->stack, frozenset, -1);
+    return 0;
+}
+
 static int
 load_list(UnpicklerObject *self)
 {
@@ -4619,6 +5592,68 @@ load_newobj(UnpicklerObject *self)
     return -1;
 }
 
+static int
+load_newobj_ex(UnpicklerObject *self)
+{
+    PyObject *cls, *args, *kwargs;
+    PyObject *obj;
+
+    PDATA_POP(self->stack, kwargs);
+    if (kwargs == NULL) {
+        return -1;
+    }
+    PDATA_POP(self->stack, args);
+    if (args == NULL) {
+        Py_DECREF(kwargs);
+        return -1;
+    }
+    PDATA_POP(self->stack, cls);
+    if (cls == NULL) {
+        Py_DECREF(kwargs);
+        Py_DECREF(args);
+        return -1;
+    }
+
+    if (!PyType_Check(cls)) {
+        PyErr_Format(UnpicklingError,
+                     "NEWOBJ_EX class argument must be a type, not %.200s",
+                     Py_TYPE(cls)->tp_name);
+        goto error;
+    }
+    if (((PyTypeObject *)cls)->tp_new == NULL) {
+        PyErr_SetString(UnpicklingError,
+                        "NEWOBJ_EX class argument doesn't have __new__");
+        goto error;
+    }
+    if (!PyTuple_Check(args)) {
+        PyErr_Format(UnpicklingError,
+                     "NEWOBJ_EX args argument must be a tuple, not %.200s",
+                     Py_TYPE(args)->tp_name);
+        goto error;
+    }
+    if (!PyDict_Check(kwargs)) {
+        PyErr_Format(UnpicklingError,
+                     "NEWOBJ_EX kwargs argument must be a dict, not %.200s",
+                     Py_TYPE(kwargs)->tp_name);
+        goto error;
+    }
+
+    obj = ((PyTypeObject *)cls)->tp_new((PyTypeObject *)cls, args, kwargs);
+    Py_DECREF(kwargs);
+    Py_DECREF(args);
+    Py_DECREF(cls);
+    if (obj == NULL)
+        return -1;
+    PDATA_PUSH(self->stack, obj, -1);
+    return 0;
+
+  error:
+    Py_DECREF(kwargs);
+    Py_DECREF(args);
+    Py_DECREF(cls);
+    return -1;
+}
+
 static int
 load_global(UnpicklerObject *self)
 {
@@ -4655,6 +5690,37 @@ load_global(UnpicklerObject *self)
     return 0;
 }
 
+static int
+load_stack_global(UnpicklerObject *self)
+{
+    PyObject *global;
+    PyObject *module_name;
+    PyObject *global_name;
+
+    PDATA_POP(self->stack, global_name);
+    if (global_name == NULL)
+        return -1;
+    PDATA_POP(self->stack, module_name);
+    if (module_name == NULL) {
+        Py_DECREF(global_name);
+        return -1;
+    }
+    if (!PyUnicode_CheckExact(module_name) ||
+        !PyUnicode_CheckExact(global_name)) {
+        PyErr_SetString(UnpicklingError, "STACK_GLOBAL requires str");
+        Py_DECREF(global_name);
+        Py_DECREF(module_name);
+        return -1;
+    }
+    global = find_class(self, module_name, global_name);
+    Py_DECREF(global_name);
+    Py_DECREF(module_name);
+    if (global == NULL)
+        return -1;
+    PDATA_PUSH(self->stack, global, -1);
+    return 0;
+}
+
 static int
 load_persid(UnpicklerObject *self)
 {
@@ -4996,6 +6062,18 @@ load_long_binput(UnpicklerObject *self)
     return _Unpickler_MemoPut(self, idx, value);
 }
 
+static int
+load_memoize(UnpicklerObject *self)
+{
+    PyObject *value;
+
+    if (Py_SIZE(self->stack) <= 0)
+        return stack_underflow();
+    value = self->stack->data[Py_SIZE(self->stack) - 1];
+
+    return _Unpickler_MemoPut(self, self->memo_len, value);
+}
+
 static int
 do_append(UnpicklerObject *self, Py_ssize_t x)
 {
@@ -5109,6 +6187,61 @@ load_setitems(UnpicklerObject *self)
     return do_setitems(self, marker(self));
 }
 
+static int
+load_additems(UnpicklerObject *self)
+{
+    PyObject *set;
+    Py_ssize_t mark, len, i;
+
+    mark =  marker(self);
+    len = Py_SIZE(self->stack);
+    if (mark > len || mark <= 0)
+        return stack_underflow();
+    if (len == mark)  /* nothing to do */
+        return 0;
+
+    set = self->stack->data[mark - 1];
+
+    if (PySet_Check(set)) {
+        PyObject *items;
+        int status;
+
+        items = Pdata_poptuple(self->stack, mark);
+        if (items == NULL)
+            return -1;
+
+        status = _PySet_Update(set, items);
+        Py_DECREF(items);
+        return status;
+    }
+    else {
+        PyObject *add_func;
+        _Py_IDENTIFIER(add);
+
+        add_func = _PyObject_GetAttrId(set, &PyId_add);
+        if (add_func == NULL)
+            return -1;
+        for (i = mark; i < len; i++) {
+            PyObject *result;
+            PyObject *item;
+
+            item = self->stack->data[i];
+            result = _Unpickler_FastCall(self, add_func, item);
+            if (result == NULL) {
+                Pdata_clear(self->stack, i + 1);
+                Py_SIZE(self->stack) = mark;
+                Py_DECREF(add_func);
+                return -1;
+            }
+            Py_DECREF(result);
+        }
+        Py_SIZE(self->stack) = mark;
+        Py_DECREF(add_func);
+    }
+
+    return 0;
+}
+
 static int
 load_build(UnpicklerObject *self)
 {
@@ -5310,6 +6443,33 @@ load_proto(UnpicklerObject *self)
     return -1;
 }
 
+static int
+load_frame(UnpicklerObject *self)
+{
+    char *s;
+    Py_ssize_t frame_len;
+
+    if (_Unpickler_Read(self, &s, 8) < 0)
+        return -1;
+
+    frame_len = calc_binsize(s, 8);
+    if (frame_len < 0) {
+        PyErr_Format(PyExc_OverflowError,
+                     "FRAME length exceeds system's maximum of %zd bytes",
+                     PY_SSIZE_T_MAX);
+        return -1;
+    }
+
+    /* Pull the whole frame into the input buffer with a single read, then
+       rewind to its start: the opcodes of the frame are then served from
+       memory. */
+    if (_Unpickler_Read(self, &s, frame_len) < 0)
+        return -1;
+
+    self->next_read_idx -= frame_len;
+    return 0;
+}
+
 static PyObject *
 load(UnpicklerObject *self)
 {
@@ -5343,13 +6503,19 @@ load(UnpicklerObject *self)
         OP_ARG(LONG4, load_counted_long, 4)
         OP(FLOAT, load_float)
         OP(BINFLOAT, load_binfloat)
-        OP(BINBYTES, load_binbytes)
+        OP_ARG(BINBYTES, load_counted_binbytes, 4)
+        OP_ARG(BINBYTES8, load_counted_binbytes, 8)
         OP(SHORT_BINBYTES, load_short_binbytes)
+        OP(BYTEARRAY8, load_bytearray8)
+        OP(NEXT_BUFFER, load_next_buffer)
+        OP(READONLY_BUFFER, load_readonly_buffer)
         OP(BINSTRING, load_binstring)
         OP(SHORT_BINSTRING, load_short_binstring)
         OP(STRING, load_string)
         OP(UNICODE, load_unicode)
-        OP(BINUNICODE, load_binunicode)
+        OP_ARG(BINUNICODE, load_counted_binunicode, 4)
+        OP_ARG(BINUNICODE8, load_counted_binunicode, 8)
+        OP(SHORT_BINUNICODE, load_short_binunicode)
         OP_ARG(EMPTY_TUPLE, load_counted_tuple, 0)
         OP_ARG(TUPLE1, load_counted_tuple, 1)
         OP_ARG(TUPLE2, load_counted_tuple, 2)
@@ -5359,10 +6525,15 @@ load(UnpicklerObject *self)
         OP(LIST, load_list)
         OP(EMPTY_DICT, load_empty_dict)
         OP(DICT, load_dict)
+        OP(EMPTY_SET, load_empty_set)
+        OP(ADDITEMS, load_additems)
+        OP(FROZENSET, load_frozenset)
         OP(OBJ, load_obj)
         OP(INST, load_inst)
         OP(NEWOBJ, load_newobj)
+        OP(NEWOBJ_EX, load_newobj_ex)
         OP(GLOBAL, load_global)
+        OP(STACK_GLOBAL, load_stack_global)
         OP(APPEND, load_append)
         OP(APPENDS, load_appends)
         OP(BUILD, load_build)
@@ -5374,6 +6545,7 @@ load(UnpicklerObject *self)
         OP(BINPUT, load_binput)
         OP(LONG_BINPUT, load_long_binput)
         OP(PUT, load_put)
+        OP(MEMOIZE, load_memoize)
         OP(POP, load_pop)
         OP(POP_MARK, load_pop_mark)
         OP(SETITEM, load_setitem)
@@ -5382,6 +6554,7 @@ load(UnpicklerObject *self)
         OP(BINPERSID, load_binpersid)
         OP(REDUCE, load_reduce)
         OP(PROTO, load_proto)
+        OP(FRAME, load_frame)
         OP_ARG(EXT1, load_extension, 1)
         OP_ARG(EXT2, load_extension, 2)
         OP_ARG(EXT4, load_extension, 4)
@@ -5532,11 +6705,11 @@ Unpickler_find_class(UnpicklerObject *self, PyObject *args)
         module = PyImport_Import(module_name);
         if (module == NULL)
             return NULL;
-        global = PyObject_GetAttr(module, global_name);
+        global = getattribute(module, global_name, self->proto >= 4);
         Py_DECREF(module);
     }
     else {
-        global = PyObject_GetAttr(module, global_name);
+        global = getattribute(module, global_name, self->proto >= 4);
     }
     return global;
 }
@@ -5559,6 +6732,7 @@ Unpickler_dealloc(UnpicklerObject *self)
     Py_XDECREF(self->stack);
     Py_XDECREF(self->pers_func);
     Py_XDECREF(self->arg);
+    Py_XDECREF(self->buffers);
     if (self->buffer.buf != NULL) {
         PyBuffer_Release(&self->buffer);
         self->buffer.buf = NULL;
@@ -5582,6 +6756,7 @@ Unpickler_traverse(UnpicklerObject *self, visitproc visit, void *arg)
     Py_VISIT(self->stack);
     Py_VISIT(self->pers_func);
     Py_VISIT(self->arg);
+    Py_VISIT(self->buffers);
     return 0;
 }
 
@@ -5594,6 +6769,7 @@ Unpickler_clear(UnpicklerObject *self)
     Py_CLEAR(self->stack);
     Py_CLEAR(self->pers_func);
     Py_CLEAR(self->arg);
+    Py_CLEAR(self->buffers);
     if (self->buffer.buf != NULL) {
         PyBuffer_Release(&self->buffer);
         self->buffer.buf = NULL;
@@ -5613,7 +6789,7 @@ Unpickler_clear(UnpicklerObject *self)
 }
 
 PyDoc_STRVAR(Unpickler_doc,
-"Unpickler(file, *, encoding='ASCII', errors='strict')"
+"Unpickler(file, *, encoding='ASCII', errors='strict', buffers=None)"
 "\n"
 "This takes a binary file for reading a pickle data stream.\n"
 "\n"
@@ -5633,14 +6809,20 @@ PyDoc_STRVAR(Unpickler_doc,
 "map the old Python 2.x names to the new names used in Python 3.x.  The\n"
 "*encoding* and *errors* tell pickle how to decode 8-bit string\n"
 "instances pickled by Python 2.x; these default to 'ASCII' and\n"
-"'strict', respectively.\n");
+"'strict', respectively.\n"
+"\n"
+"If *buffers* is not None, it is an iterable of buffer-enabled objects\n"
+"consumed, in order, each time the pickle stream references an\n"
+"out-of-band buffer.\n");
 
 static int
 Unpickler_init(UnpicklerObject *self, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"file", "fix_imports", "encoding", "errors", 0};
+    static char *kwlist[] = {"file", "fix_imports", "encoding", "errors",
+                             "buffers", 0};
     PyObject *file;
     PyObject *fix_imports = Py_True;
+    PyObject *buffers = NULL;
     char *encoding = NULL;
     char *errors = NULL;
     _Py_IDENTIFIER(persistent_load);
@@ -5660,8 +6842,9 @@ Unpickler_init(UnpicklerObject *self, PyObject *args, PyObject *kwds)
        extra careful in the other Unpickler methods, since a subclass could
        forget to call Unpickler.__init__() thus breaking our internal
        invariants. */
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|Oss:Unpickler", kwlist,
-                                     &file, &fix_imports, &encoding, &errors))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|OssO:Unpickler", kwlist,
+                                     &file, &fix_imports, &encoding, &errors,
+                                     &buffers))
         return -1;
 
     /* In case of multiple __init__() calls, clear previous content. */
@@ -5674,6 +6857,9 @@ Unpickler_init(UnpicklerObject *self, PyObject *args, PyObject *kwds)
     if (_Unpickler_SetInputEncoding(self, encoding, errors) < 0)
         return -1;
 
+    if (_Unpickler_SetBuffers(self, buffers) < 0)
+        return -1;
+
     self->fix_imports = PyObject_IsTrue(fix_imports);
     if (self->fix_imports == -1)
         return -1;
@@ -5693,6 +6879,7 @@ Unpickler_init(UnpicklerObject *self, PyObject *args, PyObject *kwds)
         return -1;
 
     self->memo_size = 32;
+    self->memo_len = 0;
     self->memo = _Unpickler_NewMemo(self->memo_size);
     if (self->memo == NULL)
         return -1;
@@ -5943,6 +7130,10 @@ Unpickler_set_memo(UnpicklerObject *self, PyObject *obj)
     _Unpickler_MemoCleanup(self);
     self->memo_size = new_memo_size;
     self->memo = new_memo;
+    for (i = 0; i < new_memo_size; i++) {
+        if (new_memo[i] != NULL)
+            self->memo_len++;
+    }
 
     return 0;
 
@@ -6043,14 +7234,15 @@ static PyTypeObject Unpickler_Type = {
 };
 
 PyDoc_STRVAR(pickle_dump_doc,
-"dump(obj, file, protocol=None, *, fix_imports=True) -> None\n"
+"dump(obj, file, protocol=None, *, fix_imports=True, buffer_callback=None)\n"
+"    -> None\n"
 "\n"
 "Write a pickled representation of obj to the open file object file.  This\n"
 "is equivalent to ``Pickler(file, protocol).dump(obj)``, but may be more\n"
 "efficient.\n"
 "\n"
 "The optional protocol argument tells the pickler to use the given protocol;\n"
-"supported protocols are 0, 1, 2, 3.  The default protocol is 3; a\n"
+"supported protocols are 0 to 5.  The default protocol is 3; a\n"
 "backward-incompatible protocol designed for Python 3.0.\n"
 "\n"
 "Specifying a negative protocol version selects the highest protocol version\n"
@@ -6063,16 +7255,21 @@ PyDoc_STRVAR(pickle_dump_doc,
 "\n"
 "If fix_imports is True and protocol is less than 3, pickle will try to\n"
 "map the new Python 3.x names to the old module names used in Python 2.x,\n"
-"so that the pickle data stream is readable with Python 2.x.\n");
+"so that the pickle data stream is readable with Python 2.x.\n"
+"\n"
+"If buffer_callback is not None, it is passed each PickleBuffer met while\n"
+"pickling, as with the Pickler class.\n");
 
 static PyObject *
 pickle_dump(PyObject *self, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"obj", "file", "protocol", "fix_imports", 0};
+    static char *kwlist[] = {"obj", "file", "protocol", "fix_imports",
+                             "buffer_callback", 0};
     PyObject *obj;
     PyObject *file;
     PyObject *proto = NULL;
     PyObject *fix_imports = Py_True;
+    PyObject *buffer_callback = NULL;
     PicklerObject *pickler;
 
     /* fix_imports is a keyword-only argument.  */
@@ -6083,8 +7280,9 @@ pickle_dump(PyObject *self, PyObject *args, PyObject *kwds)
         return NULL;
     }
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:dump", kwlist,
-                                     &obj, &file, &proto, &fix_imports))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO|OOO:dump", kwlist,
+                                     &obj, &file, &proto, &fix_imports,
+                                     &buffer_callback))
         return NULL;
 
     pickler = _Pickler_New();
@@ -6094,6 +7292,9 @@ pickle_dump(PyObject *self, PyObject *args, PyObject *kwds)
     if (_Pickler_SetProtocol(pickler, proto, fix_imports) < 0)
         goto error;
 
+    if (_Pickler_SetBufferCallback(pickler, buffer_callback) < 0)
+        goto error;
+
     if (_Pickler_SetOutputStream(pickler, file) < 0)
         goto error;
 
@@ -6112,13 +7313,14 @@ pickle_dump(PyObject *self, PyObject *args, PyObject *kwds)
 }
 
 PyDoc_STRVAR(pickle_dumps_doc,
-"dumps(obj, protocol=None, *, fix_imports=True) -> bytes\n"
+"dumps(obj, protocol=None, *, fix_imports=True, buffer_callback=None)\n"
+"    -> bytes\n"
 "\n"
 "Return the pickled representation of the object as a bytes\n"
 "object, instead of writing it to a file.\n"
 "\n"
 "The optional protocol argument tells the pickler to use the given protocol;\n"
-"supported protocols are 0, 1, 2, 3.  The default protocol is 3; a\n"
+"supported protocols are 0 to 5.  The default protocol is 3; a\n"
 "backward-incompatible protocol designed for Python 3.0.\n"
 "\n"
 "Specifying a negative protocol version selects the highest protocol version\n"
@@ -6127,16 +7329,21 @@ PyDoc_STRVAR(pickle_dumps_doc,
 "\n"
 "If fix_imports is True and *protocol* is less than 3, pickle will try to\n"
 "map the new Python 3.x names to the old module names used in Python 2.x,\n"
-"so that the pickle data stream is readable with Python 2.x.\n");
+"so that the pickle data stream is readable with Python 2.x.\n"
+"\n"
+"If buffer_callback is not None, it is passed each PickleBuffer met while\n"
+"pickling, as with the Pickler class.\n");
 
 static PyObject *
 pickle_dumps(PyObject *self, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"obj", "protocol", "fix_imports", 0};
+    static char *kwlist[] = {"obj", "protocol", "fix_imports",
+                             "buffer_callback", 0};
     PyObject *obj;
     PyObject *proto = NULL;
     PyObject *result;
     PyObject *fix_imports = Py_True;
+    PyObject *buffer_callback = NULL;
     PicklerObject *pickler;
 
     /* fix_imports is a keyword-only argument.  */
@@ -6147,8 +7354,9 @@ pickle_dumps(PyObject *self, PyObject *args, PyObject *kwds)
         return NULL;
     }
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:dumps", kwlist,
-                                     &obj, &proto, &fix_imports))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|OOO:dumps", kwlist,
+                                     &obj, &proto, &fix_imports,
+                                     &buffer_callback))
         return NULL;
 
     pickler = _Pickler_New();
@@ -6158,6 +7366,9 @@ pickle_dumps(PyObject *self, PyObject *args, PyObject *kwds)
     if (_Pickler_SetProtocol(pickler, proto, fix_imports) < 0)
         goto error;
 
+    if (_Pickler_SetBufferCallback(pickler, buffer_callback) < 0)
+        goto error;
+
     if (dump(pickler, obj) < 0)
         goto error;
 
@@ -6171,7 +7382,8 @@ pickle_dumps(PyObject *self, PyObject *args, PyObject *kwds)
 }
 
 PyDoc_STRVAR(pickle_load_doc,
-"load(file, *, fix_imports=True, encoding='ASCII', errors='strict') -> object\n"
+"load(file, *, fix_imports=True, encoding='ASCII', errors='strict',\n"
+"     buffers=None) -> object\n"
 "\n"
 "Read a pickled object representation from the open file object file and\n"
 "return the reconstituted object hierarchy specified therein.  This is\n"
@@ -6192,14 +7404,19 @@ PyDoc_STRVAR(pickle_load_doc,
 "by Python 2.x.  If fix_imports is True, pickle will try to map the old\n"
 "Python 2.x names to the new names used in Python 3.x.  The encoding and\n"
 "errors tell pickle how to decode 8-bit string instances pickled by Python\n"
-"2.x; these default to 'ASCII' and 'strict', respectively.\n");
+"2.x; these default to 'ASCII' and 'strict', respectively.\n"
+"\n"
+"If buffers is not None, it is an iterable of the out-of-band buffers the\n"
+"pickle stream refers to, as with the Unpickler class.\n");
 
 static PyObject *
 pickle_load(PyObject *self, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"file", "fix_imports", "encoding", "errors", 0};
+    static char *kwlist[] = {"file", "fix_imports", "encoding", "errors",
+                             "buffers", 0};
     PyObject *file;
     PyObject *fix_imports = Py_True;
+    PyObject *buffers = NULL;
     PyObject *result;
     char *encoding = NULL;
     char *errors = NULL;
@@ -6213,8 +7430,9 @@ pickle_load(PyObject *self, PyObject *args, PyObject *kwds)
         return NULL;
     }
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|Oss:load", kwlist,
-                                     &file, &fix_imports, &encoding, &errors))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|OssO:load", kwlist,
+                                     &file, &fix_imports, &encoding, &errors,
+                                     &buffers))
         return NULL;
 
     unpickler = _Unpickler_New();
@@ -6227,6 +7445,9 @@ pickle_load(PyObject *self, PyObject *args, PyObject *kwds)
     if (_Unpickler_SetInputEncoding(unpickler, encoding, errors) < 0)
         goto error;
 
+    if (_Unpickler_SetBuffers(unpickler, buffers) < 0)
+        goto error;
+
     unpickler->fix_imports = PyObject_IsTrue(fix_imports);
     if (unpickler->fix_imports == -1)
         goto error;
@@ -6241,7 +7462,8 @@ pickle_load(PyObject *self, PyObject *args, PyObject *kwds)
 }
 
 PyDoc_STRVAR(pickle_loads_doc,
-"loads(input, *, fix_imports=True, encoding='ASCII', errors='strict') -> object\n"
+"loads(input, *, fix_imports=True, encoding='ASCII', errors='strict',\n"
+"      buffers=None) -> object\n"
 "\n"
 "Read a pickled object hierarchy from a bytes object and return the\n"
 "reconstituted object hierarchy specified therein\n"
@@ -6255,14 +7477,19 @@ PyDoc_STRVAR(pickle_loads_doc,
 "by Python 2.x.  If fix_imports is True, pickle will try to map the old\n"
 "Python 2.x names to the new names used in Python 3.x.  The encoding and\n"
 "errors tell pickle how to decode 8-bit string instances pickled by Python\n"
-"2.x; these default to 'ASCII' and 'strict', respectively.\n");
+"2.x; these default to 'ASCII' and 'strict', respectively.\n"
+"\n"
+"If buffers is not None, it is an iterable of the out-of-band buffers the\n"
+"pickle stream refers to, as with the Unpickler class.\n");
 
 static PyObject *
 pickle_loads(PyObject *self, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"input", "fix_imports", "encoding", "errors", 0};
+    static char *kwlist[] = {"input", "fix_imports", "encoding", "errors",
+                             "buffers", 0};
     PyObject *input;
     PyObject *fix_imports = Py_True;
+    PyObject *buffers = NULL;
     PyObject *result;
     char *encoding = NULL;
     char *errors = NULL;
@@ -6276,8 +7503,9 @@ pickle_loads(PyObject *self, PyObject *args, PyObject *kwds)
         return NULL;
     }
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|Oss:loads", kwlist,
-                                     &input, &fix_imports, &encoding, &errors))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|OssO:loads", kwlist,
+                                     &input, &fix_imports, &encoding, &errors,
+                                     &buffers))
         return NULL;
 
     unpickler = _Unpickler_New();
@@ -6290,6 +7518,9 @@ pickle_loads(PyObject *self, PyObject *args, PyObject *kwds)
     if (_Unpickler_SetInputEncoding(unpickler, encoding, errors) < 0)
         goto error;
 
+    if (_Unpickler_SetBuffers(unpickler, buffers) < 0)
+        goto error;
+
     unpickler->fix_imports = PyObject_IsTrue(fix_imports);
     if (unpickler->fix_imports == -1)
         goto error;
@@ -6443,6 +7674,8 @@ PyInit__pickle(void)
         return NULL;
     if (PyType_Ready(&Pdata_Type) < 0)
         return NULL;
+    if (PyType_Ready(&PickleBuffer_Type) < 0)
+        return NULL;
     if (PyType_Ready(&PicklerMemoProxyType) < 0)
         return NULL;
     if (PyType_Ready(&UnpicklerMemoProxyType) < 0)
@@ -6459,6 +7692,10 @@ PyInit__pickle(void)
     Py_INCREF(&Unpickler_Type);
     if (PyModule_AddObject(m, "Unpickler", (PyObject *)&Unpickler_Type) < 0)
         return NULL;
+    Py_INCREF(&PickleBuffer_Type);
+    if (PyModule_AddObject(m, "PickleBuffer",
+                           (PyObject *)&PickleBuffer_Type) < 0)
+        return NULL;
 
     /* Initialize the exceptions. */
     PickleError = PyErr_NewException("_pickle.PickleError", NULL, NULL);
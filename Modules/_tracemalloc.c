@@ -0,0 +1,914 @@
+/* Trace memory blocks allocated by Python.
+
+   The allocators installed with PyMem_SetAllocator() on top of the current
+   allocators of the PYMEM_DOMAIN_MEM and PYMEM_DOMAIN_OBJ domains record
+   each memory block allocated by PyMem_Malloc() and PyObject_Malloc() in a
+   hash table, with
+   its size and the traceback where it was allocated.  Tracebacks are
+   interned: memory blocks allocated at the same place share the same
+   traceback.  The tables are allocated with the system allocator so that
+   tracing does not trace itself. */
+
+#include "Python.h"
+#include "frameobject.h"
+
+/* Maximum number of frames stored in a traceback */
+#define MAX_NFRAME 100
+
+/* Initial number of buckets of a hash table, must be a power of 2 */
+#define TABLE_MIN_SIZE 16
+
+/* Resize a hash table when it contains more than TABLE_HIGH entries per
+   bucket */
+#define TABLE_HIGH 2
+
+typedef struct entry_s {
+    struct entry_s *next;
+    Py_uhash_t hash;
+} entry_t;
+
+typedef int (*entry_compare_func)(entry_t *entry, const void *key);
+
+typedef struct {
+    size_t nbuckets;
+    size_t nentries;
+    entry_t **buckets;
+    entry_compare_func compare;
+} table_t;
+
+typedef struct {
+    /* filename of the code, NULL if the frame has no Unicode filename */
+    PyObject *filename;
+    int lineno;
+} frame_t;
+
+typedef struct {
+    entry_t entry;
+    int nframe;
+    frame_t frames[1];
+} traceback_t;
+
+#define TRACEBACK_SIZE(NFRAME) \
+        (sizeof(traceback_t) + sizeof(frame_t) * (NFRAME - 1))
+
+typedef struct {
+    entry_t entry;
+    void *ptr;
+    size_t size;
+    traceback_t *traceback;
+} trace_t;
+
+static struct {
+    /* Is tracemalloc tracing memory allocations? */
+    int tracing;
+    /* Maximum number of frames stored in a traceback */
+    int max_nframe;
+    /* Set while the module updates its tables to ignore the memory blocks
+       allocated or released meanwhile */
+    int reentrant;
+} tracemalloc_config = {0, 1, 0};
+
+/* memory block address => trace_t */
+static table_t tracemalloc_traces;
+
+/* interned tracebacks: traceback_t */
+static table_t tracemalloc_tracebacks;
+
+/* Buffer used to collect the frames of the current traceback */
+static traceback_t *tracemalloc_traceback = NULL;
+
+/* Total size of the traced memory blocks, and its peak */
+static size_t tracemalloc_traced_memory = 0;
+static size_t tracemalloc_peak_traced_memory = 0;
+
+/* Size of the memory allocated to store the traces and the tracebacks */
+static size_t tracemalloc_memory = 0;
+
+
+/* Hash tables */
+
+static int
+table_init(table_t *table, entry_compare_func compare)
+{
+    size_t size = TABLE_MIN_SIZE * sizeof(entry_t *);
+
+    table->buckets = (entry_t **)malloc(size);
+    if (table->buckets == NULL)
+        return -1;
+    memset(table->buckets, 0, size);
+    table->nbuckets = TABLE_MIN_SIZE;
+    table->nentries = 0;
+    table->compare = compare;
+    tracemalloc_memory += size;
+    return 0;
+}
+
+static entry_t *
+table_get(table_t *table, Py_uhash_t hash, const void *key)
+{
+    entry_t *entry;
+
+    entry = table->buckets[hash & (table->nbuckets - 1)];
+    for (; entry != NULL; entry = entry->next) {
+        if (entry->hash == hash && table->compare(entry, key))
+            return entry;
+    }
+    return NULL;
+}
+
+static void
+table_resize(table_t *table)
+{
+    size_t nbuckets, size, i;
+    entry_t **buckets, *entry, *next;
+
+    nbuckets = table->nbuckets * 2;
+    size = nbuckets * sizeof(entry_t *);
+    buckets = (entry_t **)malloc(size);
+    if (buckets == NULL) {
+        /* keep the current buckets, the table is only slower */
+        return;
+    }
+    memset(buckets, 0, size);
+
+    for (i = 0; i < table->nbuckets; i++) {
+        for (entry = table->buckets[i]; entry != NULL; entry = next) {
+            size_t index = entry->hash & (nbuckets - 1);
+            next = entry->next;
+            entry->next = buckets[index];
+            buckets[index] = entry;
+        }
+    }
+
+    free(table->buckets);
+    tracemalloc_memory -= table->nbuckets * sizeof(entry_t *);
+    tracemalloc_memory += size;
+    table->buckets = buckets;
+    table->nbuckets = nbuckets;
+}
+
+static void
+table_add(table_t *table, entry_t *entry, Py_uhash_t hash)
+{
+    size_t index = hash & (table->nbuckets - 1);
+
+    entry->hash = hash;
+    entry->next = table->buckets[index];
+    table->buckets[index] = entry;
+    table->nentries++;
+
+    if (table->nentries > table->nbuckets * TABLE_HIGH)
+        table_resize(table);
+}
+
+/* Remove the entry matching key from the table and return it, or return NULL
+   if the table has no such entry. */
+static entry_t *
+table_pop(table_t *table, Py_uhash_t hash, const void *key)
+{
+    entry_t **link, *entry;
+
+    link = &table->buckets[hash & (table->nbuckets - 1)];
+    for (entry = *link; entry != NULL; entry = *link) {
+        if (entry->hash == hash && table->compare(entry, key)) {
+            *link = entry->next;
+            table->nentries--;
+            return entry;
+        }
+        link = &entry->next;
+    }
+    return NULL;
+}
+
+/* Remove all entries of the table and call free_entry() on each of them.  The
+   buckets are shrunk to their initial size. */
+static void
+table_clear(table_t *table, void (*free_entry)(entry_t *))
+{
+    size_t i;
+    entry_t *entry, *next;
+
+    for (i = 0; i < table->nbuckets; i++) {
+        for (entry = table->buckets[i]; entry != NULL; entry = next) {
+            next = entry->next;
+            free_entry(entry);
+        }
+        table->buckets[i] = NULL;
+    }
+    table->nentries = 0;
+
+    if (table->nbuckets > TABLE_MIN_SIZE) {
+        entry_t **buckets;
+        size_t size = TABLE_MIN_SIZE * sizeof(entry_t *);
+
+        buckets = (entry_t **)realloc(table->buckets, size);
+        if (buckets != NULL) {
+            tracemalloc_memory -= table->nbuckets * sizeof(entry_t *);
+            tracemalloc_memory += size;
+            table->buckets = buckets;
+            table->nbuckets = TABLE_MIN_SIZE;
+        }
+    }
+}
+
+static void
+table_fini(table_t *table)
+{
+    free(table->buckets);
+    tracemalloc_memory -= table->nbuckets * sizeof(entry_t *);
+    table->buckets = NULL;
+    table->nbuckets = 0;
+}
+
+
+/* Traces and tracebacks */
+
+static Py_uhash_t
+hash_ptr(const void *ptr)
+{
+    /* memory blocks are aligned on 8 bytes: ignore the lower bits */
+    size_t y = (size_t)ptr;
+    y = (y >> 3) | (y << (8 * SIZEOF_VOID_P - 3));
+    return (Py_uhash_t)y;
+}
+
+static int
+trace_compare(entry_t *entry, const void *key)
+{
+    return ((trace_t *)entry)->ptr == key;
+}
+
+static Py_uhash_t
+traceback_hash(traceback_t *traceback)
+{
+    Py_uhash_t x = 0x345678;
+    int i;
+
+    for (i = 0; i < traceback->nframe; i++) {
+        frame_t *frame = &traceback->frames[i];
+        x = (x ^ hash_ptr(frame->filename)) * 1000003;
+        x = (x ^ (Py_uhash_t)frame->lineno) * 1000003;
+    }
+    x ^= (Py_uhash_t)traceback->nframe;
+    return x;
+}
+
+static int
+traceback_compare(entry_t *entry, const void *key)
+{
+    traceback_t *traceback1 = (traceback_t *)entry;
+    const traceback_t *traceback2 = (const traceback_t *)key;
+    int i;
+
+    if (traceback1->nframe != traceback2->nframe)
+        return 0;
+    for (i = 0; i < traceback1->nframe; i++) {
+        const frame_t *frame1 = &traceback1->frames[i];
+        const frame_t *frame2 = &traceback2->frames[i];
+        if (frame1->filename != frame2->filename
+            || frame1->lineno != frame2->lineno)
+            return 0;
+    }
+    return 1;
+}
+
+static void
+traceback_free(entry_t *entry)
+{
+    traceback_t *traceback = (traceback_t *)entry;
+    int i;
+
+    for (i = 0; i < traceback->nframe; i++)
+        Py_XDECREF(traceback->frames[i].filename);
+    tracemalloc_memory -= TRACEBACK_SIZE(traceback->nframe);
+    free(traceback);
+}
+
+static void
+trace_free(entry_t *entry)
+{
+    tracemalloc_memory -= sizeof(trace_t);
+    free(entry);
+}
+
+/* Get the traceback of the current thread, interned in the table of
+   tracebacks.  The caller must hold the GIL.  Return NULL on memory
+   allocation failure. */
+static traceback_t *
+traceback_get(void)
+{
+    PyThreadState *tstate;
+    PyFrameObject *pyframe;
+    traceback_t *traceback = tracemalloc_traceback;
+    Py_uhash_t hash;
+    entry_t *entry;
+    size_t size;
+    int i;
+
+    traceback->nframe = 0;
+    tstate = (PyThreadState*)_Py_atomic_load_relaxed(&_PyThreadState_Current);
+    for (pyframe = tstate->frame; pyframe != NULL; pyframe = pyframe->f_back) {
+        frame_t *frame = &traceback->frames[traceback->nframe];
+        PyObject *filename = pyframe->f_code->co_filename;
+
+        frame->filename = (filename != NULL && PyUnicode_Check(filename)) ?
+                          filename : NULL;
+        frame->lineno = PyFrame_GetLineNumber(pyframe);
+        traceback->nframe++;
+        if (traceback->nframe == tracemalloc_config.max_nframe)
+            break;
+    }
+    if (traceback->nframe == 0) {
+        /* memory allocated by C code without Python frame */
+        traceback->frames[0].filename = NULL;
+        traceback->frames[0].lineno = 0;
+        traceback->nframe = 1;
+    }
+
+    hash = traceback_hash(traceback);
+    entry = table_get(&tracemalloc_tracebacks, hash, traceback);
+    if (entry != NULL)
+        return (traceback_t *)entry;
+
+    size = TRACEBACK_SIZE(traceback->nframe);
+    traceback = (traceback_t *)malloc(size);
+    if (traceback == NULL)
+        return NULL;
+    memcpy(traceback, tracemalloc_traceback, size);
+    for (i = 0; i < traceback->nframe; i++)
+        Py_XINCREF(traceback->frames[i].filename);
+    tracemalloc_memory += size;
+    table_add(&tracemalloc_tracebacks, &traceback->entry, hash);
+    return traceback;
+}
+
+static void
+tracemalloc_remove_trace(void *ptr)
+{
+    trace_t *trace;
+
+    trace = (trace_t *)table_pop(&tracemalloc_traces, hash_ptr(ptr), ptr);
+    if (trace == NULL)
+        return;
+    tracemalloc_traced_memory -= trace->size;
+    trace_free(&trace->entry);
+}
+
+static void
+tracemalloc_add_trace(void *ptr, size_t size)
+{
+    traceback_t *traceback;
+    trace_t *trace;
+    Py_uhash_t hash;
+
+    traceback = traceback_get();
+    if (traceback == NULL)
+        return;
+
+    hash = hash_ptr(ptr);
+    trace = (trace_t *)table_get(&tracemalloc_traces, hash, ptr);
+    if (trace != NULL) {
+        /* The block was released without the GIL held: replace its stale
+           trace */
+        tracemalloc_traced_memory -= trace->size;
+    }
+    else {
+        trace = (trace_t *)malloc(sizeof(trace_t));
+        if (trace == NULL)
+            return;
+        trace->ptr = ptr;
+        tracemalloc_memory += sizeof(trace_t);
+        table_add(&tracemalloc_traces, &trace->entry, hash);
+    }
+    trace->size = size;
+    trace->traceback = traceback;
+
+    tracemalloc_traced_memory += size;
+    if (tracemalloc_traced_memory > tracemalloc_peak_traced_memory)
+        tracemalloc_peak_traced_memory = tracemalloc_traced_memory;
+}
+
+
+/* Hooks on the memory allocators */
+
+/* The tables are protected by the GIL: ignore memory blocks allocated or
+   released by threads not holding it, like PyOS_Readline(). */
+static int
+tracemalloc_can_trace(void)
+{
+    PyThreadState *tstate;
+
+    if (tracemalloc_config.reentrant)
+        return 0;
+    tstate = (PyThreadState*)_Py_atomic_load_relaxed(&_PyThreadState_Current);
+    if (tstate == NULL)
+        return 0;
+#ifdef WITH_THREAD
+    if (tstate != PyGILState_GetThisThreadState())
+        return 0;
+#endif
+    return 1;
+}
+
+/* The allocators wrapped by the tracemalloc allocators */
+static struct {
+    PyMemAllocator mem;
+    PyMemAllocator obj;
+} allocators;
+
+static void*
+tracemalloc_malloc(void *ctx, size_t size)
+{
+    PyMemAllocator *alloc = (PyMemAllocator *)ctx;
+    void *ptr;
+
+    ptr = alloc->malloc(alloc->ctx, size);
+    if (ptr != NULL && tracemalloc_can_trace()) {
+        tracemalloc_config.reentrant = 1;
+        tracemalloc_add_trace(ptr, size);
+        tracemalloc_config.reentrant = 0;
+    }
+    return ptr;
+}
+
+static void*
+tracemalloc_realloc(void *ctx, void *ptr, size_t new_size)
+{
+    PyMemAllocator *alloc = (PyMemAllocator *)ctx;
+    void *ptr2;
+
+    ptr2 = alloc->realloc(alloc->ctx, ptr, new_size);
+    if (ptr2 != NULL && tracemalloc_can_trace()) {
+        tracemalloc_config.reentrant = 1;
+        if (ptr != NULL)
+            tracemalloc_remove_trace(ptr);
+        tracemalloc_add_trace(ptr2, new_size);
+        tracemalloc_config.reentrant = 0;
+    }
+    return ptr2;
+}
+
+static void
+tracemalloc_free(void *ctx, void *ptr)
+{
+    PyMemAllocator *alloc = (PyMemAllocator *)ctx;
+
+    if (ptr != NULL && tracemalloc_can_trace()) {
+        tracemalloc_config.reentrant = 1;
+        tracemalloc_remove_trace(ptr);
+        tracemalloc_config.reentrant = 0;
+    }
+    alloc->free(alloc->ctx, ptr);
+}
+
+
+/* Start, stop */
+
+static void
+tracemalloc_clear_traces(void)
+{
+    /* releasing a filename can release memory */
+    tracemalloc_config.reentrant = 1;
+    table_clear(&tracemalloc_traces, trace_free);
+    table_clear(&tracemalloc_tracebacks, traceback_free);
+    tracemalloc_config.reentrant = 0;
+
+    tracemalloc_traced_memory = 0;
+    tracemalloc_peak_traced_memory = 0;
+}
+
+static int
+tracemalloc_set_max_nframe(int nframe)
+{
+    traceback_t *traceback;
+    size_t size;
+
+    if (nframe < 1 || nframe > MAX_NFRAME) {
+        PyErr_Format(PyExc_ValueError,
+                     "the number of frames must be in range [1; %i]",
+                     MAX_NFRAME);
+        return -1;
+    }
+
+    size = TRACEBACK_SIZE(nframe);
+    traceback = (traceback_t *)realloc(tracemalloc_traceback, size);
+    if (traceback == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    if (tracemalloc_traceback != NULL)
+        tracemalloc_memory -= TRACEBACK_SIZE(tracemalloc_config.max_nframe);
+    tracemalloc_memory += size;
+    tracemalloc_traceback = traceback;
+    tracemalloc_config.max_nframe = nframe;
+    return 0;
+}
+
+static int
+tracemalloc_start(int nframe)
+{
+    PyMemAllocator alloc;
+
+    if (tracemalloc_set_max_nframe(nframe) < 0)
+        return -1;
+    if (tracemalloc_config.tracing)
+        return 0;
+
+    if (table_init(&tracemalloc_traces, trace_compare) < 0) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    if (table_init(&tracemalloc_tracebacks, traceback_compare) < 0) {
+        table_fini(&tracemalloc_traces);
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    alloc.malloc = tracemalloc_malloc;
+    alloc.realloc = tracemalloc_realloc;
+    alloc.free = tracemalloc_free;
+
+    alloc.ctx = &allocators.mem;
+    PyMem_GetAllocator(PYMEM_DOMAIN_MEM, &allocators.mem);
+    PyMem_SetAllocator(PYMEM_DOMAIN_MEM, &alloc);
+
+    alloc.ctx = &allocators.obj;
+    PyMem_GetAllocator(PYMEM_DOMAIN_OBJ, &allocators.obj);
+    PyMem_SetAllocator(PYMEM_DOMAIN_OBJ, &alloc);
+
+    tracemalloc_config.tracing = 1;
+    return 0;
+}
+
+static void
+tracemalloc_stop(void)
+{
+    if (!tracemalloc_config.tracing)
+        return;
+
+    /* unregister the hook on memory allocators */
+    PyMem_SetAllocator(PYMEM_DOMAIN_MEM, &allocators.mem);
+    PyMem_SetAllocator(PYMEM_DOMAIN_OBJ, &allocators.obj);
+    tracemalloc_config.tracing = 0;
+
+    tracemalloc_clear_traces();
+    table_fini(&tracemalloc_traces);
+    table_fini(&tracemalloc_tracebacks);
+}
+
+
+/* Python functions */
+
+PyDoc_STRVAR(tracemalloc_start_doc,
+"start(nframe: int=1)\n"
+"\n"
+"Start tracing Python memory allocations, storing at most nframe frames\n"
+"in the traceback of each memory block.");
+
+static PyObject *
+py_tracemalloc_start(PyObject *self, PyObject *args)
+{
+    int nframe = 1;
+
+    if (!PyArg_ParseTuple(args, "|i:start", &nframe))
+        return NULL;
+    if (tracemalloc_start(nframe) < 0)
+        return NULL;
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(tracemalloc_stop_doc,
+"stop()\n"
+"\n"
+"Stop tracing Python memory allocations and clear the traces.");
+
+static PyObject *
+py_tracemalloc_stop(PyObject *self)
+{
+    tracemalloc_stop();
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(tracemalloc_is_tracing_doc,
+"is_tracing() -> bool\n"
+"\n"
+"True if the tracemalloc module is tracing Python memory allocations.");
+
+static PyObject *
+py_tracemalloc_is_tracing(PyObject *self)
+{
+    return PyBool_FromLong(tracemalloc_config.tracing);
+}
+
+PyDoc_STRVAR(tracemalloc_clear_traces_doc,
+"clear_traces()\n"
+"\n"
+"Clear the traces of the memory blocks allocated by Python.");
+
+static PyObject *
+py_tracemalloc_clear_traces(PyObject *self)
+{
+    if (tracemalloc_config.tracing)
+        tracemalloc_clear_traces();
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(tracemalloc_get_traceback_limit_doc,
+"get_traceback_limit() -> int\n"
+"\n"
+"Get the maximum number of frames stored in the traceback of a trace.");
+
+static PyObject *
+py_tracemalloc_get_traceback_limit(PyObject *self)
+{
+    return PyLong_FromLong(tracemalloc_config.max_nframe);
+}
+
+PyDoc_STRVAR(tracemalloc_get_traced_memory_doc,
+"get_traced_memory() -> (int, int)\n"
+"\n"
+"Get the current size and the peak size of the memory blocks traced\n"
+"by the tracemalloc module, as a tuple: (current: int, peak: int).");
+
+static PyObject *
+py_tracemalloc_get_traced_memory(PyObject *self)
+{
+    size_t size, peak_size;
+
+    if (tracemalloc_config.tracing) {
+        size = tracemalloc_traced_memory;
+        peak_size = tracemalloc_peak_traced_memory;
+    }
+    else {
+        size = 0;
+        peak_size = 0;
+    }
+    return Py_BuildValue("nn", (Py_ssize_t)size, (Py_ssize_t)peak_size);
+}
+
+PyDoc_STRVAR(tracemalloc_get_tracemalloc_memory_doc,
+"get_tracemalloc_memory() -> int\n"
+"\n"
+"Get the memory usage in bytes of the tracemalloc module used internally\n"
+"to trace memory allocations.");
+
+static PyObject *
+py_tracemalloc_get_tracemalloc_memory(PyObject *self)
+{
+    return PyLong_FromSize_t(tracemalloc_memory);
+}
+
+/* Convert a traceback to a tuple of (filename, lineno) tuples.  Conversions
+   are cached in the cache dictionary: traceback address => tuple. */
+static PyObject *
+traceback_to_pyobject(traceback_t *traceback, PyObject *cache)
+{
+    PyObject *key = NULL, *frames, *frame;
+    int i;
+
+    if (cache != NULL) {
+        key = PyLong_FromVoidPtr(traceback);
+        if (key == NULL)
+            return NULL;
+        frames = PyDict_GetItem(cache, key);
+        if (frames != NULL) {
+            Py_DECREF(key);
+            Py_INCREF(frames);
+            return frames;
+        }
+    }
+
+    frames = PyTuple_New(traceback->nframe);
+    if (frames == NULL)
+        goto error;
+    for (i = 0; i < traceback->nframe; i++) {
+        PyObject *filename = traceback->frames[i].filename;
+
+        if (filename != NULL)
+            frame = Py_BuildValue("(Oi)", filename,
+                                  traceback->frames[i].lineno);
+        else
+            frame = Py_BuildValue("(si)", "<unknown>",
+                                  traceback->frames[i].lineno);
+        if (frame == NULL)
+            goto error;
+        PyTuple_SET_ITEM(frames, i, frame);
+    }
+
+    if (cache != NULL) {
+        if (PyDict_SetItem(cache, key, frames) < 0)
+            goto error;
+        Py_DECREF(key);
+    }
+    return frames;
+
+error:
+    Py_XDECREF(key);
+    Py_XDECREF(frames);
+    return NULL;
+}
+
+PyDoc_STRVAR(tracemalloc_get_traces_doc,
+"_get_traces() -> list\n"
+"\n"
+"Get the traces of the memory blocks allocated by Python: list of\n"
+"(size: int, traceback: tuple) tuples, where traceback is a tuple of\n"
+"(filename: str, lineno: int) tuples, most recent frame first.\n"
+"\n"
+"Return an empty list if the tracemalloc module is not tracing.");
+
+static PyObject *
+py_tracemalloc_get_traces(PyObject *self)
+{
+    trace_t *copy = NULL;
+    size_t ncopy = 0, i;
+    PyObject *list = NULL, *cache = NULL;
+
+    if (tracemalloc_config.tracing && tracemalloc_traces.nentries != 0) {
+        /* Copy the traces first: the objects built below are traced and so
+           modify the table. */
+        entry_t *entry;
+
+        copy = (trace_t *)malloc(tracemalloc_traces.nentries
+                                 * sizeof(trace_t));
+        if (copy == NULL)
+            return PyErr_NoMemory();
+        for (i = 0; i < tracemalloc_traces.nbuckets; i++) {
+            entry = tracemalloc_traces.buckets[i];
+            for (; entry != NULL; entry = entry->next)
+                copy[ncopy++] = *(trace_t *)entry;
+        }
+    }
+
+    list = PyList_New(ncopy);
+    if (list == NULL)
+        goto error;
+    cache = PyDict_New();
+    if (cache == NULL)
+        goto error;
+
+    for (i = 0; i < ncopy; i++) {
+        PyObject *traceback, *item;
+
+        traceback = traceback_to_pyobject(copy[i].traceback, cache);
+        if (traceback == NULL)
+            goto error;
+        item = Py_BuildValue("(nN)", (Py_ssize_t)copy[i].size, traceback);
+        if (item == NULL)
+            goto error;
+        PyList_SET_ITEM(list, i, item);
+    }
+
+    free(copy);
+    Py_DECREF(cache);
+    return list;
+
+error:
+    free(copy);
+    Py_XDECREF(cache);
+    Py_XDECREF(list);
+    return NULL;
+}
+
+PyDoc_STRVAR(tracemalloc_get_object_traceback_doc,
+"_get_object_traceback(obj)\n"
+"\n"
+"Get the traceback where the Python object obj was allocated, as a tuple\n"
+"of (filename: str, lineno: int) tuples, most recent frame first.\n"
+"\n"
+"Return None if the tracemalloc module is not tracing memory allocations\n"
+"or did not trace the allocation of the object.");
+
+static PyObject *
+py_tracemalloc_get_object_traceback(PyObject *self, PyObject *obj)
+{
+    void *ptr;
+    trace_t *trace;
+
+    if (!tracemalloc_config.tracing)
+        Py_RETURN_NONE;
+
+    /* the memory block of a GC object starts with its GC header */
+    if (PyType_IS_GC(Py_TYPE(obj)))
+        ptr = (void *)((char *)obj - sizeof(PyGC_Head));
+    else
+        ptr = (void *)obj;
+
+    trace = (trace_t *)table_get(&tracemalloc_traces, hash_ptr(ptr), ptr);
+    if (trace == NULL)
+        Py_RETURN_NONE;
+    return traceback_to_pyobject(trace->traceback, NULL);
+}
+
+static PyMethodDef module_methods[] = {
+    {"start", (PyCFunction)py_tracemalloc_start,
+     METH_VARARGS, tracemalloc_start_doc},
+    {"stop", (PyCFunction)py_tracemalloc_stop,
+     METH_NOARGS, tracemalloc_stop_doc},
+    {"is_tracing", (PyCFunction)py_tracemalloc_is_tracing,
+     METH_NOARGS, tracemalloc_is_tracing_doc},
+    {"clear_traces", (PyCFunction)py_tracemalloc_clear_traces,
+     METH_NOARGS, tracemalloc_clear_traces_doc},
+    {"get_traceback_limit", (PyCFunction)py_tracemalloc_get_traceback_limit,
+     METH_NOARGS, tracemalloc_get_traceback_limit_doc},
+    {"get_traced_memory", (PyCFunction)py_tracemalloc_get_traced_memory,
+     METH_NOARGS, tracemalloc_get_traced_memory_doc},
+    {"get_tracemalloc_memory",
+     (PyCFunction)py_tracemalloc_get_tracemalloc_memory,
+     METH_NOARGS, tracemalloc_get_tracemalloc_memory_doc},
+    {"_get_traces", (PyCFunction)py_tracemalloc_get_traces,
+     METH_NOARGS, tracemalloc_get_traces_doc},
+    {"_get_object_traceback", (PyCFunction)py_tracemalloc_get_object_traceback,
+     METH_O, tracemalloc_get_object_traceback_doc},
+    {NULL, NULL}  /* sentinel */
+};
+
+PyDoc_STRVAR(module_doc,
+"Low-level functions of the tracemalloc module: trace memory blocks\n"
+"allocated by Python.");
+
+static struct PyModuleDef module_def = {
+    PyModuleDef_HEAD_INIT,
+    "_tracemalloc",
+    module_doc,
+    0, /* non-negative size to be able to unload the module */
+    module_methods,
+    NULL,
+};
+
+PyMODINIT_FUNC
+PyInit__tracemalloc(void)
+{
+    return PyModule_Create(&module_def);
+}
+
+/* Parse the number of frames of the PYTHONTRACEMALLOC environment variable
+   or of the -X tracemalloc=NFRAME option.  Return -1 if the value is
+   invalid. */
+static int
+parse_nframe(const char *str)
+{
+    char *endptr;
+    long value;
+
+    errno = 0;
+    value = strtol(str, &endptr, 10);
+    if (*endptr != '\0' || errno != 0 || value < 1 || value > MAX_NFRAME)
+        return -1;
+    return (int)value;
+}
+
+/* Start tracing memory allocations if the PYTHONTRACEMALLOC environment
+   variable is set to a number of frames, or if sys._xoptions has a
+   'tracemalloc' key. */
+
+int
+_PyTraceMalloc_Init(void)
+{
+    char *env;
+    int nframe;
+
+    env = Py_GETENV("PYTHONTRACEMALLOC");
+    if (env != NULL && *env != '\0') {
+        nframe = parse_nframe(env);
+        if (nframe < 0)
+            Py_FatalError("PYTHONTRACEMALLOC: invalid number of frames");
+    }
+    else {
+        PyObject *xoptions, *key, *value;
+
+        xoptions = PySys_GetXOptions();
+        if (xoptions == NULL)
+            return -1;
+
+        key = PyUnicode_FromString("tracemalloc");
+        if (key == NULL)
+            return -1;
+        value = PyDict_GetItem(xoptions, key);
+        Py_DECREF(key);
+        if (value == NULL)
+            return 0;
+
+        if (value == Py_True)
+            nframe = 1;
+        else {
+            char *str = PyUnicode_AsUTF8(value);
+            if (str == NULL)
+                return -1;
+            nframe = parse_nframe(str);
+            if (nframe < 0)
+                Py_FatalError("-X tracemalloc=NFRAME: invalid number "
+                              "of frames");
+        }
+    }
+
+    return tracemalloc_start(nframe);
+}
+
+void
+_PyTraceMalloc_Fini(void)
+{
+    tracemalloc_stop();
+    free(tracemalloc_traceback);
+    tracemalloc_traceback = NULL;
+}
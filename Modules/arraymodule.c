@@ -1844,10 +1844,57 @@ array_reconstructor(PyObject *self, PyObject *args)
         return NULL;
     }
     if (!PyBytes_Check(items)) {
-        PyErr_Format(PyExc_TypeError,
-            "fourth argument should be bytes, not %.200s",
-            Py_TYPE(items)->tp_name);
-        return NULL;
+        PyObject *new_args;
+
+        if (!PyObject_CheckBuffer(items)) {
+            PyErr_Format(PyExc_TypeError,
+                "fourth argument should be bytes or a buffer, not %.200s",
+                Py_TYPE(items)->tp_name);
+            return NULL;
+        }
+        /* Fast path for out-of-band buffers (pickle protocol 5): copy the
+         * memory straight into the new array without an intermediate bytes
+         * object.
+         */
+        if (mformat_code == typecode_to_mformat_code((char)typecode) ||
+            mformat_code == UNKNOWN_FORMAT) {
+            Py_buffer buffer;
+            PyObject *empty;
+
+            if (PyObject_GetBuffer(items, &buffer, PyBUF_SIMPLE) < 0)
+                return NULL;
+            if (buffer.len % descr->itemsize != 0) {
+                PyBuffer_Release(&buffer);
+                PyErr_SetString(PyExc_ValueError,
+                                "string length not a multiple of item size");
+                return NULL;
+            }
+            empty = PyList_New(0);
+            if (empty == NULL) {
+                PyBuffer_Release(&buffer);
+                return NULL;
+            }
+            result = make_array(arraytype, (char)typecode, empty);
+            Py_DECREF(empty);
+            if (result == NULL ||
+                array_resize((arrayobject *)result,
+                             buffer.len / descr->itemsize) == -1) {
+                Py_XDECREF(result);
+                PyBuffer_Release(&buffer);
+                return NULL;
+            }
+            memcpy(((arrayobject *)result)->ob_item, buffer.buf, buffer.len);
+            PyBuffer_Release(&buffer);
+            return result;
+        }
+        /* The slow path decodes from a bytes copy of the buffer. */
+        new_args = Py_BuildValue("OCiN", arraytype, typecode, mformat_code,
+                                 PyBytes_FromObject(items));
+        if (new_args == NULL)
+            return NULL;
+        result = array_reconstructor(self, new_args);
+        Py_DECREF(new_args);
+        return result;
     }
 
     /* Fast path: No decoding has to be done. */
@@ -2073,7 +2120,32 @@ array_reduce_ex(arrayobject *array, PyObject *value)
         return result;
     }
 
-    array_str = array_tobytes(array, NULL);
+    if (protocol >= 5) {
+        /* Expose the array's memory through a PickleBuffer so that the
+         * pickler can serialize it in-band without an intermediate bytes
+         * copy, or hand it over out-of-band to a buffer_callback.
+         */
+        static PyObject *PickleBuffer = NULL;
+        _Py_IDENTIFIER(PickleBuffer);
+
+        if (PickleBuffer == NULL) {
+            PyObject *pickle_module = PyImport_ImportModule("pickle");
+            if (pickle_module == NULL) {
+                Py_DECREF(dict);
+                return NULL;
+            }
+            PickleBuffer = _PyObject_GetAttrId(pickle_module,
+                                               &PyId_PickleBuffer);
+            Py_DECREF(pickle_module);
+            if (PickleBuffer == NULL) {
+                Py_DECREF(dict);
+                return NULL;
+            }
+        }
+        array_str = PyObject_CallFunctionObjArgs(PickleBuffer, array, NULL);
+    }
+    else
+        array_str = array_tobytes(array, NULL);
     if (array_str == NULL) {
         Py_DECREF(dict);
         return NULL;
@@ -92,7 +92,9 @@ static Py_ssize_t long_lived_pending = 0;
    In addition to the various configurable thresholds, we only trigger a
    full collection if the ratio
     long_lived_pending / long_lived_total
-   is above a given value (hardwired to 25%).
+   is above a given value (hardwired to 25%).  Full collections skipped
+   this way are counted in the "skipped" entry of gc.get_stats(), so that
+   the heuristic can be observed.
 
    The reason is that, while "non-full" collections (i.e., collections of
    the young and middle generations) will always examine roughly the same
@@ -176,6 +178,15 @@ struct gc_generation_stats {
     Py_ssize_t collected;
     /* total number of uncollectable objects (put into gc.garbage) */
     Py_ssize_t uncollectable;
+    /* total number of objects examined, i.e. tracked by this generation
+       and the younger ones when the collection started */
+    Py_ssize_t examined;
+    /* total and longest duration of the collections, in seconds */
+    double duration;
+    double max_duration;
+    /* number of collections not done because of the long-lived objects
+       heuristic (only for the oldest generation) */
+    Py_ssize_t skipped;
 };
 
 static struct gc_generation_stats generation_stats[NUM_GENERATIONS];
@@ -334,13 +345,15 @@ append_objects(PyObject *py_list, PyGC_Head *gc_list)
 
 /* Set all gc_refs = ob_refcnt.  After this, gc_refs is > 0 for all objects
  * in containers, and is GC_REACHABLE for all tracked gc objects not in
- * containers.
+ * containers.  Return the number of objects in containers.
  */
-static void
+static Py_ssize_t
 update_refs(PyGC_Head *containers)
 {
+    Py_ssize_t n = 0;
     PyGC_Head *gc = containers->gc.gc_next;
     for (; gc != containers; gc = gc->gc.gc_next) {
+        n++;
         assert(gc->gc.gc_refs == GC_REACHABLE);
         gc->gc.gc_refs = Py_REFCNT(FROM_GC(gc));
         /* Python's cyclic gc should never see an incoming refcount
@@ -363,6 +376,7 @@ update_refs(PyGC_Head *containers)
          */
         assert(gc->gc.gc_refs != 0);
     }
+    return n;
 }
 
 /* A traversal callback for subtract_refs. */
@@ -850,14 +864,27 @@ get_time(void)
     return result;
 }
 
+/* Return the current time in seconds.  Unlike get_time(), this doesn't call
+ * Python code, so it can be used to time every collection. */
+static double
+clock_seconds(void)
+{
+    _PyTime_timeval t;
+    _PyTime_gettimeofday(&t);
+    return (double)t.tv_sec + t.tv_usec * 1e-6;
+}
+
 /* This is the main function.  Read this to understand how the
  * collection process works. */
 static Py_ssize_t
-collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable)
+collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable,
+        Py_ssize_t *n_examined, double *duration)
 {
     int i;
     Py_ssize_t m = 0; /* # objects collected */
     Py_ssize_t n = 0; /* # unreachable objects that couldn't be collected */
+    Py_ssize_t examined; /* # objects in the generations being collected */
+    double start, elapsed;
     PyGC_Head *young; /* the generation we are examining */
     PyGC_Head *old; /* next older generation */
     PyGC_Head unreachable; /* non-problematic unreachable trash */
@@ -866,6 +893,8 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable)
     double t1 = 0.0;
     struct gc_generation_stats *stats = &generation_stats[generation];
 
+    start = clock_seconds();
+
     if (debug & DEBUG_STATS) {
         PySys_WriteStderr("gc: collecting generation %d...\n",
                           generation);
@@ -900,7 +929,7 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable)
      * refcount greater than 0 when all the references within the
      * set are taken into account).
      */
-    update_refs(young);
+    examined = update_refs(young);
     subtract_refs(young);
 
     /* Leave everything reachable from outside young in young, and move
@@ -1006,14 +1035,25 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable)
         Py_FatalError("unexpected exception during garbage collection");
     }
 
-    /* Update stats */
+    /* Update stats.  The system clock may go backward. */
+    elapsed = clock_seconds() - start;
+    if (elapsed < 0)
+        elapsed = 0;
     if (n_collected)
         *n_collected = m;
     if (n_uncollectable)
         *n_uncollectable = n;
+    if (n_examined)
+        *n_examined = examined;
+    if (duration)
+        *duration = elapsed;
     stats->collections++;
     stats->collected += m;
     stats->uncollectable += n;
+    stats->examined += examined;
+    stats->duration += elapsed;
+    if (elapsed > stats->max_duration)
+        stats->max_duration = elapsed;
     return n+m;
 }
 
@@ -1022,7 +1062,8 @@ collect(int generation, Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable)
  */
 static void
 invoke_gc_callback(const char *phase, int generation,
-                   Py_ssize_t collected, Py_ssize_t uncollectable)
+                   Py_ssize_t collected, Py_ssize_t uncollectable,
+                   Py_ssize_t examined, double duration)
 {
     Py_ssize_t i;
     PyObject *info = NULL;
@@ -1033,10 +1074,12 @@ invoke_gc_callback(const char *phase, int generation,
     /* The local variable cannot be rebound, check it for sanity */
     assert(callbacks != NULL && PyList_CheckExact(callbacks));
     if (PyList_GET_SIZE(callbacks) != 0) {
-        info = Py_BuildValue("{sisnsn}",
+        info = Py_BuildValue("{sisnsnsnsd}",
             "generation", generation,
             "collected", collected,
-            "uncollectable", uncollectable);
+            "uncollectable", uncollectable,
+            "examined", examined,
+            "duration", duration);
         if (info == NULL) {
             PyErr_WriteUnraisable(NULL);
             return;
@@ -1060,10 +1103,13 @@ invoke_gc_callback(const char *phase, int generation,
 static Py_ssize_t
 collect_with_callback(int generation)
 {
-    Py_ssize_t result, collected, uncollectable;
-    invoke_gc_callback("start", generation, 0, 0);
-    result = collect(generation, &collected, &uncollectable);
-    invoke_gc_callback("stop", generation, collected, uncollectable);
+    Py_ssize_t result, collected, uncollectable, examined;
+    double duration;
+    invoke_gc_callback("start", generation, 0, 0, 0, 0.0);
+    result = collect(generation, &collected, &uncollectable,
+                     &examined, &duration);
+    invoke_gc_callback("stop", generation, collected, uncollectable,
+                       examined, duration);
     return result;
 }
 
@@ -1083,8 +1129,10 @@ collect_generations(void)
                of this file, and issue #4074.
             */
             if (i == NUM_GENERATIONS - 1
-                && long_lived_pending < long_lived_total / 4)
+                && long_lived_pending < long_lived_total / 4) {
+                generation_stats[i].skipped++;
                 continue;
+            }
             n = collect_with_callback(i);
             break;
         }
@@ -1385,10 +1433,14 @@ gc_get_stats(PyObject *self, PyObject *noargs)
     for (i = 0; i < NUM_GENERATIONS; i++) {
         PyObject *dict;
         st = &stats[i];
-        dict = Py_BuildValue("{snsnsn}",
+        dict = Py_BuildValue("{snsnsnsnsdsdsn}",
                              "collections", st->collections,
                              "collected", st->collected,
-                             "uncollectable", st->uncollectable
+                             "uncollectable", st->uncollectable,
+                             "examined", st->examined,
+                             "duration", st->duration,
+                             "max_duration", st->max_duration,
+                             "skipped", st->skipped
                             );
         if (dict == NULL)
             goto error;
@@ -97,7 +97,8 @@ static char *usage_5 =
 "               The default module search path uses %s.\n"
 "PYTHONCASEOK : ignore case in 'import' statements (Windows).\n"
 "PYTHONIOENCODING: Encoding[:errors] used for stdin/stdout/stderr.\n"
-"PYTHONFAULTHANDLER: dump the Python traceback on fatal errors.\n\
+"PYTHONFAULTHANDLER: dump the Python traceback on fatal errors.\n"
+"PYTHONPROFILEIMPORTTIME: show how long each import takes.\n\
 ";
 static char *usage_6 = "\
 PYTHONHASHSEED: if this variable is set to 'random', a random value is used\n\
@@ -3,6 +3,9 @@
 #include "osdefs.h"
 #include "marshal.h"
 #include <time.h>
+#ifdef HAVE_MMAP
+#include <sys/mman.h>
+#endif
 
 
 #define IS_SOURCE   0x0
@@ -46,6 +49,24 @@ static PyObject *ZipImportError;
 /* read_directory() cache */
 static PyObject *zip_directory_cache = NULL;
 
+/* An archive mapped in memory, shared by read_directory() and get_data()
+   for all the zipimporters of the archive. */
+typedef struct {
+    const unsigned char *data;
+    Py_ssize_t size;
+#ifdef HAVE_MMAP
+    /* Identify the version of the archive which was mapped */
+    dev_t dev;
+    ino_t ino;
+    time_t mtime;
+#endif
+} zip_mapping;
+
+#define ZIP_MAPPING_CAPSULE "zipimport._mapping"
+
+/* get_mapping() cache: maps archive paths to capsules of zip_mapping */
+static PyObject *zip_mapping_cache = NULL;
+
 /* forward decls */
 static PyObject *read_directory(PyObject *archive);
 static PyObject *get_data(PyObject *archive, PyObject *toc_entry);
@@ -828,6 +849,118 @@ get_long(unsigned char *buf) {
     return x;
 }
 
+/* Given a buffer, return the unsigned short that is represented by the
+   first 2 bytes, encoded as little endian. */
+static unsigned int
+get_short(const unsigned char *buf) {
+    return buf[0] | (unsigned int)buf[1] << 8;
+}
+
+#ifdef HAVE_MMAP
+static void
+zip_mapping_destructor(PyObject *capsule)
+{
+    zip_mapping *mapping = PyCapsule_GetPointer(capsule, ZIP_MAPPING_CAPSULE);
+    munmap((void *)mapping->data, mapping->size);
+    PyMem_Free(mapping);
+}
+#endif
+
+/*
+   get_mapping(archive) -> capsule of a zip_mapping (new reference)
+
+   Map the archive in memory, or reuse the mapping made by a previous call
+   if the archive didn't change on disk since then: the archive is read
+   without opening it again, and members are decompressed straight from
+   the mapping.
+
+   Return NULL without an exception set if the archive can't be mapped;
+   the caller then reads it with stdio.  A mapping replaced in the cache
+   stays valid for the callers holding a reference to it.
+*/
+static PyObject *
+get_mapping(PyObject *archive)
+{
+#ifdef HAVE_MMAP
+    struct stat st;
+    PyObject *capsule;
+    zip_mapping *mapping;
+    FILE *fp;
+    void *data;
+
+    /* Stat the file which is mapped, not the path: the archive may be
+       replaced between a _Py_stat() and the open, and mapping past the end
+       of the new file would turn reads into SIGBUS instead of
+       ZipImportError. */
+    fp = _Py_fopen(archive, "rb");
+    if (fp == NULL)
+        return NULL;
+    if (fstat(fileno(fp), &st) != 0 || !S_ISREG(st.st_mode)
+        || st.st_size <= 0 || (PY_LONG_LONG)st.st_size > PY_SSIZE_T_MAX) {
+        fclose(fp);
+        return NULL;
+    }
+
+    if (zip_mapping_cache == NULL) {
+        zip_mapping_cache = PyDict_New();
+        if (zip_mapping_cache == NULL) {
+            fclose(fp);
+            return NULL;
+        }
+    }
+    capsule = PyDict_GetItem(zip_mapping_cache, archive);
+    if (capsule != NULL) {
+        mapping = PyCapsule_GetPointer(capsule, ZIP_MAPPING_CAPSULE);
+        if (mapping->size == st.st_size && mapping->dev == st.st_dev
+            && mapping->ino == st.st_ino && mapping->mtime == st.st_mtime) {
+            fclose(fp);
+            Py_INCREF(capsule);
+            return capsule;
+        }
+        if (PyDict_DelItem(zip_mapping_cache, archive) != 0) {
+            fclose(fp);
+            return NULL;
+        }
+    }
+
+    /* The mapping is MAP_SHARED: replacing the archive (a new inode) is
+       safe, but truncating it in place while it is mapped makes reads past
+       the new end fault.  A MAP_PRIVATE mapping would not help, pages not
+       yet touched are still read from the file. */
+    data = mmap(NULL, st.st_size, PROT_READ, MAP_SHARED, fileno(fp), 0);
+    fclose(fp);
+    if (data == MAP_FAILED)
+        return NULL;
+    mapping = PyMem_Malloc(sizeof(zip_mapping));
+    if (mapping == NULL) {
+        munmap(data, st.st_size);
+        PyErr_NoMemory();
+        return NULL;
+    }
+    mapping->data = data;
+    mapping->size = st.st_size;
+    mapping->dev = st.st_dev;
+    mapping->ino = st.st_ino;
+    mapping->mtime = st.st_mtime;
+    capsule = PyCapsule_New(mapping, ZIP_MAPPING_CAPSULE,
+                            zip_mapping_destructor);
+    if (capsule == NULL) {
+        munmap(data, st.st_size);
+        PyMem_Free(mapping);
+        return NULL;
+    }
+    if (PyDict_SetItem(zip_mapping_cache, archive, capsule) != 0) {
+        Py_DECREF(capsule);
+        return NULL;
+    }
+    if (Py_VerboseFlag)
+        PySys_FormatStderr("# zipimport: mapped %R\n", archive);
+    return capsule;
+#else
+    return NULL;
+#endif
+}
+
 /*
    read_directory(archive) -> files dict (new reference)
 
@@ -854,94 +987,120 @@ static PyObject *
 read_directory(PyObject *archive)
 {
     PyObject *files = NULL;
-    FILE *fp;
+    PyObject *capsule;
+    zip_mapping *mapping = NULL;
+    FILE *fp = NULL;
     unsigned short flags;
-    short compress, time, date, name_size;
+    short compress, time, date;
+    unsigned int name_size;
     long crc, data_size, file_size, header_size;
     Py_ssize_t file_offset, header_position, header_offset;
-    long l, count;
+    long count;
     Py_ssize_t i;
     char name[MAXPATHLEN + 5];
     PyObject *nameobj = NULL;
-    char *p, endof_central_dir[22];
+    char *p;
+    unsigned char endof_central_dir[22];
+    unsigned char *allocated = NULL;
+    const unsigned char *header, *end;  /* the central directory */
     Py_ssize_t arc_offset;  /* Absolute offset to start of the zip-archive. */
     PyObject *path;
     const char *charset;
     int bootstrap;
 
-    fp = _Py_fopen(archive, "rb");
-    if (fp == NULL) {
-        if (!PyErr_Occurred())
-            PyErr_Format(ZipImportError, "can't open Zip file: %R", archive);
-        return NULL;
-    }
-
-    if (fseek(fp, -22, SEEK_END) == -1) {
-        fclose(fp);
-        PyErr_Format(ZipImportError, "can't read Zip file: %R", archive);
-        return NULL;
+    capsule = get_mapping(archive);
+    if (capsule != NULL) {
+        mapping = PyCapsule_GetPointer(capsule, ZIP_MAPPING_CAPSULE);
+        if (mapping->size < 22) {
+            PyErr_Format(ZipImportError, "not a Zip file: %R", archive);
+            goto error;
+        }
+        header_position = mapping->size - 22;
+        memcpy(endof_central_dir, mapping->data + header_position, 22);
     }
-    header_position = ftell(fp);
-    if (fread(endof_central_dir, 1, 22, fp) != 22) {
-        fclose(fp);
-        PyErr_Format(ZipImportError, "can't read Zip file: %R", archive);
-        return NULL;
+    else {
+        if (PyErr_Occurred())
+            return NULL;
+        fp = _Py_fopen(archive, "rb");
+        if (fp == NULL) {
+            if (!PyErr_Occurred())
+                PyErr_Format(ZipImportError, "can't open Zip file: %R",
+                             archive);
+            return NULL;
+        }
+        if (fseek(fp, -22, SEEK_END) == -1)
+            goto read_error;
+        header_position = ftell(fp);
+        if (fread(endof_central_dir, 1, 22, fp) != 22)
+            goto read_error;
     }
-    if (get_long((unsigned char *)endof_central_dir) != 0x06054B50) {
+    if (get_long(endof_central_dir) != 0x06054B50) {
         /* Bad: End of Central Dir signature */
-        fclose(fp);
         PyErr_Format(ZipImportError, "not a Zip file: %R", archive);
-        return NULL;
+        goto error;
     }
 
-    header_size = get_long((unsigned char *)endof_central_dir + 12);
-    header_offset = get_long((unsigned char *)endof_central_dir + 16);
+    header_size = get_long(endof_central_dir + 12);
+    header_offset = get_long(endof_central_dir + 16);
     arc_offset = header_position - header_offset - header_size;
     header_offset += arc_offset;
+    if (header_size < 0 || header_offset < 0 || arc_offset < 0)
+        goto read_error;
+
+    /* Read the whole Central Directory at once */
+    if (mapping != NULL)
+        header = mapping->data + header_offset;
+    else {
+        allocated = PyMem_Malloc(header_size + 1);
+        if (allocated == NULL) {
+            PyErr_NoMemory();
+            goto error;
+        }
+        if (fseek(fp, header_offset, 0) == -1 ||
+            fread(allocated, 1, header_size, fp) != (size_t)header_size)
+            goto read_error;
+        fclose(fp);
+        fp = NULL;
+        header = allocated;
+    }
+    end = header + header_size;
 
     files = PyDict_New();
     if (files == NULL)
         goto error;
 
-    /* Start of Central Directory */
     count = 0;
-    for (;;) {
+    for (; end - header >= 46; header += header_size) {
         PyObject *t;
         int err;
 
-        if (fseek(fp, header_offset, 0) == -1)  /* Start of file header */
-            goto fseek_error;
-        l = PyMarshal_ReadLongFromFile(fp);
-        if (l != 0x02014B50)
+        if (get_long((unsigned char *)header) != 0x02014B50)
             break;              /* Bad: Central Dir File Header */
-        if (fseek(fp, header_offset + 8, 0) == -1)
-            goto fseek_error;
-        flags = (unsigned short)PyMarshal_ReadShortFromFile(fp);
-        compress = PyMarshal_ReadShortFromFile(fp);
-        time = PyMarshal_ReadShortFromFile(fp);
-        date = PyMarshal_ReadShortFromFile(fp);
-        crc = PyMarshal_ReadLongFromFile(fp);
-        data_size = PyMarshal_ReadLongFromFile(fp);
-        file_size = PyMarshal_ReadLongFromFile(fp);
-        name_size = PyMarshal_ReadShortFromFile(fp);
+        flags = (unsigned short)get_short(header + 8);
+        compress = (short)get_short(header + 10);
+        time = (short)get_short(header + 12);
+        date = (short)get_short(header + 14);
+        crc = get_long((unsigned char *)header + 16);
+        data_size = get_long((unsigned char *)header + 20);
+        file_size = get_long((unsigned char *)header + 24);
+        name_size = get_short(header + 28);
         header_size = 46 + name_size +
-           PyMarshal_ReadShortFromFile(fp) +
-           PyMarshal_ReadShortFromFile(fp);
-        if (fseek(fp, header_offset + 42, 0) == -1)
-            goto fseek_error;
-        file_offset = PyMarshal_ReadLongFromFile(fp) + arc_offset;
+           get_short(header + 30) +
+           get_short(header + 32);
+        file_offset = get_long((unsigned char *)header + 42) + arc_offset;
+        if (end - header < 46 + (Py_ssize_t)name_size)
+            break;              /* Truncated file name */
         if (name_size > MAXPATHLEN)
             name_size = MAXPATHLEN;
 
         p = name;
         for (i = 0; i < (Py_ssize_t)name_size; i++) {
-            *p = (char)getc(fp);
+            *p = (char)header[46 + i];
             if (*p == '/')
                 *p = SEP;
             p++;
         }
         *p = 0;         /* Add terminating null byte */
-        header_offset += header_size;
 
         bootstrap = 0;
         if (flags & 0x0800)
@@ -983,19 +1142,19 @@ read_directory(PyObject *archive)
             goto error;
         count++;
     }
-    fclose(fp);
+    Py_XDECREF(capsule);
+    PyMem_Free(allocated);
     if (Py_VerboseFlag)
         PySys_FormatStderr("# zipimport: found %ld names in %R\n",
                            count, archive);
     return files;
-fseek_error:
-    fclose(fp);
-    Py_XDECREF(files);
-    Py_XDECREF(nameobj);
+read_error:
     PyErr_Format(ZipImportError, "can't read Zip file: %R", archive);
-    return NULL;
 error:
-    fclose(fp);
+    if (fp != NULL)
+        fclose(fp);
+    Py_XDECREF(capsule);
+    PyMem_Free(allocated);
     Py_XDECREF(files);
     Py_XDECREF(nameobj);
     return NULL;
@@ -1039,7 +1198,9 @@ get_decompress_func(void)
 static PyObject *
 get_data(PyObject *archive, PyObject *toc_entry)
 {
-    PyObject *raw_data, *data = NULL, *decompress;
+    PyObject *raw_data, *data = NULL, *decompress, *capsule;
+    zip_mapping *mapping;
+    const unsigned char *local_header;
     char *buf;
     FILE *fp;
     int err;
@@ -1055,6 +1216,52 @@ get_data(PyObject *archive, PyObject *toc_entry)
         return NULL;
     }
 
+    capsule = get_mapping(archive);
+    if (capsule != NULL) {
+        mapping = PyCapsule_GetPointer(capsule, ZIP_MAPPING_CAPSULE);
+        if (file_offset < 0 || file_offset > mapping->size - 30) {
+            Py_DECREF(capsule);
+            PyErr_Format(ZipImportError, "can't read Zip file: %R", archive);
+            return NULL;
+        }
+        /* Check to make sure the local file header is correct */
+        local_header = mapping->data + file_offset;
+        if (get_long((unsigned char *)local_header) != 0x04034B50) {
+            /* Bad: Local File Header */
+            Py_DECREF(capsule);
+            PyErr_Format(ZipImportError,
+                         "bad local file header in %U",
+                         archive);
+            return NULL;
+        }
+        /* Start of file data */
+        file_offset += 30 + get_short(local_header + 26) +
+                       get_short(local_header + 28);
+        if (data_size < 0 || file_offset > mapping->size - data_size) {
+            Py_DECREF(capsule);
+            PyErr_SetString(PyExc_IOError,
+                            "zipimport: can't read data");
+            return NULL;
+        }
+        if (compress == 0) {  /* data is not compressed */
+            data = PyBytes_FromStringAndSize(
+                (const char *)mapping->data + file_offset, data_size);
+            Py_DECREF(capsule);
+            return data;
+        }
+        /* Decompressed straight from the mapping, which the capsule keeps
+           alive even if the archive is remapped meanwhile */
+        raw_data = PyMemoryView_FromMemory(
+            (char *)mapping->data + file_offset, data_size, PyBUF_READ);
+        if (raw_data == NULL) {
+            Py_DECREF(capsule);
+            return NULL;
+        }
+        goto decompress;
+    }
+    if (PyErr_Occurred())
+        return NULL;
+
     fp = _Py_fopen(archive, "rb");
     if (!fp) {
         if (!PyErr_Occurred())
@@ -1128,6 +1335,7 @@ get_data(PyObject *archive, PyObject *toc_entry)
         return data;
     }
 
+decompress:
     /* Decompress with zlib */
     decompress = get_decompress_func();
     if (decompress == NULL) {
@@ -1140,6 +1348,7 @@ get_data(PyObject *archive, PyObject *toc_entry)
     Py_DECREF(decompress);
 error:
     Py_DECREF(raw_data);
+    Py_XDECREF(capsule);
     return data;
 }
 
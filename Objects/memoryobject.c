@@ -2111,6 +2111,20 @@ memory_tobytes(PyMemoryViewObject *self, PyObject *dummy)
     return bytes;
 }
 
+static PyObject *
+memory_toreadonly(PyMemoryViewObject *self, PyObject *noargs)
+{
+    CHECK_RELEASED(self);
+    /* Even if self is already readonly, we still need to create a new
+     * object for .release() to work correctly.
+     */
+    self = (PyMemoryViewObject *) mbuf_add_view(self->mbuf, &self->view);
+    if (self != NULL) {
+        self->view.readonly = 1;
+    };
+    return (PyObject *) self;
+}
+
 static PyObject *
 memory_repr(PyMemoryViewObject *self)
 {
@@ -2927,6 +2941,10 @@ PyDoc_STRVAR(memory_tolist_doc,
 "M.tolist() -> list\n\
 \n\
 Return the data in the buffer as a list of elements.");
+PyDoc_STRVAR(memory_toreadonly_doc,
+"M.toreadonly() -> memoryview\n\
+\n\
+Return a readonly version of the memoryview.");
 PyDoc_STRVAR(memory_cast_doc,
 "M.cast(format[, shape]) -> memoryview\n\
 \n\
@@ -2936,6 +2954,7 @@ static PyMethodDef memory_methods[] = {
     {"release",     (PyCFunction)memory_release, METH_NOARGS, memory_release_doc},
     {"tobytes",     (PyCFunction)memory_tobytes, METH_NOARGS, memory_tobytes_doc},
     {"tolist",      (PyCFunction)memory_tolist, METH_NOARGS, memory_tolist_doc},
+    {"toreadonly",  (PyCFunction)memory_toreadonly, METH_NOARGS, memory_toreadonly_doc},
     {"cast",        (PyCFunction)memory_cast, METH_VARARGS|METH_KEYWORDS, memory_cast_doc},
     {"__enter__",   memory_enter, METH_NOARGS, NULL},
     {"__exit__",    memory_exit, METH_VARARGS, NULL},
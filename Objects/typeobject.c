@@ -3330,6 +3330,8 @@ static PyGetSetDef object_getsets[] = {
    - pickle protocols < 2
    - calculating the list of slot names (done only once per class)
    - the __newobj__ function (which is used as a token but never called)
+   - the __newobj_ex__ function, used when __getnewargs_ex__ returns
+     keyword arguments
 */
 
 static PyObject *
@@ -3389,32 +3391,77 @@ slotnames(PyObject *cls)
 static PyObject *
 reduce_2(PyObject *obj)
 {
-    PyObject *cls, *getnewargs;
-    PyObject *args = NULL, *args2 = NULL;
+    PyObject *cls, *getnewargs, *getnewargs_ex;
+    PyObject *args = NULL, *kwargs = NULL, *args2 = NULL;
     PyObject *getstate = NULL, *state = NULL, *names = NULL;
     PyObject *slots = NULL, *listitems = NULL, *dictitems = NULL;
     PyObject *copyreg = NULL, *newobj = NULL, *res = NULL;
     Py_ssize_t i, n;
     _Py_IDENTIFIER(__getnewargs__);
+    _Py_IDENTIFIER(__getnewargs_ex__);
     _Py_IDENTIFIER(__getstate__);
     _Py_IDENTIFIER(__newobj__);
+    _Py_IDENTIFIER(__newobj_ex__);
 
     cls = (PyObject *) Py_TYPE(obj);
 
-    getnewargs = _PyObject_GetAttrId(obj, &PyId___getnewargs__);
-    if (getnewargs != NULL) {
-        args = PyObject_CallObject(getnewargs, NULL);
-        Py_DECREF(getnewargs);
-        if (args != NULL && !PyTuple_Check(args)) {
+    getnewargs_ex = _PyObject_GetAttrId(obj, &PyId___getnewargs_ex__);
+    if (getnewargs_ex != NULL) {
+        PyObject *newargs = PyObject_CallObject(getnewargs_ex, NULL);
+        Py_DECREF(getnewargs_ex);
+        if (newargs == NULL)
+            goto end;
+        if (!PyTuple_Check(newargs)) {
+            PyErr_Format(PyExc_TypeError,
+                "__getnewargs_ex__ should return a tuple, "
+                "not '%.200s'", Py_TYPE(newargs)->tp_name);
+            Py_DECREF(newargs);
+            goto end;
+        }
+        if (PyTuple_GET_SIZE(newargs) != 2) {
+            PyErr_Format(PyExc_ValueError,
+                "__getnewargs_ex__ should return a tuple of "
+                "length 2, not %zd", PyTuple_GET_SIZE(newargs));
+            Py_DECREF(newargs);
+            goto end;
+        }
+        args = PyTuple_GET_ITEM(newargs, 0);
+        kwargs = PyTuple_GET_ITEM(newargs, 1);
+        Py_INCREF(args);
+        Py_INCREF(kwargs);
+        Py_DECREF(newargs);
+        if (!PyTuple_Check(args)) {
+            PyErr_Format(PyExc_TypeError,
+                "first item of the tuple returned by "
+                "__getnewargs_ex__ must be a tuple, not '%.200s'",
+                Py_TYPE(args)->tp_name);
+            goto end;
+        }
+        if (!PyDict_Check(kwargs)) {
             PyErr_Format(PyExc_TypeError,
-                "__getnewargs__ should return a tuple, "
-                "not '%.200s'", Py_TYPE(args)->tp_name);
+                "second item of the tuple returned by "
+                "__getnewargs_ex__ must be a dict, not '%.200s'",
+                Py_TYPE(kwargs)->tp_name);
             goto end;
         }
     }
     else {
         PyErr_Clear();
-        args = PyTuple_New(0);
+        getnewargs = _PyObject_GetAttrId(obj, &PyId___getnewargs__);
+        if (getnewargs != NULL) {
+            args = PyObject_CallObject(getnewargs, NULL);
+            Py_DECREF(getnewargs);
+            if (args != NULL && !PyTuple_Check(args)) {
+                PyErr_Format(PyExc_TypeError,
+                    "__getnewargs__ should return a tuple, "
+                    "not '%.200s'", Py_TYPE(args)->tp_name);
+                goto end;
+            }
+        }
+        else {
+            PyErr_Clear();
+            args = PyTuple_New(0);
+        }
     }
     if (args == NULL)
         goto end;
@@ -3498,26 +3545,40 @@ reduce_2(PyObject *obj)
     copyreg = import_copyreg();
     if (copyreg == NULL)
         goto end;
-    newobj = _PyObject_GetAttrId(copyreg, &PyId___newobj__);
-    if (newobj == NULL)
-        goto end;
 
-    n = PyTuple_GET_SIZE(args);
-    args2 = PyTuple_New(n+1);
-    if (args2 == NULL)
-        goto end;
-    Py_INCREF(cls);
-    PyTuple_SET_ITEM(args2, 0, cls);
-    for (i = 0; i < n; i++) {
-        PyObject *v = PyTuple_GET_ITEM(args, i);
-        Py_INCREF(v);
-        PyTuple_SET_ITEM(args2, i+1, v);
+    if (kwargs != NULL && PyDict_Size(kwargs) > 0) {
+        /* Protocol 4 pickles this with NEWOBJ_EX; older protocols and the
+           copy module simply call copyreg.__newobj_ex__. */
+        newobj = _PyObject_GetAttrId(copyreg, &PyId___newobj_ex__);
+        if (newobj == NULL)
+            goto end;
+        args2 = PyTuple_Pack(3, cls, args, kwargs);
+        if (args2 == NULL)
+            goto end;
+    }
+    else {
+        newobj = _PyObject_GetAttrId(copyreg, &PyId___newobj__);
+        if (newobj == NULL)
+            goto end;
+
+        n = PyTuple_GET_SIZE(args);
+        args2 = PyTuple_New(n+1);
+        if (args2 == NULL)
+            goto end;
+        Py_INCREF(cls);
+        PyTuple_SET_ITEM(args2, 0, cls);
+        for (i = 0; i < n; i++) {
+            PyObject *v = PyTuple_GET_ITEM(args, i);
+            Py_INCREF(v);
+            PyTuple_SET_ITEM(args2, i+1, v);
+        }
     }
 
     res = PyTuple_Pack(5, newobj, args2, state, listitems, dictitems);
 
   end:
     Py_XDECREF(args);
+    Py_XDECREF(kwargs);
     Py_XDECREF(args2);
     Py_XDECREF(slots);
     Py_XDECREF(state);
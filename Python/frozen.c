@@ -3,6 +3,10 @@
 
 #include "Python.h"
 #include "importlib.h"
+#ifdef Py_FROZEN_STARTUP
+/* The modules listed in FROZEN_STARTUP_MODULES by the Makefile */
+#include "frozen_startup.h"
+#endif
 
 /* In order to test the support for frozen modules, by default we
    define a single frozen module, __hello__.  Loading it will print
@@ -31,6 +35,10 @@ static unsigned char M___hello__[] = {
 static struct _frozen _PyImport_FrozenModules[] = {
     /* importlib */
     {"_frozen_importlib", _Py_M__importlib, (int)sizeof(_Py_M__importlib)},
+#ifdef Py_FROZEN_STARTUP
+    /* Startup modules */
+    _Py_FROZEN_STARTUP_MODULES
+#endif
     /* Test module */
     {"__hello__", M___hello__, SIZE},
     /* Test package (negative size indicates package-ness) */
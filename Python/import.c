@@ -1225,6 +1225,89 @@ done:
 }
 
 
+/* -X importtime and PYTHONPROFILEIMPORTTIME: report on stderr the time spent
+   in each import, as a tree of "self | cumulative | module" lines written as
+   the imports complete. -1 until the options have been looked up. */
+static int import_time = -1;
+static int import_time_level = 0;
+/* Cumulative time of the completed imports nested in the current one */
+static PY_LONG_LONG import_time_nested = 0;
+
+static PY_LONG_LONG
+import_time_now(void)
+{
+    _PyTime_timeval tv;
+    _PyTime_gettimeofday(&tv);
+    return (PY_LONG_LONG)tv.tv_sec * 1000000 + tv.tv_usec;
+}
+
+static int
+import_time_enabled(void)
+{
+    char *envvar;
+    PyObject *xoptions, *key;
+
+    if (import_time >= 0)
+        return import_time;
+    envvar = Py_GETENV("PYTHONPROFILEIMPORTTIME");
+    if (envvar != NULL && *envvar != '\0')
+        import_time = 1;
+    else {
+        import_time = 0;
+        xoptions = PySys_GetXOptions();
+        key = PyUnicode_FromString("importtime");
+        if (xoptions != NULL && key != NULL)
+            import_time = (PyDict_Contains(xoptions, key) > 0);
+        Py_XDECREF(key);
+        PyErr_Clear();
+    }
+    if (import_time)
+        fprintf(stderr,
+                "import time: self [us] | cumulative | imported package\n");
+    return import_time;
+}
+
+static PyObject *
+import_find_and_load(PyObject *abs_name, PyObject *builtins_import)
+{
+    _Py_IDENTIFIER(_find_and_load);
+    PyInterpreterState *interp = PyThreadState_GET()->interp;
+    PyObject *mod;
+    PY_LONG_LONG t1 = 0, cumulative, outer_nested = 0;
+    const char *name;
+
+    if (import_time_enabled()) {
+        outer_nested = import_time_nested;
+        import_time_nested = 0;
+        import_time_level++;
+        t1 = import_time_now();
+    }
+
+    /* _bootstrap._find_and_load() releases the import lock */
+    mod = _PyObject_CallMethodObjIdArgs(interp->importlib,
+                                        &PyId__find_and_load, abs_name,
+                                        builtins_import, NULL);
+
+    if (import_time) {
+        PyObject *exc, *val, *tb;
+
+        cumulative = import_time_now() - t1;
+        import_time_level--;
+        PyErr_Fetch(&exc, &val, &tb);
+        name = PyUnicode_AsUTF8(abs_name);
+        if (name == NULL) {
+            PyErr_Clear();
+            name = "?";
+        }
+        PyErr_Restore(exc, val, tb);
+        fprintf(stderr, "import time: %9ld | %10ld | %*s%s\n",
+                (long)(cumulative - import_time_nested), (long)cumulative,
+                import_time_level * 2, "", name);
+        import_time_nested = outer_nested + cumulative;
+    }
+    return mod;
+}
+
 PyObject *
 PyImport_ImportModuleLevelObject(PyObject *name, PyObject *given_globals,
                                  PyObject *locals, PyObject *given_fromlist,
@@ -1235,7 +1318,6 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *given_globals,
     _Py_IDENTIFIER(__package__);
     _Py_IDENTIFIER(__path__);
     _Py_IDENTIFIER(__name__);
-    _Py_IDENTIFIER(_find_and_load);
     _Py_IDENTIFIER(_handle_fromlist);
     _Py_IDENTIFIER(_lock_unlock_module);
     _Py_static_string(single_dot, ".");
@@ -1458,9 +1540,7 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *given_globals,
     }
     else {
         /* _bootstrap._find_and_load() releases the import lock */
-        mod = _PyObject_CallMethodObjIdArgs(interp->importlib,
-                                            &PyId__find_and_load, abs_name,
-                                            builtins_import, NULL);
+        mod = import_find_and_load(abs_name, builtins_import);
         if (mod == NULL) {
             goto error;
         }
@@ -1,8 +1,8 @@
 /* Auto-generated by Modules/_freeze_importlib.c */
 unsigned char _Py_M__importlib[] = {
     99,0,0,0,0,0,0,0,0,0,0,0,0,6,0,0,
-    0,64,0,0,0,115,200,3,0,0,100,0,0,90,0,0,
-    100,129,0,90,1,0,100,4,0,100,5,0,132,0,0,90,
+    0,64,0,0,0,115,236,3,0,0,100,0,0,90,0,0,
+    100,134,0,90,1,0,100,4,0,100,5,0,132,0,0,90,
     2,0,100,6,0,100,7,0,132,0,0,90,3,0,100,8,
     0,100,9,0,132,0,0,90,4,0,100,10,0,100,11,0,
     132,0,0,90,5,0,100,12,0,100,13,0,132,0,0,90,
@@ -47,486 +47,573 @@ unsigned char _Py_M__importlib[] = {
     0,90,53,0,71,100,92,0,100,93,0,132,0,0,100,93,
     0,131,2,0,90,54,0,71,100,94,0,100,95,0,132,0,
     0,100,95,0,131,2,0,90,55,0,71,100,96,0,100,97,
-    0,132,0,0,100,97,0,131,2,0,90,56,0,71,100,98,
-    0,100,99,0,132,0,0,100,99,0,131,2,0,90,57,0,
-    71,100,100,0,100,101,0,132,0,0,100,101,0,131,2,0,
-    90,58,0,71,100,102,0,100,103,0,132,0,0,100,103,0,
-    131,2,0,90,59,0,100,104,0,100,105,0,132,0,0,90,
-    60,0,100,106,0,100,107,0,132,0,0,90,61,0,100,108,
-    0,100,109,0,132,0,0,90,62,0,100,110,0,90,63,0,
-    100,111,0,100,112,0,132,0,0,90,64,0,100,113,0,100,
-    114,0,132,0,0,90,65,0,100,53,0,100,46,0,100,115,
-    0,100,116,0,132,2,0,90,66,0,100,117,0,100,118,0,
-    132,0,0,90,67,0,100,119,0,100,120,0,132,0,0,90,
-    68,0,100,121,0,100,122,0,132,0,0,90,69,0,100,53,
-    0,100,53,0,102,0,0,100,46,0,100,123,0,100,124,0,
-    132,4,0,90,70,0,100,125,0,100,126,0,132,0,0,90,
-    71,0,100,127,0,100,128,0,132,0,0,90,72,0,100,53,
-    0,83,40,130,0,0,0,117,83,1,0,0,67,111,114,101,
-    32,105,109,112,108,101,109,101,110,116,97,116,105,111,110,32,
-    111,102,32,105,109,112,111,114,116,46,10,10,84,104,105,115,
-    32,109,111,100,117,108,101,32,105,115,32,78,79,84,32,109,
-    101,97,110,116,32,116,111,32,98,101,32,100,105,114,101,99,
-    116,108,121,32,105,109,112,111,114,116,101,100,33,32,73,116,
-    32,104,97,115,32,98,101,101,110,32,100,101,115,105,103,110,
-    101,100,32,115,117,99,104,10,116,104,97,116,32,105,116,32,
-    99,97,110,32,98,101,32,98,111,111,116,115,116,114,97,112,
-    112,101,100,32,105,110,116,111,32,80,121,116,104,111,110,32,
-    97,115,32,116,104,101,32,105,109,112,108,101,109,101,110,116,
-    97,116,105,111,110,32,111,102,32,105,109,112,111,114,116,46,
-    32,65,115,10,115,117,99,104,32,105,116,32,114,101,113,117,
-    105,114,101,115,32,116,104,101,32,105,110,106,101,99,116,105,
-    111,110,32,111,102,32,115,112,101,99,105,102,105,99,32,109,
-    111,100,117,108,101,115,32,97,110,100,32,97,116,116,114,105,
-    98,117,116,101,115,32,105,110,32,111,114,100,101,114,32,116,
-    111,10,119,111,114,107,46,32,79,110,101,32,115,104,111,117,
-    108,100,32,117,115,101,32,105,109,112,111,114,116,108,105,98,
-    32,97,115,32,116,104,101,32,112,117,98,108,105,99,45,102,
-    97,99,105,110,103,32,118,101,114,115,105,111,110,32,111,102,
-    32,116,104,105,115,32,109,111,100,117,108,101,46,10,10,117,
-    3,0,0,0,119,105,110,117,6,0,0,0,99,121,103,119,
-    105,110,117,6,0,0,0,100,97,114,119,105,110,99,0,0,
-    0,0,0,0,0,0,1,0,0,0,2,0,0,0,67,0,
-    0,0,115,49,0,0,0,116,0,0,106,1,0,106,2,0,
-    116,3,0,131,1,0,114,33,0,100,1,0,100,2,0,132,
-    0,0,125,0,0,110,12,0,100,3,0,100,2,0,132,0,
-    0,125,0,0,124,0,0,83,40,4,0,0,0,78,99,0,
-    0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,83,
-    0,0,0,115,13,0,0,0,100,1,0,116,0,0,106,1,
-    0,107,6,0,83,40,2,0,0,0,117,53,0,0,0,84,
-    114,117,101,32,105,102,32,102,105,108,101,110,97,109,101,115,
-    32,109,117,115,116,32,98,101,32,99,104,101,99,107,101,100,
-    32,99,97,115,101,45,105,110,115,101,110,115,105,116,105,118,
-    101,108,121,46,115,12,0,0,0,80,89,84,72,79,78,67,
-    65,83,69,79,75,40,2,0,0,0,117,3,0,0,0,95,
-    111,115,117,7,0,0,0,101,110,118,105,114,111,110,40,0,
-    0,0,0,40,0,0,0,0,40,0,0,0,0,117,29,0,
+    0,132,0,0,100,97,0,131,2,0,90,56,0,100,98,0,
+    90,57,0,100,53,0,97,58,0,100,99,0,100,100,0,132,
+    0,0,90,59,0,100,101,0,100,102,0,132,0,0,90,60,
+    0,71,100,103,0,100,104,0,132,0,0,100,104,0,131,2,
+    0,90,61,0,71,100,105,0,100,106,0,132,0,0,100,106,
+    0,131,2,0,90,62,0,71,100,107,0,100,108,0,132,0,
+    0,100,108,0,131,2,0,90,63,0,100,109,0,100,110,0,
+    132,0,0,90,64,0,100,111,0,100,112,0,132,0,0,90,
+    65,0,100,113,0,100,114,0,132,0,0,90,66,0,100,115,
+    0,90,67,0,100,116,0,100,117,0,132,0,0,90,68,0,
+    100,118,0,100,119,0,132,0,0,90,69,0,100,53,0,100,
+    46,0,100,120,0,100,121,0,132,2,0,90,70,0,100,122,
+    0,100,123,0,132,0,0,90,71,0,100,124,0,100,125,0,
+    132,0,0,90,72,0,100,126,0,100,127,0,132,0,0,90,
+    73,0,100,53,0,100,53,0,102,0,0,100,46,0,100,128,
+    0,100,129,0,132,4,0,90,74,0,100,130,0,100,131,0,
+    132,0,0,90,75,0,100,132,0,100,133,0,132,0,0,90,
+    76,0,100,53,0,83,40,135,0,0,0,117,83,1,0,0,
+    67,111,114,101,32,105,109,112,108,101,109,101,110,116,97,116,
+    105,111,110,32,111,102,32,105,109,112,111,114,116,46,10,10,
+    84,104,105,115,32,109,111,100,117,108,101,32,105,115,32,78,
+    79,84,32,109,101,97,110,116,32,116,111,32,98,101,32,100,
+    105,114,101,99,116,108,121,32,105,109,112,111,114,116,101,100,
+    33,32,73,116,32,104,97,115,32,98,101,101,110,32,100,101,
+    115,105,103,110,101,100,32,115,117,99,104,10,116,104,97,116,
+    32,105,116,32,99,97,110,32,98,101,32,98,111,111,116,115,
+    116,114,97,112,112,101,100,32,105,110,116,111,32,80,121,116,
+    104,111,110,32,97,115,32,116,104,101,32,105,109,112,108,101,
+    109,101,110,116,97,116,105,111,110,32,111,102,32,105,109,112,
+    111,114,116,46,32,65,115,10,115,117,99,104,32,105,116,32,
+    114,101,113,117,105,114,101,115,32,116,104,101,32,105,110,106,
+    101,99,116,105,111,110,32,111,102,32,115,112,101,99,105,102,
+    105,99,32,109,111,100,117,108,101,115,32,97,110,100,32,97,
+    116,116,114,105,98,117,116,101,115,32,105,110,32,111,114,100,
+    101,114,32,116,111,10,119,111,114,107,46,32,79,110,101,32,
+    115,104,111,117,108,100,32,117,115,101,32,105,109,112,111,114,
+    116,108,105,98,32,97,115,32,116,104,101,32,112,117,98,108,
+    105,99,45,102,97,99,105,110,103,32,118,101,114,115,105,111,
+    110,32,111,102,32,116,104,105,115,32,109,111,100,117,108,101,
+    46,10,10,117,3,0,0,0,119,105,110,117,6,0,0,0,
+    99,121,103,119,105,110,117,6,0,0,0,100,97,114,119,105,
+    110,99,0,0,0,0,0,0,0,0,1,0,0,0,2,0,
+    0,0,67,0,0,0,115,49,0,0,0,116,0,0,106,1,
+    0,106,2,0,116,3,0,131,1,0,114,33,0,100,1,0,
+    100,2,0,132,0,0,125,0,0,110,12,0,100,3,0,100,
+    2,0,132,0,0,125,0,0,124,0,0,83,40,4,0,0,
+    0,78,99,0,0,0,0,0,0,0,0,0,0,0,0,2,
+    0,0,0,83,0,0,0,115,13,0,0,0,100,1,0,116,
+    0,0,106,1,0,107,6,0,83,40,2,0,0,0,117,53,
+    0,0,0,84,114,117,101,32,105,102,32,102,105,108,101,110,
+    97,109,101,115,32,109,117,115,116,32,98,101,32,99,104,101,
+    99,107,101,100,32,99,97,115,101,45,105,110,115,101,110,115,
+    105,116,105,118,101,108,121,46,115,12,0,0,0,80,89,84,
+    72,79,78,67,65,83,69,79,75,40,2,0,0,0,117,3,
+    0,0,0,95,111,115,117,7,0,0,0,101,110,118,105,114,
+    111,110,40,0,0,0,0,40,0,0,0,0,40,0,0,0,
+    0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
+    112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
+    97,112,62,117,11,0,0,0,95,114,101,108,97,120,95,99,
+    97,115,101,34,0,0,0,115,2,0,0,0,0,2,117,37,
+    0,0,0,95,109,97,107,101,95,114,101,108,97,120,95,99,
+    97,115,101,46,60,108,111,99,97,108,115,62,46,95,114,101,
+    108,97,120,95,99,97,115,101,99,0,0,0,0,0,0,0,
+    0,0,0,0,0,1,0,0,0,83,0,0,0,115,4,0,
+    0,0,100,1,0,83,40,2,0,0,0,117,53,0,0,0,
+    84,114,117,101,32,105,102,32,102,105,108,101,110,97,109,101,
+    115,32,109,117,115,116,32,98,101,32,99,104,101,99,107,101,
+    100,32,99,97,115,101,45,105,110,115,101,110,115,105,116,105,
+    118,101,108,121,46,70,40,0,0,0,0,40,0,0,0,0,
+    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
+    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
+    46,95,98,111,111,116,115,116,114,97,112,62,117,11,0,0,
+    0,95,114,101,108,97,120,95,99,97,115,101,38,0,0,0,
+    115,2,0,0,0,0,2,40,4,0,0,0,117,3,0,0,
+    0,115,121,115,117,8,0,0,0,112,108,97,116,102,111,114,
+    109,117,10,0,0,0,115,116,97,114,116,115,119,105,116,104,
+    117,27,0,0,0,95,67,65,83,69,95,73,78,83,69,78,
+    83,73,84,73,86,69,95,80,76,65,84,70,79,82,77,83,
+    40,1,0,0,0,117,11,0,0,0,95,114,101,108,97,120,
+    95,99,97,115,101,40,0,0,0,0,40,0,0,0,0,117,
+    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
+    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
+    62,117,16,0,0,0,95,109,97,107,101,95,114,101,108,97,
+    120,95,99,97,115,101,32,0,0,0,115,8,0,0,0,0,
+    1,18,1,15,4,12,3,117,16,0,0,0,95,109,97,107,
+    101,95,114,101,108,97,120,95,99,97,115,101,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,0,
+    0,115,108,0,0,0,116,0,0,124,0,0,131,1,0,125,
+    0,0,103,0,0,125,1,0,124,1,0,106,1,0,124,0,
+    0,100,1,0,64,131,1,0,1,124,1,0,106,1,0,124,
+    0,0,100,2,0,63,100,1,0,64,131,1,0,1,124,1,
+    0,106,1,0,124,0,0,100,3,0,63,100,1,0,64,131,
+    1,0,1,124,1,0,106,1,0,124,0,0,100,4,0,63,
+    100,1,0,64,131,1,0,1,116,2,0,124,1,0,131,1,
+    0,83,40,5,0,0,0,117,111,0,0,0,67,111,110,118,
+    101,114,116,32,97,32,51,50,45,98,105,116,32,105,110,116,
+    101,103,101,114,32,116,111,32,108,105,116,116,108,101,45,101,
+    110,100,105,97,110,46,10,10,32,32,32,32,88,88,88,32,
+    84,101,109,112,111,114,97,114,121,32,117,110,116,105,108,32,
+    109,97,114,115,104,97,108,39,115,32,108,111,110,103,32,102,
+    117,110,99,116,105,111,110,115,32,97,114,101,32,101,120,112,
+    111,115,101,100,46,10,10,32,32,32,32,105,255,0,0,0,
+    105,8,0,0,0,105,16,0,0,0,105,24,0,0,0,40,
+    3,0,0,0,117,3,0,0,0,105,110,116,117,6,0,0,
+    0,97,112,112,101,110,100,117,9,0,0,0,98,121,116,101,
+    97,114,114,97,121,40,2,0,0,0,117,1,0,0,0,120,
+    117,9,0,0,0,105,110,116,95,98,121,116,101,115,40,0,
+    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
+    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
+    98,111,111,116,115,116,114,97,112,62,117,7,0,0,0,95,
+    119,95,108,111,110,103,45,0,0,0,115,14,0,0,0,0,
+    6,12,1,6,1,17,1,21,1,21,1,21,1,117,7,0,
+    0,0,95,119,95,108,111,110,103,99,1,0,0,0,0,0,
+    0,0,2,0,0,0,3,0,0,0,67,0,0,0,115,68,
+    0,0,0,124,0,0,100,1,0,25,125,1,0,124,1,0,
+    124,0,0,100,2,0,25,100,3,0,62,79,125,1,0,124,
+    1,0,124,0,0,100,4,0,25,100,5,0,62,79,125,1,
+    0,124,1,0,124,0,0,100,6,0,25,100,7,0,62,79,
+    125,1,0,124,1,0,83,40,8,0,0,0,117,115,0,0,
+    0,67,111,110,118,101,114,116,32,52,32,98,121,116,101,115,
+    32,105,110,32,108,105,116,116,108,101,45,101,110,100,105,97,
+    110,32,116,111,32,97,110,32,105,110,116,101,103,101,114,46,
+    10,10,32,32,32,32,88,88,88,32,84,101,109,112,111,114,
+    97,114,121,32,117,110,116,105,108,32,109,97,114,115,104,97,
+    108,39,115,32,108,111,110,103,32,102,117,110,99,116,105,111,
+    110,32,97,114,101,32,101,120,112,111,115,101,100,46,10,10,
+    32,32,32,32,105,0,0,0,0,105,1,0,0,0,105,8,
+    0,0,0,105,2,0,0,0,105,16,0,0,0,105,3,0,
+    0,0,105,24,0,0,0,40,0,0,0,0,40,2,0,0,
+    0,117,9,0,0,0,105,110,116,95,98,121,116,101,115,117,
+    1,0,0,0,120,40,0,0,0,0,40,0,0,0,0,117,
+    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
+    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
+    62,117,7,0,0,0,95,114,95,108,111,110,103,61,0,0,
+    0,115,10,0,0,0,0,6,10,1,18,1,18,1,18,1,
+    117,7,0,0,0,95,114,95,108,111,110,103,99,0,0,0,
+    0,0,0,0,0,3,0,0,0,4,0,0,0,71,0,0,
+    0,115,103,0,0,0,103,0,0,125,1,0,120,71,0,124,
+    0,0,68,93,63,0,125,2,0,124,2,0,115,31,0,113,
+    13,0,110,0,0,124,1,0,106,0,0,124,2,0,131,1,
+    0,1,124,2,0,100,4,0,25,116,1,0,107,7,0,114,
+    13,0,124,1,0,106,0,0,116,2,0,131,1,0,1,113,
+    13,0,113,13,0,87,100,2,0,106,3,0,124,1,0,100,
+    3,0,100,5,0,133,2,0,25,131,1,0,83,40,6,0,
+    0,0,117,31,0,0,0,82,101,112,108,97,99,101,109,101,
+    110,116,32,102,111,114,32,111,115,46,112,97,116,104,46,106,
+    111,105,110,40,41,46,105,1,0,0,0,117,0,0,0,0,
+    78,105,255,255,255,255,105,255,255,255,255,40,4,0,0,0,
+    117,6,0,0,0,97,112,112,101,110,100,117,15,0,0,0,
+    112,97,116,104,95,115,101,112,97,114,97,116,111,114,115,117,
+    8,0,0,0,112,97,116,104,95,115,101,112,117,4,0,0,
+    0,106,111,105,110,40,3,0,0,0,117,10,0,0,0,112,
+    97,116,104,95,112,97,114,116,115,117,9,0,0,0,110,101,
+    119,95,112,97,114,116,115,117,4,0,0,0,112,97,114,116,
+    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
+    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
+    46,95,98,111,111,116,115,116,114,97,112,62,117,10,0,0,
+    0,95,112,97,116,104,95,106,111,105,110,74,0,0,0,115,
+    16,0,0,0,0,2,6,1,13,1,6,1,6,1,13,1,
+    16,1,20,1,117,10,0,0,0,95,112,97,116,104,95,106,
+    111,105,110,99,1,0,0,0,0,0,0,0,6,0,0,0,
+    3,0,0,0,67,0,0,0,115,85,0,0,0,120,48,0,
+    116,0,0,124,0,0,131,1,0,68,93,28,0,125,1,0,
+    124,1,0,116,1,0,107,6,0,114,13,0,124,1,0,125,
+    2,0,80,113,13,0,113,13,0,87,116,2,0,125,2,0,
+    124,0,0,106,3,0,124,2,0,131,1,0,92,3,0,125,
+    3,0,125,4,0,125,5,0,124,3,0,124,5,0,102,2,
+    0,83,40,1,0,0,0,117,32,0,0,0,82,101,112,108,
+    97,99,101,109,101,110,116,32,102,111,114,32,111,115,46,112,
+    97,116,104,46,115,112,108,105,116,40,41,46,40,4,0,0,
+    0,117,8,0,0,0,114,101,118,101,114,115,101,100,117,15,
+    0,0,0,112,97,116,104,95,115,101,112,97,114,97,116,111,
+    114,115,117,8,0,0,0,112,97,116,104,95,115,101,112,117,
+    10,0,0,0,114,112,97,114,116,105,116,105,111,110,40,6,
+    0,0,0,117,4,0,0,0,112,97,116,104,117,1,0,0,
+    0,120,117,3,0,0,0,115,101,112,117,5,0,0,0,102,
+    114,111,110,116,117,1,0,0,0,95,117,4,0,0,0,116,
+    97,105,108,40,0,0,0,0,40,0,0,0,0,117,29,0,
     0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
     108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
-    11,0,0,0,95,114,101,108,97,120,95,99,97,115,101,34,
-    0,0,0,115,2,0,0,0,0,2,117,37,0,0,0,95,
-    109,97,107,101,95,114,101,108,97,120,95,99,97,115,101,46,
-    60,108,111,99,97,108,115,62,46,95,114,101,108,97,120,95,
-    99,97,115,101,99,0,0,0,0,0,0,0,0,0,0,0,
-    0,1,0,0,0,83,0,0,0,115,4,0,0,0,100,1,
-    0,83,40,2,0,0,0,117,53,0,0,0,84,114,117,101,
-    32,105,102,32,102,105,108,101,110,97,109,101,115,32,109,117,
-    115,116,32,98,101,32,99,104,101,99,107,101,100,32,99,97,
-    115,101,45,105,110,115,101,110,115,105,116,105,118,101,108,121,
-    46,70,40,0,0,0,0,40,0,0,0,0,40,0,0,0,
-    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
-    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,11,0,0,0,95,114,101,
-    108,97,120,95,99,97,115,101,38,0,0,0,115,2,0,0,
-    0,0,2,40,4,0,0,0,117,3,0,0,0,115,121,115,
-    117,8,0,0,0,112,108,97,116,102,111,114,109,117,10,0,
-    0,0,115,116,97,114,116,115,119,105,116,104,117,27,0,0,
-    0,95,67,65,83,69,95,73,78,83,69,78,83,73,84,73,
-    86,69,95,80,76,65,84,70,79,82,77,83,40,1,0,0,
-    0,117,11,0,0,0,95,114,101,108,97,120,95,99,97,115,
-    101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
-    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
-    98,46,95,98,111,111,116,115,116,114,97,112,62,117,16,0,
-    0,0,95,109,97,107,101,95,114,101,108,97,120,95,99,97,
-    115,101,32,0,0,0,115,8,0,0,0,0,1,18,1,15,
-    4,12,3,117,16,0,0,0,95,109,97,107,101,95,114,101,
-    108,97,120,95,99,97,115,101,99,1,0,0,0,0,0,0,
-    0,2,0,0,0,3,0,0,0,67,0,0,0,115,108,0,
-    0,0,116,0,0,124,0,0,131,1,0,125,0,0,103,0,
-    0,125,1,0,124,1,0,106,1,0,124,0,0,100,1,0,
-    64,131,1,0,1,124,1,0,106,1,0,124,0,0,100,2,
-    0,63,100,1,0,64,131,1,0,1,124,1,0,106,1,0,
-    124,0,0,100,3,0,63,100,1,0,64,131,1,0,1,124,
-    1,0,106,1,0,124,0,0,100,4,0,63,100,1,0,64,
-    131,1,0,1,116,2,0,124,1,0,131,1,0,83,40,5,
-    0,0,0,117,111,0,0,0,67,111,110,118,101,114,116,32,
-    97,32,51,50,45,98,105,116,32,105,110,116,101,103,101,114,
-    32,116,111,32,108,105,116,116,108,101,45,101,110,100,105,97,
-    110,46,10,10,32,32,32,32,88,88,88,32,84,101,109,112,
-    111,114,97,114,121,32,117,110,116,105,108,32,109,97,114,115,
-    104,97,108,39,115,32,108,111,110,103,32,102,117,110,99,116,
-    105,111,110,115,32,97,114,101,32,101,120,112,111,115,101,100,
-    46,10,10,32,32,32,32,105,255,0,0,0,105,8,0,0,
-    0,105,16,0,0,0,105,24,0,0,0,40,3,0,0,0,
-    117,3,0,0,0,105,110,116,117,6,0,0,0,97,112,112,
-    101,110,100,117,9,0,0,0,98,121,116,101,97,114,114,97,
-    121,40,2,0,0,0,117,1,0,0,0,120,117,9,0,0,
-    0,105,110,116,95,98,121,116,101,115,40,0,0,0,0,40,
-    0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,
-    32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,
-    115,116,114,97,112,62,117,7,0,0,0,95,119,95,108,111,
-    110,103,45,0,0,0,115,14,0,0,0,0,6,12,1,6,
-    1,17,1,21,1,21,1,21,1,117,7,0,0,0,95,119,
-    95,108,111,110,103,99,1,0,0,0,0,0,0,0,2,0,
-    0,0,3,0,0,0,67,0,0,0,115,68,0,0,0,124,
-    0,0,100,1,0,25,125,1,0,124,1,0,124,0,0,100,
-    2,0,25,100,3,0,62,79,125,1,0,124,1,0,124,0,
-    0,100,4,0,25,100,5,0,62,79,125,1,0,124,1,0,
-    124,0,0,100,6,0,25,100,7,0,62,79,125,1,0,124,
-    1,0,83,40,8,0,0,0,117,115,0,0,0,67,111,110,
-    118,101,114,116,32,52,32,98,121,116,101,115,32,105,110,32,
-    108,105,116,116,108,101,45,101,110,100,105,97,110,32,116,111,
-    32,97,110,32,105,110,116,101,103,101,114,46,10,10,32,32,
-    32,32,88,88,88,32,84,101,109,112,111,114,97,114,121,32,
-    117,110,116,105,108,32,109,97,114,115,104,97,108,39,115,32,
-    108,111,110,103,32,102,117,110,99,116,105,111,110,32,97,114,
-    101,32,101,120,112,111,115,101,100,46,10,10,32,32,32,32,
-    105,0,0,0,0,105,1,0,0,0,105,8,0,0,0,105,
-    2,0,0,0,105,16,0,0,0,105,3,0,0,0,105,24,
-    0,0,0,40,0,0,0,0,40,2,0,0,0,117,9,0,
-    0,0,105,110,116,95,98,121,116,101,115,117,1,0,0,0,
-    120,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    11,0,0,0,95,112,97,116,104,95,115,112,108,105,116,86,
+    0,0,0,115,14,0,0,0,0,2,19,1,12,1,6,1,
+    8,2,6,1,24,1,117,11,0,0,0,95,112,97,116,104,
+    95,115,112,108,105,116,99,2,0,0,0,0,0,0,0,3,
+    0,0,0,11,0,0,0,67,0,0,0,115,61,0,0,0,
+    121,19,0,116,0,0,106,1,0,124,0,0,131,1,0,125,
+    2,0,87,110,22,0,4,116,2,0,107,10,0,114,43,0,
+    1,1,1,100,1,0,83,89,110,1,0,88,124,2,0,106,
+    3,0,100,2,0,64,124,1,0,107,2,0,83,40,3,0,
+    0,0,117,49,0,0,0,84,101,115,116,32,119,104,101,116,
+    104,101,114,32,116,104,101,32,112,97,116,104,32,105,115,32,
+    116,104,101,32,115,112,101,99,105,102,105,101,100,32,109,111,
+    100,101,32,116,121,112,101,46,70,105,0,240,0,0,40,4,
+    0,0,0,117,3,0,0,0,95,111,115,117,4,0,0,0,
+    115,116,97,116,117,7,0,0,0,79,83,69,114,114,111,114,
+    117,7,0,0,0,115,116,95,109,111,100,101,40,3,0,0,
+    0,117,4,0,0,0,112,97,116,104,117,4,0,0,0,109,
+    111,100,101,117,9,0,0,0,115,116,97,116,95,105,110,102,
+    111,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
     60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
-    98,46,95,98,111,111,116,115,116,114,97,112,62,117,7,0,
-    0,0,95,114,95,108,111,110,103,61,0,0,0,115,10,0,
-    0,0,0,6,10,1,18,1,18,1,18,1,117,7,0,0,
-    0,95,114,95,108,111,110,103,99,0,0,0,0,0,0,0,
-    0,3,0,0,0,4,0,0,0,71,0,0,0,115,103,0,
-    0,0,103,0,0,125,1,0,120,71,0,124,0,0,68,93,
-    63,0,125,2,0,124,2,0,115,31,0,113,13,0,110,0,
-    0,124,1,0,106,0,0,124,2,0,131,1,0,1,124,2,
-    0,100,4,0,25,116,1,0,107,7,0,114,13,0,124,1,
-    0,106,0,0,116,2,0,131,1,0,1,113,13,0,113,13,
-    0,87,100,2,0,106,3,0,124,1,0,100,3,0,100,5,
-    0,133,2,0,25,131,1,0,83,40,6,0,0,0,117,31,
-    0,0,0,82,101,112,108,97,99,101,109,101,110,116,32,102,
-    111,114,32,111,115,46,112,97,116,104,46,106,111,105,110,40,
-    41,46,105,1,0,0,0,117,0,0,0,0,78,105,255,255,
-    255,255,105,255,255,255,255,40,4,0,0,0,117,6,0,0,
-    0,97,112,112,101,110,100,117,15,0,0,0,112,97,116,104,
-    95,115,101,112,97,114,97,116,111,114,115,117,8,0,0,0,
-    112,97,116,104,95,115,101,112,117,4,0,0,0,106,111,105,
-    110,40,3,0,0,0,117,10,0,0,0,112,97,116,104,95,
-    112,97,114,116,115,117,9,0,0,0,110,101,119,95,112,97,
-    114,116,115,117,4,0,0,0,112,97,114,116,40,0,0,0,
-    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
-    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,10,0,0,0,95,112,97,
-    116,104,95,106,111,105,110,74,0,0,0,115,16,0,0,0,
-    0,2,6,1,13,1,6,1,6,1,13,1,16,1,20,1,
-    117,10,0,0,0,95,112,97,116,104,95,106,111,105,110,99,
-    1,0,0,0,0,0,0,0,6,0,0,0,3,0,0,0,
-    67,0,0,0,115,85,0,0,0,120,48,0,116,0,0,124,
-    0,0,131,1,0,68,93,28,0,125,1,0,124,1,0,116,
-    1,0,107,6,0,114,13,0,124,1,0,125,2,0,80,113,
-    13,0,113,13,0,87,116,2,0,125,2,0,124,0,0,106,
-    3,0,124,2,0,131,1,0,92,3,0,125,3,0,125,4,
-    0,125,5,0,124,3,0,124,5,0,102,2,0,83,40,1,
-    0,0,0,117,32,0,0,0,82,101,112,108,97,99,101,109,
-    101,110,116,32,102,111,114,32,111,115,46,112,97,116,104,46,
-    115,112,108,105,116,40,41,46,40,4,0,0,0,117,8,0,
-    0,0,114,101,118,101,114,115,101,100,117,15,0,0,0,112,
-    97,116,104,95,115,101,112,97,114,97,116,111,114,115,117,8,
-    0,0,0,112,97,116,104,95,115,101,112,117,10,0,0,0,
-    114,112,97,114,116,105,116,105,111,110,40,6,0,0,0,117,
-    4,0,0,0,112,97,116,104,117,1,0,0,0,120,117,3,
-    0,0,0,115,101,112,117,5,0,0,0,102,114,111,110,116,
-    117,1,0,0,0,95,117,4,0,0,0,116,97,105,108,40,
-    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
-    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
-    95,98,111,111,116,115,116,114,97,112,62,117,11,0,0,0,
-    95,112,97,116,104,95,115,112,108,105,116,86,0,0,0,115,
-    14,0,0,0,0,2,19,1,12,1,6,1,8,2,6,1,
-    24,1,117,11,0,0,0,95,112,97,116,104,95,115,112,108,
-    105,116,99,2,0,0,0,0,0,0,0,3,0,0,0,11,
-    0,0,0,67,0,0,0,115,61,0,0,0,121,19,0,116,
-    0,0,106,1,0,124,0,0,131,1,0,125,2,0,87,110,
-    22,0,4,116,2,0,107,10,0,114,43,0,1,1,1,100,
-    1,0,83,89,110,1,0,88,124,2,0,106,3,0,100,2,
-    0,64,124,1,0,107,2,0,83,40,3,0,0,0,117,49,
-    0,0,0,84,101,115,116,32,119,104,101,116,104,101,114,32,
-    116,104,101,32,112,97,116,104,32,105,115,32,116,104,101,32,
-    115,112,101,99,105,102,105,101,100,32,109,111,100,101,32,116,
-    121,112,101,46,70,105,0,240,0,0,40,4,0,0,0,117,
-    3,0,0,0,95,111,115,117,4,0,0,0,115,116,97,116,
-    117,7,0,0,0,79,83,69,114,114,111,114,117,7,0,0,
-    0,115,116,95,109,111,100,101,40,3,0,0,0,117,4,0,
-    0,0,112,97,116,104,117,4,0,0,0,109,111,100,101,117,
-    9,0,0,0,115,116,97,116,95,105,110,102,111,40,0,0,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,18,0,
+    0,0,95,112,97,116,104,95,105,115,95,109,111,100,101,95,
+    116,121,112,101,98,0,0,0,115,10,0,0,0,0,2,3,
+    1,19,1,13,1,9,1,117,18,0,0,0,95,112,97,116,
+    104,95,105,115,95,109,111,100,101,95,116,121,112,101,99,1,
+    0,0,0,0,0,0,0,1,0,0,0,3,0,0,0,67,
+    0,0,0,115,13,0,0,0,116,0,0,124,0,0,100,1,
+    0,131,2,0,83,40,2,0,0,0,117,31,0,0,0,82,
+    101,112,108,97,99,101,109,101,110,116,32,102,111,114,32,111,
+    115,46,112,97,116,104,46,105,115,102,105,108,101,46,105,0,
+    128,0,0,40,1,0,0,0,117,18,0,0,0,95,112,97,
+    116,104,95,105,115,95,109,111,100,101,95,116,121,112,101,40,
+    1,0,0,0,117,4,0,0,0,112,97,116,104,40,0,0,
     0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
     122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
-    111,111,116,115,116,114,97,112,62,117,18,0,0,0,95,112,
-    97,116,104,95,105,115,95,109,111,100,101,95,116,121,112,101,
-    98,0,0,0,115,10,0,0,0,0,2,3,1,19,1,13,
-    1,9,1,117,18,0,0,0,95,112,97,116,104,95,105,115,
-    95,109,111,100,101,95,116,121,112,101,99,1,0,0,0,0,
-    0,0,0,1,0,0,0,3,0,0,0,67,0,0,0,115,
-    13,0,0,0,116,0,0,124,0,0,100,1,0,131,2,0,
-    83,40,2,0,0,0,117,31,0,0,0,82,101,112,108,97,
-    99,101,109,101,110,116,32,102,111,114,32,111,115,46,112,97,
-    116,104,46,105,115,102,105,108,101,46,105,0,128,0,0,40,
-    1,0,0,0,117,18,0,0,0,95,112,97,116,104,95,105,
-    115,95,109,111,100,101,95,116,121,112,101,40,1,0,0,0,
-    117,4,0,0,0,112,97,116,104,40,0,0,0,0,40,0,
-    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
-    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
-    116,114,97,112,62,117,12,0,0,0,95,112,97,116,104,95,
-    105,115,102,105,108,101,108,0,0,0,115,2,0,0,0,0,
-    2,117,12,0,0,0,95,112,97,116,104,95,105,115,102,105,
-    108,101,99,1,0,0,0,0,0,0,0,1,0,0,0,3,
-    0,0,0,67,0,0,0,115,34,0,0,0,124,0,0,115,
-    21,0,116,0,0,106,1,0,131,0,0,125,0,0,110,0,
-    0,116,2,0,124,0,0,100,1,0,131,2,0,83,40,2,
-    0,0,0,117,30,0,0,0,82,101,112,108,97,99,101,109,
-    101,110,116,32,102,111,114,32,111,115,46,112,97,116,104,46,
-    105,115,100,105,114,46,105,0,64,0,0,40,3,0,0,0,
-    117,3,0,0,0,95,111,115,117,6,0,0,0,103,101,116,
-    99,119,100,117,18,0,0,0,95,112,97,116,104,95,105,115,
-    95,109,111,100,101,95,116,121,112,101,40,1,0,0,0,117,
-    4,0,0,0,112,97,116,104,40,0,0,0,0,40,0,0,
-    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
-    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
-    114,97,112,62,117,11,0,0,0,95,112,97,116,104,95,105,
-    115,100,105,114,114,0,0,0,115,6,0,0,0,0,2,6,
-    1,15,1,117,11,0,0,0,95,112,97,116,104,95,105,115,
-    100,105,114,105,182,1,0,0,99,3,0,0,0,0,0,0,
-    0,6,0,0,0,17,0,0,0,67,0,0,0,115,192,0,
-    0,0,100,1,0,106,0,0,124,0,0,116,1,0,124,0,
-    0,131,1,0,131,2,0,125,3,0,116,2,0,106,3,0,
-    124,3,0,116,2,0,106,4,0,116,2,0,106,5,0,66,
-    116,2,0,106,6,0,66,124,2,0,100,2,0,64,131,3,
-    0,125,4,0,121,60,0,116,7,0,106,8,0,124,4,0,
-    100,3,0,131,2,0,143,20,0,125,5,0,124,5,0,106,
-    9,0,124,1,0,131,1,0,1,87,100,4,0,81,88,116,
-    2,0,106,10,0,124,3,0,124,0,0,131,2,0,1,87,
-    110,59,0,4,116,11,0,107,10,0,114,187,0,1,1,1,
-    121,17,0,116,2,0,106,12,0,124,3,0,131,1,0,1,
-    87,110,18,0,4,116,11,0,107,10,0,114,179,0,1,1,
-    1,89,110,1,0,88,130,0,0,89,110,1,0,88,100,4,
-    0,83,40,5,0,0,0,117,162,0,0,0,66,101,115,116,
-    45,101,102,102,111,114,116,32,102,117,110,99,116,105,111,110,
-    32,116,111,32,119,114,105,116,101,32,100,97,116,97,32,116,
-    111,32,97,32,112,97,116,104,32,97,116,111,109,105,99,97,
-    108,108,121,46,10,32,32,32,32,66,101,32,112,114,101,112,
-    97,114,101,100,32,116,111,32,104,97,110,100,108,101,32,97,
-    32,70,105,108,101,69,120,105,115,116,115,69,114,114,111,114,
-    32,105,102,32,99,111,110,99,117,114,114,101,110,116,32,119,
-    114,105,116,105,110,103,32,111,102,32,116,104,101,10,32,32,
-    32,32,116,101,109,112,111,114,97,114,121,32,102,105,108,101,
-    32,105,115,32,97,116,116,101,109,112,116,101,100,46,117,5,
-    0,0,0,123,125,46,123,125,105,182,1,0,0,117,2,0,
-    0,0,119,98,78,40,13,0,0,0,117,6,0,0,0,102,
-    111,114,109,97,116,117,2,0,0,0,105,100,117,3,0,0,
-    0,95,111,115,117,4,0,0,0,111,112,101,110,117,6,0,
-    0,0,79,95,69,88,67,76,117,7,0,0,0,79,95,67,
-    82,69,65,84,117,8,0,0,0,79,95,87,82,79,78,76,
-    89,117,3,0,0,0,95,105,111,117,6,0,0,0,70,105,
-    108,101,73,79,117,5,0,0,0,119,114,105,116,101,117,7,
-    0,0,0,114,101,112,108,97,99,101,117,7,0,0,0,79,
-    83,69,114,114,111,114,117,6,0,0,0,117,110,108,105,110,
-    107,40,6,0,0,0,117,4,0,0,0,112,97,116,104,117,
-    4,0,0,0,100,97,116,97,117,4,0,0,0,109,111,100,
-    101,117,8,0,0,0,112,97,116,104,95,116,109,112,117,2,
-    0,0,0,102,100,117,4,0,0,0,102,105,108,101,40,0,
-    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,13,0,0,0,95,
-    119,114,105,116,101,95,97,116,111,109,105,99,121,0,0,0,
-    115,26,0,0,0,0,5,24,1,9,1,33,1,3,3,21,
-    1,19,1,20,1,13,1,3,1,17,1,13,1,5,1,117,
-    13,0,0,0,95,119,114,105,116,101,95,97,116,111,109,105,
-    99,99,2,0,0,0,0,0,0,0,3,0,0,0,7,0,
-    0,0,67,0,0,0,115,95,0,0,0,120,69,0,100,1,
-    0,100,2,0,100,3,0,100,4,0,103,4,0,68,93,49,
-    0,125,2,0,116,0,0,124,1,0,124,2,0,131,2,0,
-    114,19,0,116,1,0,124,0,0,124,2,0,116,2,0,124,
-    1,0,124,2,0,131,2,0,131,3,0,1,113,19,0,113,
-    19,0,87,124,0,0,106,3,0,106,4,0,124,1,0,106,
-    3,0,131,1,0,1,100,5,0,83,40,6,0,0,0,117,
-    47,0,0,0,83,105,109,112,108,101,32,115,117,98,115,116,
-    105,116,117,116,101,32,102,111,114,32,102,117,110,99,116,111,
-    111,108,115,46,117,112,100,97,116,101,95,119,114,97,112,112,
-    101,114,46,117,10,0,0,0,95,95,109,111,100,117,108,101,
-    95,95,117,8,0,0,0,95,95,110,97,109,101,95,95,117,
-    12,0,0,0,95,95,113,117,97,108,110,97,109,101,95,95,
-    117,7,0,0,0,95,95,100,111,99,95,95,78,40,5,0,
-    0,0,117,7,0,0,0,104,97,115,97,116,116,114,117,7,
-    0,0,0,115,101,116,97,116,116,114,117,7,0,0,0,103,
-    101,116,97,116,116,114,117,8,0,0,0,95,95,100,105,99,
-    116,95,95,117,6,0,0,0,117,112,100,97,116,101,40,3,
-    0,0,0,117,3,0,0,0,110,101,119,117,3,0,0,0,
-    111,108,100,117,7,0,0,0,114,101,112,108,97,99,101,40,
-    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
-    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
-    95,98,111,111,116,115,116,114,97,112,62,117,5,0,0,0,
-    95,119,114,97,112,143,0,0,0,115,8,0,0,0,0,2,
-    25,1,15,1,32,1,117,5,0,0,0,95,119,114,97,112,
-    99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,
-    0,67,0,0,0,115,16,0,0,0,116,0,0,116,1,0,
-    131,1,0,124,0,0,131,1,0,83,40,1,0,0,0,117,
-    75,0,0,0,67,114,101,97,116,101,32,97,32,110,101,119,
-    32,109,111,100,117,108,101,46,10,10,32,32,32,32,84,104,
-    101,32,109,111,100,117,108,101,32,105,115,32,110,111,116,32,
-    101,110,116,101,114,101,100,32,105,110,116,111,32,115,121,115,
-    46,109,111,100,117,108,101,115,46,10,10,32,32,32,32,40,
-    2,0,0,0,117,4,0,0,0,116,121,112,101,117,3,0,
-    0,0,95,105,111,40,1,0,0,0,117,4,0,0,0,110,
-    97,109,101,40,0,0,0,0,40,0,0,0,0,117,29,0,
+    111,111,116,115,116,114,97,112,62,117,12,0,0,0,95,112,
+    97,116,104,95,105,115,102,105,108,101,108,0,0,0,115,2,
+    0,0,0,0,2,117,12,0,0,0,95,112,97,116,104,95,
+    105,115,102,105,108,101,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,3,0,0,0,67,0,0,0,115,34,0,0,0,
+    124,0,0,115,21,0,116,0,0,106,1,0,131,0,0,125,
+    0,0,110,0,0,116,2,0,124,0,0,100,1,0,131,2,
+    0,83,40,2,0,0,0,117,30,0,0,0,82,101,112,108,
+    97,99,101,109,101,110,116,32,102,111,114,32,111,115,46,112,
+    97,116,104,46,105,115,100,105,114,46,105,0,64,0,0,40,
+    3,0,0,0,117,3,0,0,0,95,111,115,117,6,0,0,
+    0,103,101,116,99,119,100,117,18,0,0,0,95,112,97,116,
+    104,95,105,115,95,109,111,100,101,95,116,121,112,101,40,1,
+    0,0,0,117,4,0,0,0,112,97,116,104,40,0,0,0,
+    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
+    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
+    111,116,115,116,114,97,112,62,117,11,0,0,0,95,112,97,
+    116,104,95,105,115,100,105,114,114,0,0,0,115,6,0,0,
+    0,0,2,6,1,15,1,117,11,0,0,0,95,112,97,116,
+    104,95,105,115,100,105,114,105,182,1,0,0,99,3,0,0,
+    0,0,0,0,0,6,0,0,0,17,0,0,0,67,0,0,
+    0,115,192,0,0,0,100,1,0,106,0,0,124,0,0,116,
+    1,0,124,0,0,131,1,0,131,2,0,125,3,0,116,2,
+    0,106,3,0,124,3,0,116,2,0,106,4,0,116,2,0,
+    106,5,0,66,116,2,0,106,6,0,66,124,2,0,100,2,
+    0,64,131,3,0,125,4,0,121,60,0,116,7,0,106,8,
+    0,124,4,0,100,3,0,131,2,0,143,20,0,125,5,0,
+    124,5,0,106,9,0,124,1,0,131,1,0,1,87,100,4,
+    0,81,88,116,2,0,106,10,0,124,3,0,124,0,0,131,
+    2,0,1,87,110,59,0,4,116,11,0,107,10,0,114,187,
+    0,1,1,1,121,17,0,116,2,0,106,12,0,124,3,0,
+    131,1,0,1,87,110,18,0,4,116,11,0,107,10,0,114,
+    179,0,1,1,1,89,110,1,0,88,130,0,0,89,110,1,
+    0,88,100,4,0,83,40,5,0,0,0,117,162,0,0,0,
+    66,101,115,116,45,101,102,102,111,114,116,32,102,117,110,99,
+    116,105,111,110,32,116,111,32,119,114,105,116,101,32,100,97,
+    116,97,32,116,111,32,97,32,112,97,116,104,32,97,116,111,
+    109,105,99,97,108,108,121,46,10,32,32,32,32,66,101,32,
+    112,114,101,112,97,114,101,100,32,116,111,32,104,97,110,100,
+    108,101,32,97,32,70,105,108,101,69,120,105,115,116,115,69,
+    114,114,111,114,32,105,102,32,99,111,110,99,117,114,114,101,
+    110,116,32,119,114,105,116,105,110,103,32,111,102,32,116,104,
+    101,10,32,32,32,32,116,101,109,112,111,114,97,114,121,32,
+    102,105,108,101,32,105,115,32,97,116,116,101,109,112,116,101,
+    100,46,117,5,0,0,0,123,125,46,123,125,105,182,1,0,
+    0,117,2,0,0,0,119,98,78,40,13,0,0,0,117,6,
+    0,0,0,102,111,114,109,97,116,117,2,0,0,0,105,100,
+    117,3,0,0,0,95,111,115,117,4,0,0,0,111,112,101,
+    110,117,6,0,0,0,79,95,69,88,67,76,117,7,0,0,
+    0,79,95,67,82,69,65,84,117,8,0,0,0,79,95,87,
+    82,79,78,76,89,117,3,0,0,0,95,105,111,117,6,0,
+    0,0,70,105,108,101,73,79,117,5,0,0,0,119,114,105,
+    116,101,117,7,0,0,0,114,101,112,108,97,99,101,117,7,
+    0,0,0,79,83,69,114,114,111,114,117,6,0,0,0,117,
+    110,108,105,110,107,40,6,0,0,0,117,4,0,0,0,112,
+    97,116,104,117,4,0,0,0,100,97,116,97,117,4,0,0,
+    0,109,111,100,101,117,8,0,0,0,112,97,116,104,95,116,
+    109,112,117,2,0,0,0,102,100,117,4,0,0,0,102,105,
+    108,101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,13,
+    0,0,0,95,119,114,105,116,101,95,97,116,111,109,105,99,
+    121,0,0,0,115,26,0,0,0,0,5,24,1,9,1,33,
+    1,3,3,21,1,19,1,20,1,13,1,3,1,17,1,13,
+    1,5,1,117,13,0,0,0,95,119,114,105,116,101,95,97,
+    116,111,109,105,99,99,2,0,0,0,0,0,0,0,3,0,
+    0,0,7,0,0,0,67,0,0,0,115,95,0,0,0,120,
+    69,0,100,1,0,100,2,0,100,3,0,100,4,0,103,4,
+    0,68,93,49,0,125,2,0,116,0,0,124,1,0,124,2,
+    0,131,2,0,114,19,0,116,1,0,124,0,0,124,2,0,
+    116,2,0,124,1,0,124,2,0,131,2,0,131,3,0,1,
+    113,19,0,113,19,0,87,124,0,0,106,3,0,106,4,0,
+    124,1,0,106,3,0,131,1,0,1,100,5,0,83,40,6,
+    0,0,0,117,47,0,0,0,83,105,109,112,108,101,32,115,
+    117,98,115,116,105,116,117,116,101,32,102,111,114,32,102,117,
+    110,99,116,111,111,108,115,46,117,112,100,97,116,101,95,119,
+    114,97,112,112,101,114,46,117,10,0,0,0,95,95,109,111,
+    100,117,108,101,95,95,117,8,0,0,0,95,95,110,97,109,
+    101,95,95,117,12,0,0,0,95,95,113,117,97,108,110,97,
+    109,101,95,95,117,7,0,0,0,95,95,100,111,99,95,95,
+    78,40,5,0,0,0,117,7,0,0,0,104,97,115,97,116,
+    116,114,117,7,0,0,0,115,101,116,97,116,116,114,117,7,
+    0,0,0,103,101,116,97,116,116,114,117,8,0,0,0,95,
+    95,100,105,99,116,95,95,117,6,0,0,0,117,112,100,97,
+    116,101,40,3,0,0,0,117,3,0,0,0,110,101,119,117,
+    3,0,0,0,111,108,100,117,7,0,0,0,114,101,112,108,
+    97,99,101,40,0,0,0,0,40,0,0,0,0,117,29,0,
     0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
     108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
-    10,0,0,0,110,101,119,95,109,111,100,117,108,101,154,0,
-    0,0,115,2,0,0,0,0,6,117,10,0,0,0,110,101,
-    119,95,109,111,100,117,108,101,99,1,0,0,0,0,0,0,
-    0,1,0,0,0,1,0,0,0,66,0,0,0,115,20,0,
-    0,0,124,0,0,69,101,0,0,90,1,0,100,0,0,90,
-    2,0,100,1,0,83,40,2,0,0,0,117,14,0,0,0,
-    95,68,101,97,100,108,111,99,107,69,114,114,111,114,78,40,
-    3,0,0,0,117,8,0,0,0,95,95,110,97,109,101,95,
-    95,117,10,0,0,0,95,95,109,111,100,117,108,101,95,95,
-    117,12,0,0,0,95,95,113,117,97,108,110,97,109,101,95,
-    95,40,1,0,0,0,117,10,0,0,0,95,95,108,111,99,
-    97,108,115,95,95,40,0,0,0,0,40,0,0,0,0,117,
-    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
-    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,14,0,0,0,95,68,101,97,100,108,111,99,107,69,
-    114,114,111,114,171,0,0,0,115,2,0,0,0,16,1,117,
-    14,0,0,0,95,68,101,97,100,108,111,99,107,69,114,114,
-    111,114,99,1,0,0,0,0,0,0,0,1,0,0,0,2,
-    0,0,0,66,0,0,0,115,86,0,0,0,124,0,0,69,
-    101,0,0,90,1,0,100,0,0,90,2,0,100,1,0,90,
-    3,0,100,2,0,100,3,0,132,0,0,90,4,0,100,4,
-    0,100,5,0,132,0,0,90,5,0,100,6,0,100,7,0,
-    132,0,0,90,6,0,100,8,0,100,9,0,132,0,0,90,
-    7,0,100,10,0,100,11,0,132,0,0,90,8,0,100,12,
-    0,83,40,13,0,0,0,117,11,0,0,0,95,77,111,100,
-    117,108,101,76,111,99,107,117,169,0,0,0,65,32,114,101,
-    99,117,114,115,105,118,101,32,108,111,99,107,32,105,109,112,
-    108,101,109,101,110,116,97,116,105,111,110,32,119,104,105,99,
-    104,32,105,115,32,97,98,108,101,32,116,111,32,100,101,116,
-    101,99,116,32,100,101,97,100,108,111,99,107,115,10,32,32,
-    32,32,40,101,46,103,46,32,116,104,114,101,97,100,32,49,
-    32,116,114,121,105,110,103,32,116,111,32,116,97,107,101,32,
-    108,111,99,107,115,32,65,32,116,104,101,110,32,66,44,32,
-    97,110,100,32,116,104,114,101,97,100,32,50,32,116,114,121,
-    105,110,103,32,116,111,10,32,32,32,32,116,97,107,101,32,
-    108,111,99,107,115,32,66,32,116,104,101,110,32,65,41,46,
-    10,32,32,32,32,99,2,0,0,0,0,0,0,0,2,0,
-    0,0,2,0,0,0,67,0,0,0,115,70,0,0,0,116,
-    0,0,106,1,0,131,0,0,124,0,0,95,2,0,116,0,
-    0,106,1,0,131,0,0,124,0,0,95,3,0,124,1,0,
-    124,0,0,95,4,0,100,0,0,124,0,0,95,5,0,100,
-    1,0,124,0,0,95,6,0,100,1,0,124,0,0,95,7,
-    0,100,0,0,83,40,2,0,0,0,78,105,0,0,0,0,
-    40,8,0,0,0,117,7,0,0,0,95,116,104,114,101,97,
-    100,117,13,0,0,0,97,108,108,111,99,97,116,101,95,108,
-    111,99,107,117,4,0,0,0,108,111,99,107,117,6,0,0,
-    0,119,97,107,101,117,112,117,4,0,0,0,110,97,109,101,
-    117,5,0,0,0,111,119,110,101,114,117,5,0,0,0,99,
-    111,117,110,116,117,7,0,0,0,119,97,105,116,101,114,115,
-    40,2,0,0,0,117,4,0,0,0,115,101,108,102,117,4,
+    5,0,0,0,95,119,114,97,112,143,0,0,0,115,8,0,
+    0,0,0,2,25,1,15,1,32,1,117,5,0,0,0,95,
+    119,114,97,112,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,2,0,0,0,67,0,0,0,115,16,0,0,0,116,0,
+    0,116,1,0,131,1,0,124,0,0,131,1,0,83,40,1,
+    0,0,0,117,75,0,0,0,67,114,101,97,116,101,32,97,
+    32,110,101,119,32,109,111,100,117,108,101,46,10,10,32,32,
+    32,32,84,104,101,32,109,111,100,117,108,101,32,105,115,32,
+    110,111,116,32,101,110,116,101,114,101,100,32,105,110,116,111,
+    32,115,121,115,46,109,111,100,117,108,101,115,46,10,10,32,
+    32,32,32,40,2,0,0,0,117,4,0,0,0,116,121,112,
+    101,117,3,0,0,0,95,105,111,40,1,0,0,0,117,4,
     0,0,0,110,97,109,101,40,0,0,0,0,40,0,0,0,
     0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
     112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
-    97,112,62,117,8,0,0,0,95,95,105,110,105,116,95,95,
-    181,0,0,0,115,12,0,0,0,0,1,15,1,15,1,9,
-    1,9,1,9,1,117,20,0,0,0,95,77,111,100,117,108,
-    101,76,111,99,107,46,95,95,105,110,105,116,95,95,99,1,
-    0,0,0,0,0,0,0,4,0,0,0,2,0,0,0,67,
-    0,0,0,115,87,0,0,0,116,0,0,106,1,0,131,0,
-    0,125,1,0,124,0,0,106,2,0,125,2,0,120,59,0,
-    116,3,0,106,4,0,124,2,0,131,1,0,125,3,0,124,
-    3,0,100,0,0,107,8,0,114,55,0,100,1,0,83,124,
-    3,0,106,2,0,125,2,0,124,2,0,124,1,0,107,2,
-    0,114,24,0,100,2,0,83,113,24,0,100,0,0,83,40,
-    3,0,0,0,78,70,84,40,5,0,0,0,117,7,0,0,
-    0,95,116,104,114,101,97,100,117,9,0,0,0,103,101,116,
-    95,105,100,101,110,116,117,5,0,0,0,111,119,110,101,114,
-    117,12,0,0,0,95,98,108,111,99,107,105,110,103,95,111,
-    110,117,3,0,0,0,103,101,116,40,4,0,0,0,117,4,
-    0,0,0,115,101,108,102,117,2,0,0,0,109,101,117,3,
-    0,0,0,116,105,100,117,4,0,0,0,108,111,99,107,40,
-    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
-    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
-    95,98,111,111,116,115,116,114,97,112,62,117,12,0,0,0,
-    104,97,115,95,100,101,97,100,108,111,99,107,189,0,0,0,
-    115,18,0,0,0,0,2,12,1,9,1,3,1,15,1,12,
-    1,4,1,9,1,12,1,117,24,0,0,0,95,77,111,100,
-    117,108,101,76,111,99,107,46,104,97,115,95,100,101,97,100,
-    108,111,99,107,99,1,0,0,0,0,0,0,0,2,0,0,
-    0,17,0,0,0,67,0,0,0,115,214,0,0,0,116,0,
-    0,106,1,0,131,0,0,125,1,0,124,0,0,116,2,0,
-    124,1,0,60,122,177,0,120,170,0,124,0,0,106,3,0,
-    143,130,0,1,124,0,0,106,4,0,100,1,0,107,2,0,
-    115,68,0,124,0,0,106,5,0,124,1,0,107,2,0,114,
-    96,0,124,1,0,124,0,0,95,5,0,124,0,0,4,106,
-    4,0,100,2,0,55,2,95,4,0,100,3,0,83,124,0,
-    0,106,6,0,131,0,0,114,127,0,116,7,0,100,4,0,
-    124,0,0,22,131,1,0,130,1,0,110,0,0,124,0,0,
-    106,8,0,106,9,0,100,5,0,131,1,0,114,163,0,124,
-    0,0,4,106,10,0,100,2,0,55,2,95,10,0,110,0,
-    0,87,100,6,0,81,88,124,0,0,106,8,0,106,9,0,
-    131,0,0,1,124,0,0,106,8,0,106,11,0,131,0,0,
-    1,113,28,0,87,100,6,0,116,2,0,124,1,0,61,88,
-    100,6,0,83,40,7,0,0,0,117,185,0,0,0,10,32,
-    32,32,32,32,32,32,32,65,99,113,117,105,114,101,32,116,
-    104,101,32,109,111,100,117,108,101,32,108,111,99,107,46,32,
-    32,73,102,32,97,32,112,111,116,101,110,116,105,97,108,32,
-    100,101,97,100,108,111,99,107,32,105,115,32,100,101,116,101,
-    99,116,101,100,44,10,32,32,32,32,32,32,32,32,97,32,
-    95,68,101,97,100,108,111,99,107,69,114,114,111,114,32,105,
-    115,32,114,97,105,115,101,100,46,10,32,32,32,32,32,32,
-    32,32,79,116,104,101,114,119,105,115,101,44,32,116,104,101,
-    32,108,111,99,107,32,105,115,32,97,108,119,97,121,115,32,
-    97,99,113,117,105,114,101,100,32,97,110,100,32,84,114,117,
-    101,32,105,115,32,114,101,116,117,114,110,101,100,46,10,32,
-    32,32,32,32,32,32,32,105,0,0,0,0,105,1,0,0,
-    0,84,117,23,0,0,0,100,101,97,100,108,111,99,107,32,
-    100,101,116,101,99,116,101,100,32,98,121,32,37,114,70,78,
-    40,12,0,0,0,117,7,0,0,0,95,116,104,114,101,97,
-    100,117,9,0,0,0,103,101,116,95,105,100,101,110,116,117,
-    12,0,0,0,95,98,108,111,99,107,105,110,103,95,111,110,
-    117,4,0,0,0,108,111,99,107,117,5,0,0,0,99,111,
-    117,110,116,117,5,0,0,0,111,119,110,101,114,117,12,0,
-    0,0,104,97,115,95,100,101,97,100,108,111,99,107,117,14,
-    0,0,0,95,68,101,97,100,108,111,99,107,69,114,114,111,
-    114,117,6,0,0,0,119,97,107,101,117,112,117,7,0,0,
-    0,97,99,113,117,105,114,101,117,7,0,0,0,119,97,105,
-    116,101,114,115,117,7,0,0,0,114,101,108,101,97,115,101,
-    40,2,0,0,0,117,4,0,0,0,115,101,108,102,117,3,
-    0,0,0,116,105,100,40,0,0,0,0,40,0,0,0,0,
-    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
-    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
-    112,62,117,7,0,0,0,97,99,113,117,105,114,101,201,0,
-    0,0,115,32,0,0,0,0,6,12,1,10,1,3,1,3,
-    1,10,1,30,1,9,1,15,1,4,1,12,1,19,1,18,
-    1,24,2,13,1,20,2,117,19,0,0,0,95,77,111,100,
-    117,108,101,76,111,99,107,46,97,99,113,117,105,114,101,99,
-    1,0,0,0,0,0,0,0,2,0,0,0,10,0,0,0,
-    67,0,0,0,115,165,0,0,0,116,0,0,106,1,0,131,
-    0,0,125,1,0,124,0,0,106,2,0,143,138,0,1,124,
-    0,0,106,3,0,124,1,0,107,3,0,114,52,0,116,4,
-    0,100,1,0,131,1,0,130,1,0,110,0,0,124,0,0,
-    106,5,0,100,2,0,107,4,0,115,73,0,116,6,0,130,
-    1,0,124,0,0,4,106,5,0,100,3,0,56,2,95,5,
-    0,124,0,0,106,5,0,100,2,0,107,2,0,114,155,0,
-    100,0,0,124,0,0,95,3,0,124,0,0,106,7,0,114,
-    155,0,124,0,0,4,106,7,0,100,3,0,56,2,95,7,
-    0,124,0,0,106,8,0,106,9,0,131,0,0,1,113,155,
-    0,110,0,0,87,100,0,0,81,88,100,0,0,83,40,4,
-    0,0,0,78,117,31,0,0,0,99,97,110,110,111,116,32,
-    114,101,108,101,97,115,101,32,117,110,45,97,99,113,117,105,
-    114,101,100,32,108,111,99,107,105,0,0,0,0,105,1,0,
-    0,0,40,10,0,0,0,117,7,0,0,0,95,116,104,114,
-    101,97,100,117,9,0,0,0,103,101,116,95,105,100,101,110,
-    116,117,4,0,0,0,108,111,99,107,117,5,0,0,0,111,
-    119,110,101,114,117,12,0,0,0,82,117,110,116,105,109,101,
-    69,114,114,111,114,117,5,0,0,0,99,111,117,110,116,117,
-    14,0,0,0,65,115,115,101,114,116,105,111,110,69,114,114,
-    111,114,117,7,0,0,0,119,97,105,116,101,114,115,117,6,
-    0,0,0,119,97,107,101,117,112,117,7,0,0,0,114,101,
-    108,101,97,115,101,40,2,0,0,0,117,4,0,0,0,115,
-    101,108,102,117,3,0,0,0,116,105,100,40,0,0,0,0,
+    97,112,62,117,10,0,0,0,110,101,119,95,109,111,100,117,
+    108,101,154,0,0,0,115,2,0,0,0,0,6,117,10,0,
+    0,0,110,101,119,95,109,111,100,117,108,101,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,1,0,0,0,66,0,0,
+    0,115,20,0,0,0,124,0,0,69,101,0,0,90,1,0,
+    100,0,0,90,2,0,100,1,0,83,40,2,0,0,0,117,
+    14,0,0,0,95,68,101,97,100,108,111,99,107,69,114,114,
+    111,114,78,40,3,0,0,0,117,8,0,0,0,95,95,110,
+    97,109,101,95,95,117,10,0,0,0,95,95,109,111,100,117,
+    108,101,95,95,117,12,0,0,0,95,95,113,117,97,108,110,
+    97,109,101,95,95,40,1,0,0,0,117,10,0,0,0,95,
+    95,108,111,99,97,108,115,95,95,40,0,0,0,0,40,0,
+    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
+    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
+    116,114,97,112,62,117,14,0,0,0,95,68,101,97,100,108,
+    111,99,107,69,114,114,111,114,171,0,0,0,115,2,0,0,
+    0,16,1,117,14,0,0,0,95,68,101,97,100,108,111,99,
+    107,69,114,114,111,114,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,2,0,0,0,66,0,0,0,115,86,0,0,0,
+    124,0,0,69,101,0,0,90,1,0,100,0,0,90,2,0,
+    100,1,0,90,3,0,100,2,0,100,3,0,132,0,0,90,
+    4,0,100,4,0,100,5,0,132,0,0,90,5,0,100,6,
+    0,100,7,0,132,0,0,90,6,0,100,8,0,100,9,0,
+    132,0,0,90,7,0,100,10,0,100,11,0,132,0,0,90,
+    8,0,100,12,0,83,40,13,0,0,0,117,11,0,0,0,
+    95,77,111,100,117,108,101,76,111,99,107,117,169,0,0,0,
+    65,32,114,101,99,117,114,115,105,118,101,32,108,111,99,107,
+    32,105,109,112,108,101,109,101,110,116,97,116,105,111,110,32,
+    119,104,105,99,104,32,105,115,32,97,98,108,101,32,116,111,
+    32,100,101,116,101,99,116,32,100,101,97,100,108,111,99,107,
+    115,10,32,32,32,32,40,101,46,103,46,32,116,104,114,101,
+    97,100,32,49,32,116,114,121,105,110,103,32,116,111,32,116,
+    97,107,101,32,108,111,99,107,115,32,65,32,116,104,101,110,
+    32,66,44,32,97,110,100,32,116,104,114,101,97,100,32,50,
+    32,116,114,121,105,110,103,32,116,111,10,32,32,32,32,116,
+    97,107,101,32,108,111,99,107,115,32,66,32,116,104,101,110,
+    32,65,41,46,10,32,32,32,32,99,2,0,0,0,0,0,
+    0,0,2,0,0,0,2,0,0,0,67,0,0,0,115,70,
+    0,0,0,116,0,0,106,1,0,131,0,0,124,0,0,95,
+    2,0,116,0,0,106,1,0,131,0,0,124,0,0,95,3,
+    0,124,1,0,124,0,0,95,4,0,100,0,0,124,0,0,
+    95,5,0,100,1,0,124,0,0,95,6,0,100,1,0,124,
+    0,0,95,7,0,100,0,0,83,40,2,0,0,0,78,105,
+    0,0,0,0,40,8,0,0,0,117,7,0,0,0,95,116,
+    104,114,101,97,100,117,13,0,0,0,97,108,108,111,99,97,
+    116,101,95,108,111,99,107,117,4,0,0,0,108,111,99,107,
+    117,6,0,0,0,119,97,107,101,117,112,117,4,0,0,0,
+    110,97,109,101,117,5,0,0,0,111,119,110,101,114,117,5,
+    0,0,0,99,111,117,110,116,117,7,0,0,0,119,97,105,
+    116,101,114,115,40,2,0,0,0,117,4,0,0,0,115,101,
+    108,102,117,4,0,0,0,110,97,109,101,40,0,0,0,0,
     40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
     110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,7,0,0,0,114,101,108,101,
-    97,115,101,226,0,0,0,115,22,0,0,0,0,1,12,1,
-    10,1,15,1,15,1,21,1,15,1,15,1,9,1,9,1,
-    15,1,117,19,0,0,0,95,77,111,100,117,108,101,76,111,
-    99,107,46,114,101,108,101,97,115,101,99,1,0,0,0,0,
-    0,0,0,1,0,0,0,4,0,0,0,67,0,0,0,115,
-    25,0,0,0,100,1,0,106,0,0,124,0,0,106,1,0,
-    116,2,0,124,0,0,131,1,0,131,2,0,83,40,2,0,
-    0,0,78,117,23,0,0,0,95,77,111,100,117,108,101,76,
+    116,115,116,114,97,112,62,117,8,0,0,0,95,95,105,110,
+    105,116,95,95,181,0,0,0,115,12,0,0,0,0,1,15,
+    1,15,1,9,1,9,1,9,1,117,20,0,0,0,95,77,
+    111,100,117,108,101,76,111,99,107,46,95,95,105,110,105,116,
+    95,95,99,1,0,0,0,0,0,0,0,4,0,0,0,2,
+    0,0,0,67,0,0,0,115,87,0,0,0,116,0,0,106,
+    1,0,131,0,0,125,1,0,124,0,0,106,2,0,125,2,
+    0,120,59,0,116,3,0,106,4,0,124,2,0,131,1,0,
+    125,3,0,124,3,0,100,0,0,107,8,0,114,55,0,100,
+    1,0,83,124,3,0,106,2,0,125,2,0,124,2,0,124,
+    1,0,107,2,0,114,24,0,100,2,0,83,113,24,0,100,
+    0,0,83,40,3,0,0,0,78,70,84,40,5,0,0,0,
+    117,7,0,0,0,95,116,104,114,101,97,100,117,9,0,0,
+    0,103,101,116,95,105,100,101,110,116,117,5,0,0,0,111,
+    119,110,101,114,117,12,0,0,0,95,98,108,111,99,107,105,
+    110,103,95,111,110,117,3,0,0,0,103,101,116,40,4,0,
+    0,0,117,4,0,0,0,115,101,108,102,117,2,0,0,0,
+    109,101,117,3,0,0,0,116,105,100,117,4,0,0,0,108,
+    111,99,107,40,0,0,0,0,40,0,0,0,0,117,29,0,
+    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
+    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
+    12,0,0,0,104,97,115,95,100,101,97,100,108,111,99,107,
+    189,0,0,0,115,18,0,0,0,0,2,12,1,9,1,3,
+    1,15,1,12,1,4,1,9,1,12,1,117,24,0,0,0,
+    95,77,111,100,117,108,101,76,111,99,107,46,104,97,115,95,
+    100,101,97,100,108,111,99,107,99,1,0,0,0,0,0,0,
+    0,2,0,0,0,17,0,0,0,67,0,0,0,115,214,0,
+    0,0,116,0,0,106,1,0,131,0,0,125,1,0,124,0,
+    0,116,2,0,124,1,0,60,122,177,0,120,170,0,124,0,
+    0,106,3,0,143,130,0,1,124,0,0,106,4,0,100,1,
+    0,107,2,0,115,68,0,124,0,0,106,5,0,124,1,0,
+    107,2,0,114,96,0,124,1,0,124,0,0,95,5,0,124,
+    0,0,4,106,4,0,100,2,0,55,2,95,4,0,100,3,
+    0,83,124,0,0,106,6,0,131,0,0,114,127,0,116,7,
+    0,100,4,0,124,0,0,22,131,1,0,130,1,0,110,0,
+    0,124,0,0,106,8,0,106,9,0,100,5,0,131,1,0,
+    114,163,0,124,0,0,4,106,10,0,100,2,0,55,2,95,
+    10,0,110,0,0,87,100,6,0,81,88,124,0,0,106,8,
+    0,106,9,0,131,0,0,1,124,0,0,106,8,0,106,11,
+    0,131,0,0,1,113,28,0,87,100,6,0,116,2,0,124,
+    1,0,61,88,100,6,0,83,40,7,0,0,0,117,185,0,
+    0,0,10,32,32,32,32,32,32,32,32,65,99,113,117,105,
+    114,101,32,116,104,101,32,109,111,100,117,108,101,32,108,111,
+    99,107,46,32,32,73,102,32,97,32,112,111,116,101,110,116,
+    105,97,108,32,100,101,97,100,108,111,99,107,32,105,115,32,
+    100,101,116,101,99,116,101,100,44,10,32,32,32,32,32,32,
+    32,32,97,32,95,68,101,97,100,108,111,99,107,69,114,114,
+    111,114,32,105,115,32,114,97,105,115,101,100,46,10,32,32,
+    32,32,32,32,32,32,79,116,104,101,114,119,105,115,101,44,
+    32,116,104,101,32,108,111,99,107,32,105,115,32,97,108,119,
+    97,121,115,32,97,99,113,117,105,114,101,100,32,97,110,100,
+    32,84,114,117,101,32,105,115,32,114,101,116,117,114,110,101,
+    100,46,10,32,32,32,32,32,32,32,32,105,0,0,0,0,
+    105,1,0,0,0,84,117,23,0,0,0,100,101,97,100,108,
+    111,99,107,32,100,101,116,101,99,116,101,100,32,98,121,32,
+    37,114,70,78,40,12,0,0,0,117,7,0,0,0,95,116,
+    104,114,101,97,100,117,9,0,0,0,103,101,116,95,105,100,
+    101,110,116,117,12,0,0,0,95,98,108,111,99,107,105,110,
+    103,95,111,110,117,4,0,0,0,108,111,99,107,117,5,0,
+    0,0,99,111,117,110,116,117,5,0,0,0,111,119,110,101,
+    114,117,12,0,0,0,104,97,115,95,100,101,97,100,108,111,
+    99,107,117,14,0,0,0,95,68,101,97,100,108,111,99,107,
+    69,114,114,111,114,117,6,0,0,0,119,97,107,101,117,112,
+    117,7,0,0,0,97,99,113,117,105,114,101,117,7,0,0,
+    0,119,97,105,116,101,114,115,117,7,0,0,0,114,101,108,
+    101,97,115,101,40,2,0,0,0,117,4,0,0,0,115,101,
+    108,102,117,3,0,0,0,116,105,100,40,0,0,0,0,40,
+    0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,
+    32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,
+    115,116,114,97,112,62,117,7,0,0,0,97,99,113,117,105,
+    114,101,201,0,0,0,115,32,0,0,0,0,6,12,1,10,
+    1,3,1,3,1,10,1,30,1,9,1,15,1,4,1,12,
+    1,19,1,18,1,24,2,13,1,20,2,117,19,0,0,0,
+    95,77,111,100,117,108,101,76,111,99,107,46,97,99,113,117,
+    105,114,101,99,1,0,0,0,0,0,0,0,2,0,0,0,
+    10,0,0,0,67,0,0,0,115,165,0,0,0,116,0,0,
+    106,1,0,131,0,0,125,1,0,124,0,0,106,2,0,143,
+    138,0,1,124,0,0,106,3,0,124,1,0,107,3,0,114,
+    52,0,116,4,0,100,1,0,131,1,0,130,1,0,110,0,
+    0,124,0,0,106,5,0,100,2,0,107,4,0,115,73,0,
+    116,6,0,130,1,0,124,0,0,4,106,5,0,100,3,0,
+    56,2,95,5,0,124,0,0,106,5,0,100,2,0,107,2,
+    0,114,155,0,100,0,0,124,0,0,95,3,0,124,0,0,
+    106,7,0,114,155,0,124,0,0,4,106,7,0,100,3,0,
+    56,2,95,7,0,124,0,0,106,8,0,106,9,0,131,0,
+    0,1,113,155,0,110,0,0,87,100,0,0,81,88,100,0,
+    0,83,40,4,0,0,0,78,117,31,0,0,0,99,97,110,
+    110,111,116,32,114,101,108,101,97,115,101,32,117,110,45,97,
+    99,113,117,105,114,101,100,32,108,111,99,107,105,0,0,0,
+    0,105,1,0,0,0,40,10,0,0,0,117,7,0,0,0,
+    95,116,104,114,101,97,100,117,9,0,0,0,103,101,116,95,
+    105,100,101,110,116,117,4,0,0,0,108,111,99,107,117,5,
+    0,0,0,111,119,110,101,114,117,12,0,0,0,82,117,110,
+    116,105,109,101,69,114,114,111,114,117,5,0,0,0,99,111,
+    117,110,116,117,14,0,0,0,65,115,115,101,114,116,105,111,
+    110,69,114,114,111,114,117,7,0,0,0,119,97,105,116,101,
+    114,115,117,6,0,0,0,119,97,107,101,117,112,117,7,0,
+    0,0,114,101,108,101,97,115,101,40,2,0,0,0,117,4,
+    0,0,0,115,101,108,102,117,3,0,0,0,116,105,100,40,
+    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
+    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
+    95,98,111,111,116,115,116,114,97,112,62,117,7,0,0,0,
+    114,101,108,101,97,115,101,226,0,0,0,115,22,0,0,0,
+    0,1,12,1,10,1,15,1,15,1,21,1,15,1,15,1,
+    9,1,9,1,15,1,117,19,0,0,0,95,77,111,100,117,
+    108,101,76,111,99,107,46,114,101,108,101,97,115,101,99,1,
+    0,0,0,0,0,0,0,1,0,0,0,4,0,0,0,67,
+    0,0,0,115,25,0,0,0,100,1,0,106,0,0,124,0,
+    0,106,1,0,116,2,0,124,0,0,131,1,0,131,2,0,
+    83,40,2,0,0,0,78,117,23,0,0,0,95,77,111,100,
+    117,108,101,76,111,99,107,40,123,33,114,125,41,32,97,116,
+    32,123,125,40,3,0,0,0,117,6,0,0,0,102,111,114,
+    109,97,116,117,4,0,0,0,110,97,109,101,117,2,0,0,
+    0,105,100,40,1,0,0,0,117,4,0,0,0,115,101,108,
+    102,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,8,0,
+    0,0,95,95,114,101,112,114,95,95,239,0,0,0,115,2,
+    0,0,0,0,1,117,20,0,0,0,95,77,111,100,117,108,
+    101,76,111,99,107,46,95,95,114,101,112,114,95,95,78,40,
+    9,0,0,0,117,8,0,0,0,95,95,110,97,109,101,95,
+    95,117,10,0,0,0,95,95,109,111,100,117,108,101,95,95,
+    117,12,0,0,0,95,95,113,117,97,108,110,97,109,101,95,
+    95,117,7,0,0,0,95,95,100,111,99,95,95,117,8,0,
+    0,0,95,95,105,110,105,116,95,95,117,12,0,0,0,104,
+    97,115,95,100,101,97,100,108,111,99,107,117,7,0,0,0,
+    97,99,113,117,105,114,101,117,7,0,0,0,114,101,108,101,
+    97,115,101,117,8,0,0,0,95,95,114,101,112,114,95,95,
+    40,1,0,0,0,117,10,0,0,0,95,95,108,111,99,97,
+    108,115,95,95,40,0,0,0,0,40,0,0,0,0,117,29,
+    0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
+    116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
+    117,11,0,0,0,95,77,111,100,117,108,101,76,111,99,107,
+    175,0,0,0,115,12,0,0,0,16,4,6,2,12,8,12,
+    12,12,25,12,13,117,11,0,0,0,95,77,111,100,117,108,
+    101,76,111,99,107,99,1,0,0,0,0,0,0,0,1,0,
+    0,0,2,0,0,0,66,0,0,0,115,74,0,0,0,124,
+    0,0,69,101,0,0,90,1,0,100,0,0,90,2,0,100,
+    1,0,90,3,0,100,2,0,100,3,0,132,0,0,90,4,
+    0,100,4,0,100,5,0,132,0,0,90,5,0,100,6,0,
+    100,7,0,132,0,0,90,6,0,100,8,0,100,9,0,132,
+    0,0,90,7,0,100,10,0,83,40,11,0,0,0,117,16,
+    0,0,0,95,68,117,109,109,121,77,111,100,117,108,101,76,
+    111,99,107,117,86,0,0,0,65,32,115,105,109,112,108,101,
+    32,95,77,111,100,117,108,101,76,111,99,107,32,101,113,117,
+    105,118,97,108,101,110,116,32,102,111,114,32,80,121,116,104,
+    111,110,32,98,117,105,108,100,115,32,119,105,116,104,111,117,
+    116,10,32,32,32,32,109,117,108,116,105,45,116,104,114,101,
+    97,100,105,110,103,32,115,117,112,112,111,114,116,46,99,2,
+    0,0,0,0,0,0,0,2,0,0,0,2,0,0,0,67,
+    0,0,0,115,22,0,0,0,124,1,0,124,0,0,95,0,
+    0,100,1,0,124,0,0,95,1,0,100,0,0,83,40,2,
+    0,0,0,78,105,0,0,0,0,40,2,0,0,0,117,4,
+    0,0,0,110,97,109,101,117,5,0,0,0,99,111,117,110,
+    116,40,2,0,0,0,117,4,0,0,0,115,101,108,102,117,
+    4,0,0,0,110,97,109,101,40,0,0,0,0,40,0,0,
+    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,117,8,0,0,0,95,95,105,110,105,116,95,
+    95,247,0,0,0,115,4,0,0,0,0,1,9,1,117,25,
+    0,0,0,95,68,117,109,109,121,77,111,100,117,108,101,76,
+    111,99,107,46,95,95,105,110,105,116,95,95,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,3,0,0,0,67,0,0,
+    0,115,19,0,0,0,124,0,0,4,106,0,0,100,1,0,
+    55,2,95,0,0,100,2,0,83,40,3,0,0,0,78,105,
+    1,0,0,0,84,40,1,0,0,0,117,5,0,0,0,99,
+    111,117,110,116,40,1,0,0,0,117,4,0,0,0,115,101,
+    108,102,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,7,
+    0,0,0,97,99,113,117,105,114,101,251,0,0,0,115,4,
+    0,0,0,0,1,15,1,117,24,0,0,0,95,68,117,109,
+    109,121,77,111,100,117,108,101,76,111,99,107,46,97,99,113,
+    117,105,114,101,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,3,0,0,0,67,0,0,0,115,49,0,0,0,124,0,
+    0,106,0,0,100,1,0,107,2,0,114,30,0,116,1,0,
+    100,2,0,131,1,0,130,1,0,110,0,0,124,0,0,4,
+    106,0,0,100,3,0,56,2,95,0,0,100,0,0,83,40,
+    4,0,0,0,78,105,0,0,0,0,117,31,0,0,0,99,
+    97,110,110,111,116,32,114,101,108,101,97,115,101,32,117,110,
+    45,97,99,113,117,105,114,101,100,32,108,111,99,107,105,1,
+    0,0,0,40,2,0,0,0,117,5,0,0,0,99,111,117,
+    110,116,117,12,0,0,0,82,117,110,116,105,109,101,69,114,
+    114,111,114,40,1,0,0,0,117,4,0,0,0,115,101,108,
+    102,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,7,0,
+    0,0,114,101,108,101,97,115,101,255,0,0,0,115,6,0,
+    0,0,0,1,15,1,15,1,117,24,0,0,0,95,68,117,
+    109,109,121,77,111,100,117,108,101,76,111,99,107,46,114,101,
+    108,101,97,115,101,99,1,0,0,0,0,0,0,0,1,0,
+    0,0,4,0,0,0,67,0,0,0,115,25,0,0,0,100,
+    1,0,106,0,0,124,0,0,106,1,0,116,2,0,124,0,
+    0,131,1,0,131,2,0,83,40,2,0,0,0,78,117,28,
+    0,0,0,95,68,117,109,109,121,77,111,100,117,108,101,76,
     111,99,107,40,123,33,114,125,41,32,97,116,32,123,125,40,
     3,0,0,0,117,6,0,0,0,102,111,114,109,97,116,117,
     4,0,0,0,110,97,109,101,117,2,0,0,0,105,100,40,
@@ -534,1070 +621,840 @@ unsigned char _Py_M__importlib[] = {
     0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
     122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
     111,111,116,115,116,114,97,112,62,117,8,0,0,0,95,95,
-    114,101,112,114,95,95,239,0,0,0,115,2,0,0,0,0,
-    1,117,20,0,0,0,95,77,111,100,117,108,101,76,111,99,
-    107,46,95,95,114,101,112,114,95,95,78,40,9,0,0,0,
-    117,8,0,0,0,95,95,110,97,109,101,95,95,117,10,0,
-    0,0,95,95,109,111,100,117,108,101,95,95,117,12,0,0,
-    0,95,95,113,117,97,108,110,97,109,101,95,95,117,7,0,
-    0,0,95,95,100,111,99,95,95,117,8,0,0,0,95,95,
-    105,110,105,116,95,95,117,12,0,0,0,104,97,115,95,100,
-    101,97,100,108,111,99,107,117,7,0,0,0,97,99,113,117,
-    105,114,101,117,7,0,0,0,114,101,108,101,97,115,101,117,
-    8,0,0,0,95,95,114,101,112,114,95,95,40,1,0,0,
-    0,117,10,0,0,0,95,95,108,111,99,97,108,115,95,95,
-    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
-    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
-    46,95,98,111,111,116,115,116,114,97,112,62,117,11,0,0,
-    0,95,77,111,100,117,108,101,76,111,99,107,175,0,0,0,
-    115,12,0,0,0,16,4,6,2,12,8,12,12,12,25,12,
-    13,117,11,0,0,0,95,77,111,100,117,108,101,76,111,99,
-    107,99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,
-    0,0,66,0,0,0,115,74,0,0,0,124,0,0,69,101,
-    0,0,90,1,0,100,0,0,90,2,0,100,1,0,90,3,
-    0,100,2,0,100,3,0,132,0,0,90,4,0,100,4,0,
-    100,5,0,132,0,0,90,5,0,100,6,0,100,7,0,132,
-    0,0,90,6,0,100,8,0,100,9,0,132,0,0,90,7,
-    0,100,10,0,83,40,11,0,0,0,117,16,0,0,0,95,
-    68,117,109,109,121,77,111,100,117,108,101,76,111,99,107,117,
-    86,0,0,0,65,32,115,105,109,112,108,101,32,95,77,111,
-    100,117,108,101,76,111,99,107,32,101,113,117,105,118,97,108,
-    101,110,116,32,102,111,114,32,80,121,116,104,111,110,32,98,
-    117,105,108,100,115,32,119,105,116,104,111,117,116,10,32,32,
-    32,32,109,117,108,116,105,45,116,104,114,101,97,100,105,110,
-    103,32,115,117,112,112,111,114,116,46,99,2,0,0,0,0,
-    0,0,0,2,0,0,0,2,0,0,0,67,0,0,0,115,
-    22,0,0,0,124,1,0,124,0,0,95,0,0,100,1,0,
-    124,0,0,95,1,0,100,0,0,83,40,2,0,0,0,78,
-    105,0,0,0,0,40,2,0,0,0,117,4,0,0,0,110,
-    97,109,101,117,5,0,0,0,99,111,117,110,116,40,2,0,
-    0,0,117,4,0,0,0,115,101,108,102,117,4,0,0,0,
-    110,97,109,101,40,0,0,0,0,40,0,0,0,0,117,29,
+    114,101,112,114,95,95,4,1,0,0,115,2,0,0,0,0,
+    1,117,25,0,0,0,95,68,117,109,109,121,77,111,100,117,
+    108,101,76,111,99,107,46,95,95,114,101,112,114,95,95,78,
+    40,8,0,0,0,117,8,0,0,0,95,95,110,97,109,101,
+    95,95,117,10,0,0,0,95,95,109,111,100,117,108,101,95,
+    95,117,12,0,0,0,95,95,113,117,97,108,110,97,109,101,
+    95,95,117,7,0,0,0,95,95,100,111,99,95,95,117,8,
+    0,0,0,95,95,105,110,105,116,95,95,117,7,0,0,0,
+    97,99,113,117,105,114,101,117,7,0,0,0,114,101,108,101,
+    97,115,101,117,8,0,0,0,95,95,114,101,112,114,95,95,
+    40,1,0,0,0,117,10,0,0,0,95,95,108,111,99,97,
+    108,115,95,95,40,0,0,0,0,40,0,0,0,0,117,29,
     0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
     116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
-    117,8,0,0,0,95,95,105,110,105,116,95,95,247,0,0,
-    0,115,4,0,0,0,0,1,9,1,117,25,0,0,0,95,
-    68,117,109,109,121,77,111,100,117,108,101,76,111,99,107,46,
-    95,95,105,110,105,116,95,95,99,1,0,0,0,0,0,0,
-    0,1,0,0,0,3,0,0,0,67,0,0,0,115,19,0,
-    0,0,124,0,0,4,106,0,0,100,1,0,55,2,95,0,
-    0,100,2,0,83,40,3,0,0,0,78,105,1,0,0,0,
-    84,40,1,0,0,0,117,5,0,0,0,99,111,117,110,116,
-    40,1,0,0,0,117,4,0,0,0,115,101,108,102,40,0,
-    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,7,0,0,0,97,
-    99,113,117,105,114,101,251,0,0,0,115,4,0,0,0,0,
-    1,15,1,117,24,0,0,0,95,68,117,109,109,121,77,111,
-    100,117,108,101,76,111,99,107,46,97,99,113,117,105,114,101,
-    99,1,0,0,0,0,0,0,0,1,0,0,0,3,0,0,
-    0,67,0,0,0,115,49,0,0,0,124,0,0,106,0,0,
-    100,1,0,107,2,0,114,30,0,116,1,0,100,2,0,131,
-    1,0,130,1,0,110,0,0,124,0,0,4,106,0,0,100,
-    3,0,56,2,95,0,0,100,0,0,83,40,4,0,0,0,
-    78,105,0,0,0,0,117,31,0,0,0,99,97,110,110,111,
-    116,32,114,101,108,101,97,115,101,32,117,110,45,97,99,113,
-    117,105,114,101,100,32,108,111,99,107,105,1,0,0,0,40,
-    2,0,0,0,117,5,0,0,0,99,111,117,110,116,117,12,
-    0,0,0,82,117,110,116,105,109,101,69,114,114,111,114,40,
-    1,0,0,0,117,4,0,0,0,115,101,108,102,40,0,0,
-    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
-    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
-    111,111,116,115,116,114,97,112,62,117,7,0,0,0,114,101,
-    108,101,97,115,101,255,0,0,0,115,6,0,0,0,0,1,
-    15,1,15,1,117,24,0,0,0,95,68,117,109,109,121,77,
-    111,100,117,108,101,76,111,99,107,46,114,101,108,101,97,115,
-    101,99,1,0,0,0,0,0,0,0,1,0,0,0,4,0,
-    0,0,67,0,0,0,115,25,0,0,0,100,1,0,106,0,
-    0,124,0,0,106,1,0,116,2,0,124,0,0,131,1,0,
-    131,2,0,83,40,2,0,0,0,78,117,28,0,0,0,95,
-    68,117,109,109,121,77,111,100,117,108,101,76,111,99,107,40,
-    123,33,114,125,41,32,97,116,32,123,125,40,3,0,0,0,
-    117,6,0,0,0,102,111,114,109,97,116,117,4,0,0,0,
-    110,97,109,101,117,2,0,0,0,105,100,40,1,0,0,0,
-    117,4,0,0,0,115,101,108,102,40,0,0,0,0,40,0,
-    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
-    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
-    116,114,97,112,62,117,8,0,0,0,95,95,114,101,112,114,
-    95,95,4,1,0,0,115,2,0,0,0,0,1,117,25,0,
-    0,0,95,68,117,109,109,121,77,111,100,117,108,101,76,111,
-    99,107,46,95,95,114,101,112,114,95,95,78,40,8,0,0,
-    0,117,8,0,0,0,95,95,110,97,109,101,95,95,117,10,
-    0,0,0,95,95,109,111,100,117,108,101,95,95,117,12,0,
-    0,0,95,95,113,117,97,108,110,97,109,101,95,95,117,7,
-    0,0,0,95,95,100,111,99,95,95,117,8,0,0,0,95,
-    95,105,110,105,116,95,95,117,7,0,0,0,97,99,113,117,
-    105,114,101,117,7,0,0,0,114,101,108,101,97,115,101,117,
-    8,0,0,0,95,95,114,101,112,114,95,95,40,1,0,0,
-    0,117,10,0,0,0,95,95,108,111,99,97,108,115,95,95,
+    117,16,0,0,0,95,68,117,109,109,121,77,111,100,117,108,
+    101,76,111,99,107,243,0,0,0,115,10,0,0,0,16,2,
+    6,2,12,4,12,4,12,5,117,16,0,0,0,95,68,117,
+    109,109,121,77,111,100,117,108,101,76,111,99,107,99,1,0,
+    0,0,0,0,0,0,3,0,0,0,11,0,0,0,3,0,
+    0,0,115,142,0,0,0,100,1,0,125,1,0,121,17,0,
+    116,0,0,136,0,0,25,131,0,0,125,1,0,87,110,18,
+    0,4,116,1,0,107,10,0,114,43,0,1,1,1,89,110,
+    1,0,88,124,1,0,100,1,0,107,8,0,114,138,0,116,
+    2,0,100,1,0,107,8,0,114,83,0,116,3,0,136,0,
+    0,131,1,0,125,1,0,110,12,0,116,4,0,136,0,0,
+    131,1,0,125,1,0,135,0,0,102,1,0,100,2,0,100,
+    3,0,134,0,0,125,2,0,116,5,0,106,6,0,124,1,
+    0,124,2,0,131,2,0,116,0,0,136,0,0,60,110,0,
+    0,124,1,0,83,40,4,0,0,0,117,109,0,0,0,71,
+    101,116,32,111,114,32,99,114,101,97,116,101,32,116,104,101,
+    32,109,111,100,117,108,101,32,108,111,99,107,32,102,111,114,
+    32,97,32,103,105,118,101,110,32,109,111,100,117,108,101,32,
+    110,97,109,101,46,10,10,32,32,32,32,83,104,111,117,108,
+    100,32,111,110,108,121,32,98,101,32,99,97,108,108,101,100,
+    32,119,105,116,104,32,116,104,101,32,105,109,112,111,114,116,
+    32,108,111,99,107,32,116,97,107,101,110,46,78,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,2,0,0,0,19,0,
+    0,0,115,11,0,0,0,116,0,0,136,0,0,61,100,0,
+    0,83,40,1,0,0,0,78,40,1,0,0,0,117,13,0,
+    0,0,95,109,111,100,117,108,101,95,108,111,99,107,115,40,
+    1,0,0,0,117,1,0,0,0,95,40,1,0,0,0,117,
+    4,0,0,0,110,97,109,101,40,0,0,0,0,117,29,0,
+    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
+    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
+    2,0,0,0,99,98,24,1,0,0,115,2,0,0,0,0,
+    1,117,28,0,0,0,95,103,101,116,95,109,111,100,117,108,
+    101,95,108,111,99,107,46,60,108,111,99,97,108,115,62,46,
+    99,98,40,7,0,0,0,117,13,0,0,0,95,109,111,100,
+    117,108,101,95,108,111,99,107,115,117,8,0,0,0,75,101,
+    121,69,114,114,111,114,117,7,0,0,0,95,116,104,114,101,
+    97,100,117,16,0,0,0,95,68,117,109,109,121,77,111,100,
+    117,108,101,76,111,99,107,117,11,0,0,0,95,77,111,100,
+    117,108,101,76,111,99,107,117,8,0,0,0,95,119,101,97,
+    107,114,101,102,117,3,0,0,0,114,101,102,40,3,0,0,
+    0,117,4,0,0,0,110,97,109,101,117,4,0,0,0,108,
+    111,99,107,117,2,0,0,0,99,98,40,0,0,0,0,40,
+    1,0,0,0,117,4,0,0,0,110,97,109,101,117,29,0,
+    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
+    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
+    16,0,0,0,95,103,101,116,95,109,111,100,117,108,101,95,
+    108,111,99,107,10,1,0,0,115,24,0,0,0,0,4,6,
+    1,3,1,17,1,13,1,5,1,12,1,12,1,15,2,12,
+    1,18,2,25,1,117,16,0,0,0,95,103,101,116,95,109,
+    111,100,117,108,101,95,108,111,99,107,99,1,0,0,0,0,
+    0,0,0,2,0,0,0,11,0,0,0,67,0,0,0,115,
+    71,0,0,0,116,0,0,124,0,0,131,1,0,125,1,0,
+    116,1,0,106,2,0,131,0,0,1,121,14,0,124,1,0,
+    106,3,0,131,0,0,1,87,110,18,0,4,116,4,0,107,
+    10,0,114,56,0,1,1,1,89,110,11,0,88,124,1,0,
+    106,5,0,131,0,0,1,100,1,0,83,40,2,0,0,0,
+    117,21,1,0,0,82,101,108,101,97,115,101,32,116,104,101,
+    32,103,108,111,98,97,108,32,105,109,112,111,114,116,32,108,
+    111,99,107,44,32,97,110,100,32,97,99,113,117,105,114,101,
+    115,32,116,104,101,110,32,114,101,108,101,97,115,101,32,116,
+    104,101,10,32,32,32,32,109,111,100,117,108,101,32,108,111,
+    99,107,32,102,111,114,32,97,32,103,105,118,101,110,32,109,
+    111,100,117,108,101,32,110,97,109,101,46,10,32,32,32,32,
+    84,104,105,115,32,105,115,32,117,115,101,100,32,116,111,32,
+    101,110,115,117,114,101,32,97,32,109,111,100,117,108,101,32,
+    105,115,32,99,111,109,112,108,101,116,101,108,121,32,105,110,
+    105,116,105,97,108,105,122,101,100,44,32,105,110,32,116,104,
+    101,10,32,32,32,32,101,118,101,110,116,32,105,116,32,105,
+    115,32,98,101,105,110,103,32,105,109,112,111,114,116,101,100,
+    32,98,121,32,97,110,111,116,104,101,114,32,116,104,114,101,
+    97,100,46,10,10,32,32,32,32,83,104,111,117,108,100,32,
+    111,110,108,121,32,98,101,32,99,97,108,108,101,100,32,119,
+    105,116,104,32,116,104,101,32,105,109,112,111,114,116,32,108,
+    111,99,107,32,116,97,107,101,110,46,78,40,6,0,0,0,
+    117,16,0,0,0,95,103,101,116,95,109,111,100,117,108,101,
+    95,108,111,99,107,117,4,0,0,0,95,105,109,112,117,12,
+    0,0,0,114,101,108,101,97,115,101,95,108,111,99,107,117,
+    7,0,0,0,97,99,113,117,105,114,101,117,14,0,0,0,
+    95,68,101,97,100,108,111,99,107,69,114,114,111,114,117,7,
+    0,0,0,114,101,108,101,97,115,101,40,2,0,0,0,117,
+    4,0,0,0,110,97,109,101,117,4,0,0,0,108,111,99,
+    107,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,19,0,
+    0,0,95,108,111,99,107,95,117,110,108,111,99,107,95,109,
+    111,100,117,108,101,29,1,0,0,115,14,0,0,0,0,7,
+    12,1,10,1,3,1,14,1,13,3,5,2,117,19,0,0,
+    0,95,108,111,99,107,95,117,110,108,111,99,107,95,109,111,
+    100,117,108,101,99,1,0,0,0,0,0,0,0,3,0,0,
+    0,3,0,0,0,79,0,0,0,115,13,0,0,0,124,0,
+    0,124,1,0,124,2,0,142,0,0,83,40,1,0,0,0,
+    117,46,1,0,0,114,101,109,111,118,101,95,105,109,112,111,
+    114,116,108,105,98,95,102,114,97,109,101,115,32,105,110,32,
+    105,109,112,111,114,116,46,99,32,119,105,108,108,32,97,108,
+    119,97,121,115,32,114,101,109,111,118,101,32,115,101,113,117,
+    101,110,99,101,115,10,32,32,32,32,111,102,32,105,109,112,
+    111,114,116,108,105,98,32,102,114,97,109,101,115,32,116,104,
+    97,116,32,101,110,100,32,119,105,116,104,32,97,32,99,97,
+    108,108,32,116,111,32,116,104,105,115,32,102,117,110,99,116,
+    105,111,110,10,10,32,32,32,32,85,115,101,32,105,116,32,
+    105,110,115,116,101,97,100,32,111,102,32,97,32,110,111,114,
+    109,97,108,32,99,97,108,108,32,105,110,32,112,108,97,99,
+    101,115,32,119,104,101,114,101,32,105,110,99,108,117,100,105,
+    110,103,32,116,104,101,32,105,109,112,111,114,116,108,105,98,
+    10,32,32,32,32,102,114,97,109,101,115,32,105,110,116,114,
+    111,100,117,99,101,115,32,117,110,119,97,110,116,101,100,32,
+    110,111,105,115,101,32,105,110,116,111,32,116,104,101,32,116,
+    114,97,99,101,98,97,99,107,32,40,101,46,103,46,32,119,
+    104,101,110,32,101,120,101,99,117,116,105,110,103,10,32,32,
+    32,32,109,111,100,117,108,101,32,99,111,100,101,41,10,32,
+    32,32,32,40,0,0,0,0,40,3,0,0,0,117,1,0,
+    0,0,102,117,4,0,0,0,97,114,103,115,117,4,0,0,
+    0,107,119,100,115,40,0,0,0,0,40,0,0,0,0,117,
+    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
+    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
+    62,117,25,0,0,0,95,99,97,108,108,95,119,105,116,104,
+    95,102,114,97,109,101,115,95,114,101,109,111,118,101,100,49,
+    1,0,0,115,2,0,0,0,0,8,117,25,0,0,0,95,
+    99,97,108,108,95,119,105,116,104,95,102,114,97,109,101,115,
+    95,114,101,109,111,118,101,100,105,158,12,0,0,117,1,0,
+    0,0,13,105,16,0,0,0,117,1,0,0,0,10,105,24,
+    0,0,0,99,1,0,0,0,0,0,0,0,2,0,0,0,
+    3,0,0,0,99,0,0,0,115,29,0,0,0,124,0,0,
+    93,19,0,125,1,0,116,0,0,124,1,0,63,100,0,0,
+    64,86,1,113,3,0,100,1,0,83,40,2,0,0,0,105,
+    255,0,0,0,78,40,1,0,0,0,117,17,0,0,0,95,
+    82,65,87,95,77,65,71,73,67,95,78,85,77,66,69,82,
+    40,2,0,0,0,117,2,0,0,0,46,48,117,1,0,0,
+    0,110,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,9,
+    0,0,0,60,103,101,110,101,120,112,114,62,150,1,0,0,
+    115,2,0,0,0,6,0,117,9,0,0,0,60,103,101,110,
+    101,120,112,114,62,105,0,0,0,0,105,25,0,0,0,105,
+    8,0,0,0,117,11,0,0,0,95,95,112,121,99,97,99,
+    104,101,95,95,117,3,0,0,0,46,112,121,117,4,0,0,
+    0,46,112,121,99,117,4,0,0,0,46,112,121,111,78,99,
+    2,0,0,0,0,0,0,0,11,0,0,0,6,0,0,0,
+    67,0,0,0,115,180,0,0,0,124,1,0,100,1,0,107,
+    8,0,114,25,0,116,0,0,106,1,0,106,2,0,12,110,
+    3,0,124,1,0,125,2,0,124,2,0,114,46,0,116,3,
+    0,125,3,0,110,6,0,116,4,0,125,3,0,116,5,0,
+    124,0,0,131,1,0,92,2,0,125,4,0,125,5,0,124,
+    5,0,106,6,0,100,2,0,131,1,0,92,3,0,125,6,
+    0,125,7,0,125,8,0,116,0,0,106,7,0,106,8,0,
+    125,9,0,124,9,0,100,1,0,107,8,0,114,133,0,116,
+    9,0,100,3,0,131,1,0,130,1,0,110,0,0,100,4,
+    0,106,10,0,124,6,0,124,7,0,124,9,0,124,3,0,
+    100,5,0,25,103,4,0,131,1,0,125,10,0,116,11,0,
+    124,4,0,116,12,0,124,10,0,131,3,0,83,40,6,0,
+    0,0,117,244,1,0,0,71,105,118,101,110,32,116,104,101,
+    32,112,97,116,104,32,116,111,32,97,32,46,112,121,32,102,
+    105,108,101,44,32,114,101,116,117,114,110,32,116,104,101,32,
+    112,97,116,104,32,116,111,32,105,116,115,32,46,112,121,99,
+    47,46,112,121,111,32,102,105,108,101,46,10,10,32,32,32,
+    32,84,104,101,32,46,112,121,32,102,105,108,101,32,100,111,
+    101,115,32,110,111,116,32,110,101,101,100,32,116,111,32,101,
+    120,105,115,116,59,32,116,104,105,115,32,115,105,109,112,108,
+    121,32,114,101,116,117,114,110,115,32,116,104,101,32,112,97,
+    116,104,32,116,111,32,116,104,101,10,32,32,32,32,46,112,
+    121,99,47,46,112,121,111,32,102,105,108,101,32,99,97,108,
+    99,117,108,97,116,101,100,32,97,115,32,105,102,32,116,104,
+    101,32,46,112,121,32,102,105,108,101,32,119,101,114,101,32,
+    105,109,112,111,114,116,101,100,46,32,32,84,104,101,32,101,
+    120,116,101,110,115,105,111,110,10,32,32,32,32,119,105,108,
+    108,32,98,101,32,46,112,121,99,32,117,110,108,101,115,115,
+    32,115,121,115,46,102,108,97,103,115,46,111,112,116,105,109,
+    105,122,101,32,105,115,32,110,111,110,45,122,101,114,111,44,
+    32,116,104,101,110,32,105,116,32,119,105,108,108,32,98,101,
+    32,46,112,121,111,46,10,10,32,32,32,32,73,102,32,100,
+    101,98,117,103,95,111,118,101,114,114,105,100,101,32,105,115,
+    32,110,111,116,32,78,111,110,101,44,32,116,104,101,110,32,
+    105,116,32,109,117,115,116,32,98,101,32,97,32,98,111,111,
+    108,101,97,110,32,97,110,100,32,105,115,32,117,115,101,100,
+    32,105,110,10,32,32,32,32,112,108,97,99,101,32,111,102,
+    32,115,121,115,46,102,108,97,103,115,46,111,112,116,105,109,
+    105,122,101,46,10,10,32,32,32,32,73,102,32,115,121,115,
+    46,105,109,112,108,101,109,101,110,116,97,116,105,111,110,46,
+    99,97,99,104,101,95,116,97,103,32,105,115,32,78,111,110,
+    101,32,116,104,101,110,32,78,111,116,73,109,112,108,101,109,
+    101,110,116,101,100,69,114,114,111,114,32,105,115,32,114,97,
+    105,115,101,100,46,10,10,32,32,32,32,78,117,1,0,0,
+    0,46,117,36,0,0,0,115,121,115,46,105,109,112,108,101,
+    109,101,110,116,97,116,105,111,110,46,99,97,99,104,101,95,
+    116,97,103,32,105,115,32,78,111,110,101,117,0,0,0,0,
+    105,0,0,0,0,40,13,0,0,0,117,3,0,0,0,115,
+    121,115,117,5,0,0,0,102,108,97,103,115,117,8,0,0,
+    0,111,112,116,105,109,105,122,101,117,23,0,0,0,68,69,
+    66,85,71,95,66,89,84,69,67,79,68,69,95,83,85,70,
+    70,73,88,69,83,117,27,0,0,0,79,80,84,73,77,73,
+    90,69,68,95,66,89,84,69,67,79,68,69,95,83,85,70,
+    70,73,88,69,83,117,11,0,0,0,95,112,97,116,104,95,
+    115,112,108,105,116,117,9,0,0,0,112,97,114,116,105,116,
+    105,111,110,117,14,0,0,0,105,109,112,108,101,109,101,110,
+    116,97,116,105,111,110,117,9,0,0,0,99,97,99,104,101,
+    95,116,97,103,117,19,0,0,0,78,111,116,73,109,112,108,
+    101,109,101,110,116,101,100,69,114,114,111,114,117,4,0,0,
+    0,106,111,105,110,117,10,0,0,0,95,112,97,116,104,95,
+    106,111,105,110,117,8,0,0,0,95,80,89,67,65,67,72,
+    69,40,11,0,0,0,117,4,0,0,0,112,97,116,104,117,
+    14,0,0,0,100,101,98,117,103,95,111,118,101,114,114,105,
+    100,101,117,5,0,0,0,100,101,98,117,103,117,8,0,0,
+    0,115,117,102,102,105,120,101,115,117,4,0,0,0,104,101,
+    97,100,117,4,0,0,0,116,97,105,108,117,13,0,0,0,
+    98,97,115,101,95,102,105,108,101,110,97,109,101,117,3,0,
+    0,0,115,101,112,117,1,0,0,0,95,117,3,0,0,0,
+    116,97,103,117,8,0,0,0,102,105,108,101,110,97,109,101,
     40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
     102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
-    46,95,98,111,111,116,115,116,114,97,112,62,117,16,0,0,
-    0,95,68,117,109,109,121,77,111,100,117,108,101,76,111,99,
-    107,243,0,0,0,115,10,0,0,0,16,2,6,2,12,4,
-    12,4,12,5,117,16,0,0,0,95,68,117,109,109,121,77,
-    111,100,117,108,101,76,111,99,107,99,1,0,0,0,0,0,
-    0,0,3,0,0,0,11,0,0,0,3,0,0,0,115,142,
-    0,0,0,100,1,0,125,1,0,121,17,0,116,0,0,136,
-    0,0,25,131,0,0,125,1,0,87,110,18,0,4,116,1,
-    0,107,10,0,114,43,0,1,1,1,89,110,1,0,88,124,
-    1,0,100,1,0,107,8,0,114,138,0,116,2,0,100,1,
-    0,107,8,0,114,83,0,116,3,0,136,0,0,131,1,0,
-    125,1,0,110,12,0,116,4,0,136,0,0,131,1,0,125,
-    1,0,135,0,0,102,1,0,100,2,0,100,3,0,134,0,
-    0,125,2,0,116,5,0,106,6,0,124,1,0,124,2,0,
-    131,2,0,116,0,0,136,0,0,60,110,0,0,124,1,0,
-    83,40,4,0,0,0,117,109,0,0,0,71,101,116,32,111,
-    114,32,99,114,101,97,116,101,32,116,104,101,32,109,111,100,
-    117,108,101,32,108,111,99,107,32,102,111,114,32,97,32,103,
-    105,118,101,110,32,109,111,100,117,108,101,32,110,97,109,101,
-    46,10,10,32,32,32,32,83,104,111,117,108,100,32,111,110,
-    108,121,32,98,101,32,99,97,108,108,101,100,32,119,105,116,
-    104,32,116,104,101,32,105,109,112,111,114,116,32,108,111,99,
-    107,32,116,97,107,101,110,46,78,99,1,0,0,0,0,0,
-    0,0,1,0,0,0,2,0,0,0,19,0,0,0,115,11,
-    0,0,0,116,0,0,136,0,0,61,100,0,0,83,40,1,
-    0,0,0,78,40,1,0,0,0,117,13,0,0,0,95,109,
-    111,100,117,108,101,95,108,111,99,107,115,40,1,0,0,0,
-    117,1,0,0,0,95,40,1,0,0,0,117,4,0,0,0,
-    110,97,109,101,40,0,0,0,0,117,29,0,0,0,60,102,
-    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
-    95,98,111,111,116,115,116,114,97,112,62,117,2,0,0,0,
-    99,98,24,1,0,0,115,2,0,0,0,0,1,117,28,0,
-    0,0,95,103,101,116,95,109,111,100,117,108,101,95,108,111,
-    99,107,46,60,108,111,99,97,108,115,62,46,99,98,40,7,
-    0,0,0,117,13,0,0,0,95,109,111,100,117,108,101,95,
-    108,111,99,107,115,117,8,0,0,0,75,101,121,69,114,114,
-    111,114,117,7,0,0,0,95,116,104,114,101,97,100,117,16,
-    0,0,0,95,68,117,109,109,121,77,111,100,117,108,101,76,
-    111,99,107,117,11,0,0,0,95,77,111,100,117,108,101,76,
-    111,99,107,117,8,0,0,0,95,119,101,97,107,114,101,102,
-    117,3,0,0,0,114,101,102,40,3,0,0,0,117,4,0,
-    0,0,110,97,109,101,117,4,0,0,0,108,111,99,107,117,
-    2,0,0,0,99,98,40,0,0,0,0,40,1,0,0,0,
-    117,4,0,0,0,110,97,109,101,117,29,0,0,0,60,102,
-    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
-    95,98,111,111,116,115,116,114,97,112,62,117,16,0,0,0,
-    95,103,101,116,95,109,111,100,117,108,101,95,108,111,99,107,
-    10,1,0,0,115,24,0,0,0,0,4,6,1,3,1,17,
-    1,13,1,5,1,12,1,12,1,15,2,12,1,18,2,25,
-    1,117,16,0,0,0,95,103,101,116,95,109,111,100,117,108,
-    101,95,108,111,99,107,99,1,0,0,0,0,0,0,0,2,
-    0,0,0,11,0,0,0,67,0,0,0,115,71,0,0,0,
-    116,0,0,124,0,0,131,1,0,125,1,0,116,1,0,106,
-    2,0,131,0,0,1,121,14,0,124,1,0,106,3,0,131,
-    0,0,1,87,110,18,0,4,116,4,0,107,10,0,114,56,
-    0,1,1,1,89,110,11,0,88,124,1,0,106,5,0,131,
-    0,0,1,100,1,0,83,40,2,0,0,0,117,21,1,0,
-    0,82,101,108,101,97,115,101,32,116,104,101,32,103,108,111,
-    98,97,108,32,105,109,112,111,114,116,32,108,111,99,107,44,
-    32,97,110,100,32,97,99,113,117,105,114,101,115,32,116,104,
-    101,110,32,114,101,108,101,97,115,101,32,116,104,101,10,32,
-    32,32,32,109,111,100,117,108,101,32,108,111,99,107,32,102,
-    111,114,32,97,32,103,105,118,101,110,32,109,111,100,117,108,
-    101,32,110,97,109,101,46,10,32,32,32,32,84,104,105,115,
-    32,105,115,32,117,115,101,100,32,116,111,32,101,110,115,117,
-    114,101,32,97,32,109,111,100,117,108,101,32,105,115,32,99,
-    111,109,112,108,101,116,101,108,121,32,105,110,105,116,105,97,
-    108,105,122,101,100,44,32,105,110,32,116,104,101,10,32,32,
-    32,32,101,118,101,110,116,32,105,116,32,105,115,32,98,101,
-    105,110,103,32,105,109,112,111,114,116,101,100,32,98,121,32,
-    97,110,111,116,104,101,114,32,116,104,114,101,97,100,46,10,
-    10,32,32,32,32,83,104,111,117,108,100,32,111,110,108,121,
-    32,98,101,32,99,97,108,108,101,100,32,119,105,116,104,32,
-    116,104,101,32,105,109,112,111,114,116,32,108,111,99,107,32,
-    116,97,107,101,110,46,78,40,6,0,0,0,117,16,0,0,
-    0,95,103,101,116,95,109,111,100,117,108,101,95,108,111,99,
-    107,117,4,0,0,0,95,105,109,112,117,12,0,0,0,114,
-    101,108,101,97,115,101,95,108,111,99,107,117,7,0,0,0,
-    97,99,113,117,105,114,101,117,14,0,0,0,95,68,101,97,
-    100,108,111,99,107,69,114,114,111,114,117,7,0,0,0,114,
-    101,108,101,97,115,101,40,2,0,0,0,117,4,0,0,0,
-    110,97,109,101,117,4,0,0,0,108,111,99,107,40,0,0,
-    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
-    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
-    111,111,116,115,116,114,97,112,62,117,19,0,0,0,95,108,
-    111,99,107,95,117,110,108,111,99,107,95,109,111,100,117,108,
-    101,29,1,0,0,115,14,0,0,0,0,7,12,1,10,1,
-    3,1,14,1,13,3,5,2,117,19,0,0,0,95,108,111,
-    99,107,95,117,110,108,111,99,107,95,109,111,100,117,108,101,
-    99,1,0,0,0,0,0,0,0,3,0,0,0,3,0,0,
-    0,79,0,0,0,115,13,0,0,0,124,0,0,124,1,0,
-    124,2,0,142,0,0,83,40,1,0,0,0,117,46,1,0,
-    0,114,101,109,111,118,101,95,105,109,112,111,114,116,108,105,
-    98,95,102,114,97,109,101,115,32,105,110,32,105,109,112,111,
-    114,116,46,99,32,119,105,108,108,32,97,108,119,97,121,115,
-    32,114,101,109,111,118,101,32,115,101,113,117,101,110,99,101,
-    115,10,32,32,32,32,111,102,32,105,109,112,111,114,116,108,
-    105,98,32,102,114,97,109,101,115,32,116,104,97,116,32,101,
-    110,100,32,119,105,116,104,32,97,32,99,97,108,108,32,116,
-    111,32,116,104,105,115,32,102,117,110,99,116,105,111,110,10,
-    10,32,32,32,32,85,115,101,32,105,116,32,105,110,115,116,
-    101,97,100,32,111,102,32,97,32,110,111,114,109,97,108,32,
-    99,97,108,108,32,105,110,32,112,108,97,99,101,115,32,119,
-    104,101,114,101,32,105,110,99,108,117,100,105,110,103,32,116,
-    104,101,32,105,109,112,111,114,116,108,105,98,10,32,32,32,
-    32,102,114,97,109,101,115,32,105,110,116,114,111,100,117,99,
-    101,115,32,117,110,119,97,110,116,101,100,32,110,111,105,115,
-    101,32,105,110,116,111,32,116,104,101,32,116,114,97,99,101,
-    98,97,99,107,32,40,101,46,103,46,32,119,104,101,110,32,
-    101,120,101,99,117,116,105,110,103,10,32,32,32,32,109,111,
-    100,117,108,101,32,99,111,100,101,41,10,32,32,32,32,40,
-    0,0,0,0,40,3,0,0,0,117,1,0,0,0,102,117,
-    4,0,0,0,97,114,103,115,117,4,0,0,0,107,119,100,
-    115,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
-    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
-    98,46,95,98,111,111,116,115,116,114,97,112,62,117,25,0,
-    0,0,95,99,97,108,108,95,119,105,116,104,95,102,114,97,
-    109,101,115,95,114,101,109,111,118,101,100,49,1,0,0,115,
-    2,0,0,0,0,8,117,25,0,0,0,95,99,97,108,108,
-    95,119,105,116,104,95,102,114,97,109,101,115,95,114,101,109,
-    111,118,101,100,105,158,12,0,0,117,1,0,0,0,13,105,
-    16,0,0,0,117,1,0,0,0,10,105,24,0,0,0,99,
-    1,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
-    99,0,0,0,115,29,0,0,0,124,0,0,93,19,0,125,
-    1,0,116,0,0,124,1,0,63,100,0,0,64,86,1,113,
-    3,0,100,1,0,83,40,2,0,0,0,105,255,0,0,0,
-    78,40,1,0,0,0,117,17,0,0,0,95,82,65,87,95,
-    77,65,71,73,67,95,78,85,77,66,69,82,40,2,0,0,
-    0,117,2,0,0,0,46,48,117,1,0,0,0,110,40,0,
-    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,9,0,0,0,60,
-    103,101,110,101,120,112,114,62,150,1,0,0,115,2,0,0,
-    0,6,0,117,9,0,0,0,60,103,101,110,101,120,112,114,
-    62,105,0,0,0,0,105,25,0,0,0,105,8,0,0,0,
-    117,11,0,0,0,95,95,112,121,99,97,99,104,101,95,95,
-    117,3,0,0,0,46,112,121,117,4,0,0,0,46,112,121,
-    99,117,4,0,0,0,46,112,121,111,78,99,2,0,0,0,
-    0,0,0,0,11,0,0,0,6,0,0,0,67,0,0,0,
-    115,180,0,0,0,124,1,0,100,1,0,107,8,0,114,25,
-    0,116,0,0,106,1,0,106,2,0,12,110,3,0,124,1,
-    0,125,2,0,124,2,0,114,46,0,116,3,0,125,3,0,
-    110,6,0,116,4,0,125,3,0,116,5,0,124,0,0,131,
-    1,0,92,2,0,125,4,0,125,5,0,124,5,0,106,6,
-    0,100,2,0,131,1,0,92,3,0,125,6,0,125,7,0,
-    125,8,0,116,0,0,106,7,0,106,8,0,125,9,0,124,
-    9,0,100,1,0,107,8,0,114,133,0,116,9,0,100,3,
-    0,131,1,0,130,1,0,110,0,0,100,4,0,106,10,0,
-    124,6,0,124,7,0,124,9,0,124,3,0,100,5,0,25,
-    103,4,0,131,1,0,125,10,0,116,11,0,124,4,0,116,
-    12,0,124,10,0,131,3,0,83,40,6,0,0,0,117,244,
-    1,0,0,71,105,118,101,110,32,116,104,101,32,112,97,116,
-    104,32,116,111,32,97,32,46,112,121,32,102,105,108,101,44,
+    46,95,98,111,111,116,115,116,114,97,112,62,117,17,0,0,
+    0,99,97,99,104,101,95,102,114,111,109,95,115,111,117,114,
+    99,101,159,1,0,0,115,22,0,0,0,0,13,31,1,6,
+    1,9,2,6,1,18,1,24,1,12,1,12,1,15,1,31,
+    1,117,17,0,0,0,99,97,99,104,101,95,102,114,111,109,
+    95,115,111,117,114,99,101,99,1,0,0,0,0,0,0,0,
+    5,0,0,0,5,0,0,0,67,0,0,0,115,193,0,0,
+    0,116,0,0,106,1,0,106,2,0,100,1,0,107,8,0,
+    114,33,0,116,3,0,100,2,0,131,1,0,130,1,0,110,
+    0,0,116,4,0,124,0,0,131,1,0,92,2,0,125,1,
+    0,125,2,0,116,4,0,124,1,0,131,1,0,92,2,0,
+    125,1,0,125,3,0,124,3,0,116,5,0,107,3,0,114,
+    108,0,116,6,0,100,3,0,106,7,0,116,5,0,124,0,
+    0,131,2,0,131,1,0,130,1,0,110,0,0,124,2,0,
+    106,8,0,100,4,0,131,1,0,100,5,0,107,3,0,114,
+    153,0,116,6,0,100,6,0,106,7,0,124,2,0,131,1,
+    0,131,1,0,130,1,0,110,0,0,124,2,0,106,9,0,
+    100,4,0,131,1,0,100,7,0,25,125,4,0,116,10,0,
+    124,1,0,124,4,0,116,11,0,100,7,0,25,23,131,2,
+    0,83,40,8,0,0,0,117,121,1,0,0,71,105,118,101,
+    110,32,116,104,101,32,112,97,116,104,32,116,111,32,97,32,
+    46,112,121,99,46,47,46,112,121,111,32,102,105,108,101,44,
     32,114,101,116,117,114,110,32,116,104,101,32,112,97,116,104,
-    32,116,111,32,105,116,115,32,46,112,121,99,47,46,112,121,
-    111,32,102,105,108,101,46,10,10,32,32,32,32,84,104,101,
-    32,46,112,121,32,102,105,108,101,32,100,111,101,115,32,110,
+    32,116,111,32,105,116,115,32,46,112,121,32,102,105,108,101,
+    46,10,10,32,32,32,32,84,104,101,32,46,112,121,99,47,
+    46,112,121,111,32,102,105,108,101,32,100,111,101,115,32,110,
     111,116,32,110,101,101,100,32,116,111,32,101,120,105,115,116,
     59,32,116,104,105,115,32,115,105,109,112,108,121,32,114,101,
     116,117,114,110,115,32,116,104,101,32,112,97,116,104,32,116,
-    111,32,116,104,101,10,32,32,32,32,46,112,121,99,47,46,
-    112,121,111,32,102,105,108,101,32,99,97,108,99,117,108,97,
-    116,101,100,32,97,115,32,105,102,32,116,104,101,32,46,112,
-    121,32,102,105,108,101,32,119,101,114,101,32,105,109,112,111,
-    114,116,101,100,46,32,32,84,104,101,32,101,120,116,101,110,
-    115,105,111,110,10,32,32,32,32,119,105,108,108,32,98,101,
-    32,46,112,121,99,32,117,110,108,101,115,115,32,115,121,115,
-    46,102,108,97,103,115,46,111,112,116,105,109,105,122,101,32,
-    105,115,32,110,111,110,45,122,101,114,111,44,32,116,104,101,
-    110,32,105,116,32,119,105,108,108,32,98,101,32,46,112,121,
-    111,46,10,10,32,32,32,32,73,102,32,100,101,98,117,103,
-    95,111,118,101,114,114,105,100,101,32,105,115,32,110,111,116,
-    32,78,111,110,101,44,32,116,104,101,110,32,105,116,32,109,
-    117,115,116,32,98,101,32,97,32,98,111,111,108,101,97,110,
-    32,97,110,100,32,105,115,32,117,115,101,100,32,105,110,10,
-    32,32,32,32,112,108,97,99,101,32,111,102,32,115,121,115,
-    46,102,108,97,103,115,46,111,112,116,105,109,105,122,101,46,
-    10,10,32,32,32,32,73,102,32,115,121,115,46,105,109,112,
-    108,101,109,101,110,116,97,116,105,111,110,46,99,97,99,104,
-    101,95,116,97,103,32,105,115,32,78,111,110,101,32,116,104,
-    101,110,32,78,111,116,73,109,112,108,101,109,101,110,116,101,
-    100,69,114,114,111,114,32,105,115,32,114,97,105,115,101,100,
-    46,10,10,32,32,32,32,78,117,1,0,0,0,46,117,36,
-    0,0,0,115,121,115,46,105,109,112,108,101,109,101,110,116,
-    97,116,105,111,110,46,99,97,99,104,101,95,116,97,103,32,
-    105,115,32,78,111,110,101,117,0,0,0,0,105,0,0,0,
-    0,40,13,0,0,0,117,3,0,0,0,115,121,115,117,5,
-    0,0,0,102,108,97,103,115,117,8,0,0,0,111,112,116,
-    105,109,105,122,101,117,23,0,0,0,68,69,66,85,71,95,
-    66,89,84,69,67,79,68,69,95,83,85,70,70,73,88,69,
-    83,117,27,0,0,0,79,80,84,73,77,73,90,69,68,95,
-    66,89,84,69,67,79,68,69,95,83,85,70,70,73,88,69,
-    83,117,11,0,0,0,95,112,97,116,104,95,115,112,108,105,
+    111,10,32,32,32,32,116,104,101,32,46,112,121,32,102,105,
+    108,101,32,99,97,108,99,117,108,97,116,101,100,32,116,111,
+    32,99,111,114,114,101,115,112,111,110,100,32,116,111,32,116,
+    104,101,32,46,112,121,99,47,46,112,121,111,32,102,105,108,
+    101,46,32,32,73,102,32,112,97,116,104,32,100,111,101,115,
+    10,32,32,32,32,110,111,116,32,99,111,110,102,111,114,109,
+    32,116,111,32,80,69,80,32,51,49,52,55,32,102,111,114,
+    109,97,116,44,32,86,97,108,117,101,69,114,114,111,114,32,
+    119,105,108,108,32,98,101,32,114,97,105,115,101,100,46,32,
+    73,102,10,32,32,32,32,115,121,115,46,105,109,112,108,101,
+    109,101,110,116,97,116,105,111,110,46,99,97,99,104,101,95,
+    116,97,103,32,105,115,32,78,111,110,101,32,116,104,101,110,
+    32,78,111,116,73,109,112,108,101,109,101,110,116,101,100,69,
+    114,114,111,114,32,105,115,32,114,97,105,115,101,100,46,10,
+    10,32,32,32,32,78,117,36,0,0,0,115,121,115,46,105,
+    109,112,108,101,109,101,110,116,97,116,105,111,110,46,99,97,
+    99,104,101,95,116,97,103,32,105,115,32,78,111,110,101,117,
+    37,0,0,0,123,125,32,110,111,116,32,98,111,116,116,111,
+    109,45,108,101,118,101,108,32,100,105,114,101,99,116,111,114,
+    121,32,105,110,32,123,33,114,125,117,1,0,0,0,46,105,
+    2,0,0,0,117,28,0,0,0,101,120,112,101,99,116,101,
+    100,32,111,110,108,121,32,50,32,100,111,116,115,32,105,110,
+    32,123,33,114,125,105,0,0,0,0,40,12,0,0,0,117,
+    3,0,0,0,115,121,115,117,14,0,0,0,105,109,112,108,
+    101,109,101,110,116,97,116,105,111,110,117,9,0,0,0,99,
+    97,99,104,101,95,116,97,103,117,19,0,0,0,78,111,116,
+    73,109,112,108,101,109,101,110,116,101,100,69,114,114,111,114,
+    117,11,0,0,0,95,112,97,116,104,95,115,112,108,105,116,
+    117,8,0,0,0,95,80,89,67,65,67,72,69,117,10,0,
+    0,0,86,97,108,117,101,69,114,114,111,114,117,6,0,0,
+    0,102,111,114,109,97,116,117,5,0,0,0,99,111,117,110,
     116,117,9,0,0,0,112,97,114,116,105,116,105,111,110,117,
-    14,0,0,0,105,109,112,108,101,109,101,110,116,97,116,105,
-    111,110,117,9,0,0,0,99,97,99,104,101,95,116,97,103,
-    117,19,0,0,0,78,111,116,73,109,112,108,101,109,101,110,
-    116,101,100,69,114,114,111,114,117,4,0,0,0,106,111,105,
-    110,117,10,0,0,0,95,112,97,116,104,95,106,111,105,110,
-    117,8,0,0,0,95,80,89,67,65,67,72,69,40,11,0,
-    0,0,117,4,0,0,0,112,97,116,104,117,14,0,0,0,
-    100,101,98,117,103,95,111,118,101,114,114,105,100,101,117,5,
-    0,0,0,100,101,98,117,103,117,8,0,0,0,115,117,102,
-    102,105,120,101,115,117,4,0,0,0,104,101,97,100,117,4,
-    0,0,0,116,97,105,108,117,13,0,0,0,98,97,115,101,
-    95,102,105,108,101,110,97,109,101,117,3,0,0,0,115,101,
-    112,117,1,0,0,0,95,117,3,0,0,0,116,97,103,117,
-    8,0,0,0,102,105,108,101,110,97,109,101,40,0,0,0,
+    10,0,0,0,95,112,97,116,104,95,106,111,105,110,117,15,
+    0,0,0,83,79,85,82,67,69,95,83,85,70,70,73,88,
+    69,83,40,5,0,0,0,117,4,0,0,0,112,97,116,104,
+    117,4,0,0,0,104,101,97,100,117,16,0,0,0,112,121,
+    99,97,99,104,101,95,102,105,108,101,110,97,109,101,117,7,
+    0,0,0,112,121,99,97,99,104,101,117,13,0,0,0,98,
+    97,115,101,95,102,105,108,101,110,97,109,101,40,0,0,0,
     0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
     101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,17,0,0,0,99,97,99,
-    104,101,95,102,114,111,109,95,115,111,117,114,99,101,159,1,
-    0,0,115,22,0,0,0,0,13,31,1,6,1,9,2,6,
-    1,18,1,24,1,12,1,12,1,15,1,31,1,117,17,0,
-    0,0,99,97,99,104,101,95,102,114,111,109,95,115,111,117,
-    114,99,101,99,1,0,0,0,0,0,0,0,5,0,0,0,
-    5,0,0,0,67,0,0,0,115,193,0,0,0,116,0,0,
-    106,1,0,106,2,0,100,1,0,107,8,0,114,33,0,116,
-    3,0,100,2,0,131,1,0,130,1,0,110,0,0,116,4,
-    0,124,0,0,131,1,0,92,2,0,125,1,0,125,2,0,
-    116,4,0,124,1,0,131,1,0,92,2,0,125,1,0,125,
-    3,0,124,3,0,116,5,0,107,3,0,114,108,0,116,6,
-    0,100,3,0,106,7,0,116,5,0,124,0,0,131,2,0,
-    131,1,0,130,1,0,110,0,0,124,2,0,106,8,0,100,
-    4,0,131,1,0,100,5,0,107,3,0,114,153,0,116,6,
-    0,100,6,0,106,7,0,124,2,0,131,1,0,131,1,0,
-    130,1,0,110,0,0,124,2,0,106,9,0,100,4,0,131,
-    1,0,100,7,0,25,125,4,0,116,10,0,124,1,0,124,
-    4,0,116,11,0,100,7,0,25,23,131,2,0,83,40,8,
-    0,0,0,117,121,1,0,0,71,105,118,101,110,32,116,104,
-    101,32,112,97,116,104,32,116,111,32,97,32,46,112,121,99,
-    46,47,46,112,121,111,32,102,105,108,101,44,32,114,101,116,
-    117,114,110,32,116,104,101,32,112,97,116,104,32,116,111,32,
-    105,116,115,32,46,112,121,32,102,105,108,101,46,10,10,32,
-    32,32,32,84,104,101,32,46,112,121,99,47,46,112,121,111,
-    32,102,105,108,101,32,100,111,101,115,32,110,111,116,32,110,
-    101,101,100,32,116,111,32,101,120,105,115,116,59,32,116,104,
-    105,115,32,115,105,109,112,108,121,32,114,101,116,117,114,110,
-    115,32,116,104,101,32,112,97,116,104,32,116,111,10,32,32,
-    32,32,116,104,101,32,46,112,121,32,102,105,108,101,32,99,
-    97,108,99,117,108,97,116,101,100,32,116,111,32,99,111,114,
-    114,101,115,112,111,110,100,32,116,111,32,116,104,101,32,46,
-    112,121,99,47,46,112,121,111,32,102,105,108,101,46,32,32,
-    73,102,32,112,97,116,104,32,100,111,101,115,10,32,32,32,
-    32,110,111,116,32,99,111,110,102,111,114,109,32,116,111,32,
-    80,69,80,32,51,49,52,55,32,102,111,114,109,97,116,44,
-    32,86,97,108,117,101,69,114,114,111,114,32,119,105,108,108,
-    32,98,101,32,114,97,105,115,101,100,46,32,73,102,10,32,
-    32,32,32,115,121,115,46,105,109,112,108,101,109,101,110,116,
-    97,116,105,111,110,46,99,97,99,104,101,95,116,97,103,32,
-    105,115,32,78,111,110,101,32,116,104,101,110,32,78,111,116,
-    73,109,112,108,101,109,101,110,116,101,100,69,114,114,111,114,
-    32,105,115,32,114,97,105,115,101,100,46,10,10,32,32,32,
-    32,78,117,36,0,0,0,115,121,115,46,105,109,112,108,101,
-    109,101,110,116,97,116,105,111,110,46,99,97,99,104,101,95,
-    116,97,103,32,105,115,32,78,111,110,101,117,37,0,0,0,
-    123,125,32,110,111,116,32,98,111,116,116,111,109,45,108,101,
-    118,101,108,32,100,105,114,101,99,116,111,114,121,32,105,110,
-    32,123,33,114,125,117,1,0,0,0,46,105,2,0,0,0,
-    117,28,0,0,0,101,120,112,101,99,116,101,100,32,111,110,
-    108,121,32,50,32,100,111,116,115,32,105,110,32,123,33,114,
-    125,105,0,0,0,0,40,12,0,0,0,117,3,0,0,0,
-    115,121,115,117,14,0,0,0,105,109,112,108,101,109,101,110,
-    116,97,116,105,111,110,117,9,0,0,0,99,97,99,104,101,
-    95,116,97,103,117,19,0,0,0,78,111,116,73,109,112,108,
-    101,109,101,110,116,101,100,69,114,114,111,114,117,11,0,0,
-    0,95,112,97,116,104,95,115,112,108,105,116,117,8,0,0,
-    0,95,80,89,67,65,67,72,69,117,10,0,0,0,86,97,
-    108,117,101,69,114,114,111,114,117,6,0,0,0,102,111,114,
-    109,97,116,117,5,0,0,0,99,111,117,110,116,117,9,0,
-    0,0,112,97,114,116,105,116,105,111,110,117,10,0,0,0,
-    95,112,97,116,104,95,106,111,105,110,117,15,0,0,0,83,
-    79,85,82,67,69,95,83,85,70,70,73,88,69,83,40,5,
-    0,0,0,117,4,0,0,0,112,97,116,104,117,4,0,0,
-    0,104,101,97,100,117,16,0,0,0,112,121,99,97,99,104,
-    101,95,102,105,108,101,110,97,109,101,117,7,0,0,0,112,
-    121,99,97,99,104,101,117,13,0,0,0,98,97,115,101,95,
-    102,105,108,101,110,97,109,101,40,0,0,0,0,40,0,0,
+    111,116,115,116,114,97,112,62,117,17,0,0,0,115,111,117,
+    114,99,101,95,102,114,111,109,95,99,97,99,104,101,186,1,
+    0,0,115,24,0,0,0,0,9,18,1,15,1,18,1,18,
+    1,12,1,9,1,18,1,21,1,9,1,15,1,19,1,117,
+    17,0,0,0,115,111,117,114,99,101,95,102,114,111,109,95,
+    99,97,99,104,101,99,1,0,0,0,0,0,0,0,5,0,
+    0,0,13,0,0,0,67,0,0,0,115,164,0,0,0,116,
+    0,0,124,0,0,131,1,0,100,1,0,107,2,0,114,22,
+    0,100,2,0,83,124,0,0,106,1,0,100,3,0,131,1,
+    0,92,3,0,125,1,0,125,2,0,125,3,0,124,1,0,
+    12,115,81,0,124,3,0,106,2,0,131,0,0,100,7,0,
+    100,8,0,133,2,0,25,100,6,0,107,3,0,114,85,0,
+    124,0,0,83,121,16,0,116,3,0,124,0,0,131,1,0,
+    125,4,0,87,110,40,0,4,116,4,0,116,5,0,102,2,
+    0,107,10,0,114,143,0,1,1,1,116,6,0,100,9,0,
+    100,2,0,133,2,0,25,125,4,0,89,110,1,0,88,116,
+    7,0,116,8,0,131,1,0,114,160,0,124,4,0,83,124,
+    0,0,83,40,10,0,0,0,117,188,0,0,0,67,111,110,
+    118,101,114,116,32,97,32,98,121,116,101,99,111,100,101,32,
+    102,105,108,101,32,112,97,116,104,32,116,111,32,97,32,115,
+    111,117,114,99,101,32,112,97,116,104,32,40,105,102,32,112,
+    111,115,115,105,98,108,101,41,46,10,10,32,32,32,32,84,
+    104,105,115,32,102,117,110,99,116,105,111,110,32,101,120,105,
+    115,116,115,32,112,117,114,101,108,121,32,102,111,114,32,98,
+    97,99,107,119,97,114,100,115,45,99,111,109,112,97,116,105,
+    98,105,108,105,116,121,32,102,111,114,10,32,32,32,32,80,
+    121,73,109,112,111,114,116,95,69,120,101,99,67,111,100,101,
+    77,111,100,117,108,101,87,105,116,104,70,105,108,101,110,97,
+    109,101,115,40,41,32,105,110,32,116,104,101,32,67,32,65,
+    80,73,46,10,10,32,32,32,32,105,0,0,0,0,78,117,
+    1,0,0,0,46,105,3,0,0,0,105,1,0,0,0,117,
+    3,0,0,0,46,112,121,105,253,255,255,255,105,255,255,255,
+    255,105,255,255,255,255,40,9,0,0,0,117,3,0,0,0,
+    108,101,110,117,9,0,0,0,114,112,97,114,105,116,105,111,
+    110,117,5,0,0,0,108,111,119,101,114,117,17,0,0,0,
+    115,111,117,114,99,101,95,102,114,111,109,95,99,97,99,104,
+    101,117,19,0,0,0,78,111,116,73,109,112,108,101,109,101,
+    110,116,101,100,69,114,114,111,114,117,10,0,0,0,86,97,
+    108,117,101,69,114,114,111,114,117,12,0,0,0,98,121,116,
+    99,111,100,101,95,112,97,116,104,117,12,0,0,0,95,112,
+    97,116,104,95,105,115,102,105,108,101,117,12,0,0,0,115,
+    111,117,114,99,101,95,115,116,97,116,115,40,5,0,0,0,
+    117,13,0,0,0,98,121,116,101,99,111,100,101,95,112,97,
+    116,104,117,4,0,0,0,114,101,115,116,117,1,0,0,0,
+    95,117,9,0,0,0,101,120,116,101,110,115,105,111,110,117,
+    11,0,0,0,115,111,117,114,99,101,95,112,97,116,104,40,
+    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
+    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
+    95,98,111,111,116,115,116,114,97,112,62,117,15,0,0,0,
+    95,103,101,116,95,115,111,117,114,99,101,102,105,108,101,209,
+    1,0,0,115,20,0,0,0,0,7,18,1,4,1,24,1,
+    35,1,4,2,3,1,16,1,19,1,21,2,117,15,0,0,
+    0,95,103,101,116,95,115,111,117,114,99,101,102,105,108,101,
+    99,1,0,0,0,0,0,0,0,2,0,0,0,4,0,0,
+    0,71,0,0,0,115,75,0,0,0,116,0,0,106,1,0,
+    106,2,0,114,71,0,124,0,0,106,3,0,100,6,0,131,
+    1,0,115,40,0,100,3,0,124,0,0,23,125,0,0,110,
+    0,0,116,4,0,124,0,0,106,5,0,124,1,0,140,0,
+    0,100,4,0,116,0,0,106,6,0,131,1,1,1,110,0,
+    0,100,5,0,83,40,7,0,0,0,117,61,0,0,0,80,
+    114,105,110,116,32,116,104,101,32,109,101,115,115,97,103,101,
+    32,116,111,32,115,116,100,101,114,114,32,105,102,32,45,118,
+    47,80,89,84,72,79,78,86,69,82,66,79,83,69,32,105,
+    115,32,116,117,114,110,101,100,32,111,110,46,117,1,0,0,
+    0,35,117,7,0,0,0,105,109,112,111,114,116,32,117,2,
+    0,0,0,35,32,117,4,0,0,0,102,105,108,101,78,40,
+    2,0,0,0,117,1,0,0,0,35,117,7,0,0,0,105,
+    109,112,111,114,116,32,40,7,0,0,0,117,3,0,0,0,
+    115,121,115,117,5,0,0,0,102,108,97,103,115,117,7,0,
+    0,0,118,101,114,98,111,115,101,117,10,0,0,0,115,116,
+    97,114,116,115,119,105,116,104,117,5,0,0,0,112,114,105,
+    110,116,117,6,0,0,0,102,111,114,109,97,116,117,6,0,
+    0,0,115,116,100,101,114,114,40,2,0,0,0,117,7,0,
+    0,0,109,101,115,115,97,103,101,117,4,0,0,0,97,114,
+    103,115,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,16,
+    0,0,0,95,118,101,114,98,111,115,101,95,109,101,115,115,
+    97,103,101,230,1,0,0,115,8,0,0,0,0,2,12,1,
+    15,1,13,1,117,16,0,0,0,95,118,101,114,98,111,115,
+    101,95,109,101,115,115,97,103,101,99,1,0,0,0,0,0,
+    0,0,2,0,0,0,3,0,0,0,3,0,0,0,115,35,
+    0,0,0,135,0,0,102,1,0,100,1,0,100,2,0,134,
+    0,0,125,1,0,116,0,0,124,1,0,136,0,0,131,2,
+    0,1,124,1,0,83,40,3,0,0,0,117,39,0,0,0,
+    83,101,116,32,95,95,112,97,99,107,97,103,101,95,95,32,
+    111,110,32,116,104,101,32,114,101,116,117,114,110,101,100,32,
+    109,111,100,117,108,101,46,99,0,0,0,0,0,0,0,0,
+    3,0,0,0,4,0,0,0,31,0,0,0,115,101,0,0,
+    0,136,0,0,124,0,0,124,1,0,142,0,0,125,2,0,
+    116,0,0,124,2,0,100,1,0,100,0,0,131,3,0,100,
+    0,0,107,8,0,114,97,0,124,2,0,106,1,0,124,2,
+    0,95,2,0,116,3,0,124,2,0,100,2,0,131,2,0,
+    115,97,0,124,2,0,106,2,0,106,4,0,100,3,0,131,
+    1,0,100,4,0,25,124,2,0,95,2,0,113,97,0,110,
+    0,0,124,2,0,83,40,5,0,0,0,78,117,11,0,0,
+    0,95,95,112,97,99,107,97,103,101,95,95,117,8,0,0,
+    0,95,95,112,97,116,104,95,95,117,1,0,0,0,46,105,
+    0,0,0,0,40,5,0,0,0,117,7,0,0,0,103,101,
+    116,97,116,116,114,117,8,0,0,0,95,95,110,97,109,101,
+    95,95,117,11,0,0,0,95,95,112,97,99,107,97,103,101,
+    95,95,117,7,0,0,0,104,97,115,97,116,116,114,117,10,
+    0,0,0,114,112,97,114,116,105,116,105,111,110,40,3,0,
+    0,0,117,4,0,0,0,97,114,103,115,117,6,0,0,0,
+    107,119,97,114,103,115,117,6,0,0,0,109,111,100,117,108,
+    101,40,1,0,0,0,117,3,0,0,0,102,120,110,40,0,
+    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
+    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
+    116,114,97,112,62,117,19,0,0,0,115,101,116,95,112,97,
+    99,107,97,103,101,95,119,114,97,112,112,101,114,240,1,0,
+    0,115,12,0,0,0,0,1,15,1,24,1,12,1,15,1,
+    31,1,117,40,0,0,0,115,101,116,95,112,97,99,107,97,
+    103,101,46,60,108,111,99,97,108,115,62,46,115,101,116,95,
+    112,97,99,107,97,103,101,95,119,114,97,112,112,101,114,40,
+    1,0,0,0,117,5,0,0,0,95,119,114,97,112,40,2,
+    0,0,0,117,3,0,0,0,102,120,110,117,19,0,0,0,
+    115,101,116,95,112,97,99,107,97,103,101,95,119,114,97,112,
+    112,101,114,40,0,0,0,0,40,1,0,0,0,117,3,0,
+    0,0,102,120,110,117,29,0,0,0,60,102,114,111,122,101,
+    110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
+    116,115,116,114,97,112,62,117,11,0,0,0,115,101,116,95,
+    112,97,99,107,97,103,101,238,1,0,0,115,6,0,0,0,
+    0,2,18,7,13,1,117,11,0,0,0,115,101,116,95,112,
+    97,99,107,97,103,101,99,1,0,0,0,0,0,0,0,2,
+    0,0,0,3,0,0,0,3,0,0,0,115,35,0,0,0,
+    135,0,0,102,1,0,100,1,0,100,2,0,134,0,0,125,
+    1,0,116,0,0,124,1,0,136,0,0,131,2,0,1,124,
+    1,0,83,40,3,0,0,0,117,38,0,0,0,83,101,116,
+    32,95,95,108,111,97,100,101,114,95,95,32,111,110,32,116,
+    104,101,32,114,101,116,117,114,110,101,100,32,109,111,100,117,
+    108,101,46,99,1,0,0,0,0,0,0,0,4,0,0,0,
+    4,0,0,0,31,0,0,0,115,49,0,0,0,136,0,0,
+    124,0,0,124,1,0,124,2,0,142,1,0,125,3,0,116,
+    0,0,124,3,0,100,1,0,131,2,0,115,45,0,124,0,
+    0,124,3,0,95,1,0,110,0,0,124,3,0,83,40,2,
+    0,0,0,78,117,10,0,0,0,95,95,108,111,97,100,101,
+    114,95,95,40,2,0,0,0,117,7,0,0,0,104,97,115,
+    97,116,116,114,117,10,0,0,0,95,95,108,111,97,100,101,
+    114,95,95,40,4,0,0,0,117,4,0,0,0,115,101,108,
+    102,117,4,0,0,0,97,114,103,115,117,6,0,0,0,107,
+    119,97,114,103,115,117,6,0,0,0,109,111,100,117,108,101,
+    40,1,0,0,0,117,3,0,0,0,102,120,110,40,0,0,
     0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
     109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
-    114,97,112,62,117,17,0,0,0,115,111,117,114,99,101,95,
-    102,114,111,109,95,99,97,99,104,101,186,1,0,0,115,24,
-    0,0,0,0,9,18,1,15,1,18,1,18,1,12,1,9,
-    1,18,1,21,1,9,1,15,1,19,1,117,17,0,0,0,
-    115,111,117,114,99,101,95,102,114,111,109,95,99,97,99,104,
-    101,99,1,0,0,0,0,0,0,0,5,0,0,0,13,0,
-    0,0,67,0,0,0,115,164,0,0,0,116,0,0,124,0,
-    0,131,1,0,100,1,0,107,2,0,114,22,0,100,2,0,
-    83,124,0,0,106,1,0,100,3,0,131,1,0,92,3,0,
-    125,1,0,125,2,0,125,3,0,124,1,0,12,115,81,0,
-    124,3,0,106,2,0,131,0,0,100,7,0,100,8,0,133,
-    2,0,25,100,6,0,107,3,0,114,85,0,124,0,0,83,
-    121,16,0,116,3,0,124,0,0,131,1,0,125,4,0,87,
-    110,40,0,4,116,4,0,116,5,0,102,2,0,107,10,0,
-    114,143,0,1,1,1,116,6,0,100,9,0,100,2,0,133,
-    2,0,25,125,4,0,89,110,1,0,88,116,7,0,116,8,
-    0,131,1,0,114,160,0,124,4,0,83,124,0,0,83,40,
-    10,0,0,0,117,188,0,0,0,67,111,110,118,101,114,116,
-    32,97,32,98,121,116,101,99,111,100,101,32,102,105,108,101,
-    32,112,97,116,104,32,116,111,32,97,32,115,111,117,114,99,
-    101,32,112,97,116,104,32,40,105,102,32,112,111,115,115,105,
-    98,108,101,41,46,10,10,32,32,32,32,84,104,105,115,32,
-    102,117,110,99,116,105,111,110,32,101,120,105,115,116,115,32,
-    112,117,114,101,108,121,32,102,111,114,32,98,97,99,107,119,
-    97,114,100,115,45,99,111,109,112,97,116,105,98,105,108,105,
-    116,121,32,102,111,114,10,32,32,32,32,80,121,73,109,112,
-    111,114,116,95,69,120,101,99,67,111,100,101,77,111,100,117,
-    108,101,87,105,116,104,70,105,108,101,110,97,109,101,115,40,
-    41,32,105,110,32,116,104,101,32,67,32,65,80,73,46,10,
-    10,32,32,32,32,105,0,0,0,0,78,117,1,0,0,0,
-    46,105,3,0,0,0,105,1,0,0,0,117,3,0,0,0,
-    46,112,121,105,253,255,255,255,105,255,255,255,255,105,255,255,
-    255,255,40,9,0,0,0,117,3,0,0,0,108,101,110,117,
-    9,0,0,0,114,112,97,114,105,116,105,111,110,117,5,0,
-    0,0,108,111,119,101,114,117,17,0,0,0,115,111,117,114,
-    99,101,95,102,114,111,109,95,99,97,99,104,101,117,19,0,
-    0,0,78,111,116,73,109,112,108,101,109,101,110,116,101,100,
-    69,114,114,111,114,117,10,0,0,0,86,97,108,117,101,69,
-    114,114,111,114,117,12,0,0,0,98,121,116,99,111,100,101,
-    95,112,97,116,104,117,12,0,0,0,95,112,97,116,104,95,
-    105,115,102,105,108,101,117,12,0,0,0,115,111,117,114,99,
-    101,95,115,116,97,116,115,40,5,0,0,0,117,13,0,0,
-    0,98,121,116,101,99,111,100,101,95,112,97,116,104,117,4,
-    0,0,0,114,101,115,116,117,1,0,0,0,95,117,9,0,
-    0,0,101,120,116,101,110,115,105,111,110,117,11,0,0,0,
-    115,111,117,114,99,101,95,112,97,116,104,40,0,0,0,0,
+    114,97,112,62,117,18,0,0,0,115,101,116,95,108,111,97,
+    100,101,114,95,119,114,97,112,112,101,114,253,1,0,0,115,
+    8,0,0,0,0,1,18,1,15,1,12,1,117,38,0,0,
+    0,115,101,116,95,108,111,97,100,101,114,46,60,108,111,99,
+    97,108,115,62,46,115,101,116,95,108,111,97,100,101,114,95,
+    119,114,97,112,112,101,114,40,1,0,0,0,117,5,0,0,
+    0,95,119,114,97,112,40,2,0,0,0,117,3,0,0,0,
+    102,120,110,117,18,0,0,0,115,101,116,95,108,111,97,100,
+    101,114,95,119,114,97,112,112,101,114,40,0,0,0,0,40,
+    1,0,0,0,117,3,0,0,0,102,120,110,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,10,
+    0,0,0,115,101,116,95,108,111,97,100,101,114,251,1,0,
+    0,115,6,0,0,0,0,2,18,5,13,1,117,10,0,0,
+    0,115,101,116,95,108,111,97,100,101,114,99,1,0,0,0,
+    0,0,0,0,2,0,0,0,3,0,0,0,3,0,0,0,
+    115,35,0,0,0,135,0,0,102,1,0,100,1,0,100,2,
+    0,134,0,0,125,1,0,116,0,0,124,1,0,136,0,0,
+    131,2,0,1,124,1,0,83,40,3,0,0,0,117,42,3,
+    0,0,68,101,99,111,114,97,116,111,114,32,116,111,32,104,
+    97,110,100,108,101,32,115,101,108,101,99,116,105,110,103,32,
+    116,104,101,32,112,114,111,112,101,114,32,109,111,100,117,108,
+    101,32,102,111,114,32,108,111,97,100,101,114,115,46,10,10,
+    32,32,32,32,84,104,101,32,100,101,99,111,114,97,116,101,
+    100,32,102,117,110,99,116,105,111,110,32,105,115,32,112,97,
+    115,115,101,100,32,116,104,101,32,109,111,100,117,108,101,32,
+    116,111,32,117,115,101,32,105,110,115,116,101,97,100,32,111,
+    102,32,116,104,101,32,109,111,100,117,108,101,10,32,32,32,
+    32,110,97,109,101,46,32,84,104,101,32,109,111,100,117,108,
+    101,32,112,97,115,115,101,100,32,105,110,32,116,111,32,116,
+    104,101,32,102,117,110,99,116,105,111,110,32,105,115,32,101,
+    105,116,104,101,114,32,102,114,111,109,32,115,121,115,46,109,
+    111,100,117,108,101,115,32,105,102,10,32,32,32,32,105,116,
+    32,97,108,114,101,97,100,121,32,101,120,105,115,116,115,32,
+    111,114,32,105,115,32,97,32,110,101,119,32,109,111,100,117,
+    108,101,46,32,73,102,32,116,104,101,32,109,111,100,117,108,
+    101,32,105,115,32,110,101,119,44,32,116,104,101,110,32,95,
+    95,110,97,109,101,95,95,10,32,32,32,32,105,115,32,115,
+    101,116,32,116,104,101,32,102,105,114,115,116,32,97,114,103,
+    117,109,101,110,116,32,116,111,32,116,104,101,32,109,101,116,
+    104,111,100,44,32,95,95,108,111,97,100,101,114,95,95,32,
+    105,115,32,115,101,116,32,116,111,32,115,101,108,102,44,32,
+    97,110,100,10,32,32,32,32,95,95,112,97,99,107,97,103,
+    101,95,95,32,105,115,32,115,101,116,32,97,99,99,111,114,
+    100,105,110,103,108,121,32,40,105,102,32,115,101,108,102,46,
+    105,115,95,112,97,99,107,97,103,101,40,41,32,105,115,32,
+    100,101,102,105,110,101,100,41,32,119,105,108,108,32,98,101,
+    32,115,101,116,10,32,32,32,32,98,101,102,111,114,101,32,
+    105,116,32,105,115,32,112,97,115,115,101,100,32,116,111,32,
+    116,104,101,32,100,101,99,111,114,97,116,101,100,32,102,117,
+    110,99,116,105,111,110,32,40,105,102,32,115,101,108,102,46,
+    105,115,95,112,97,99,107,97,103,101,40,41,32,100,111,101,
+    115,10,32,32,32,32,110,111,116,32,119,111,114,107,32,102,
+    111,114,32,116,104,101,32,109,111,100,117,108,101,32,105,116,
+    32,119,105,108,108,32,98,101,32,115,101,116,32,112,111,115,
+    116,45,108,111,97,100,41,46,10,10,32,32,32,32,73,102,
+    32,97,110,32,101,120,99,101,112,116,105,111,110,32,105,115,
+    32,114,97,105,115,101,100,32,97,110,100,32,116,104,101,32,
+    100,101,99,111,114,97,116,111,114,32,99,114,101,97,116,101,
+    100,32,116,104,101,32,109,111,100,117,108,101,32,105,116,32,
+    105,115,10,32,32,32,32,115,117,98,115,101,113,117,101,110,
+    116,108,121,32,114,101,109,111,118,101,100,32,102,114,111,109,
+    32,115,121,115,46,109,111,100,117,108,101,115,46,10,10,32,
+    32,32,32,84,104,101,32,100,101,99,111,114,97,116,111,114,
+    32,97,115,115,117,109,101,115,32,116,104,97,116,32,116,104,
+    101,32,100,101,99,111,114,97,116,101,100,32,102,117,110,99,
+    116,105,111,110,32,116,97,107,101,115,32,116,104,101,32,109,
+    111,100,117,108,101,32,110,97,109,101,32,97,115,10,32,32,
+    32,32,116,104,101,32,115,101,99,111,110,100,32,97,114,103,
+    117,109,101,110,116,46,10,10,32,32,32,32,99,2,0,0,
+    0,0,0,0,0,7,0,0,0,25,0,0,0,31,0,0,
+    0,115,254,0,0,0,116,0,0,106,1,0,106,2,0,124,
+    1,0,131,1,0,125,4,0,124,4,0,100,0,0,107,9,
+    0,125,5,0,124,5,0,115,168,0,116,3,0,124,1,0,
+    131,1,0,125,4,0,100,1,0,124,4,0,95,4,0,124,
+    4,0,116,0,0,106,1,0,124,1,0,60,124,0,0,124,
+    4,0,95,5,0,121,19,0,124,0,0,106,6,0,124,1,
+    0,131,1,0,125,6,0,87,110,24,0,4,116,7,0,116,
+    8,0,102,2,0,107,10,0,114,124,0,1,1,1,89,113,
+    177,0,88,124,6,0,114,143,0,124,1,0,124,4,0,95,
+    9,0,113,177,0,124,1,0,106,10,0,100,2,0,131,1,
+    0,100,3,0,25,124,4,0,95,9,0,110,9,0,100,1,
+    0,124,4,0,95,4,0,122,60,0,121,23,0,136,0,0,
+    124,0,0,124,4,0,124,2,0,124,3,0,142,2,0,83,
+    87,110,30,0,1,1,1,124,5,0,115,228,0,116,0,0,
+    106,1,0,124,1,0,61,110,0,0,130,0,0,89,110,1,
+    0,88,87,100,0,0,100,4,0,124,4,0,95,4,0,88,
+    100,0,0,83,40,5,0,0,0,78,84,117,1,0,0,0,
+    46,105,0,0,0,0,70,40,11,0,0,0,117,3,0,0,
+    0,115,121,115,117,7,0,0,0,109,111,100,117,108,101,115,
+    117,3,0,0,0,103,101,116,117,10,0,0,0,110,101,119,
+    95,109,111,100,117,108,101,117,16,0,0,0,95,95,105,110,
+    105,116,105,97,108,105,122,105,110,103,95,95,117,10,0,0,
+    0,95,95,108,111,97,100,101,114,95,95,117,10,0,0,0,
+    105,115,95,112,97,99,107,97,103,101,117,11,0,0,0,73,
+    109,112,111,114,116,69,114,114,111,114,117,14,0,0,0,65,
+    116,116,114,105,98,117,116,101,69,114,114,111,114,117,11,0,
+    0,0,95,95,112,97,99,107,97,103,101,95,95,117,10,0,
+    0,0,114,112,97,114,116,105,116,105,111,110,40,7,0,0,
+    0,117,4,0,0,0,115,101,108,102,117,8,0,0,0,102,
+    117,108,108,110,97,109,101,117,4,0,0,0,97,114,103,115,
+    117,6,0,0,0,107,119,97,114,103,115,117,6,0,0,0,
+    109,111,100,117,108,101,117,9,0,0,0,105,115,95,114,101,
+    108,111,97,100,117,10,0,0,0,105,115,95,112,97,99,107,
+    97,103,101,40,1,0,0,0,117,3,0,0,0,102,120,110,
     40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
     110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,15,0,0,0,95,103,101,116,
-    95,115,111,117,114,99,101,102,105,108,101,209,1,0,0,115,
-    20,0,0,0,0,7,18,1,4,1,24,1,35,1,4,2,
-    3,1,16,1,19,1,21,2,117,15,0,0,0,95,103,101,
-    116,95,115,111,117,114,99,101,102,105,108,101,99,1,0,0,
-    0,0,0,0,0,2,0,0,0,4,0,0,0,71,0,0,
-    0,115,75,0,0,0,116,0,0,106,1,0,106,2,0,114,
-    71,0,124,0,0,106,3,0,100,6,0,131,1,0,115,40,
-    0,100,3,0,124,0,0,23,125,0,0,110,0,0,116,4,
-    0,124,0,0,106,5,0,124,1,0,140,0,0,100,4,0,
-    116,0,0,106,6,0,131,1,1,1,110,0,0,100,5,0,
-    83,40,7,0,0,0,117,61,0,0,0,80,114,105,110,116,
-    32,116,104,101,32,109,101,115,115,97,103,101,32,116,111,32,
-    115,116,100,101,114,114,32,105,102,32,45,118,47,80,89,84,
-    72,79,78,86,69,82,66,79,83,69,32,105,115,32,116,117,
-    114,110,101,100,32,111,110,46,117,1,0,0,0,35,117,7,
-    0,0,0,105,109,112,111,114,116,32,117,2,0,0,0,35,
-    32,117,4,0,0,0,102,105,108,101,78,40,2,0,0,0,
-    117,1,0,0,0,35,117,7,0,0,0,105,109,112,111,114,
-    116,32,40,7,0,0,0,117,3,0,0,0,115,121,115,117,
-    5,0,0,0,102,108,97,103,115,117,7,0,0,0,118,101,
-    114,98,111,115,101,117,10,0,0,0,115,116,97,114,116,115,
-    119,105,116,104,117,5,0,0,0,112,114,105,110,116,117,6,
-    0,0,0,102,111,114,109,97,116,117,6,0,0,0,115,116,
-    100,101,114,114,40,2,0,0,0,117,7,0,0,0,109,101,
-    115,115,97,103,101,117,4,0,0,0,97,114,103,115,40,0,
-    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,16,0,0,0,95,
-    118,101,114,98,111,115,101,95,109,101,115,115,97,103,101,230,
-    1,0,0,115,8,0,0,0,0,2,12,1,15,1,13,1,
-    117,16,0,0,0,95,118,101,114,98,111,115,101,95,109,101,
-    115,115,97,103,101,99,1,0,0,0,0,0,0,0,2,0,
-    0,0,3,0,0,0,3,0,0,0,115,35,0,0,0,135,
-    0,0,102,1,0,100,1,0,100,2,0,134,0,0,125,1,
-    0,116,0,0,124,1,0,136,0,0,131,2,0,1,124,1,
-    0,83,40,3,0,0,0,117,39,0,0,0,83,101,116,32,
-    95,95,112,97,99,107,97,103,101,95,95,32,111,110,32,116,
-    104,101,32,114,101,116,117,114,110,101,100,32,109,111,100,117,
-    108,101,46,99,0,0,0,0,0,0,0,0,3,0,0,0,
-    4,0,0,0,31,0,0,0,115,101,0,0,0,136,0,0,
-    124,0,0,124,1,0,142,0,0,125,2,0,116,0,0,124,
-    2,0,100,1,0,100,0,0,131,3,0,100,0,0,107,8,
-    0,114,97,0,124,2,0,106,1,0,124,2,0,95,2,0,
-    116,3,0,124,2,0,100,2,0,131,2,0,115,97,0,124,
-    2,0,106,2,0,106,4,0,100,3,0,131,1,0,100,4,
-    0,25,124,2,0,95,2,0,113,97,0,110,0,0,124,2,
-    0,83,40,5,0,0,0,78,117,11,0,0,0,95,95,112,
-    97,99,107,97,103,101,95,95,117,8,0,0,0,95,95,112,
-    97,116,104,95,95,117,1,0,0,0,46,105,0,0,0,0,
-    40,5,0,0,0,117,7,0,0,0,103,101,116,97,116,116,
-    114,117,8,0,0,0,95,95,110,97,109,101,95,95,117,11,
-    0,0,0,95,95,112,97,99,107,97,103,101,95,95,117,7,
-    0,0,0,104,97,115,97,116,116,114,117,10,0,0,0,114,
-    112,97,114,116,105,116,105,111,110,40,3,0,0,0,117,4,
-    0,0,0,97,114,103,115,117,6,0,0,0,107,119,97,114,
-    103,115,117,6,0,0,0,109,111,100,117,108,101,40,1,0,
-    0,0,117,3,0,0,0,102,120,110,40,0,0,0,0,117,
+    116,115,116,114,97,112,62,117,25,0,0,0,109,111,100,117,
+    108,101,95,102,111,114,95,108,111,97,100,101,114,95,119,114,
+    97,112,112,101,114,24,2,0,0,115,44,0,0,0,0,1,
+    18,1,12,1,6,4,12,3,9,1,13,1,9,1,3,1,
+    19,1,19,1,5,2,6,1,12,2,25,2,9,1,6,2,
+    23,1,3,1,6,1,13,1,12,2,117,52,0,0,0,109,
+    111,100,117,108,101,95,102,111,114,95,108,111,97,100,101,114,
+    46,60,108,111,99,97,108,115,62,46,109,111,100,117,108,101,
+    95,102,111,114,95,108,111,97,100,101,114,95,119,114,97,112,
+    112,101,114,40,1,0,0,0,117,5,0,0,0,95,119,114,
+    97,112,40,2,0,0,0,117,3,0,0,0,102,120,110,117,
+    25,0,0,0,109,111,100,117,108,101,95,102,111,114,95,108,
+    111,97,100,101,114,95,119,114,97,112,112,101,114,40,0,0,
+    0,0,40,1,0,0,0,117,3,0,0,0,102,120,110,117,
     29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
     114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,19,0,0,0,115,101,116,95,112,97,99,107,97,103,
-    101,95,119,114,97,112,112,101,114,240,1,0,0,115,12,0,
-    0,0,0,1,15,1,24,1,12,1,15,1,31,1,117,40,
-    0,0,0,115,101,116,95,112,97,99,107,97,103,101,46,60,
-    108,111,99,97,108,115,62,46,115,101,116,95,112,97,99,107,
-    97,103,101,95,119,114,97,112,112,101,114,40,1,0,0,0,
-    117,5,0,0,0,95,119,114,97,112,40,2,0,0,0,117,
-    3,0,0,0,102,120,110,117,19,0,0,0,115,101,116,95,
-    112,97,99,107,97,103,101,95,119,114,97,112,112,101,114,40,
-    0,0,0,0,40,1,0,0,0,117,3,0,0,0,102,120,
-    110,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
-    112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
-    97,112,62,117,11,0,0,0,115,101,116,95,112,97,99,107,
-    97,103,101,238,1,0,0,115,6,0,0,0,0,2,18,7,
-    13,1,117,11,0,0,0,115,101,116,95,112,97,99,107,97,
-    103,101,99,1,0,0,0,0,0,0,0,2,0,0,0,3,
-    0,0,0,3,0,0,0,115,35,0,0,0,135,0,0,102,
-    1,0,100,1,0,100,2,0,134,0,0,125,1,0,116,0,
-    0,124,1,0,136,0,0,131,2,0,1,124,1,0,83,40,
-    3,0,0,0,117,38,0,0,0,83,101,116,32,95,95,108,
-    111,97,100,101,114,95,95,32,111,110,32,116,104,101,32,114,
-    101,116,117,114,110,101,100,32,109,111,100,117,108,101,46,99,
-    1,0,0,0,0,0,0,0,4,0,0,0,4,0,0,0,
-    31,0,0,0,115,49,0,0,0,136,0,0,124,0,0,124,
-    1,0,124,2,0,142,1,0,125,3,0,116,0,0,124,3,
-    0,100,1,0,131,2,0,115,45,0,124,0,0,124,3,0,
-    95,1,0,110,0,0,124,3,0,83,40,2,0,0,0,78,
-    117,10,0,0,0,95,95,108,111,97,100,101,114,95,95,40,
-    2,0,0,0,117,7,0,0,0,104,97,115,97,116,116,114,
-    117,10,0,0,0,95,95,108,111,97,100,101,114,95,95,40,
-    4,0,0,0,117,4,0,0,0,115,101,108,102,117,4,0,
-    0,0,97,114,103,115,117,6,0,0,0,107,119,97,114,103,
-    115,117,6,0,0,0,109,111,100,117,108,101,40,1,0,0,
-    0,117,3,0,0,0,102,120,110,40,0,0,0,0,117,29,
-    0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
-    116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
-    117,18,0,0,0,115,101,116,95,108,111,97,100,101,114,95,
-    119,114,97,112,112,101,114,253,1,0,0,115,8,0,0,0,
-    0,1,18,1,15,1,12,1,117,38,0,0,0,115,101,116,
-    95,108,111,97,100,101,114,46,60,108,111,99,97,108,115,62,
-    46,115,101,116,95,108,111,97,100,101,114,95,119,114,97,112,
+    62,117,17,0,0,0,109,111,100,117,108,101,95,102,111,114,
+    95,108,111,97,100,101,114,6,2,0,0,115,6,0,0,0,
+    0,18,18,33,13,1,117,17,0,0,0,109,111,100,117,108,
+    101,95,102,111,114,95,108,111,97,100,101,114,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,4,0,0,0,3,0,0,
+    0,115,38,0,0,0,100,1,0,135,0,0,102,1,0,100,
+    2,0,100,3,0,134,1,0,125,1,0,116,0,0,124,1,
+    0,136,0,0,131,2,0,1,124,1,0,83,40,4,0,0,
+    0,117,252,0,0,0,68,101,99,111,114,97,116,111,114,32,
+    116,111,32,118,101,114,105,102,121,32,116,104,97,116,32,116,
+    104,101,32,109,111,100,117,108,101,32,98,101,105,110,103,32,
+    114,101,113,117,101,115,116,101,100,32,109,97,116,99,104,101,
+    115,32,116,104,101,32,111,110,101,32,116,104,101,10,32,32,
+    32,32,108,111,97,100,101,114,32,99,97,110,32,104,97,110,
+    100,108,101,46,10,10,32,32,32,32,84,104,101,32,102,105,
+    114,115,116,32,97,114,103,117,109,101,110,116,32,40,115,101,
+    108,102,41,32,109,117,115,116,32,100,101,102,105,110,101,32,
+    95,110,97,109,101,32,119,104,105,99,104,32,116,104,101,32,
+    115,101,99,111,110,100,32,97,114,103,117,109,101,110,116,32,
+    105,115,10,32,32,32,32,99,111,109,112,97,114,101,100,32,
+    97,103,97,105,110,115,116,46,32,73,102,32,116,104,101,32,
+    99,111,109,112,97,114,105,115,111,110,32,102,97,105,108,115,
+    32,116,104,101,110,32,73,109,112,111,114,116,69,114,114,111,
+    114,32,105,115,32,114,97,105,115,101,100,46,10,10,32,32,
+    32,32,78,99,2,0,0,0,0,0,0,0,4,0,0,0,
+    5,0,0,0,31,0,0,0,115,83,0,0,0,124,1,0,
+    100,0,0,107,8,0,114,24,0,124,0,0,106,0,0,125,
+    1,0,110,40,0,124,0,0,106,0,0,124,1,0,107,3,
+    0,114,64,0,116,1,0,100,1,0,124,1,0,22,100,2,
+    0,124,1,0,131,1,1,130,1,0,110,0,0,136,0,0,
+    124,0,0,124,1,0,124,2,0,124,3,0,142,2,0,83,
+    40,3,0,0,0,78,117,23,0,0,0,108,111,97,100,101,
+    114,32,99,97,110,110,111,116,32,104,97,110,100,108,101,32,
+    37,115,117,4,0,0,0,110,97,109,101,40,2,0,0,0,
+    117,4,0,0,0,110,97,109,101,117,11,0,0,0,73,109,
+    112,111,114,116,69,114,114,111,114,40,4,0,0,0,117,4,
+    0,0,0,115,101,108,102,117,4,0,0,0,110,97,109,101,
+    117,4,0,0,0,97,114,103,115,117,6,0,0,0,107,119,
+    97,114,103,115,40,1,0,0,0,117,6,0,0,0,109,101,
+    116,104,111,100,40,0,0,0,0,117,29,0,0,0,60,102,
+    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
+    95,98,111,111,116,115,116,114,97,112,62,117,19,0,0,0,
+    95,99,104,101,99,107,95,110,97,109,101,95,119,114,97,112,
+    112,101,114,69,2,0,0,115,10,0,0,0,0,1,12,1,
+    12,1,15,1,25,1,117,40,0,0,0,95,99,104,101,99,
+    107,95,110,97,109,101,46,60,108,111,99,97,108,115,62,46,
+    95,99,104,101,99,107,95,110,97,109,101,95,119,114,97,112,
+    112,101,114,40,1,0,0,0,117,5,0,0,0,95,119,114,
+    97,112,40,2,0,0,0,117,6,0,0,0,109,101,116,104,
+    111,100,117,19,0,0,0,95,99,104,101,99,107,95,110,97,
+    109,101,95,119,114,97,112,112,101,114,40,0,0,0,0,40,
+    1,0,0,0,117,6,0,0,0,109,101,116,104,111,100,117,
+    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
+    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
+    62,117,11,0,0,0,95,99,104,101,99,107,95,110,97,109,
+    101,61,2,0,0,115,6,0,0,0,0,8,21,6,13,1,
+    117,11,0,0,0,95,99,104,101,99,107,95,110,97,109,101,
+    99,1,0,0,0,0,0,0,0,2,0,0,0,3,0,0,
+    0,3,0,0,0,115,35,0,0,0,135,0,0,102,1,0,
+    100,1,0,100,2,0,134,0,0,125,1,0,116,0,0,124,
+    1,0,136,0,0,131,2,0,1,124,1,0,83,40,3,0,
+    0,0,117,49,0,0,0,68,101,99,111,114,97,116,111,114,
+    32,116,111,32,118,101,114,105,102,121,32,116,104,101,32,110,
+    97,109,101,100,32,109,111,100,117,108,101,32,105,115,32,98,
+    117,105,108,116,45,105,110,46,99,2,0,0,0,0,0,0,
+    0,2,0,0,0,4,0,0,0,19,0,0,0,115,58,0,
+    0,0,124,1,0,116,0,0,106,1,0,107,7,0,114,45,
+    0,116,2,0,100,1,0,106,3,0,124,1,0,131,1,0,
+    100,2,0,124,1,0,131,1,1,130,1,0,110,0,0,136,
+    0,0,124,0,0,124,1,0,131,2,0,83,40,3,0,0,
+    0,78,117,27,0,0,0,123,125,32,105,115,32,110,111,116,
+    32,97,32,98,117,105,108,116,45,105,110,32,109,111,100,117,
+    108,101,117,4,0,0,0,110,97,109,101,40,4,0,0,0,
+    117,3,0,0,0,115,121,115,117,20,0,0,0,98,117,105,
+    108,116,105,110,95,109,111,100,117,108,101,95,110,97,109,101,
+    115,117,11,0,0,0,73,109,112,111,114,116,69,114,114,111,
+    114,117,6,0,0,0,102,111,114,109,97,116,40,2,0,0,
+    0,117,4,0,0,0,115,101,108,102,117,8,0,0,0,102,
+    117,108,108,110,97,109,101,40,1,0,0,0,117,3,0,0,
+    0,102,120,110,40,0,0,0,0,117,29,0,0,0,60,102,
+    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
+    95,98,111,111,116,115,116,114,97,112,62,117,25,0,0,0,
+    95,114,101,113,117,105,114,101,115,95,98,117,105,108,116,105,
+    110,95,119,114,97,112,112,101,114,81,2,0,0,115,8,0,
+    0,0,0,1,15,1,18,1,12,1,117,52,0,0,0,95,
+    114,101,113,117,105,114,101,115,95,98,117,105,108,116,105,110,
+    46,60,108,111,99,97,108,115,62,46,95,114,101,113,117,105,
+    114,101,115,95,98,117,105,108,116,105,110,95,119,114,97,112,
     112,101,114,40,1,0,0,0,117,5,0,0,0,95,119,114,
     97,112,40,2,0,0,0,117,3,0,0,0,102,120,110,117,
-    18,0,0,0,115,101,116,95,108,111,97,100,101,114,95,119,
-    114,97,112,112,101,114,40,0,0,0,0,40,1,0,0,0,
-    117,3,0,0,0,102,120,110,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,10,0,0,0,115,
-    101,116,95,108,111,97,100,101,114,251,1,0,0,115,6,0,
-    0,0,0,2,18,5,13,1,117,10,0,0,0,115,101,116,
-    95,108,111,97,100,101,114,99,1,0,0,0,0,0,0,0,
-    2,0,0,0,3,0,0,0,3,0,0,0,115,35,0,0,
-    0,135,0,0,102,1,0,100,1,0,100,2,0,134,0,0,
-    125,1,0,116,0,0,124,1,0,136,0,0,131,2,0,1,
-    124,1,0,83,40,3,0,0,0,117,42,3,0,0,68,101,
-    99,111,114,97,116,111,114,32,116,111,32,104,97,110,100,108,
-    101,32,115,101,108,101,99,116,105,110,103,32,116,104,101,32,
-    112,114,111,112,101,114,32,109,111,100,117,108,101,32,102,111,
-    114,32,108,111,97,100,101,114,115,46,10,10,32,32,32,32,
-    84,104,101,32,100,101,99,111,114,97,116,101,100,32,102,117,
-    110,99,116,105,111,110,32,105,115,32,112,97,115,115,101,100,
-    32,116,104,101,32,109,111,100,117,108,101,32,116,111,32,117,
-    115,101,32,105,110,115,116,101,97,100,32,111,102,32,116,104,
-    101,32,109,111,100,117,108,101,10,32,32,32,32,110,97,109,
-    101,46,32,84,104,101,32,109,111,100,117,108,101,32,112,97,
-    115,115,101,100,32,105,110,32,116,111,32,116,104,101,32,102,
-    117,110,99,116,105,111,110,32,105,115,32,101,105,116,104,101,
-    114,32,102,114,111,109,32,115,121,115,46,109,111,100,117,108,
-    101,115,32,105,102,10,32,32,32,32,105,116,32,97,108,114,
-    101,97,100,121,32,101,120,105,115,116,115,32,111,114,32,105,
-    115,32,97,32,110,101,119,32,109,111,100,117,108,101,46,32,
-    73,102,32,116,104,101,32,109,111,100,117,108,101,32,105,115,
-    32,110,101,119,44,32,116,104,101,110,32,95,95,110,97,109,
-    101,95,95,10,32,32,32,32,105,115,32,115,101,116,32,116,
-    104,101,32,102,105,114,115,116,32,97,114,103,117,109,101,110,
-    116,32,116,111,32,116,104,101,32,109,101,116,104,111,100,44,
-    32,95,95,108,111,97,100,101,114,95,95,32,105,115,32,115,
-    101,116,32,116,111,32,115,101,108,102,44,32,97,110,100,10,
-    32,32,32,32,95,95,112,97,99,107,97,103,101,95,95,32,
-    105,115,32,115,101,116,32,97,99,99,111,114,100,105,110,103,
-    108,121,32,40,105,102,32,115,101,108,102,46,105,115,95,112,
-    97,99,107,97,103,101,40,41,32,105,115,32,100,101,102,105,
-    110,101,100,41,32,119,105,108,108,32,98,101,32,115,101,116,
-    10,32,32,32,32,98,101,102,111,114,101,32,105,116,32,105,
-    115,32,112,97,115,115,101,100,32,116,111,32,116,104,101,32,
-    100,101,99,111,114,97,116,101,100,32,102,117,110,99,116,105,
-    111,110,32,40,105,102,32,115,101,108,102,46,105,115,95,112,
-    97,99,107,97,103,101,40,41,32,100,111,101,115,10,32,32,
-    32,32,110,111,116,32,119,111,114,107,32,102,111,114,32,116,
-    104,101,32,109,111,100,117,108,101,32,105,116,32,119,105,108,
-    108,32,98,101,32,115,101,116,32,112,111,115,116,45,108,111,
-    97,100,41,46,10,10,32,32,32,32,73,102,32,97,110,32,
-    101,120,99,101,112,116,105,111,110,32,105,115,32,114,97,105,
-    115,101,100,32,97,110,100,32,116,104,101,32,100,101,99,111,
-    114,97,116,111,114,32,99,114,101,97,116,101,100,32,116,104,
-    101,32,109,111,100,117,108,101,32,105,116,32,105,115,10,32,
-    32,32,32,115,117,98,115,101,113,117,101,110,116,108,121,32,
-    114,101,109,111,118,101,100,32,102,114,111,109,32,115,121,115,
-    46,109,111,100,117,108,101,115,46,10,10,32,32,32,32,84,
-    104,101,32,100,101,99,111,114,97,116,111,114,32,97,115,115,
-    117,109,101,115,32,116,104,97,116,32,116,104,101,32,100,101,
-    99,111,114,97,116,101,100,32,102,117,110,99,116,105,111,110,
-    32,116,97,107,101,115,32,116,104,101,32,109,111,100,117,108,
-    101,32,110,97,109,101,32,97,115,10,32,32,32,32,116,104,
-    101,32,115,101,99,111,110,100,32,97,114,103,117,109,101,110,
-    116,46,10,10,32,32,32,32,99,2,0,0,0,0,0,0,
-    0,7,0,0,0,25,0,0,0,31,0,0,0,115,254,0,
-    0,0,116,0,0,106,1,0,106,2,0,124,1,0,131,1,
-    0,125,4,0,124,4,0,100,0,0,107,9,0,125,5,0,
-    124,5,0,115,168,0,116,3,0,124,1,0,131,1,0,125,
-    4,0,100,1,0,124,4,0,95,4,0,124,4,0,116,0,
-    0,106,1,0,124,1,0,60,124,0,0,124,4,0,95,5,
-    0,121,19,0,124,0,0,106,6,0,124,1,0,131,1,0,
-    125,6,0,87,110,24,0,4,116,7,0,116,8,0,102,2,
-    0,107,10,0,114,124,0,1,1,1,89,113,177,0,88,124,
-    6,0,114,143,0,124,1,0,124,4,0,95,9,0,113,177,
-    0,124,1,0,106,10,0,100,2,0,131,1,0,100,3,0,
-    25,124,4,0,95,9,0,110,9,0,100,1,0,124,4,0,
-    95,4,0,122,60,0,121,23,0,136,0,0,124,0,0,124,
-    4,0,124,2,0,124,3,0,142,2,0,83,87,110,30,0,
-    1,1,1,124,5,0,115,228,0,116,0,0,106,1,0,124,
-    1,0,61,110,0,0,130,0,0,89,110,1,0,88,87,100,
-    0,0,100,4,0,124,4,0,95,4,0,88,100,0,0,83,
-    40,5,0,0,0,78,84,117,1,0,0,0,46,105,0,0,
-    0,0,70,40,11,0,0,0,117,3,0,0,0,115,121,115,
-    117,7,0,0,0,109,111,100,117,108,101,115,117,3,0,0,
-    0,103,101,116,117,10,0,0,0,110,101,119,95,109,111,100,
-    117,108,101,117,16,0,0,0,95,95,105,110,105,116,105,97,
-    108,105,122,105,110,103,95,95,117,10,0,0,0,95,95,108,
-    111,97,100,101,114,95,95,117,10,0,0,0,105,115,95,112,
-    97,99,107,97,103,101,117,11,0,0,0,73,109,112,111,114,
-    116,69,114,114,111,114,117,14,0,0,0,65,116,116,114,105,
-    98,117,116,101,69,114,114,111,114,117,11,0,0,0,95,95,
-    112,97,99,107,97,103,101,95,95,117,10,0,0,0,114,112,
-    97,114,116,105,116,105,111,110,40,7,0,0,0,117,4,0,
-    0,0,115,101,108,102,117,8,0,0,0,102,117,108,108,110,
-    97,109,101,117,4,0,0,0,97,114,103,115,117,6,0,0,
-    0,107,119,97,114,103,115,117,6,0,0,0,109,111,100,117,
-    108,101,117,9,0,0,0,105,115,95,114,101,108,111,97,100,
-    117,10,0,0,0,105,115,95,112,97,99,107,97,103,101,40,
-    1,0,0,0,117,3,0,0,0,102,120,110,40,0,0,0,
-    0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
-    112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
-    97,112,62,117,25,0,0,0,109,111,100,117,108,101,95,102,
-    111,114,95,108,111,97,100,101,114,95,119,114,97,112,112,101,
-    114,24,2,0,0,115,44,0,0,0,0,1,18,1,12,1,
-    6,4,12,3,9,1,13,1,9,1,3,1,19,1,19,1,
-    5,2,6,1,12,2,25,2,9,1,6,2,23,1,3,1,
-    6,1,13,1,12,2,117,52,0,0,0,109,111,100,117,108,
-    101,95,102,111,114,95,108,111,97,100,101,114,46,60,108,111,
-    99,97,108,115,62,46,109,111,100,117,108,101,95,102,111,114,
-    95,108,111,97,100,101,114,95,119,114,97,112,112,101,114,40,
-    1,0,0,0,117,5,0,0,0,95,119,114,97,112,40,2,
-    0,0,0,117,3,0,0,0,102,120,110,117,25,0,0,0,
-    109,111,100,117,108,101,95,102,111,114,95,108,111,97,100,101,
-    114,95,119,114,97,112,112,101,114,40,0,0,0,0,40,1,
-    0,0,0,117,3,0,0,0,102,120,110,117,29,0,0,0,
-    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
-    98,46,95,98,111,111,116,115,116,114,97,112,62,117,17,0,
-    0,0,109,111,100,117,108,101,95,102,111,114,95,108,111,97,
-    100,101,114,6,2,0,0,115,6,0,0,0,0,18,18,33,
-    13,1,117,17,0,0,0,109,111,100,117,108,101,95,102,111,
-    114,95,108,111,97,100,101,114,99,1,0,0,0,0,0,0,
-    0,2,0,0,0,4,0,0,0,3,0,0,0,115,38,0,
-    0,0,100,1,0,135,0,0,102,1,0,100,2,0,100,3,
-    0,134,1,0,125,1,0,116,0,0,124,1,0,136,0,0,
-    131,2,0,1,124,1,0,83,40,4,0,0,0,117,252,0,
-    0,0,68,101,99,111,114,97,116,111,114,32,116,111,32,118,
-    101,114,105,102,121,32,116,104,97,116,32,116,104,101,32,109,
-    111,100,117,108,101,32,98,101,105,110,103,32,114,101,113,117,
-    101,115,116,101,100,32,109,97,116,99,104,101,115,32,116,104,
-    101,32,111,110,101,32,116,104,101,10,32,32,32,32,108,111,
-    97,100,101,114,32,99,97,110,32,104,97,110,100,108,101,46,
-    10,10,32,32,32,32,84,104,101,32,102,105,114,115,116,32,
-    97,114,103,117,109,101,110,116,32,40,115,101,108,102,41,32,
-    109,117,115,116,32,100,101,102,105,110,101,32,95,110,97,109,
-    101,32,119,104,105,99,104,32,116,104,101,32,115,101,99,111,
-    110,100,32,97,114,103,117,109,101,110,116,32,105,115,10,32,
-    32,32,32,99,111,109,112,97,114,101,100,32,97,103,97,105,
-    110,115,116,46,32,73,102,32,116,104,101,32,99,111,109,112,
-    97,114,105,115,111,110,32,102,97,105,108,115,32,116,104,101,
-    110,32,73,109,112,111,114,116,69,114,114,111,114,32,105,115,
-    32,114,97,105,115,101,100,46,10,10,32,32,32,32,78,99,
-    2,0,0,0,0,0,0,0,4,0,0,0,5,0,0,0,
-    31,0,0,0,115,83,0,0,0,124,1,0,100,0,0,107,
-    8,0,114,24,0,124,0,0,106,0,0,125,1,0,110,40,
-    0,124,0,0,106,0,0,124,1,0,107,3,0,114,64,0,
-    116,1,0,100,1,0,124,1,0,22,100,2,0,124,1,0,
-    131,1,1,130,1,0,110,0,0,136,0,0,124,0,0,124,
-    1,0,124,2,0,124,3,0,142,2,0,83,40,3,0,0,
-    0,78,117,23,0,0,0,108,111,97,100,101,114,32,99,97,
-    110,110,111,116,32,104,97,110,100,108,101,32,37,115,117,4,
-    0,0,0,110,97,109,101,40,2,0,0,0,117,4,0,0,
-    0,110,97,109,101,117,11,0,0,0,73,109,112,111,114,116,
-    69,114,114,111,114,40,4,0,0,0,117,4,0,0,0,115,
-    101,108,102,117,4,0,0,0,110,97,109,101,117,4,0,0,
-    0,97,114,103,115,117,6,0,0,0,107,119,97,114,103,115,
-    40,1,0,0,0,117,6,0,0,0,109,101,116,104,111,100,
-    40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
-    110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,19,0,0,0,95,99,104,101,
-    99,107,95,110,97,109,101,95,119,114,97,112,112,101,114,69,
-    2,0,0,115,10,0,0,0,0,1,12,1,12,1,15,1,
-    25,1,117,40,0,0,0,95,99,104,101,99,107,95,110,97,
-    109,101,46,60,108,111,99,97,108,115,62,46,95,99,104,101,
-    99,107,95,110,97,109,101,95,119,114,97,112,112,101,114,40,
-    1,0,0,0,117,5,0,0,0,95,119,114,97,112,40,2,
-    0,0,0,117,6,0,0,0,109,101,116,104,111,100,117,19,
-    0,0,0,95,99,104,101,99,107,95,110,97,109,101,95,119,
-    114,97,112,112,101,114,40,0,0,0,0,40,1,0,0,0,
-    117,6,0,0,0,109,101,116,104,111,100,117,29,0,0,0,
-    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
-    98,46,95,98,111,111,116,115,116,114,97,112,62,117,11,0,
-    0,0,95,99,104,101,99,107,95,110,97,109,101,61,2,0,
-    0,115,6,0,0,0,0,8,21,6,13,1,117,11,0,0,
-    0,95,99,104,101,99,107,95,110,97,109,101,99,1,0,0,
+    25,0,0,0,95,114,101,113,117,105,114,101,115,95,98,117,
+    105,108,116,105,110,95,119,114,97,112,112,101,114,40,0,0,
+    0,0,40,1,0,0,0,117,3,0,0,0,102,120,110,117,
+    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
+    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
+    62,117,17,0,0,0,95,114,101,113,117,105,114,101,115,95,
+    98,117,105,108,116,105,110,79,2,0,0,115,6,0,0,0,
+    0,2,18,5,13,1,117,17,0,0,0,95,114,101,113,117,
+    105,114,101,115,95,98,117,105,108,116,105,110,99,1,0,0,
     0,0,0,0,0,2,0,0,0,3,0,0,0,3,0,0,
     0,115,35,0,0,0,135,0,0,102,1,0,100,1,0,100,
     2,0,134,0,0,125,1,0,116,0,0,124,1,0,136,0,
-    0,131,2,0,1,124,1,0,83,40,3,0,0,0,117,49,
+    0,131,2,0,1,124,1,0,83,40,3,0,0,0,117,47,
     0,0,0,68,101,99,111,114,97,116,111,114,32,116,111,32,
     118,101,114,105,102,121,32,116,104,101,32,110,97,109,101,100,
-    32,109,111,100,117,108,101,32,105,115,32,98,117,105,108,116,
-    45,105,110,46,99,2,0,0,0,0,0,0,0,2,0,0,
-    0,4,0,0,0,19,0,0,0,115,58,0,0,0,124,1,
-    0,116,0,0,106,1,0,107,7,0,114,45,0,116,2,0,
-    100,1,0,106,3,0,124,1,0,131,1,0,100,2,0,124,
-    1,0,131,1,1,130,1,0,110,0,0,136,0,0,124,0,
-    0,124,1,0,131,2,0,83,40,3,0,0,0,78,117,27,
-    0,0,0,123,125,32,105,115,32,110,111,116,32,97,32,98,
-    117,105,108,116,45,105,110,32,109,111,100,117,108,101,117,4,
-    0,0,0,110,97,109,101,40,4,0,0,0,117,3,0,0,
-    0,115,121,115,117,20,0,0,0,98,117,105,108,116,105,110,
-    95,109,111,100,117,108,101,95,110,97,109,101,115,117,11,0,
-    0,0,73,109,112,111,114,116,69,114,114,111,114,117,6,0,
-    0,0,102,111,114,109,97,116,40,2,0,0,0,117,4,0,
-    0,0,115,101,108,102,117,8,0,0,0,102,117,108,108,110,
-    97,109,101,40,1,0,0,0,117,3,0,0,0,102,120,110,
-    40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
-    110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,25,0,0,0,95,114,101,113,
-    117,105,114,101,115,95,98,117,105,108,116,105,110,95,119,114,
-    97,112,112,101,114,81,2,0,0,115,8,0,0,0,0,1,
-    15,1,18,1,12,1,117,52,0,0,0,95,114,101,113,117,
-    105,114,101,115,95,98,117,105,108,116,105,110,46,60,108,111,
+    32,109,111,100,117,108,101,32,105,115,32,102,114,111,122,101,
+    110,46,99,2,0,0,0,0,0,0,0,2,0,0,0,4,
+    0,0,0,19,0,0,0,115,58,0,0,0,116,0,0,106,
+    1,0,124,1,0,131,1,0,115,45,0,116,2,0,100,1,
+    0,106,3,0,124,1,0,131,1,0,100,2,0,124,1,0,
+    131,1,1,130,1,0,110,0,0,136,0,0,124,0,0,124,
+    1,0,131,2,0,83,40,3,0,0,0,78,117,25,0,0,
+    0,123,125,32,105,115,32,110,111,116,32,97,32,102,114,111,
+    122,101,110,32,109,111,100,117,108,101,117,4,0,0,0,110,
+    97,109,101,40,4,0,0,0,117,4,0,0,0,95,105,109,
+    112,117,9,0,0,0,105,115,95,102,114,111,122,101,110,117,
+    11,0,0,0,73,109,112,111,114,116,69,114,114,111,114,117,
+    6,0,0,0,102,111,114,109,97,116,40,2,0,0,0,117,
+    4,0,0,0,115,101,108,102,117,8,0,0,0,102,117,108,
+    108,110,97,109,101,40,1,0,0,0,117,3,0,0,0,102,
+    120,110,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
+    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
+    111,111,116,115,116,114,97,112,62,117,24,0,0,0,95,114,
+    101,113,117,105,114,101,115,95,102,114,111,122,101,110,95,119,
+    114,97,112,112,101,114,92,2,0,0,115,8,0,0,0,0,
+    1,15,1,18,1,12,1,117,50,0,0,0,95,114,101,113,
+    117,105,114,101,115,95,102,114,111,122,101,110,46,60,108,111,
     99,97,108,115,62,46,95,114,101,113,117,105,114,101,115,95,
-    98,117,105,108,116,105,110,95,119,114,97,112,112,101,114,40,
-    1,0,0,0,117,5,0,0,0,95,119,114,97,112,40,2,
-    0,0,0,117,3,0,0,0,102,120,110,117,25,0,0,0,
-    95,114,101,113,117,105,114,101,115,95,98,117,105,108,116,105,
-    110,95,119,114,97,112,112,101,114,40,0,0,0,0,40,1,
-    0,0,0,117,3,0,0,0,102,120,110,117,29,0,0,0,
-    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
-    98,46,95,98,111,111,116,115,116,114,97,112,62,117,17,0,
-    0,0,95,114,101,113,117,105,114,101,115,95,98,117,105,108,
-    116,105,110,79,2,0,0,115,6,0,0,0,0,2,18,5,
-    13,1,117,17,0,0,0,95,114,101,113,117,105,114,101,115,
-    95,98,117,105,108,116,105,110,99,1,0,0,0,0,0,0,
-    0,2,0,0,0,3,0,0,0,3,0,0,0,115,35,0,
-    0,0,135,0,0,102,1,0,100,1,0,100,2,0,134,0,
-    0,125,1,0,116,0,0,124,1,0,136,0,0,131,2,0,
-    1,124,1,0,83,40,3,0,0,0,117,47,0,0,0,68,
-    101,99,111,114,97,116,111,114,32,116,111,32,118,101,114,105,
-    102,121,32,116,104,101,32,110,97,109,101,100,32,109,111,100,
-    117,108,101,32,105,115,32,102,114,111,122,101,110,46,99,2,
-    0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,19,
-    0,0,0,115,58,0,0,0,116,0,0,106,1,0,124,1,
-    0,131,1,0,115,45,0,116,2,0,100,1,0,106,3,0,
-    124,1,0,131,1,0,100,2,0,124,1,0,131,1,1,130,
-    1,0,110,0,0,136,0,0,124,0,0,124,1,0,131,2,
-    0,83,40,3,0,0,0,78,117,25,0,0,0,123,125,32,
-    105,115,32,110,111,116,32,97,32,102,114,111,122,101,110,32,
-    109,111,100,117,108,101,117,4,0,0,0,110,97,109,101,40,
-    4,0,0,0,117,4,0,0,0,95,105,109,112,117,9,0,
-    0,0,105,115,95,102,114,111,122,101,110,117,11,0,0,0,
-    73,109,112,111,114,116,69,114,114,111,114,117,6,0,0,0,
-    102,111,114,109,97,116,40,2,0,0,0,117,4,0,0,0,
-    115,101,108,102,117,8,0,0,0,102,117,108,108,110,97,109,
-    101,40,1,0,0,0,117,3,0,0,0,102,120,110,40,0,
-    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
-    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
-    116,114,97,112,62,117,24,0,0,0,95,114,101,113,117,105,
-    114,101,115,95,102,114,111,122,101,110,95,119,114,97,112,112,
-    101,114,92,2,0,0,115,8,0,0,0,0,1,15,1,18,
-    1,12,1,117,50,0,0,0,95,114,101,113,117,105,114,101,
-    115,95,102,114,111,122,101,110,46,60,108,111,99,97,108,115,
-    62,46,95,114,101,113,117,105,114,101,115,95,102,114,111,122,
-    101,110,95,119,114,97,112,112,101,114,40,1,0,0,0,117,
-    5,0,0,0,95,119,114,97,112,40,2,0,0,0,117,3,
-    0,0,0,102,120,110,117,24,0,0,0,95,114,101,113,117,
-    105,114,101,115,95,102,114,111,122,101,110,95,119,114,97,112,
-    112,101,114,40,0,0,0,0,40,1,0,0,0,117,3,0,
-    0,0,102,120,110,117,29,0,0,0,60,102,114,111,122,101,
-    110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,16,0,0,0,95,114,101,113,
-    117,105,114,101,115,95,102,114,111,122,101,110,90,2,0,0,
-    115,6,0,0,0,0,2,18,5,13,1,117,16,0,0,0,
+    102,114,111,122,101,110,95,119,114,97,112,112,101,114,40,1,
+    0,0,0,117,5,0,0,0,95,119,114,97,112,40,2,0,
+    0,0,117,3,0,0,0,102,120,110,117,24,0,0,0,95,
+    114,101,113,117,105,114,101,115,95,102,114,111,122,101,110,95,
+    119,114,97,112,112,101,114,40,0,0,0,0,40,1,0,0,
+    0,117,3,0,0,0,102,120,110,117,29,0,0,0,60,102,
+    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
+    95,98,111,111,116,115,116,114,97,112,62,117,16,0,0,0,
     95,114,101,113,117,105,114,101,115,95,102,114,111,122,101,110,
-    99,2,0,0,0,0,0,0,0,5,0,0,0,5,0,0,
-    0,67,0,0,0,115,87,0,0,0,124,0,0,106,0,0,
-    124,1,0,131,1,0,92,2,0,125,2,0,125,3,0,124,
-    2,0,100,1,0,107,8,0,114,83,0,116,1,0,124,3,
-    0,131,1,0,114,83,0,100,2,0,125,4,0,116,2,0,
-    106,3,0,124,4,0,106,4,0,124,3,0,100,3,0,25,
-    131,1,0,116,5,0,131,2,0,1,110,0,0,124,2,0,
-    83,40,4,0,0,0,117,86,0,0,0,84,114,121,32,116,
-    111,32,102,105,110,100,32,97,32,108,111,97,100,101,114,32,
-    102,111,114,32,116,104,101,32,115,112,101,99,105,102,105,101,
-    100,32,109,111,100,117,108,101,32,98,121,32,100,101,108,101,
-    103,97,116,105,110,103,32,116,111,10,32,32,32,32,115,101,
-    108,102,46,102,105,110,100,95,108,111,97,100,101,114,40,41,
-    46,78,117,44,0,0,0,78,111,116,32,105,109,112,111,114,
-    116,105,110,103,32,100,105,114,101,99,116,111,114,121,32,123,
-    125,58,32,109,105,115,115,105,110,103,32,95,95,105,110,105,
-    116,95,95,105,0,0,0,0,40,6,0,0,0,117,11,0,
-    0,0,102,105,110,100,95,108,111,97,100,101,114,117,3,0,
-    0,0,108,101,110,117,9,0,0,0,95,119,97,114,110,105,
-    110,103,115,117,4,0,0,0,119,97,114,110,117,6,0,0,
-    0,102,111,114,109,97,116,117,13,0,0,0,73,109,112,111,
-    114,116,87,97,114,110,105,110,103,40,5,0,0,0,117,4,
-    0,0,0,115,101,108,102,117,8,0,0,0,102,117,108,108,
-    110,97,109,101,117,6,0,0,0,108,111,97,100,101,114,117,
-    8,0,0,0,112,111,114,116,105,111,110,115,117,3,0,0,
-    0,109,115,103,40,0,0,0,0,40,0,0,0,0,117,29,
-    0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
-    116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
-    117,17,0,0,0,95,102,105,110,100,95,109,111,100,117,108,
-    101,95,115,104,105,109,101,2,0,0,115,10,0,0,0,0,
-    6,21,1,24,1,6,1,32,1,117,17,0,0,0,95,102,
-    105,110,100,95,109,111,100,117,108,101,95,115,104,105,109,99,
-    1,0,0,0,0,0,0,0,1,0,0,0,6,0,0,0,
-    66,0,0,0,115,173,0,0,0,124,0,0,69,101,0,0,
-    90,1,0,100,0,0,90,2,0,100,1,0,90,3,0,101,
-    4,0,100,2,0,100,3,0,132,0,0,131,1,0,90,5,
-    0,101,4,0,100,4,0,100,5,0,100,6,0,132,1,0,
-    131,1,0,90,6,0,101,4,0,101,7,0,101,8,0,101,
-    9,0,100,7,0,100,8,0,132,0,0,131,1,0,131,1,
-    0,131,1,0,131,1,0,90,10,0,101,4,0,101,9,0,
-    100,9,0,100,10,0,132,0,0,131,1,0,131,1,0,90,
-    11,0,101,4,0,101,9,0,100,11,0,100,12,0,132,0,
-    0,131,1,0,131,1,0,90,12,0,101,4,0,101,9,0,
-    100,13,0,100,14,0,132,0,0,131,1,0,131,1,0,90,
-    13,0,100,4,0,83,40,15,0,0,0,117,15,0,0,0,
-    66,117,105,108,116,105,110,73,109,112,111,114,116,101,114,117,
-    144,0,0,0,77,101,116,97,32,112,97,116,104,32,105,109,
-    112,111,114,116,32,102,111,114,32,98,117,105,108,116,45,105,
-    110,32,109,111,100,117,108,101,115,46,10,10,32,32,32,32,
-    65,108,108,32,109,101,116,104,111,100,115,32,97,114,101,32,
-    101,105,116,104,101,114,32,99,108,97,115,115,32,111,114,32,
-    115,116,97,116,105,99,32,109,101,116,104,111,100,115,32,116,
-    111,32,97,118,111,105,100,32,116,104,101,32,110,101,101,100,
-    32,116,111,10,32,32,32,32,105,110,115,116,97,110,116,105,
-    97,116,101,32,116,104,101,32,99,108,97,115,115,46,10,10,
-    32,32,32,32,99,2,0,0,0,0,0,0,0,2,0,0,
-    0,2,0,0,0,67,0,0,0,115,16,0,0,0,100,1,
-    0,106,0,0,124,1,0,106,1,0,131,1,0,83,40,2,
-    0,0,0,78,117,24,0,0,0,60,109,111,100,117,108,101,
-    32,39,123,125,39,32,40,98,117,105,108,116,45,105,110,41,
-    62,40,2,0,0,0,117,6,0,0,0,102,111,114,109,97,
-    116,117,8,0,0,0,95,95,110,97,109,101,95,95,40,2,
-    0,0,0,117,3,0,0,0,99,108,115,117,6,0,0,0,
-    109,111,100,117,108,101,40,0,0,0,0,40,0,0,0,0,
-    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
-    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
-    112,62,117,11,0,0,0,109,111,100,117,108,101,95,114,101,
-    112,114,127,2,0,0,115,2,0,0,0,0,2,117,27,0,
-    0,0,66,117,105,108,116,105,110,73,109,112,111,114,116,101,
-    114,46,109,111,100,117,108,101,95,114,101,112,114,78,99,3,
-    0,0,0,0,0,0,0,3,0,0,0,2,0,0,0,67,
-    0,0,0,115,39,0,0,0,124,2,0,100,1,0,107,9,
-    0,114,16,0,100,1,0,83,116,0,0,106,1,0,124,1,
-    0,131,1,0,114,35,0,124,0,0,83,100,1,0,83,40,
-    2,0,0,0,117,113,0,0,0,70,105,110,100,32,116,104,
-    101,32,98,117,105,108,116,45,105,110,32,109,111,100,117,108,
-    101,46,10,10,32,32,32,32,32,32,32,32,73,102,32,39,
-    112,97,116,104,39,32,105,115,32,101,118,101,114,32,115,112,
-    101,99,105,102,105,101,100,32,116,104,101,110,32,116,104,101,
-    32,115,101,97,114,99,104,32,105,115,32,99,111,110,115,105,
-    100,101,114,101,100,32,97,32,102,97,105,108,117,114,101,46,
-    10,10,32,32,32,32,32,32,32,32,78,40,2,0,0,0,
-    117,4,0,0,0,95,105,109,112,117,10,0,0,0,105,115,
-    95,98,117,105,108,116,105,110,40,3,0,0,0,117,3,0,
-    0,0,99,108,115,117,8,0,0,0,102,117,108,108,110,97,
-    109,101,117,4,0,0,0,112,97,116,104,40,0,0,0,0,
-    40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
-    110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,11,0,0,0,102,105,110,100,
-    95,109,111,100,117,108,101,131,2,0,0,115,6,0,0,0,
-    0,7,12,1,4,1,117,27,0,0,0,66,117,105,108,116,
-    105,110,73,109,112,111,114,116,101,114,46,102,105,110,100,95,
-    109,111,100,117,108,101,99,2,0,0,0,0,0,0,0,3,
-    0,0,0,9,0,0,0,67,0,0,0,115,88,0,0,0,
-    124,1,0,116,0,0,106,1,0,107,6,0,125,2,0,121,
-    20,0,116,2,0,116,3,0,106,4,0,124,1,0,131,2,
-    0,83,87,110,46,0,1,1,1,124,2,0,12,114,76,0,
-    124,1,0,116,0,0,106,1,0,107,6,0,114,76,0,116,
-    0,0,106,1,0,124,1,0,61,110,0,0,130,0,0,89,
-    110,1,0,88,100,1,0,83,40,2,0,0,0,117,23,0,
-    0,0,76,111,97,100,32,97,32,98,117,105,108,116,45,105,
-    110,32,109,111,100,117,108,101,46,78,40,5,0,0,0,117,
-    3,0,0,0,115,121,115,117,7,0,0,0,109,111,100,117,
-    108,101,115,117,25,0,0,0,95,99,97,108,108,95,119,105,
-    116,104,95,102,114,97,109,101,115,95,114,101,109,111,118,101,
-    100,117,4,0,0,0,95,105,109,112,117,12,0,0,0,105,
-    110,105,116,95,98,117,105,108,116,105,110,40,3,0,0,0,
-    117,3,0,0,0,99,108,115,117,8,0,0,0,102,117,108,
-    108,110,97,109,101,117,9,0,0,0,105,115,95,114,101,108,
-    111,97,100,40,0,0,0,0,40,0,0,0,0,117,29,0,
-    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
-    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
-    11,0,0,0,108,111,97,100,95,109,111,100,117,108,101,142,
-    2,0,0,115,14,0,0,0,0,6,15,1,3,1,20,1,
-    3,1,22,1,13,1,117,27,0,0,0,66,117,105,108,116,
-    105,110,73,109,112,111,114,116,101,114,46,108,111,97,100,95,
-    109,111,100,117,108,101,99,2,0,0,0,0,0,0,0,2,
-    0,0,0,1,0,0,0,67,0,0,0,115,4,0,0,0,
-    100,1,0,83,40,2,0,0,0,117,57,0,0,0,82,101,
-    116,117,114,110,32,78,111,110,101,32,97,115,32,98,117,105,
-    108,116,45,105,110,32,109,111,100,117,108,101,115,32,100,111,
-    32,110,111,116,32,104,97,118,101,32,99,111,100,101,32,111,
-    98,106,101,99,116,115,46,78,40,0,0,0,0,40,2,0,
-    0,0,117,3,0,0,0,99,108,115,117,8,0,0,0,102,
-    117,108,108,110,97,109,101,40,0,0,0,0,40,0,0,0,
-    0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
-    112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
-    97,112,62,117,8,0,0,0,103,101,116,95,99,111,100,101,
-    156,2,0,0,115,2,0,0,0,0,4,117,24,0,0,0,
-    66,117,105,108,116,105,110,73,109,112,111,114,116,101,114,46,
-    103,101,116,95,99,111,100,101,99,2,0,0,0,0,0,0,
-    0,2,0,0,0,1,0,0,0,67,0,0,0,115,4,0,
-    0,0,100,1,0,83,40,2,0,0,0,117,56,0,0,0,
-    82,101,116,117,114,110,32,78,111,110,101,32,97,115,32,98,
-    117,105,108,116,45,105,110,32,109,111,100,117,108,101,115,32,
-    100,111,32,110,111,116,32,104,97,118,101,32,115,111,117,114,
-    99,101,32,99,111,100,101,46,78,40,0,0,0,0,40,2,
-    0,0,0,117,3,0,0,0,99,108,115,117,8,0,0,0,
-    102,117,108,108,110,97,109,101,40,0,0,0,0,40,0,0,
+    90,2,0,0,115,6,0,0,0,0,2,18,5,13,1,117,
+    16,0,0,0,95,114,101,113,117,105,114,101,115,95,102,114,
+    111,122,101,110,99,2,0,0,0,0,0,0,0,5,0,0,
+    0,5,0,0,0,67,0,0,0,115,87,0,0,0,124,0,
+    0,106,0,0,124,1,0,131,1,0,92,2,0,125,2,0,
+    125,3,0,124,2,0,100,1,0,107,8,0,114,83,0,116,
+    1,0,124,3,0,131,1,0,114,83,0,100,2,0,125,4,
+    0,116,2,0,106,3,0,124,4,0,106,4,0,124,3,0,
+    100,3,0,25,131,1,0,116,5,0,131,2,0,1,110,0,
+    0,124,2,0,83,40,4,0,0,0,117,86,0,0,0,84,
+    114,121,32,116,111,32,102,105,110,100,32,97,32,108,111,97,
+    100,101,114,32,102,111,114,32,116,104,101,32,115,112,101,99,
+    105,102,105,101,100,32,109,111,100,117,108,101,32,98,121,32,
+    100,101,108,101,103,97,116,105,110,103,32,116,111,10,32,32,
+    32,32,115,101,108,102,46,102,105,110,100,95,108,111,97,100,
+    101,114,40,41,46,78,117,44,0,0,0,78,111,116,32,105,
+    109,112,111,114,116,105,110,103,32,100,105,114,101,99,116,111,
+    114,121,32,123,125,58,32,109,105,115,115,105,110,103,32,95,
+    95,105,110,105,116,95,95,105,0,0,0,0,40,6,0,0,
+    0,117,11,0,0,0,102,105,110,100,95,108,111,97,100,101,
+    114,117,3,0,0,0,108,101,110,117,9,0,0,0,95,119,
+    97,114,110,105,110,103,115,117,4,0,0,0,119,97,114,110,
+    117,6,0,0,0,102,111,114,109,97,116,117,13,0,0,0,
+    73,109,112,111,114,116,87,97,114,110,105,110,103,40,5,0,
+    0,0,117,4,0,0,0,115,101,108,102,117,8,0,0,0,
+    102,117,108,108,110,97,109,101,117,6,0,0,0,108,111,97,
+    100,101,114,117,8,0,0,0,112,111,114,116,105,111,110,115,
+    117,3,0,0,0,109,115,103,40,0,0,0,0,40,0,0,
     0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
     109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
-    114,97,112,62,117,10,0,0,0,103,101,116,95,115,111,117,
-    114,99,101,162,2,0,0,115,2,0,0,0,0,4,117,26,
-    0,0,0,66,117,105,108,116,105,110,73,109,112,111,114,116,
-    101,114,46,103,101,116,95,115,111,117,114,99,101,99,2,0,
-    0,0,0,0,0,0,2,0,0,0,1,0,0,0,67,0,
-    0,0,115,4,0,0,0,100,1,0,83,40,2,0,0,0,
-    117,52,0,0,0,82,101,116,117,114,110,32,70,97,108,115,
-    101,32,97,115,32,98,117,105,108,116,45,105,110,32,109,111,
-    100,117,108,101,115,32,97,114,101,32,110,101,118,101,114,32,
-    112,97,99,107,97,103,101,115,46,70,40,0,0,0,0,40,
-    2,0,0,0,117,3,0,0,0,99,108,115,117,8,0,0,
-    0,102,117,108,108,110,97,109,101,40,0,0,0,0,40,0,
-    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
-    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
-    116,114,97,112,62,117,10,0,0,0,105,115,95,112,97,99,
-    107,97,103,101,168,2,0,0,115,2,0,0,0,0,4,117,
-    26,0,0,0,66,117,105,108,116,105,110,73,109,112,111,114,
-    116,101,114,46,105,115,95,112,97,99,107,97,103,101,40,14,
-    0,0,0,117,8,0,0,0,95,95,110,97,109,101,95,95,
-    117,10,0,0,0,95,95,109,111,100,117,108,101,95,95,117,
-    12,0,0,0,95,95,113,117,97,108,110,97,109,101,95,95,
-    117,7,0,0,0,95,95,100,111,99,95,95,117,11,0,0,
-    0,99,108,97,115,115,109,101,116,104,111,100,117,11,0,0,
-    0,109,111,100,117,108,101,95,114,101,112,114,117,11,0,0,
-    0,102,105,110,100,95,109,111,100,117,108,101,117,11,0,0,
-    0,115,101,116,95,112,97,99,107,97,103,101,117,10,0,0,
-    0,115,101,116,95,108,111,97,100,101,114,117,17,0,0,0,
-    95,114,101,113,117,105,114,101,115,95,98,117,105,108,116,105,
-    110,117,11,0,0,0,108,111,97,100,95,109,111,100,117,108,
-    101,117,8,0,0,0,103,101,116,95,99,111,100,101,117,10,
-    0,0,0,103,101,116,95,115,111,117,114,99,101,117,10,0,
-    0,0,105,115,95,112,97,99,107,97,103,101,40,1,0,0,
-    0,117,10,0,0,0,95,95,108,111,99,97,108,115,95,95,
-    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
-    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
-    46,95,98,111,111,116,115,116,114,97,112,62,117,15,0,0,
-    0,66,117,105,108,116,105,110,73,109,112,111,114,116,101,114,
-    118,2,0,0,115,28,0,0,0,16,7,6,2,18,4,3,
-    1,18,10,3,1,3,1,3,1,27,11,3,1,21,5,3,
-    1,21,5,3,1,117,15,0,0,0,66,117,105,108,116,105,
-    110,73,109,112,111,114,116,101,114,99,1,0,0,0,0,0,
-    0,0,1,0,0,0,6,0,0,0,66,0,0,0,115,173,
-    0,0,0,124,0,0,69,101,0,0,90,1,0,100,0,0,
-    90,2,0,100,1,0,90,3,0,101,4,0,100,2,0,100,
-    3,0,132,0,0,131,1,0,90,5,0,101,4,0,100,4,
-    0,100,5,0,100,6,0,132,1,0,131,1,0,90,6,0,
-    101,4,0,101,7,0,101,8,0,101,9,0,100,7,0,100,
-    8,0,132,0,0,131,1,0,131,1,0,131,1,0,131,1,
-    0,90,10,0,101,4,0,101,9,0,100,9,0,100,10,0,
-    132,0,0,131,1,0,131,1,0,90,11,0,101,4,0,101,
-    9,0,100,11,0,100,12,0,132,0,0,131,1,0,131,1,
-    0,90,12,0,101,4,0,101,9,0,100,13,0,100,14,0,
-    132,0,0,131,1,0,131,1,0,90,13,0,100,4,0,83,
-    40,15,0,0,0,117,14,0,0,0,70,114,111,122,101,110,
-    73,109,112,111,114,116,101,114,117,142,0,0,0,77,101,116,
-    97,32,112,97,116,104,32,105,109,112,111,114,116,32,102,111,
-    114,32,102,114,111,122,101,110,32,109,111,100,117,108,101,115,
-    46,10,10,32,32,32,32,65,108,108,32,109,101,116,104,111,
-    100,115,32,97,114,101,32,101,105,116,104,101,114,32,99,108,
-    97,115,115,32,111,114,32,115,116,97,116,105,99,32,109,101,
-    116,104,111,100,115,32,116,111,32,97,118,111,105,100,32,116,
-    104,101,32,110,101,101,100,32,116,111,10,32,32,32,32,105,
-    110,115,116,97,110,116,105,97,116,101,32,116,104,101,32,99,
-    108,97,115,115,46,10,10,32,32,32,32,99,2,0,0,0,
-    0,0,0,0,2,0,0,0,2,0,0,0,67,0,0,0,
-    115,16,0,0,0,100,1,0,106,0,0,124,1,0,106,1,
-    0,131,1,0,83,40,2,0,0,0,78,117,22,0,0,0,
-    60,109,111,100,117,108,101,32,39,123,125,39,32,40,102,114,
-    111,122,101,110,41,62,40,2,0,0,0,117,6,0,0,0,
-    102,111,114,109,97,116,117,8,0,0,0,95,95,110,97,109,
-    101,95,95,40,2,0,0,0,117,3,0,0,0,99,108,115,
-    117,1,0,0,0,109,40,0,0,0,0,40,0,0,0,0,
-    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
-    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
-    112,62,117,11,0,0,0,109,111,100,117,108,101,95,114,101,
-    112,114,184,2,0,0,115,2,0,0,0,0,2,117,26,0,
-    0,0,70,114,111,122,101,110,73,109,112,111,114,116,101,114,
-    46,109,111,100,117,108,101,95,114,101,112,114,78,99,3,0,
-    0,0,0,0,0,0,3,0,0,0,2,0,0,0,67,0,
-    0,0,115,23,0,0,0,116,0,0,106,1,0,124,1,0,
-    131,1,0,114,19,0,124,0,0,83,100,1,0,83,40,2,
-    0,0,0,117,21,0,0,0,70,105,110,100,32,97,32,102,
-    114,111,122,101,110,32,109,111,100,117,108,101,46,78,40,2,
-    0,0,0,117,4,0,0,0,95,105,109,112,117,9,0,0,
-    0,105,115,95,102,114,111,122,101,110,40,3,0,0,0,117,
-    3,0,0,0,99,108,115,117,8,0,0,0,102,117,108,108,
-    110,97,109,101,117,4,0,0,0,112,97,116,104,40,0,0,
-    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
-    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
-    111,111,116,115,116,114,97,112,62,117,11,0,0,0,102,105,
-    110,100,95,109,111,100,117,108,101,188,2,0,0,115,2,0,
-    0,0,0,3,117,26,0,0,0,70,114,111,122,101,110,73,
-    109,112,111,114,116,101,114,46,102,105,110,100,95,109,111,100,
-    117,108,101,99,2,0,0,0,0,0,0,0,4,0,0,0,
-    9,0,0,0,67,0,0,0,115,100,0,0,0,124,1,0,
-    116,0,0,106,1,0,107,6,0,125,2,0,121,32,0,116,
-    2,0,116,3,0,106,4,0,124,1,0,131,2,0,125,3,
-    0,124,3,0,96,5,0,124,3,0,83,87,110,46,0,1,
-    1,1,124,2,0,12,114,88,0,124,1,0,116,0,0,106,
-    1,0,107,6,0,114,88,0,116,0,0,106,1,0,124,1,
-    0,61,110,0,0,130,0,0,89,110,1,0,88,100,1,0,
-    83,40,2,0,0,0,117,21,0,0,0,76,111,97,100,32,
-    97,32,102,114,111,122,101,110,32,109,111,100,117,108,101,46,
-    78,40,6,0,0,0,117,3,0,0,0,115,121,115,117,7,
-    0,0,0,109,111,100,117,108,101,115,117,25,0,0,0,95,
-    99,97,108,108,95,119,105,116,104,95,102,114,97,109,101,115,
-    95,114,101,109,111,118,101,100,117,4,0,0,0,95,105,109,
-    112,117,11,0,0,0,105,110,105,116,95,102,114,111,122,101,
-    110,117,8,0,0,0,95,95,102,105,108,101,95,95,40,4,
-    0,0,0,117,3,0,0,0,99,108,115,117,8,0,0,0,
-    102,117,108,108,110,97,109,101,117,9,0,0,0,105,115,95,
-    114,101,108,111,97,100,117,1,0,0,0,109,40,0,0,0,
-    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
-    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,11,0,0,0,108,111,97,
-    100,95,109,111,100,117,108,101,193,2,0,0,115,18,0,0,
-    0,0,6,15,1,3,1,18,2,6,1,8,1,3,1,22,
-    1,13,1,117,26,0,0,0,70,114,111,122,101,110,73,109,
-    112,111,114,116,101,114,46,108,111,97,100,95,109,111,100,117,
-    108,101,99,2,0,0,0,0,0,0,0,2,0,0,0,2,
-    0,0,0,67,0,0,0,115,13,0,0,0,116,0,0,106,
-    1,0,124,1,0,131,1,0,83,40,1,0,0,0,117,45,
-    0,0,0,82,101,116,117,114,110,32,116,104,101,32,99,111,
-    100,101,32,111,98,106,101,99,116,32,102,111,114,32,116,104,
-    101,32,102,114,111,122,101,110,32,109,111,100,117,108,101,46,
-    40,2,0,0,0,117,4,0,0,0,95,105,109,112,117,17,
-    0,0,0,103,101,116,95,102,114,111,122,101,110,95,111,98,
-    106,101,99,116,40,2,0,0,0,117,3,0,0,0,99,108,
-    115,117,8,0,0,0,102,117,108,108,110,97,109,101,40,0,
-    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,8,0,0,0,103,
-    101,116,95,99,111,100,101,210,2,0,0,115,2,0,0,0,
-    0,4,117,23,0,0,0,70,114,111,122,101,110,73,109,112,
-    111,114,116,101,114,46,103,101,116,95,99,111,100,101,99,2,
-    0,0,0,0,0,0,0,2,0,0,0,1,0,0,0,67,
-    0,0,0,115,4,0,0,0,100,1,0,83,40,2,0,0,
-    0,117,54,0,0,0,82,101,116,117,114,110,32,78,111,110,
-    101,32,97,115,32,102,114,111,122,101,110,32,109,111,100,117,
+    114,97,112,62,117,17,0,0,0,95,102,105,110,100,95,109,
+    111,100,117,108,101,95,115,104,105,109,101,2,0,0,115,10,
+    0,0,0,0,6,21,1,24,1,6,1,32,1,117,17,0,
+    0,0,95,102,105,110,100,95,109,111,100,117,108,101,95,115,
+    104,105,109,99,1,0,0,0,0,0,0,0,1,0,0,0,
+    6,0,0,0,66,0,0,0,115,173,0,0,0,124,0,0,
+    69,101,0,0,90,1,0,100,0,0,90,2,0,100,1,0,
+    90,3,0,101,4,0,100,2,0,100,3,0,132,0,0,131,
+    1,0,90,5,0,101,4,0,100,4,0,100,5,0,100,6,
+    0,132,1,0,131,1,0,90,6,0,101,4,0,101,7,0,
+    101,8,0,101,9,0,100,7,0,100,8,0,132,0,0,131,
+    1,0,131,1,0,131,1,0,131,1,0,90,10,0,101,4,
+    0,101,9,0,100,9,0,100,10,0,132,0,0,131,1,0,
+    131,1,0,90,11,0,101,4,0,101,9,0,100,11,0,100,
+    12,0,132,0,0,131,1,0,131,1,0,90,12,0,101,4,
+    0,101,9,0,100,13,0,100,14,0,132,0,0,131,1,0,
+    131,1,0,90,13,0,100,4,0,83,40,15,0,0,0,117,
+    15,0,0,0,66,117,105,108,116,105,110,73,109,112,111,114,
+    116,101,114,117,144,0,0,0,77,101,116,97,32,112,97,116,
+    104,32,105,109,112,111,114,116,32,102,111,114,32,98,117,105,
+    108,116,45,105,110,32,109,111,100,117,108,101,115,46,10,10,
+    32,32,32,32,65,108,108,32,109,101,116,104,111,100,115,32,
+    97,114,101,32,101,105,116,104,101,114,32,99,108,97,115,115,
+    32,111,114,32,115,116,97,116,105,99,32,109,101,116,104,111,
+    100,115,32,116,111,32,97,118,111,105,100,32,116,104,101,32,
+    110,101,101,100,32,116,111,10,32,32,32,32,105,110,115,116,
+    97,110,116,105,97,116,101,32,116,104,101,32,99,108,97,115,
+    115,46,10,10,32,32,32,32,99,2,0,0,0,0,0,0,
+    0,2,0,0,0,2,0,0,0,67,0,0,0,115,16,0,
+    0,0,100,1,0,106,0,0,124,1,0,106,1,0,131,1,
+    0,83,40,2,0,0,0,78,117,24,0,0,0,60,109,111,
+    100,117,108,101,32,39,123,125,39,32,40,98,117,105,108,116,
+    45,105,110,41,62,40,2,0,0,0,117,6,0,0,0,102,
+    111,114,109,97,116,117,8,0,0,0,95,95,110,97,109,101,
+    95,95,40,2,0,0,0,117,3,0,0,0,99,108,115,117,
+    6,0,0,0,109,111,100,117,108,101,40,0,0,0,0,40,
+    0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,
+    32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,
+    115,116,114,97,112,62,117,11,0,0,0,109,111,100,117,108,
+    101,95,114,101,112,114,127,2,0,0,115,2,0,0,0,0,
+    2,117,27,0,0,0,66,117,105,108,116,105,110,73,109,112,
+    111,114,116,101,114,46,109,111,100,117,108,101,95,114,101,112,
+    114,78,99,3,0,0,0,0,0,0,0,3,0,0,0,2,
+    0,0,0,67,0,0,0,115,39,0,0,0,124,2,0,100,
+    1,0,107,9,0,114,16,0,100,1,0,83,116,0,0,106,
+    1,0,124,1,0,131,1,0,114,35,0,124,0,0,83,100,
+    1,0,83,40,2,0,0,0,117,113,0,0,0,70,105,110,
+    100,32,116,104,101,32,98,117,105,108,116,45,105,110,32,109,
+    111,100,117,108,101,46,10,10,32,32,32,32,32,32,32,32,
+    73,102,32,39,112,97,116,104,39,32,105,115,32,101,118,101,
+    114,32,115,112,101,99,105,102,105,101,100,32,116,104,101,110,
+    32,116,104,101,32,115,101,97,114,99,104,32,105,115,32,99,
+    111,110,115,105,100,101,114,101,100,32,97,32,102,97,105,108,
+    117,114,101,46,10,10,32,32,32,32,32,32,32,32,78,40,
+    2,0,0,0,117,4,0,0,0,95,105,109,112,117,10,0,
+    0,0,105,115,95,98,117,105,108,116,105,110,40,3,0,0,
+    0,117,3,0,0,0,99,108,115,117,8,0,0,0,102,117,
+    108,108,110,97,109,101,117,4,0,0,0,112,97,116,104,40,
+    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
+    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
+    95,98,111,111,116,115,116,114,97,112,62,117,11,0,0,0,
+    102,105,110,100,95,109,111,100,117,108,101,131,2,0,0,115,
+    6,0,0,0,0,7,12,1,4,1,117,27,0,0,0,66,
+    117,105,108,116,105,110,73,109,112,111,114,116,101,114,46,102,
+    105,110,100,95,109,111,100,117,108,101,99,2,0,0,0,0,
+    0,0,0,3,0,0,0,9,0,0,0,67,0,0,0,115,
+    88,0,0,0,124,1,0,116,0,0,106,1,0,107,6,0,
+    125,2,0,121,20,0,116,2,0,116,3,0,106,4,0,124,
+    1,0,131,2,0,83,87,110,46,0,1,1,1,124,2,0,
+    12,114,76,0,124,1,0,116,0,0,106,1,0,107,6,0,
+    114,76,0,116,0,0,106,1,0,124,1,0,61,110,0,0,
+    130,0,0,89,110,1,0,88,100,1,0,83,40,2,0,0,
+    0,117,23,0,0,0,76,111,97,100,32,97,32,98,117,105,
+    108,116,45,105,110,32,109,111,100,117,108,101,46,78,40,5,
+    0,0,0,117,3,0,0,0,115,121,115,117,7,0,0,0,
+    109,111,100,117,108,101,115,117,25,0,0,0,95,99,97,108,
+    108,95,119,105,116,104,95,102,114,97,109,101,115,95,114,101,
+    109,111,118,101,100,117,4,0,0,0,95,105,109,112,117,12,
+    0,0,0,105,110,105,116,95,98,117,105,108,116,105,110,40,
+    3,0,0,0,117,3,0,0,0,99,108,115,117,8,0,0,
+    0,102,117,108,108,110,97,109,101,117,9,0,0,0,105,115,
+    95,114,101,108,111,97,100,40,0,0,0,0,40,0,0,0,
+    0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
+    112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
+    97,112,62,117,11,0,0,0,108,111,97,100,95,109,111,100,
+    117,108,101,142,2,0,0,115,14,0,0,0,0,6,15,1,
+    3,1,20,1,3,1,22,1,13,1,117,27,0,0,0,66,
+    117,105,108,116,105,110,73,109,112,111,114,116,101,114,46,108,
+    111,97,100,95,109,111,100,117,108,101,99,2,0,0,0,0,
+    0,0,0,2,0,0,0,1,0,0,0,67,0,0,0,115,
+    4,0,0,0,100,1,0,83,40,2,0,0,0,117,57,0,
+    0,0,82,101,116,117,114,110,32,78,111,110,101,32,97,115,
+    32,98,117,105,108,116,45,105,110,32,109,111,100,117,108,101,
+    115,32,100,111,32,110,111,116,32,104,97,118,101,32,99,111,
+    100,101,32,111,98,106,101,99,116,115,46,78,40,0,0,0,
+    0,40,2,0,0,0,117,3,0,0,0,99,108,115,117,8,
+    0,0,0,102,117,108,108,110,97,109,101,40,0,0,0,0,
+    40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
+    110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
+    116,115,116,114,97,112,62,117,8,0,0,0,103,101,116,95,
+    99,111,100,101,156,2,0,0,115,2,0,0,0,0,4,117,
+    24,0,0,0,66,117,105,108,116,105,110,73,109,112,111,114,
+    116,101,114,46,103,101,116,95,99,111,100,101,99,2,0,0,
+    0,0,0,0,0,2,0,0,0,1,0,0,0,67,0,0,
+    0,115,4,0,0,0,100,1,0,83,40,2,0,0,0,117,
+    56,0,0,0,82,101,116,117,114,110,32,78,111,110,101,32,
+    97,115,32,98,117,105,108,116,45,105,110,32,109,111,100,117,
     108,101,115,32,100,111,32,110,111,116,32,104,97,118,101,32,
     115,111,117,114,99,101,32,99,111,100,101,46,78,40,0,0,
     0,0,40,2,0,0,0,117,3,0,0,0,99,108,115,117,
@@ -1605,1476 +1462,1757 @@ unsigned char _Py_M__importlib[] = {
     0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
     101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
     111,116,115,116,114,97,112,62,117,10,0,0,0,103,101,116,
-    95,115,111,117,114,99,101,216,2,0,0,115,2,0,0,0,
-    0,4,117,25,0,0,0,70,114,111,122,101,110,73,109,112,
-    111,114,116,101,114,46,103,101,116,95,115,111,117,114,99,101,
-    99,2,0,0,0,0,0,0,0,2,0,0,0,2,0,0,
-    0,67,0,0,0,115,13,0,0,0,116,0,0,106,1,0,
-    124,1,0,131,1,0,83,40,1,0,0,0,117,46,0,0,
-    0,82,101,116,117,114,110,32,84,114,117,101,32,105,102,32,
-    116,104,101,32,102,114,111,122,101,110,32,109,111,100,117,108,
-    101,32,105,115,32,97,32,112,97,99,107,97,103,101,46,40,
-    2,0,0,0,117,4,0,0,0,95,105,109,112,117,17,0,
-    0,0,105,115,95,102,114,111,122,101,110,95,112,97,99,107,
-    97,103,101,40,2,0,0,0,117,3,0,0,0,99,108,115,
+    95,115,111,117,114,99,101,162,2,0,0,115,2,0,0,0,
+    0,4,117,26,0,0,0,66,117,105,108,116,105,110,73,109,
+    112,111,114,116,101,114,46,103,101,116,95,115,111,117,114,99,
+    101,99,2,0,0,0,0,0,0,0,2,0,0,0,1,0,
+    0,0,67,0,0,0,115,4,0,0,0,100,1,0,83,40,
+    2,0,0,0,117,52,0,0,0,82,101,116,117,114,110,32,
+    70,97,108,115,101,32,97,115,32,98,117,105,108,116,45,105,
+    110,32,109,111,100,117,108,101,115,32,97,114,101,32,110,101,
+    118,101,114,32,112,97,99,107,97,103,101,115,46,70,40,0,
+    0,0,0,40,2,0,0,0,117,3,0,0,0,99,108,115,
     117,8,0,0,0,102,117,108,108,110,97,109,101,40,0,0,
     0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
     122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
     111,111,116,115,116,114,97,112,62,117,10,0,0,0,105,115,
-    95,112,97,99,107,97,103,101,222,2,0,0,115,2,0,0,
-    0,0,4,117,25,0,0,0,70,114,111,122,101,110,73,109,
-    112,111,114,116,101,114,46,105,115,95,112,97,99,107,97,103,
-    101,40,14,0,0,0,117,8,0,0,0,95,95,110,97,109,
-    101,95,95,117,10,0,0,0,95,95,109,111,100,117,108,101,
-    95,95,117,12,0,0,0,95,95,113,117,97,108,110,97,109,
-    101,95,95,117,7,0,0,0,95,95,100,111,99,95,95,117,
-    11,0,0,0,99,108,97,115,115,109,101,116,104,111,100,117,
-    11,0,0,0,109,111,100,117,108,101,95,114,101,112,114,117,
-    11,0,0,0,102,105,110,100,95,109,111,100,117,108,101,117,
-    11,0,0,0,115,101,116,95,112,97,99,107,97,103,101,117,
-    10,0,0,0,115,101,116,95,108,111,97,100,101,114,117,16,
-    0,0,0,95,114,101,113,117,105,114,101,115,95,102,114,111,
-    122,101,110,117,11,0,0,0,108,111,97,100,95,109,111,100,
-    117,108,101,117,8,0,0,0,103,101,116,95,99,111,100,101,
-    117,10,0,0,0,103,101,116,95,115,111,117,114,99,101,117,
-    10,0,0,0,105,115,95,112,97,99,107,97,103,101,40,1,
-    0,0,0,117,10,0,0,0,95,95,108,111,99,97,108,115,
-    95,95,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
-    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
-    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,14,
-    0,0,0,70,114,111,122,101,110,73,109,112,111,114,116,101,
-    114,175,2,0,0,115,28,0,0,0,16,7,6,2,18,4,
-    3,1,18,4,3,1,3,1,3,1,27,14,3,1,21,5,
-    3,1,21,5,3,1,117,14,0,0,0,70,114,111,122,101,
-    110,73,109,112,111,114,116,101,114,99,1,0,0,0,0,0,
-    0,0,1,0,0,0,4,0,0,0,66,0,0,0,115,101,
-    0,0,0,124,0,0,69,101,0,0,90,1,0,100,0,0,
-    90,2,0,100,1,0,90,3,0,100,2,0,90,4,0,100,
-    3,0,90,5,0,100,4,0,90,6,0,101,7,0,100,5,
-    0,100,6,0,132,0,0,131,1,0,90,8,0,101,7,0,
-    100,7,0,100,8,0,132,0,0,131,1,0,90,9,0,101,
-    7,0,100,9,0,100,10,0,100,11,0,132,1,0,131,1,
-    0,90,10,0,100,9,0,83,40,12,0,0,0,117,21,0,
-    0,0,87,105,110,100,111,119,115,82,101,103,105,115,116,114,
-    121,70,105,110,100,101,114,117,67,0,0,0,77,101,116,97,
-    32,112,97,116,104,32,102,105,110,100,101,114,32,102,111,114,
-    32,109,111,100,117,108,101,115,32,100,101,99,108,97,114,101,
-    100,32,105,110,32,116,104,101,32,87,105,110,100,111,119,115,
-    32,114,101,103,105,115,116,114,121,46,10,32,32,32,32,117,
-    59,0,0,0,83,111,102,116,119,97,114,101,92,80,121,116,
-    104,111,110,92,80,121,116,104,111,110,67,111,114,101,92,123,
-    115,121,115,95,118,101,114,115,105,111,110,125,92,77,111,100,
-    117,108,101,115,92,123,102,117,108,108,110,97,109,101,125,117,
-    65,0,0,0,83,111,102,116,119,97,114,101,92,80,121,116,
-    104,111,110,92,80,121,116,104,111,110,67,111,114,101,92,123,
-    115,121,115,95,118,101,114,115,105,111,110,125,92,77,111,100,
-    117,108,101,115,92,123,102,117,108,108,110,97,109,101,125,92,
-    68,101,98,117,103,70,99,2,0,0,0,0,0,0,0,2,
-    0,0,0,11,0,0,0,67,0,0,0,115,67,0,0,0,
-    121,23,0,116,0,0,106,1,0,116,0,0,106,2,0,124,
-    1,0,131,2,0,83,87,110,37,0,4,116,3,0,107,10,
-    0,114,62,0,1,1,1,116,0,0,106,1,0,116,0,0,
-    106,4,0,124,1,0,131,2,0,83,89,110,1,0,88,100,
-    0,0,83,40,1,0,0,0,78,40,5,0,0,0,117,7,
-    0,0,0,95,119,105,110,114,101,103,117,7,0,0,0,79,
-    112,101,110,75,101,121,117,17,0,0,0,72,75,69,89,95,
-    67,85,82,82,69,78,84,95,85,83,69,82,117,7,0,0,
-    0,79,83,69,114,114,111,114,117,18,0,0,0,72,75,69,
-    89,95,76,79,67,65,76,95,77,65,67,72,73,78,69,40,
-    2,0,0,0,117,3,0,0,0,99,108,115,117,3,0,0,
-    0,107,101,121,40,0,0,0,0,40,0,0,0,0,117,29,
+    95,112,97,99,107,97,103,101,168,2,0,0,115,2,0,0,
+    0,0,4,117,26,0,0,0,66,117,105,108,116,105,110,73,
+    109,112,111,114,116,101,114,46,105,115,95,112,97,99,107,97,
+    103,101,40,14,0,0,0,117,8,0,0,0,95,95,110,97,
+    109,101,95,95,117,10,0,0,0,95,95,109,111,100,117,108,
+    101,95,95,117,12,0,0,0,95,95,113,117,97,108,110,97,
+    109,101,95,95,117,7,0,0,0,95,95,100,111,99,95,95,
+    117,11,0,0,0,99,108,97,115,115,109,101,116,104,111,100,
+    117,11,0,0,0,109,111,100,117,108,101,95,114,101,112,114,
+    117,11,0,0,0,102,105,110,100,95,109,111,100,117,108,101,
+    117,11,0,0,0,115,101,116,95,112,97,99,107,97,103,101,
+    117,10,0,0,0,115,101,116,95,108,111,97,100,101,114,117,
+    17,0,0,0,95,114,101,113,117,105,114,101,115,95,98,117,
+    105,108,116,105,110,117,11,0,0,0,108,111,97,100,95,109,
+    111,100,117,108,101,117,8,0,0,0,103,101,116,95,99,111,
+    100,101,117,10,0,0,0,103,101,116,95,115,111,117,114,99,
+    101,117,10,0,0,0,105,115,95,112,97,99,107,97,103,101,
+    40,1,0,0,0,117,10,0,0,0,95,95,108,111,99,97,
+    108,115,95,95,40,0,0,0,0,40,0,0,0,0,117,29,
     0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
     116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
-    117,14,0,0,0,95,111,112,101,110,95,114,101,103,105,115,
-    116,114,121,242,2,0,0,115,8,0,0,0,0,2,3,1,
-    23,1,13,1,117,36,0,0,0,87,105,110,100,111,119,115,
-    82,101,103,105,115,116,114,121,70,105,110,100,101,114,46,95,
-    111,112,101,110,95,114,101,103,105,115,116,114,121,99,2,0,
-    0,0,0,0,0,0,6,0,0,0,16,0,0,0,67,0,
-    0,0,115,142,0,0,0,124,0,0,106,0,0,114,21,0,
-    124,0,0,106,1,0,125,2,0,110,9,0,124,0,0,106,
-    2,0,125,2,0,124,2,0,106,3,0,100,1,0,124,1,
-    0,100,2,0,116,4,0,106,5,0,100,0,0,100,3,0,
-    133,2,0,25,131,0,2,125,3,0,121,46,0,124,0,0,
-    106,6,0,124,3,0,131,1,0,143,25,0,125,4,0,116,
-    7,0,106,8,0,124,4,0,100,4,0,131,2,0,125,5,
-    0,87,100,0,0,81,88,87,110,22,0,4,116,9,0,107,
-    10,0,114,137,0,1,1,1,100,0,0,83,89,110,1,0,
-    88,124,5,0,83,40,5,0,0,0,78,117,8,0,0,0,
-    102,117,108,108,110,97,109,101,117,11,0,0,0,115,121,115,
-    95,118,101,114,115,105,111,110,105,3,0,0,0,117,0,0,
-    0,0,40,10,0,0,0,117,11,0,0,0,68,69,66,85,
-    71,95,66,85,73,76,68,117,18,0,0,0,82,69,71,73,
-    83,84,82,89,95,75,69,89,95,68,69,66,85,71,117,12,
-    0,0,0,82,69,71,73,83,84,82,89,95,75,69,89,117,
-    6,0,0,0,102,111,114,109,97,116,117,3,0,0,0,115,
-    121,115,117,7,0,0,0,118,101,114,115,105,111,110,117,14,
-    0,0,0,95,111,112,101,110,95,114,101,103,105,115,116,114,
-    121,117,7,0,0,0,95,119,105,110,114,101,103,117,10,0,
-    0,0,81,117,101,114,121,86,97,108,117,101,117,7,0,0,
-    0,79,83,69,114,114,111,114,40,6,0,0,0,117,3,0,
-    0,0,99,108,115,117,8,0,0,0,102,117,108,108,110,97,
-    109,101,117,12,0,0,0,114,101,103,105,115,116,114,121,95,
-    107,101,121,117,3,0,0,0,107,101,121,117,4,0,0,0,
-    104,107,101,121,117,8,0,0,0,102,105,108,101,112,97,116,
-    104,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
-    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
-    98,46,95,98,111,111,116,115,116,114,97,112,62,117,16,0,
-    0,0,95,115,101,97,114,99,104,95,114,101,103,105,115,116,
-    114,121,249,2,0,0,115,22,0,0,0,0,2,9,1,12,
-    2,9,1,15,1,22,1,3,1,18,1,28,1,13,1,9,
-    1,117,38,0,0,0,87,105,110,100,111,119,115,82,101,103,
-    105,115,116,114,121,70,105,110,100,101,114,46,95,115,101,97,
-    114,99,104,95,114,101,103,105,115,116,114,121,78,99,3,0,
-    0,0,0,0,0,0,7,0,0,0,12,0,0,0,67,0,
-    0,0,115,140,0,0,0,124,0,0,106,0,0,124,1,0,
-    131,1,0,125,3,0,124,3,0,100,1,0,107,8,0,114,
-    31,0,100,1,0,83,121,17,0,116,1,0,106,2,0,124,
-    3,0,131,1,0,1,87,110,22,0,4,116,3,0,107,10,
-    0,114,72,0,1,1,1,100,1,0,83,89,110,1,0,88,
-    120,60,0,116,4,0,131,0,0,68,93,49,0,92,3,0,
-    125,4,0,125,5,0,125,6,0,124,3,0,106,5,0,116,
-    6,0,124,5,0,131,1,0,131,1,0,114,83,0,124,4,
-    0,124,1,0,124,3,0,131,2,0,83,113,83,0,87,100,
-    1,0,83,40,2,0,0,0,117,34,0,0,0,70,105,110,
-    100,32,109,111,100,117,108,101,32,110,97,109,101,100,32,105,
-    110,32,116,104,101,32,114,101,103,105,115,116,114,121,46,78,
-    40,7,0,0,0,117,16,0,0,0,95,115,101,97,114,99,
-    104,95,114,101,103,105,115,116,114,121,117,3,0,0,0,95,
-    111,115,117,4,0,0,0,115,116,97,116,117,7,0,0,0,
-    79,83,69,114,114,111,114,117,27,0,0,0,95,103,101,116,
-    95,115,117,112,112,111,114,116,101,100,95,102,105,108,101,95,
-    108,111,97,100,101,114,115,117,8,0,0,0,101,110,100,115,
-    119,105,116,104,117,5,0,0,0,116,117,112,108,101,40,7,
+    117,15,0,0,0,66,117,105,108,116,105,110,73,109,112,111,
+    114,116,101,114,118,2,0,0,115,28,0,0,0,16,7,6,
+    2,18,4,3,1,18,10,3,1,3,1,3,1,27,11,3,
+    1,21,5,3,1,21,5,3,1,117,15,0,0,0,66,117,
+    105,108,116,105,110,73,109,112,111,114,116,101,114,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,6,0,0,0,66,0,
+    0,0,115,173,0,0,0,124,0,0,69,101,0,0,90,1,
+    0,100,0,0,90,2,0,100,1,0,90,3,0,101,4,0,
+    100,2,0,100,3,0,132,0,0,131,1,0,90,5,0,101,
+    4,0,100,4,0,100,5,0,100,6,0,132,1,0,131,1,
+    0,90,6,0,101,4,0,101,7,0,101,8,0,101,9,0,
+    100,7,0,100,8,0,132,0,0,131,1,0,131,1,0,131,
+    1,0,131,1,0,90,10,0,101,4,0,101,9,0,100,9,
+    0,100,10,0,132,0,0,131,1,0,131,1,0,90,11,0,
+    101,4,0,101,9,0,100,11,0,100,12,0,132,0,0,131,
+    1,0,131,1,0,90,12,0,101,4,0,101,9,0,100,13,
+    0,100,14,0,132,0,0,131,1,0,131,1,0,90,13,0,
+    100,4,0,83,40,15,0,0,0,117,14,0,0,0,70,114,
+    111,122,101,110,73,109,112,111,114,116,101,114,117,142,0,0,
+    0,77,101,116,97,32,112,97,116,104,32,105,109,112,111,114,
+    116,32,102,111,114,32,102,114,111,122,101,110,32,109,111,100,
+    117,108,101,115,46,10,10,32,32,32,32,65,108,108,32,109,
+    101,116,104,111,100,115,32,97,114,101,32,101,105,116,104,101,
+    114,32,99,108,97,115,115,32,111,114,32,115,116,97,116,105,
+    99,32,109,101,116,104,111,100,115,32,116,111,32,97,118,111,
+    105,100,32,116,104,101,32,110,101,101,100,32,116,111,10,32,
+    32,32,32,105,110,115,116,97,110,116,105,97,116,101,32,116,
+    104,101,32,99,108,97,115,115,46,10,10,32,32,32,32,99,
+    2,0,0,0,0,0,0,0,2,0,0,0,2,0,0,0,
+    67,0,0,0,115,16,0,0,0,100,1,0,106,0,0,124,
+    1,0,106,1,0,131,1,0,83,40,2,0,0,0,78,117,
+    22,0,0,0,60,109,111,100,117,108,101,32,39,123,125,39,
+    32,40,102,114,111,122,101,110,41,62,40,2,0,0,0,117,
+    6,0,0,0,102,111,114,109,97,116,117,8,0,0,0,95,
+    95,110,97,109,101,95,95,40,2,0,0,0,117,3,0,0,
+    0,99,108,115,117,1,0,0,0,109,40,0,0,0,0,40,
+    0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,
+    32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,
+    115,116,114,97,112,62,117,11,0,0,0,109,111,100,117,108,
+    101,95,114,101,112,114,184,2,0,0,115,2,0,0,0,0,
+    2,117,26,0,0,0,70,114,111,122,101,110,73,109,112,111,
+    114,116,101,114,46,109,111,100,117,108,101,95,114,101,112,114,
+    78,99,3,0,0,0,0,0,0,0,3,0,0,0,2,0,
+    0,0,67,0,0,0,115,23,0,0,0,116,0,0,106,1,
+    0,124,1,0,131,1,0,114,19,0,124,0,0,83,100,1,
+    0,83,40,2,0,0,0,117,21,0,0,0,70,105,110,100,
+    32,97,32,102,114,111,122,101,110,32,109,111,100,117,108,101,
+    46,78,40,2,0,0,0,117,4,0,0,0,95,105,109,112,
+    117,9,0,0,0,105,115,95,102,114,111,122,101,110,40,3,
     0,0,0,117,3,0,0,0,99,108,115,117,8,0,0,0,
     102,117,108,108,110,97,109,101,117,4,0,0,0,112,97,116,
-    104,117,8,0,0,0,102,105,108,101,112,97,116,104,117,6,
-    0,0,0,108,111,97,100,101,114,117,8,0,0,0,115,117,
-    102,102,105,120,101,115,117,1,0,0,0,95,40,0,0,0,
-    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
-    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,11,0,0,0,102,105,110,
-    100,95,109,111,100,117,108,101,8,3,0,0,115,20,0,0,
-    0,0,3,15,1,12,1,4,1,3,1,17,1,13,1,9,
-    1,25,1,21,1,117,33,0,0,0,87,105,110,100,111,119,
+    104,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,11,0,
+    0,0,102,105,110,100,95,109,111,100,117,108,101,188,2,0,
+    0,115,2,0,0,0,0,3,117,26,0,0,0,70,114,111,
+    122,101,110,73,109,112,111,114,116,101,114,46,102,105,110,100,
+    95,109,111,100,117,108,101,99,2,0,0,0,0,0,0,0,
+    4,0,0,0,9,0,0,0,67,0,0,0,115,100,0,0,
+    0,124,1,0,116,0,0,106,1,0,107,6,0,125,2,0,
+    121,32,0,116,2,0,116,3,0,106,4,0,124,1,0,131,
+    2,0,125,3,0,124,3,0,96,5,0,124,3,0,83,87,
+    110,46,0,1,1,1,124,2,0,12,114,88,0,124,1,0,
+    116,0,0,106,1,0,107,6,0,114,88,0,116,0,0,106,
+    1,0,124,1,0,61,110,0,0,130,0,0,89,110,1,0,
+    88,100,1,0,83,40,2,0,0,0,117,21,0,0,0,76,
+    111,97,100,32,97,32,102,114,111,122,101,110,32,109,111,100,
+    117,108,101,46,78,40,6,0,0,0,117,3,0,0,0,115,
+    121,115,117,7,0,0,0,109,111,100,117,108,101,115,117,25,
+    0,0,0,95,99,97,108,108,95,119,105,116,104,95,102,114,
+    97,109,101,115,95,114,101,109,111,118,101,100,117,4,0,0,
+    0,95,105,109,112,117,11,0,0,0,105,110,105,116,95,102,
+    114,111,122,101,110,117,8,0,0,0,95,95,102,105,108,101,
+    95,95,40,4,0,0,0,117,3,0,0,0,99,108,115,117,
+    8,0,0,0,102,117,108,108,110,97,109,101,117,9,0,0,
+    0,105,115,95,114,101,108,111,97,100,117,1,0,0,0,109,
+    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
+    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
+    46,95,98,111,111,116,115,116,114,97,112,62,117,11,0,0,
+    0,108,111,97,100,95,109,111,100,117,108,101,193,2,0,0,
+    115,18,0,0,0,0,6,15,1,3,1,18,2,6,1,8,
+    1,3,1,22,1,13,1,117,26,0,0,0,70,114,111,122,
+    101,110,73,109,112,111,114,116,101,114,46,108,111,97,100,95,
+    109,111,100,117,108,101,99,2,0,0,0,0,0,0,0,2,
+    0,0,0,2,0,0,0,67,0,0,0,115,13,0,0,0,
+    116,0,0,106,1,0,124,1,0,131,1,0,83,40,1,0,
+    0,0,117,45,0,0,0,82,101,116,117,114,110,32,116,104,
+    101,32,99,111,100,101,32,111,98,106,101,99,116,32,102,111,
+    114,32,116,104,101,32,102,114,111,122,101,110,32,109,111,100,
+    117,108,101,46,40,2,0,0,0,117,4,0,0,0,95,105,
+    109,112,117,17,0,0,0,103,101,116,95,102,114,111,122,101,
+    110,95,111,98,106,101,99,116,40,2,0,0,0,117,3,0,
+    0,0,99,108,115,117,8,0,0,0,102,117,108,108,110,97,
+    109,101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,8,
+    0,0,0,103,101,116,95,99,111,100,101,210,2,0,0,115,
+    2,0,0,0,0,4,117,23,0,0,0,70,114,111,122,101,
+    110,73,109,112,111,114,116,101,114,46,103,101,116,95,99,111,
+    100,101,99,2,0,0,0,0,0,0,0,2,0,0,0,1,
+    0,0,0,67,0,0,0,115,4,0,0,0,100,1,0,83,
+    40,2,0,0,0,117,54,0,0,0,82,101,116,117,114,110,
+    32,78,111,110,101,32,97,115,32,102,114,111,122,101,110,32,
+    109,111,100,117,108,101,115,32,100,111,32,110,111,116,32,104,
+    97,118,101,32,115,111,117,114,99,101,32,99,111,100,101,46,
+    78,40,0,0,0,0,40,2,0,0,0,117,3,0,0,0,
+    99,108,115,117,8,0,0,0,102,117,108,108,110,97,109,101,
+    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
+    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
+    46,95,98,111,111,116,115,116,114,97,112,62,117,10,0,0,
+    0,103,101,116,95,115,111,117,114,99,101,216,2,0,0,115,
+    2,0,0,0,0,4,117,25,0,0,0,70,114,111,122,101,
+    110,73,109,112,111,114,116,101,114,46,103,101,116,95,115,111,
+    117,114,99,101,99,2,0,0,0,0,0,0,0,2,0,0,
+    0,2,0,0,0,67,0,0,0,115,13,0,0,0,116,0,
+    0,106,1,0,124,1,0,131,1,0,83,40,1,0,0,0,
+    117,46,0,0,0,82,101,116,117,114,110,32,84,114,117,101,
+    32,105,102,32,116,104,101,32,102,114,111,122,101,110,32,109,
+    111,100,117,108,101,32,105,115,32,97,32,112,97,99,107,97,
+    103,101,46,40,2,0,0,0,117,4,0,0,0,95,105,109,
+    112,117,17,0,0,0,105,115,95,102,114,111,122,101,110,95,
+    112,97,99,107,97,103,101,40,2,0,0,0,117,3,0,0,
+    0,99,108,115,117,8,0,0,0,102,117,108,108,110,97,109,
+    101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,10,0,
+    0,0,105,115,95,112,97,99,107,97,103,101,222,2,0,0,
+    115,2,0,0,0,0,4,117,25,0,0,0,70,114,111,122,
+    101,110,73,109,112,111,114,116,101,114,46,105,115,95,112,97,
+    99,107,97,103,101,40,14,0,0,0,117,8,0,0,0,95,
+    95,110,97,109,101,95,95,117,10,0,0,0,95,95,109,111,
+    100,117,108,101,95,95,117,12,0,0,0,95,95,113,117,97,
+    108,110,97,109,101,95,95,117,7,0,0,0,95,95,100,111,
+    99,95,95,117,11,0,0,0,99,108,97,115,115,109,101,116,
+    104,111,100,117,11,0,0,0,109,111,100,117,108,101,95,114,
+    101,112,114,117,11,0,0,0,102,105,110,100,95,109,111,100,
+    117,108,101,117,11,0,0,0,115,101,116,95,112,97,99,107,
+    97,103,101,117,10,0,0,0,115,101,116,95,108,111,97,100,
+    101,114,117,16,0,0,0,95,114,101,113,117,105,114,101,115,
+    95,102,114,111,122,101,110,117,11,0,0,0,108,111,97,100,
+    95,109,111,100,117,108,101,117,8,0,0,0,103,101,116,95,
+    99,111,100,101,117,10,0,0,0,103,101,116,95,115,111,117,
+    114,99,101,117,10,0,0,0,105,115,95,112,97,99,107,97,
+    103,101,40,1,0,0,0,117,10,0,0,0,95,95,108,111,
+    99,97,108,115,95,95,40,0,0,0,0,40,0,0,0,0,
+    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
+    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
+    112,62,117,14,0,0,0,70,114,111,122,101,110,73,109,112,
+    111,114,116,101,114,175,2,0,0,115,28,0,0,0,16,7,
+    6,2,18,4,3,1,18,4,3,1,3,1,3,1,27,14,
+    3,1,21,5,3,1,21,5,3,1,117,14,0,0,0,70,
+    114,111,122,101,110,73,109,112,111,114,116,101,114,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,4,0,0,0,66,0,
+    0,0,115,101,0,0,0,124,0,0,69,101,0,0,90,1,
+    0,100,0,0,90,2,0,100,1,0,90,3,0,100,2,0,
+    90,4,0,100,3,0,90,5,0,100,4,0,90,6,0,101,
+    7,0,100,5,0,100,6,0,132,0,0,131,1,0,90,8,
+    0,101,7,0,100,7,0,100,8,0,132,0,0,131,1,0,
+    90,9,0,101,7,0,100,9,0,100,10,0,100,11,0,132,
+    1,0,131,1,0,90,10,0,100,9,0,83,40,12,0,0,
+    0,117,21,0,0,0,87,105,110,100,111,119,115,82,101,103,
+    105,115,116,114,121,70,105,110,100,101,114,117,67,0,0,0,
+    77,101,116,97,32,112,97,116,104,32,102,105,110,100,101,114,
+    32,102,111,114,32,109,111,100,117,108,101,115,32,100,101,99,
+    108,97,114,101,100,32,105,110,32,116,104,101,32,87,105,110,
+    100,111,119,115,32,114,101,103,105,115,116,114,121,46,10,32,
+    32,32,32,117,59,0,0,0,83,111,102,116,119,97,114,101,
+    92,80,121,116,104,111,110,92,80,121,116,104,111,110,67,111,
+    114,101,92,123,115,121,115,95,118,101,114,115,105,111,110,125,
+    92,77,111,100,117,108,101,115,92,123,102,117,108,108,110,97,
+    109,101,125,117,65,0,0,0,83,111,102,116,119,97,114,101,
+    92,80,121,116,104,111,110,92,80,121,116,104,111,110,67,111,
+    114,101,92,123,115,121,115,95,118,101,114,115,105,111,110,125,
+    92,77,111,100,117,108,101,115,92,123,102,117,108,108,110,97,
+    109,101,125,92,68,101,98,117,103,70,99,2,0,0,0,0,
+    0,0,0,2,0,0,0,11,0,0,0,67,0,0,0,115,
+    67,0,0,0,121,23,0,116,0,0,106,1,0,116,0,0,
+    106,2,0,124,1,0,131,2,0,83,87,110,37,0,4,116,
+    3,0,107,10,0,114,62,0,1,1,1,116,0,0,106,1,
+    0,116,0,0,106,4,0,124,1,0,131,2,0,83,89,110,
+    1,0,88,100,0,0,83,40,1,0,0,0,78,40,5,0,
+    0,0,117,7,0,0,0,95,119,105,110,114,101,103,117,7,
+    0,0,0,79,112,101,110,75,101,121,117,17,0,0,0,72,
+    75,69,89,95,67,85,82,82,69,78,84,95,85,83,69,82,
+    117,7,0,0,0,79,83,69,114,114,111,114,117,18,0,0,
+    0,72,75,69,89,95,76,79,67,65,76,95,77,65,67,72,
+    73,78,69,40,2,0,0,0,117,3,0,0,0,99,108,115,
+    117,3,0,0,0,107,101,121,40,0,0,0,0,40,0,0,
+    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,117,14,0,0,0,95,111,112,101,110,95,114,
+    101,103,105,115,116,114,121,242,2,0,0,115,8,0,0,0,
+    0,2,3,1,23,1,13,1,117,36,0,0,0,87,105,110,
+    100,111,119,115,82,101,103,105,115,116,114,121,70,105,110,100,
+    101,114,46,95,111,112,101,110,95,114,101,103,105,115,116,114,
+    121,99,2,0,0,0,0,0,0,0,6,0,0,0,16,0,
+    0,0,67,0,0,0,115,142,0,0,0,124,0,0,106,0,
+    0,114,21,0,124,0,0,106,1,0,125,2,0,110,9,0,
+    124,0,0,106,2,0,125,2,0,124,2,0,106,3,0,100,
+    1,0,124,1,0,100,2,0,116,4,0,106,5,0,100,0,
+    0,100,3,0,133,2,0,25,131,0,2,125,3,0,121,46,
+    0,124,0,0,106,6,0,124,3,0,131,1,0,143,25,0,
+    125,4,0,116,7,0,106,8,0,124,4,0,100,4,0,131,
+    2,0,125,5,0,87,100,0,0,81,88,87,110,22,0,4,
+    116,9,0,107,10,0,114,137,0,1,1,1,100,0,0,83,
+    89,110,1,0,88,124,5,0,83,40,5,0,0,0,78,117,
+    8,0,0,0,102,117,108,108,110,97,109,101,117,11,0,0,
+    0,115,121,115,95,118,101,114,115,105,111,110,105,3,0,0,
+    0,117,0,0,0,0,40,10,0,0,0,117,11,0,0,0,
+    68,69,66,85,71,95,66,85,73,76,68,117,18,0,0,0,
+    82,69,71,73,83,84,82,89,95,75,69,89,95,68,69,66,
+    85,71,117,12,0,0,0,82,69,71,73,83,84,82,89,95,
+    75,69,89,117,6,0,0,0,102,111,114,109,97,116,117,3,
+    0,0,0,115,121,115,117,7,0,0,0,118,101,114,115,105,
+    111,110,117,14,0,0,0,95,111,112,101,110,95,114,101,103,
+    105,115,116,114,121,117,7,0,0,0,95,119,105,110,114,101,
+    103,117,10,0,0,0,81,117,101,114,121,86,97,108,117,101,
+    117,7,0,0,0,79,83,69,114,114,111,114,40,6,0,0,
+    0,117,3,0,0,0,99,108,115,117,8,0,0,0,102,117,
+    108,108,110,97,109,101,117,12,0,0,0,114,101,103,105,115,
+    116,114,121,95,107,101,121,117,3,0,0,0,107,101,121,117,
+    4,0,0,0,104,107,101,121,117,8,0,0,0,102,105,108,
+    101,112,97,116,104,40,0,0,0,0,40,0,0,0,0,117,
+    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
+    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
+    62,117,16,0,0,0,95,115,101,97,114,99,104,95,114,101,
+    103,105,115,116,114,121,249,2,0,0,115,22,0,0,0,0,
+    2,9,1,12,2,9,1,15,1,22,1,3,1,18,1,28,
+    1,13,1,9,1,117,38,0,0,0,87,105,110,100,111,119,
     115,82,101,103,105,115,116,114,121,70,105,110,100,101,114,46,
-    102,105,110,100,95,109,111,100,117,108,101,40,11,0,0,0,
-    117,8,0,0,0,95,95,110,97,109,101,95,95,117,10,0,
-    0,0,95,95,109,111,100,117,108,101,95,95,117,12,0,0,
-    0,95,95,113,117,97,108,110,97,109,101,95,95,117,7,0,
-    0,0,95,95,100,111,99,95,95,117,12,0,0,0,82,69,
-    71,73,83,84,82,89,95,75,69,89,117,18,0,0,0,82,
-    69,71,73,83,84,82,89,95,75,69,89,95,68,69,66,85,
-    71,117,11,0,0,0,68,69,66,85,71,95,66,85,73,76,
-    68,117,11,0,0,0,99,108,97,115,115,109,101,116,104,111,
-    100,117,14,0,0,0,95,111,112,101,110,95,114,101,103,105,
-    115,116,114,121,117,16,0,0,0,95,115,101,97,114,99,104,
-    95,114,101,103,105,115,116,114,121,117,11,0,0,0,102,105,
-    110,100,95,109,111,100,117,108,101,40,1,0,0,0,117,10,
-    0,0,0,95,95,108,111,99,97,108,115,95,95,40,0,0,
-    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
-    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
-    111,111,116,115,116,114,97,112,62,117,21,0,0,0,87,105,
+    95,115,101,97,114,99,104,95,114,101,103,105,115,116,114,121,
+    78,99,3,0,0,0,0,0,0,0,7,0,0,0,12,0,
+    0,0,67,0,0,0,115,140,0,0,0,124,0,0,106,0,
+    0,124,1,0,131,1,0,125,3,0,124,3,0,100,1,0,
+    107,8,0,114,31,0,100,1,0,83,121,17,0,116,1,0,
+    106,2,0,124,3,0,131,1,0,1,87,110,22,0,4,116,
+    3,0,107,10,0,114,72,0,1,1,1,100,1,0,83,89,
+    110,1,0,88,120,60,0,116,4,0,131,0,0,68,93,49,
+    0,92,3,0,125,4,0,125,5,0,125,6,0,124,3,0,
+    106,5,0,116,6,0,124,5,0,131,1,0,131,1,0,114,
+    83,0,124,4,0,124,1,0,124,3,0,131,2,0,83,113,
+    83,0,87,100,1,0,83,40,2,0,0,0,117,34,0,0,
+    0,70,105,110,100,32,109,111,100,117,108,101,32,110,97,109,
+    101,100,32,105,110,32,116,104,101,32,114,101,103,105,115,116,
+    114,121,46,78,40,7,0,0,0,117,16,0,0,0,95,115,
+    101,97,114,99,104,95,114,101,103,105,115,116,114,121,117,3,
+    0,0,0,95,111,115,117,4,0,0,0,115,116,97,116,117,
+    7,0,0,0,79,83,69,114,114,111,114,117,27,0,0,0,
+    95,103,101,116,95,115,117,112,112,111,114,116,101,100,95,102,
+    105,108,101,95,108,111,97,100,101,114,115,117,8,0,0,0,
+    101,110,100,115,119,105,116,104,117,5,0,0,0,116,117,112,
+    108,101,40,7,0,0,0,117,3,0,0,0,99,108,115,117,
+    8,0,0,0,102,117,108,108,110,97,109,101,117,4,0,0,
+    0,112,97,116,104,117,8,0,0,0,102,105,108,101,112,97,
+    116,104,117,6,0,0,0,108,111,97,100,101,114,117,8,0,
+    0,0,115,117,102,102,105,120,101,115,117,1,0,0,0,95,
+    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
+    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
+    46,95,98,111,111,116,115,116,114,97,112,62,117,11,0,0,
+    0,102,105,110,100,95,109,111,100,117,108,101,8,3,0,0,
+    115,20,0,0,0,0,3,15,1,12,1,4,1,3,1,17,
+    1,13,1,9,1,25,1,21,1,117,33,0,0,0,87,105,
     110,100,111,119,115,82,101,103,105,115,116,114,121,70,105,110,
-    100,101,114,229,2,0,0,115,16,0,0,0,16,3,6,3,
-    6,3,6,2,6,2,18,7,18,15,3,1,117,21,0,0,
-    0,87,105,110,100,111,119,115,82,101,103,105,115,116,114,121,
-    70,105,110,100,101,114,99,1,0,0,0,0,0,0,0,1,
-    0,0,0,5,0,0,0,66,0,0,0,115,74,0,0,0,
-    124,0,0,69,101,0,0,90,1,0,100,0,0,90,2,0,
-    100,1,0,90,3,0,100,2,0,100,3,0,132,0,0,90,
-    4,0,100,4,0,100,5,0,132,0,0,90,5,0,101,6,
-    0,100,6,0,100,7,0,100,8,0,100,9,0,132,0,1,
-    131,1,0,90,7,0,100,10,0,83,40,11,0,0,0,117,
-    13,0,0,0,95,76,111,97,100,101,114,66,97,115,105,99,
-    115,117,83,0,0,0,66,97,115,101,32,99,108,97,115,115,
-    32,111,102,32,99,111,109,109,111,110,32,99,111,100,101,32,
-    110,101,101,100,101,100,32,98,121,32,98,111,116,104,32,83,
-    111,117,114,99,101,76,111,97,100,101,114,32,97,110,100,10,
-    32,32,32,32,83,111,117,114,99,101,108,101,115,115,70,105,
-    108,101,76,111,97,100,101,114,46,99,2,0,0,0,0,0,
-    0,0,5,0,0,0,3,0,0,0,67,0,0,0,115,88,
-    0,0,0,116,0,0,124,0,0,106,1,0,124,1,0,131,
-    1,0,131,1,0,100,1,0,25,125,2,0,124,2,0,106,
-    2,0,100,2,0,100,1,0,131,2,0,100,3,0,25,125,
-    3,0,124,1,0,106,3,0,100,2,0,131,1,0,100,4,
-    0,25,125,4,0,124,3,0,100,5,0,107,2,0,111,87,
-    0,124,4,0,100,5,0,107,3,0,83,40,6,0,0,0,
-    117,141,0,0,0,67,111,110,99,114,101,116,101,32,105,109,
-    112,108,101,109,101,110,116,97,116,105,111,110,32,111,102,32,
-    73,110,115,112,101,99,116,76,111,97,100,101,114,46,105,115,
-    95,112,97,99,107,97,103,101,32,98,121,32,99,104,101,99,
-    107,105,110,103,32,105,102,10,32,32,32,32,32,32,32,32,
-    116,104,101,32,112,97,116,104,32,114,101,116,117,114,110,101,
-    100,32,98,121,32,103,101,116,95,102,105,108,101,110,97,109,
-    101,32,104,97,115,32,97,32,102,105,108,101,110,97,109,101,
-    32,111,102,32,39,95,95,105,110,105,116,95,95,46,112,121,
-    39,46,105,1,0,0,0,117,1,0,0,0,46,105,0,0,
-    0,0,105,2,0,0,0,117,8,0,0,0,95,95,105,110,
-    105,116,95,95,40,4,0,0,0,117,11,0,0,0,95,112,
-    97,116,104,95,115,112,108,105,116,117,12,0,0,0,103,101,
-    116,95,102,105,108,101,110,97,109,101,117,6,0,0,0,114,
-    115,112,108,105,116,117,10,0,0,0,114,112,97,114,116,105,
-    116,105,111,110,40,5,0,0,0,117,4,0,0,0,115,101,
-    108,102,117,8,0,0,0,102,117,108,108,110,97,109,101,117,
-    8,0,0,0,102,105,108,101,110,97,109,101,117,13,0,0,
-    0,102,105,108,101,110,97,109,101,95,98,97,115,101,117,9,
-    0,0,0,116,97,105,108,95,110,97,109,101,40,0,0,0,
-    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
-    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,10,0,0,0,105,115,95,
-    112,97,99,107,97,103,101,28,3,0,0,115,8,0,0,0,
-    0,3,25,1,22,1,19,1,117,24,0,0,0,95,76,111,
-    97,100,101,114,66,97,115,105,99,115,46,105,115,95,112,97,
-    99,107,97,103,101,99,5,0,0,0,0,0,0,0,12,0,
-    0,0,22,0,0,0,67,0,0,0,115,198,1,0,0,124,
-    2,0,100,1,0,100,2,0,133,2,0,25,125,5,0,124,
-    2,0,100,2,0,100,3,0,133,2,0,25,125,6,0,124,
-    2,0,100,3,0,100,4,0,133,2,0,25,125,7,0,124,
-    5,0,116,0,0,107,3,0,114,105,0,100,5,0,106,1,
-    0,124,1,0,124,5,0,131,2,0,125,8,0,116,2,0,
-    124,8,0,100,6,0,124,1,0,100,7,0,124,3,0,131,
-    1,2,130,1,0,110,116,0,116,3,0,124,6,0,131,1,
-    0,100,2,0,107,3,0,114,163,0,100,8,0,106,1,0,
+    100,101,114,46,102,105,110,100,95,109,111,100,117,108,101,40,
+    11,0,0,0,117,8,0,0,0,95,95,110,97,109,101,95,
+    95,117,10,0,0,0,95,95,109,111,100,117,108,101,95,95,
+    117,12,0,0,0,95,95,113,117,97,108,110,97,109,101,95,
+    95,117,7,0,0,0,95,95,100,111,99,95,95,117,12,0,
+    0,0,82,69,71,73,83,84,82,89,95,75,69,89,117,18,
+    0,0,0,82,69,71,73,83,84,82,89,95,75,69,89,95,
+    68,69,66,85,71,117,11,0,0,0,68,69,66,85,71,95,
+    66,85,73,76,68,117,11,0,0,0,99,108,97,115,115,109,
+    101,116,104,111,100,117,14,0,0,0,95,111,112,101,110,95,
+    114,101,103,105,115,116,114,121,117,16,0,0,0,95,115,101,
+    97,114,99,104,95,114,101,103,105,115,116,114,121,117,11,0,
+    0,0,102,105,110,100,95,109,111,100,117,108,101,40,1,0,
+    0,0,117,10,0,0,0,95,95,108,111,99,97,108,115,95,
+    95,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,21,0,
+    0,0,87,105,110,100,111,119,115,82,101,103,105,115,116,114,
+    121,70,105,110,100,101,114,229,2,0,0,115,16,0,0,0,
+    16,3,6,3,6,3,6,2,6,2,18,7,18,15,3,1,
+    117,21,0,0,0,87,105,110,100,111,119,115,82,101,103,105,
+    115,116,114,121,70,105,110,100,101,114,99,1,0,0,0,0,
+    0,0,0,1,0,0,0,3,0,0,0,66,0,0,0,115,
+    92,0,0,0,124,0,0,69,101,0,0,90,1,0,100,0,
+    0,90,2,0,100,1,0,90,3,0,100,2,0,100,3,0,
+    132,0,0,90,4,0,100,4,0,100,5,0,132,0,0,90,
+    5,0,100,6,0,100,7,0,132,0,0,90,6,0,100,8,
+    0,100,9,0,132,0,0,90,7,0,101,8,0,100,10,0,
+    100,11,0,132,0,0,131,1,0,90,9,0,100,12,0,83,
+    40,13,0,0,0,117,13,0,0,0,95,76,111,97,100,101,
+    114,66,97,115,105,99,115,117,83,0,0,0,66,97,115,101,
+    32,99,108,97,115,115,32,111,102,32,99,111,109,109,111,110,
+    32,99,111,100,101,32,110,101,101,100,101,100,32,98,121,32,
+    98,111,116,104,32,83,111,117,114,99,101,76,111,97,100,101,
+    114,32,97,110,100,10,32,32,32,32,83,111,117,114,99,101,
+    108,101,115,115,70,105,108,101,76,111,97,100,101,114,46,99,
+    2,0,0,0,0,0,0,0,5,0,0,0,3,0,0,0,
+    67,0,0,0,115,88,0,0,0,116,0,0,124,0,0,106,
+    1,0,124,1,0,131,1,0,131,1,0,100,1,0,25,125,
+    2,0,124,2,0,106,2,0,100,2,0,100,1,0,131,2,
+    0,100,3,0,25,125,3,0,124,1,0,106,3,0,100,2,
+    0,131,1,0,100,4,0,25,125,4,0,124,3,0,100,5,
+    0,107,2,0,111,87,0,124,4,0,100,5,0,107,3,0,
+    83,40,6,0,0,0,117,141,0,0,0,67,111,110,99,114,
+    101,116,101,32,105,109,112,108,101,109,101,110,116,97,116,105,
+    111,110,32,111,102,32,73,110,115,112,101,99,116,76,111,97,
+    100,101,114,46,105,115,95,112,97,99,107,97,103,101,32,98,
+    121,32,99,104,101,99,107,105,110,103,32,105,102,10,32,32,
+    32,32,32,32,32,32,116,104,101,32,112,97,116,104,32,114,
+    101,116,117,114,110,101,100,32,98,121,32,103,101,116,95,102,
+    105,108,101,110,97,109,101,32,104,97,115,32,97,32,102,105,
+    108,101,110,97,109,101,32,111,102,32,39,95,95,105,110,105,
+    116,95,95,46,112,121,39,46,105,1,0,0,0,117,1,0,
+    0,0,46,105,0,0,0,0,105,2,0,0,0,117,8,0,
+    0,0,95,95,105,110,105,116,95,95,40,4,0,0,0,117,
+    11,0,0,0,95,112,97,116,104,95,115,112,108,105,116,117,
+    12,0,0,0,103,101,116,95,102,105,108,101,110,97,109,101,
+    117,6,0,0,0,114,115,112,108,105,116,117,10,0,0,0,
+    114,112,97,114,116,105,116,105,111,110,40,5,0,0,0,117,
+    4,0,0,0,115,101,108,102,117,8,0,0,0,102,117,108,
+    108,110,97,109,101,117,8,0,0,0,102,105,108,101,110,97,
+    109,101,117,13,0,0,0,102,105,108,101,110,97,109,101,95,
+    98,97,115,101,117,9,0,0,0,116,97,105,108,95,110,97,
+    109,101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,10,
+    0,0,0,105,115,95,112,97,99,107,97,103,101,28,3,0,
+    0,115,8,0,0,0,0,3,25,1,22,1,19,1,117,24,
+    0,0,0,95,76,111,97,100,101,114,66,97,115,105,99,115,
+    46,105,115,95,112,97,99,107,97,103,101,99,5,0,0,0,
+    0,0,0,0,12,0,0,0,22,0,0,0,67,0,0,0,
+    115,198,1,0,0,124,2,0,100,1,0,100,2,0,133,2,
+    0,25,125,5,0,124,2,0,100,2,0,100,3,0,133,2,
+    0,25,125,6,0,124,2,0,100,3,0,100,4,0,133,2,
+    0,25,125,7,0,124,5,0,116,0,0,107,3,0,114,105,
+    0,100,5,0,106,1,0,124,1,0,124,5,0,131,2,0,
+    125,8,0,116,2,0,124,8,0,100,6,0,124,1,0,100,
+    7,0,124,3,0,131,1,2,130,1,0,110,116,0,116,3,
+    0,124,6,0,131,1,0,100,2,0,107,3,0,114,163,0,
+    100,8,0,106,1,0,124,1,0,131,1,0,125,9,0,116,
+    4,0,124,9,0,131,1,0,1,116,5,0,124,9,0,131,
+    1,0,130,1,0,110,58,0,116,3,0,124,7,0,131,1,
+    0,100,2,0,107,3,0,114,221,0,100,9,0,106,1,0,
     124,1,0,131,1,0,125,9,0,116,4,0,124,9,0,131,
     1,0,1,116,5,0,124,9,0,131,1,0,130,1,0,110,
-    58,0,116,3,0,124,7,0,131,1,0,100,2,0,107,3,
-    0,114,221,0,100,9,0,106,1,0,124,1,0,131,1,0,
-    125,9,0,116,4,0,124,9,0,131,1,0,1,116,5,0,
-    124,9,0,131,1,0,130,1,0,110,0,0,124,4,0,100,
-    1,0,107,9,0,114,184,1,121,20,0,116,6,0,124,4,
-    0,100,10,0,25,131,1,0,125,10,0,87,110,18,0,4,
-    116,7,0,107,10,0,114,17,1,1,1,1,89,110,71,0,
-    88,116,8,0,124,6,0,131,1,0,124,10,0,107,3,0,
-    114,88,1,100,11,0,106,1,0,124,1,0,131,1,0,125,
-    9,0,116,4,0,124,9,0,131,1,0,1,116,2,0,124,
-    9,0,100,6,0,124,1,0,100,7,0,124,3,0,131,1,
-    2,130,1,0,110,0,0,121,18,0,124,4,0,100,12,0,
-    25,100,13,0,64,125,11,0,87,110,18,0,4,116,7,0,
-    107,10,0,114,126,1,1,1,1,89,113,184,1,88,116,8,
-    0,124,7,0,131,1,0,124,11,0,107,3,0,114,184,1,
-    116,2,0,100,11,0,106,1,0,124,1,0,131,1,0,100,
-    6,0,124,1,0,100,7,0,124,3,0,131,1,2,130,1,
-    0,113,184,1,110,0,0,124,2,0,100,4,0,100,1,0,
-    133,2,0,25,83,40,14,0,0,0,117,193,0,0,0,82,
-    101,116,117,114,110,32,116,104,101,32,109,97,114,115,104,97,
-    108,108,101,100,32,98,121,116,101,115,32,102,114,111,109,32,
-    98,121,116,101,99,111,100,101,44,32,118,101,114,105,102,121,
-    105,110,103,32,116,104,101,32,109,97,103,105,99,10,32,32,
-    32,32,32,32,32,32,110,117,109,98,101,114,44,32,116,105,
-    109,101,115,116,97,109,112,32,97,110,100,32,115,111,117,114,
-    99,101,32,115,105,122,101,32,97,108,111,110,103,32,116,104,
-    101,32,119,97,121,46,10,10,32,32,32,32,32,32,32,32,
-    73,102,32,115,111,117,114,99,101,95,115,116,97,116,115,32,
-    105,115,32,78,111,110,101,32,116,104,101,110,32,115,107,105,
-    112,32,116,104,101,32,116,105,109,101,115,116,97,109,112,32,
-    99,104,101,99,107,46,10,10,32,32,32,32,32,32,32,32,
-    78,105,4,0,0,0,105,8,0,0,0,105,12,0,0,0,
-    117,30,0,0,0,98,97,100,32,109,97,103,105,99,32,110,
-    117,109,98,101,114,32,105,110,32,123,33,114,125,58,32,123,
-    33,114,125,117,4,0,0,0,110,97,109,101,117,4,0,0,
-    0,112,97,116,104,117,19,0,0,0,98,97,100,32,116,105,
-    109,101,115,116,97,109,112,32,105,110,32,123,125,117,14,0,
-    0,0,98,97,100,32,115,105,122,101,32,105,110,32,123,125,
-    117,5,0,0,0,109,116,105,109,101,117,24,0,0,0,98,
-    121,116,101,99,111,100,101,32,105,115,32,115,116,97,108,101,
-    32,102,111,114,32,123,125,117,4,0,0,0,115,105,122,101,
-    108,3,0,0,0,255,127,255,127,3,0,40,9,0,0,0,
-    117,12,0,0,0,95,77,65,71,73,67,95,66,89,84,69,
-    83,117,6,0,0,0,102,111,114,109,97,116,117,11,0,0,
-    0,73,109,112,111,114,116,69,114,114,111,114,117,3,0,0,
-    0,108,101,110,117,16,0,0,0,95,118,101,114,98,111,115,
-    101,95,109,101,115,115,97,103,101,117,8,0,0,0,69,79,
-    70,69,114,114,111,114,117,3,0,0,0,105,110,116,117,8,
-    0,0,0,75,101,121,69,114,114,111,114,117,7,0,0,0,
-    95,114,95,108,111,110,103,40,12,0,0,0,117,4,0,0,
-    0,115,101,108,102,117,8,0,0,0,102,117,108,108,110,97,
-    109,101,117,4,0,0,0,100,97,116,97,117,13,0,0,0,
-    98,121,116,101,99,111,100,101,95,112,97,116,104,117,12,0,
-    0,0,115,111,117,114,99,101,95,115,116,97,116,115,117,5,
-    0,0,0,109,97,103,105,99,117,13,0,0,0,114,97,119,
-    95,116,105,109,101,115,116,97,109,112,117,8,0,0,0,114,
-    97,119,95,115,105,122,101,117,3,0,0,0,109,115,103,117,
-    7,0,0,0,109,101,115,115,97,103,101,117,12,0,0,0,
-    115,111,117,114,99,101,95,109,116,105,109,101,117,11,0,0,
-    0,115,111,117,114,99,101,95,115,105,122,101,40,0,0,0,
-    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
-    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,20,0,0,0,95,98,121,
-    116,101,115,95,102,114,111,109,95,98,121,116,101,99,111,100,
-    101,36,3,0,0,115,66,0,0,0,0,7,16,1,16,1,
-    16,1,12,1,18,1,27,1,18,1,15,1,10,1,15,1,
-    18,1,15,1,10,1,15,1,12,1,3,1,20,1,13,1,
-    5,2,18,1,15,1,10,1,15,1,12,1,3,1,18,1,
-    13,1,5,2,18,1,3,1,15,1,21,3,117,34,0,0,
-    0,95,76,111,97,100,101,114,66,97,115,105,99,115,46,95,
-    98,121,116,101,115,95,102,114,111,109,95,98,121,116,101,99,
-    111,100,101,117,10,0,0,0,115,111,117,114,99,101,108,101,
-    115,115,70,99,2,0,0,0,1,0,0,0,5,0,0,0,
-    12,0,0,0,67,0,0,0,115,227,0,0,0,124,1,0,
-    106,0,0,125,3,0,124,0,0,106,1,0,124,3,0,131,
-    1,0,125,4,0,124,0,0,106,2,0,124,3,0,131,1,
-    0,124,1,0,95,3,0,124,2,0,115,106,0,121,22,0,
-    116,4,0,124,1,0,106,3,0,131,1,0,124,1,0,95,
-    5,0,87,113,118,0,4,116,6,0,107,10,0,114,102,0,
-    1,1,1,124,1,0,106,3,0,124,1,0,95,5,0,89,
-    113,118,0,88,110,12,0,124,1,0,106,3,0,124,1,0,
-    95,5,0,124,3,0,124,1,0,95,7,0,124,0,0,106,
-    8,0,124,3,0,131,1,0,114,170,0,116,9,0,124,1,
-    0,106,3,0,131,1,0,100,1,0,25,103,1,0,124,1,
-    0,95,10,0,110,25,0,124,1,0,106,7,0,106,11,0,
-    100,2,0,131,1,0,100,1,0,25,124,1,0,95,7,0,
-    124,0,0,124,1,0,95,12,0,116,13,0,116,14,0,124,
-    4,0,124,1,0,106,15,0,131,3,0,1,124,1,0,83,
-    40,3,0,0,0,117,82,0,0,0,72,101,108,112,101,114,
-    32,102,111,114,32,108,111,97,100,95,109,111,100,117,108,101,
-    32,97,98,108,101,32,116,111,32,104,97,110,100,108,101,32,
-    101,105,116,104,101,114,32,115,111,117,114,99,101,32,111,114,
-    32,115,111,117,114,99,101,108,101,115,115,10,32,32,32,32,
-    32,32,32,32,108,111,97,100,105,110,103,46,105,0,0,0,
-    0,117,1,0,0,0,46,40,16,0,0,0,117,8,0,0,
-    0,95,95,110,97,109,101,95,95,117,8,0,0,0,103,101,
-    116,95,99,111,100,101,117,12,0,0,0,103,101,116,95,102,
-    105,108,101,110,97,109,101,117,8,0,0,0,95,95,102,105,
-    108,101,95,95,117,17,0,0,0,99,97,99,104,101,95,102,
-    114,111,109,95,115,111,117,114,99,101,117,10,0,0,0,95,
-    95,99,97,99,104,101,100,95,95,117,19,0,0,0,78,111,
-    116,73,109,112,108,101,109,101,110,116,101,100,69,114,114,111,
-    114,117,11,0,0,0,95,95,112,97,99,107,97,103,101,95,
-    95,117,10,0,0,0,105,115,95,112,97,99,107,97,103,101,
-    117,11,0,0,0,95,112,97,116,104,95,115,112,108,105,116,
-    117,8,0,0,0,95,95,112,97,116,104,95,95,117,10,0,
-    0,0,114,112,97,114,116,105,116,105,111,110,117,10,0,0,
-    0,95,95,108,111,97,100,101,114,95,95,117,25,0,0,0,
+    0,0,124,4,0,100,1,0,107,9,0,114,184,1,121,20,
+    0,116,6,0,124,4,0,100,10,0,25,131,1,0,125,10,
+    0,87,110,18,0,4,116,7,0,107,10,0,114,17,1,1,
+    1,1,89,110,71,0,88,116,8,0,124,6,0,131,1,0,
+    124,10,0,107,3,0,114,88,1,100,11,0,106,1,0,124,
+    1,0,131,1,0,125,9,0,116,4,0,124,9,0,131,1,
+    0,1,116,2,0,124,9,0,100,6,0,124,1,0,100,7,
+    0,124,3,0,131,1,2,130,1,0,110,0,0,121,18,0,
+    124,4,0,100,12,0,25,100,13,0,64,125,11,0,87,110,
+    18,0,4,116,7,0,107,10,0,114,126,1,1,1,1,89,
+    113,184,1,88,116,8,0,124,7,0,131,1,0,124,11,0,
+    107,3,0,114,184,1,116,2,0,100,11,0,106,1,0,124,
+    1,0,131,1,0,100,6,0,124,1,0,100,7,0,124,3,
+    0,131,1,2,130,1,0,113,184,1,110,0,0,124,2,0,
+    100,4,0,100,1,0,133,2,0,25,83,40,14,0,0,0,
+    117,193,0,0,0,82,101,116,117,114,110,32,116,104,101,32,
+    109,97,114,115,104,97,108,108,101,100,32,98,121,116,101,115,
+    32,102,114,111,109,32,98,121,116,101,99,111,100,101,44,32,
+    118,101,114,105,102,121,105,110,103,32,116,104,101,32,109,97,
+    103,105,99,10,32,32,32,32,32,32,32,32,110,117,109,98,
+    101,114,44,32,116,105,109,101,115,116,97,109,112,32,97,110,
+    100,32,115,111,117,114,99,101,32,115,105,122,101,32,97,108,
+    111,110,103,32,116,104,101,32,119,97,121,46,10,10,32,32,
+    32,32,32,32,32,32,73,102,32,115,111,117,114,99,101,95,
+    115,116,97,116,115,32,105,115,32,78,111,110,101,32,116,104,
+    101,110,32,115,107,105,112,32,116,104,101,32,116,105,109,101,
+    115,116,97,109,112,32,99,104,101,99,107,46,10,10,32,32,
+    32,32,32,32,32,32,78,105,4,0,0,0,105,8,0,0,
+    0,105,12,0,0,0,117,30,0,0,0,98,97,100,32,109,
+    97,103,105,99,32,110,117,109,98,101,114,32,105,110,32,123,
+    33,114,125,58,32,123,33,114,125,117,4,0,0,0,110,97,
+    109,101,117,4,0,0,0,112,97,116,104,117,19,0,0,0,
+    98,97,100,32,116,105,109,101,115,116,97,109,112,32,105,110,
+    32,123,125,117,14,0,0,0,98,97,100,32,115,105,122,101,
+    32,105,110,32,123,125,117,5,0,0,0,109,116,105,109,101,
+    117,24,0,0,0,98,121,116,101,99,111,100,101,32,105,115,
+    32,115,116,97,108,101,32,102,111,114,32,123,125,117,4,0,
+    0,0,115,105,122,101,108,3,0,0,0,255,127,255,127,3,
+    0,40,9,0,0,0,117,12,0,0,0,95,77,65,71,73,
+    67,95,66,89,84,69,83,117,6,0,0,0,102,111,114,109,
+    97,116,117,11,0,0,0,73,109,112,111,114,116,69,114,114,
+    111,114,117,3,0,0,0,108,101,110,117,16,0,0,0,95,
+    118,101,114,98,111,115,101,95,109,101,115,115,97,103,101,117,
+    8,0,0,0,69,79,70,69,114,114,111,114,117,3,0,0,
+    0,105,110,116,117,8,0,0,0,75,101,121,69,114,114,111,
+    114,117,7,0,0,0,95,114,95,108,111,110,103,40,12,0,
+    0,0,117,4,0,0,0,115,101,108,102,117,8,0,0,0,
+    102,117,108,108,110,97,109,101,117,4,0,0,0,100,97,116,
+    97,117,13,0,0,0,98,121,116,101,99,111,100,101,95,112,
+    97,116,104,117,12,0,0,0,115,111,117,114,99,101,95,115,
+    116,97,116,115,117,5,0,0,0,109,97,103,105,99,117,13,
+    0,0,0,114,97,119,95,116,105,109,101,115,116,97,109,112,
+    117,8,0,0,0,114,97,119,95,115,105,122,101,117,3,0,
+    0,0,109,115,103,117,7,0,0,0,109,101,115,115,97,103,
+    101,117,12,0,0,0,115,111,117,114,99,101,95,109,116,105,
+    109,101,117,11,0,0,0,115,111,117,114,99,101,95,115,105,
+    122,101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,20,
+    0,0,0,95,98,121,116,101,115,95,102,114,111,109,95,98,
+    121,116,101,99,111,100,101,36,3,0,0,115,66,0,0,0,
+    0,7,16,1,16,1,16,1,12,1,18,1,27,1,18,1,
+    15,1,10,1,15,1,18,1,15,1,10,1,15,1,12,1,
+    3,1,20,1,13,1,5,2,18,1,15,1,10,1,15,1,
+    12,1,3,1,18,1,13,1,5,2,18,1,3,1,15,1,
+    21,3,117,34,0,0,0,95,76,111,97,100,101,114,66,97,
+    115,105,99,115,46,95,98,121,116,101,115,95,102,114,111,109,
+    95,98,121,116,101,99,111,100,101,99,2,0,0,0,0,0,
+    0,0,3,0,0,0,11,0,0,0,67,0,0,0,115,172,
+    0,0,0,124,1,0,106,0,0,125,2,0,124,0,0,106,
+    1,0,124,2,0,131,1,0,124,1,0,95,2,0,121,22,
+    0,116,3,0,124,1,0,106,2,0,131,1,0,124,1,0,
+    95,4,0,87,110,30,0,4,116,5,0,107,10,0,114,81,
+    0,1,1,1,124,1,0,106,2,0,124,1,0,95,4,0,
+    89,110,1,0,88,124,2,0,124,1,0,95,6,0,124,0,
+    0,106,7,0,124,2,0,131,1,0,114,134,0,116,8,0,
+    124,1,0,106,2,0,131,1,0,100,1,0,25,103,1,0,
+    124,1,0,95,9,0,110,25,0,124,1,0,106,6,0,106,
+    10,0,100,2,0,131,1,0,100,1,0,25,124,1,0,95,
+    6,0,124,0,0,124,1,0,95,11,0,100,3,0,83,40,
+    4,0,0,0,117,117,0,0,0,83,101,116,32,116,104,101,
+    32,105,109,112,111,114,116,45,114,101,108,97,116,101,100,32,
+    97,116,116,114,105,98,117,116,101,115,32,111,102,32,116,104,
+    101,32,109,111,100,117,108,101,32,40,95,95,102,105,108,101,
+    95,95,44,10,32,32,32,32,32,32,32,32,95,95,99,97,
+    99,104,101,100,95,95,44,32,95,95,112,97,99,107,97,103,
+    101,95,95,44,32,95,95,112,97,116,104,95,95,32,97,110,
+    100,32,95,95,108,111,97,100,101,114,95,95,41,46,105,0,
+    0,0,0,117,1,0,0,0,46,78,40,12,0,0,0,117,
+    8,0,0,0,95,95,110,97,109,101,95,95,117,12,0,0,
+    0,103,101,116,95,102,105,108,101,110,97,109,101,117,8,0,
+    0,0,95,95,102,105,108,101,95,95,117,17,0,0,0,99,
+    97,99,104,101,95,102,114,111,109,95,115,111,117,114,99,101,
+    117,10,0,0,0,95,95,99,97,99,104,101,100,95,95,117,
+    19,0,0,0,78,111,116,73,109,112,108,101,109,101,110,116,
+    101,100,69,114,114,111,114,117,11,0,0,0,95,95,112,97,
+    99,107,97,103,101,95,95,117,10,0,0,0,105,115,95,112,
+    97,99,107,97,103,101,117,11,0,0,0,95,112,97,116,104,
+    95,115,112,108,105,116,117,8,0,0,0,95,95,112,97,116,
+    104,95,95,117,10,0,0,0,114,112,97,114,116,105,116,105,
+    111,110,117,10,0,0,0,95,95,108,111,97,100,101,114,95,
+    95,40,3,0,0,0,117,4,0,0,0,115,101,108,102,117,
+    6,0,0,0,109,111,100,117,108,101,117,4,0,0,0,110,
+    97,109,101,40,0,0,0,0,40,0,0,0,0,117,29,0,
+    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
+    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
+    18,0,0,0,95,105,110,105,116,95,109,111,100,117,108,101,
+    95,97,116,116,114,115,81,3,0,0,115,22,0,0,0,0,
+    3,9,1,18,1,3,1,22,1,13,1,17,1,9,1,15,
+    1,28,2,25,1,117,32,0,0,0,95,76,111,97,100,101,
+    114,66,97,115,105,99,115,46,95,105,110,105,116,95,109,111,
+    100,117,108,101,95,97,116,116,114,115,99,2,0,0,0,0,
+    0,0,0,3,0,0,0,4,0,0,0,67,0,0,0,115,
+    41,0,0,0,124,0,0,106,0,0,124,1,0,106,1,0,
+    131,1,0,125,2,0,116,2,0,116,3,0,124,2,0,124,
+    1,0,106,4,0,131,3,0,1,100,1,0,83,40,2,0,
+    0,0,117,52,0,0,0,69,120,101,99,117,116,101,32,116,
+    104,101,32,109,111,100,117,108,101,39,115,32,99,111,100,101,
+    32,105,110,32,116,104,101,32,109,111,100,117,108,101,39,115,
+    32,110,97,109,101,115,112,97,99,101,46,78,40,5,0,0,
+    0,117,8,0,0,0,103,101,116,95,99,111,100,101,117,8,
+    0,0,0,95,95,110,97,109,101,95,95,117,25,0,0,0,
     95,99,97,108,108,95,119,105,116,104,95,102,114,97,109,101,
     115,95,114,101,109,111,118,101,100,117,4,0,0,0,101,120,
     101,99,117,8,0,0,0,95,95,100,105,99,116,95,95,40,
-    5,0,0,0,117,4,0,0,0,115,101,108,102,117,6,0,
-    0,0,109,111,100,117,108,101,117,10,0,0,0,115,111,117,
-    114,99,101,108,101,115,115,117,4,0,0,0,110,97,109,101,
-    117,11,0,0,0,99,111,100,101,95,111,98,106,101,99,116,
-    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
-    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
-    46,95,98,111,111,116,115,116,114,97,112,62,117,12,0,0,
-    0,95,108,111,97,100,95,109,111,100,117,108,101,81,3,0,
-    0,115,32,0,0,0,0,4,9,1,15,1,18,1,6,1,
-    3,1,22,1,13,1,20,2,12,1,9,1,15,1,28,2,
-    25,1,9,1,19,1,117,26,0,0,0,95,76,111,97,100,
-    101,114,66,97,115,105,99,115,46,95,108,111,97,100,95,109,
-    111,100,117,108,101,78,40,8,0,0,0,117,8,0,0,0,
-    95,95,110,97,109,101,95,95,117,10,0,0,0,95,95,109,
-    111,100,117,108,101,95,95,117,12,0,0,0,95,95,113,117,
-    97,108,110,97,109,101,95,95,117,7,0,0,0,95,95,100,
-    111,99,95,95,117,10,0,0,0,105,115,95,112,97,99,107,
-    97,103,101,117,20,0,0,0,95,98,121,116,101,115,95,102,
-    114,111,109,95,98,121,116,101,99,111,100,101,117,17,0,0,
-    0,109,111,100,117,108,101,95,102,111,114,95,108,111,97,100,
-    101,114,117,12,0,0,0,95,108,111,97,100,95,109,111,100,
-    117,108,101,40,1,0,0,0,117,10,0,0,0,95,95,108,
-    111,99,97,108,115,95,95,40,0,0,0,0,40,0,0,0,
-    0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
-    112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
-    97,112,62,117,13,0,0,0,95,76,111,97,100,101,114,66,
-    97,115,105,99,115,23,3,0,0,115,10,0,0,0,16,3,
-    6,2,12,8,12,45,6,1,117,13,0,0,0,95,76,111,
-    97,100,101,114,66,97,115,105,99,115,99,1,0,0,0,0,
-    0,0,0,1,0,0,0,2,0,0,0,66,0,0,0,115,
-    116,0,0,0,124,0,0,69,101,0,0,90,1,0,100,0,
-    0,90,2,0,100,1,0,100,2,0,132,0,0,90,3,0,
-    100,3,0,100,4,0,132,0,0,90,4,0,100,5,0,100,
-    6,0,132,0,0,90,5,0,100,7,0,100,8,0,132,0,
-    0,90,6,0,100,9,0,100,10,0,132,0,0,90,7,0,
-    100,11,0,100,12,0,132,0,0,90,8,0,100,13,0,100,
-    14,0,132,0,0,90,9,0,100,15,0,100,16,0,132,0,
-    0,90,10,0,100,17,0,83,40,18,0,0,0,117,12,0,
-    0,0,83,111,117,114,99,101,76,111,97,100,101,114,99,2,
-    0,0,0,0,0,0,0,2,0,0,0,1,0,0,0,67,
-    0,0,0,115,10,0,0,0,116,0,0,130,1,0,100,1,
-    0,83,40,2,0,0,0,117,121,0,0,0,79,112,116,105,
-    111,110,97,108,32,109,101,116,104,111,100,32,116,104,97,116,
-    32,114,101,116,117,114,110,115,32,116,104,101,32,109,111,100,
-    105,102,105,99,97,116,105,111,110,32,116,105,109,101,32,40,
-    97,110,32,105,110,116,41,32,102,111,114,32,116,104,101,10,
-    32,32,32,32,32,32,32,32,115,112,101,99,105,102,105,101,
-    100,32,112,97,116,104,44,32,119,104,101,114,101,32,112,97,
-    116,104,32,105,115,32,97,32,115,116,114,46,10,32,32,32,
+    3,0,0,0,117,4,0,0,0,115,101,108,102,117,6,0,
+    0,0,109,111,100,117,108,101,117,11,0,0,0,99,111,100,
+    101,95,111,98,106,101,99,116,40,0,0,0,0,40,0,0,
+    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,117,11,0,0,0,101,120,101,99,95,109,111,
+    100,117,108,101,97,3,0,0,115,4,0,0,0,0,2,18,
+    1,117,25,0,0,0,95,76,111,97,100,101,114,66,97,115,
+    105,99,115,46,101,120,101,99,95,109,111,100,117,108,101,99,
+    2,0,0,0,0,0,0,0,2,0,0,0,2,0,0,0,
+    67,0,0,0,115,30,0,0,0,124,0,0,106,0,0,124,
+    1,0,131,1,0,1,124,0,0,106,1,0,124,1,0,131,
+    1,0,1,124,1,0,83,40,1,0,0,0,117,82,0,0,
+    0,72,101,108,112,101,114,32,102,111,114,32,108,111,97,100,
+    95,109,111,100,117,108,101,32,97,98,108,101,32,116,111,32,
+    104,97,110,100,108,101,32,101,105,116,104,101,114,32,115,111,
+    117,114,99,101,32,111,114,32,115,111,117,114,99,101,108,101,
+    115,115,10,32,32,32,32,32,32,32,32,108,111,97,100,105,
+    110,103,46,40,2,0,0,0,117,18,0,0,0,95,105,110,
+    105,116,95,109,111,100,117,108,101,95,97,116,116,114,115,117,
+    11,0,0,0,101,120,101,99,95,109,111,100,117,108,101,40,
+    2,0,0,0,117,4,0,0,0,115,101,108,102,117,6,0,
+    0,0,109,111,100,117,108,101,40,0,0,0,0,40,0,0,
+    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,117,12,0,0,0,95,108,111,97,100,95,109,
+    111,100,117,108,101,102,3,0,0,115,6,0,0,0,0,4,
+    13,1,13,1,117,26,0,0,0,95,76,111,97,100,101,114,
+    66,97,115,105,99,115,46,95,108,111,97,100,95,109,111,100,
+    117,108,101,78,40,10,0,0,0,117,8,0,0,0,95,95,
+    110,97,109,101,95,95,117,10,0,0,0,95,95,109,111,100,
+    117,108,101,95,95,117,12,0,0,0,95,95,113,117,97,108,
+    110,97,109,101,95,95,117,7,0,0,0,95,95,100,111,99,
+    95,95,117,10,0,0,0,105,115,95,112,97,99,107,97,103,
+    101,117,20,0,0,0,95,98,121,116,101,115,95,102,114,111,
+    109,95,98,121,116,101,99,111,100,101,117,18,0,0,0,95,
+    105,110,105,116,95,109,111,100,117,108,101,95,97,116,116,114,
+    115,117,11,0,0,0,101,120,101,99,95,109,111,100,117,108,
+    101,117,17,0,0,0,109,111,100,117,108,101,95,102,111,114,
+    95,108,111,97,100,101,114,117,12,0,0,0,95,108,111,97,
+    100,95,109,111,100,117,108,101,40,1,0,0,0,117,10,0,
+    0,0,95,95,108,111,99,97,108,115,95,95,40,0,0,0,
+    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
+    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
+    111,116,115,116,114,97,112,62,117,13,0,0,0,95,76,111,
+    97,100,101,114,66,97,115,105,99,115,23,3,0,0,115,12,
+    0,0,0,16,3,6,2,12,8,12,45,12,16,12,5,117,
+    13,0,0,0,95,76,111,97,100,101,114,66,97,115,105,99,
+    115,99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,
+    0,0,66,0,0,0,115,116,0,0,0,124,0,0,69,101,
+    0,0,90,1,0,100,0,0,90,2,0,100,1,0,100,2,
+    0,132,0,0,90,3,0,100,3,0,100,4,0,132,0,0,
+    90,4,0,100,5,0,100,6,0,132,0,0,90,5,0,100,
+    7,0,100,8,0,132,0,0,90,6,0,100,9,0,100,10,
+    0,132,0,0,90,7,0,100,11,0,100,12,0,132,0,0,
+    90,8,0,100,13,0,100,14,0,132,0,0,90,9,0,100,
+    15,0,100,16,0,132,0,0,90,10,0,100,17,0,83,40,
+    18,0,0,0,117,12,0,0,0,83,111,117,114,99,101,76,
+    111,97,100,101,114,99,2,0,0,0,0,0,0,0,2,0,
+    0,0,1,0,0,0,67,0,0,0,115,10,0,0,0,116,
+    0,0,130,1,0,100,1,0,83,40,2,0,0,0,117,121,
+    0,0,0,79,112,116,105,111,110,97,108,32,109,101,116,104,
+    111,100,32,116,104,97,116,32,114,101,116,117,114,110,115,32,
+    116,104,101,32,109,111,100,105,102,105,99,97,116,105,111,110,
+    32,116,105,109,101,32,40,97,110,32,105,110,116,41,32,102,
+    111,114,32,116,104,101,10,32,32,32,32,32,32,32,32,115,
+    112,101,99,105,102,105,101,100,32,112,97,116,104,44,32,119,
+    104,101,114,101,32,112,97,116,104,32,105,115,32,97,32,115,
+    116,114,46,10,32,32,32,32,32,32,32,32,78,40,1,0,
+    0,0,117,19,0,0,0,78,111,116,73,109,112,108,101,109,
+    101,110,116,101,100,69,114,114,111,114,40,2,0,0,0,117,
+    4,0,0,0,115,101,108,102,117,4,0,0,0,112,97,116,
+    104,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,10,0,
+    0,0,112,97,116,104,95,109,116,105,109,101,113,3,0,0,
+    115,2,0,0,0,0,4,117,23,0,0,0,83,111,117,114,
+    99,101,76,111,97,100,101,114,46,112,97,116,104,95,109,116,
+    105,109,101,99,2,0,0,0,0,0,0,0,2,0,0,0,
+    3,0,0,0,67,0,0,0,115,20,0,0,0,105,1,0,
+    124,0,0,106,0,0,124,1,0,131,1,0,100,1,0,54,
+    83,40,2,0,0,0,117,114,1,0,0,79,112,116,105,111,
+    110,97,108,32,109,101,116,104,111,100,32,114,101,116,117,114,
+    110,105,110,103,32,97,32,109,101,116,97,100,97,116,97,32,
+    100,105,99,116,32,102,111,114,32,116,104,101,32,115,112,101,
+    99,105,102,105,101,100,32,112,97,116,104,10,32,32,32,32,
+    32,32,32,32,116,111,32,98,121,32,116,104,101,32,112,97,
+    116,104,32,40,115,116,114,41,46,10,32,32,32,32,32,32,
+    32,32,80,111,115,115,105,98,108,101,32,107,101,121,115,58,
+    10,32,32,32,32,32,32,32,32,45,32,39,109,116,105,109,
+    101,39,32,40,109,97,110,100,97,116,111,114,121,41,32,105,
+    115,32,116,104,101,32,110,117,109,101,114,105,99,32,116,105,
+    109,101,115,116,97,109,112,32,111,102,32,108,97,115,116,32,
+    115,111,117,114,99,101,10,32,32,32,32,32,32,32,32,32,
+    32,99,111,100,101,32,109,111,100,105,102,105,99,97,116,105,
+    111,110,59,10,32,32,32,32,32,32,32,32,45,32,39,115,
+    105,122,101,39,32,40,111,112,116,105,111,110,97,108,41,32,
+    105,115,32,116,104,101,32,115,105,122,101,32,105,110,32,98,
+    121,116,101,115,32,111,102,32,116,104,101,32,115,111,117,114,
+    99,101,32,99,111,100,101,46,10,10,32,32,32,32,32,32,
+    32,32,73,109,112,108,101,109,101,110,116,105,110,103,32,116,
+    104,105,115,32,109,101,116,104,111,100,32,97,108,108,111,119,
+    115,32,116,104,101,32,108,111,97,100,101,114,32,116,111,32,
+    114,101,97,100,32,98,121,116,101,99,111,100,101,32,102,105,
+    108,101,115,46,10,32,32,32,32,32,32,32,32,117,5,0,
+    0,0,109,116,105,109,101,40,1,0,0,0,117,10,0,0,
+    0,112,97,116,104,95,109,116,105,109,101,40,2,0,0,0,
+    117,4,0,0,0,115,101,108,102,117,4,0,0,0,112,97,
+    116,104,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,10,
+    0,0,0,112,97,116,104,95,115,116,97,116,115,119,3,0,
+    0,115,2,0,0,0,0,10,117,23,0,0,0,83,111,117,
+    114,99,101,76,111,97,100,101,114,46,112,97,116,104,95,115,
+    116,97,116,115,99,4,0,0,0,0,0,0,0,4,0,0,
+    0,3,0,0,0,67,0,0,0,115,16,0,0,0,124,0,
+    0,106,0,0,124,2,0,124,3,0,131,2,0,83,40,1,
+    0,0,0,117,228,0,0,0,79,112,116,105,111,110,97,108,
+    32,109,101,116,104,111,100,32,119,104,105,99,104,32,119,114,
+    105,116,101,115,32,100,97,116,97,32,40,98,121,116,101,115,
+    41,32,116,111,32,97,32,102,105,108,101,32,112,97,116,104,
+    32,40,97,32,115,116,114,41,46,10,10,32,32,32,32,32,
+    32,32,32,73,109,112,108,101,109,101,110,116,105,110,103,32,
+    116,104,105,115,32,109,101,116,104,111,100,32,97,108,108,111,
+    119,115,32,102,111,114,32,116,104,101,32,119,114,105,116,105,
+    110,103,32,111,102,32,98,121,116,101,99,111,100,101,32,102,
+    105,108,101,115,46,10,10,32,32,32,32,32,32,32,32,84,
+    104,101,32,115,111,117,114,99,101,32,112,97,116,104,32,105,
+    115,32,110,101,101,100,101,100,32,105,110,32,111,114,100,101,
+    114,32,116,111,32,99,111,114,114,101,99,116,108,121,32,116,
+    114,97,110,115,102,101,114,32,112,101,114,109,105,115,115,105,
+    111,110,115,10,32,32,32,32,32,32,32,32,40,1,0,0,
+    0,117,8,0,0,0,115,101,116,95,100,97,116,97,40,4,
+    0,0,0,117,4,0,0,0,115,101,108,102,117,11,0,0,
+    0,115,111,117,114,99,101,95,112,97,116,104,117,10,0,0,
+    0,99,97,99,104,101,95,112,97,116,104,117,4,0,0,0,
+    100,97,116,97,40,0,0,0,0,40,0,0,0,0,117,29,
+    0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
+    116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
+    117,15,0,0,0,95,99,97,99,104,101,95,98,121,116,101,
+    99,111,100,101,131,3,0,0,115,2,0,0,0,0,8,117,
+    28,0,0,0,83,111,117,114,99,101,76,111,97,100,101,114,
+    46,95,99,97,99,104,101,95,98,121,116,101,99,111,100,101,
+    99,3,0,0,0,0,0,0,0,3,0,0,0,1,0,0,
+    0,67,0,0,0,115,10,0,0,0,116,0,0,130,1,0,
+    100,1,0,83,40,2,0,0,0,117,151,0,0,0,79,112,
+    116,105,111,110,97,108,32,109,101,116,104,111,100,32,119,104,
+    105,99,104,32,119,114,105,116,101,115,32,100,97,116,97,32,
+    40,98,121,116,101,115,41,32,116,111,32,97,32,102,105,108,
+    101,32,112,97,116,104,32,40,97,32,115,116,114,41,46,10,
+    10,32,32,32,32,32,32,32,32,73,109,112,108,101,109,101,
+    110,116,105,110,103,32,116,104,105,115,32,109,101,116,104,111,
+    100,32,97,108,108,111,119,115,32,102,111,114,32,116,104,101,
+    32,119,114,105,116,105,110,103,32,111,102,32,98,121,116,101,
+    99,111,100,101,32,102,105,108,101,115,46,10,10,32,32,32,
     32,32,32,32,32,78,40,1,0,0,0,117,19,0,0,0,
     78,111,116,73,109,112,108,101,109,101,110,116,101,100,69,114,
-    114,111,114,40,2,0,0,0,117,4,0,0,0,115,101,108,
-    102,117,4,0,0,0,112,97,116,104,40,0,0,0,0,40,
-    0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,
-    32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,
-    115,116,114,97,112,62,117,10,0,0,0,112,97,116,104,95,
-    109,116,105,109,101,107,3,0,0,115,2,0,0,0,0,4,
-    117,23,0,0,0,83,111,117,114,99,101,76,111,97,100,101,
-    114,46,112,97,116,104,95,109,116,105,109,101,99,2,0,0,
-    0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,0,
-    0,115,20,0,0,0,105,1,0,124,0,0,106,0,0,124,
-    1,0,131,1,0,100,1,0,54,83,40,2,0,0,0,117,
-    114,1,0,0,79,112,116,105,111,110,97,108,32,109,101,116,
-    104,111,100,32,114,101,116,117,114,110,105,110,103,32,97,32,
-    109,101,116,97,100,97,116,97,32,100,105,99,116,32,102,111,
-    114,32,116,104,101,32,115,112,101,99,105,102,105,101,100,32,
-    112,97,116,104,10,32,32,32,32,32,32,32,32,116,111,32,
-    98,121,32,116,104,101,32,112,97,116,104,32,40,115,116,114,
-    41,46,10,32,32,32,32,32,32,32,32,80,111,115,115,105,
-    98,108,101,32,107,101,121,115,58,10,32,32,32,32,32,32,
-    32,32,45,32,39,109,116,105,109,101,39,32,40,109,97,110,
-    100,97,116,111,114,121,41,32,105,115,32,116,104,101,32,110,
-    117,109,101,114,105,99,32,116,105,109,101,115,116,97,109,112,
-    32,111,102,32,108,97,115,116,32,115,111,117,114,99,101,10,
-    32,32,32,32,32,32,32,32,32,32,99,111,100,101,32,109,
-    111,100,105,102,105,99,97,116,105,111,110,59,10,32,32,32,
-    32,32,32,32,32,45,32,39,115,105,122,101,39,32,40,111,
-    112,116,105,111,110,97,108,41,32,105,115,32,116,104,101,32,
-    115,105,122,101,32,105,110,32,98,121,116,101,115,32,111,102,
-    32,116,104,101,32,115,111,117,114,99,101,32,99,111,100,101,
-    46,10,10,32,32,32,32,32,32,32,32,73,109,112,108,101,
-    109,101,110,116,105,110,103,32,116,104,105,115,32,109,101,116,
-    104,111,100,32,97,108,108,111,119,115,32,116,104,101,32,108,
-    111,97,100,101,114,32,116,111,32,114,101,97,100,32,98,121,
-    116,101,99,111,100,101,32,102,105,108,101,115,46,10,32,32,
-    32,32,32,32,32,32,117,5,0,0,0,109,116,105,109,101,
-    40,1,0,0,0,117,10,0,0,0,112,97,116,104,95,109,
-    116,105,109,101,40,2,0,0,0,117,4,0,0,0,115,101,
-    108,102,117,4,0,0,0,112,97,116,104,40,0,0,0,0,
-    40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
-    110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,10,0,0,0,112,97,116,104,
-    95,115,116,97,116,115,113,3,0,0,115,2,0,0,0,0,
-    10,117,23,0,0,0,83,111,117,114,99,101,76,111,97,100,
-    101,114,46,112,97,116,104,95,115,116,97,116,115,99,4,0,
-    0,0,0,0,0,0,4,0,0,0,3,0,0,0,67,0,
-    0,0,115,16,0,0,0,124,0,0,106,0,0,124,2,0,
-    124,3,0,131,2,0,83,40,1,0,0,0,117,228,0,0,
-    0,79,112,116,105,111,110,97,108,32,109,101,116,104,111,100,
-    32,119,104,105,99,104,32,119,114,105,116,101,115,32,100,97,
-    116,97,32,40,98,121,116,101,115,41,32,116,111,32,97,32,
-    102,105,108,101,32,112,97,116,104,32,40,97,32,115,116,114,
-    41,46,10,10,32,32,32,32,32,32,32,32,73,109,112,108,
-    101,109,101,110,116,105,110,103,32,116,104,105,115,32,109,101,
-    116,104,111,100,32,97,108,108,111,119,115,32,102,111,114,32,
-    116,104,101,32,119,114,105,116,105,110,103,32,111,102,32,98,
-    121,116,101,99,111,100,101,32,102,105,108,101,115,46,10,10,
-    32,32,32,32,32,32,32,32,84,104,101,32,115,111,117,114,
-    99,101,32,112,97,116,104,32,105,115,32,110,101,101,100,101,
-    100,32,105,110,32,111,114,100,101,114,32,116,111,32,99,111,
-    114,114,101,99,116,108,121,32,116,114,97,110,115,102,101,114,
-    32,112,101,114,109,105,115,115,105,111,110,115,10,32,32,32,
-    32,32,32,32,32,40,1,0,0,0,117,8,0,0,0,115,
-    101,116,95,100,97,116,97,40,4,0,0,0,117,4,0,0,
-    0,115,101,108,102,117,11,0,0,0,115,111,117,114,99,101,
-    95,112,97,116,104,117,10,0,0,0,99,97,99,104,101,95,
-    112,97,116,104,117,4,0,0,0,100,97,116,97,40,0,0,
+    114,111,114,40,3,0,0,0,117,4,0,0,0,115,101,108,
+    102,117,4,0,0,0,112,97,116,104,117,4,0,0,0,100,
+    97,116,97,40,0,0,0,0,40,0,0,0,0,117,29,0,
+    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
+    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
+    8,0,0,0,115,101,116,95,100,97,116,97,141,3,0,0,
+    115,2,0,0,0,0,6,117,21,0,0,0,83,111,117,114,
+    99,101,76,111,97,100,101,114,46,115,101,116,95,100,97,116,
+    97,99,2,0,0,0,0,0,0,0,9,0,0,0,44,0,
+    0,0,67,0,0,0,115,62,1,0,0,100,1,0,100,2,
+    0,108,0,0,125,2,0,124,0,0,106,1,0,124,1,0,
+    131,1,0,125,3,0,121,19,0,124,0,0,106,2,0,124,
+    3,0,131,1,0,125,4,0,87,110,58,0,4,116,3,0,
+    107,10,0,114,106,0,1,125,5,0,1,122,26,0,116,4,
+    0,100,3,0,100,4,0,124,1,0,131,1,1,124,5,0,
+    130,2,0,87,89,100,2,0,100,2,0,125,5,0,126,5,
+    0,88,110,1,0,88,116,5,0,106,6,0,124,4,0,131,
+    1,0,106,7,0,125,6,0,121,19,0,124,2,0,106,8,
+    0,124,6,0,131,1,0,125,7,0,87,110,58,0,4,116,
+    9,0,107,10,0,114,204,0,1,125,5,0,1,122,26,0,
+    116,4,0,100,5,0,100,4,0,124,1,0,131,1,1,124,
+    5,0,130,2,0,87,89,100,2,0,100,2,0,125,5,0,
+    126,5,0,88,110,1,0,88,116,5,0,106,10,0,100,2,
+    0,100,6,0,131,2,0,125,8,0,121,30,0,124,8,0,
+    106,11,0,124,4,0,106,11,0,124,7,0,100,1,0,25,
+    131,1,0,131,1,0,83,87,110,58,0,4,116,12,0,107,
+    10,0,114,57,1,1,125,5,0,1,122,26,0,116,4,0,
+    100,7,0,100,4,0,124,1,0,131,1,1,124,5,0,130,
+    2,0,87,89,100,2,0,100,2,0,125,5,0,126,5,0,
+    88,110,1,0,88,100,2,0,83,40,8,0,0,0,117,52,
+    0,0,0,67,111,110,99,114,101,116,101,32,105,109,112,108,
+    101,109,101,110,116,97,116,105,111,110,32,111,102,32,73,110,
+    115,112,101,99,116,76,111,97,100,101,114,46,103,101,116,95,
+    115,111,117,114,99,101,46,105,0,0,0,0,78,117,39,0,
+    0,0,115,111,117,114,99,101,32,110,111,116,32,97,118,97,
+    105,108,97,98,108,101,32,116,104,114,111,117,103,104,32,103,
+    101,116,95,100,97,116,97,40,41,117,4,0,0,0,110,97,
+    109,101,117,25,0,0,0,70,97,105,108,101,100,32,116,111,
+    32,100,101,116,101,99,116,32,101,110,99,111,100,105,110,103,
+    84,117,28,0,0,0,70,97,105,108,101,100,32,116,111,32,
+    100,101,99,111,100,101,32,115,111,117,114,99,101,32,102,105,
+    108,101,40,13,0,0,0,117,8,0,0,0,116,111,107,101,
+    110,105,122,101,117,12,0,0,0,103,101,116,95,102,105,108,
+    101,110,97,109,101,117,8,0,0,0,103,101,116,95,100,97,
+    116,97,117,7,0,0,0,79,83,69,114,114,111,114,117,11,
+    0,0,0,73,109,112,111,114,116,69,114,114,111,114,117,3,
+    0,0,0,95,105,111,117,7,0,0,0,66,121,116,101,115,
+    73,79,117,8,0,0,0,114,101,97,100,108,105,110,101,117,
+    15,0,0,0,100,101,116,101,99,116,95,101,110,99,111,100,
+    105,110,103,117,11,0,0,0,83,121,110,116,97,120,69,114,
+    114,111,114,117,25,0,0,0,73,110,99,114,101,109,101,110,
+    116,97,108,78,101,119,108,105,110,101,68,101,99,111,100,101,
+    114,117,6,0,0,0,100,101,99,111,100,101,117,18,0,0,
+    0,85,110,105,99,111,100,101,68,101,99,111,100,101,69,114,
+    114,111,114,40,9,0,0,0,117,4,0,0,0,115,101,108,
+    102,117,8,0,0,0,102,117,108,108,110,97,109,101,117,8,
+    0,0,0,116,111,107,101,110,105,122,101,117,4,0,0,0,
+    112,97,116,104,117,12,0,0,0,115,111,117,114,99,101,95,
+    98,121,116,101,115,117,3,0,0,0,101,120,99,117,10,0,
+    0,0,114,101,97,100,115,111,117,114,99,101,117,8,0,0,
+    0,101,110,99,111,100,105,110,103,117,15,0,0,0,110,101,
+    119,108,105,110,101,95,100,101,99,111,100,101,114,40,0,0,
     0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
     122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
-    111,111,116,115,116,114,97,112,62,117,15,0,0,0,95,99,
-    97,99,104,101,95,98,121,116,101,99,111,100,101,125,3,0,
-    0,115,2,0,0,0,0,8,117,28,0,0,0,83,111,117,
-    114,99,101,76,111,97,100,101,114,46,95,99,97,99,104,101,
-    95,98,121,116,101,99,111,100,101,99,3,0,0,0,0,0,
-    0,0,3,0,0,0,1,0,0,0,67,0,0,0,115,10,
-    0,0,0,116,0,0,130,1,0,100,1,0,83,40,2,0,
-    0,0,117,151,0,0,0,79,112,116,105,111,110,97,108,32,
-    109,101,116,104,111,100,32,119,104,105,99,104,32,119,114,105,
-    116,101,115,32,100,97,116,97,32,40,98,121,116,101,115,41,
-    32,116,111,32,97,32,102,105,108,101,32,112,97,116,104,32,
-    40,97,32,115,116,114,41,46,10,10,32,32,32,32,32,32,
-    32,32,73,109,112,108,101,109,101,110,116,105,110,103,32,116,
-    104,105,115,32,109,101,116,104,111,100,32,97,108,108,111,119,
-    115,32,102,111,114,32,116,104,101,32,119,114,105,116,105,110,
-    103,32,111,102,32,98,121,116,101,99,111,100,101,32,102,105,
-    108,101,115,46,10,10,32,32,32,32,32,32,32,32,78,40,
-    1,0,0,0,117,19,0,0,0,78,111,116,73,109,112,108,
-    101,109,101,110,116,101,100,69,114,114,111,114,40,3,0,0,
-    0,117,4,0,0,0,115,101,108,102,117,4,0,0,0,112,
-    97,116,104,117,4,0,0,0,100,97,116,97,40,0,0,0,
+    111,111,116,115,116,114,97,112,62,117,10,0,0,0,103,101,
+    116,95,115,111,117,114,99,101,150,3,0,0,115,38,0,0,
+    0,0,2,12,1,15,1,3,1,19,1,18,1,9,1,31,
+    1,18,1,3,1,19,1,18,1,9,1,31,1,18,1,3,
+    1,30,1,18,1,9,1,117,23,0,0,0,83,111,117,114,
+    99,101,76,111,97,100,101,114,46,103,101,116,95,115,111,117,
+    114,99,101,99,3,0,0,0,0,0,0,0,3,0,0,0,
+    7,0,0,0,67,0,0,0,115,25,0,0,0,116,0,0,
+    116,1,0,124,1,0,124,2,0,100,1,0,100,2,0,100,
+    3,0,131,4,1,83,40,4,0,0,0,117,130,0,0,0,
+    82,101,116,117,114,110,32,116,104,101,32,99,111,100,101,32,
+    111,98,106,101,99,116,32,99,111,109,112,105,108,101,100,32,
+    102,114,111,109,32,115,111,117,114,99,101,46,10,10,32,32,
+    32,32,32,32,32,32,84,104,101,32,39,100,97,116,97,39,
+    32,97,114,103,117,109,101,110,116,32,99,97,110,32,98,101,
+    32,97,110,121,32,111,98,106,101,99,116,32,116,121,112,101,
+    32,116,104,97,116,32,99,111,109,112,105,108,101,40,41,32,
+    115,117,112,112,111,114,116,115,46,10,32,32,32,32,32,32,
+    32,32,117,4,0,0,0,101,120,101,99,117,12,0,0,0,
+    100,111,110,116,95,105,110,104,101,114,105,116,84,40,2,0,
+    0,0,117,25,0,0,0,95,99,97,108,108,95,119,105,116,
+    104,95,102,114,97,109,101,115,95,114,101,109,111,118,101,100,
+    117,7,0,0,0,99,111,109,112,105,108,101,40,3,0,0,
+    0,117,4,0,0,0,115,101,108,102,117,4,0,0,0,100,
+    97,116,97,117,4,0,0,0,112,97,116,104,40,0,0,0,
     0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
     101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,8,0,0,0,115,101,116,
-    95,100,97,116,97,135,3,0,0,115,2,0,0,0,0,6,
+    111,116,115,116,114,97,112,62,117,14,0,0,0,115,111,117,
+    114,99,101,95,116,111,95,99,111,100,101,172,3,0,0,115,
+    4,0,0,0,0,5,18,1,117,27,0,0,0,83,111,117,
+    114,99,101,76,111,97,100,101,114,46,115,111,117,114,99,101,
+    95,116,111,95,99,111,100,101,99,2,0,0,0,0,0,0,
+    0,12,0,0,0,45,0,0,0,67,0,0,0,115,43,2,
+    0,0,124,0,0,106,0,0,124,1,0,131,1,0,125,2,
+    0,100,1,0,125,3,0,121,16,0,116,1,0,124,2,0,
+    131,1,0,125,4,0,87,110,24,0,4,116,2,0,107,10,
+    0,114,63,0,1,1,1,100,1,0,125,4,0,89,110,14,
+    1,88,121,19,0,124,0,0,106,3,0,124,2,0,131,1,
+    0,125,5,0,87,110,18,0,4,116,2,0,107,10,0,114,
+    103,0,1,1,1,89,110,230,0,88,116,4,0,124,5,0,
+    100,2,0,25,131,1,0,125,3,0,121,19,0,124,0,0,
+    106,5,0,124,4,0,131,1,0,125,6,0,87,110,18,0,
+    4,116,6,0,107,10,0,114,159,0,1,1,1,89,110,174,
+    0,88,121,28,0,124,0,0,106,7,0,124,1,0,124,6,
+    0,124,4,0,124,5,0,131,4,0,125,7,0,87,110,24,
+    0,4,116,8,0,116,9,0,102,2,0,107,10,0,114,214,
+    0,1,1,1,89,110,119,0,88,116,10,0,100,3,0,124,
+    4,0,124,2,0,131,3,0,1,116,11,0,106,12,0,124,
+    7,0,131,1,0,125,8,0,116,13,0,124,8,0,116,14,
+    0,131,2,0,114,38,1,116,15,0,106,16,0,124,8,0,
+    124,2,0,131,2,0,1,116,10,0,100,4,0,124,4,0,
+    131,2,0,1,124,8,0,83,100,5,0,125,9,0,116,8,
+    0,124,9,0,106,17,0,124,4,0,131,1,0,100,6,0,
+    124,1,0,100,7,0,124,4,0,131,1,2,130,1,0,124,
+    0,0,106,5,0,124,2,0,131,1,0,125,10,0,124,0,
+    0,106,18,0,124,10,0,124,2,0,131,2,0,125,11,0,
+    116,10,0,100,4,0,124,2,0,131,2,0,1,116,19,0,
+    106,20,0,12,114,39,2,124,4,0,100,1,0,107,9,0,
+    114,39,2,124,3,0,100,1,0,107,9,0,114,39,2,116,
+    21,0,116,22,0,131,1,0,125,6,0,124,6,0,106,23,
+    0,116,24,0,124,3,0,131,1,0,131,1,0,1,124,6,
+    0,106,23,0,116,24,0,116,25,0,124,10,0,131,1,0,
+    131,1,0,131,1,0,1,124,6,0,106,23,0,116,11,0,
+    106,26,0,124,11,0,131,1,0,131,1,0,1,121,36,0,
+    124,0,0,106,27,0,124,2,0,124,4,0,124,6,0,131,
+    3,0,1,116,10,0,100,8,0,124,4,0,131,2,0,1,
+    87,113,39,2,4,116,2,0,107,10,0,114,35,2,1,1,
+    1,89,113,39,2,88,110,0,0,124,11,0,83,40,9,0,
+    0,0,117,190,0,0,0,67,111,110,99,114,101,116,101,32,
+    105,109,112,108,101,109,101,110,116,97,116,105,111,110,32,111,
+    102,32,73,110,115,112,101,99,116,76,111,97,100,101,114,46,
+    103,101,116,95,99,111,100,101,46,10,10,32,32,32,32,32,
+    32,32,32,82,101,97,100,105,110,103,32,111,102,32,98,121,
+    116,101,99,111,100,101,32,114,101,113,117,105,114,101,115,32,
+    112,97,116,104,95,115,116,97,116,115,32,116,111,32,98,101,
+    32,105,109,112,108,101,109,101,110,116,101,100,46,32,84,111,
+    32,119,114,105,116,101,10,32,32,32,32,32,32,32,32,98,
+    121,116,101,99,111,100,101,44,32,115,101,116,95,100,97,116,
+    97,32,109,117,115,116,32,97,108,115,111,32,98,101,32,105,
+    109,112,108,101,109,101,110,116,101,100,46,10,10,32,32,32,
+    32,32,32,32,32,78,117,5,0,0,0,109,116,105,109,101,
+    117,13,0,0,0,123,125,32,109,97,116,99,104,101,115,32,
+    123,125,117,19,0,0,0,99,111,100,101,32,111,98,106,101,
+    99,116,32,102,114,111,109,32,123,125,117,21,0,0,0,78,
+    111,110,45,99,111,100,101,32,111,98,106,101,99,116,32,105,
+    110,32,123,125,117,4,0,0,0,110,97,109,101,117,4,0,
+    0,0,112,97,116,104,117,10,0,0,0,119,114,111,116,101,
+    32,123,33,114,125,40,28,0,0,0,117,12,0,0,0,103,
+    101,116,95,102,105,108,101,110,97,109,101,117,17,0,0,0,
+    99,97,99,104,101,95,102,114,111,109,95,115,111,117,114,99,
+    101,117,19,0,0,0,78,111,116,73,109,112,108,101,109,101,
+    110,116,101,100,69,114,114,111,114,117,10,0,0,0,112,97,
+    116,104,95,115,116,97,116,115,117,3,0,0,0,105,110,116,
+    117,8,0,0,0,103,101,116,95,100,97,116,97,117,7,0,
+    0,0,79,83,69,114,114,111,114,117,20,0,0,0,95,98,
+    121,116,101,115,95,102,114,111,109,95,98,121,116,101,99,111,
+    100,101,117,11,0,0,0,73,109,112,111,114,116,69,114,114,
+    111,114,117,8,0,0,0,69,79,70,69,114,114,111,114,117,
+    16,0,0,0,95,118,101,114,98,111,115,101,95,109,101,115,
+    115,97,103,101,117,7,0,0,0,109,97,114,115,104,97,108,
+    117,5,0,0,0,108,111,97,100,115,117,10,0,0,0,105,
+    115,105,110,115,116,97,110,99,101,117,10,0,0,0,95,99,
+    111,100,101,95,116,121,112,101,117,4,0,0,0,95,105,109,
+    112,117,16,0,0,0,95,102,105,120,95,99,111,95,102,105,
+    108,101,110,97,109,101,117,6,0,0,0,102,111,114,109,97,
+    116,117,14,0,0,0,115,111,117,114,99,101,95,116,111,95,
+    99,111,100,101,117,3,0,0,0,115,121,115,117,19,0,0,
+    0,100,111,110,116,95,119,114,105,116,101,95,98,121,116,101,
+    99,111,100,101,117,9,0,0,0,98,121,116,101,97,114,114,
+    97,121,117,12,0,0,0,95,77,65,71,73,67,95,66,89,
+    84,69,83,117,6,0,0,0,101,120,116,101,110,100,117,7,
+    0,0,0,95,119,95,108,111,110,103,117,3,0,0,0,108,
+    101,110,117,5,0,0,0,100,117,109,112,115,117,15,0,0,
+    0,95,99,97,99,104,101,95,98,121,116,101,99,111,100,101,
+    40,12,0,0,0,117,4,0,0,0,115,101,108,102,117,8,
+    0,0,0,102,117,108,108,110,97,109,101,117,11,0,0,0,
+    115,111,117,114,99,101,95,112,97,116,104,117,12,0,0,0,
+    115,111,117,114,99,101,95,109,116,105,109,101,117,13,0,0,
+    0,98,121,116,101,99,111,100,101,95,112,97,116,104,117,2,
+    0,0,0,115,116,117,4,0,0,0,100,97,116,97,117,10,
+    0,0,0,98,121,116,101,115,95,100,97,116,97,117,5,0,
+    0,0,102,111,117,110,100,117,3,0,0,0,109,115,103,117,
+    12,0,0,0,115,111,117,114,99,101,95,98,121,116,101,115,
+    117,11,0,0,0,99,111,100,101,95,111,98,106,101,99,116,
+    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
+    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
+    46,95,98,111,111,116,115,116,114,97,112,62,117,8,0,0,
+    0,103,101,116,95,99,111,100,101,180,3,0,0,115,94,0,
+    0,0,0,7,15,1,6,1,3,1,16,1,13,1,11,2,
+    3,1,19,1,13,1,5,2,16,1,3,1,19,1,13,1,
+    5,2,3,1,12,1,3,1,13,1,19,1,5,2,9,1,
+    7,1,15,1,15,1,16,1,6,1,7,1,4,2,6,1,
+    18,1,15,1,15,1,18,1,13,1,22,1,12,1,12,1,
+    19,1,25,1,22,1,3,1,19,1,17,1,13,1,8,1,
     117,21,0,0,0,83,111,117,114,99,101,76,111,97,100,101,
-    114,46,115,101,116,95,100,97,116,97,99,2,0,0,0,0,
-    0,0,0,9,0,0,0,44,0,0,0,67,0,0,0,115,
-    62,1,0,0,100,1,0,100,2,0,108,0,0,125,2,0,
-    124,0,0,106,1,0,124,1,0,131,1,0,125,3,0,121,
-    19,0,124,0,0,106,2,0,124,3,0,131,1,0,125,4,
-    0,87,110,58,0,4,116,3,0,107,10,0,114,106,0,1,
-    125,5,0,1,122,26,0,116,4,0,100,3,0,100,4,0,
-    124,1,0,131,1,1,124,5,0,130,2,0,87,89,100,2,
-    0,100,2,0,125,5,0,126,5,0,88,110,1,0,88,116,
-    5,0,106,6,0,124,4,0,131,1,0,106,7,0,125,6,
-    0,121,19,0,124,2,0,106,8,0,124,6,0,131,1,0,
-    125,7,0,87,110,58,0,4,116,9,0,107,10,0,114,204,
-    0,1,125,5,0,1,122,26,0,116,4,0,100,5,0,100,
-    4,0,124,1,0,131,1,1,124,5,0,130,2,0,87,89,
-    100,2,0,100,2,0,125,5,0,126,5,0,88,110,1,0,
-    88,116,5,0,106,10,0,100,2,0,100,6,0,131,2,0,
-    125,8,0,121,30,0,124,8,0,106,11,0,124,4,0,106,
-    11,0,124,7,0,100,1,0,25,131,1,0,131,1,0,83,
-    87,110,58,0,4,116,12,0,107,10,0,114,57,1,1,125,
-    5,0,1,122,26,0,116,4,0,100,7,0,100,4,0,124,
-    1,0,131,1,1,124,5,0,130,2,0,87,89,100,2,0,
-    100,2,0,125,5,0,126,5,0,88,110,1,0,88,100,2,
-    0,83,40,8,0,0,0,117,52,0,0,0,67,111,110,99,
-    114,101,116,101,32,105,109,112,108,101,109,101,110,116,97,116,
-    105,111,110,32,111,102,32,73,110,115,112,101,99,116,76,111,
-    97,100,101,114,46,103,101,116,95,115,111,117,114,99,101,46,
-    105,0,0,0,0,78,117,39,0,0,0,115,111,117,114,99,
-    101,32,110,111,116,32,97,118,97,105,108,97,98,108,101,32,
-    116,104,114,111,117,103,104,32,103,101,116,95,100,97,116,97,
-    40,41,117,4,0,0,0,110,97,109,101,117,25,0,0,0,
-    70,97,105,108,101,100,32,116,111,32,100,101,116,101,99,116,
-    32,101,110,99,111,100,105,110,103,84,117,28,0,0,0,70,
-    97,105,108,101,100,32,116,111,32,100,101,99,111,100,101,32,
-    115,111,117,114,99,101,32,102,105,108,101,40,13,0,0,0,
-    117,8,0,0,0,116,111,107,101,110,105,122,101,117,12,0,
-    0,0,103,101,116,95,102,105,108,101,110,97,109,101,117,8,
-    0,0,0,103,101,116,95,100,97,116,97,117,7,0,0,0,
-    79,83,69,114,114,111,114,117,11,0,0,0,73,109,112,111,
-    114,116,69,114,114,111,114,117,3,0,0,0,95,105,111,117,
-    7,0,0,0,66,121,116,101,115,73,79,117,8,0,0,0,
-    114,101,97,100,108,105,110,101,117,15,0,0,0,100,101,116,
-    101,99,116,95,101,110,99,111,100,105,110,103,117,11,0,0,
-    0,83,121,110,116,97,120,69,114,114,111,114,117,25,0,0,
-    0,73,110,99,114,101,109,101,110,116,97,108,78,101,119,108,
-    105,110,101,68,101,99,111,100,101,114,117,6,0,0,0,100,
-    101,99,111,100,101,117,18,0,0,0,85,110,105,99,111,100,
-    101,68,101,99,111,100,101,69,114,114,111,114,40,9,0,0,
-    0,117,4,0,0,0,115,101,108,102,117,8,0,0,0,102,
-    117,108,108,110,97,109,101,117,8,0,0,0,116,111,107,101,
-    110,105,122,101,117,4,0,0,0,112,97,116,104,117,12,0,
-    0,0,115,111,117,114,99,101,95,98,121,116,101,115,117,3,
-    0,0,0,101,120,99,117,10,0,0,0,114,101,97,100,115,
-    111,117,114,99,101,117,8,0,0,0,101,110,99,111,100,105,
-    110,103,117,15,0,0,0,110,101,119,108,105,110,101,95,100,
-    101,99,111,100,101,114,40,0,0,0,0,40,0,0,0,0,
-    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
-    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
-    112,62,117,10,0,0,0,103,101,116,95,115,111,117,114,99,
-    101,144,3,0,0,115,38,0,0,0,0,2,12,1,15,1,
-    3,1,19,1,18,1,9,1,31,1,18,1,3,1,19,1,
-    18,1,9,1,31,1,18,1,3,1,30,1,18,1,9,1,
-    117,23,0,0,0,83,111,117,114,99,101,76,111,97,100,101,
-    114,46,103,101,116,95,115,111,117,114,99,101,99,3,0,0,
-    0,0,0,0,0,3,0,0,0,7,0,0,0,67,0,0,
-    0,115,25,0,0,0,116,0,0,116,1,0,124,1,0,124,
-    2,0,100,1,0,100,2,0,100,3,0,131,4,1,83,40,
-    4,0,0,0,117,130,0,0,0,82,101,116,117,114,110,32,
-    116,104,101,32,99,111,100,101,32,111,98,106,101,99,116,32,
-    99,111,109,112,105,108,101,100,32,102,114,111,109,32,115,111,
-    117,114,99,101,46,10,10,32,32,32,32,32,32,32,32,84,
-    104,101,32,39,100,97,116,97,39,32,97,114,103,117,109,101,
-    110,116,32,99,97,110,32,98,101,32,97,110,121,32,111,98,
-    106,101,99,116,32,116,121,112,101,32,116,104,97,116,32,99,
-    111,109,112,105,108,101,40,41,32,115,117,112,112,111,114,116,
-    115,46,10,32,32,32,32,32,32,32,32,117,4,0,0,0,
-    101,120,101,99,117,12,0,0,0,100,111,110,116,95,105,110,
-    104,101,114,105,116,84,40,2,0,0,0,117,25,0,0,0,
-    95,99,97,108,108,95,119,105,116,104,95,102,114,97,109,101,
-    115,95,114,101,109,111,118,101,100,117,7,0,0,0,99,111,
-    109,112,105,108,101,40,3,0,0,0,117,4,0,0,0,115,
-    101,108,102,117,4,0,0,0,100,97,116,97,117,4,0,0,
-    0,112,97,116,104,40,0,0,0,0,40,0,0,0,0,117,
-    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
-    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,14,0,0,0,115,111,117,114,99,101,95,116,111,95,
-    99,111,100,101,166,3,0,0,115,4,0,0,0,0,5,18,
-    1,117,27,0,0,0,83,111,117,114,99,101,76,111,97,100,
-    101,114,46,115,111,117,114,99,101,95,116,111,95,99,111,100,
-    101,99,2,0,0,0,0,0,0,0,12,0,0,0,45,0,
-    0,0,67,0,0,0,115,43,2,0,0,124,0,0,106,0,
-    0,124,1,0,131,1,0,125,2,0,100,1,0,125,3,0,
-    121,16,0,116,1,0,124,2,0,131,1,0,125,4,0,87,
-    110,24,0,4,116,2,0,107,10,0,114,63,0,1,1,1,
-    100,1,0,125,4,0,89,110,14,1,88,121,19,0,124,0,
-    0,106,3,0,124,2,0,131,1,0,125,5,0,87,110,18,
-    0,4,116,2,0,107,10,0,114,103,0,1,1,1,89,110,
-    230,0,88,116,4,0,124,5,0,100,2,0,25,131,1,0,
-    125,3,0,121,19,0,124,0,0,106,5,0,124,4,0,131,
-    1,0,125,6,0,87,110,18,0,4,116,6,0,107,10,0,
-    114,159,0,1,1,1,89,110,174,0,88,121,28,0,124,0,
-    0,106,7,0,124,1,0,124,6,0,124,4,0,124,5,0,
-    131,4,0,125,7,0,87,110,24,0,4,116,8,0,116,9,
-    0,102,2,0,107,10,0,114,214,0,1,1,1,89,110,119,
-    0,88,116,10,0,100,3,0,124,4,0,124,2,0,131,3,
-    0,1,116,11,0,106,12,0,124,7,0,131,1,0,125,8,
-    0,116,13,0,124,8,0,116,14,0,131,2,0,114,38,1,
-    116,15,0,106,16,0,124,8,0,124,2,0,131,2,0,1,
-    116,10,0,100,4,0,124,4,0,131,2,0,1,124,8,0,
-    83,100,5,0,125,9,0,116,8,0,124,9,0,106,17,0,
-    124,4,0,131,1,0,100,6,0,124,1,0,100,7,0,124,
-    4,0,131,1,2,130,1,0,124,0,0,106,5,0,124,2,
-    0,131,1,0,125,10,0,124,0,0,106,18,0,124,10,0,
-    124,2,0,131,2,0,125,11,0,116,10,0,100,4,0,124,
-    2,0,131,2,0,1,116,19,0,106,20,0,12,114,39,2,
-    124,4,0,100,1,0,107,9,0,114,39,2,124,3,0,100,
-    1,0,107,9,0,114,39,2,116,21,0,116,22,0,131,1,
-    0,125,6,0,124,6,0,106,23,0,116,24,0,124,3,0,
-    131,1,0,131,1,0,1,124,6,0,106,23,0,116,24,0,
-    116,25,0,124,10,0,131,1,0,131,1,0,131,1,0,1,
-    124,6,0,106,23,0,116,11,0,106,26,0,124,11,0,131,
-    1,0,131,1,0,1,121,36,0,124,0,0,106,27,0,124,
-    2,0,124,4,0,124,6,0,131,3,0,1,116,10,0,100,
-    8,0,124,4,0,131,2,0,1,87,113,39,2,4,116,2,
-    0,107,10,0,114,35,2,1,1,1,89,113,39,2,88,110,
-    0,0,124,11,0,83,40,9,0,0,0,117,190,0,0,0,
-    67,111,110,99,114,101,116,101,32,105,109,112,108,101,109,101,
-    110,116,97,116,105,111,110,32,111,102,32,73,110,115,112,101,
-    99,116,76,111,97,100,101,114,46,103,101,116,95,99,111,100,
-    101,46,10,10,32,32,32,32,32,32,32,32,82,101,97,100,
-    105,110,103,32,111,102,32,98,121,116,101,99,111,100,101,32,
-    114,101,113,117,105,114,101,115,32,112,97,116,104,95,115,116,
-    97,116,115,32,116,111,32,98,101,32,105,109,112,108,101,109,
-    101,110,116,101,100,46,32,84,111,32,119,114,105,116,101,10,
-    32,32,32,32,32,32,32,32,98,121,116,101,99,111,100,101,
-    44,32,115,101,116,95,100,97,116,97,32,109,117,115,116,32,
-    97,108,115,111,32,98,101,32,105,109,112,108,101,109,101,110,
-    116,101,100,46,10,10,32,32,32,32,32,32,32,32,78,117,
-    5,0,0,0,109,116,105,109,101,117,13,0,0,0,123,125,
-    32,109,97,116,99,104,101,115,32,123,125,117,19,0,0,0,
-    99,111,100,101,32,111,98,106,101,99,116,32,102,114,111,109,
-    32,123,125,117,21,0,0,0,78,111,110,45,99,111,100,101,
-    32,111,98,106,101,99,116,32,105,110,32,123,125,117,4,0,
-    0,0,110,97,109,101,117,4,0,0,0,112,97,116,104,117,
-    10,0,0,0,119,114,111,116,101,32,123,33,114,125,40,28,
-    0,0,0,117,12,0,0,0,103,101,116,95,102,105,108,101,
-    110,97,109,101,117,17,0,0,0,99,97,99,104,101,95,102,
-    114,111,109,95,115,111,117,114,99,101,117,19,0,0,0,78,
-    111,116,73,109,112,108,101,109,101,110,116,101,100,69,114,114,
-    111,114,117,10,0,0,0,112,97,116,104,95,115,116,97,116,
-    115,117,3,0,0,0,105,110,116,117,8,0,0,0,103,101,
-    116,95,100,97,116,97,117,7,0,0,0,79,83,69,114,114,
-    111,114,117,20,0,0,0,95,98,121,116,101,115,95,102,114,
-    111,109,95,98,121,116,101,99,111,100,101,117,11,0,0,0,
-    73,109,112,111,114,116,69,114,114,111,114,117,8,0,0,0,
-    69,79,70,69,114,114,111,114,117,16,0,0,0,95,118,101,
-    114,98,111,115,101,95,109,101,115,115,97,103,101,117,7,0,
-    0,0,109,97,114,115,104,97,108,117,5,0,0,0,108,111,
-    97,100,115,117,10,0,0,0,105,115,105,110,115,116,97,110,
-    99,101,117,10,0,0,0,95,99,111,100,101,95,116,121,112,
-    101,117,4,0,0,0,95,105,109,112,117,16,0,0,0,95,
-    102,105,120,95,99,111,95,102,105,108,101,110,97,109,101,117,
-    6,0,0,0,102,111,114,109,97,116,117,14,0,0,0,115,
-    111,117,114,99,101,95,116,111,95,99,111,100,101,117,3,0,
-    0,0,115,121,115,117,19,0,0,0,100,111,110,116,95,119,
-    114,105,116,101,95,98,121,116,101,99,111,100,101,117,9,0,
-    0,0,98,121,116,101,97,114,114,97,121,117,12,0,0,0,
-    95,77,65,71,73,67,95,66,89,84,69,83,117,6,0,0,
-    0,101,120,116,101,110,100,117,7,0,0,0,95,119,95,108,
-    111,110,103,117,3,0,0,0,108,101,110,117,5,0,0,0,
-    100,117,109,112,115,117,15,0,0,0,95,99,97,99,104,101,
-    95,98,121,116,101,99,111,100,101,40,12,0,0,0,117,4,
-    0,0,0,115,101,108,102,117,8,0,0,0,102,117,108,108,
-    110,97,109,101,117,11,0,0,0,115,111,117,114,99,101,95,
-    112,97,116,104,117,12,0,0,0,115,111,117,114,99,101,95,
-    109,116,105,109,101,117,13,0,0,0,98,121,116,101,99,111,
-    100,101,95,112,97,116,104,117,2,0,0,0,115,116,117,4,
-    0,0,0,100,97,116,97,117,10,0,0,0,98,121,116,101,
-    115,95,100,97,116,97,117,5,0,0,0,102,111,117,110,100,
-    117,3,0,0,0,109,115,103,117,12,0,0,0,115,111,117,
-    114,99,101,95,98,121,116,101,115,117,11,0,0,0,99,111,
-    100,101,95,111,98,106,101,99,116,40,0,0,0,0,40,0,
-    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
-    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
-    116,114,97,112,62,117,8,0,0,0,103,101,116,95,99,111,
-    100,101,174,3,0,0,115,94,0,0,0,0,7,15,1,6,
-    1,3,1,16,1,13,1,11,2,3,1,19,1,13,1,5,
-    2,16,1,3,1,19,1,13,1,5,2,3,1,12,1,3,
-    1,13,1,19,1,5,2,9,1,7,1,15,1,15,1,16,
-    1,6,1,7,1,4,2,6,1,18,1,15,1,15,1,18,
-    1,13,1,22,1,12,1,12,1,19,1,25,1,22,1,3,
-    1,19,1,17,1,13,1,8,1,117,21,0,0,0,83,111,
-    117,114,99,101,76,111,97,100,101,114,46,103,101,116,95,99,
-    111,100,101,99,2,0,0,0,0,0,0,0,2,0,0,0,
-    2,0,0,0,67,0,0,0,115,13,0,0,0,124,0,0,
-    106,0,0,124,1,0,131,1,0,83,40,1,0,0,0,117,
-    0,1,0,0,67,111,110,99,114,101,116,101,32,105,109,112,
-    108,101,109,101,110,116,97,116,105,111,110,32,111,102,32,76,
-    111,97,100,101,114,46,108,111,97,100,95,109,111,100,117,108,
-    101,46,10,10,32,32,32,32,32,32,32,32,82,101,113,117,
-    105,114,101,115,32,69,120,101,99,117,116,105,111,110,76,111,
-    97,100,101,114,46,103,101,116,95,102,105,108,101,110,97,109,
-    101,32,97,110,100,32,82,101,115,111,117,114,99,101,76,111,
-    97,100,101,114,46,103,101,116,95,100,97,116,97,32,116,111,
-    32,98,101,10,32,32,32,32,32,32,32,32,105,109,112,108,
-    101,109,101,110,116,101,100,32,116,111,32,108,111,97,100,32,
-    115,111,117,114,99,101,32,99,111,100,101,46,32,85,115,101,
-    32,111,102,32,98,121,116,101,99,111,100,101,32,105,115,32,
-    100,105,99,116,97,116,101,100,32,98,121,32,119,104,101,116,
-    104,101,114,10,32,32,32,32,32,32,32,32,103,101,116,95,
-    99,111,100,101,32,117,115,101,115,47,119,114,105,116,101,115,
-    32,98,121,116,101,99,111,100,101,46,10,10,32,32,32,32,
-    32,32,32,32,40,1,0,0,0,117,12,0,0,0,95,108,
-    111,97,100,95,109,111,100,117,108,101,40,2,0,0,0,117,
-    4,0,0,0,115,101,108,102,117,8,0,0,0,102,117,108,
-    108,110,97,109,101,40,0,0,0,0,40,0,0,0,0,117,
-    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
-    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,11,0,0,0,108,111,97,100,95,109,111,100,117,108,
-    101,234,3,0,0,115,2,0,0,0,0,8,117,24,0,0,
-    0,83,111,117,114,99,101,76,111,97,100,101,114,46,108,111,
-    97,100,95,109,111,100,117,108,101,78,40,11,0,0,0,117,
-    8,0,0,0,95,95,110,97,109,101,95,95,117,10,0,0,
-    0,95,95,109,111,100,117,108,101,95,95,117,12,0,0,0,
-    95,95,113,117,97,108,110,97,109,101,95,95,117,10,0,0,
-    0,112,97,116,104,95,109,116,105,109,101,117,10,0,0,0,
-    112,97,116,104,95,115,116,97,116,115,117,15,0,0,0,95,
-    99,97,99,104,101,95,98,121,116,101,99,111,100,101,117,8,
-    0,0,0,115,101,116,95,100,97,116,97,117,10,0,0,0,
-    103,101,116,95,115,111,117,114,99,101,117,14,0,0,0,115,
-    111,117,114,99,101,95,116,111,95,99,111,100,101,117,8,0,
-    0,0,103,101,116,95,99,111,100,101,117,11,0,0,0,108,
-    111,97,100,95,109,111,100,117,108,101,40,1,0,0,0,117,
-    10,0,0,0,95,95,108,111,99,97,108,115,95,95,40,0,
-    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,12,0,0,0,83,
-    111,117,114,99,101,76,111,97,100,101,114,105,3,0,0,115,
-    16,0,0,0,16,2,12,6,12,12,12,10,12,9,12,22,
-    12,8,12,60,117,12,0,0,0,83,111,117,114,99,101,76,
-    111,97,100,101,114,99,1,0,0,0,0,0,0,0,1,0,
-    0,0,4,0,0,0,2,0,0,0,115,92,0,0,0,124,
-    0,0,69,101,0,0,90,1,0,100,0,0,90,2,0,100,
-    1,0,90,3,0,100,2,0,100,3,0,132,0,0,90,4,
-    0,101,5,0,135,0,0,102,1,0,100,4,0,100,5,0,
-    134,0,0,131,1,0,90,6,0,101,5,0,100,6,0,100,
-    7,0,132,0,0,131,1,0,90,7,0,100,8,0,100,9,
-    0,132,0,0,90,8,0,135,0,0,83,40,10,0,0,0,
-    117,10,0,0,0,70,105,108,101,76,111,97,100,101,114,117,
-    103,0,0,0,66,97,115,101,32,102,105,108,101,32,108,111,
-    97,100,101,114,32,99,108,97,115,115,32,119,104,105,99,104,
-    32,105,109,112,108,101,109,101,110,116,115,32,116,104,101,32,
-    108,111,97,100,101,114,32,112,114,111,116,111,99,111,108,32,
-    109,101,116,104,111,100,115,32,116,104,97,116,10,32,32,32,
-    32,114,101,113,117,105,114,101,32,102,105,108,101,32,115,121,
-    115,116,101,109,32,117,115,97,103,101,46,99,3,0,0,0,
-    0,0,0,0,3,0,0,0,2,0,0,0,67,0,0,0,
-    115,22,0,0,0,124,1,0,124,0,0,95,0,0,124,2,
-    0,124,0,0,95,1,0,100,1,0,83,40,2,0,0,0,
-    117,75,0,0,0,67,97,99,104,101,32,116,104,101,32,109,
-    111,100,117,108,101,32,110,97,109,101,32,97,110,100,32,116,
-    104,101,32,112,97,116,104,32,116,111,32,116,104,101,32,102,
-    105,108,101,32,102,111,117,110,100,32,98,121,32,116,104,101,
-    10,32,32,32,32,32,32,32,32,102,105,110,100,101,114,46,
-    78,40,2,0,0,0,117,4,0,0,0,110,97,109,101,117,
-    4,0,0,0,112,97,116,104,40,3,0,0,0,117,4,0,
-    0,0,115,101,108,102,117,8,0,0,0,102,117,108,108,110,
-    97,109,101,117,4,0,0,0,112,97,116,104,40,0,0,0,
+    114,46,103,101,116,95,99,111,100,101,99,2,0,0,0,0,
+    0,0,0,2,0,0,0,2,0,0,0,67,0,0,0,115,
+    13,0,0,0,124,0,0,106,0,0,124,1,0,131,1,0,
+    83,40,1,0,0,0,117,0,1,0,0,67,111,110,99,114,
+    101,116,101,32,105,109,112,108,101,109,101,110,116,97,116,105,
+    111,110,32,111,102,32,76,111,97,100,101,114,46,108,111,97,
+    100,95,109,111,100,117,108,101,46,10,10,32,32,32,32,32,
+    32,32,32,82,101,113,117,105,114,101,115,32,69,120,101,99,
+    117,116,105,111,110,76,111,97,100,101,114,46,103,101,116,95,
+    102,105,108,101,110,97,109,101,32,97,110,100,32,82,101,115,
+    111,117,114,99,101,76,111,97,100,101,114,46,103,101,116,95,
+    100,97,116,97,32,116,111,32,98,101,10,32,32,32,32,32,
+    32,32,32,105,109,112,108,101,109,101,110,116,101,100,32,116,
+    111,32,108,111,97,100,32,115,111,117,114,99,101,32,99,111,
+    100,101,46,32,85,115,101,32,111,102,32,98,121,116,101,99,
+    111,100,101,32,105,115,32,100,105,99,116,97,116,101,100,32,
+    98,121,32,119,104,101,116,104,101,114,10,32,32,32,32,32,
+    32,32,32,103,101,116,95,99,111,100,101,32,117,115,101,115,
+    47,119,114,105,116,101,115,32,98,121,116,101,99,111,100,101,
+    46,10,10,32,32,32,32,32,32,32,32,40,1,0,0,0,
+    117,12,0,0,0,95,108,111,97,100,95,109,111,100,117,108,
+    101,40,2,0,0,0,117,4,0,0,0,115,101,108,102,117,
+    8,0,0,0,102,117,108,108,110,97,109,101,40,0,0,0,
     0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
     101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,8,0,0,0,95,95,105,
-    110,105,116,95,95,250,3,0,0,115,4,0,0,0,0,3,
-    9,1,117,19,0,0,0,70,105,108,101,76,111,97,100,101,
-    114,46,95,95,105,110,105,116,95,95,99,2,0,0,0,0,
-    0,0,0,2,0,0,0,3,0,0,0,3,0,0,0,115,
-    22,0,0,0,116,0,0,116,1,0,124,0,0,131,2,0,
-    106,2,0,124,1,0,131,1,0,83,40,1,0,0,0,117,
-    26,0,0,0,76,111,97,100,32,97,32,109,111,100,117,108,
-    101,32,102,114,111,109,32,97,32,102,105,108,101,46,40,3,
-    0,0,0,117,5,0,0,0,115,117,112,101,114,117,10,0,
-    0,0,70,105,108,101,76,111,97,100,101,114,117,11,0,0,
-    0,108,111,97,100,95,109,111,100,117,108,101,40,2,0,0,
-    0,117,4,0,0,0,115,101,108,102,117,8,0,0,0,102,
-    117,108,108,110,97,109,101,40,1,0,0,0,117,9,0,0,
-    0,95,95,99,108,97,115,115,95,95,40,0,0,0,0,117,
-    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
-    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,11,0,0,0,108,111,97,100,95,109,111,100,117,108,
-    101,0,4,0,0,115,2,0,0,0,0,5,117,22,0,0,
-    0,70,105,108,101,76,111,97,100,101,114,46,108,111,97,100,
-    95,109,111,100,117,108,101,99,2,0,0,0,0,0,0,0,
-    2,0,0,0,1,0,0,0,67,0,0,0,115,7,0,0,
-    0,124,0,0,106,0,0,83,40,1,0,0,0,117,58,0,
-    0,0,82,101,116,117,114,110,32,116,104,101,32,112,97,116,
-    104,32,116,111,32,116,104,101,32,115,111,117,114,99,101,32,
-    102,105,108,101,32,97,115,32,102,111,117,110,100,32,98,121,
-    32,116,104,101,32,102,105,110,100,101,114,46,40,1,0,0,
-    0,117,4,0,0,0,112,97,116,104,40,2,0,0,0,117,
-    4,0,0,0,115,101,108,102,117,8,0,0,0,102,117,108,
-    108,110,97,109,101,40,0,0,0,0,40,0,0,0,0,117,
-    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
-    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,12,0,0,0,103,101,116,95,102,105,108,101,110,97,
-    109,101,7,4,0,0,115,2,0,0,0,0,3,117,23,0,
-    0,0,70,105,108,101,76,111,97,100,101,114,46,103,101,116,
-    95,102,105,108,101,110,97,109,101,99,2,0,0,0,0,0,
-    0,0,3,0,0,0,8,0,0,0,67,0,0,0,115,41,
-    0,0,0,116,0,0,106,1,0,124,1,0,100,1,0,131,
-    2,0,143,17,0,125,2,0,124,2,0,106,2,0,131,0,
-    0,83,87,100,2,0,81,88,100,2,0,83,40,3,0,0,
-    0,117,39,0,0,0,82,101,116,117,114,110,32,116,104,101,
-    32,100,97,116,97,32,102,114,111,109,32,112,97,116,104,32,
-    97,115,32,114,97,119,32,98,121,116,101,115,46,117,1,0,
-    0,0,114,78,40,3,0,0,0,117,3,0,0,0,95,105,
-    111,117,6,0,0,0,70,105,108,101,73,79,117,4,0,0,
-    0,114,101,97,100,40,3,0,0,0,117,4,0,0,0,115,
-    101,108,102,117,4,0,0,0,112,97,116,104,117,4,0,0,
-    0,102,105,108,101,40,0,0,0,0,40,0,0,0,0,117,
+    111,116,115,116,114,97,112,62,117,11,0,0,0,108,111,97,
+    100,95,109,111,100,117,108,101,240,3,0,0,115,2,0,0,
+    0,0,8,117,24,0,0,0,83,111,117,114,99,101,76,111,
+    97,100,101,114,46,108,111,97,100,95,109,111,100,117,108,101,
+    78,40,11,0,0,0,117,8,0,0,0,95,95,110,97,109,
+    101,95,95,117,10,0,0,0,95,95,109,111,100,117,108,101,
+    95,95,117,12,0,0,0,95,95,113,117,97,108,110,97,109,
+    101,95,95,117,10,0,0,0,112,97,116,104,95,109,116,105,
+    109,101,117,10,0,0,0,112,97,116,104,95,115,116,97,116,
+    115,117,15,0,0,0,95,99,97,99,104,101,95,98,121,116,
+    101,99,111,100,101,117,8,0,0,0,115,101,116,95,100,97,
+    116,97,117,10,0,0,0,103,101,116,95,115,111,117,114,99,
+    101,117,14,0,0,0,115,111,117,114,99,101,95,116,111,95,
+    99,111,100,101,117,8,0,0,0,103,101,116,95,99,111,100,
+    101,117,11,0,0,0,108,111,97,100,95,109,111,100,117,108,
+    101,40,1,0,0,0,117,10,0,0,0,95,95,108,111,99,
+    97,108,115,95,95,40,0,0,0,0,40,0,0,0,0,117,
     29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
     114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,8,0,0,0,103,101,116,95,100,97,116,97,12,4,
-    0,0,115,4,0,0,0,0,2,21,1,117,19,0,0,0,
-    70,105,108,101,76,111,97,100,101,114,46,103,101,116,95,100,
-    97,116,97,40,9,0,0,0,117,8,0,0,0,95,95,110,
-    97,109,101,95,95,117,10,0,0,0,95,95,109,111,100,117,
-    108,101,95,95,117,12,0,0,0,95,95,113,117,97,108,110,
-    97,109,101,95,95,117,7,0,0,0,95,95,100,111,99,95,
-    95,117,8,0,0,0,95,95,105,110,105,116,95,95,117,11,
-    0,0,0,95,99,104,101,99,107,95,110,97,109,101,117,11,
-    0,0,0,108,111,97,100,95,109,111,100,117,108,101,117,12,
-    0,0,0,103,101,116,95,102,105,108,101,110,97,109,101,117,
-    8,0,0,0,103,101,116,95,100,97,116,97,40,1,0,0,
-    0,117,10,0,0,0,95,95,108,111,99,97,108,115,95,95,
-    40,0,0,0,0,40,1,0,0,0,117,9,0,0,0,95,
-    95,99,108,97,115,115,95,95,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,10,0,0,0,70,
-    105,108,101,76,111,97,100,101,114,245,3,0,0,115,10,0,
-    0,0,16,3,6,2,12,6,24,7,18,5,117,10,0,0,
-    0,70,105,108,101,76,111,97,100,101,114,99,1,0,0,0,
-    0,0,0,0,1,0,0,0,4,0,0,0,66,0,0,0,
-    115,68,0,0,0,124,0,0,69,101,0,0,90,1,0,100,
-    0,0,90,2,0,100,1,0,90,3,0,100,2,0,100,3,
-    0,132,0,0,90,4,0,100,4,0,100,5,0,132,0,0,
-    90,5,0,100,6,0,100,7,0,100,8,0,100,9,0,132,
-    0,1,90,6,0,100,10,0,83,40,11,0,0,0,117,16,
-    0,0,0,83,111,117,114,99,101,70,105,108,101,76,111,97,
-    100,101,114,117,62,0,0,0,67,111,110,99,114,101,116,101,
-    32,105,109,112,108,101,109,101,110,116,97,116,105,111,110,32,
-    111,102,32,83,111,117,114,99,101,76,111,97,100,101,114,32,
-    117,115,105,110,103,32,116,104,101,32,102,105,108,101,32,115,
-    121,115,116,101,109,46,99,2,0,0,0,0,0,0,0,3,
-    0,0,0,3,0,0,0,67,0,0,0,115,39,0,0,0,
-    116,0,0,106,1,0,124,1,0,131,1,0,125,2,0,105,
-    2,0,124,2,0,106,2,0,100,1,0,54,124,2,0,106,
-    3,0,100,2,0,54,83,40,3,0,0,0,117,33,0,0,
-    0,82,101,116,117,114,110,32,116,104,101,32,109,101,116,97,
-    100,97,116,97,32,102,111,114,32,116,104,101,32,112,97,116,
-    104,46,117,5,0,0,0,109,116,105,109,101,117,4,0,0,
-    0,115,105,122,101,40,4,0,0,0,117,3,0,0,0,95,
-    111,115,117,4,0,0,0,115,116,97,116,117,8,0,0,0,
-    115,116,95,109,116,105,109,101,117,7,0,0,0,115,116,95,
-    115,105,122,101,40,3,0,0,0,117,4,0,0,0,115,101,
-    108,102,117,4,0,0,0,112,97,116,104,117,2,0,0,0,
-    115,116,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
-    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
-    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,10,
-    0,0,0,112,97,116,104,95,115,116,97,116,115,22,4,0,
-    0,115,4,0,0,0,0,2,15,1,117,27,0,0,0,83,
-    111,117,114,99,101,70,105,108,101,76,111,97,100,101,114,46,
-    112,97,116,104,95,115,116,97,116,115,99,4,0,0,0,0,
-    0,0,0,5,0,0,0,13,0,0,0,67,0,0,0,115,
-    81,0,0,0,121,22,0,116,0,0,106,1,0,124,1,0,
-    131,1,0,106,2,0,125,4,0,87,110,24,0,4,116,3,
-    0,107,10,0,114,48,0,1,1,1,100,1,0,125,4,0,
-    89,110,1,0,88,124,4,0,100,2,0,79,125,4,0,124,
-    0,0,106,4,0,124,2,0,124,3,0,100,3,0,124,4,
-    0,131,2,1,83,40,4,0,0,0,78,105,182,1,0,0,
-    105,128,0,0,0,117,5,0,0,0,95,109,111,100,101,40,
-    5,0,0,0,117,3,0,0,0,95,111,115,117,4,0,0,
-    0,115,116,97,116,117,7,0,0,0,115,116,95,109,111,100,
-    101,117,7,0,0,0,79,83,69,114,114,111,114,117,8,0,
-    0,0,115,101,116,95,100,97,116,97,40,5,0,0,0,117,
-    4,0,0,0,115,101,108,102,117,11,0,0,0,115,111,117,
-    114,99,101,95,112,97,116,104,117,13,0,0,0,98,121,116,
-    101,99,111,100,101,95,112,97,116,104,117,4,0,0,0,100,
-    97,116,97,117,4,0,0,0,109,111,100,101,40,0,0,0,
+    62,117,12,0,0,0,83,111,117,114,99,101,76,111,97,100,
+    101,114,111,3,0,0,115,16,0,0,0,16,2,12,6,12,
+    12,12,10,12,9,12,22,12,8,12,60,117,12,0,0,0,
+    83,111,117,114,99,101,76,111,97,100,101,114,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,4,0,0,0,2,0,0,
+    0,115,92,0,0,0,124,0,0,69,101,0,0,90,1,0,
+    100,0,0,90,2,0,100,1,0,90,3,0,100,2,0,100,
+    3,0,132,0,0,90,4,0,101,5,0,135,0,0,102,1,
+    0,100,4,0,100,5,0,134,0,0,131,1,0,90,6,0,
+    101,5,0,100,6,0,100,7,0,132,0,0,131,1,0,90,
+    7,0,100,8,0,100,9,0,132,0,0,90,8,0,135,0,
+    0,83,40,10,0,0,0,117,10,0,0,0,70,105,108,101,
+    76,111,97,100,101,114,117,103,0,0,0,66,97,115,101,32,
+    102,105,108,101,32,108,111,97,100,101,114,32,99,108,97,115,
+    115,32,119,104,105,99,104,32,105,109,112,108,101,109,101,110,
+    116,115,32,116,104,101,32,108,111,97,100,101,114,32,112,114,
+    111,116,111,99,111,108,32,109,101,116,104,111,100,115,32,116,
+    104,97,116,10,32,32,32,32,114,101,113,117,105,114,101,32,
+    102,105,108,101,32,115,121,115,116,101,109,32,117,115,97,103,
+    101,46,99,3,0,0,0,0,0,0,0,3,0,0,0,2,
+    0,0,0,67,0,0,0,115,22,0,0,0,124,1,0,124,
+    0,0,95,0,0,124,2,0,124,0,0,95,1,0,100,1,
+    0,83,40,2,0,0,0,117,75,0,0,0,67,97,99,104,
+    101,32,116,104,101,32,109,111,100,117,108,101,32,110,97,109,
+    101,32,97,110,100,32,116,104,101,32,112,97,116,104,32,116,
+    111,32,116,104,101,32,102,105,108,101,32,102,111,117,110,100,
+    32,98,121,32,116,104,101,10,32,32,32,32,32,32,32,32,
+    102,105,110,100,101,114,46,78,40,2,0,0,0,117,4,0,
+    0,0,110,97,109,101,117,4,0,0,0,112,97,116,104,40,
+    3,0,0,0,117,4,0,0,0,115,101,108,102,117,8,0,
+    0,0,102,117,108,108,110,97,109,101,117,4,0,0,0,112,
+    97,116,104,40,0,0,0,0,40,0,0,0,0,117,29,0,
+    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
+    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
+    8,0,0,0,95,95,105,110,105,116,95,95,0,4,0,0,
+    115,4,0,0,0,0,3,9,1,117,19,0,0,0,70,105,
+    108,101,76,111,97,100,101,114,46,95,95,105,110,105,116,95,
+    95,99,2,0,0,0,0,0,0,0,2,0,0,0,3,0,
+    0,0,3,0,0,0,115,22,0,0,0,116,0,0,116,1,
+    0,124,0,0,131,2,0,106,2,0,124,1,0,131,1,0,
+    83,40,1,0,0,0,117,26,0,0,0,76,111,97,100,32,
+    97,32,109,111,100,117,108,101,32,102,114,111,109,32,97,32,
+    102,105,108,101,46,40,3,0,0,0,117,5,0,0,0,115,
+    117,112,101,114,117,10,0,0,0,70,105,108,101,76,111,97,
+    100,101,114,117,11,0,0,0,108,111,97,100,95,109,111,100,
+    117,108,101,40,2,0,0,0,117,4,0,0,0,115,101,108,
+    102,117,8,0,0,0,102,117,108,108,110,97,109,101,40,1,
+    0,0,0,117,9,0,0,0,95,95,99,108,97,115,115,95,
+    95,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
+    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
+    111,116,115,116,114,97,112,62,117,11,0,0,0,108,111,97,
+    100,95,109,111,100,117,108,101,6,4,0,0,115,2,0,0,
+    0,0,5,117,22,0,0,0,70,105,108,101,76,111,97,100,
+    101,114,46,108,111,97,100,95,109,111,100,117,108,101,99,2,
+    0,0,0,0,0,0,0,2,0,0,0,1,0,0,0,67,
+    0,0,0,115,7,0,0,0,124,0,0,106,0,0,83,40,
+    1,0,0,0,117,58,0,0,0,82,101,116,117,114,110,32,
+    116,104,101,32,112,97,116,104,32,116,111,32,116,104,101,32,
+    115,111,117,114,99,101,32,102,105,108,101,32,97,115,32,102,
+    111,117,110,100,32,98,121,32,116,104,101,32,102,105,110,100,
+    101,114,46,40,1,0,0,0,117,4,0,0,0,112,97,116,
+    104,40,2,0,0,0,117,4,0,0,0,115,101,108,102,117,
+    8,0,0,0,102,117,108,108,110,97,109,101,40,0,0,0,
     0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
     101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,15,0,0,0,95,99,97,
-    99,104,101,95,98,121,116,101,99,111,100,101,27,4,0,0,
-    115,12,0,0,0,0,2,3,1,22,1,13,1,11,3,10,
-    1,117,32,0,0,0,83,111,117,114,99,101,70,105,108,101,
-    76,111,97,100,101,114,46,95,99,97,99,104,101,95,98,121,
-    116,101,99,111,100,101,117,5,0,0,0,95,109,111,100,101,
-    105,182,1,0,0,99,3,0,0,0,1,0,0,0,9,0,
-    0,0,18,0,0,0,67,0,0,0,115,53,1,0,0,116,
-    0,0,124,1,0,131,1,0,92,2,0,125,4,0,125,5,
-    0,103,0,0,125,6,0,120,54,0,124,4,0,114,80,0,
-    116,1,0,124,4,0,131,1,0,12,114,80,0,116,0,0,
-    124,4,0,131,1,0,92,2,0,125,4,0,125,7,0,124,
-    6,0,106,2,0,124,7,0,131,1,0,1,113,27,0,87,
-    120,132,0,116,3,0,124,6,0,131,1,0,68,93,118,0,
-    125,7,0,116,4,0,124,4,0,124,7,0,131,2,0,125,
-    4,0,121,17,0,116,5,0,106,6,0,124,4,0,131,1,
-    0,1,87,113,94,0,4,116,7,0,107,10,0,114,155,0,
-    1,1,1,119,94,0,89,113,94,0,4,116,8,0,107,10,
-    0,114,211,0,1,125,8,0,1,122,25,0,116,9,0,100,
-    1,0,124,4,0,124,8,0,131,3,0,1,100,2,0,83,
-    87,89,100,2,0,100,2,0,125,8,0,126,8,0,88,113,
-    94,0,88,113,94,0,87,121,33,0,116,10,0,124,1,0,
-    124,2,0,124,3,0,131,3,0,1,116,9,0,100,3,0,
-    124,1,0,131,2,0,1,87,110,53,0,4,116,8,0,107,
-    10,0,114,48,1,1,125,8,0,1,122,21,0,116,9,0,
-    100,1,0,124,1,0,124,8,0,131,3,0,1,87,89,100,
-    2,0,100,2,0,125,8,0,126,8,0,88,110,1,0,88,
-    100,2,0,83,40,4,0,0,0,117,27,0,0,0,87,114,
-    105,116,101,32,98,121,116,101,115,32,100,97,116,97,32,116,
-    111,32,97,32,102,105,108,101,46,117,27,0,0,0,99,111,
-    117,108,100,32,110,111,116,32,99,114,101,97,116,101,32,123,
-    33,114,125,58,32,123,33,114,125,78,117,12,0,0,0,99,
-    114,101,97,116,101,100,32,123,33,114,125,40,11,0,0,0,
-    117,11,0,0,0,95,112,97,116,104,95,115,112,108,105,116,
-    117,11,0,0,0,95,112,97,116,104,95,105,115,100,105,114,
-    117,6,0,0,0,97,112,112,101,110,100,117,8,0,0,0,
-    114,101,118,101,114,115,101,100,117,10,0,0,0,95,112,97,
-    116,104,95,106,111,105,110,117,3,0,0,0,95,111,115,117,
-    5,0,0,0,109,107,100,105,114,117,15,0,0,0,70,105,
-    108,101,69,120,105,115,116,115,69,114,114,111,114,117,7,0,
-    0,0,79,83,69,114,114,111,114,117,16,0,0,0,95,118,
-    101,114,98,111,115,101,95,109,101,115,115,97,103,101,117,13,
-    0,0,0,95,119,114,105,116,101,95,97,116,111,109,105,99,
-    40,9,0,0,0,117,4,0,0,0,115,101,108,102,117,4,
-    0,0,0,112,97,116,104,117,4,0,0,0,100,97,116,97,
-    117,5,0,0,0,95,109,111,100,101,117,6,0,0,0,112,
-    97,114,101,110,116,117,8,0,0,0,102,105,108,101,110,97,
-    109,101,117,10,0,0,0,112,97,116,104,95,112,97,114,116,
-    115,117,4,0,0,0,112,97,114,116,117,3,0,0,0,101,
-    120,99,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
-    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
-    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,8,
-    0,0,0,115,101,116,95,100,97,116,97,38,4,0,0,115,
-    38,0,0,0,0,2,18,1,6,2,22,1,18,1,17,2,
-    19,1,15,1,3,1,17,1,13,2,7,1,18,3,16,1,
-    27,1,3,1,16,1,17,1,18,2,117,25,0,0,0,83,
-    111,117,114,99,101,70,105,108,101,76,111,97,100,101,114,46,
-    115,101,116,95,100,97,116,97,78,40,7,0,0,0,117,8,
-    0,0,0,95,95,110,97,109,101,95,95,117,10,0,0,0,
-    95,95,109,111,100,117,108,101,95,95,117,12,0,0,0,95,
-    95,113,117,97,108,110,97,109,101,95,95,117,7,0,0,0,
-    95,95,100,111,99,95,95,117,10,0,0,0,112,97,116,104,
-    95,115,116,97,116,115,117,15,0,0,0,95,99,97,99,104,
-    101,95,98,121,116,101,99,111,100,101,117,8,0,0,0,115,
-    101,116,95,100,97,116,97,40,1,0,0,0,117,10,0,0,
-    0,95,95,108,111,99,97,108,115,95,95,40,0,0,0,0,
-    40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
-    110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,16,0,0,0,83,111,117,114,
-    99,101,70,105,108,101,76,111,97,100,101,114,18,4,0,0,
-    115,8,0,0,0,16,2,6,2,12,5,12,11,117,16,0,
-    0,0,83,111,117,114,99,101,70,105,108,101,76,111,97,100,
-    101,114,99,1,0,0,0,0,0,0,0,1,0,0,0,2,
-    0,0,0,66,0,0,0,115,62,0,0,0,124,0,0,69,
+    111,116,115,116,114,97,112,62,117,12,0,0,0,103,101,116,
+    95,102,105,108,101,110,97,109,101,13,4,0,0,115,2,0,
+    0,0,0,3,117,23,0,0,0,70,105,108,101,76,111,97,
+    100,101,114,46,103,101,116,95,102,105,108,101,110,97,109,101,
+    99,2,0,0,0,0,0,0,0,3,0,0,0,8,0,0,
+    0,67,0,0,0,115,41,0,0,0,116,0,0,106,1,0,
+    124,1,0,100,1,0,131,2,0,143,17,0,125,2,0,124,
+    2,0,106,2,0,131,0,0,83,87,100,2,0,81,88,100,
+    2,0,83,40,3,0,0,0,117,39,0,0,0,82,101,116,
+    117,114,110,32,116,104,101,32,100,97,116,97,32,102,114,111,
+    109,32,112,97,116,104,32,97,115,32,114,97,119,32,98,121,
+    116,101,115,46,117,1,0,0,0,114,78,40,3,0,0,0,
+    117,3,0,0,0,95,105,111,117,6,0,0,0,70,105,108,
+    101,73,79,117,4,0,0,0,114,101,97,100,40,3,0,0,
+    0,117,4,0,0,0,115,101,108,102,117,4,0,0,0,112,
+    97,116,104,117,4,0,0,0,102,105,108,101,40,0,0,0,
+    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
+    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
+    111,116,115,116,114,97,112,62,117,8,0,0,0,103,101,116,
+    95,100,97,116,97,18,4,0,0,115,4,0,0,0,0,2,
+    21,1,117,19,0,0,0,70,105,108,101,76,111,97,100,101,
+    114,46,103,101,116,95,100,97,116,97,40,9,0,0,0,117,
+    8,0,0,0,95,95,110,97,109,101,95,95,117,10,0,0,
+    0,95,95,109,111,100,117,108,101,95,95,117,12,0,0,0,
+    95,95,113,117,97,108,110,97,109,101,95,95,117,7,0,0,
+    0,95,95,100,111,99,95,95,117,8,0,0,0,95,95,105,
+    110,105,116,95,95,117,11,0,0,0,95,99,104,101,99,107,
+    95,110,97,109,101,117,11,0,0,0,108,111,97,100,95,109,
+    111,100,117,108,101,117,12,0,0,0,103,101,116,95,102,105,
+    108,101,110,97,109,101,117,8,0,0,0,103,101,116,95,100,
+    97,116,97,40,1,0,0,0,117,10,0,0,0,95,95,108,
+    111,99,97,108,115,95,95,40,0,0,0,0,40,1,0,0,
+    0,117,9,0,0,0,95,95,99,108,97,115,115,95,95,117,
+    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
+    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
+    62,117,10,0,0,0,70,105,108,101,76,111,97,100,101,114,
+    251,3,0,0,115,10,0,0,0,16,3,6,2,12,6,24,
+    7,18,5,117,10,0,0,0,70,105,108,101,76,111,97,100,
+    101,114,99,1,0,0,0,0,0,0,0,1,0,0,0,4,
+    0,0,0,66,0,0,0,115,68,0,0,0,124,0,0,69,
     101,0,0,90,1,0,100,0,0,90,2,0,100,1,0,90,
     3,0,100,2,0,100,3,0,132,0,0,90,4,0,100,4,
     0,100,5,0,132,0,0,90,5,0,100,6,0,100,7,0,
-    132,0,0,90,6,0,100,8,0,83,40,9,0,0,0,117,
-    20,0,0,0,83,111,117,114,99,101,108,101,115,115,70,105,
-    108,101,76,111,97,100,101,114,117,45,0,0,0,76,111,97,
-    100,101,114,32,119,104,105,99,104,32,104,97,110,100,108,101,
-    115,32,115,111,117,114,99,101,108,101,115,115,32,102,105,108,
-    101,32,105,109,112,111,114,116,115,46,99,2,0,0,0,0,
-    0,0,0,2,0,0,0,4,0,0,0,67,0,0,0,115,
-    19,0,0,0,124,0,0,106,0,0,124,1,0,100,1,0,
-    100,2,0,131,1,1,83,40,3,0,0,0,78,117,10,0,
-    0,0,115,111,117,114,99,101,108,101,115,115,84,40,1,0,
-    0,0,117,12,0,0,0,95,108,111,97,100,95,109,111,100,
-    117,108,101,40,2,0,0,0,117,4,0,0,0,115,101,108,
-    102,117,8,0,0,0,102,117,108,108,110,97,109,101,40,0,
-    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,11,0,0,0,108,
-    111,97,100,95,109,111,100,117,108,101,71,4,0,0,115,2,
-    0,0,0,0,1,117,32,0,0,0,83,111,117,114,99,101,
-    108,101,115,115,70,105,108,101,76,111,97,100,101,114,46,108,
-    111,97,100,95,109,111,100,117,108,101,99,2,0,0,0,0,
-    0,0,0,6,0,0,0,6,0,0,0,67,0,0,0,115,
-    138,0,0,0,124,0,0,106,0,0,124,1,0,131,1,0,
-    125,2,0,124,0,0,106,1,0,124,2,0,131,1,0,125,
-    3,0,124,0,0,106,2,0,124,1,0,124,3,0,124,2,
-    0,100,0,0,131,4,0,125,4,0,116,3,0,106,4,0,
-    124,4,0,131,1,0,125,5,0,116,5,0,124,5,0,116,
-    6,0,131,2,0,114,101,0,116,7,0,100,1,0,124,2,
-    0,131,2,0,1,124,5,0,83,116,8,0,100,2,0,106,
-    9,0,124,2,0,131,1,0,100,3,0,124,1,0,100,4,
-    0,124,2,0,131,1,2,130,1,0,100,0,0,83,40,5,
-    0,0,0,78,117,21,0,0,0,99,111,100,101,32,111,98,
-    106,101,99,116,32,102,114,111,109,32,123,33,114,125,117,21,
-    0,0,0,78,111,110,45,99,111,100,101,32,111,98,106,101,
-    99,116,32,105,110,32,123,125,117,4,0,0,0,110,97,109,
-    101,117,4,0,0,0,112,97,116,104,40,10,0,0,0,117,
-    12,0,0,0,103,101,116,95,102,105,108,101,110,97,109,101,
-    117,8,0,0,0,103,101,116,95,100,97,116,97,117,20,0,
-    0,0,95,98,121,116,101,115,95,102,114,111,109,95,98,121,
-    116,101,99,111,100,101,117,7,0,0,0,109,97,114,115,104,
-    97,108,117,5,0,0,0,108,111,97,100,115,117,10,0,0,
-    0,105,115,105,110,115,116,97,110,99,101,117,10,0,0,0,
-    95,99,111,100,101,95,116,121,112,101,117,16,0,0,0,95,
-    118,101,114,98,111,115,101,95,109,101,115,115,97,103,101,117,
-    11,0,0,0,73,109,112,111,114,116,69,114,114,111,114,117,
-    6,0,0,0,102,111,114,109,97,116,40,6,0,0,0,117,
-    4,0,0,0,115,101,108,102,117,8,0,0,0,102,117,108,
-    108,110,97,109,101,117,4,0,0,0,112,97,116,104,117,4,
-    0,0,0,100,97,116,97,117,10,0,0,0,98,121,116,101,
-    115,95,100,97,116,97,117,5,0,0,0,102,111,117,110,100,
-    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
-    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
-    46,95,98,111,111,116,115,116,114,97,112,62,117,8,0,0,
-    0,103,101,116,95,99,111,100,101,74,4,0,0,115,18,0,
-    0,0,0,1,15,1,15,1,24,1,15,1,15,1,13,1,
-    4,2,18,1,117,29,0,0,0,83,111,117,114,99,101,108,
-    101,115,115,70,105,108,101,76,111,97,100,101,114,46,103,101,
-    116,95,99,111,100,101,99,2,0,0,0,0,0,0,0,2,
-    0,0,0,1,0,0,0,67,0,0,0,115,4,0,0,0,
-    100,1,0,83,40,2,0,0,0,117,39,0,0,0,82,101,
-    116,117,114,110,32,78,111,110,101,32,97,115,32,116,104,101,
-    114,101,32,105,115,32,110,111,32,115,111,117,114,99,101,32,
-    99,111,100,101,46,78,40,0,0,0,0,40,2,0,0,0,
-    117,4,0,0,0,115,101,108,102,117,8,0,0,0,102,117,
-    108,108,110,97,109,101,40,0,0,0,0,40,0,0,0,0,
+    100,8,0,100,9,0,132,0,1,90,6,0,100,10,0,83,
+    40,11,0,0,0,117,16,0,0,0,83,111,117,114,99,101,
+    70,105,108,101,76,111,97,100,101,114,117,62,0,0,0,67,
+    111,110,99,114,101,116,101,32,105,109,112,108,101,109,101,110,
+    116,97,116,105,111,110,32,111,102,32,83,111,117,114,99,101,
+    76,111,97,100,101,114,32,117,115,105,110,103,32,116,104,101,
+    32,102,105,108,101,32,115,121,115,116,101,109,46,99,2,0,
+    0,0,0,0,0,0,3,0,0,0,3,0,0,0,67,0,
+    0,0,115,39,0,0,0,116,0,0,106,1,0,124,1,0,
+    131,1,0,125,2,0,105,2,0,124,2,0,106,2,0,100,
+    1,0,54,124,2,0,106,3,0,100,2,0,54,83,40,3,
+    0,0,0,117,33,0,0,0,82,101,116,117,114,110,32,116,
+    104,101,32,109,101,116,97,100,97,116,97,32,102,111,114,32,
+    116,104,101,32,112,97,116,104,46,117,5,0,0,0,109,116,
+    105,109,101,117,4,0,0,0,115,105,122,101,40,4,0,0,
+    0,117,3,0,0,0,95,111,115,117,4,0,0,0,115,116,
+    97,116,117,8,0,0,0,115,116,95,109,116,105,109,101,117,
+    7,0,0,0,115,116,95,115,105,122,101,40,3,0,0,0,
+    117,4,0,0,0,115,101,108,102,117,4,0,0,0,112,97,
+    116,104,117,2,0,0,0,115,116,40,0,0,0,0,40,0,
+    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
+    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
+    116,114,97,112,62,117,10,0,0,0,112,97,116,104,95,115,
+    116,97,116,115,28,4,0,0,115,4,0,0,0,0,2,15,
+    1,117,27,0,0,0,83,111,117,114,99,101,70,105,108,101,
+    76,111,97,100,101,114,46,112,97,116,104,95,115,116,97,116,
+    115,99,4,0,0,0,0,0,0,0,5,0,0,0,13,0,
+    0,0,67,0,0,0,115,81,0,0,0,121,22,0,116,0,
+    0,106,1,0,124,1,0,131,1,0,106,2,0,125,4,0,
+    87,110,24,0,4,116,3,0,107,10,0,114,48,0,1,1,
+    1,100,1,0,125,4,0,89,110,1,0,88,124,4,0,100,
+    2,0,79,125,4,0,124,0,0,106,4,0,124,2,0,124,
+    3,0,100,3,0,124,4,0,131,2,1,83,40,4,0,0,
+    0,78,105,182,1,0,0,105,128,0,0,0,117,5,0,0,
+    0,95,109,111,100,101,40,5,0,0,0,117,3,0,0,0,
+    95,111,115,117,4,0,0,0,115,116,97,116,117,7,0,0,
+    0,115,116,95,109,111,100,101,117,7,0,0,0,79,83,69,
+    114,114,111,114,117,8,0,0,0,115,101,116,95,100,97,116,
+    97,40,5,0,0,0,117,4,0,0,0,115,101,108,102,117,
+    11,0,0,0,115,111,117,114,99,101,95,112,97,116,104,117,
+    13,0,0,0,98,121,116,101,99,111,100,101,95,112,97,116,
+    104,117,4,0,0,0,100,97,116,97,117,4,0,0,0,109,
+    111,100,101,40,0,0,0,0,40,0,0,0,0,117,29,0,
+    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
+    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
+    15,0,0,0,95,99,97,99,104,101,95,98,121,116,101,99,
+    111,100,101,33,4,0,0,115,12,0,0,0,0,2,3,1,
+    22,1,13,1,11,3,10,1,117,32,0,0,0,83,111,117,
+    114,99,101,70,105,108,101,76,111,97,100,101,114,46,95,99,
+    97,99,104,101,95,98,121,116,101,99,111,100,101,117,5,0,
+    0,0,95,109,111,100,101,105,182,1,0,0,99,3,0,0,
+    0,1,0,0,0,9,0,0,0,18,0,0,0,67,0,0,
+    0,115,53,1,0,0,116,0,0,124,1,0,131,1,0,92,
+    2,0,125,4,0,125,5,0,103,0,0,125,6,0,120,54,
+    0,124,4,0,114,80,0,116,1,0,124,4,0,131,1,0,
+    12,114,80,0,116,0,0,124,4,0,131,1,0,92,2,0,
+    125,4,0,125,7,0,124,6,0,106,2,0,124,7,0,131,
+    1,0,1,113,27,0,87,120,132,0,116,3,0,124,6,0,
+    131,1,0,68,93,118,0,125,7,0,116,4,0,124,4,0,
+    124,7,0,131,2,0,125,4,0,121,17,0,116,5,0,106,
+    6,0,124,4,0,131,1,0,1,87,113,94,0,4,116,7,
+    0,107,10,0,114,155,0,1,1,1,119,94,0,89,113,94,
+    0,4,116,8,0,107,10,0,114,211,0,1,125,8,0,1,
+    122,25,0,116,9,0,100,1,0,124,4,0,124,8,0,131,
+    3,0,1,100,2,0,83,87,89,100,2,0,100,2,0,125,
+    8,0,126,8,0,88,113,94,0,88,113,94,0,87,121,33,
+    0,116,10,0,124,1,0,124,2,0,124,3,0,131,3,0,
+    1,116,9,0,100,3,0,124,1,0,131,2,0,1,87,110,
+    53,0,4,116,8,0,107,10,0,114,48,1,1,125,8,0,
+    1,122,21,0,116,9,0,100,1,0,124,1,0,124,8,0,
+    131,3,0,1,87,89,100,2,0,100,2,0,125,8,0,126,
+    8,0,88,110,1,0,88,100,2,0,83,40,4,0,0,0,
+    117,27,0,0,0,87,114,105,116,101,32,98,121,116,101,115,
+    32,100,97,116,97,32,116,111,32,97,32,102,105,108,101,46,
+    117,27,0,0,0,99,111,117,108,100,32,110,111,116,32,99,
+    114,101,97,116,101,32,123,33,114,125,58,32,123,33,114,125,
+    78,117,12,0,0,0,99,114,101,97,116,101,100,32,123,33,
+    114,125,40,11,0,0,0,117,11,0,0,0,95,112,97,116,
+    104,95,115,112,108,105,116,117,11,0,0,0,95,112,97,116,
+    104,95,105,115,100,105,114,117,6,0,0,0,97,112,112,101,
+    110,100,117,8,0,0,0,114,101,118,101,114,115,101,100,117,
+    10,0,0,0,95,112,97,116,104,95,106,111,105,110,117,3,
+    0,0,0,95,111,115,117,5,0,0,0,109,107,100,105,114,
+    117,15,0,0,0,70,105,108,101,69,120,105,115,116,115,69,
+    114,114,111,114,117,7,0,0,0,79,83,69,114,114,111,114,
+    117,16,0,0,0,95,118,101,114,98,111,115,101,95,109,101,
+    115,115,97,103,101,117,13,0,0,0,95,119,114,105,116,101,
+    95,97,116,111,109,105,99,40,9,0,0,0,117,4,0,0,
+    0,115,101,108,102,117,4,0,0,0,112,97,116,104,117,4,
+    0,0,0,100,97,116,97,117,5,0,0,0,95,109,111,100,
+    101,117,6,0,0,0,112,97,114,101,110,116,117,8,0,0,
+    0,102,105,108,101,110,97,109,101,117,10,0,0,0,112,97,
+    116,104,95,112,97,114,116,115,117,4,0,0,0,112,97,114,
+    116,117,3,0,0,0,101,120,99,40,0,0,0,0,40,0,
+    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
+    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
+    116,114,97,112,62,117,8,0,0,0,115,101,116,95,100,97,
+    116,97,44,4,0,0,115,38,0,0,0,0,2,18,1,6,
+    2,22,1,18,1,17,2,19,1,15,1,3,1,17,1,13,
+    2,7,1,18,3,16,1,27,1,3,1,16,1,17,1,18,
+    2,117,25,0,0,0,83,111,117,114,99,101,70,105,108,101,
+    76,111,97,100,101,114,46,115,101,116,95,100,97,116,97,78,
+    40,7,0,0,0,117,8,0,0,0,95,95,110,97,109,101,
+    95,95,117,10,0,0,0,95,95,109,111,100,117,108,101,95,
+    95,117,12,0,0,0,95,95,113,117,97,108,110,97,109,101,
+    95,95,117,7,0,0,0,95,95,100,111,99,95,95,117,10,
+    0,0,0,112,97,116,104,95,115,116,97,116,115,117,15,0,
+    0,0,95,99,97,99,104,101,95,98,121,116,101,99,111,100,
+    101,117,8,0,0,0,115,101,116,95,100,97,116,97,40,1,
+    0,0,0,117,10,0,0,0,95,95,108,111,99,97,108,115,
+    95,95,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,16,
+    0,0,0,83,111,117,114,99,101,70,105,108,101,76,111,97,
+    100,101,114,24,4,0,0,115,8,0,0,0,16,2,6,2,
+    12,5,12,11,117,16,0,0,0,83,111,117,114,99,101,70,
+    105,108,101,76,111,97,100,101,114,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,3,0,0,0,2,0,0,0,115,80,
+    0,0,0,124,0,0,69,101,0,0,90,1,0,100,0,0,
+    90,2,0,100,1,0,90,3,0,100,2,0,100,3,0,132,
+    0,0,90,4,0,135,0,0,102,1,0,100,4,0,100,5,
+    0,134,0,0,90,5,0,100,6,0,100,7,0,132,0,0,
+    90,6,0,100,8,0,100,9,0,132,0,0,90,7,0,135,
+    0,0,83,40,10,0,0,0,117,20,0,0,0,83,111,117,
+    114,99,101,108,101,115,115,70,105,108,101,76,111,97,100,101,
+    114,117,45,0,0,0,76,111,97,100,101,114,32,119,104,105,
+    99,104,32,104,97,110,100,108,101,115,32,115,111,117,114,99,
+    101,108,101,115,115,32,102,105,108,101,32,105,109,112,111,114,
+    116,115,46,99,2,0,0,0,0,0,0,0,2,0,0,0,
+    2,0,0,0,67,0,0,0,115,13,0,0,0,124,0,0,
+    106,0,0,124,1,0,131,1,0,83,40,1,0,0,0,78,
+    40,1,0,0,0,117,12,0,0,0,95,108,111,97,100,95,
+    109,111,100,117,108,101,40,2,0,0,0,117,4,0,0,0,
+    115,101,108,102,117,8,0,0,0,102,117,108,108,110,97,109,
+    101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,11,0,
+    0,0,108,111,97,100,95,109,111,100,117,108,101,77,4,0,
+    0,115,2,0,0,0,0,1,117,32,0,0,0,83,111,117,
+    114,99,101,108,101,115,115,70,105,108,101,76,111,97,100,101,
+    114,46,108,111,97,100,95,109,111,100,117,108,101,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,2,0,0,0,3,0,
+    0,0,115,32,0,0,0,116,0,0,131,0,0,106,1,0,
+    124,1,0,131,1,0,1,124,1,0,106,2,0,124,1,0,
+    95,3,0,100,0,0,83,40,1,0,0,0,78,40,4,0,
+    0,0,117,5,0,0,0,115,117,112,101,114,117,18,0,0,
+    0,95,105,110,105,116,95,109,111,100,117,108,101,95,97,116,
+    116,114,115,117,8,0,0,0,95,95,102,105,108,101,95,95,
+    117,10,0,0,0,95,95,99,97,99,104,101,100,95,95,40,
+    2,0,0,0,117,4,0,0,0,115,101,108,102,117,6,0,
+    0,0,109,111,100,117,108,101,40,1,0,0,0,117,9,0,
+    0,0,95,95,99,108,97,115,115,95,95,40,0,0,0,0,
     117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
     111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
-    112,62,117,10,0,0,0,103,101,116,95,115,111,117,114,99,
-    101,86,4,0,0,115,2,0,0,0,0,2,117,31,0,0,
+    112,62,117,18,0,0,0,95,105,110,105,116,95,109,111,100,
+    117,108,101,95,97,116,116,114,115,80,4,0,0,115,4,0,
+    0,0,0,1,16,1,117,39,0,0,0,83,111,117,114,99,
+    101,108,101,115,115,70,105,108,101,76,111,97,100,101,114,46,
+    95,105,110,105,116,95,109,111,100,117,108,101,95,97,116,116,
+    114,115,99,2,0,0,0,0,0,0,0,6,0,0,0,6,
+    0,0,0,67,0,0,0,115,138,0,0,0,124,0,0,106,
+    0,0,124,1,0,131,1,0,125,2,0,124,0,0,106,1,
+    0,124,2,0,131,1,0,125,3,0,124,0,0,106,2,0,
+    124,1,0,124,3,0,124,2,0,100,0,0,131,4,0,125,
+    4,0,116,3,0,106,4,0,124,4,0,131,1,0,125,5,
+    0,116,5,0,124,5,0,116,6,0,131,2,0,114,101,0,
+    116,7,0,100,1,0,124,2,0,131,2,0,1,124,5,0,
+    83,116,8,0,100,2,0,106,9,0,124,2,0,131,1,0,
+    100,3,0,124,1,0,100,4,0,124,2,0,131,1,2,130,
+    1,0,100,0,0,83,40,5,0,0,0,78,117,21,0,0,
+    0,99,111,100,101,32,111,98,106,101,99,116,32,102,114,111,
+    109,32,123,33,114,125,117,21,0,0,0,78,111,110,45,99,
+    111,100,101,32,111,98,106,101,99,116,32,105,110,32,123,125,
+    117,4,0,0,0,110,97,109,101,117,4,0,0,0,112,97,
+    116,104,40,10,0,0,0,117,12,0,0,0,103,101,116,95,
+    102,105,108,101,110,97,109,101,117,8,0,0,0,103,101,116,
+    95,100,97,116,97,117,20,0,0,0,95,98,121,116,101,115,
+    95,102,114,111,109,95,98,121,116,101,99,111,100,101,117,7,
+    0,0,0,109,97,114,115,104,97,108,117,5,0,0,0,108,
+    111,97,100,115,117,10,0,0,0,105,115,105,110,115,116,97,
+    110,99,101,117,10,0,0,0,95,99,111,100,101,95,116,121,
+    112,101,117,16,0,0,0,95,118,101,114,98,111,115,101,95,
+    109,101,115,115,97,103,101,117,11,0,0,0,73,109,112,111,
+    114,116,69,114,114,111,114,117,6,0,0,0,102,111,114,109,
+    97,116,40,6,0,0,0,117,4,0,0,0,115,101,108,102,
+    117,8,0,0,0,102,117,108,108,110,97,109,101,117,4,0,
+    0,0,112,97,116,104,117,4,0,0,0,100,97,116,97,117,
+    10,0,0,0,98,121,116,101,115,95,100,97,116,97,117,5,
+    0,0,0,102,111,117,110,100,40,0,0,0,0,40,0,0,
+    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,117,8,0,0,0,103,101,116,95,99,111,100,
+    101,84,4,0,0,115,18,0,0,0,0,1,15,1,15,1,
+    24,1,15,1,15,1,13,1,4,2,18,1,117,29,0,0,
     0,83,111,117,114,99,101,108,101,115,115,70,105,108,101,76,
-    111,97,100,101,114,46,103,101,116,95,115,111,117,114,99,101,
-    78,40,7,0,0,0,117,8,0,0,0,95,95,110,97,109,
-    101,95,95,117,10,0,0,0,95,95,109,111,100,117,108,101,
-    95,95,117,12,0,0,0,95,95,113,117,97,108,110,97,109,
-    101,95,95,117,7,0,0,0,95,95,100,111,99,95,95,117,
-    11,0,0,0,108,111,97,100,95,109,111,100,117,108,101,117,
-    8,0,0,0,103,101,116,95,99,111,100,101,117,10,0,0,
-    0,103,101,116,95,115,111,117,114,99,101,40,1,0,0,0,
-    117,10,0,0,0,95,95,108,111,99,97,108,115,95,95,40,
-    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
-    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
-    95,98,111,111,116,115,116,114,97,112,62,117,20,0,0,0,
-    83,111,117,114,99,101,108,101,115,115,70,105,108,101,76,111,
-    97,100,101,114,67,4,0,0,115,8,0,0,0,16,2,6,
-    2,12,3,12,12,117,20,0,0,0,83,111,117,114,99,101,
-    108,101,115,115,70,105,108,101,76,111,97,100,101,114,99,1,
-    0,0,0,0,0,0,0,1,0,0,0,5,0,0,0,66,
-    0,0,0,115,104,0,0,0,124,0,0,69,101,0,0,90,
-    1,0,100,0,0,90,2,0,100,1,0,90,3,0,100,2,
-    0,100,3,0,132,0,0,90,4,0,101,5,0,101,6,0,
-    101,7,0,100,4,0,100,5,0,132,0,0,131,1,0,131,
-    1,0,131,1,0,90,8,0,100,6,0,100,7,0,132,0,
-    0,90,9,0,100,8,0,100,9,0,132,0,0,90,10,0,
-    100,10,0,100,11,0,132,0,0,90,11,0,100,12,0,83,
-    40,13,0,0,0,117,19,0,0,0,69,120,116,101,110,115,
-    105,111,110,70,105,108,101,76,111,97,100,101,114,117,93,0,
-    0,0,76,111,97,100,101,114,32,102,111,114,32,101,120,116,
-    101,110,115,105,111,110,32,109,111,100,117,108,101,115,46,10,
-    10,32,32,32,32,84,104,101,32,99,111,110,115,116,114,117,
-    99,116,111,114,32,105,115,32,100,101,115,105,103,110,101,100,
-    32,116,111,32,119,111,114,107,32,119,105,116,104,32,70,105,
-    108,101,70,105,110,100,101,114,46,10,10,32,32,32,32,99,
-    3,0,0,0,0,0,0,0,3,0,0,0,2,0,0,0,
-    67,0,0,0,115,22,0,0,0,124,1,0,124,0,0,95,
-    0,0,124,2,0,124,0,0,95,1,0,100,0,0,83,40,
-    1,0,0,0,78,40,2,0,0,0,117,4,0,0,0,110,
-    97,109,101,117,4,0,0,0,112,97,116,104,40,3,0,0,
-    0,117,4,0,0,0,115,101,108,102,117,4,0,0,0,110,
-    97,109,101,117,4,0,0,0,112,97,116,104,40,0,0,0,
-    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
-    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,8,0,0,0,95,95,105,
-    110,105,116,95,95,103,4,0,0,115,4,0,0,0,0,1,
-    9,1,117,28,0,0,0,69,120,116,101,110,115,105,111,110,
-    70,105,108,101,76,111,97,100,101,114,46,95,95,105,110,105,
-    116,95,95,99,2,0,0,0,0,0,0,0,4,0,0,0,
-    10,0,0,0,67,0,0,0,115,175,0,0,0,124,1,0,
-    116,0,0,106,1,0,107,6,0,125,2,0,121,107,0,116,
-    2,0,116,3,0,106,4,0,124,1,0,124,0,0,106,5,
-    0,131,3,0,125,3,0,116,6,0,100,1,0,124,0,0,
-    106,5,0,131,2,0,1,124,0,0,106,7,0,124,1,0,
-    131,1,0,114,117,0,116,8,0,124,3,0,100,2,0,131,
-    2,0,12,114,117,0,116,9,0,124,0,0,106,5,0,131,
-    1,0,100,3,0,25,103,1,0,124,3,0,95,10,0,110,
-    0,0,124,3,0,83,87,110,46,0,1,1,1,124,2,0,
-    12,114,163,0,124,1,0,116,0,0,106,1,0,107,6,0,
-    114,163,0,116,0,0,106,1,0,124,1,0,61,110,0,0,
-    130,0,0,89,110,1,0,88,100,4,0,83,40,5,0,0,
-    0,117,25,0,0,0,76,111,97,100,32,97,110,32,101,120,
-    116,101,110,115,105,111,110,32,109,111,100,117,108,101,46,117,
-    33,0,0,0,101,120,116,101,110,115,105,111,110,32,109,111,
-    100,117,108,101,32,108,111,97,100,101,100,32,102,114,111,109,
-    32,123,33,114,125,117,8,0,0,0,95,95,112,97,116,104,
-    95,95,105,0,0,0,0,78,40,11,0,0,0,117,3,0,
-    0,0,115,121,115,117,7,0,0,0,109,111,100,117,108,101,
-    115,117,25,0,0,0,95,99,97,108,108,95,119,105,116,104,
-    95,102,114,97,109,101,115,95,114,101,109,111,118,101,100,117,
-    4,0,0,0,95,105,109,112,117,12,0,0,0,108,111,97,
-    100,95,100,121,110,97,109,105,99,117,4,0,0,0,112,97,
-    116,104,117,16,0,0,0,95,118,101,114,98,111,115,101,95,
-    109,101,115,115,97,103,101,117,10,0,0,0,105,115,95,112,
-    97,99,107,97,103,101,117,7,0,0,0,104,97,115,97,116,
-    116,114,117,11,0,0,0,95,112,97,116,104,95,115,112,108,
-    105,116,117,8,0,0,0,95,95,112,97,116,104,95,95,40,
-    4,0,0,0,117,4,0,0,0,115,101,108,102,117,8,0,
-    0,0,102,117,108,108,110,97,109,101,117,9,0,0,0,105,
-    115,95,114,101,108,111,97,100,117,6,0,0,0,109,111,100,
-    117,108,101,40,0,0,0,0,40,0,0,0,0,117,29,0,
-    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
-    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
-    11,0,0,0,108,111,97,100,95,109,111,100,117,108,101,107,
-    4,0,0,115,24,0,0,0,0,5,15,1,3,1,9,1,
-    15,1,16,1,31,1,28,1,8,1,3,1,22,1,13,1,
-    117,31,0,0,0,69,120,116,101,110,115,105,111,110,70,105,
-    108,101,76,111,97,100,101,114,46,108,111,97,100,95,109,111,
-    100,117,108,101,99,2,0,0,0,0,0,0,0,2,0,0,
-    0,4,0,0,0,3,0,0,0,115,48,0,0,0,116,0,
-    0,124,0,0,106,1,0,131,1,0,100,1,0,25,137,0,
-    0,116,2,0,135,0,0,102,1,0,100,2,0,100,3,0,
-    134,0,0,116,3,0,68,131,1,0,131,1,0,83,40,4,
-    0,0,0,117,49,0,0,0,82,101,116,117,114,110,32,84,
-    114,117,101,32,105,102,32,116,104,101,32,101,120,116,101,110,
-    115,105,111,110,32,109,111,100,117,108,101,32,105,115,32,97,
-    32,112,97,99,107,97,103,101,46,105,1,0,0,0,99,1,
-    0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,51,
-    0,0,0,115,31,0,0,0,124,0,0,93,21,0,125,1,
-    0,136,0,0,100,0,0,124,1,0,23,107,2,0,86,1,
-    113,3,0,100,1,0,83,40,2,0,0,0,117,8,0,0,
-    0,95,95,105,110,105,116,95,95,78,40,0,0,0,0,40,
-    2,0,0,0,117,2,0,0,0,46,48,117,6,0,0,0,
-    115,117,102,102,105,120,40,1,0,0,0,117,9,0,0,0,
-    102,105,108,101,95,110,97,109,101,40,0,0,0,0,117,29,
-    0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
-    116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
-    117,9,0,0,0,60,103,101,110,101,120,112,114,62,128,4,
-    0,0,115,2,0,0,0,6,1,117,49,0,0,0,69,120,
-    116,101,110,115,105,111,110,70,105,108,101,76,111,97,100,101,
-    114,46,105,115,95,112,97,99,107,97,103,101,46,60,108,111,
-    99,97,108,115,62,46,60,103,101,110,101,120,112,114,62,40,
-    4,0,0,0,117,11,0,0,0,95,112,97,116,104,95,115,
-    112,108,105,116,117,4,0,0,0,112,97,116,104,117,3,0,
-    0,0,97,110,121,117,18,0,0,0,69,88,84,69,78,83,
-    73,79,78,95,83,85,70,70,73,88,69,83,40,2,0,0,
-    0,117,4,0,0,0,115,101,108,102,117,8,0,0,0,102,
-    117,108,108,110,97,109,101,40,0,0,0,0,40,1,0,0,
-    0,117,9,0,0,0,102,105,108,101,95,110,97,109,101,117,
-    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
-    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,10,0,0,0,105,115,95,112,97,99,107,97,103,101,
-    125,4,0,0,115,6,0,0,0,0,2,19,1,18,1,117,
-    30,0,0,0,69,120,116,101,110,115,105,111,110,70,105,108,
-    101,76,111,97,100,101,114,46,105,115,95,112,97,99,107,97,
-    103,101,99,2,0,0,0,0,0,0,0,2,0,0,0,1,
-    0,0,0,67,0,0,0,115,4,0,0,0,100,1,0,83,
-    40,2,0,0,0,117,63,0,0,0,82,101,116,117,114,110,
-    32,78,111,110,101,32,97,115,32,97,110,32,101,120,116,101,
-    110,115,105,111,110,32,109,111,100,117,108,101,32,99,97,110,
-    110,111,116,32,99,114,101,97,116,101,32,97,32,99,111,100,
-    101,32,111,98,106,101,99,116,46,78,40,0,0,0,0,40,
-    2,0,0,0,117,4,0,0,0,115,101,108,102,117,8,0,
-    0,0,102,117,108,108,110,97,109,101,40,0,0,0,0,40,
+    111,97,100,101,114,46,103,101,116,95,99,111,100,101,99,2,
+    0,0,0,0,0,0,0,2,0,0,0,1,0,0,0,67,
+    0,0,0,115,4,0,0,0,100,1,0,83,40,2,0,0,
+    0,117,39,0,0,0,82,101,116,117,114,110,32,78,111,110,
+    101,32,97,115,32,116,104,101,114,101,32,105,115,32,110,111,
+    32,115,111,117,114,99,101,32,99,111,100,101,46,78,40,0,
+    0,0,0,40,2,0,0,0,117,4,0,0,0,115,101,108,
+    102,117,8,0,0,0,102,117,108,108,110,97,109,101,40,0,
+    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
+    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
+    98,111,111,116,115,116,114,97,112,62,117,10,0,0,0,103,
+    101,116,95,115,111,117,114,99,101,96,4,0,0,115,2,0,
+    0,0,0,2,117,31,0,0,0,83,111,117,114,99,101,108,
+    101,115,115,70,105,108,101,76,111,97,100,101,114,46,103,101,
+    116,95,115,111,117,114,99,101,40,8,0,0,0,117,8,0,
+    0,0,95,95,110,97,109,101,95,95,117,10,0,0,0,95,
+    95,109,111,100,117,108,101,95,95,117,12,0,0,0,95,95,
+    113,117,97,108,110,97,109,101,95,95,117,7,0,0,0,95,
+    95,100,111,99,95,95,117,11,0,0,0,108,111,97,100,95,
+    109,111,100,117,108,101,117,18,0,0,0,95,105,110,105,116,
+    95,109,111,100,117,108,101,95,97,116,116,114,115,117,8,0,
+    0,0,103,101,116,95,99,111,100,101,117,10,0,0,0,103,
+    101,116,95,115,111,117,114,99,101,40,1,0,0,0,117,10,
+    0,0,0,95,95,108,111,99,97,108,115,95,95,40,0,0,
+    0,0,40,1,0,0,0,117,9,0,0,0,95,95,99,108,
+    97,115,115,95,95,117,29,0,0,0,60,102,114,111,122,101,
+    110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
+    116,115,116,114,97,112,62,117,20,0,0,0,83,111,117,114,
+    99,101,108,101,115,115,70,105,108,101,76,111,97,100,101,114,
+    73,4,0,0,115,10,0,0,0,16,2,6,2,12,3,18,
+    4,12,12,117,20,0,0,0,83,111,117,114,99,101,108,101,
+    115,115,70,105,108,101,76,111,97,100,101,114,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,5,0,0,0,66,0,0,
+    0,115,104,0,0,0,124,0,0,69,101,0,0,90,1,0,
+    100,0,0,90,2,0,100,1,0,90,3,0,100,2,0,100,
+    3,0,132,0,0,90,4,0,101,5,0,101,6,0,101,7,
+    0,100,4,0,100,5,0,132,0,0,131,1,0,131,1,0,
+    131,1,0,90,8,0,100,6,0,100,7,0,132,0,0,90,
+    9,0,100,8,0,100,9,0,132,0,0,90,10,0,100,10,
+    0,100,11,0,132,0,0,90,11,0,100,12,0,83,40,13,
+    0,0,0,117,19,0,0,0,69,120,116,101,110,115,105,111,
+    110,70,105,108,101,76,111,97,100,101,114,117,93,0,0,0,
+    76,111,97,100,101,114,32,102,111,114,32,101,120,116,101,110,
+    115,105,111,110,32,109,111,100,117,108,101,115,46,10,10,32,
+    32,32,32,84,104,101,32,99,111,110,115,116,114,117,99,116,
+    111,114,32,105,115,32,100,101,115,105,103,110,101,100,32,116,
+    111,32,119,111,114,107,32,119,105,116,104,32,70,105,108,101,
+    70,105,110,100,101,114,46,10,10,32,32,32,32,99,3,0,
+    0,0,0,0,0,0,3,0,0,0,2,0,0,0,67,0,
+    0,0,115,22,0,0,0,124,1,0,124,0,0,95,0,0,
+    124,2,0,124,0,0,95,1,0,100,0,0,83,40,1,0,
+    0,0,78,40,2,0,0,0,117,4,0,0,0,110,97,109,
+    101,117,4,0,0,0,112,97,116,104,40,3,0,0,0,117,
+    4,0,0,0,115,101,108,102,117,4,0,0,0,110,97,109,
+    101,117,4,0,0,0,112,97,116,104,40,0,0,0,0,40,
     0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,
     32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,
-    115,116,114,97,112,62,117,8,0,0,0,103,101,116,95,99,
-    111,100,101,131,4,0,0,115,2,0,0,0,0,2,117,28,
+    115,116,114,97,112,62,117,8,0,0,0,95,95,105,110,105,
+    116,95,95,113,4,0,0,115,4,0,0,0,0,1,9,1,
+    117,28,0,0,0,69,120,116,101,110,115,105,111,110,70,105,
+    108,101,76,111,97,100,101,114,46,95,95,105,110,105,116,95,
+    95,99,2,0,0,0,0,0,0,0,4,0,0,0,10,0,
+    0,0,67,0,0,0,115,175,0,0,0,124,1,0,116,0,
+    0,106,1,0,107,6,0,125,2,0,121,107,0,116,2,0,
+    116,3,0,106,4,0,124,1,0,124,0,0,106,5,0,131,
+    3,0,125,3,0,116,6,0,100,1,0,124,0,0,106,5,
+    0,131,2,0,1,124,0,0,106,7,0,124,1,0,131,1,
+    0,114,117,0,116,8,0,124,3,0,100,2,0,131,2,0,
+    12,114,117,0,116,9,0,124,0,0,106,5,0,131,1,0,
+    100,3,0,25,103,1,0,124,3,0,95,10,0,110,0,0,
+    124,3,0,83,87,110,46,0,1,1,1,124,2,0,12,114,
+    163,0,124,1,0,116,0,0,106,1,0,107,6,0,114,163,
+    0,116,0,0,106,1,0,124,1,0,61,110,0,0,130,0,
+    0,89,110,1,0,88,100,4,0,83,40,5,0,0,0,117,
+    25,0,0,0,76,111,97,100,32,97,110,32,101,120,116,101,
+    110,115,105,111,110,32,109,111,100,117,108,101,46,117,33,0,
+    0,0,101,120,116,101,110,115,105,111,110,32,109,111,100,117,
+    108,101,32,108,111,97,100,101,100,32,102,114,111,109,32,123,
+    33,114,125,117,8,0,0,0,95,95,112,97,116,104,95,95,
+    105,0,0,0,0,78,40,11,0,0,0,117,3,0,0,0,
+    115,121,115,117,7,0,0,0,109,111,100,117,108,101,115,117,
+    25,0,0,0,95,99,97,108,108,95,119,105,116,104,95,102,
+    114,97,109,101,115,95,114,101,109,111,118,101,100,117,4,0,
+    0,0,95,105,109,112,117,12,0,0,0,108,111,97,100,95,
+    100,121,110,97,109,105,99,117,4,0,0,0,112,97,116,104,
+    117,16,0,0,0,95,118,101,114,98,111,115,101,95,109,101,
+    115,115,97,103,101,117,10,0,0,0,105,115,95,112,97,99,
+    107,97,103,101,117,7,0,0,0,104,97,115,97,116,116,114,
+    117,11,0,0,0,95,112,97,116,104,95,115,112,108,105,116,
+    117,8,0,0,0,95,95,112,97,116,104,95,95,40,4,0,
+    0,0,117,4,0,0,0,115,101,108,102,117,8,0,0,0,
+    102,117,108,108,110,97,109,101,117,9,0,0,0,105,115,95,
+    114,101,108,111,97,100,117,6,0,0,0,109,111,100,117,108,
+    101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,11,0,
+    0,0,108,111,97,100,95,109,111,100,117,108,101,117,4,0,
+    0,115,24,0,0,0,0,5,15,1,3,1,9,1,15,1,
+    16,1,31,1,28,1,8,1,3,1,22,1,13,1,117,31,
     0,0,0,69,120,116,101,110,115,105,111,110,70,105,108,101,
-    76,111,97,100,101,114,46,103,101,116,95,99,111,100,101,99,
-    2,0,0,0,0,0,0,0,2,0,0,0,1,0,0,0,
-    67,0,0,0,115,4,0,0,0,100,1,0,83,40,2,0,
-    0,0,117,53,0,0,0,82,101,116,117,114,110,32,78,111,
-    110,101,32,97,115,32,101,120,116,101,110,115,105,111,110,32,
-    109,111,100,117,108,101,115,32,104,97,118,101,32,110,111,32,
-    115,111,117,114,99,101,32,99,111,100,101,46,78,40,0,0,
-    0,0,40,2,0,0,0,117,4,0,0,0,115,101,108,102,
-    117,8,0,0,0,102,117,108,108,110,97,109,101,40,0,0,
-    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
-    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
-    111,111,116,115,116,114,97,112,62,117,10,0,0,0,103,101,
-    116,95,115,111,117,114,99,101,135,4,0,0,115,2,0,0,
-    0,0,2,117,30,0,0,0,69,120,116,101,110,115,105,111,
-    110,70,105,108,101,76,111,97,100,101,114,46,103,101,116,95,
-    115,111,117,114,99,101,78,40,12,0,0,0,117,8,0,0,
-    0,95,95,110,97,109,101,95,95,117,10,0,0,0,95,95,
-    109,111,100,117,108,101,95,95,117,12,0,0,0,95,95,113,
-    117,97,108,110,97,109,101,95,95,117,7,0,0,0,95,95,
-    100,111,99,95,95,117,8,0,0,0,95,95,105,110,105,116,
-    95,95,117,11,0,0,0,95,99,104,101,99,107,95,110,97,
-    109,101,117,11,0,0,0,115,101,116,95,112,97,99,107,97,
-    103,101,117,10,0,0,0,115,101,116,95,108,111,97,100,101,
-    114,117,11,0,0,0,108,111,97,100,95,109,111,100,117,108,
-    101,117,10,0,0,0,105,115,95,112,97,99,107,97,103,101,
-    117,8,0,0,0,103,101,116,95,99,111,100,101,117,10,0,
-    0,0,103,101,116,95,115,111,117,114,99,101,40,1,0,0,
-    0,117,10,0,0,0,95,95,108,111,99,97,108,115,95,95,
-    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
-    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
-    46,95,98,111,111,116,115,116,114,97,112,62,117,19,0,0,
-    0,69,120,116,101,110,115,105,111,110,70,105,108,101,76,111,
-    97,100,101,114,95,4,0,0,115,16,0,0,0,16,6,6,
-    2,12,4,3,1,3,1,24,16,12,6,12,4,117,19,0,
+    76,111,97,100,101,114,46,108,111,97,100,95,109,111,100,117,
+    108,101,99,2,0,0,0,0,0,0,0,2,0,0,0,4,
+    0,0,0,3,0,0,0,115,48,0,0,0,116,0,0,124,
+    0,0,106,1,0,131,1,0,100,1,0,25,137,0,0,116,
+    2,0,135,0,0,102,1,0,100,2,0,100,3,0,134,0,
+    0,116,3,0,68,131,1,0,131,1,0,83,40,4,0,0,
+    0,117,49,0,0,0,82,101,116,117,114,110,32,84,114,117,
+    101,32,105,102,32,116,104,101,32,101,120,116,101,110,115,105,
+    111,110,32,109,111,100,117,108,101,32,105,115,32,97,32,112,
+    97,99,107,97,103,101,46,105,1,0,0,0,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,4,0,0,0,51,0,0,
+    0,115,31,0,0,0,124,0,0,93,21,0,125,1,0,136,
+    0,0,100,0,0,124,1,0,23,107,2,0,86,1,113,3,
+    0,100,1,0,83,40,2,0,0,0,117,8,0,0,0,95,
+    95,105,110,105,116,95,95,78,40,0,0,0,0,40,2,0,
+    0,0,117,2,0,0,0,46,48,117,6,0,0,0,115,117,
+    102,102,105,120,40,1,0,0,0,117,9,0,0,0,102,105,
+    108,101,95,110,97,109,101,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,9,
+    0,0,0,60,103,101,110,101,120,112,114,62,138,4,0,0,
+    115,2,0,0,0,6,1,117,49,0,0,0,69,120,116,101,
+    110,115,105,111,110,70,105,108,101,76,111,97,100,101,114,46,
+    105,115,95,112,97,99,107,97,103,101,46,60,108,111,99,97,
+    108,115,62,46,60,103,101,110,101,120,112,114,62,40,4,0,
+    0,0,117,11,0,0,0,95,112,97,116,104,95,115,112,108,
+    105,116,117,4,0,0,0,112,97,116,104,117,3,0,0,0,
+    97,110,121,117,18,0,0,0,69,88,84,69,78,83,73,79,
+    78,95,83,85,70,70,73,88,69,83,40,2,0,0,0,117,
+    4,0,0,0,115,101,108,102,117,8,0,0,0,102,117,108,
+    108,110,97,109,101,40,0,0,0,0,40,1,0,0,0,117,
+    9,0,0,0,102,105,108,101,95,110,97,109,101,117,29,0,
+    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
+    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
+    10,0,0,0,105,115,95,112,97,99,107,97,103,101,135,4,
+    0,0,115,6,0,0,0,0,2,19,1,18,1,117,30,0,
     0,0,69,120,116,101,110,115,105,111,110,70,105,108,101,76,
-    111,97,100,101,114,99,1,0,0,0,0,0,0,0,1,0,
-    0,0,2,0,0,0,66,0,0,0,115,134,0,0,0,124,
-    0,0,69,101,0,0,90,1,0,100,0,0,90,2,0,100,
-    1,0,90,3,0,100,2,0,100,3,0,132,0,0,90,4,
-    0,100,4,0,100,5,0,132,0,0,90,5,0,100,6,0,
-    100,7,0,132,0,0,90,6,0,100,8,0,100,9,0,132,
-    0,0,90,7,0,100,10,0,100,11,0,132,0,0,90,8,
-    0,100,12,0,100,13,0,132,0,0,90,9,0,100,14,0,
-    100,15,0,132,0,0,90,10,0,100,16,0,100,17,0,132,
-    0,0,90,11,0,100,18,0,100,19,0,132,0,0,90,12,
-    0,100,20,0,83,40,21,0,0,0,117,14,0,0,0,95,
-    78,97,109,101,115,112,97,99,101,80,97,116,104,117,38,1,
-    0,0,82,101,112,114,101,115,101,110,116,115,32,97,32,110,
-    97,109,101,115,112,97,99,101,32,112,97,99,107,97,103,101,
-    39,115,32,112,97,116,104,46,32,32,73,116,32,117,115,101,
-    115,32,116,104,101,32,109,111,100,117,108,101,32,110,97,109,
-    101,10,32,32,32,32,116,111,32,102,105,110,100,32,105,116,
-    115,32,112,97,114,101,110,116,32,109,111,100,117,108,101,44,
-    32,97,110,100,32,102,114,111,109,32,116,104,101,114,101,32,
-    105,116,32,108,111,111,107,115,32,117,112,32,116,104,101,32,
-    112,97,114,101,110,116,39,115,10,32,32,32,32,95,95,112,
-    97,116,104,95,95,46,32,32,87,104,101,110,32,116,104,105,
-    115,32,99,104,97,110,103,101,115,44,32,116,104,101,32,109,
-    111,100,117,108,101,39,115,32,111,119,110,32,112,97,116,104,
-    32,105,115,32,114,101,99,111,109,112,117,116,101,100,44,10,
-    32,32,32,32,117,115,105,110,103,32,112,97,116,104,95,102,
-    105,110,100,101,114,46,32,32,70,111,114,32,116,111,112,45,
-    108,101,118,101,108,32,109,111,100,117,108,101,115,44,32,116,
-    104,101,32,112,97,114,101,110,116,32,109,111,100,117,108,101,
-    39,115,32,112,97,116,104,10,32,32,32,32,105,115,32,115,
-    121,115,46,112,97,116,104,46,99,4,0,0,0,0,0,0,
-    0,4,0,0,0,2,0,0,0,67,0,0,0,115,52,0,
-    0,0,124,1,0,124,0,0,95,0,0,124,2,0,124,0,
-    0,95,1,0,116,2,0,124,0,0,106,3,0,131,0,0,
-    131,1,0,124,0,0,95,4,0,124,3,0,124,0,0,95,
-    5,0,100,0,0,83,40,1,0,0,0,78,40,6,0,0,
-    0,117,5,0,0,0,95,110,97,109,101,117,5,0,0,0,
-    95,112,97,116,104,117,5,0,0,0,116,117,112,108,101,117,
-    16,0,0,0,95,103,101,116,95,112,97,114,101,110,116,95,
-    112,97,116,104,117,17,0,0,0,95,108,97,115,116,95,112,
-    97,114,101,110,116,95,112,97,116,104,117,12,0,0,0,95,
-    112,97,116,104,95,102,105,110,100,101,114,40,4,0,0,0,
-    117,4,0,0,0,115,101,108,102,117,4,0,0,0,110,97,
-    109,101,117,4,0,0,0,112,97,116,104,117,11,0,0,0,
-    112,97,116,104,95,102,105,110,100,101,114,40,0,0,0,0,
+    111,97,100,101,114,46,105,115,95,112,97,99,107,97,103,101,
+    99,2,0,0,0,0,0,0,0,2,0,0,0,1,0,0,
+    0,67,0,0,0,115,4,0,0,0,100,1,0,83,40,2,
+    0,0,0,117,63,0,0,0,82,101,116,117,114,110,32,78,
+    111,110,101,32,97,115,32,97,110,32,101,120,116,101,110,115,
+    105,111,110,32,109,111,100,117,108,101,32,99,97,110,110,111,
+    116,32,99,114,101,97,116,101,32,97,32,99,111,100,101,32,
+    111,98,106,101,99,116,46,78,40,0,0,0,0,40,2,0,
+    0,0,117,4,0,0,0,115,101,108,102,117,8,0,0,0,
+    102,117,108,108,110,97,109,101,40,0,0,0,0,40,0,0,
+    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,117,8,0,0,0,103,101,116,95,99,111,100,
+    101,141,4,0,0,115,2,0,0,0,0,2,117,28,0,0,
+    0,69,120,116,101,110,115,105,111,110,70,105,108,101,76,111,
+    97,100,101,114,46,103,101,116,95,99,111,100,101,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,1,0,0,0,67,0,
+    0,0,115,4,0,0,0,100,1,0,83,40,2,0,0,0,
+    117,53,0,0,0,82,101,116,117,114,110,32,78,111,110,101,
+    32,97,115,32,101,120,116,101,110,115,105,111,110,32,109,111,
+    100,117,108,101,115,32,104,97,118,101,32,110,111,32,115,111,
+    117,114,99,101,32,99,111,100,101,46,78,40,0,0,0,0,
+    40,2,0,0,0,117,4,0,0,0,115,101,108,102,117,8,
+    0,0,0,102,117,108,108,110,97,109,101,40,0,0,0,0,
     40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
     110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,8,0,0,0,95,95,105,110,
-    105,116,95,95,147,4,0,0,115,8,0,0,0,0,1,9,
-    1,9,1,21,1,117,23,0,0,0,95,78,97,109,101,115,
-    112,97,99,101,80,97,116,104,46,95,95,105,110,105,116,95,
-    95,99,1,0,0,0,0,0,0,0,4,0,0,0,3,0,
-    0,0,67,0,0,0,115,53,0,0,0,124,0,0,106,0,
-    0,106,1,0,100,1,0,131,1,0,92,3,0,125,1,0,
-    125,2,0,125,3,0,124,2,0,100,2,0,107,2,0,114,
-    43,0,100,6,0,83,124,1,0,100,5,0,102,2,0,83,
-    40,7,0,0,0,117,62,0,0,0,82,101,116,117,114,110,
-    115,32,97,32,116,117,112,108,101,32,111,102,32,40,112,97,
-    114,101,110,116,45,109,111,100,117,108,101,45,110,97,109,101,
-    44,32,112,97,114,101,110,116,45,112,97,116,104,45,97,116,
-    116,114,45,110,97,109,101,41,117,1,0,0,0,46,117,0,
-    0,0,0,117,3,0,0,0,115,121,115,117,4,0,0,0,
-    112,97,116,104,117,8,0,0,0,95,95,112,97,116,104,95,
-    95,40,2,0,0,0,117,3,0,0,0,115,121,115,117,4,
-    0,0,0,112,97,116,104,40,2,0,0,0,117,5,0,0,
-    0,95,110,97,109,101,117,10,0,0,0,114,112,97,114,116,
-    105,116,105,111,110,40,4,0,0,0,117,4,0,0,0,115,
-    101,108,102,117,6,0,0,0,112,97,114,101,110,116,117,3,
-    0,0,0,100,111,116,117,2,0,0,0,109,101,40,0,0,
-    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
-    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
-    111,111,116,115,116,114,97,112,62,117,23,0,0,0,95,102,
-    105,110,100,95,112,97,114,101,110,116,95,112,97,116,104,95,
-    110,97,109,101,115,153,4,0,0,115,8,0,0,0,0,2,
-    27,1,12,2,4,3,117,38,0,0,0,95,78,97,109,101,
-    115,112,97,99,101,80,97,116,104,46,95,102,105,110,100,95,
-    112,97,114,101,110,116,95,112,97,116,104,95,110,97,109,101,
-    115,99,1,0,0,0,0,0,0,0,3,0,0,0,3,0,
-    0,0,67,0,0,0,115,38,0,0,0,124,0,0,106,0,
-    0,131,0,0,92,2,0,125,1,0,125,2,0,116,1,0,
-    116,2,0,106,3,0,124,1,0,25,124,2,0,131,2,0,
-    83,40,1,0,0,0,78,40,4,0,0,0,117,23,0,0,
-    0,95,102,105,110,100,95,112,97,114,101,110,116,95,112,97,
-    116,104,95,110,97,109,101,115,117,7,0,0,0,103,101,116,
-    97,116,116,114,117,3,0,0,0,115,121,115,117,7,0,0,
-    0,109,111,100,117,108,101,115,40,3,0,0,0,117,4,0,
-    0,0,115,101,108,102,117,18,0,0,0,112,97,114,101,110,
-    116,95,109,111,100,117,108,101,95,110,97,109,101,117,14,0,
-    0,0,112,97,116,104,95,97,116,116,114,95,110,97,109,101,
-    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
-    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
-    46,95,98,111,111,116,115,116,114,97,112,62,117,16,0,0,
-    0,95,103,101,116,95,112,97,114,101,110,116,95,112,97,116,
-    104,163,4,0,0,115,4,0,0,0,0,1,18,1,117,31,
-    0,0,0,95,78,97,109,101,115,112,97,99,101,80,97,116,
-    104,46,95,103,101,116,95,112,97,114,101,110,116,95,112,97,
-    116,104,99,1,0,0,0,0,0,0,0,4,0,0,0,3,
-    0,0,0,67,0,0,0,115,103,0,0,0,116,0,0,124,
-    0,0,106,1,0,131,0,0,131,1,0,125,1,0,124,1,
-    0,124,0,0,106,2,0,107,3,0,114,96,0,124,0,0,
-    106,3,0,124,0,0,106,4,0,124,1,0,131,2,0,92,
-    2,0,125,2,0,125,3,0,124,2,0,100,0,0,107,8,
-    0,114,84,0,124,3,0,124,0,0,95,5,0,110,0,0,
-    124,1,0,124,0,0,95,2,0,110,0,0,124,0,0,106,
-    5,0,83,40,1,0,0,0,78,40,6,0,0,0,117,5,
-    0,0,0,116,117,112,108,101,117,16,0,0,0,95,103,101,
-    116,95,112,97,114,101,110,116,95,112,97,116,104,117,17,0,
-    0,0,95,108,97,115,116,95,112,97,114,101,110,116,95,112,
-    97,116,104,117,12,0,0,0,95,112,97,116,104,95,102,105,
-    110,100,101,114,117,5,0,0,0,95,110,97,109,101,117,5,
-    0,0,0,95,112,97,116,104,40,4,0,0,0,117,4,0,
-    0,0,115,101,108,102,117,11,0,0,0,112,97,114,101,110,
-    116,95,112,97,116,104,117,6,0,0,0,108,111,97,100,101,
-    114,117,8,0,0,0,110,101,119,95,112,97,116,104,40,0,
+    116,115,116,114,97,112,62,117,10,0,0,0,103,101,116,95,
+    115,111,117,114,99,101,145,4,0,0,115,2,0,0,0,0,
+    2,117,30,0,0,0,69,120,116,101,110,115,105,111,110,70,
+    105,108,101,76,111,97,100,101,114,46,103,101,116,95,115,111,
+    117,114,99,101,78,40,12,0,0,0,117,8,0,0,0,95,
+    95,110,97,109,101,95,95,117,10,0,0,0,95,95,109,111,
+    100,117,108,101,95,95,117,12,0,0,0,95,95,113,117,97,
+    108,110,97,109,101,95,95,117,7,0,0,0,95,95,100,111,
+    99,95,95,117,8,0,0,0,95,95,105,110,105,116,95,95,
+    117,11,0,0,0,95,99,104,101,99,107,95,110,97,109,101,
+    117,11,0,0,0,115,101,116,95,112,97,99,107,97,103,101,
+    117,10,0,0,0,115,101,116,95,108,111,97,100,101,114,117,
+    11,0,0,0,108,111,97,100,95,109,111,100,117,108,101,117,
+    10,0,0,0,105,115,95,112,97,99,107,97,103,101,117,8,
+    0,0,0,103,101,116,95,99,111,100,101,117,10,0,0,0,
+    103,101,116,95,115,111,117,114,99,101,40,1,0,0,0,117,
+    10,0,0,0,95,95,108,111,99,97,108,115,95,95,40,0,
     0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
     111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,12,0,0,0,95,
-    114,101,99,97,108,99,117,108,97,116,101,167,4,0,0,115,
-    14,0,0,0,0,2,18,1,15,1,27,3,12,1,12,1,
-    12,1,117,27,0,0,0,95,78,97,109,101,115,112,97,99,
-    101,80,97,116,104,46,95,114,101,99,97,108,99,117,108,97,
-    116,101,99,1,0,0,0,0,0,0,0,1,0,0,0,2,
-    0,0,0,67,0,0,0,115,16,0,0,0,116,0,0,124,
-    0,0,106,1,0,131,0,0,131,1,0,83,40,1,0,0,
-    0,78,40,2,0,0,0,117,4,0,0,0,105,116,101,114,
-    117,12,0,0,0,95,114,101,99,97,108,99,117,108,97,116,
-    101,40,1,0,0,0,117,4,0,0,0,115,101,108,102,40,
-    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
-    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
-    95,98,111,111,116,115,116,114,97,112,62,117,8,0,0,0,
-    95,95,105,116,101,114,95,95,179,4,0,0,115,2,0,0,
-    0,0,1,117,23,0,0,0,95,78,97,109,101,115,112,97,
-    99,101,80,97,116,104,46,95,95,105,116,101,114,95,95,99,
-    1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,0,
-    67,0,0,0,115,16,0,0,0,116,0,0,124,0,0,106,
-    1,0,131,0,0,131,1,0,83,40,1,0,0,0,78,40,
-    2,0,0,0,117,3,0,0,0,108,101,110,117,12,0,0,
-    0,95,114,101,99,97,108,99,117,108,97,116,101,40,1,0,
-    0,0,117,4,0,0,0,115,101,108,102,40,0,0,0,0,
+    98,111,111,116,115,116,114,97,112,62,117,19,0,0,0,69,
+    120,116,101,110,115,105,111,110,70,105,108,101,76,111,97,100,
+    101,114,105,4,0,0,115,16,0,0,0,16,6,6,2,12,
+    4,3,1,3,1,24,16,12,6,12,4,117,19,0,0,0,
+    69,120,116,101,110,115,105,111,110,70,105,108,101,76,111,97,
+    100,101,114,99,1,0,0,0,0,0,0,0,1,0,0,0,
+    2,0,0,0,66,0,0,0,115,134,0,0,0,124,0,0,
+    69,101,0,0,90,1,0,100,0,0,90,2,0,100,1,0,
+    90,3,0,100,2,0,100,3,0,132,0,0,90,4,0,100,
+    4,0,100,5,0,132,0,0,90,5,0,100,6,0,100,7,
+    0,132,0,0,90,6,0,100,8,0,100,9,0,132,0,0,
+    90,7,0,100,10,0,100,11,0,132,0,0,90,8,0,100,
+    12,0,100,13,0,132,0,0,90,9,0,100,14,0,100,15,
+    0,132,0,0,90,10,0,100,16,0,100,17,0,132,0,0,
+    90,11,0,100,18,0,100,19,0,132,0,0,90,12,0,100,
+    20,0,83,40,21,0,0,0,117,14,0,0,0,95,78,97,
+    109,101,115,112,97,99,101,80,97,116,104,117,38,1,0,0,
+    82,101,112,114,101,115,101,110,116,115,32,97,32,110,97,109,
+    101,115,112,97,99,101,32,112,97,99,107,97,103,101,39,115,
+    32,112,97,116,104,46,32,32,73,116,32,117,115,101,115,32,
+    116,104,101,32,109,111,100,117,108,101,32,110,97,109,101,10,
+    32,32,32,32,116,111,32,102,105,110,100,32,105,116,115,32,
+    112,97,114,101,110,116,32,109,111,100,117,108,101,44,32,97,
+    110,100,32,102,114,111,109,32,116,104,101,114,101,32,105,116,
+    32,108,111,111,107,115,32,117,112,32,116,104,101,32,112,97,
+    114,101,110,116,39,115,10,32,32,32,32,95,95,112,97,116,
+    104,95,95,46,32,32,87,104,101,110,32,116,104,105,115,32,
+    99,104,97,110,103,101,115,44,32,116,104,101,32,109,111,100,
+    117,108,101,39,115,32,111,119,110,32,112,97,116,104,32,105,
+    115,32,114,101,99,111,109,112,117,116,101,100,44,10,32,32,
+    32,32,117,115,105,110,103,32,112,97,116,104,95,102,105,110,
+    100,101,114,46,32,32,70,111,114,32,116,111,112,45,108,101,
+    118,101,108,32,109,111,100,117,108,101,115,44,32,116,104,101,
+    32,112,97,114,101,110,116,32,109,111,100,117,108,101,39,115,
+    32,112,97,116,104,10,32,32,32,32,105,115,32,115,121,115,
+    46,112,97,116,104,46,99,4,0,0,0,0,0,0,0,4,
+    0,0,0,2,0,0,0,67,0,0,0,115,52,0,0,0,
+    124,1,0,124,0,0,95,0,0,124,2,0,124,0,0,95,
+    1,0,116,2,0,124,0,0,106,3,0,131,0,0,131,1,
+    0,124,0,0,95,4,0,124,3,0,124,0,0,95,5,0,
+    100,0,0,83,40,1,0,0,0,78,40,6,0,0,0,117,
+    5,0,0,0,95,110,97,109,101,117,5,0,0,0,95,112,
+    97,116,104,117,5,0,0,0,116,117,112,108,101,117,16,0,
+    0,0,95,103,101,116,95,112,97,114,101,110,116,95,112,97,
+    116,104,117,17,0,0,0,95,108,97,115,116,95,112,97,114,
+    101,110,116,95,112,97,116,104,117,12,0,0,0,95,112,97,
+    116,104,95,102,105,110,100,101,114,40,4,0,0,0,117,4,
+    0,0,0,115,101,108,102,117,4,0,0,0,110,97,109,101,
+    117,4,0,0,0,112,97,116,104,117,11,0,0,0,112,97,
+    116,104,95,102,105,110,100,101,114,40,0,0,0,0,40,0,
+    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
+    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
+    116,114,97,112,62,117,8,0,0,0,95,95,105,110,105,116,
+    95,95,157,4,0,0,115,8,0,0,0,0,1,9,1,9,
+    1,21,1,117,23,0,0,0,95,78,97,109,101,115,112,97,
+    99,101,80,97,116,104,46,95,95,105,110,105,116,95,95,99,
+    1,0,0,0,0,0,0,0,4,0,0,0,3,0,0,0,
+    67,0,0,0,115,53,0,0,0,124,0,0,106,0,0,106,
+    1,0,100,1,0,131,1,0,92,3,0,125,1,0,125,2,
+    0,125,3,0,124,2,0,100,2,0,107,2,0,114,43,0,
+    100,6,0,83,124,1,0,100,5,0,102,2,0,83,40,7,
+    0,0,0,117,62,0,0,0,82,101,116,117,114,110,115,32,
+    97,32,116,117,112,108,101,32,111,102,32,40,112,97,114,101,
+    110,116,45,109,111,100,117,108,101,45,110,97,109,101,44,32,
+    112,97,114,101,110,116,45,112,97,116,104,45,97,116,116,114,
+    45,110,97,109,101,41,117,1,0,0,0,46,117,0,0,0,
+    0,117,3,0,0,0,115,121,115,117,4,0,0,0,112,97,
+    116,104,117,8,0,0,0,95,95,112,97,116,104,95,95,40,
+    2,0,0,0,117,3,0,0,0,115,121,115,117,4,0,0,
+    0,112,97,116,104,40,2,0,0,0,117,5,0,0,0,95,
+    110,97,109,101,117,10,0,0,0,114,112,97,114,116,105,116,
+    105,111,110,40,4,0,0,0,117,4,0,0,0,115,101,108,
+    102,117,6,0,0,0,112,97,114,101,110,116,117,3,0,0,
+    0,100,111,116,117,2,0,0,0,109,101,40,0,0,0,0,
     40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
     110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,7,0,0,0,95,95,108,101,
-    110,95,95,182,4,0,0,115,2,0,0,0,0,1,117,22,
+    116,115,116,114,97,112,62,117,23,0,0,0,95,102,105,110,
+    100,95,112,97,114,101,110,116,95,112,97,116,104,95,110,97,
+    109,101,115,163,4,0,0,115,8,0,0,0,0,2,27,1,
+    12,2,4,3,117,38,0,0,0,95,78,97,109,101,115,112,
+    97,99,101,80,97,116,104,46,95,102,105,110,100,95,112,97,
+    114,101,110,116,95,112,97,116,104,95,110,97,109,101,115,99,
+    1,0,0,0,0,0,0,0,3,0,0,0,3,0,0,0,
+    67,0,0,0,115,38,0,0,0,124,0,0,106,0,0,131,
+    0,0,92,2,0,125,1,0,125,2,0,116,1,0,116,2,
+    0,106,3,0,124,1,0,25,124,2,0,131,2,0,83,40,
+    1,0,0,0,78,40,4,0,0,0,117,23,0,0,0,95,
+    102,105,110,100,95,112,97,114,101,110,116,95,112,97,116,104,
+    95,110,97,109,101,115,117,7,0,0,0,103,101,116,97,116,
+    116,114,117,3,0,0,0,115,121,115,117,7,0,0,0,109,
+    111,100,117,108,101,115,40,3,0,0,0,117,4,0,0,0,
+    115,101,108,102,117,18,0,0,0,112,97,114,101,110,116,95,
+    109,111,100,117,108,101,95,110,97,109,101,117,14,0,0,0,
+    112,97,116,104,95,97,116,116,114,95,110,97,109,101,40,0,
+    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
+    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
+    98,111,111,116,115,116,114,97,112,62,117,16,0,0,0,95,
+    103,101,116,95,112,97,114,101,110,116,95,112,97,116,104,173,
+    4,0,0,115,4,0,0,0,0,1,18,1,117,31,0,0,
+    0,95,78,97,109,101,115,112,97,99,101,80,97,116,104,46,
+    95,103,101,116,95,112,97,114,101,110,116,95,112,97,116,104,
+    99,1,0,0,0,0,0,0,0,4,0,0,0,3,0,0,
+    0,67,0,0,0,115,103,0,0,0,116,0,0,124,0,0,
+    106,1,0,131,0,0,131,1,0,125,1,0,124,1,0,124,
+    0,0,106,2,0,107,3,0,114,96,0,124,0,0,106,3,
+    0,124,0,0,106,4,0,124,1,0,131,2,0,92,2,0,
+    125,2,0,125,3,0,124,2,0,100,0,0,107,8,0,114,
+    84,0,124,3,0,124,0,0,95,5,0,110,0,0,124,1,
+    0,124,0,0,95,2,0,110,0,0,124,0,0,106,5,0,
+    83,40,1,0,0,0,78,40,6,0,0,0,117,5,0,0,
+    0,116,117,112,108,101,117,16,0,0,0,95,103,101,116,95,
+    112,97,114,101,110,116,95,112,97,116,104,117,17,0,0,0,
+    95,108,97,115,116,95,112,97,114,101,110,116,95,112,97,116,
+    104,117,12,0,0,0,95,112,97,116,104,95,102,105,110,100,
+    101,114,117,5,0,0,0,95,110,97,109,101,117,5,0,0,
+    0,95,112,97,116,104,40,4,0,0,0,117,4,0,0,0,
+    115,101,108,102,117,11,0,0,0,112,97,114,101,110,116,95,
+    112,97,116,104,117,6,0,0,0,108,111,97,100,101,114,117,
+    8,0,0,0,110,101,119,95,112,97,116,104,40,0,0,0,
+    0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
+    101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
+    111,116,115,116,114,97,112,62,117,12,0,0,0,95,114,101,
+    99,97,108,99,117,108,97,116,101,177,4,0,0,115,14,0,
+    0,0,0,2,18,1,15,1,27,3,12,1,12,1,12,1,
+    117,27,0,0,0,95,78,97,109,101,115,112,97,99,101,80,
+    97,116,104,46,95,114,101,99,97,108,99,117,108,97,116,101,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,
+    0,67,0,0,0,115,16,0,0,0,116,0,0,124,0,0,
+    106,1,0,131,0,0,131,1,0,83,40,1,0,0,0,78,
+    40,2,0,0,0,117,4,0,0,0,105,116,101,114,117,12,
+    0,0,0,95,114,101,99,97,108,99,117,108,97,116,101,40,
+    1,0,0,0,117,4,0,0,0,115,101,108,102,40,0,0,
+    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
+    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
+    111,111,116,115,116,114,97,112,62,117,8,0,0,0,95,95,
+    105,116,101,114,95,95,189,4,0,0,115,2,0,0,0,0,
+    1,117,23,0,0,0,95,78,97,109,101,115,112,97,99,101,
+    80,97,116,104,46,95,95,105,116,101,114,95,95,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,2,0,0,0,67,0,
+    0,0,115,16,0,0,0,116,0,0,124,0,0,106,1,0,
+    131,0,0,131,1,0,83,40,1,0,0,0,78,40,2,0,
+    0,0,117,3,0,0,0,108,101,110,117,12,0,0,0,95,
+    114,101,99,97,108,99,117,108,97,116,101,40,1,0,0,0,
+    117,4,0,0,0,115,101,108,102,40,0,0,0,0,40,0,
+    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
+    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
+    116,114,97,112,62,117,7,0,0,0,95,95,108,101,110,95,
+    95,192,4,0,0,115,2,0,0,0,0,1,117,22,0,0,
+    0,95,78,97,109,101,115,112,97,99,101,80,97,116,104,46,
+    95,95,108,101,110,95,95,99,1,0,0,0,0,0,0,0,
+    1,0,0,0,2,0,0,0,67,0,0,0,115,16,0,0,
+    0,100,1,0,106,0,0,124,0,0,106,1,0,131,1,0,
+    83,40,2,0,0,0,78,117,20,0,0,0,95,78,97,109,
+    101,115,112,97,99,101,80,97,116,104,40,123,33,114,125,41,
+    40,2,0,0,0,117,6,0,0,0,102,111,114,109,97,116,
+    117,5,0,0,0,95,112,97,116,104,40,1,0,0,0,117,
+    4,0,0,0,115,101,108,102,40,0,0,0,0,40,0,0,
+    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,117,8,0,0,0,95,95,114,101,112,114,95,
+    95,195,4,0,0,115,2,0,0,0,0,1,117,23,0,0,
+    0,95,78,97,109,101,115,112,97,99,101,80,97,116,104,46,
+    95,95,114,101,112,114,95,95,99,2,0,0,0,0,0,0,
+    0,2,0,0,0,2,0,0,0,67,0,0,0,115,16,0,
+    0,0,124,1,0,124,0,0,106,0,0,131,0,0,107,6,
+    0,83,40,1,0,0,0,78,40,1,0,0,0,117,12,0,
+    0,0,95,114,101,99,97,108,99,117,108,97,116,101,40,2,
+    0,0,0,117,4,0,0,0,115,101,108,102,117,4,0,0,
+    0,105,116,101,109,40,0,0,0,0,40,0,0,0,0,117,
+    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
+    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
+    62,117,12,0,0,0,95,95,99,111,110,116,97,105,110,115,
+    95,95,198,4,0,0,115,2,0,0,0,0,1,117,27,0,
+    0,0,95,78,97,109,101,115,112,97,99,101,80,97,116,104,
+    46,95,95,99,111,110,116,97,105,110,115,95,95,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,2,0,0,0,67,0,
+    0,0,115,20,0,0,0,124,0,0,106,0,0,106,1,0,
+    124,1,0,131,1,0,1,100,0,0,83,40,1,0,0,0,
+    78,40,2,0,0,0,117,5,0,0,0,95,112,97,116,104,
+    117,6,0,0,0,97,112,112,101,110,100,40,2,0,0,0,
+    117,4,0,0,0,115,101,108,102,117,4,0,0,0,105,116,
+    101,109,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,6,
+    0,0,0,97,112,112,101,110,100,201,4,0,0,115,2,0,
+    0,0,0,1,117,21,0,0,0,95,78,97,109,101,115,112,
+    97,99,101,80,97,116,104,46,97,112,112,101,110,100,78,40,
+    13,0,0,0,117,8,0,0,0,95,95,110,97,109,101,95,
+    95,117,10,0,0,0,95,95,109,111,100,117,108,101,95,95,
+    117,12,0,0,0,95,95,113,117,97,108,110,97,109,101,95,
+    95,117,7,0,0,0,95,95,100,111,99,95,95,117,8,0,
+    0,0,95,95,105,110,105,116,95,95,117,23,0,0,0,95,
+    102,105,110,100,95,112,97,114,101,110,116,95,112,97,116,104,
+    95,110,97,109,101,115,117,16,0,0,0,95,103,101,116,95,
+    112,97,114,101,110,116,95,112,97,116,104,117,12,0,0,0,
+    95,114,101,99,97,108,99,117,108,97,116,101,117,8,0,0,
+    0,95,95,105,116,101,114,95,95,117,7,0,0,0,95,95,
+    108,101,110,95,95,117,8,0,0,0,95,95,114,101,112,114,
+    95,95,117,12,0,0,0,95,95,99,111,110,116,97,105,110,
+    115,95,95,117,6,0,0,0,97,112,112,101,110,100,40,1,
+    0,0,0,117,10,0,0,0,95,95,108,111,99,97,108,115,
+    95,95,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,14,
     0,0,0,95,78,97,109,101,115,112,97,99,101,80,97,116,
-    104,46,95,95,108,101,110,95,95,99,1,0,0,0,0,0,
-    0,0,1,0,0,0,2,0,0,0,67,0,0,0,115,16,
-    0,0,0,100,1,0,106,0,0,124,0,0,106,1,0,131,
-    1,0,83,40,2,0,0,0,78,117,20,0,0,0,95,78,
-    97,109,101,115,112,97,99,101,80,97,116,104,40,123,33,114,
-    125,41,40,2,0,0,0,117,6,0,0,0,102,111,114,109,
-    97,116,117,5,0,0,0,95,112,97,116,104,40,1,0,0,
-    0,117,4,0,0,0,115,101,108,102,40,0,0,0,0,40,
-    0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,
-    32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,
-    115,116,114,97,112,62,117,8,0,0,0,95,95,114,101,112,
-    114,95,95,185,4,0,0,115,2,0,0,0,0,1,117,23,
+    104,150,4,0,0,115,20,0,0,0,16,5,6,2,12,6,
+    12,10,12,4,12,12,12,3,12,3,12,3,12,3,117,14,
     0,0,0,95,78,97,109,101,115,112,97,99,101,80,97,116,
-    104,46,95,95,114,101,112,114,95,95,99,2,0,0,0,0,
-    0,0,0,2,0,0,0,2,0,0,0,67,0,0,0,115,
-    16,0,0,0,124,1,0,124,0,0,106,0,0,131,0,0,
-    107,6,0,83,40,1,0,0,0,78,40,1,0,0,0,117,
-    12,0,0,0,95,114,101,99,97,108,99,117,108,97,116,101,
-    40,2,0,0,0,117,4,0,0,0,115,101,108,102,117,4,
-    0,0,0,105,116,101,109,40,0,0,0,0,40,0,0,0,
+    104,99,1,0,0,0,0,0,0,0,1,0,0,0,3,0,
+    0,0,66,0,0,0,115,68,0,0,0,124,0,0,69,101,
+    0,0,90,1,0,100,0,0,90,2,0,100,1,0,100,2,
+    0,132,0,0,90,3,0,101,4,0,100,3,0,100,4,0,
+    132,0,0,131,1,0,90,5,0,101,6,0,100,5,0,100,
+    6,0,132,0,0,131,1,0,90,7,0,100,7,0,83,40,
+    8,0,0,0,117,15,0,0,0,78,97,109,101,115,112,97,
+    99,101,76,111,97,100,101,114,99,4,0,0,0,0,0,0,
+    0,4,0,0,0,4,0,0,0,67,0,0,0,115,25,0,
+    0,0,116,0,0,124,1,0,124,2,0,124,3,0,131,3,
+    0,124,0,0,95,1,0,100,0,0,83,40,1,0,0,0,
+    78,40,2,0,0,0,117,14,0,0,0,95,78,97,109,101,
+    115,112,97,99,101,80,97,116,104,117,5,0,0,0,95,112,
+    97,116,104,40,4,0,0,0,117,4,0,0,0,115,101,108,
+    102,117,4,0,0,0,110,97,109,101,117,4,0,0,0,112,
+    97,116,104,117,11,0,0,0,112,97,116,104,95,102,105,110,
+    100,101,114,40,0,0,0,0,40,0,0,0,0,117,29,0,
+    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
+    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
+    8,0,0,0,95,95,105,110,105,116,95,95,206,4,0,0,
+    115,2,0,0,0,0,1,117,24,0,0,0,78,97,109,101,
+    115,112,97,99,101,76,111,97,100,101,114,46,95,95,105,110,
+    105,116,95,95,99,2,0,0,0,0,0,0,0,2,0,0,
+    0,2,0,0,0,67,0,0,0,115,16,0,0,0,100,1,
+    0,106,0,0,124,1,0,106,1,0,131,1,0,83,40,2,
+    0,0,0,78,117,25,0,0,0,60,109,111,100,117,108,101,
+    32,39,123,125,39,32,40,110,97,109,101,115,112,97,99,101,
+    41,62,40,2,0,0,0,117,6,0,0,0,102,111,114,109,
+    97,116,117,8,0,0,0,95,95,110,97,109,101,95,95,40,
+    2,0,0,0,117,3,0,0,0,99,108,115,117,6,0,0,
+    0,109,111,100,117,108,101,40,0,0,0,0,40,0,0,0,
     0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
     112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
-    97,112,62,117,12,0,0,0,95,95,99,111,110,116,97,105,
-    110,115,95,95,188,4,0,0,115,2,0,0,0,0,1,117,
-    27,0,0,0,95,78,97,109,101,115,112,97,99,101,80,97,
-    116,104,46,95,95,99,111,110,116,97,105,110,115,95,95,99,
-    2,0,0,0,0,0,0,0,2,0,0,0,2,0,0,0,
-    67,0,0,0,115,20,0,0,0,124,0,0,106,0,0,106,
-    1,0,124,1,0,131,1,0,1,100,0,0,83,40,1,0,
-    0,0,78,40,2,0,0,0,117,5,0,0,0,95,112,97,
-    116,104,117,6,0,0,0,97,112,112,101,110,100,40,2,0,
-    0,0,117,4,0,0,0,115,101,108,102,117,4,0,0,0,
-    105,116,101,109,40,0,0,0,0,40,0,0,0,0,117,29,
-    0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
-    116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
-    117,6,0,0,0,97,112,112,101,110,100,191,4,0,0,115,
-    2,0,0,0,0,1,117,21,0,0,0,95,78,97,109,101,
-    115,112,97,99,101,80,97,116,104,46,97,112,112,101,110,100,
-    78,40,13,0,0,0,117,8,0,0,0,95,95,110,97,109,
-    101,95,95,117,10,0,0,0,95,95,109,111,100,117,108,101,
-    95,95,117,12,0,0,0,95,95,113,117,97,108,110,97,109,
-    101,95,95,117,7,0,0,0,95,95,100,111,99,95,95,117,
-    8,0,0,0,95,95,105,110,105,116,95,95,117,23,0,0,
-    0,95,102,105,110,100,95,112,97,114,101,110,116,95,112,97,
-    116,104,95,110,97,109,101,115,117,16,0,0,0,95,103,101,
-    116,95,112,97,114,101,110,116,95,112,97,116,104,117,12,0,
-    0,0,95,114,101,99,97,108,99,117,108,97,116,101,117,8,
-    0,0,0,95,95,105,116,101,114,95,95,117,7,0,0,0,
-    95,95,108,101,110,95,95,117,8,0,0,0,95,95,114,101,
-    112,114,95,95,117,12,0,0,0,95,95,99,111,110,116,97,
-    105,110,115,95,95,117,6,0,0,0,97,112,112,101,110,100,
+    97,112,62,117,11,0,0,0,109,111,100,117,108,101,95,114,
+    101,112,114,209,4,0,0,115,2,0,0,0,0,2,117,27,
+    0,0,0,78,97,109,101,115,112,97,99,101,76,111,97,100,
+    101,114,46,109,111,100,117,108,101,95,114,101,112,114,99,2,
+    0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,67,
+    0,0,0,115,32,0,0,0,116,0,0,100,1,0,124,0,
+    0,106,1,0,131,2,0,1,124,0,0,106,1,0,124,1,
+    0,95,2,0,124,1,0,83,40,2,0,0,0,117,24,0,
+    0,0,76,111,97,100,32,97,32,110,97,109,101,115,112,97,
+    99,101,32,109,111,100,117,108,101,46,117,38,0,0,0,110,
+    97,109,101,115,112,97,99,101,32,109,111,100,117,108,101,32,
+    108,111,97,100,101,100,32,119,105,116,104,32,112,97,116,104,
+    32,123,33,114,125,40,3,0,0,0,117,16,0,0,0,95,
+    118,101,114,98,111,115,101,95,109,101,115,115,97,103,101,117,
+    5,0,0,0,95,112,97,116,104,117,8,0,0,0,95,95,
+    112,97,116,104,95,95,40,2,0,0,0,117,4,0,0,0,
+    115,101,108,102,117,6,0,0,0,109,111,100,117,108,101,40,
+    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
+    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
+    95,98,111,111,116,115,116,114,97,112,62,117,11,0,0,0,
+    108,111,97,100,95,109,111,100,117,108,101,213,4,0,0,115,
+    6,0,0,0,0,3,16,1,12,1,117,27,0,0,0,78,
+    97,109,101,115,112,97,99,101,76,111,97,100,101,114,46,108,
+    111,97,100,95,109,111,100,117,108,101,78,40,8,0,0,0,
+    117,8,0,0,0,95,95,110,97,109,101,95,95,117,10,0,
+    0,0,95,95,109,111,100,117,108,101,95,95,117,12,0,0,
+    0,95,95,113,117,97,108,110,97,109,101,95,95,117,8,0,
+    0,0,95,95,105,110,105,116,95,95,117,11,0,0,0,99,
+    108,97,115,115,109,101,116,104,111,100,117,11,0,0,0,109,
+    111,100,117,108,101,95,114,101,112,114,117,17,0,0,0,109,
+    111,100,117,108,101,95,102,111,114,95,108,111,97,100,101,114,
+    117,11,0,0,0,108,111,97,100,95,109,111,100,117,108,101,
     40,1,0,0,0,117,10,0,0,0,95,95,108,111,99,97,
     108,115,95,95,40,0,0,0,0,40,0,0,0,0,117,29,
     0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
     116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
-    117,14,0,0,0,95,78,97,109,101,115,112,97,99,101,80,
-    97,116,104,140,4,0,0,115,20,0,0,0,16,5,6,2,
-    12,6,12,10,12,4,12,12,12,3,12,3,12,3,12,3,
-    117,14,0,0,0,95,78,97,109,101,115,112,97,99,101,80,
-    97,116,104,99,1,0,0,0,0,0,0,0,1,0,0,0,
-    3,0,0,0,66,0,0,0,115,68,0,0,0,124,0,0,
-    69,101,0,0,90,1,0,100,0,0,90,2,0,100,1,0,
-    100,2,0,132,0,0,90,3,0,101,4,0,100,3,0,100,
-    4,0,132,0,0,131,1,0,90,5,0,101,6,0,100,5,
-    0,100,6,0,132,0,0,131,1,0,90,7,0,100,7,0,
-    83,40,8,0,0,0,117,15,0,0,0,78,97,109,101,115,
-    112,97,99,101,76,111,97,100,101,114,99,4,0,0,0,0,
-    0,0,0,4,0,0,0,4,0,0,0,67,0,0,0,115,
-    25,0,0,0,116,0,0,124,1,0,124,2,0,124,3,0,
-    131,3,0,124,0,0,95,1,0,100,0,0,83,40,1,0,
-    0,0,78,40,2,0,0,0,117,14,0,0,0,95,78,97,
-    109,101,115,112,97,99,101,80,97,116,104,117,5,0,0,0,
-    95,112,97,116,104,40,4,0,0,0,117,4,0,0,0,115,
-    101,108,102,117,4,0,0,0,110,97,109,101,117,4,0,0,
-    0,112,97,116,104,117,11,0,0,0,112,97,116,104,95,102,
-    105,110,100,101,114,40,0,0,0,0,40,0,0,0,0,117,
-    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
-    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,8,0,0,0,95,95,105,110,105,116,95,95,196,4,
-    0,0,115,2,0,0,0,0,1,117,24,0,0,0,78,97,
-    109,101,115,112,97,99,101,76,111,97,100,101,114,46,95,95,
-    105,110,105,116,95,95,99,2,0,0,0,0,0,0,0,2,
-    0,0,0,2,0,0,0,67,0,0,0,115,16,0,0,0,
-    100,1,0,106,0,0,124,1,0,106,1,0,131,1,0,83,
-    40,2,0,0,0,78,117,25,0,0,0,60,109,111,100,117,
-    108,101,32,39,123,125,39,32,40,110,97,109,101,115,112,97,
-    99,101,41,62,40,2,0,0,0,117,6,0,0,0,102,111,
-    114,109,97,116,117,8,0,0,0,95,95,110,97,109,101,95,
-    95,40,2,0,0,0,117,3,0,0,0,99,108,115,117,6,
-    0,0,0,109,111,100,117,108,101,40,0,0,0,0,40,0,
-    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
-    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
-    116,114,97,112,62,117,11,0,0,0,109,111,100,117,108,101,
-    95,114,101,112,114,199,4,0,0,115,2,0,0,0,0,2,
-    117,27,0,0,0,78,97,109,101,115,112,97,99,101,76,111,
-    97,100,101,114,46,109,111,100,117,108,101,95,114,101,112,114,
-    99,2,0,0,0,0,0,0,0,2,0,0,0,3,0,0,
-    0,67,0,0,0,115,32,0,0,0,116,0,0,100,1,0,
-    124,0,0,106,1,0,131,2,0,1,124,0,0,106,1,0,
-    124,1,0,95,2,0,124,1,0,83,40,2,0,0,0,117,
-    24,0,0,0,76,111,97,100,32,97,32,110,97,109,101,115,
-    112,97,99,101,32,109,111,100,117,108,101,46,117,38,0,0,
-    0,110,97,109,101,115,112,97,99,101,32,109,111,100,117,108,
-    101,32,108,111,97,100,101,100,32,119,105,116,104,32,112,97,
-    116,104,32,123,33,114,125,40,3,0,0,0,117,16,0,0,
-    0,95,118,101,114,98,111,115,101,95,109,101,115,115,97,103,
-    101,117,5,0,0,0,95,112,97,116,104,117,8,0,0,0,
-    95,95,112,97,116,104,95,95,40,2,0,0,0,117,4,0,
-    0,0,115,101,108,102,117,6,0,0,0,109,111,100,117,108,
-    101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
-    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
-    98,46,95,98,111,111,116,115,116,114,97,112,62,117,11,0,
-    0,0,108,111,97,100,95,109,111,100,117,108,101,203,4,0,
-    0,115,6,0,0,0,0,3,16,1,12,1,117,27,0,0,
-    0,78,97,109,101,115,112,97,99,101,76,111,97,100,101,114,
-    46,108,111,97,100,95,109,111,100,117,108,101,78,40,8,0,
-    0,0,117,8,0,0,0,95,95,110,97,109,101,95,95,117,
-    10,0,0,0,95,95,109,111,100,117,108,101,95,95,117,12,
-    0,0,0,95,95,113,117,97,108,110,97,109,101,95,95,117,
-    8,0,0,0,95,95,105,110,105,116,95,95,117,11,0,0,
-    0,99,108,97,115,115,109,101,116,104,111,100,117,11,0,0,
-    0,109,111,100,117,108,101,95,114,101,112,114,117,17,0,0,
-    0,109,111,100,117,108,101,95,102,111,114,95,108,111,97,100,
-    101,114,117,11,0,0,0,108,111,97,100,95,109,111,100,117,
-    108,101,40,1,0,0,0,117,10,0,0,0,95,95,108,111,
-    99,97,108,115,95,95,40,0,0,0,0,40,0,0,0,0,
-    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
-    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
-    112,62,117,15,0,0,0,78,97,109,101,115,112,97,99,101,
-    76,111,97,100,101,114,195,4,0,0,115,6,0,0,0,16,
-    1,12,3,18,4,117,15,0,0,0,78,97,109,101,115,112,
-    97,99,101,76,111,97,100,101,114,99,1,0,0,0,0,0,
+    117,15,0,0,0,78,97,109,101,115,112,97,99,101,76,111,
+    97,100,101,114,205,4,0,0,115,6,0,0,0,16,1,12,
+    3,18,4,117,15,0,0,0,78,97,109,101,115,112,97,99,
+    101,76,111,97,100,101,114,115,8,0,0,0,80,89,73,88,
+    1,0,13,10,99,0,0,0,0,0,0,0,0,0,0,0,
+    0,3,0,0,0,67,0,0,0,115,75,0,0,0,116,0,
+    0,106,1,0,106,2,0,114,16,0,100,1,0,83,116,3,
+    0,106,4,0,100,2,0,107,2,0,114,53,0,116,3,0,
+    106,5,0,106,6,0,100,3,0,131,1,0,112,52,0,100,
+    1,0,83,116,3,0,106,5,0,106,6,0,100,4,0,131,
+    1,0,112,74,0,100,1,0,83,40,5,0,0,0,117,53,
+    0,0,0,82,101,116,117,114,110,32,116,104,101,32,110,97,
+    109,101,32,111,102,32,116,104,101,32,100,105,114,101,99,116,
+    111,114,121,32,105,110,100,101,120,32,102,105,108,101,44,32,
+    111,114,32,78,111,110,101,46,78,117,2,0,0,0,110,116,
+    117,17,0,0,0,80,89,84,72,79,78,73,77,80,79,82,
+    84,73,78,68,69,88,115,17,0,0,0,80,89,84,72,79,
+    78,73,77,80,79,82,84,73,78,68,69,88,40,7,0,0,
+    0,117,3,0,0,0,115,121,115,117,5,0,0,0,102,108,
+    97,103,115,117,18,0,0,0,105,103,110,111,114,101,95,101,
+    110,118,105,114,111,110,109,101,110,116,117,3,0,0,0,95,
+    111,115,117,8,0,0,0,95,95,110,97,109,101,95,95,117,
+    7,0,0,0,101,110,118,105,114,111,110,117,3,0,0,0,
+    103,101,116,40,0,0,0,0,40,0,0,0,0,40,0,0,
+    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,117,20,0,0,0,95,112,97,116,104,95,105,
+    110,100,101,120,95,102,105,108,101,110,97,109,101,235,4,0,
+    0,115,10,0,0,0,0,2,12,1,4,1,15,1,22,1,
+    117,20,0,0,0,95,112,97,116,104,95,105,110,100,101,120,
+    95,102,105,108,101,110,97,109,101,99,0,0,0,0,0,0,
+    0,0,5,0,0,0,25,0,0,0,67,0,0,0,115,245,
+    0,0,0,116,0,0,100,1,0,107,8,0,114,241,0,105,
+    0,0,125,0,0,116,1,0,131,0,0,125,1,0,124,1,
+    0,100,1,0,107,9,0,114,232,0,121,43,0,116,2,0,
+    106,3,0,124,1,0,100,2,0,131,2,0,143,19,0,125,
+    2,0,124,2,0,106,4,0,131,0,0,125,3,0,87,100,
+    1,0,81,88,87,110,24,0,4,116,5,0,107,10,0,114,
+    108,0,1,1,1,100,3,0,125,3,0,89,110,1,0,88,
+    124,3,0,100,1,0,116,6,0,116,7,0,131,1,0,133,
+    2,0,25,116,7,0,107,2,0,114,232,0,121,35,0,116,
+    8,0,106,9,0,124,3,0,116,6,0,116,7,0,131,1,
+    0,100,1,0,133,2,0,25,131,1,0,125,4,0,87,110,
+    27,0,4,116,10,0,116,11,0,116,12,0,102,3,0,107,
+    10,0,114,201,0,1,1,1,89,113,229,0,88,116,13,0,
+    124,4,0,116,14,0,131,2,0,114,229,0,124,4,0,125,
+    0,0,113,229,0,113,232,0,110,0,0,124,0,0,97,0,
+    0,110,0,0,116,0,0,83,40,4,0,0,0,117,117,0,
+    0,0,82,101,116,117,114,110,32,116,104,101,32,100,105,114,
+    101,99,116,111,114,121,32,105,110,100,101,120,44,32,114,101,
+    97,100,105,110,103,32,105,116,32,111,110,32,102,105,114,115,
+    116,32,117,115,101,46,10,10,32,32,32,32,65,32,109,105,
+    115,115,105,110,103,32,111,114,32,105,110,118,97,108,105,100,
+    32,105,110,100,101,120,32,102,105,108,101,32,103,105,118,101,
+    115,32,97,110,32,101,109,112,116,121,32,105,110,100,101,120,
+    46,10,10,32,32,32,32,78,117,1,0,0,0,114,115,0,
+    0,0,0,40,15,0,0,0,117,11,0,0,0,95,112,97,
+    116,104,95,105,110,100,101,120,117,20,0,0,0,95,112,97,
+    116,104,95,105,110,100,101,120,95,102,105,108,101,110,97,109,
+    101,117,3,0,0,0,95,105,111,117,6,0,0,0,70,105,
+    108,101,73,79,117,4,0,0,0,114,101,97,100,117,7,0,
+    0,0,79,83,69,114,114,111,114,117,3,0,0,0,108,101,
+    110,117,17,0,0,0,95,80,65,84,72,95,73,78,68,69,
+    88,95,77,65,71,73,67,117,7,0,0,0,109,97,114,115,
+    104,97,108,117,5,0,0,0,108,111,97,100,115,117,8,0,
+    0,0,69,79,70,69,114,114,111,114,117,10,0,0,0,86,
+    97,108,117,101,69,114,114,111,114,117,9,0,0,0,84,121,
+    112,101,69,114,114,111,114,117,10,0,0,0,105,115,105,110,
+    115,116,97,110,99,101,117,4,0,0,0,100,105,99,116,40,
+    5,0,0,0,117,5,0,0,0,105,110,100,101,120,117,8,
+    0,0,0,102,105,108,101,110,97,109,101,117,4,0,0,0,
+    102,105,108,101,117,4,0,0,0,100,97,116,97,117,6,0,
+    0,0,108,111,97,100,101,100,40,0,0,0,0,40,0,0,
+    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,117,15,0,0,0,95,103,101,116,95,112,97,
+    116,104,95,105,110,100,101,120,244,4,0,0,115,36,0,0,
+    0,0,7,12,1,6,1,9,1,12,1,3,1,21,1,22,
+    1,13,1,11,1,28,1,3,1,35,1,22,1,5,2,15,
+    1,15,1,9,1,117,15,0,0,0,95,103,101,116,95,112,
+    97,116,104,95,105,110,100,101,120,99,1,0,0,0,0,0,
     0,0,1,0,0,0,4,0,0,0,66,0,0,0,115,119,
     0,0,0,124,0,0,69,101,0,0,90,1,0,100,0,0,
     90,2,0,100,1,0,90,3,0,101,4,0,100,2,0,100,
@@ -3090,405 +3228,446 @@ unsigned char _Py_M__importlib[] = {
     32,97,110,100,32,112,97,99,107,97,103,101,32,95,95,112,
     97,116,104,95,95,32,97,116,116,114,105,98,117,116,101,115,
     46,99,1,0,0,0,0,0,0,0,2,0,0,0,4,0,
-    0,0,67,0,0,0,115,58,0,0,0,120,51,0,116,0,
-    0,106,1,0,106,2,0,131,0,0,68,93,34,0,125,1,
-    0,116,3,0,124,1,0,100,1,0,131,2,0,114,16,0,
-    124,1,0,106,4,0,131,0,0,1,113,16,0,113,16,0,
-    87,100,2,0,83,40,3,0,0,0,117,125,0,0,0,67,
-    97,108,108,32,116,104,101,32,105,110,118,97,108,105,100,97,
-    116,101,95,99,97,99,104,101,115,40,41,32,109,101,116,104,
-    111,100,32,111,110,32,97,108,108,32,112,97,116,104,32,101,
-    110,116,114,121,32,102,105,110,100,101,114,115,10,32,32,32,
-    32,32,32,32,32,115,116,111,114,101,100,32,105,110,32,115,
-    121,115,46,112,97,116,104,95,105,109,112,111,114,116,101,114,
-    95,99,97,99,104,101,115,32,40,119,104,101,114,101,32,105,
-    109,112,108,101,109,101,110,116,101,100,41,46,117,17,0,0,
-    0,105,110,118,97,108,105,100,97,116,101,95,99,97,99,104,
-    101,115,78,40,5,0,0,0,117,3,0,0,0,115,121,115,
-    117,19,0,0,0,112,97,116,104,95,105,109,112,111,114,116,
-    101,114,95,99,97,99,104,101,117,6,0,0,0,118,97,108,
-    117,101,115,117,7,0,0,0,104,97,115,97,116,116,114,117,
-    17,0,0,0,105,110,118,97,108,105,100,97,116,101,95,99,
-    97,99,104,101,115,40,2,0,0,0,117,3,0,0,0,99,
-    108,115,117,6,0,0,0,102,105,110,100,101,114,40,0,0,
-    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
-    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
-    111,111,116,115,116,114,97,112,62,117,17,0,0,0,105,110,
-    118,97,108,105,100,97,116,101,95,99,97,99,104,101,115,217,
-    4,0,0,115,6,0,0,0,0,4,22,1,15,1,117,28,
-    0,0,0,80,97,116,104,70,105,110,100,101,114,46,105,110,
-    118,97,108,105,100,97,116,101,95,99,97,99,104,101,115,99,
-    2,0,0,0,0,0,0,0,3,0,0,0,12,0,0,0,
-    67,0,0,0,115,94,0,0,0,116,0,0,106,1,0,115,
-    28,0,116,2,0,106,3,0,100,1,0,116,4,0,131,2,
-    0,1,110,0,0,120,59,0,116,0,0,106,1,0,68,93,
-    44,0,125,2,0,121,14,0,124,2,0,124,1,0,131,1,
-    0,83,87,113,38,0,4,116,5,0,107,10,0,114,81,0,
-    1,1,1,119,38,0,89,113,38,0,88,113,38,0,87,100,
-    2,0,83,100,2,0,83,40,3,0,0,0,117,113,0,0,
-    0,83,101,97,114,99,104,32,115,101,113,117,101,110,99,101,
-    32,111,102,32,104,111,111,107,115,32,102,111,114,32,97,32,
-    102,105,110,100,101,114,32,102,111,114,32,39,112,97,116,104,
-    39,46,10,10,32,32,32,32,32,32,32,32,73,102,32,39,
-    104,111,111,107,115,39,32,105,115,32,102,97,108,115,101,32,
-    116,104,101,110,32,117,115,101,32,115,121,115,46,112,97,116,
-    104,95,104,111,111,107,115,46,10,10,32,32,32,32,32,32,
-    32,32,117,23,0,0,0,115,121,115,46,112,97,116,104,95,
-    104,111,111,107,115,32,105,115,32,101,109,112,116,121,78,40,
-    6,0,0,0,117,3,0,0,0,115,121,115,117,10,0,0,
-    0,112,97,116,104,95,104,111,111,107,115,117,9,0,0,0,
-    95,119,97,114,110,105,110,103,115,117,4,0,0,0,119,97,
-    114,110,117,13,0,0,0,73,109,112,111,114,116,87,97,114,
-    110,105,110,103,117,11,0,0,0,73,109,112,111,114,116,69,
-    114,114,111,114,40,3,0,0,0,117,3,0,0,0,99,108,
-    115,117,4,0,0,0,112,97,116,104,117,4,0,0,0,104,
-    111,111,107,40,0,0,0,0,40,0,0,0,0,117,29,0,
-    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
-    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
-    11,0,0,0,95,112,97,116,104,95,104,111,111,107,115,225,
-    4,0,0,115,16,0,0,0,0,7,9,1,19,1,16,1,
-    3,1,14,1,13,1,12,2,117,22,0,0,0,80,97,116,
-    104,70,105,110,100,101,114,46,95,112,97,116,104,95,104,111,
-    111,107,115,99,2,0,0,0,0,0,0,0,3,0,0,0,
-    11,0,0,0,67,0,0,0,115,91,0,0,0,124,1,0,
-    100,1,0,107,2,0,114,21,0,100,2,0,125,1,0,110,
-    0,0,121,17,0,116,0,0,106,1,0,124,1,0,25,125,
-    2,0,87,110,46,0,4,116,2,0,107,10,0,114,86,0,
-    1,1,1,124,0,0,106,3,0,124,1,0,131,1,0,125,
-    2,0,124,2,0,116,0,0,106,1,0,124,1,0,60,89,
-    110,1,0,88,124,2,0,83,40,3,0,0,0,117,210,0,
-    0,0,71,101,116,32,116,104,101,32,102,105,110,100,101,114,
-    32,102,111,114,32,116,104,101,32,112,97,116,104,32,101,110,
-    116,114,121,32,102,114,111,109,32,115,121,115,46,112,97,116,
-    104,95,105,109,112,111,114,116,101,114,95,99,97,99,104,101,
-    46,10,10,32,32,32,32,32,32,32,32,73,102,32,116,104,
-    101,32,112,97,116,104,32,101,110,116,114,121,32,105,115,32,
-    110,111,116,32,105,110,32,116,104,101,32,99,97,99,104,101,
-    44,32,102,105,110,100,32,116,104,101,32,97,112,112,114,111,
-    112,114,105,97,116,101,32,102,105,110,100,101,114,10,32,32,
-    32,32,32,32,32,32,97,110,100,32,99,97,99,104,101,32,
-    105,116,46,32,73,102,32,110,111,32,102,105,110,100,101,114,
-    32,105,115,32,97,118,97,105,108,97,98,108,101,44,32,115,
-    116,111,114,101,32,78,111,110,101,46,10,10,32,32,32,32,
-    32,32,32,32,117,0,0,0,0,117,1,0,0,0,46,40,
-    4,0,0,0,117,3,0,0,0,115,121,115,117,19,0,0,
-    0,112,97,116,104,95,105,109,112,111,114,116,101,114,95,99,
-    97,99,104,101,117,8,0,0,0,75,101,121,69,114,114,111,
-    114,117,11,0,0,0,95,112,97,116,104,95,104,111,111,107,
-    115,40,3,0,0,0,117,3,0,0,0,99,108,115,117,4,
-    0,0,0,112,97,116,104,117,6,0,0,0,102,105,110,100,
-    101,114,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
-    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
-    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,20,
-    0,0,0,95,112,97,116,104,95,105,109,112,111,114,116,101,
-    114,95,99,97,99,104,101,242,4,0,0,115,16,0,0,0,
-    0,8,12,1,9,1,3,1,17,1,13,1,15,1,18,1,
-    117,31,0,0,0,80,97,116,104,70,105,110,100,101,114,46,
-    95,112,97,116,104,95,105,109,112,111,114,116,101,114,95,99,
-    97,99,104,101,99,3,0,0,0,0,0,0,0,8,0,0,
-    0,5,0,0,0,67,0,0,0,115,189,0,0,0,103,0,
-    0,125,3,0,120,176,0,124,2,0,68,93,158,0,125,4,
-    0,116,0,0,124,4,0,116,1,0,116,2,0,102,2,0,
-    131,2,0,115,46,0,113,13,0,110,0,0,124,0,0,106,
-    3,0,124,4,0,131,1,0,125,5,0,124,5,0,100,1,
-    0,107,9,0,114,13,0,116,4,0,124,5,0,100,2,0,
-    131,2,0,114,112,0,124,5,0,106,5,0,124,1,0,131,
-    1,0,92,2,0,125,6,0,125,7,0,110,21,0,124,5,
-    0,106,6,0,124,1,0,131,1,0,125,6,0,103,0,0,
-    125,7,0,124,6,0,100,1,0,107,9,0,114,155,0,124,
-    6,0,124,3,0,102,2,0,83,124,3,0,106,7,0,124,
-    7,0,131,1,0,1,113,13,0,113,13,0,87,100,1,0,
-    124,3,0,102,2,0,83,100,1,0,83,40,3,0,0,0,
-    117,63,0,0,0,70,105,110,100,32,116,104,101,32,108,111,
-    97,100,101,114,32,111,114,32,110,97,109,101,115,112,97,99,
-    101,95,112,97,116,104,32,102,111,114,32,116,104,105,115,32,
-    109,111,100,117,108,101,47,112,97,99,107,97,103,101,32,110,
-    97,109,101,46,78,117,11,0,0,0,102,105,110,100,95,108,
-    111,97,100,101,114,40,8,0,0,0,117,10,0,0,0,105,
-    115,105,110,115,116,97,110,99,101,117,3,0,0,0,115,116,
-    114,117,5,0,0,0,98,121,116,101,115,117,20,0,0,0,
-    95,112,97,116,104,95,105,109,112,111,114,116,101,114,95,99,
-    97,99,104,101,117,7,0,0,0,104,97,115,97,116,116,114,
-    117,11,0,0,0,102,105,110,100,95,108,111,97,100,101,114,
-    117,11,0,0,0,102,105,110,100,95,109,111,100,117,108,101,
-    117,6,0,0,0,101,120,116,101,110,100,40,8,0,0,0,
-    117,3,0,0,0,99,108,115,117,8,0,0,0,102,117,108,
-    108,110,97,109,101,117,4,0,0,0,112,97,116,104,117,14,
-    0,0,0,110,97,109,101,115,112,97,99,101,95,112,97,116,
-    104,117,5,0,0,0,101,110,116,114,121,117,6,0,0,0,
-    102,105,110,100,101,114,117,6,0,0,0,108,111,97,100,101,
-    114,117,8,0,0,0,112,111,114,116,105,111,110,115,40,0,
-    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,11,0,0,0,95,
-    103,101,116,95,108,111,97,100,101,114,3,5,0,0,115,28,
-    0,0,0,0,5,6,1,13,1,21,1,6,1,15,1,12,
-    1,15,1,24,2,15,1,6,1,12,2,10,5,20,2,117,
-    22,0,0,0,80,97,116,104,70,105,110,100,101,114,46,95,
-    103,101,116,95,108,111,97,100,101,114,78,99,3,0,0,0,
-    0,0,0,0,5,0,0,0,4,0,0,0,67,0,0,0,
-    115,97,0,0,0,124,2,0,100,1,0,107,8,0,114,24,
-    0,116,0,0,106,1,0,125,2,0,110,0,0,124,0,0,
-    106,2,0,124,1,0,124,2,0,131,2,0,92,2,0,125,
-    3,0,125,4,0,124,3,0,100,1,0,107,9,0,114,64,
-    0,124,3,0,83,124,4,0,114,89,0,116,3,0,124,1,
-    0,124,4,0,124,0,0,106,2,0,131,3,0,83,100,1,
-    0,83,100,1,0,83,40,2,0,0,0,117,98,0,0,0,
-    70,105,110,100,32,116,104,101,32,109,111,100,117,108,101,32,
-    111,110,32,115,121,115,46,112,97,116,104,32,111,114,32,39,
-    112,97,116,104,39,32,98,97,115,101,100,32,111,110,32,115,
-    121,115,46,112,97,116,104,95,104,111,111,107,115,32,97,110,
-    100,10,32,32,32,32,32,32,32,32,115,121,115,46,112,97,
-    116,104,95,105,109,112,111,114,116,101,114,95,99,97,99,104,
-    101,46,78,40,4,0,0,0,117,3,0,0,0,115,121,115,
-    117,4,0,0,0,112,97,116,104,117,11,0,0,0,95,103,
-    101,116,95,108,111,97,100,101,114,117,15,0,0,0,78,97,
-    109,101,115,112,97,99,101,76,111,97,100,101,114,40,5,0,
-    0,0,117,3,0,0,0,99,108,115,117,8,0,0,0,102,
-    117,108,108,110,97,109,101,117,4,0,0,0,112,97,116,104,
-    117,6,0,0,0,108,111,97,100,101,114,117,14,0,0,0,
-    110,97,109,101,115,112,97,99,101,95,112,97,116,104,40,0,
-    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,11,0,0,0,102,
-    105,110,100,95,109,111,100,117,108,101,30,5,0,0,115,16,
-    0,0,0,0,4,12,1,12,1,24,1,12,1,4,2,6,
-    3,19,2,117,22,0,0,0,80,97,116,104,70,105,110,100,
-    101,114,46,102,105,110,100,95,109,111,100,117,108,101,40,10,
-    0,0,0,117,8,0,0,0,95,95,110,97,109,101,95,95,
-    117,10,0,0,0,95,95,109,111,100,117,108,101,95,95,117,
-    12,0,0,0,95,95,113,117,97,108,110,97,109,101,95,95,
-    117,7,0,0,0,95,95,100,111,99,95,95,117,11,0,0,
-    0,99,108,97,115,115,109,101,116,104,111,100,117,17,0,0,
-    0,105,110,118,97,108,105,100,97,116,101,95,99,97,99,104,
-    101,115,117,11,0,0,0,95,112,97,116,104,95,104,111,111,
-    107,115,117,20,0,0,0,95,112,97,116,104,95,105,109,112,
-    111,114,116,101,114,95,99,97,99,104,101,117,11,0,0,0,
-    95,103,101,116,95,108,111,97,100,101,114,117,11,0,0,0,
-    102,105,110,100,95,109,111,100,117,108,101,40,1,0,0,0,
-    117,10,0,0,0,95,95,108,111,99,97,108,115,95,95,40,
-    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
-    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
-    95,98,111,111,116,115,116,114,97,112,62,117,10,0,0,0,
-    80,97,116,104,70,105,110,100,101,114,213,4,0,0,115,14,
-    0,0,0,16,2,6,2,18,8,18,17,18,17,18,27,3,
-    1,117,10,0,0,0,80,97,116,104,70,105,110,100,101,114,
-    99,1,0,0,0,0,0,0,0,1,0,0,0,3,0,0,
-    0,66,0,0,0,115,110,0,0,0,124,0,0,69,101,0,
-    0,90,1,0,100,0,0,90,2,0,100,1,0,90,3,0,
-    100,2,0,100,3,0,132,0,0,90,4,0,100,4,0,100,
-    5,0,132,0,0,90,5,0,101,6,0,90,7,0,100,6,
-    0,100,7,0,132,0,0,90,8,0,100,8,0,100,9,0,
-    132,0,0,90,9,0,101,10,0,100,10,0,100,11,0,132,
-    0,0,131,1,0,90,11,0,100,12,0,100,13,0,132,0,
-    0,90,12,0,100,14,0,83,40,15,0,0,0,117,10,0,
-    0,0,70,105,108,101,70,105,110,100,101,114,117,172,0,0,
-    0,70,105,108,101,45,98,97,115,101,100,32,102,105,110,100,
-    101,114,46,10,10,32,32,32,32,73,110,116,101,114,97,99,
-    116,105,111,110,115,32,119,105,116,104,32,116,104,101,32,102,
-    105,108,101,32,115,121,115,116,101,109,32,97,114,101,32,99,
-    97,99,104,101,100,32,102,111,114,32,112,101,114,102,111,114,
-    109,97,110,99,101,44,32,98,101,105,110,103,10,32,32,32,
-    32,114,101,102,114,101,115,104,101,100,32,119,104,101,110,32,
-    116,104,101,32,100,105,114,101,99,116,111,114,121,32,116,104,
-    101,32,102,105,110,100,101,114,32,105,115,32,104,97,110,100,
-    108,105,110,103,32,104,97,115,32,98,101,101,110,32,109,111,
-    100,105,102,105,101,100,46,10,10,32,32,32,32,99,2,0,
-    0,0,0,0,0,0,5,0,0,0,5,0,0,0,7,0,
-    0,0,115,122,0,0,0,103,0,0,125,3,0,120,52,0,
-    124,2,0,68,93,44,0,92,2,0,137,0,0,125,4,0,
-    124,3,0,106,0,0,135,0,0,102,1,0,100,1,0,100,
-    2,0,134,0,0,124,4,0,68,131,1,0,131,1,0,1,
-    113,13,0,87,124,3,0,124,0,0,95,1,0,124,1,0,
-    112,79,0,100,3,0,124,0,0,95,2,0,100,6,0,124,
-    0,0,95,3,0,116,4,0,131,0,0,124,0,0,95,5,
-    0,116,4,0,131,0,0,124,0,0,95,6,0,100,5,0,
-    83,40,7,0,0,0,117,201,0,0,0,73,110,105,116,105,
-    97,108,105,122,101,32,119,105,116,104,32,116,104,101,32,112,
-    97,116,104,32,116,111,32,115,101,97,114,99,104,32,111,110,
-    32,97,110,100,32,97,32,118,97,114,105,97,98,108,101,32,
-    110,117,109,98,101,114,32,111,102,10,32,32,32,32,32,32,
-    32,32,51,45,116,117,112,108,101,115,32,99,111,110,116,97,
-    105,110,105,110,103,32,116,104,101,32,108,111,97,100,101,114,
-    44,32,102,105,108,101,32,115,117,102,102,105,120,101,115,32,
-    116,104,101,32,108,111,97,100,101,114,32,114,101,99,111,103,
-    110,105,122,101,115,44,10,32,32,32,32,32,32,32,32,97,
-    110,100,32,97,32,98,111,111,108,101,97,110,32,111,102,32,
-    119,104,101,116,104,101,114,32,116,104,101,32,108,111,97,100,
-    101,114,32,104,97,110,100,108,101,115,32,112,97,99,107,97,
-    103,101,115,46,99,1,0,0,0,0,0,0,0,2,0,0,
-    0,3,0,0,0,51,0,0,0,115,27,0,0,0,124,0,
-    0,93,17,0,125,1,0,124,1,0,136,0,0,102,2,0,
-    86,1,113,3,0,100,0,0,83,40,1,0,0,0,78,40,
-    0,0,0,0,40,2,0,0,0,117,2,0,0,0,46,48,
-    117,6,0,0,0,115,117,102,102,105,120,40,1,0,0,0,
-    117,6,0,0,0,108,111,97,100,101,114,40,0,0,0,0,
-    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
-    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
-    112,62,117,9,0,0,0,60,103,101,110,101,120,112,114,62,
-    63,5,0,0,115,2,0,0,0,6,0,117,38,0,0,0,
-    70,105,108,101,70,105,110,100,101,114,46,95,95,105,110,105,
-    116,95,95,46,60,108,111,99,97,108,115,62,46,60,103,101,
-    110,101,120,112,114,62,117,1,0,0,0,46,105,1,0,0,
-    0,78,105,255,255,255,255,40,7,0,0,0,117,6,0,0,
-    0,101,120,116,101,110,100,117,8,0,0,0,95,108,111,97,
-    100,101,114,115,117,4,0,0,0,112,97,116,104,117,11,0,
-    0,0,95,112,97,116,104,95,109,116,105,109,101,117,3,0,
-    0,0,115,101,116,117,11,0,0,0,95,112,97,116,104,95,
-    99,97,99,104,101,117,19,0,0,0,95,114,101,108,97,120,
-    101,100,95,112,97,116,104,95,99,97,99,104,101,40,5,0,
-    0,0,117,4,0,0,0,115,101,108,102,117,4,0,0,0,
-    112,97,116,104,117,7,0,0,0,100,101,116,97,105,108,115,
-    117,7,0,0,0,108,111,97,100,101,114,115,117,8,0,0,
-    0,115,117,102,102,105,120,101,115,40,0,0,0,0,40,1,
-    0,0,0,117,6,0,0,0,108,111,97,100,101,114,117,29,
+    0,0,67,0,0,0,115,64,0,0,0,100,1,0,97,0,
+    0,120,51,0,116,1,0,106,2,0,106,3,0,131,0,0,
+    68,93,34,0,125,1,0,116,4,0,124,1,0,100,2,0,
+    131,2,0,114,22,0,124,1,0,106,5,0,131,0,0,1,
+    113,22,0,113,22,0,87,100,1,0,83,40,3,0,0,0,
+    117,190,0,0,0,67,97,108,108,32,116,104,101,32,105,110,
+    118,97,108,105,100,97,116,101,95,99,97,99,104,101,115,40,
+    41,32,109,101,116,104,111,100,32,111,110,32,97,108,108,32,
+    112,97,116,104,32,101,110,116,114,121,32,102,105,110,100,101,
+    114,115,10,32,32,32,32,32,32,32,32,115,116,111,114,101,
+    100,32,105,110,32,115,121,115,46,112,97,116,104,95,105,109,
+    112,111,114,116,101,114,95,99,97,99,104,101,115,32,40,119,
+    104,101,114,101,32,105,109,112,108,101,109,101,110,116,101,100,
+    41,44,32,97,110,100,32,102,111,114,103,101,116,10,32,32,
+    32,32,32,32,32,32,116,104,101,32,100,105,114,101,99,116,
+    111,114,121,32,105,110,100,101,120,32,115,111,32,116,104,97,
+    116,32,105,116,32,105,115,32,114,101,97,100,32,97,103,97,
+    105,110,46,78,117,17,0,0,0,105,110,118,97,108,105,100,
+    97,116,101,95,99,97,99,104,101,115,40,6,0,0,0,117,
+    11,0,0,0,95,112,97,116,104,95,105,110,100,101,120,117,
+    3,0,0,0,115,121,115,117,19,0,0,0,112,97,116,104,
+    95,105,109,112,111,114,116,101,114,95,99,97,99,104,101,117,
+    6,0,0,0,118,97,108,117,101,115,117,7,0,0,0,104,
+    97,115,97,116,116,114,117,17,0,0,0,105,110,118,97,108,
+    105,100,97,116,101,95,99,97,99,104,101,115,40,2,0,0,
+    0,117,3,0,0,0,99,108,115,117,6,0,0,0,102,105,
+    110,100,101,114,40,0,0,0,0,40,0,0,0,0,117,29,
     0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
     116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
-    117,8,0,0,0,95,95,105,110,105,116,95,95,57,5,0,
-    0,115,16,0,0,0,0,4,6,1,19,1,36,1,9,2,
-    15,1,9,1,12,1,117,19,0,0,0,70,105,108,101,70,
-    105,110,100,101,114,46,95,95,105,110,105,116,95,95,99,1,
-    0,0,0,0,0,0,0,1,0,0,0,2,0,0,0,67,
-    0,0,0,115,13,0,0,0,100,3,0,124,0,0,95,0,
-    0,100,2,0,83,40,4,0,0,0,117,31,0,0,0,73,
-    110,118,97,108,105,100,97,116,101,32,116,104,101,32,100,105,
-    114,101,99,116,111,114,121,32,109,116,105,109,101,46,105,1,
-    0,0,0,78,105,255,255,255,255,40,1,0,0,0,117,11,
-    0,0,0,95,112,97,116,104,95,109,116,105,109,101,40,1,
-    0,0,0,117,4,0,0,0,115,101,108,102,40,0,0,0,
+    117,17,0,0,0,105,110,118,97,108,105,100,97,116,101,95,
+    99,97,99,104,101,115,22,5,0,0,115,8,0,0,0,0,
+    6,6,1,22,1,15,1,117,28,0,0,0,80,97,116,104,
+    70,105,110,100,101,114,46,105,110,118,97,108,105,100,97,116,
+    101,95,99,97,99,104,101,115,99,2,0,0,0,0,0,0,
+    0,3,0,0,0,12,0,0,0,67,0,0,0,115,94,0,
+    0,0,116,0,0,106,1,0,115,28,0,116,2,0,106,3,
+    0,100,1,0,116,4,0,131,2,0,1,110,0,0,120,59,
+    0,116,0,0,106,1,0,68,93,44,0,125,2,0,121,14,
+    0,124,2,0,124,1,0,131,1,0,83,87,113,38,0,4,
+    116,5,0,107,10,0,114,81,0,1,1,1,119,38,0,89,
+    113,38,0,88,113,38,0,87,100,2,0,83,100,2,0,83,
+    40,3,0,0,0,117,113,0,0,0,83,101,97,114,99,104,
+    32,115,101,113,117,101,110,99,101,32,111,102,32,104,111,111,
+    107,115,32,102,111,114,32,97,32,102,105,110,100,101,114,32,
+    102,111,114,32,39,112,97,116,104,39,46,10,10,32,32,32,
+    32,32,32,32,32,73,102,32,39,104,111,111,107,115,39,32,
+    105,115,32,102,97,108,115,101,32,116,104,101,110,32,117,115,
+    101,32,115,121,115,46,112,97,116,104,95,104,111,111,107,115,
+    46,10,10,32,32,32,32,32,32,32,32,117,23,0,0,0,
+    115,121,115,46,112,97,116,104,95,104,111,111,107,115,32,105,
+    115,32,101,109,112,116,121,78,40,6,0,0,0,117,3,0,
+    0,0,115,121,115,117,10,0,0,0,112,97,116,104,95,104,
+    111,111,107,115,117,9,0,0,0,95,119,97,114,110,105,110,
+    103,115,117,4,0,0,0,119,97,114,110,117,13,0,0,0,
+    73,109,112,111,114,116,87,97,114,110,105,110,103,117,11,0,
+    0,0,73,109,112,111,114,116,69,114,114,111,114,40,3,0,
+    0,0,117,3,0,0,0,99,108,115,117,4,0,0,0,112,
+    97,116,104,117,4,0,0,0,104,111,111,107,40,0,0,0,
     0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
     101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,17,0,0,0,105,110,118,
-    97,108,105,100,97,116,101,95,99,97,99,104,101,115,71,5,
-    0,0,115,2,0,0,0,0,2,117,28,0,0,0,70,105,
-    108,101,70,105,110,100,101,114,46,105,110,118,97,108,105,100,
-    97,116,101,95,99,97,99,104,101,115,99,2,0,0,0,0,
-    0,0,0,12,0,0,0,13,0,0,0,67,0,0,0,115,
-    172,1,0,0,100,1,0,125,2,0,124,1,0,106,0,0,
-    100,2,0,131,1,0,100,3,0,25,125,3,0,121,25,0,
-    116,1,0,106,2,0,124,0,0,106,3,0,131,1,0,106,
-    4,0,125,4,0,87,110,24,0,4,116,5,0,107,10,0,
-    114,76,0,1,1,1,100,8,0,125,4,0,89,110,1,0,
-    88,124,4,0,124,0,0,106,6,0,107,3,0,114,114,0,
-    124,0,0,106,7,0,131,0,0,1,124,4,0,124,0,0,
-    95,6,0,110,0,0,116,8,0,131,0,0,114,147,0,124,
-    0,0,106,9,0,125,5,0,124,3,0,106,10,0,131,0,
-    0,125,6,0,110,15,0,124,0,0,106,11,0,125,5,0,
-    124,3,0,125,6,0,124,6,0,124,5,0,107,6,0,114,
-    45,1,116,12,0,124,0,0,106,3,0,124,3,0,131,2,
-    0,125,7,0,116,13,0,124,7,0,131,1,0,114,45,1,
-    120,91,0,124,0,0,106,14,0,68,93,71,0,92,2,0,
-    125,8,0,125,9,0,100,5,0,124,8,0,23,125,10,0,
-    116,12,0,124,7,0,124,10,0,131,2,0,125,11,0,116,
-    15,0,124,11,0,131,1,0,114,214,0,124,9,0,124,1,
-    0,124,11,0,131,2,0,124,7,0,103,1,0,102,2,0,
-    83,113,214,0,87,100,6,0,125,2,0,113,45,1,110,0,
-    0,120,95,0,124,0,0,106,14,0,68,93,84,0,92,2,
-    0,125,8,0,125,9,0,124,6,0,124,8,0,23,124,5,
-    0,107,6,0,114,55,1,116,12,0,124,0,0,106,3,0,
-    124,3,0,124,8,0,23,131,2,0,125,11,0,116,15,0,
-    124,11,0,131,1,0,114,139,1,124,9,0,124,1,0,124,
-    11,0,131,2,0,103,0,0,102,2,0,83,113,55,1,113,
-    55,1,87,124,2,0,114,162,1,100,7,0,124,7,0,103,
-    1,0,102,2,0,83,100,7,0,103,0,0,102,2,0,83,
-    40,9,0,0,0,117,125,0,0,0,84,114,121,32,116,111,
-    32,102,105,110,100,32,97,32,108,111,97,100,101,114,32,102,
-    111,114,32,116,104,101,32,115,112,101,99,105,102,105,101,100,
-    32,109,111,100,117,108,101,44,32,111,114,32,116,104,101,32,
-    110,97,109,101,115,112,97,99,101,10,32,32,32,32,32,32,
-    32,32,112,97,99,107,97,103,101,32,112,111,114,116,105,111,
-    110,115,46,32,82,101,116,117,114,110,115,32,40,108,111,97,
-    100,101,114,44,32,108,105,115,116,45,111,102,45,112,111,114,
-    116,105,111,110,115,41,46,70,117,1,0,0,0,46,105,2,
-    0,0,0,105,1,0,0,0,117,8,0,0,0,95,95,105,
-    110,105,116,95,95,84,78,105,255,255,255,255,40,16,0,0,
-    0,117,10,0,0,0,114,112,97,114,116,105,116,105,111,110,
-    117,3,0,0,0,95,111,115,117,4,0,0,0,115,116,97,
-    116,117,4,0,0,0,112,97,116,104,117,8,0,0,0,115,
-    116,95,109,116,105,109,101,117,7,0,0,0,79,83,69,114,
-    114,111,114,117,11,0,0,0,95,112,97,116,104,95,109,116,
-    105,109,101,117,11,0,0,0,95,102,105,108,108,95,99,97,
-    99,104,101,117,11,0,0,0,95,114,101,108,97,120,95,99,
-    97,115,101,117,19,0,0,0,95,114,101,108,97,120,101,100,
-    95,112,97,116,104,95,99,97,99,104,101,117,5,0,0,0,
-    108,111,119,101,114,117,11,0,0,0,95,112,97,116,104,95,
-    99,97,99,104,101,117,10,0,0,0,95,112,97,116,104,95,
-    106,111,105,110,117,11,0,0,0,95,112,97,116,104,95,105,
-    115,100,105,114,117,8,0,0,0,95,108,111,97,100,101,114,
-    115,117,12,0,0,0,95,112,97,116,104,95,105,115,102,105,
-    108,101,40,12,0,0,0,117,4,0,0,0,115,101,108,102,
-    117,8,0,0,0,102,117,108,108,110,97,109,101,117,12,0,
-    0,0,105,115,95,110,97,109,101,115,112,97,99,101,117,11,
-    0,0,0,116,97,105,108,95,109,111,100,117,108,101,117,5,
-    0,0,0,109,116,105,109,101,117,5,0,0,0,99,97,99,
-    104,101,117,12,0,0,0,99,97,99,104,101,95,109,111,100,
-    117,108,101,117,9,0,0,0,98,97,115,101,95,112,97,116,
-    104,117,6,0,0,0,115,117,102,102,105,120,117,6,0,0,
-    0,108,111,97,100,101,114,117,13,0,0,0,105,110,105,116,
-    95,102,105,108,101,110,97,109,101,117,9,0,0,0,102,117,
-    108,108,95,112,97,116,104,40,0,0,0,0,40,0,0,0,
+    111,116,115,116,114,97,112,62,117,11,0,0,0,95,112,97,
+    116,104,95,104,111,111,107,115,33,5,0,0,115,16,0,0,
+    0,0,7,9,1,19,1,16,1,3,1,14,1,13,1,12,
+    2,117,22,0,0,0,80,97,116,104,70,105,110,100,101,114,
+    46,95,112,97,116,104,95,104,111,111,107,115,99,2,0,0,
+    0,0,0,0,0,3,0,0,0,11,0,0,0,67,0,0,
+    0,115,91,0,0,0,124,1,0,100,1,0,107,2,0,114,
+    21,0,100,2,0,125,1,0,110,0,0,121,17,0,116,0,
+    0,106,1,0,124,1,0,25,125,2,0,87,110,46,0,4,
+    116,2,0,107,10,0,114,86,0,1,1,1,124,0,0,106,
+    3,0,124,1,0,131,1,0,125,2,0,124,2,0,116,0,
+    0,106,1,0,124,1,0,60,89,110,1,0,88,124,2,0,
+    83,40,3,0,0,0,117,210,0,0,0,71,101,116,32,116,
+    104,101,32,102,105,110,100,101,114,32,102,111,114,32,116,104,
+    101,32,112,97,116,104,32,101,110,116,114,121,32,102,114,111,
+    109,32,115,121,115,46,112,97,116,104,95,105,109,112,111,114,
+    116,101,114,95,99,97,99,104,101,46,10,10,32,32,32,32,
+    32,32,32,32,73,102,32,116,104,101,32,112,97,116,104,32,
+    101,110,116,114,121,32,105,115,32,110,111,116,32,105,110,32,
+    116,104,101,32,99,97,99,104,101,44,32,102,105,110,100,32,
+    116,104,101,32,97,112,112,114,111,112,114,105,97,116,101,32,
+    102,105,110,100,101,114,10,32,32,32,32,32,32,32,32,97,
+    110,100,32,99,97,99,104,101,32,105,116,46,32,73,102,32,
+    110,111,32,102,105,110,100,101,114,32,105,115,32,97,118,97,
+    105,108,97,98,108,101,44,32,115,116,111,114,101,32,78,111,
+    110,101,46,10,10,32,32,32,32,32,32,32,32,117,0,0,
+    0,0,117,1,0,0,0,46,40,4,0,0,0,117,3,0,
+    0,0,115,121,115,117,19,0,0,0,112,97,116,104,95,105,
+    109,112,111,114,116,101,114,95,99,97,99,104,101,117,8,0,
+    0,0,75,101,121,69,114,114,111,114,117,11,0,0,0,95,
+    112,97,116,104,95,104,111,111,107,115,40,3,0,0,0,117,
+    3,0,0,0,99,108,115,117,4,0,0,0,112,97,116,104,
+    117,6,0,0,0,102,105,110,100,101,114,40,0,0,0,0,
+    40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
+    110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
+    116,115,116,114,97,112,62,117,20,0,0,0,95,112,97,116,
+    104,95,105,109,112,111,114,116,101,114,95,99,97,99,104,101,
+    50,5,0,0,115,16,0,0,0,0,8,12,1,9,1,3,
+    1,17,1,13,1,15,1,18,1,117,31,0,0,0,80,97,
+    116,104,70,105,110,100,101,114,46,95,112,97,116,104,95,105,
+    109,112,111,114,116,101,114,95,99,97,99,104,101,99,3,0,
+    0,0,0,0,0,0,8,0,0,0,5,0,0,0,67,0,
+    0,0,115,189,0,0,0,103,0,0,125,3,0,120,176,0,
+    124,2,0,68,93,158,0,125,4,0,116,0,0,124,4,0,
+    116,1,0,116,2,0,102,2,0,131,2,0,115,46,0,113,
+    13,0,110,0,0,124,0,0,106,3,0,124,4,0,131,1,
+    0,125,5,0,124,5,0,100,1,0,107,9,0,114,13,0,
+    116,4,0,124,5,0,100,2,0,131,2,0,114,112,0,124,
+    5,0,106,5,0,124,1,0,131,1,0,92,2,0,125,6,
+    0,125,7,0,110,21,0,124,5,0,106,6,0,124,1,0,
+    131,1,0,125,6,0,103,0,0,125,7,0,124,6,0,100,
+    1,0,107,9,0,114,155,0,124,6,0,124,3,0,102,2,
+    0,83,124,3,0,106,7,0,124,7,0,131,1,0,1,113,
+    13,0,113,13,0,87,100,1,0,124,3,0,102,2,0,83,
+    100,1,0,83,40,3,0,0,0,117,63,0,0,0,70,105,
+    110,100,32,116,104,101,32,108,111,97,100,101,114,32,111,114,
+    32,110,97,109,101,115,112,97,99,101,95,112,97,116,104,32,
+    102,111,114,32,116,104,105,115,32,109,111,100,117,108,101,47,
+    112,97,99,107,97,103,101,32,110,97,109,101,46,78,117,11,
+    0,0,0,102,105,110,100,95,108,111,97,100,101,114,40,8,
+    0,0,0,117,10,0,0,0,105,115,105,110,115,116,97,110,
+    99,101,117,3,0,0,0,115,116,114,117,5,0,0,0,98,
+    121,116,101,115,117,20,0,0,0,95,112,97,116,104,95,105,
+    109,112,111,114,116,101,114,95,99,97,99,104,101,117,7,0,
+    0,0,104,97,115,97,116,116,114,117,11,0,0,0,102,105,
+    110,100,95,108,111,97,100,101,114,117,11,0,0,0,102,105,
+    110,100,95,109,111,100,117,108,101,117,6,0,0,0,101,120,
+    116,101,110,100,40,8,0,0,0,117,3,0,0,0,99,108,
+    115,117,8,0,0,0,102,117,108,108,110,97,109,101,117,4,
+    0,0,0,112,97,116,104,117,14,0,0,0,110,97,109,101,
+    115,112,97,99,101,95,112,97,116,104,117,5,0,0,0,101,
+    110,116,114,121,117,6,0,0,0,102,105,110,100,101,114,117,
+    6,0,0,0,108,111,97,100,101,114,117,8,0,0,0,112,
+    111,114,116,105,111,110,115,40,0,0,0,0,40,0,0,0,
+    0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
+    112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
+    97,112,62,117,11,0,0,0,95,103,101,116,95,108,111,97,
+    100,101,114,67,5,0,0,115,28,0,0,0,0,5,6,1,
+    13,1,21,1,6,1,15,1,12,1,15,1,24,2,15,1,
+    6,1,12,2,10,5,20,2,117,22,0,0,0,80,97,116,
+    104,70,105,110,100,101,114,46,95,103,101,116,95,108,111,97,
+    100,101,114,78,99,3,0,0,0,0,0,0,0,5,0,0,
+    0,4,0,0,0,67,0,0,0,115,97,0,0,0,124,2,
+    0,100,1,0,107,8,0,114,24,0,116,0,0,106,1,0,
+    125,2,0,110,0,0,124,0,0,106,2,0,124,1,0,124,
+    2,0,131,2,0,92,2,0,125,3,0,125,4,0,124,3,
+    0,100,1,0,107,9,0,114,64,0,124,3,0,83,124,4,
+    0,114,89,0,116,3,0,124,1,0,124,4,0,124,0,0,
+    106,2,0,131,3,0,83,100,1,0,83,100,1,0,83,40,
+    2,0,0,0,117,98,0,0,0,70,105,110,100,32,116,104,
+    101,32,109,111,100,117,108,101,32,111,110,32,115,121,115,46,
+    112,97,116,104,32,111,114,32,39,112,97,116,104,39,32,98,
+    97,115,101,100,32,111,110,32,115,121,115,46,112,97,116,104,
+    95,104,111,111,107,115,32,97,110,100,10,32,32,32,32,32,
+    32,32,32,115,121,115,46,112,97,116,104,95,105,109,112,111,
+    114,116,101,114,95,99,97,99,104,101,46,78,40,4,0,0,
+    0,117,3,0,0,0,115,121,115,117,4,0,0,0,112,97,
+    116,104,117,11,0,0,0,95,103,101,116,95,108,111,97,100,
+    101,114,117,15,0,0,0,78,97,109,101,115,112,97,99,101,
+    76,111,97,100,101,114,40,5,0,0,0,117,3,0,0,0,
+    99,108,115,117,8,0,0,0,102,117,108,108,110,97,109,101,
+    117,4,0,0,0,112,97,116,104,117,6,0,0,0,108,111,
+    97,100,101,114,117,14,0,0,0,110,97,109,101,115,112,97,
+    99,101,95,112,97,116,104,40,0,0,0,0,40,0,0,0,
     0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
     112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
-    97,112,62,117,11,0,0,0,102,105,110,100,95,108,111,97,
-    100,101,114,77,5,0,0,115,62,0,0,0,0,3,6,1,
-    19,1,3,1,25,1,13,1,11,1,15,1,10,1,12,2,
-    9,1,9,1,15,2,9,1,6,2,12,1,18,1,12,1,
-    22,1,10,1,15,1,12,1,26,4,12,2,22,1,16,1,
-    22,1,12,1,26,1,6,1,13,1,117,22,0,0,0,70,
-    105,108,101,70,105,110,100,101,114,46,102,105,110,100,95,108,
-    111,97,100,101,114,99,1,0,0,0,0,0,0,0,9,0,
-    0,0,12,0,0,0,67,0,0,0,115,255,0,0,0,124,
-    0,0,106,0,0,125,1,0,121,19,0,116,1,0,106,2,
-    0,124,1,0,131,1,0,125,2,0,87,110,24,0,4,116,
-    3,0,107,10,0,114,54,0,1,1,1,103,0,0,125,2,
-    0,89,110,1,0,88,116,4,0,106,5,0,106,6,0,100,
-    1,0,131,1,0,115,91,0,116,7,0,124,2,0,131,1,
-    0,124,0,0,95,8,0,110,111,0,116,7,0,131,0,0,
-    125,3,0,120,90,0,124,2,0,68,93,82,0,125,4,0,
-    124,4,0,106,9,0,100,2,0,131,1,0,92,3,0,125,
-    5,0,125,6,0,125,7,0,124,6,0,114,170,0,100,3,
-    0,106,10,0,124,5,0,124,7,0,106,11,0,131,0,0,
-    131,2,0,125,8,0,110,6,0,124,5,0,125,8,0,124,
-    3,0,106,12,0,124,8,0,131,1,0,1,113,107,0,87,
-    124,3,0,124,0,0,95,8,0,116,4,0,106,5,0,106,
-    6,0,116,13,0,131,1,0,114,251,0,116,7,0,100,4,
-    0,100,5,0,132,0,0,124,2,0,68,131,1,0,131,1,
-    0,124,0,0,95,14,0,110,0,0,100,6,0,83,40,7,
-    0,0,0,117,68,0,0,0,70,105,108,108,32,116,104,101,
+    97,112,62,117,11,0,0,0,102,105,110,100,95,109,111,100,
+    117,108,101,94,5,0,0,115,16,0,0,0,0,4,12,1,
+    12,1,24,1,12,1,4,2,6,3,19,2,117,22,0,0,
+    0,80,97,116,104,70,105,110,100,101,114,46,102,105,110,100,
+    95,109,111,100,117,108,101,40,10,0,0,0,117,8,0,0,
+    0,95,95,110,97,109,101,95,95,117,10,0,0,0,95,95,
+    109,111,100,117,108,101,95,95,117,12,0,0,0,95,95,113,
+    117,97,108,110,97,109,101,95,95,117,7,0,0,0,95,95,
+    100,111,99,95,95,117,11,0,0,0,99,108,97,115,115,109,
+    101,116,104,111,100,117,17,0,0,0,105,110,118,97,108,105,
+    100,97,116,101,95,99,97,99,104,101,115,117,11,0,0,0,
+    95,112,97,116,104,95,104,111,111,107,115,117,20,0,0,0,
+    95,112,97,116,104,95,105,109,112,111,114,116,101,114,95,99,
+    97,99,104,101,117,11,0,0,0,95,103,101,116,95,108,111,
+    97,100,101,114,117,11,0,0,0,102,105,110,100,95,109,111,
+    100,117,108,101,40,1,0,0,0,117,10,0,0,0,95,95,
+    108,111,99,97,108,115,95,95,40,0,0,0,0,40,0,0,
+    0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,117,10,0,0,0,80,97,116,104,70,105,110,
+    100,101,114,18,5,0,0,115,14,0,0,0,16,2,6,2,
+    18,11,18,17,18,17,18,27,3,1,117,10,0,0,0,80,
+    97,116,104,70,105,110,100,101,114,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,3,0,0,0,66,0,0,0,115,113,
+    0,0,0,124,0,0,69,101,0,0,90,1,0,100,0,0,
+    90,2,0,100,1,0,90,3,0,100,2,0,100,3,0,132,
+    0,0,90,4,0,100,4,0,100,5,0,132,0,0,90,5,
+    0,101,6,0,90,7,0,100,6,0,100,7,0,132,0,0,
+    90,8,0,100,8,0,100,9,0,100,10,0,132,1,0,90,
+    9,0,101,10,0,100,11,0,100,12,0,132,0,0,131,1,
+    0,90,11,0,100,13,0,100,14,0,132,0,0,90,12,0,
+    100,8,0,83,40,15,0,0,0,117,10,0,0,0,70,105,
+    108,101,70,105,110,100,101,114,117,172,0,0,0,70,105,108,
+    101,45,98,97,115,101,100,32,102,105,110,100,101,114,46,10,
+    10,32,32,32,32,73,110,116,101,114,97,99,116,105,111,110,
+    115,32,119,105,116,104,32,116,104,101,32,102,105,108,101,32,
+    115,121,115,116,101,109,32,97,114,101,32,99,97,99,104,101,
+    100,32,102,111,114,32,112,101,114,102,111,114,109,97,110,99,
+    101,44,32,98,101,105,110,103,10,32,32,32,32,114,101,102,
+    114,101,115,104,101,100,32,119,104,101,110,32,116,104,101,32,
+    100,105,114,101,99,116,111,114,121,32,116,104,101,32,102,105,
+    110,100,101,114,32,105,115,32,104,97,110,100,108,105,110,103,
+    32,104,97,115,32,98,101,101,110,32,109,111,100,105,102,105,
+    101,100,46,10,10,32,32,32,32,99,2,0,0,0,0,0,
+    0,0,5,0,0,0,5,0,0,0,7,0,0,0,115,140,
+    0,0,0,103,0,0,125,3,0,120,52,0,124,2,0,68,
+    93,44,0,92,2,0,137,0,0,125,4,0,124,3,0,106,
+    0,0,135,0,0,102,1,0,100,1,0,100,2,0,134,0,
+    0,124,4,0,68,131,1,0,131,1,0,1,113,13,0,87,
+    124,3,0,124,0,0,95,1,0,124,1,0,112,79,0,100,
+    3,0,124,0,0,95,2,0,100,6,0,124,0,0,95,3,
+    0,116,4,0,131,0,0,124,0,0,95,5,0,116,4,0,
+    131,0,0,124,0,0,95,6,0,100,5,0,124,0,0,95,
+    7,0,100,5,0,124,0,0,95,8,0,100,5,0,83,40,
+    7,0,0,0,117,201,0,0,0,73,110,105,116,105,97,108,
+    105,122,101,32,119,105,116,104,32,116,104,101,32,112,97,116,
+    104,32,116,111,32,115,101,97,114,99,104,32,111,110,32,97,
+    110,100,32,97,32,118,97,114,105,97,98,108,101,32,110,117,
+    109,98,101,114,32,111,102,10,32,32,32,32,32,32,32,32,
+    51,45,116,117,112,108,101,115,32,99,111,110,116,97,105,110,
+    105,110,103,32,116,104,101,32,108,111,97,100,101,114,44,32,
+    102,105,108,101,32,115,117,102,102,105,120,101,115,32,116,104,
+    101,32,108,111,97,100,101,114,32,114,101,99,111,103,110,105,
+    122,101,115,44,10,32,32,32,32,32,32,32,32,97,110,100,
+    32,97,32,98,111,111,108,101,97,110,32,111,102,32,119,104,
+    101,116,104,101,114,32,116,104,101,32,108,111,97,100,101,114,
+    32,104,97,110,100,108,101,115,32,112,97,99,107,97,103,101,
+    115,46,99,1,0,0,0,0,0,0,0,2,0,0,0,3,
+    0,0,0,51,0,0,0,115,27,0,0,0,124,0,0,93,
+    17,0,125,1,0,124,1,0,136,0,0,102,2,0,86,1,
+    113,3,0,100,0,0,83,40,1,0,0,0,78,40,0,0,
+    0,0,40,2,0,0,0,117,2,0,0,0,46,48,117,6,
+    0,0,0,115,117,102,102,105,120,40,1,0,0,0,117,6,
+    0,0,0,108,111,97,100,101,114,40,0,0,0,0,117,29,
+    0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
+    116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
+    117,9,0,0,0,60,103,101,110,101,120,112,114,62,127,5,
+    0,0,115,2,0,0,0,6,0,117,38,0,0,0,70,105,
+    108,101,70,105,110,100,101,114,46,95,95,105,110,105,116,95,
+    95,46,60,108,111,99,97,108,115,62,46,60,103,101,110,101,
+    120,112,114,62,117,1,0,0,0,46,105,1,0,0,0,78,
+    105,255,255,255,255,40,9,0,0,0,117,6,0,0,0,101,
+    120,116,101,110,100,117,8,0,0,0,95,108,111,97,100,101,
+    114,115,117,4,0,0,0,112,97,116,104,117,11,0,0,0,
+    95,112,97,116,104,95,109,116,105,109,101,117,3,0,0,0,
+    115,101,116,117,11,0,0,0,95,112,97,116,104,95,99,97,
+    99,104,101,117,19,0,0,0,95,114,101,108,97,120,101,100,
+    95,112,97,116,104,95,99,97,99,104,101,117,11,0,0,0,
+    95,112,97,116,104,95,102,105,108,101,115,117,10,0,0,0,
+    95,112,97,116,104,95,100,105,114,115,40,5,0,0,0,117,
+    4,0,0,0,115,101,108,102,117,4,0,0,0,112,97,116,
+    104,117,7,0,0,0,100,101,116,97,105,108,115,117,7,0,
+    0,0,108,111,97,100,101,114,115,117,8,0,0,0,115,117,
+    102,102,105,120,101,115,40,0,0,0,0,40,1,0,0,0,
+    117,6,0,0,0,108,111,97,100,101,114,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,8,0,
+    0,0,95,95,105,110,105,116,95,95,121,5,0,0,115,20,
+    0,0,0,0,4,6,1,19,1,36,1,9,2,15,1,9,
+    1,12,1,12,3,9,1,117,19,0,0,0,70,105,108,101,
+    70,105,110,100,101,114,46,95,95,105,110,105,116,95,95,99,
+    1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,0,
+    67,0,0,0,115,13,0,0,0,100,3,0,124,0,0,95,
+    0,0,100,2,0,83,40,4,0,0,0,117,31,0,0,0,
+    73,110,118,97,108,105,100,97,116,101,32,116,104,101,32,100,
+    105,114,101,99,116,111,114,121,32,109,116,105,109,101,46,105,
+    1,0,0,0,78,105,255,255,255,255,40,1,0,0,0,117,
+    11,0,0,0,95,112,97,116,104,95,109,116,105,109,101,40,
+    1,0,0,0,117,4,0,0,0,115,101,108,102,40,0,0,
+    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
+    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
+    111,111,116,115,116,114,97,112,62,117,17,0,0,0,105,110,
+    118,97,108,105,100,97,116,101,95,99,97,99,104,101,115,139,
+    5,0,0,115,2,0,0,0,0,2,117,28,0,0,0,70,
+    105,108,101,70,105,110,100,101,114,46,105,110,118,97,108,105,
+    100,97,116,101,95,99,97,99,104,101,115,99,2,0,0,0,
+    0,0,0,0,13,0,0,0,13,0,0,0,67,0,0,0,
+    115,242,1,0,0,100,1,0,125,2,0,124,1,0,106,0,
+    0,100,2,0,131,1,0,100,3,0,25,125,3,0,121,25,
+    0,116,1,0,106,2,0,124,0,0,106,3,0,131,1,0,
+    106,4,0,125,4,0,87,110,24,0,4,116,5,0,107,10,
+    0,114,76,0,1,1,1,100,8,0,125,4,0,89,110,1,
+    0,88,124,4,0,124,0,0,106,6,0,107,3,0,114,117,
+    0,124,0,0,106,7,0,124,4,0,131,1,0,1,124,4,
+    0,124,0,0,95,6,0,110,0,0,116,8,0,131,0,0,
+    114,156,0,124,0,0,106,9,0,125,5,0,124,3,0,106,
+    10,0,131,0,0,125,6,0,100,1,0,125,7,0,110,30,
+    0,124,0,0,106,11,0,125,5,0,124,3,0,125,6,0,
+    124,0,0,106,12,0,100,5,0,107,9,0,125,7,0,124,
+    6,0,124,5,0,107,6,0,114,90,1,116,13,0,124,0,
+    0,106,3,0,124,3,0,131,2,0,125,8,0,124,7,0,
+    114,237,0,124,6,0,124,0,0,106,12,0,107,6,0,110,
+    9,0,116,14,0,124,8,0,131,1,0,114,90,1,120,91,
+    0,124,0,0,106,15,0,68,93,71,0,92,2,0,125,9,
+    0,125,10,0,100,6,0,124,9,0,23,125,11,0,116,13,
+    0,124,8,0,124,11,0,131,2,0,125,12,0,116,16,0,
+    124,12,0,131,1,0,114,3,1,124,10,0,124,1,0,124,
+    12,0,131,2,0,124,8,0,103,1,0,102,2,0,83,113,
+    3,1,87,100,7,0,125,2,0,113,90,1,110,0,0,120,
+    120,0,124,0,0,106,15,0,68,93,109,0,92,2,0,125,
+    9,0,125,10,0,124,6,0,124,9,0,23,124,5,0,107,
+    6,0,114,100,1,116,13,0,124,0,0,106,3,0,124,3,
+    0,124,9,0,23,131,2,0,125,12,0,124,7,0,114,175,
+    1,124,6,0,124,9,0,23,124,0,0,106,17,0,107,6,
+    0,110,9,0,116,16,0,124,12,0,131,1,0,114,209,1,
+    124,10,0,124,1,0,124,12,0,131,2,0,103,0,0,102,
+    2,0,83,113,100,1,113,100,1,87,124,2,0,114,232,1,
+    100,5,0,124,8,0,103,1,0,102,2,0,83,100,5,0,
+    103,0,0,102,2,0,83,40,9,0,0,0,117,125,0,0,
+    0,84,114,121,32,116,111,32,102,105,110,100,32,97,32,108,
+    111,97,100,101,114,32,102,111,114,32,116,104,101,32,115,112,
+    101,99,105,102,105,101,100,32,109,111,100,117,108,101,44,32,
+    111,114,32,116,104,101,32,110,97,109,101,115,112,97,99,101,
+    10,32,32,32,32,32,32,32,32,112,97,99,107,97,103,101,
+    32,112,111,114,116,105,111,110,115,46,32,82,101,116,117,114,
+    110,115,32,40,108,111,97,100,101,114,44,32,108,105,115,116,
+    45,111,102,45,112,111,114,116,105,111,110,115,41,46,70,117,
+    1,0,0,0,46,105,2,0,0,0,105,1,0,0,0,78,
+    117,8,0,0,0,95,95,105,110,105,116,95,95,84,105,255,
+    255,255,255,40,18,0,0,0,117,10,0,0,0,114,112,97,
+    114,116,105,116,105,111,110,117,3,0,0,0,95,111,115,117,
+    4,0,0,0,115,116,97,116,117,4,0,0,0,112,97,116,
+    104,117,8,0,0,0,115,116,95,109,116,105,109,101,117,7,
+    0,0,0,79,83,69,114,114,111,114,117,11,0,0,0,95,
+    112,97,116,104,95,109,116,105,109,101,117,11,0,0,0,95,
+    102,105,108,108,95,99,97,99,104,101,117,11,0,0,0,95,
+    114,101,108,97,120,95,99,97,115,101,117,19,0,0,0,95,
+    114,101,108,97,120,101,100,95,112,97,116,104,95,99,97,99,
+    104,101,117,5,0,0,0,108,111,119,101,114,117,11,0,0,
+    0,95,112,97,116,104,95,99,97,99,104,101,117,10,0,0,
+    0,95,112,97,116,104,95,100,105,114,115,117,10,0,0,0,
+    95,112,97,116,104,95,106,111,105,110,117,11,0,0,0,95,
+    112,97,116,104,95,105,115,100,105,114,117,8,0,0,0,95,
+    108,111,97,100,101,114,115,117,12,0,0,0,95,112,97,116,
+    104,95,105,115,102,105,108,101,117,11,0,0,0,95,112,97,
+    116,104,95,102,105,108,101,115,40,13,0,0,0,117,4,0,
+    0,0,115,101,108,102,117,8,0,0,0,102,117,108,108,110,
+    97,109,101,117,12,0,0,0,105,115,95,110,97,109,101,115,
+    112,97,99,101,117,11,0,0,0,116,97,105,108,95,109,111,
+    100,117,108,101,117,5,0,0,0,109,116,105,109,101,117,5,
+    0,0,0,99,97,99,104,101,117,12,0,0,0,99,97,99,
+    104,101,95,109,111,100,117,108,101,117,7,0,0,0,105,110,
+    100,101,120,101,100,117,9,0,0,0,98,97,115,101,95,112,
+    97,116,104,117,6,0,0,0,115,117,102,102,105,120,117,6,
+    0,0,0,108,111,97,100,101,114,117,13,0,0,0,105,110,
+    105,116,95,102,105,108,101,110,97,109,101,117,9,0,0,0,
+    102,117,108,108,95,112,97,116,104,40,0,0,0,0,40,0,
+    0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,32,
+    105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,
+    116,114,97,112,62,117,11,0,0,0,102,105,110,100,95,108,
+    111,97,100,101,114,145,5,0,0,115,70,0,0,0,0,3,
+    6,1,19,1,3,1,25,1,13,1,11,1,15,1,13,1,
+    12,2,9,1,9,1,12,1,9,2,9,1,6,1,15,2,
+    12,1,18,1,21,1,12,1,22,1,10,1,15,1,12,1,
+    26,4,12,2,22,1,16,1,22,1,25,1,12,1,26,1,
+    6,1,13,1,117,22,0,0,0,70,105,108,101,70,105,110,
+    100,101,114,46,102,105,110,100,95,108,111,97,100,101,114,78,
+    99,2,0,0,0,0,0,0,0,11,0,0,0,13,0,0,
+    0,67,0,0,0,115,148,1,0,0,124,0,0,106,0,0,
+    125,2,0,100,1,0,4,124,0,0,95,1,0,124,0,0,
+    95,2,0,124,1,0,100,1,0,107,9,0,114,55,0,116,
+    3,0,131,0,0,106,4,0,124,2,0,131,1,0,110,3,
+    0,100,1,0,125,3,0,124,3,0,100,1,0,107,9,0,
+    114,158,0,124,3,0,100,2,0,25,124,1,0,107,2,0,
+    114,158,0,124,3,0,100,3,0,25,124,3,0,100,4,0,
+    25,66,125,4,0,116,5,0,106,6,0,106,7,0,100,5,
+    0,131,1,0,115,204,0,124,3,0,100,3,0,25,124,3,
+    0,100,4,0,25,2,124,0,0,95,1,0,124,0,0,95,
+    2,0,113,204,0,110,46,0,121,19,0,116,8,0,106,9,
+    0,124,2,0,131,1,0,125,4,0,87,110,24,0,4,116,
+    10,0,107,10,0,114,203,0,1,1,1,103,0,0,125,4,
+    0,89,110,1,0,88,116,5,0,106,6,0,106,7,0,100,
+    5,0,131,1,0,115,240,0,116,11,0,124,4,0,131,1,
+    0,124,0,0,95,12,0,110,111,0,116,11,0,131,0,0,
+    125,5,0,120,90,0,124,4,0,68,93,82,0,125,6,0,
+    124,6,0,106,13,0,100,6,0,131,1,0,92,3,0,125,
+    7,0,125,8,0,125,9,0,124,8,0,114,63,1,100,7,
+    0,106,14,0,124,7,0,124,9,0,106,15,0,131,0,0,
+    131,2,0,125,10,0,110,6,0,124,7,0,125,10,0,124,
+    5,0,106,16,0,124,10,0,131,1,0,1,113,0,1,87,
+    124,5,0,124,0,0,95,12,0,116,5,0,106,6,0,106,
+    7,0,116,17,0,131,1,0,114,144,1,116,11,0,100,8,
+    0,100,9,0,132,0,0,124,4,0,68,131,1,0,131,1,
+    0,124,0,0,95,18,0,110,0,0,100,1,0,83,40,10,
+    0,0,0,117,214,0,0,0,70,105,108,108,32,116,104,101,
     32,99,97,99,104,101,32,111,102,32,112,111,116,101,110,116,
     105,97,108,32,109,111,100,117,108,101,115,32,97,110,100,32,
     112,97,99,107,97,103,101,115,32,102,111,114,32,116,104,105,
-    115,32,100,105,114,101,99,116,111,114,121,46,117,3,0,0,
-    0,119,105,110,117,1,0,0,0,46,117,5,0,0,0,123,
-    125,46,123,125,99,1,0,0,0,0,0,0,0,2,0,0,
-    0,2,0,0,0,115,0,0,0,115,27,0,0,0,124,0,
-    0,93,17,0,125,1,0,124,1,0,106,0,0,131,0,0,
-    86,1,113,3,0,100,0,0,83,40,1,0,0,0,78,40,
-    1,0,0,0,117,5,0,0,0,108,111,119,101,114,40,2,
-    0,0,0,117,2,0,0,0,46,48,117,2,0,0,0,102,
-    110,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
-    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
-    98,46,95,98,111,111,116,115,116,114,97,112,62,117,9,0,
-    0,0,60,103,101,110,101,120,112,114,62,147,5,0,0,115,
-    2,0,0,0,6,0,117,41,0,0,0,70,105,108,101,70,
-    105,110,100,101,114,46,95,102,105,108,108,95,99,97,99,104,
-    101,46,60,108,111,99,97,108,115,62,46,60,103,101,110,101,
-    120,112,114,62,78,40,15,0,0,0,117,4,0,0,0,112,
-    97,116,104,117,3,0,0,0,95,111,115,117,7,0,0,0,
+    115,32,100,105,114,101,99,116,111,114,121,46,10,10,32,32,
+    32,32,32,32,32,32,73,102,32,116,104,101,32,100,105,114,
+    101,99,116,111,114,121,32,105,110,100,101,120,32,104,97,115,
+    32,97,110,32,101,110,116,114,121,32,102,111,114,32,116,104,
+    101,32,100,105,114,101,99,116,111,114,121,32,109,97,116,99,
+    104,105,110,103,32,105,116,115,10,32,32,32,32,32,32,32,
+    32,99,117,114,114,101,110,116,32,42,109,116,105,109,101,42,
+    44,32,116,104,101,32,100,105,114,101,99,116,111,114,121,32,
+    105,115,32,110,111,116,32,108,105,115,116,101,100,32,97,103,
+    97,105,110,46,10,10,32,32,32,32,32,32,32,32,78,105,
+    0,0,0,0,105,1,0,0,0,105,2,0,0,0,117,3,
+    0,0,0,119,105,110,117,1,0,0,0,46,117,5,0,0,
+    0,123,125,46,123,125,99,1,0,0,0,0,0,0,0,2,
+    0,0,0,2,0,0,0,115,0,0,0,115,27,0,0,0,
+    124,0,0,93,17,0,125,1,0,124,1,0,106,0,0,131,
+    0,0,86,1,113,3,0,100,0,0,83,40,1,0,0,0,
+    78,40,1,0,0,0,117,5,0,0,0,108,111,119,101,114,
+    40,2,0,0,0,117,2,0,0,0,46,48,117,2,0,0,
+    0,102,110,40,0,0,0,0,40,0,0,0,0,117,29,0,
+    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
+    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
+    9,0,0,0,60,103,101,110,101,120,112,114,62,233,5,0,
+    0,115,2,0,0,0,6,0,117,41,0,0,0,70,105,108,
+    101,70,105,110,100,101,114,46,95,102,105,108,108,95,99,97,
+    99,104,101,46,60,108,111,99,97,108,115,62,46,60,103,101,
+    110,101,120,112,114,62,40,19,0,0,0,117,4,0,0,0,
+    112,97,116,104,117,11,0,0,0,95,112,97,116,104,95,102,
+    105,108,101,115,117,10,0,0,0,95,112,97,116,104,95,100,
+    105,114,115,117,15,0,0,0,95,103,101,116,95,112,97,116,
+    104,95,105,110,100,101,120,117,3,0,0,0,103,101,116,117,
+    3,0,0,0,115,121,115,117,8,0,0,0,112,108,97,116,
+    102,111,114,109,117,10,0,0,0,115,116,97,114,116,115,119,
+    105,116,104,117,3,0,0,0,95,111,115,117,7,0,0,0,
     108,105,115,116,100,105,114,117,17,0,0,0,70,105,108,101,
     78,111,116,70,111,117,110,100,69,114,114,111,114,117,3,0,
-    0,0,115,121,115,117,8,0,0,0,112,108,97,116,102,111,
-    114,109,117,10,0,0,0,115,116,97,114,116,115,119,105,116,
-    104,117,3,0,0,0,115,101,116,117,11,0,0,0,95,112,
-    97,116,104,95,99,97,99,104,101,117,9,0,0,0,112,97,
-    114,116,105,116,105,111,110,117,6,0,0,0,102,111,114,109,
-    97,116,117,5,0,0,0,108,111,119,101,114,117,3,0,0,
-    0,97,100,100,117,27,0,0,0,95,67,65,83,69,95,73,
-    78,83,69,78,83,73,84,73,86,69,95,80,76,65,84,70,
-    79,82,77,83,117,19,0,0,0,95,114,101,108,97,120,101,
-    100,95,112,97,116,104,95,99,97,99,104,101,40,9,0,0,
-    0,117,4,0,0,0,115,101,108,102,117,4,0,0,0,112,
-    97,116,104,117,8,0,0,0,99,111,110,116,101,110,116,115,
+    0,0,115,101,116,117,11,0,0,0,95,112,97,116,104,95,
+    99,97,99,104,101,117,9,0,0,0,112,97,114,116,105,116,
+    105,111,110,117,6,0,0,0,102,111,114,109,97,116,117,5,
+    0,0,0,108,111,119,101,114,117,3,0,0,0,97,100,100,
+    117,27,0,0,0,95,67,65,83,69,95,73,78,83,69,78,
+    83,73,84,73,86,69,95,80,76,65,84,70,79,82,77,83,
+    117,19,0,0,0,95,114,101,108,97,120,101,100,95,112,97,
+    116,104,95,99,97,99,104,101,40,11,0,0,0,117,4,0,
+    0,0,115,101,108,102,117,5,0,0,0,109,116,105,109,101,
+    117,4,0,0,0,112,97,116,104,117,5,0,0,0,101,110,
+    116,114,121,117,8,0,0,0,99,111,110,116,101,110,116,115,
     117,21,0,0,0,108,111,119,101,114,95,115,117,102,102,105,
     120,95,99,111,110,116,101,110,116,115,117,4,0,0,0,105,
     116,101,109,117,4,0,0,0,110,97,109,101,117,3,0,0,
@@ -3497,43 +3676,46 @@ unsigned char _Py_M__importlib[] = {
     0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
     101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
     111,116,115,116,114,97,112,62,117,11,0,0,0,95,102,105,
-    108,108,95,99,97,99,104,101,119,5,0,0,115,34,0,0,
-    0,0,2,9,1,3,1,19,1,13,2,11,3,18,1,18,
-    7,9,1,13,1,24,1,6,1,27,2,6,1,17,1,9,
-    1,18,1,117,22,0,0,0,70,105,108,101,70,105,110,100,
-    101,114,46,95,102,105,108,108,95,99,97,99,104,101,99,1,
-    0,0,0,0,0,0,0,3,0,0,0,3,0,0,0,7,
-    0,0,0,115,25,0,0,0,135,0,0,135,1,0,102,2,
-    0,100,1,0,100,2,0,134,0,0,125,2,0,124,2,0,
-    83,40,3,0,0,0,117,20,1,0,0,65,32,99,108,97,
-    115,115,32,109,101,116,104,111,100,32,119,104,105,99,104,32,
-    114,101,116,117,114,110,115,32,97,32,99,108,111,115,117,114,
-    101,32,116,111,32,117,115,101,32,111,110,32,115,121,115,46,
-    112,97,116,104,95,104,111,111,107,10,32,32,32,32,32,32,
-    32,32,119,104,105,99,104,32,119,105,108,108,32,114,101,116,
-    117,114,110,32,97,110,32,105,110,115,116,97,110,99,101,32,
-    117,115,105,110,103,32,116,104,101,32,115,112,101,99,105,102,
-    105,101,100,32,108,111,97,100,101,114,115,32,97,110,100,32,
-    116,104,101,32,112,97,116,104,10,32,32,32,32,32,32,32,
-    32,99,97,108,108,101,100,32,111,110,32,116,104,101,32,99,
-    108,111,115,117,114,101,46,10,10,32,32,32,32,32,32,32,
-    32,73,102,32,116,104,101,32,112,97,116,104,32,99,97,108,
+    108,108,95,99,97,99,104,101,191,5,0,0,115,46,0,0,
+    0,0,7,9,1,16,1,36,1,28,1,18,3,18,1,33,
+    2,3,1,19,1,13,2,11,3,18,1,18,7,9,1,13,
+    1,24,1,6,1,27,2,6,1,17,1,9,1,18,1,117,
+    22,0,0,0,70,105,108,101,70,105,110,100,101,114,46,95,
+    102,105,108,108,95,99,97,99,104,101,99,1,0,0,0,0,
+    0,0,0,3,0,0,0,3,0,0,0,7,0,0,0,115,
+    25,0,0,0,135,0,0,135,1,0,102,2,0,100,1,0,
+    100,2,0,134,0,0,125,2,0,124,2,0,83,40,3,0,
+    0,0,117,20,1,0,0,65,32,99,108,97,115,115,32,109,
+    101,116,104,111,100,32,119,104,105,99,104,32,114,101,116,117,
+    114,110,115,32,97,32,99,108,111,115,117,114,101,32,116,111,
+    32,117,115,101,32,111,110,32,115,121,115,46,112,97,116,104,
+    95,104,111,111,107,10,32,32,32,32,32,32,32,32,119,104,
+    105,99,104,32,119,105,108,108,32,114,101,116,117,114,110,32,
+    97,110,32,105,110,115,116,97,110,99,101,32,117,115,105,110,
+    103,32,116,104,101,32,115,112,101,99,105,102,105,101,100,32,
+    108,111,97,100,101,114,115,32,97,110,100,32,116,104,101,32,
+    112,97,116,104,10,32,32,32,32,32,32,32,32,99,97,108,
     108,101,100,32,111,110,32,116,104,101,32,99,108,111,115,117,
-    114,101,32,105,115,32,110,111,116,32,97,32,100,105,114,101,
-    99,116,111,114,121,44,32,73,109,112,111,114,116,69,114,114,
-    111,114,32,105,115,10,32,32,32,32,32,32,32,32,114,97,
-    105,115,101,100,46,10,10,32,32,32,32,32,32,32,32,99,
-    1,0,0,0,0,0,0,0,1,0,0,0,4,0,0,0,
-    19,0,0,0,115,46,0,0,0,116,0,0,124,0,0,131,
-    1,0,115,33,0,116,1,0,100,1,0,100,2,0,124,0,
-    0,131,1,1,130,1,0,110,0,0,136,0,0,124,0,0,
-    136,1,0,140,1,0,83,40,3,0,0,0,117,45,0,0,
-    0,80,97,116,104,32,104,111,111,107,32,102,111,114,32,105,
-    109,112,111,114,116,108,105,98,46,109,97,99,104,105,110,101,
-    114,121,46,70,105,108,101,70,105,110,100,101,114,46,117,30,
-    0,0,0,111,110,108,121,32,100,105,114,101,99,116,111,114,
-    105,101,115,32,97,114,101,32,115,117,112,112,111,114,116,101,
-    100,117,4,0,0,0,112,97,116,104,40,2,0,0,0,117,
+    114,101,46,10,10,32,32,32,32,32,32,32,32,73,102,32,
+    116,104,101,32,112,97,116,104,32,99,97,108,108,101,100,32,
+    111,110,32,116,104,101,32,99,108,111,115,117,114,101,32,105,
+    115,32,110,111,116,32,97,32,100,105,114,101,99,116,111,114,
+    121,44,32,73,109,112,111,114,116,69,114,114,111,114,32,105,
+    115,10,32,32,32,32,32,32,32,32,114,97,105,115,101,100,
+    46,10,10,32,32,32,32,32,32,32,32,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,5,0,0,0,19,0,0,0,
+    115,62,0,0,0,124,0,0,116,0,0,131,0,0,107,7,
+    0,114,49,0,116,1,0,124,0,0,131,1,0,12,114,49,
+    0,116,2,0,100,1,0,100,2,0,124,0,0,131,1,1,
+    130,1,0,110,0,0,136,0,0,124,0,0,136,1,0,140,
+    1,0,83,40,3,0,0,0,117,45,0,0,0,80,97,116,
+    104,32,104,111,111,107,32,102,111,114,32,105,109,112,111,114,
+    116,108,105,98,46,109,97,99,104,105,110,101,114,121,46,70,
+    105,108,101,70,105,110,100,101,114,46,117,30,0,0,0,111,
+    110,108,121,32,100,105,114,101,99,116,111,114,105,101,115,32,
+    97,114,101,32,115,117,112,112,111,114,116,101,100,117,4,0,
+    0,0,112,97,116,104,40,3,0,0,0,117,15,0,0,0,
+    95,103,101,116,95,112,97,116,104,95,105,110,100,101,120,117,
     11,0,0,0,95,112,97,116,104,95,105,115,100,105,114,117,
     11,0,0,0,73,109,112,111,114,116,69,114,114,111,114,40,
     1,0,0,0,117,4,0,0,0,112,97,116,104,40,2,0,
@@ -3543,7 +3725,7 @@ unsigned char _Py_M__importlib[] = {
     109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
     114,97,112,62,117,24,0,0,0,112,97,116,104,95,104,111,
     111,107,95,102,111,114,95,70,105,108,101,70,105,110,100,101,
-    114,159,5,0,0,115,6,0,0,0,0,2,12,1,21,1,
+    114,245,5,0,0,115,6,0,0,0,0,4,28,1,21,1,
     117,54,0,0,0,70,105,108,101,70,105,110,100,101,114,46,
     112,97,116,104,95,104,111,111,107,46,60,108,111,99,97,108,
     115,62,46,112,97,116,104,95,104,111,111,107,95,102,111,114,
@@ -3557,7 +3739,7 @@ unsigned char _Py_M__importlib[] = {
     108,115,117,29,0,0,0,60,102,114,111,122,101,110,32,105,
     109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
     114,97,112,62,117,9,0,0,0,112,97,116,104,95,104,111,
-    111,107,149,5,0,0,115,4,0,0,0,0,10,21,6,117,
+    111,107,235,5,0,0,115,4,0,0,0,0,10,21,8,117,
     20,0,0,0,70,105,108,101,70,105,110,100,101,114,46,112,
     97,116,104,95,104,111,111,107,99,1,0,0,0,0,0,0,
     0,1,0,0,0,2,0,0,0,67,0,0,0,115,16,0,
@@ -3569,824 +3751,830 @@ unsigned char _Py_M__importlib[] = {
     115,101,108,102,40,0,0,0,0,40,0,0,0,0,117,29,
     0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
     116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
-    117,8,0,0,0,95,95,114,101,112,114,95,95,167,5,0,
+    117,8,0,0,0,95,95,114,101,112,114,95,95,255,5,0,
     0,115,2,0,0,0,0,1,117,19,0,0,0,70,105,108,
     101,70,105,110,100,101,114,46,95,95,114,101,112,114,95,95,
-    78,40,13,0,0,0,117,8,0,0,0,95,95,110,97,109,
-    101,95,95,117,10,0,0,0,95,95,109,111,100,117,108,101,
-    95,95,117,12,0,0,0,95,95,113,117,97,108,110,97,109,
-    101,95,95,117,7,0,0,0,95,95,100,111,99,95,95,117,
-    8,0,0,0,95,95,105,110,105,116,95,95,117,17,0,0,
-    0,105,110,118,97,108,105,100,97,116,101,95,99,97,99,104,
-    101,115,117,17,0,0,0,95,102,105,110,100,95,109,111,100,
-    117,108,101,95,115,104,105,109,117,11,0,0,0,102,105,110,
-    100,95,109,111,100,117,108,101,117,11,0,0,0,102,105,110,
-    100,95,108,111,97,100,101,114,117,11,0,0,0,95,102,105,
-    108,108,95,99,97,99,104,101,117,11,0,0,0,99,108,97,
-    115,115,109,101,116,104,111,100,117,9,0,0,0,112,97,116,
-    104,95,104,111,111,107,117,8,0,0,0,95,95,114,101,112,
-    114,95,95,40,1,0,0,0,117,10,0,0,0,95,95,108,
-    111,99,97,108,115,95,95,40,0,0,0,0,40,0,0,0,
-    0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
-    112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
-    97,112,62,117,10,0,0,0,70,105,108,101,70,105,110,100,
-    101,114,48,5,0,0,115,16,0,0,0,16,7,6,2,12,
-    14,12,4,6,2,12,42,12,30,18,18,117,10,0,0,0,
-    70,105,108,101,70,105,110,100,101,114,99,1,0,0,0,0,
-    0,0,0,1,0,0,0,2,0,0,0,66,0,0,0,115,
-    50,0,0,0,124,0,0,69,101,0,0,90,1,0,100,0,
-    0,90,2,0,100,1,0,90,3,0,100,2,0,100,3,0,
-    132,0,0,90,4,0,100,4,0,100,5,0,132,0,0,90,
-    5,0,100,6,0,83,40,7,0,0,0,117,18,0,0,0,
-    95,73,109,112,111,114,116,76,111,99,107,67,111,110,116,101,
-    120,116,117,36,0,0,0,67,111,110,116,101,120,116,32,109,
-    97,110,97,103,101,114,32,102,111,114,32,116,104,101,32,105,
-    109,112,111,114,116,32,108,111,99,107,46,99,1,0,0,0,
-    0,0,0,0,1,0,0,0,1,0,0,0,67,0,0,0,
-    115,14,0,0,0,116,0,0,106,1,0,131,0,0,1,100,
-    1,0,83,40,2,0,0,0,117,24,0,0,0,65,99,113,
-    117,105,114,101,32,116,104,101,32,105,109,112,111,114,116,32,
-    108,111,99,107,46,78,40,2,0,0,0,117,4,0,0,0,
-    95,105,109,112,117,12,0,0,0,97,99,113,117,105,114,101,
-    95,108,111,99,107,40,1,0,0,0,117,4,0,0,0,115,
-    101,108,102,40,0,0,0,0,40,0,0,0,0,117,29,0,
+    40,13,0,0,0,117,8,0,0,0,95,95,110,97,109,101,
+    95,95,117,10,0,0,0,95,95,109,111,100,117,108,101,95,
+    95,117,12,0,0,0,95,95,113,117,97,108,110,97,109,101,
+    95,95,117,7,0,0,0,95,95,100,111,99,95,95,117,8,
+    0,0,0,95,95,105,110,105,116,95,95,117,17,0,0,0,
+    105,110,118,97,108,105,100,97,116,101,95,99,97,99,104,101,
+    115,117,17,0,0,0,95,102,105,110,100,95,109,111,100,117,
+    108,101,95,115,104,105,109,117,11,0,0,0,102,105,110,100,
+    95,109,111,100,117,108,101,117,11,0,0,0,102,105,110,100,
+    95,108,111,97,100,101,114,117,11,0,0,0,95,102,105,108,
+    108,95,99,97,99,104,101,117,11,0,0,0,99,108,97,115,
+    115,109,101,116,104,111,100,117,9,0,0,0,112,97,116,104,
+    95,104,111,111,107,117,8,0,0,0,95,95,114,101,112,114,
+    95,95,40,1,0,0,0,117,10,0,0,0,95,95,108,111,
+    99,97,108,115,95,95,40,0,0,0,0,40,0,0,0,0,
+    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
+    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
+    112,62,117,10,0,0,0,70,105,108,101,70,105,110,100,101,
+    114,112,5,0,0,115,16,0,0,0,16,7,6,2,12,18,
+    12,4,6,2,12,46,15,44,18,20,117,10,0,0,0,70,
+    105,108,101,70,105,110,100,101,114,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,2,0,0,0,66,0,0,0,115,50,
+    0,0,0,124,0,0,69,101,0,0,90,1,0,100,0,0,
+    90,2,0,100,1,0,90,3,0,100,2,0,100,3,0,132,
+    0,0,90,4,0,100,4,0,100,5,0,132,0,0,90,5,
+    0,100,6,0,83,40,7,0,0,0,117,18,0,0,0,95,
+    73,109,112,111,114,116,76,111,99,107,67,111,110,116,101,120,
+    116,117,36,0,0,0,67,111,110,116,101,120,116,32,109,97,
+    110,97,103,101,114,32,102,111,114,32,116,104,101,32,105,109,
+    112,111,114,116,32,108,111,99,107,46,99,1,0,0,0,0,
+    0,0,0,1,0,0,0,1,0,0,0,67,0,0,0,115,
+    14,0,0,0,116,0,0,106,1,0,131,0,0,1,100,1,
+    0,83,40,2,0,0,0,117,24,0,0,0,65,99,113,117,
+    105,114,101,32,116,104,101,32,105,109,112,111,114,116,32,108,
+    111,99,107,46,78,40,2,0,0,0,117,4,0,0,0,95,
+    105,109,112,117,12,0,0,0,97,99,113,117,105,114,101,95,
+    108,111,99,107,40,1,0,0,0,117,4,0,0,0,115,101,
+    108,102,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
+    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
+    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,9,
+    0,0,0,95,95,101,110,116,101,114,95,95,9,6,0,0,
+    115,2,0,0,0,0,2,117,28,0,0,0,95,73,109,112,
+    111,114,116,76,111,99,107,67,111,110,116,101,120,116,46,95,
+    95,101,110,116,101,114,95,95,99,4,0,0,0,0,0,0,
+    0,4,0,0,0,1,0,0,0,67,0,0,0,115,14,0,
+    0,0,116,0,0,106,1,0,131,0,0,1,100,1,0,83,
+    40,2,0,0,0,117,60,0,0,0,82,101,108,101,97,115,
+    101,32,116,104,101,32,105,109,112,111,114,116,32,108,111,99,
+    107,32,114,101,103,97,114,100,108,101,115,115,32,111,102,32,
+    97,110,121,32,114,97,105,115,101,100,32,101,120,99,101,112,
+    116,105,111,110,115,46,78,40,2,0,0,0,117,4,0,0,
+    0,95,105,109,112,117,12,0,0,0,114,101,108,101,97,115,
+    101,95,108,111,99,107,40,4,0,0,0,117,4,0,0,0,
+    115,101,108,102,117,8,0,0,0,101,120,99,95,116,121,112,
+    101,117,9,0,0,0,101,120,99,95,118,97,108,117,101,117,
+    13,0,0,0,101,120,99,95,116,114,97,99,101,98,97,99,
+    107,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,8,0,
+    0,0,95,95,101,120,105,116,95,95,13,6,0,0,115,2,
+    0,0,0,0,2,117,27,0,0,0,95,73,109,112,111,114,
+    116,76,111,99,107,67,111,110,116,101,120,116,46,95,95,101,
+    120,105,116,95,95,78,40,6,0,0,0,117,8,0,0,0,
+    95,95,110,97,109,101,95,95,117,10,0,0,0,95,95,109,
+    111,100,117,108,101,95,95,117,12,0,0,0,95,95,113,117,
+    97,108,110,97,109,101,95,95,117,7,0,0,0,95,95,100,
+    111,99,95,95,117,9,0,0,0,95,95,101,110,116,101,114,
+    95,95,117,8,0,0,0,95,95,101,120,105,116,95,95,40,
+    1,0,0,0,117,10,0,0,0,95,95,108,111,99,97,108,
+    115,95,95,40,0,0,0,0,40,0,0,0,0,117,29,0,
     0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
     108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
-    9,0,0,0,95,95,101,110,116,101,114,95,95,177,5,0,
-    0,115,2,0,0,0,0,2,117,28,0,0,0,95,73,109,
-    112,111,114,116,76,111,99,107,67,111,110,116,101,120,116,46,
-    95,95,101,110,116,101,114,95,95,99,4,0,0,0,0,0,
-    0,0,4,0,0,0,1,0,0,0,67,0,0,0,115,14,
-    0,0,0,116,0,0,106,1,0,131,0,0,1,100,1,0,
-    83,40,2,0,0,0,117,60,0,0,0,82,101,108,101,97,
-    115,101,32,116,104,101,32,105,109,112,111,114,116,32,108,111,
-    99,107,32,114,101,103,97,114,100,108,101,115,115,32,111,102,
-    32,97,110,121,32,114,97,105,115,101,100,32,101,120,99,101,
-    112,116,105,111,110,115,46,78,40,2,0,0,0,117,4,0,
-    0,0,95,105,109,112,117,12,0,0,0,114,101,108,101,97,
-    115,101,95,108,111,99,107,40,4,0,0,0,117,4,0,0,
-    0,115,101,108,102,117,8,0,0,0,101,120,99,95,116,121,
-    112,101,117,9,0,0,0,101,120,99,95,118,97,108,117,101,
-    117,13,0,0,0,101,120,99,95,116,114,97,99,101,98,97,
-    99,107,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
-    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
-    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,8,
-    0,0,0,95,95,101,120,105,116,95,95,181,5,0,0,115,
-    2,0,0,0,0,2,117,27,0,0,0,95,73,109,112,111,
-    114,116,76,111,99,107,67,111,110,116,101,120,116,46,95,95,
-    101,120,105,116,95,95,78,40,6,0,0,0,117,8,0,0,
-    0,95,95,110,97,109,101,95,95,117,10,0,0,0,95,95,
-    109,111,100,117,108,101,95,95,117,12,0,0,0,95,95,113,
-    117,97,108,110,97,109,101,95,95,117,7,0,0,0,95,95,
-    100,111,99,95,95,117,9,0,0,0,95,95,101,110,116,101,
-    114,95,95,117,8,0,0,0,95,95,101,120,105,116,95,95,
-    40,1,0,0,0,117,10,0,0,0,95,95,108,111,99,97,
-    108,115,95,95,40,0,0,0,0,40,0,0,0,0,117,29,
+    18,0,0,0,95,73,109,112,111,114,116,76,111,99,107,67,
+    111,110,116,101,120,116,5,6,0,0,115,6,0,0,0,16,
+    2,6,2,12,4,117,18,0,0,0,95,73,109,112,111,114,
+    116,76,111,99,107,67,111,110,116,101,120,116,99,3,0,0,
+    0,0,0,0,0,5,0,0,0,4,0,0,0,67,0,0,
+    0,115,91,0,0,0,124,1,0,106,0,0,100,1,0,124,
+    2,0,100,2,0,24,131,2,0,125,3,0,116,1,0,124,
+    3,0,131,1,0,124,2,0,107,0,0,114,55,0,116,2,
+    0,100,3,0,131,1,0,130,1,0,110,0,0,124,3,0,
+    100,4,0,25,125,4,0,124,0,0,114,87,0,100,5,0,
+    106,3,0,124,4,0,124,0,0,131,2,0,83,124,4,0,
+    83,40,6,0,0,0,117,50,0,0,0,82,101,115,111,108,
+    118,101,32,97,32,114,101,108,97,116,105,118,101,32,109,111,
+    100,117,108,101,32,110,97,109,101,32,116,111,32,97,110,32,
+    97,98,115,111,108,117,116,101,32,111,110,101,46,117,1,0,
+    0,0,46,105,1,0,0,0,117,50,0,0,0,97,116,116,
+    101,109,112,116,101,100,32,114,101,108,97,116,105,118,101,32,
+    105,109,112,111,114,116,32,98,101,121,111,110,100,32,116,111,
+    112,45,108,101,118,101,108,32,112,97,99,107,97,103,101,105,
+    0,0,0,0,117,5,0,0,0,123,125,46,123,125,40,4,
+    0,0,0,117,6,0,0,0,114,115,112,108,105,116,117,3,
+    0,0,0,108,101,110,117,10,0,0,0,86,97,108,117,101,
+    69,114,114,111,114,117,6,0,0,0,102,111,114,109,97,116,
+    40,5,0,0,0,117,4,0,0,0,110,97,109,101,117,7,
+    0,0,0,112,97,99,107,97,103,101,117,5,0,0,0,108,
+    101,118,101,108,117,4,0,0,0,98,105,116,115,117,4,0,
+    0,0,98,97,115,101,40,0,0,0,0,40,0,0,0,0,
+    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
+    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
+    112,62,117,13,0,0,0,95,114,101,115,111,108,118,101,95,
+    110,97,109,101,18,6,0,0,115,10,0,0,0,0,2,22,
+    1,18,1,15,1,10,1,117,13,0,0,0,95,114,101,115,
+    111,108,118,101,95,110,97,109,101,99,2,0,0,0,0,0,
+    0,0,4,0,0,0,11,0,0,0,67,0,0,0,115,138,
+    0,0,0,116,0,0,106,1,0,115,28,0,116,2,0,106,
+    3,0,100,1,0,116,4,0,131,2,0,1,110,0,0,120,
+    103,0,116,0,0,106,1,0,68,93,88,0,125,2,0,116,
+    5,0,131,0,0,143,23,0,1,124,2,0,106,6,0,124,
+    0,0,124,1,0,131,2,0,125,3,0,87,100,2,0,81,
+    88,124,3,0,100,2,0,107,9,0,114,38,0,124,0,0,
+    116,0,0,106,7,0,107,7,0,114,109,0,124,3,0,83,
+    116,0,0,106,7,0,124,0,0,25,106,8,0,83,113,38,
+    0,113,38,0,87,100,2,0,83,100,2,0,83,40,3,0,
+    0,0,117,23,0,0,0,70,105,110,100,32,97,32,109,111,
+    100,117,108,101,39,115,32,108,111,97,100,101,114,46,117,22,
+    0,0,0,115,121,115,46,109,101,116,97,95,112,97,116,104,
+    32,105,115,32,101,109,112,116,121,78,40,9,0,0,0,117,
+    3,0,0,0,115,121,115,117,9,0,0,0,109,101,116,97,
+    95,112,97,116,104,117,9,0,0,0,95,119,97,114,110,105,
+    110,103,115,117,4,0,0,0,119,97,114,110,117,13,0,0,
+    0,73,109,112,111,114,116,87,97,114,110,105,110,103,117,18,
+    0,0,0,95,73,109,112,111,114,116,76,111,99,107,67,111,
+    110,116,101,120,116,117,11,0,0,0,102,105,110,100,95,109,
+    111,100,117,108,101,117,7,0,0,0,109,111,100,117,108,101,
+    115,117,10,0,0,0,95,95,108,111,97,100,101,114,95,95,
+    40,4,0,0,0,117,4,0,0,0,110,97,109,101,117,4,
+    0,0,0,112,97,116,104,117,6,0,0,0,102,105,110,100,
+    101,114,117,6,0,0,0,108,111,97,100,101,114,40,0,0,
+    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
+    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
+    111,111,116,115,116,114,97,112,62,117,12,0,0,0,95,102,
+    105,110,100,95,109,111,100,117,108,101,27,6,0,0,115,20,
+    0,0,0,0,2,9,1,19,1,16,1,10,1,24,1,12,
+    2,15,1,4,2,21,2,117,12,0,0,0,95,102,105,110,
+    100,95,109,111,100,117,108,101,99,3,0,0,0,0,0,0,
+    0,4,0,0,0,4,0,0,0,67,0,0,0,115,194,0,
+    0,0,116,0,0,124,0,0,116,1,0,131,2,0,115,45,
+    0,116,2,0,100,1,0,106,3,0,116,4,0,124,0,0,
+    131,1,0,131,1,0,131,1,0,130,1,0,110,0,0,124,
+    2,0,100,2,0,107,0,0,114,72,0,116,5,0,100,3,
+    0,131,1,0,130,1,0,110,0,0,124,1,0,114,156,0,
+    116,0,0,124,1,0,116,1,0,131,2,0,115,108,0,116,
+    2,0,100,4,0,131,1,0,130,1,0,113,156,0,124,1,
+    0,116,6,0,106,7,0,107,7,0,114,156,0,100,5,0,
+    125,3,0,116,8,0,124,3,0,106,3,0,124,1,0,131,
+    1,0,131,1,0,130,1,0,113,156,0,110,0,0,124,0,
+    0,12,114,190,0,124,2,0,100,2,0,107,2,0,114,190,
+    0,116,5,0,100,6,0,131,1,0,130,1,0,110,0,0,
+    100,7,0,83,40,8,0,0,0,117,28,0,0,0,86,101,
+    114,105,102,121,32,97,114,103,117,109,101,110,116,115,32,97,
+    114,101,32,34,115,97,110,101,34,46,117,31,0,0,0,109,
+    111,100,117,108,101,32,110,97,109,101,32,109,117,115,116,32,
+    98,101,32,115,116,114,44,32,110,111,116,32,123,125,105,0,
+    0,0,0,117,18,0,0,0,108,101,118,101,108,32,109,117,
+    115,116,32,98,101,32,62,61,32,48,117,31,0,0,0,95,
+    95,112,97,99,107,97,103,101,95,95,32,110,111,116,32,115,
+    101,116,32,116,111,32,97,32,115,116,114,105,110,103,117,61,
+    0,0,0,80,97,114,101,110,116,32,109,111,100,117,108,101,
+    32,123,33,114,125,32,110,111,116,32,108,111,97,100,101,100,
+    44,32,99,97,110,110,111,116,32,112,101,114,102,111,114,109,
+    32,114,101,108,97,116,105,118,101,32,105,109,112,111,114,116,
+    117,17,0,0,0,69,109,112,116,121,32,109,111,100,117,108,
+    101,32,110,97,109,101,78,40,9,0,0,0,117,10,0,0,
+    0,105,115,105,110,115,116,97,110,99,101,117,3,0,0,0,
+    115,116,114,117,9,0,0,0,84,121,112,101,69,114,114,111,
+    114,117,6,0,0,0,102,111,114,109,97,116,117,4,0,0,
+    0,116,121,112,101,117,10,0,0,0,86,97,108,117,101,69,
+    114,114,111,114,117,3,0,0,0,115,121,115,117,7,0,0,
+    0,109,111,100,117,108,101,115,117,11,0,0,0,83,121,115,
+    116,101,109,69,114,114,111,114,40,4,0,0,0,117,4,0,
+    0,0,110,97,109,101,117,7,0,0,0,112,97,99,107,97,
+    103,101,117,5,0,0,0,108,101,118,101,108,117,3,0,0,
+    0,109,115,103,40,0,0,0,0,40,0,0,0,0,117,29,
+    0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
+    116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
+    117,13,0,0,0,95,115,97,110,105,116,121,95,99,104,101,
+    99,107,44,6,0,0,115,24,0,0,0,0,2,15,1,30,
+    1,12,1,15,1,6,1,15,1,15,1,15,1,6,2,27,
+    1,19,1,117,13,0,0,0,95,115,97,110,105,116,121,95,
+    99,104,101,99,107,117,20,0,0,0,78,111,32,109,111,100,
+    117,108,101,32,110,97,109,101,100,32,123,33,114,125,99,2,
+    0,0,0,0,0,0,0,9,0,0,0,27,0,0,0,67,
+    0,0,0,115,12,2,0,0,100,0,0,125,2,0,124,0,
+    0,106,0,0,100,1,0,131,1,0,100,2,0,25,125,3,
+    0,124,3,0,114,178,0,124,3,0,116,1,0,106,2,0,
+    107,7,0,114,62,0,116,3,0,124,1,0,124,3,0,131,
+    2,0,1,110,0,0,124,0,0,116,1,0,106,2,0,107,
+    6,0,114,88,0,116,1,0,106,2,0,124,0,0,25,83,
+    116,1,0,106,2,0,124,3,0,25,125,4,0,121,13,0,
+    124,4,0,106,4,0,125,2,0,87,113,178,0,4,116,5,
+    0,107,10,0,114,174,0,1,1,1,116,6,0,100,3,0,
+    23,106,7,0,124,0,0,124,3,0,131,2,0,125,5,0,
+    116,8,0,124,5,0,100,4,0,124,0,0,131,1,1,130,
+    1,0,89,113,178,0,88,110,0,0,116,9,0,124,0,0,
+    124,2,0,131,2,0,125,6,0,124,6,0,100,0,0,107,
+    8,0,114,250,0,116,8,0,116,6,0,106,7,0,124,0,
+    0,131,1,0,100,4,0,124,0,0,131,1,1,125,7,0,
+    100,5,0,124,7,0,95,10,0,124,7,0,130,1,0,110,
+    47,0,124,0,0,116,1,0,106,2,0,107,7,0,114,41,
+    1,124,6,0,106,11,0,124,0,0,131,1,0,1,116,12,
+    0,100,6,0,124,0,0,124,6,0,131,3,0,1,110,0,
+    0,116,1,0,106,2,0,124,0,0,25,125,8,0,124,3,
+    0,114,105,1,116,1,0,106,2,0,124,3,0,25,125,4,
+    0,116,13,0,124,4,0,124,0,0,106,0,0,100,1,0,
+    131,1,0,100,7,0,25,124,8,0,131,3,0,1,110,0,
+    0,116,14,0,124,8,0,100,8,0,100,0,0,131,3,0,
+    100,0,0,107,8,0,114,212,1,121,59,0,124,8,0,106,
+    15,0,124,8,0,95,16,0,116,17,0,124,8,0,100,9,
+    0,131,2,0,115,187,1,124,8,0,106,16,0,106,0,0,
+    100,1,0,131,1,0,100,2,0,25,124,8,0,95,16,0,
+    110,0,0,87,113,212,1,4,116,5,0,107,10,0,114,208,
+    1,1,1,1,89,113,212,1,88,110,0,0,116,17,0,124,
+    8,0,100,10,0,131,2,0,115,8,2,121,13,0,124,6,
+    0,124,8,0,95,18,0,87,113,8,2,4,116,5,0,107,
+    10,0,114,4,2,1,1,1,89,113,8,2,88,110,0,0,
+    124,8,0,83,40,11,0,0,0,78,117,1,0,0,0,46,
+    105,0,0,0,0,117,21,0,0,0,59,32,123,125,32,105,
+    115,32,110,111,116,32,97,32,112,97,99,107,97,103,101,117,
+    4,0,0,0,110,97,109,101,84,117,18,0,0,0,105,109,
+    112,111,114,116,32,123,33,114,125,32,35,32,123,33,114,125,
+    105,2,0,0,0,117,11,0,0,0,95,95,112,97,99,107,
+    97,103,101,95,95,117,8,0,0,0,95,95,112,97,116,104,
+    95,95,117,10,0,0,0,95,95,108,111,97,100,101,114,95,
+    95,40,19,0,0,0,117,10,0,0,0,114,112,97,114,116,
+    105,116,105,111,110,117,3,0,0,0,115,121,115,117,7,0,
+    0,0,109,111,100,117,108,101,115,117,25,0,0,0,95,99,
+    97,108,108,95,119,105,116,104,95,102,114,97,109,101,115,95,
+    114,101,109,111,118,101,100,117,8,0,0,0,95,95,112,97,
+    116,104,95,95,117,14,0,0,0,65,116,116,114,105,98,117,
+    116,101,69,114,114,111,114,117,8,0,0,0,95,69,82,82,
+    95,77,83,71,117,6,0,0,0,102,111,114,109,97,116,117,
+    11,0,0,0,73,109,112,111,114,116,69,114,114,111,114,117,
+    12,0,0,0,95,102,105,110,100,95,109,111,100,117,108,101,
+    117,10,0,0,0,95,110,111,116,95,102,111,117,110,100,117,
+    11,0,0,0,108,111,97,100,95,109,111,100,117,108,101,117,
+    16,0,0,0,95,118,101,114,98,111,115,101,95,109,101,115,
+    115,97,103,101,117,7,0,0,0,115,101,116,97,116,116,114,
+    117,7,0,0,0,103,101,116,97,116,116,114,117,8,0,0,
+    0,95,95,110,97,109,101,95,95,117,11,0,0,0,95,95,
+    112,97,99,107,97,103,101,95,95,117,7,0,0,0,104,97,
+    115,97,116,116,114,117,10,0,0,0,95,95,108,111,97,100,
+    101,114,95,95,40,9,0,0,0,117,4,0,0,0,110,97,
+    109,101,117,7,0,0,0,105,109,112,111,114,116,95,117,4,
+    0,0,0,112,97,116,104,117,6,0,0,0,112,97,114,101,
+    110,116,117,13,0,0,0,112,97,114,101,110,116,95,109,111,
+    100,117,108,101,117,3,0,0,0,109,115,103,117,6,0,0,
+    0,108,111,97,100,101,114,117,3,0,0,0,101,120,99,117,
+    6,0,0,0,109,111,100,117,108,101,40,0,0,0,0,40,
+    0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,110,
+    32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,116,
+    115,116,114,97,112,62,117,23,0,0,0,95,102,105,110,100,
+    95,97,110,100,95,108,111,97,100,95,117,110,108,111,99,107,
+    101,100,63,6,0,0,115,76,0,0,0,0,1,6,1,19,
+    1,6,1,15,1,16,2,15,1,11,2,13,1,3,1,13,
+    1,13,1,22,1,26,1,15,1,12,1,27,3,9,1,9,
+    1,15,2,13,1,19,2,13,1,6,2,13,1,32,2,24,
+    1,3,1,12,1,15,1,32,1,13,1,8,2,15,1,3,
+    1,13,1,13,1,8,1,117,23,0,0,0,95,102,105,110,
+    100,95,97,110,100,95,108,111,97,100,95,117,110,108,111,99,
+    107,101,100,99,2,0,0,0,0,0,0,0,3,0,0,0,
+    18,0,0,0,67,0,0,0,115,75,0,0,0,122,16,0,
+    116,0,0,124,0,0,131,1,0,125,2,0,87,100,1,0,
+    116,1,0,106,2,0,131,0,0,1,88,124,2,0,106,3,
+    0,131,0,0,1,122,17,0,116,4,0,124,0,0,124,1,
+    0,131,2,0,83,87,100,1,0,124,2,0,106,5,0,131,
+    0,0,1,88,100,1,0,83,40,2,0,0,0,117,54,0,
+    0,0,70,105,110,100,32,97,110,100,32,108,111,97,100,32,
+    116,104,101,32,109,111,100,117,108,101,44,32,97,110,100,32,
+    114,101,108,101,97,115,101,32,116,104,101,32,105,109,112,111,
+    114,116,32,108,111,99,107,46,78,40,6,0,0,0,117,16,
+    0,0,0,95,103,101,116,95,109,111,100,117,108,101,95,108,
+    111,99,107,117,4,0,0,0,95,105,109,112,117,12,0,0,
+    0,114,101,108,101,97,115,101,95,108,111,99,107,117,7,0,
+    0,0,97,99,113,117,105,114,101,117,23,0,0,0,95,102,
+    105,110,100,95,97,110,100,95,108,111,97,100,95,117,110,108,
+    111,99,107,101,100,117,7,0,0,0,114,101,108,101,97,115,
+    101,40,3,0,0,0,117,4,0,0,0,110,97,109,101,117,
+    7,0,0,0,105,109,112,111,114,116,95,117,4,0,0,0,
+    108,111,99,107,40,0,0,0,0,40,0,0,0,0,117,29,
     0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
     116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
-    117,18,0,0,0,95,73,109,112,111,114,116,76,111,99,107,
-    67,111,110,116,101,120,116,173,5,0,0,115,6,0,0,0,
-    16,2,6,2,12,4,117,18,0,0,0,95,73,109,112,111,
-    114,116,76,111,99,107,67,111,110,116,101,120,116,99,3,0,
+    117,14,0,0,0,95,102,105,110,100,95,97,110,100,95,108,
+    111,97,100,113,6,0,0,115,14,0,0,0,0,2,3,1,
+    16,2,11,1,10,1,3,1,17,2,117,14,0,0,0,95,
+    102,105,110,100,95,97,110,100,95,108,111,97,100,99,3,0,
     0,0,0,0,0,0,5,0,0,0,4,0,0,0,67,0,
-    0,0,115,91,0,0,0,124,1,0,106,0,0,100,1,0,
-    124,2,0,100,2,0,24,131,2,0,125,3,0,116,1,0,
-    124,3,0,131,1,0,124,2,0,107,0,0,114,55,0,116,
-    2,0,100,3,0,131,1,0,130,1,0,110,0,0,124,3,
-    0,100,4,0,25,125,4,0,124,0,0,114,87,0,100,5,
-    0,106,3,0,124,4,0,124,0,0,131,2,0,83,124,4,
-    0,83,40,6,0,0,0,117,50,0,0,0,82,101,115,111,
-    108,118,101,32,97,32,114,101,108,97,116,105,118,101,32,109,
-    111,100,117,108,101,32,110,97,109,101,32,116,111,32,97,110,
-    32,97,98,115,111,108,117,116,101,32,111,110,101,46,117,1,
-    0,0,0,46,105,1,0,0,0,117,50,0,0,0,97,116,
-    116,101,109,112,116,101,100,32,114,101,108,97,116,105,118,101,
-    32,105,109,112,111,114,116,32,98,101,121,111,110,100,32,116,
-    111,112,45,108,101,118,101,108,32,112,97,99,107,97,103,101,
-    105,0,0,0,0,117,5,0,0,0,123,125,46,123,125,40,
-    4,0,0,0,117,6,0,0,0,114,115,112,108,105,116,117,
-    3,0,0,0,108,101,110,117,10,0,0,0,86,97,108,117,
-    101,69,114,114,111,114,117,6,0,0,0,102,111,114,109,97,
-    116,40,5,0,0,0,117,4,0,0,0,110,97,109,101,117,
-    7,0,0,0,112,97,99,107,97,103,101,117,5,0,0,0,
-    108,101,118,101,108,117,4,0,0,0,98,105,116,115,117,4,
-    0,0,0,98,97,115,101,40,0,0,0,0,40,0,0,0,
-    0,117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,
-    112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,
-    97,112,62,117,13,0,0,0,95,114,101,115,111,108,118,101,
-    95,110,97,109,101,186,5,0,0,115,10,0,0,0,0,2,
-    22,1,18,1,15,1,10,1,117,13,0,0,0,95,114,101,
-    115,111,108,118,101,95,110,97,109,101,99,2,0,0,0,0,
-    0,0,0,4,0,0,0,11,0,0,0,67,0,0,0,115,
-    138,0,0,0,116,0,0,106,1,0,115,28,0,116,2,0,
-    106,3,0,100,1,0,116,4,0,131,2,0,1,110,0,0,
-    120,103,0,116,0,0,106,1,0,68,93,88,0,125,2,0,
-    116,5,0,131,0,0,143,23,0,1,124,2,0,106,6,0,
-    124,0,0,124,1,0,131,2,0,125,3,0,87,100,2,0,
-    81,88,124,3,0,100,2,0,107,9,0,114,38,0,124,0,
-    0,116,0,0,106,7,0,107,7,0,114,109,0,124,3,0,
-    83,116,0,0,106,7,0,124,0,0,25,106,8,0,83,113,
-    38,0,113,38,0,87,100,2,0,83,100,2,0,83,40,3,
-    0,0,0,117,23,0,0,0,70,105,110,100,32,97,32,109,
-    111,100,117,108,101,39,115,32,108,111,97,100,101,114,46,117,
-    22,0,0,0,115,121,115,46,109,101,116,97,95,112,97,116,
-    104,32,105,115,32,101,109,112,116,121,78,40,9,0,0,0,
-    117,3,0,0,0,115,121,115,117,9,0,0,0,109,101,116,
-    97,95,112,97,116,104,117,9,0,0,0,95,119,97,114,110,
-    105,110,103,115,117,4,0,0,0,119,97,114,110,117,13,0,
-    0,0,73,109,112,111,114,116,87,97,114,110,105,110,103,117,
-    18,0,0,0,95,73,109,112,111,114,116,76,111,99,107,67,
-    111,110,116,101,120,116,117,11,0,0,0,102,105,110,100,95,
-    109,111,100,117,108,101,117,7,0,0,0,109,111,100,117,108,
-    101,115,117,10,0,0,0,95,95,108,111,97,100,101,114,95,
-    95,40,4,0,0,0,117,4,0,0,0,110,97,109,101,117,
-    4,0,0,0,112,97,116,104,117,6,0,0,0,102,105,110,
-    100,101,114,117,6,0,0,0,108,111,97,100,101,114,40,0,
-    0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,
-    111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,
-    98,111,111,116,115,116,114,97,112,62,117,12,0,0,0,95,
-    102,105,110,100,95,109,111,100,117,108,101,195,5,0,0,115,
-    20,0,0,0,0,2,9,1,19,1,16,1,10,1,24,1,
-    12,2,15,1,4,2,21,2,117,12,0,0,0,95,102,105,
-    110,100,95,109,111,100,117,108,101,99,3,0,0,0,0,0,
-    0,0,4,0,0,0,4,0,0,0,67,0,0,0,115,194,
-    0,0,0,116,0,0,124,0,0,116,1,0,131,2,0,115,
-    45,0,116,2,0,100,1,0,106,3,0,116,4,0,124,0,
-    0,131,1,0,131,1,0,131,1,0,130,1,0,110,0,0,
-    124,2,0,100,2,0,107,0,0,114,72,0,116,5,0,100,
-    3,0,131,1,0,130,1,0,110,0,0,124,1,0,114,156,
-    0,116,0,0,124,1,0,116,1,0,131,2,0,115,108,0,
-    116,2,0,100,4,0,131,1,0,130,1,0,113,156,0,124,
-    1,0,116,6,0,106,7,0,107,7,0,114,156,0,100,5,
-    0,125,3,0,116,8,0,124,3,0,106,3,0,124,1,0,
-    131,1,0,131,1,0,130,1,0,113,156,0,110,0,0,124,
-    0,0,12,114,190,0,124,2,0,100,2,0,107,2,0,114,
-    190,0,116,5,0,100,6,0,131,1,0,130,1,0,110,0,
-    0,100,7,0,83,40,8,0,0,0,117,28,0,0,0,86,
-    101,114,105,102,121,32,97,114,103,117,109,101,110,116,115,32,
-    97,114,101,32,34,115,97,110,101,34,46,117,31,0,0,0,
-    109,111,100,117,108,101,32,110,97,109,101,32,109,117,115,116,
-    32,98,101,32,115,116,114,44,32,110,111,116,32,123,125,105,
-    0,0,0,0,117,18,0,0,0,108,101,118,101,108,32,109,
-    117,115,116,32,98,101,32,62,61,32,48,117,31,0,0,0,
-    95,95,112,97,99,107,97,103,101,95,95,32,110,111,116,32,
-    115,101,116,32,116,111,32,97,32,115,116,114,105,110,103,117,
-    61,0,0,0,80,97,114,101,110,116,32,109,111,100,117,108,
-    101,32,123,33,114,125,32,110,111,116,32,108,111,97,100,101,
-    100,44,32,99,97,110,110,111,116,32,112,101,114,102,111,114,
-    109,32,114,101,108,97,116,105,118,101,32,105,109,112,111,114,
-    116,117,17,0,0,0,69,109,112,116,121,32,109,111,100,117,
-    108,101,32,110,97,109,101,78,40,9,0,0,0,117,10,0,
-    0,0,105,115,105,110,115,116,97,110,99,101,117,3,0,0,
-    0,115,116,114,117,9,0,0,0,84,121,112,101,69,114,114,
-    111,114,117,6,0,0,0,102,111,114,109,97,116,117,4,0,
-    0,0,116,121,112,101,117,10,0,0,0,86,97,108,117,101,
-    69,114,114,111,114,117,3,0,0,0,115,121,115,117,7,0,
-    0,0,109,111,100,117,108,101,115,117,11,0,0,0,83,121,
-    115,116,101,109,69,114,114,111,114,40,4,0,0,0,117,4,
+    0,0,115,172,0,0,0,116,0,0,124,0,0,124,1,0,
+    124,2,0,131,3,0,1,124,2,0,100,1,0,107,4,0,
+    114,49,0,116,1,0,124,0,0,124,1,0,124,2,0,131,
+    3,0,125,0,0,110,0,0,116,2,0,106,3,0,131,0,
+    0,1,124,0,0,116,4,0,106,5,0,107,7,0,114,87,
+    0,116,6,0,124,0,0,116,7,0,131,2,0,83,116,4,
+    0,106,5,0,124,0,0,25,125,3,0,124,3,0,100,2,
+    0,107,8,0,114,158,0,116,2,0,106,8,0,131,0,0,
+    1,100,3,0,106,9,0,124,0,0,131,1,0,125,4,0,
+    116,10,0,124,4,0,100,4,0,124,0,0,131,1,1,130,
+    1,0,110,0,0,116,11,0,124,0,0,131,1,0,1,124,
+    3,0,83,40,5,0,0,0,117,50,1,0,0,73,109,112,
+    111,114,116,32,97,110,100,32,114,101,116,117,114,110,32,116,
+    104,101,32,109,111,100,117,108,101,32,98,97,115,101,100,32,
+    111,110,32,105,116,115,32,110,97,109,101,44,32,116,104,101,
+    32,112,97,99,107,97,103,101,32,116,104,101,32,99,97,108,
+    108,32,105,115,10,32,32,32,32,98,101,105,110,103,32,109,
+    97,100,101,32,102,114,111,109,44,32,97,110,100,32,116,104,
+    101,32,108,101,118,101,108,32,97,100,106,117,115,116,109,101,
+    110,116,46,10,10,32,32,32,32,84,104,105,115,32,102,117,
+    110,99,116,105,111,110,32,114,101,112,114,101,115,101,110,116,
+    115,32,116,104,101,32,103,114,101,97,116,101,115,116,32,99,
+    111,109,109,111,110,32,100,101,110,111,109,105,110,97,116,111,
+    114,32,111,102,32,102,117,110,99,116,105,111,110,97,108,105,
+    116,121,10,32,32,32,32,98,101,116,119,101,101,110,32,105,
+    109,112,111,114,116,95,109,111,100,117,108,101,32,97,110,100,
+    32,95,95,105,109,112,111,114,116,95,95,46,32,84,104,105,
+    115,32,105,110,99,108,117,100,101,115,32,115,101,116,116,105,
+    110,103,32,95,95,112,97,99,107,97,103,101,95,95,32,105,
+    102,10,32,32,32,32,116,104,101,32,108,111,97,100,101,114,
+    32,100,105,100,32,110,111,116,46,10,10,32,32,32,32,105,
+    0,0,0,0,78,117,40,0,0,0,105,109,112,111,114,116,
+    32,111,102,32,123,125,32,104,97,108,116,101,100,59,32,78,
+    111,110,101,32,105,110,32,115,121,115,46,109,111,100,117,108,
+    101,115,117,4,0,0,0,110,97,109,101,40,12,0,0,0,
+    117,13,0,0,0,95,115,97,110,105,116,121,95,99,104,101,
+    99,107,117,13,0,0,0,95,114,101,115,111,108,118,101,95,
+    110,97,109,101,117,4,0,0,0,95,105,109,112,117,12,0,
+    0,0,97,99,113,117,105,114,101,95,108,111,99,107,117,3,
+    0,0,0,115,121,115,117,7,0,0,0,109,111,100,117,108,
+    101,115,117,14,0,0,0,95,102,105,110,100,95,97,110,100,
+    95,108,111,97,100,117,11,0,0,0,95,103,99,100,95,105,
+    109,112,111,114,116,117,12,0,0,0,114,101,108,101,97,115,
+    101,95,108,111,99,107,117,6,0,0,0,102,111,114,109,97,
+    116,117,11,0,0,0,73,109,112,111,114,116,69,114,114,111,
+    114,117,19,0,0,0,95,108,111,99,107,95,117,110,108,111,
+    99,107,95,109,111,100,117,108,101,40,5,0,0,0,117,4,
     0,0,0,110,97,109,101,117,7,0,0,0,112,97,99,107,
-    97,103,101,117,5,0,0,0,108,101,118,101,108,117,3,0,
-    0,0,109,115,103,40,0,0,0,0,40,0,0,0,0,117,
-    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
-    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,13,0,0,0,95,115,97,110,105,116,121,95,99,104,
-    101,99,107,212,5,0,0,115,24,0,0,0,0,2,15,1,
-    30,1,12,1,15,1,6,1,15,1,15,1,15,1,6,2,
-    27,1,19,1,117,13,0,0,0,95,115,97,110,105,116,121,
-    95,99,104,101,99,107,117,20,0,0,0,78,111,32,109,111,
-    100,117,108,101,32,110,97,109,101,100,32,123,33,114,125,99,
-    2,0,0,0,0,0,0,0,9,0,0,0,27,0,0,0,
-    67,0,0,0,115,12,2,0,0,100,0,0,125,2,0,124,
-    0,0,106,0,0,100,1,0,131,1,0,100,2,0,25,125,
-    3,0,124,3,0,114,178,0,124,3,0,116,1,0,106,2,
-    0,107,7,0,114,62,0,116,3,0,124,1,0,124,3,0,
-    131,2,0,1,110,0,0,124,0,0,116,1,0,106,2,0,
-    107,6,0,114,88,0,116,1,0,106,2,0,124,0,0,25,
-    83,116,1,0,106,2,0,124,3,0,25,125,4,0,121,13,
-    0,124,4,0,106,4,0,125,2,0,87,113,178,0,4,116,
-    5,0,107,10,0,114,174,0,1,1,1,116,6,0,100,3,
-    0,23,106,7,0,124,0,0,124,3,0,131,2,0,125,5,
-    0,116,8,0,124,5,0,100,4,0,124,0,0,131,1,1,
-    130,1,0,89,113,178,0,88,110,0,0,116,9,0,124,0,
-    0,124,2,0,131,2,0,125,6,0,124,6,0,100,0,0,
-    107,8,0,114,250,0,116,8,0,116,6,0,106,7,0,124,
-    0,0,131,1,0,100,4,0,124,0,0,131,1,1,125,7,
-    0,100,5,0,124,7,0,95,10,0,124,7,0,130,1,0,
-    110,47,0,124,0,0,116,1,0,106,2,0,107,7,0,114,
-    41,1,124,6,0,106,11,0,124,0,0,131,1,0,1,116,
-    12,0,100,6,0,124,0,0,124,6,0,131,3,0,1,110,
-    0,0,116,1,0,106,2,0,124,0,0,25,125,8,0,124,
-    3,0,114,105,1,116,1,0,106,2,0,124,3,0,25,125,
-    4,0,116,13,0,124,4,0,124,0,0,106,0,0,100,1,
-    0,131,1,0,100,7,0,25,124,8,0,131,3,0,1,110,
-    0,0,116,14,0,124,8,0,100,8,0,100,0,0,131,3,
-    0,100,0,0,107,8,0,114,212,1,121,59,0,124,8,0,
-    106,15,0,124,8,0,95,16,0,116,17,0,124,8,0,100,
-    9,0,131,2,0,115,187,1,124,8,0,106,16,0,106,0,
-    0,100,1,0,131,1,0,100,2,0,25,124,8,0,95,16,
-    0,110,0,0,87,113,212,1,4,116,5,0,107,10,0,114,
-    208,1,1,1,1,89,113,212,1,88,110,0,0,116,17,0,
-    124,8,0,100,10,0,131,2,0,115,8,2,121,13,0,124,
-    6,0,124,8,0,95,18,0,87,113,8,2,4,116,5,0,
-    107,10,0,114,4,2,1,1,1,89,113,8,2,88,110,0,
-    0,124,8,0,83,40,11,0,0,0,78,117,1,0,0,0,
-    46,105,0,0,0,0,117,21,0,0,0,59,32,123,125,32,
-    105,115,32,110,111,116,32,97,32,112,97,99,107,97,103,101,
-    117,4,0,0,0,110,97,109,101,84,117,18,0,0,0,105,
-    109,112,111,114,116,32,123,33,114,125,32,35,32,123,33,114,
-    125,105,2,0,0,0,117,11,0,0,0,95,95,112,97,99,
-    107,97,103,101,95,95,117,8,0,0,0,95,95,112,97,116,
-    104,95,95,117,10,0,0,0,95,95,108,111,97,100,101,114,
-    95,95,40,19,0,0,0,117,10,0,0,0,114,112,97,114,
-    116,105,116,105,111,110,117,3,0,0,0,115,121,115,117,7,
-    0,0,0,109,111,100,117,108,101,115,117,25,0,0,0,95,
-    99,97,108,108,95,119,105,116,104,95,102,114,97,109,101,115,
-    95,114,101,109,111,118,101,100,117,8,0,0,0,95,95,112,
-    97,116,104,95,95,117,14,0,0,0,65,116,116,114,105,98,
-    117,116,101,69,114,114,111,114,117,8,0,0,0,95,69,82,
-    82,95,77,83,71,117,6,0,0,0,102,111,114,109,97,116,
-    117,11,0,0,0,73,109,112,111,114,116,69,114,114,111,114,
-    117,12,0,0,0,95,102,105,110,100,95,109,111,100,117,108,
-    101,117,10,0,0,0,95,110,111,116,95,102,111,117,110,100,
-    117,11,0,0,0,108,111,97,100,95,109,111,100,117,108,101,
-    117,16,0,0,0,95,118,101,114,98,111,115,101,95,109,101,
-    115,115,97,103,101,117,7,0,0,0,115,101,116,97,116,116,
-    114,117,7,0,0,0,103,101,116,97,116,116,114,117,8,0,
-    0,0,95,95,110,97,109,101,95,95,117,11,0,0,0,95,
-    95,112,97,99,107,97,103,101,95,95,117,7,0,0,0,104,
-    97,115,97,116,116,114,117,10,0,0,0,95,95,108,111,97,
-    100,101,114,95,95,40,9,0,0,0,117,4,0,0,0,110,
-    97,109,101,117,7,0,0,0,105,109,112,111,114,116,95,117,
-    4,0,0,0,112,97,116,104,117,6,0,0,0,112,97,114,
-    101,110,116,117,13,0,0,0,112,97,114,101,110,116,95,109,
-    111,100,117,108,101,117,3,0,0,0,109,115,103,117,6,0,
-    0,0,108,111,97,100,101,114,117,3,0,0,0,101,120,99,
-    117,6,0,0,0,109,111,100,117,108,101,40,0,0,0,0,
+    97,103,101,117,5,0,0,0,108,101,118,101,108,117,6,0,
+    0,0,109,111,100,117,108,101,117,7,0,0,0,109,101,115,
+    115,97,103,101,40,0,0,0,0,40,0,0,0,0,117,29,
+    0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
+    116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
+    117,11,0,0,0,95,103,99,100,95,105,109,112,111,114,116,
+    126,6,0,0,115,28,0,0,0,0,9,16,1,12,1,21,
+    1,10,1,15,1,13,1,13,1,12,1,10,1,6,1,9,
+    1,21,1,10,1,117,11,0,0,0,95,103,99,100,95,105,
+    109,112,111,114,116,99,3,0,0,0,0,0,0,0,6,0,
+    0,0,17,0,0,0,67,0,0,0,115,254,0,0,0,116,
+    0,0,124,0,0,100,1,0,131,2,0,114,250,0,100,2,
+    0,124,1,0,107,6,0,114,89,0,116,1,0,124,1,0,
+    131,1,0,125,1,0,124,1,0,106,2,0,100,2,0,131,
+    1,0,1,116,0,0,124,0,0,100,3,0,131,2,0,114,
+    89,0,124,1,0,106,3,0,124,0,0,106,4,0,131,1,
+    0,1,113,89,0,110,0,0,120,158,0,124,1,0,68,93,
+    147,0,125,3,0,116,0,0,124,0,0,124,3,0,131,2,
+    0,115,96,0,100,4,0,106,5,0,124,0,0,106,6,0,
+    124,3,0,131,2,0,125,4,0,121,17,0,116,7,0,124,
+    2,0,124,4,0,131,2,0,1,87,113,243,0,4,116,8,
+    0,107,10,0,114,239,0,1,125,5,0,1,122,50,0,116,
+    9,0,124,5,0,100,5,0,100,6,0,131,3,0,114,218,
+    0,124,5,0,106,10,0,124,4,0,107,2,0,114,218,0,
+    119,96,0,113,218,0,110,0,0,130,0,0,87,89,100,7,
+    0,100,7,0,125,5,0,126,5,0,88,113,243,0,88,113,
+    96,0,113,96,0,87,110,0,0,124,0,0,83,40,8,0,
+    0,0,117,238,0,0,0,70,105,103,117,114,101,32,111,117,
+    116,32,119,104,97,116,32,95,95,105,109,112,111,114,116,95,
+    95,32,115,104,111,117,108,100,32,114,101,116,117,114,110,46,
+    10,10,32,32,32,32,84,104,101,32,105,109,112,111,114,116,
+    95,32,112,97,114,97,109,101,116,101,114,32,105,115,32,97,
+    32,99,97,108,108,97,98,108,101,32,119,104,105,99,104,32,
+    116,97,107,101,115,32,116,104,101,32,110,97,109,101,32,111,
+    102,32,109,111,100,117,108,101,32,116,111,10,32,32,32,32,
+    105,109,112,111,114,116,46,32,73,116,32,105,115,32,114,101,
+    113,117,105,114,101,100,32,116,111,32,100,101,99,111,117,112,
+    108,101,32,116,104,101,32,102,117,110,99,116,105,111,110,32,
+    102,114,111,109,32,97,115,115,117,109,105,110,103,32,105,109,
+    112,111,114,116,108,105,98,39,115,10,32,32,32,32,105,109,
+    112,111,114,116,32,105,109,112,108,101,109,101,110,116,97,116,
+    105,111,110,32,105,115,32,100,101,115,105,114,101,100,46,10,
+    10,32,32,32,32,117,8,0,0,0,95,95,112,97,116,104,
+    95,95,117,1,0,0,0,42,117,7,0,0,0,95,95,97,
+    108,108,95,95,117,5,0,0,0,123,125,46,123,125,117,10,
+    0,0,0,95,110,111,116,95,102,111,117,110,100,70,78,40,
+    11,0,0,0,117,7,0,0,0,104,97,115,97,116,116,114,
+    117,4,0,0,0,108,105,115,116,117,6,0,0,0,114,101,
+    109,111,118,101,117,6,0,0,0,101,120,116,101,110,100,117,
+    7,0,0,0,95,95,97,108,108,95,95,117,6,0,0,0,
+    102,111,114,109,97,116,117,8,0,0,0,95,95,110,97,109,
+    101,95,95,117,25,0,0,0,95,99,97,108,108,95,119,105,
+    116,104,95,102,114,97,109,101,115,95,114,101,109,111,118,101,
+    100,117,11,0,0,0,73,109,112,111,114,116,69,114,114,111,
+    114,117,7,0,0,0,103,101,116,97,116,116,114,117,4,0,
+    0,0,110,97,109,101,40,6,0,0,0,117,6,0,0,0,
+    109,111,100,117,108,101,117,8,0,0,0,102,114,111,109,108,
+    105,115,116,117,7,0,0,0,105,109,112,111,114,116,95,117,
+    1,0,0,0,120,117,9,0,0,0,102,114,111,109,95,110,
+    97,109,101,117,3,0,0,0,101,120,99,40,0,0,0,0,
     40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,101,
     110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,111,
-    116,115,116,114,97,112,62,117,23,0,0,0,95,102,105,110,
-    100,95,97,110,100,95,108,111,97,100,95,117,110,108,111,99,
-    107,101,100,231,5,0,0,115,76,0,0,0,0,1,6,1,
-    19,1,6,1,15,1,16,2,15,1,11,2,13,1,3,1,
-    13,1,13,1,22,1,26,1,15,1,12,1,27,3,9,1,
-    9,1,15,2,13,1,19,2,13,1,6,2,13,1,32,2,
-    24,1,3,1,12,1,15,1,32,1,13,1,8,2,15,1,
-    3,1,13,1,13,1,8,1,117,23,0,0,0,95,102,105,
-    110,100,95,97,110,100,95,108,111,97,100,95,117,110,108,111,
-    99,107,101,100,99,2,0,0,0,0,0,0,0,3,0,0,
-    0,18,0,0,0,67,0,0,0,115,75,0,0,0,122,16,
-    0,116,0,0,124,0,0,131,1,0,125,2,0,87,100,1,
-    0,116,1,0,106,2,0,131,0,0,1,88,124,2,0,106,
-    3,0,131,0,0,1,122,17,0,116,4,0,124,0,0,124,
-    1,0,131,2,0,83,87,100,1,0,124,2,0,106,5,0,
-    131,0,0,1,88,100,1,0,83,40,2,0,0,0,117,54,
-    0,0,0,70,105,110,100,32,97,110,100,32,108,111,97,100,
-    32,116,104,101,32,109,111,100,117,108,101,44,32,97,110,100,
-    32,114,101,108,101,97,115,101,32,116,104,101,32,105,109,112,
-    111,114,116,32,108,111,99,107,46,78,40,6,0,0,0,117,
-    16,0,0,0,95,103,101,116,95,109,111,100,117,108,101,95,
-    108,111,99,107,117,4,0,0,0,95,105,109,112,117,12,0,
-    0,0,114,101,108,101,97,115,101,95,108,111,99,107,117,7,
-    0,0,0,97,99,113,117,105,114,101,117,23,0,0,0,95,
-    102,105,110,100,95,97,110,100,95,108,111,97,100,95,117,110,
-    108,111,99,107,101,100,117,7,0,0,0,114,101,108,101,97,
-    115,101,40,3,0,0,0,117,4,0,0,0,110,97,109,101,
-    117,7,0,0,0,105,109,112,111,114,116,95,117,4,0,0,
-    0,108,111,99,107,40,0,0,0,0,40,0,0,0,0,117,
-    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
-    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,14,0,0,0,95,102,105,110,100,95,97,110,100,95,
-    108,111,97,100,25,6,0,0,115,14,0,0,0,0,2,3,
-    1,16,2,11,1,10,1,3,1,17,2,117,14,0,0,0,
-    95,102,105,110,100,95,97,110,100,95,108,111,97,100,99,3,
-    0,0,0,0,0,0,0,5,0,0,0,4,0,0,0,67,
-    0,0,0,115,172,0,0,0,116,0,0,124,0,0,124,1,
-    0,124,2,0,131,3,0,1,124,2,0,100,1,0,107,4,
-    0,114,49,0,116,1,0,124,0,0,124,1,0,124,2,0,
-    131,3,0,125,0,0,110,0,0,116,2,0,106,3,0,131,
-    0,0,1,124,0,0,116,4,0,106,5,0,107,7,0,114,
-    87,0,116,6,0,124,0,0,116,7,0,131,2,0,83,116,
-    4,0,106,5,0,124,0,0,25,125,3,0,124,3,0,100,
-    2,0,107,8,0,114,158,0,116,2,0,106,8,0,131,0,
-    0,1,100,3,0,106,9,0,124,0,0,131,1,0,125,4,
-    0,116,10,0,124,4,0,100,4,0,124,0,0,131,1,1,
-    130,1,0,110,0,0,116,11,0,124,0,0,131,1,0,1,
-    124,3,0,83,40,5,0,0,0,117,50,1,0,0,73,109,
-    112,111,114,116,32,97,110,100,32,114,101,116,117,114,110,32,
-    116,104,101,32,109,111,100,117,108,101,32,98,97,115,101,100,
-    32,111,110,32,105,116,115,32,110,97,109,101,44,32,116,104,
-    101,32,112,97,99,107,97,103,101,32,116,104,101,32,99,97,
-    108,108,32,105,115,10,32,32,32,32,98,101,105,110,103,32,
-    109,97,100,101,32,102,114,111,109,44,32,97,110,100,32,116,
-    104,101,32,108,101,118,101,108,32,97,100,106,117,115,116,109,
-    101,110,116,46,10,10,32,32,32,32,84,104,105,115,32,102,
-    117,110,99,116,105,111,110,32,114,101,112,114,101,115,101,110,
-    116,115,32,116,104,101,32,103,114,101,97,116,101,115,116,32,
-    99,111,109,109,111,110,32,100,101,110,111,109,105,110,97,116,
-    111,114,32,111,102,32,102,117,110,99,116,105,111,110,97,108,
-    105,116,121,10,32,32,32,32,98,101,116,119,101,101,110,32,
-    105,109,112,111,114,116,95,109,111,100,117,108,101,32,97,110,
-    100,32,95,95,105,109,112,111,114,116,95,95,46,32,84,104,
-    105,115,32,105,110,99,108,117,100,101,115,32,115,101,116,116,
-    105,110,103,32,95,95,112,97,99,107,97,103,101,95,95,32,
-    105,102,10,32,32,32,32,116,104,101,32,108,111,97,100,101,
-    114,32,100,105,100,32,110,111,116,46,10,10,32,32,32,32,
-    105,0,0,0,0,78,117,40,0,0,0,105,109,112,111,114,
-    116,32,111,102,32,123,125,32,104,97,108,116,101,100,59,32,
-    78,111,110,101,32,105,110,32,115,121,115,46,109,111,100,117,
-    108,101,115,117,4,0,0,0,110,97,109,101,40,12,0,0,
-    0,117,13,0,0,0,95,115,97,110,105,116,121,95,99,104,
-    101,99,107,117,13,0,0,0,95,114,101,115,111,108,118,101,
-    95,110,97,109,101,117,4,0,0,0,95,105,109,112,117,12,
-    0,0,0,97,99,113,117,105,114,101,95,108,111,99,107,117,
-    3,0,0,0,115,121,115,117,7,0,0,0,109,111,100,117,
-    108,101,115,117,14,0,0,0,95,102,105,110,100,95,97,110,
-    100,95,108,111,97,100,117,11,0,0,0,95,103,99,100,95,
-    105,109,112,111,114,116,117,12,0,0,0,114,101,108,101,97,
-    115,101,95,108,111,99,107,117,6,0,0,0,102,111,114,109,
-    97,116,117,11,0,0,0,73,109,112,111,114,116,69,114,114,
-    111,114,117,19,0,0,0,95,108,111,99,107,95,117,110,108,
-    111,99,107,95,109,111,100,117,108,101,40,5,0,0,0,117,
-    4,0,0,0,110,97,109,101,117,7,0,0,0,112,97,99,
-    107,97,103,101,117,5,0,0,0,108,101,118,101,108,117,6,
-    0,0,0,109,111,100,117,108,101,117,7,0,0,0,109,101,
-    115,115,97,103,101,40,0,0,0,0,40,0,0,0,0,117,
-    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
-    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,11,0,0,0,95,103,99,100,95,105,109,112,111,114,
-    116,38,6,0,0,115,28,0,0,0,0,9,16,1,12,1,
-    21,1,10,1,15,1,13,1,13,1,12,1,10,1,6,1,
-    9,1,21,1,10,1,117,11,0,0,0,95,103,99,100,95,
-    105,109,112,111,114,116,99,3,0,0,0,0,0,0,0,6,
-    0,0,0,17,0,0,0,67,0,0,0,115,254,0,0,0,
-    116,0,0,124,0,0,100,1,0,131,2,0,114,250,0,100,
-    2,0,124,1,0,107,6,0,114,89,0,116,1,0,124,1,
-    0,131,1,0,125,1,0,124,1,0,106,2,0,100,2,0,
-    131,1,0,1,116,0,0,124,0,0,100,3,0,131,2,0,
-    114,89,0,124,1,0,106,3,0,124,0,0,106,4,0,131,
-    1,0,1,113,89,0,110,0,0,120,158,0,124,1,0,68,
-    93,147,0,125,3,0,116,0,0,124,0,0,124,3,0,131,
-    2,0,115,96,0,100,4,0,106,5,0,124,0,0,106,6,
-    0,124,3,0,131,2,0,125,4,0,121,17,0,116,7,0,
-    124,2,0,124,4,0,131,2,0,1,87,113,243,0,4,116,
-    8,0,107,10,0,114,239,0,1,125,5,0,1,122,50,0,
-    116,9,0,124,5,0,100,5,0,100,6,0,131,3,0,114,
-    218,0,124,5,0,106,10,0,124,4,0,107,2,0,114,218,
-    0,119,96,0,113,218,0,110,0,0,130,0,0,87,89,100,
-    7,0,100,7,0,125,5,0,126,5,0,88,113,243,0,88,
-    113,96,0,113,96,0,87,110,0,0,124,0,0,83,40,8,
-    0,0,0,117,238,0,0,0,70,105,103,117,114,101,32,111,
-    117,116,32,119,104,97,116,32,95,95,105,109,112,111,114,116,
-    95,95,32,115,104,111,117,108,100,32,114,101,116,117,114,110,
-    46,10,10,32,32,32,32,84,104,101,32,105,109,112,111,114,
-    116,95,32,112,97,114,97,109,101,116,101,114,32,105,115,32,
-    97,32,99,97,108,108,97,98,108,101,32,119,104,105,99,104,
-    32,116,97,107,101,115,32,116,104,101,32,110,97,109,101,32,
-    111,102,32,109,111,100,117,108,101,32,116,111,10,32,32,32,
-    32,105,109,112,111,114,116,46,32,73,116,32,105,115,32,114,
-    101,113,117,105,114,101,100,32,116,111,32,100,101,99,111,117,
-    112,108,101,32,116,104,101,32,102,117,110,99,116,105,111,110,
-    32,102,114,111,109,32,97,115,115,117,109,105,110,103,32,105,
-    109,112,111,114,116,108,105,98,39,115,10,32,32,32,32,105,
-    109,112,111,114,116,32,105,109,112,108,101,109,101,110,116,97,
-    116,105,111,110,32,105,115,32,100,101,115,105,114,101,100,46,
-    10,10,32,32,32,32,117,8,0,0,0,95,95,112,97,116,
-    104,95,95,117,1,0,0,0,42,117,7,0,0,0,95,95,
-    97,108,108,95,95,117,5,0,0,0,123,125,46,123,125,117,
-    10,0,0,0,95,110,111,116,95,102,111,117,110,100,70,78,
-    40,11,0,0,0,117,7,0,0,0,104,97,115,97,116,116,
-    114,117,4,0,0,0,108,105,115,116,117,6,0,0,0,114,
-    101,109,111,118,101,117,6,0,0,0,101,120,116,101,110,100,
-    117,7,0,0,0,95,95,97,108,108,95,95,117,6,0,0,
-    0,102,111,114,109,97,116,117,8,0,0,0,95,95,110,97,
-    109,101,95,95,117,25,0,0,0,95,99,97,108,108,95,119,
-    105,116,104,95,102,114,97,109,101,115,95,114,101,109,111,118,
-    101,100,117,11,0,0,0,73,109,112,111,114,116,69,114,114,
-    111,114,117,7,0,0,0,103,101,116,97,116,116,114,117,4,
-    0,0,0,110,97,109,101,40,6,0,0,0,117,6,0,0,
-    0,109,111,100,117,108,101,117,8,0,0,0,102,114,111,109,
-    108,105,115,116,117,7,0,0,0,105,109,112,111,114,116,95,
-    117,1,0,0,0,120,117,9,0,0,0,102,114,111,109,95,
-    110,97,109,101,117,3,0,0,0,101,120,99,40,0,0,0,
+    116,115,116,114,97,112,62,117,16,0,0,0,95,104,97,110,
+    100,108,101,95,102,114,111,109,108,105,115,116,150,6,0,0,
+    115,34,0,0,0,0,10,15,1,12,1,12,1,13,1,15,
+    1,22,1,13,1,15,1,21,1,3,1,17,1,18,6,18,
+    1,15,1,9,1,32,1,117,16,0,0,0,95,104,97,110,
+    100,108,101,95,102,114,111,109,108,105,115,116,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,2,0,0,0,67,0,0,
+    0,115,78,0,0,0,124,0,0,106,0,0,100,1,0,131,
+    1,0,125,1,0,124,1,0,100,2,0,107,8,0,114,74,
+    0,124,0,0,100,3,0,25,125,1,0,100,4,0,124,0,
+    0,107,7,0,114,74,0,124,1,0,106,1,0,100,5,0,
+    131,1,0,100,6,0,25,125,1,0,113,74,0,110,0,0,
+    124,1,0,83,40,7,0,0,0,117,167,0,0,0,67,97,
+    108,99,117,108,97,116,101,32,119,104,97,116,32,95,95,112,
+    97,99,107,97,103,101,95,95,32,115,104,111,117,108,100,32,
+    98,101,46,10,10,32,32,32,32,95,95,112,97,99,107,97,
+    103,101,95,95,32,105,115,32,110,111,116,32,103,117,97,114,
+    97,110,116,101,101,100,32,116,111,32,98,101,32,100,101,102,
+    105,110,101,100,32,111,114,32,99,111,117,108,100,32,98,101,
+    32,115,101,116,32,116,111,32,78,111,110,101,10,32,32,32,
+    32,116,111,32,114,101,112,114,101,115,101,110,116,32,116,104,
+    97,116,32,105,116,115,32,112,114,111,112,101,114,32,118,97,
+    108,117,101,32,105,115,32,117,110,107,110,111,119,110,46,10,
+    10,32,32,32,32,117,11,0,0,0,95,95,112,97,99,107,
+    97,103,101,95,95,78,117,8,0,0,0,95,95,110,97,109,
+    101,95,95,117,8,0,0,0,95,95,112,97,116,104,95,95,
+    117,1,0,0,0,46,105,0,0,0,0,40,2,0,0,0,
+    117,3,0,0,0,103,101,116,117,10,0,0,0,114,112,97,
+    114,116,105,116,105,111,110,40,2,0,0,0,117,7,0,0,
+    0,103,108,111,98,97,108,115,117,7,0,0,0,112,97,99,
+    107,97,103,101,40,0,0,0,0,40,0,0,0,0,117,29,
+    0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,
+    116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,
+    117,17,0,0,0,95,99,97,108,99,95,95,95,112,97,99,
+    107,97,103,101,95,95,184,6,0,0,115,12,0,0,0,0,
+    7,15,1,12,1,10,1,12,1,25,1,117,17,0,0,0,
+    95,99,97,108,99,95,95,95,112,97,99,107,97,103,101,95,
+    95,99,0,0,0,0,0,0,0,0,3,0,0,0,3,0,
+    0,0,67,0,0,0,115,55,0,0,0,116,0,0,116,1,
+    0,106,2,0,131,0,0,102,2,0,125,0,0,116,3,0,
+    116,4,0,102,2,0,125,1,0,116,5,0,116,6,0,102,
+    2,0,125,2,0,124,0,0,124,1,0,124,2,0,103,3,
+    0,83,40,1,0,0,0,117,111,0,0,0,82,101,116,117,
+    114,110,115,32,97,32,108,105,115,116,32,111,102,32,102,105,
+    108,101,45,98,97,115,101,100,32,109,111,100,117,108,101,32,
+    108,111,97,100,101,114,115,46,10,10,32,32,32,32,69,97,
+    99,104,32,105,116,101,109,32,105,115,32,97,32,116,117,112,
+    108,101,32,40,108,111,97,100,101,114,44,32,115,117,102,102,
+    105,120,101,115,44,32,97,108,108,111,119,95,112,97,99,107,
+    97,103,101,115,41,46,10,32,32,32,32,40,7,0,0,0,
+    117,19,0,0,0,69,120,116,101,110,115,105,111,110,70,105,
+    108,101,76,111,97,100,101,114,117,4,0,0,0,95,105,109,
+    112,117,18,0,0,0,101,120,116,101,110,115,105,111,110,95,
+    115,117,102,102,105,120,101,115,117,16,0,0,0,83,111,117,
+    114,99,101,70,105,108,101,76,111,97,100,101,114,117,15,0,
+    0,0,83,79,85,82,67,69,95,83,85,70,70,73,88,69,
+    83,117,20,0,0,0,83,111,117,114,99,101,108,101,115,115,
+    70,105,108,101,76,111,97,100,101,114,117,17,0,0,0,66,
+    89,84,69,67,79,68,69,95,83,85,70,70,73,88,69,83,
+    40,3,0,0,0,117,10,0,0,0,101,120,116,101,110,115,
+    105,111,110,115,117,6,0,0,0,115,111,117,114,99,101,117,
+    8,0,0,0,98,121,116,101,99,111,100,101,40,0,0,0,
     0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,122,
     101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,111,
-    111,116,115,116,114,97,112,62,117,16,0,0,0,95,104,97,
-    110,100,108,101,95,102,114,111,109,108,105,115,116,62,6,0,
-    0,115,34,0,0,0,0,10,15,1,12,1,12,1,13,1,
-    15,1,22,1,13,1,15,1,21,1,3,1,17,1,18,6,
-    18,1,15,1,9,1,32,1,117,16,0,0,0,95,104,97,
-    110,100,108,101,95,102,114,111,109,108,105,115,116,99,1,0,
-    0,0,0,0,0,0,2,0,0,0,2,0,0,0,67,0,
-    0,0,115,78,0,0,0,124,0,0,106,0,0,100,1,0,
-    131,1,0,125,1,0,124,1,0,100,2,0,107,8,0,114,
-    74,0,124,0,0,100,3,0,25,125,1,0,100,4,0,124,
-    0,0,107,7,0,114,74,0,124,1,0,106,1,0,100,5,
-    0,131,1,0,100,6,0,25,125,1,0,113,74,0,110,0,
-    0,124,1,0,83,40,7,0,0,0,117,167,0,0,0,67,
-    97,108,99,117,108,97,116,101,32,119,104,97,116,32,95,95,
-    112,97,99,107,97,103,101,95,95,32,115,104,111,117,108,100,
-    32,98,101,46,10,10,32,32,32,32,95,95,112,97,99,107,
-    97,103,101,95,95,32,105,115,32,110,111,116,32,103,117,97,
-    114,97,110,116,101,101,100,32,116,111,32,98,101,32,100,101,
-    102,105,110,101,100,32,111,114,32,99,111,117,108,100,32,98,
-    101,32,115,101,116,32,116,111,32,78,111,110,101,10,32,32,
-    32,32,116,111,32,114,101,112,114,101,115,101,110,116,32,116,
-    104,97,116,32,105,116,115,32,112,114,111,112,101,114,32,118,
-    97,108,117,101,32,105,115,32,117,110,107,110,111,119,110,46,
-    10,10,32,32,32,32,117,11,0,0,0,95,95,112,97,99,
-    107,97,103,101,95,95,78,117,8,0,0,0,95,95,110,97,
-    109,101,95,95,117,8,0,0,0,95,95,112,97,116,104,95,
-    95,117,1,0,0,0,46,105,0,0,0,0,40,2,0,0,
-    0,117,3,0,0,0,103,101,116,117,10,0,0,0,114,112,
-    97,114,116,105,116,105,111,110,40,2,0,0,0,117,7,0,
-    0,0,103,108,111,98,97,108,115,117,7,0,0,0,112,97,
-    99,107,97,103,101,40,0,0,0,0,40,0,0,0,0,117,
+    111,116,115,116,114,97,112,62,117,27,0,0,0,95,103,101,
+    116,95,115,117,112,112,111,114,116,101,100,95,102,105,108,101,
+    95,108,111,97,100,101,114,115,199,6,0,0,115,8,0,0,
+    0,0,5,18,1,12,1,12,1,117,27,0,0,0,95,103,
+    101,116,95,115,117,112,112,111,114,116,101,100,95,102,105,108,
+    101,95,108,111,97,100,101,114,115,99,5,0,0,0,0,0,
+    0,0,9,0,0,0,5,0,0,0,67,0,0,0,115,227,
+    0,0,0,124,4,0,100,1,0,107,2,0,114,27,0,116,
+    0,0,124,0,0,131,1,0,125,5,0,110,54,0,124,1,
+    0,100,2,0,107,9,0,114,45,0,124,1,0,110,3,0,
+    105,0,0,125,6,0,116,1,0,124,6,0,131,1,0,125,
+    7,0,116,0,0,124,0,0,124,7,0,124,4,0,131,3,
+    0,125,5,0,124,3,0,115,207,0,124,4,0,100,1,0,
+    107,2,0,114,122,0,116,0,0,124,0,0,106,2,0,100,
+    3,0,131,1,0,100,1,0,25,131,1,0,83,124,0,0,
+    115,132,0,124,5,0,83,116,3,0,124,0,0,131,1,0,
+    116,3,0,124,0,0,106,2,0,100,3,0,131,1,0,100,
+    1,0,25,131,1,0,24,125,8,0,116,4,0,106,5,0,
+    124,5,0,106,6,0,100,2,0,116,3,0,124,5,0,106,
+    6,0,131,1,0,124,8,0,24,133,2,0,25,25,83,110,
+    16,0,116,7,0,124,5,0,124,3,0,116,0,0,131,3,
+    0,83,100,2,0,83,40,4,0,0,0,117,214,1,0,0,
+    73,109,112,111,114,116,32,97,32,109,111,100,117,108,101,46,
+    10,10,32,32,32,32,84,104,101,32,39,103,108,111,98,97,
+    108,115,39,32,97,114,103,117,109,101,110,116,32,105,115,32,
+    117,115,101,100,32,116,111,32,105,110,102,101,114,32,119,104,
+    101,114,101,32,116,104,101,32,105,109,112,111,114,116,32,105,
+    115,32,111,99,99,117,114,105,110,103,32,102,114,111,109,10,
+    32,32,32,32,116,111,32,104,97,110,100,108,101,32,114,101,
+    108,97,116,105,118,101,32,105,109,112,111,114,116,115,46,32,
+    84,104,101,32,39,108,111,99,97,108,115,39,32,97,114,103,
+    117,109,101,110,116,32,105,115,32,105,103,110,111,114,101,100,
+    46,32,84,104,101,10,32,32,32,32,39,102,114,111,109,108,
+    105,115,116,39,32,97,114,103,117,109,101,110,116,32,115,112,
+    101,99,105,102,105,101,115,32,119,104,97,116,32,115,104,111,
+    117,108,100,32,101,120,105,115,116,32,97,115,32,97,116,116,
+    114,105,98,117,116,101,115,32,111,110,32,116,104,101,32,109,
+    111,100,117,108,101,10,32,32,32,32,98,101,105,110,103,32,
+    105,109,112,111,114,116,101,100,32,40,101,46,103,46,32,96,
+    96,102,114,111,109,32,109,111,100,117,108,101,32,105,109,112,
+    111,114,116,32,60,102,114,111,109,108,105,115,116,62,96,96,
+    41,46,32,32,84,104,101,32,39,108,101,118,101,108,39,10,
+    32,32,32,32,97,114,103,117,109,101,110,116,32,114,101,112,
+    114,101,115,101,110,116,115,32,116,104,101,32,112,97,99,107,
+    97,103,101,32,108,111,99,97,116,105,111,110,32,116,111,32,
+    105,109,112,111,114,116,32,102,114,111,109,32,105,110,32,97,
+    32,114,101,108,97,116,105,118,101,10,32,32,32,32,105,109,
+    112,111,114,116,32,40,101,46,103,46,32,96,96,102,114,111,
+    109,32,46,46,112,107,103,32,105,109,112,111,114,116,32,109,
+    111,100,96,96,32,119,111,117,108,100,32,104,97,118,101,32,
+    97,32,39,108,101,118,101,108,39,32,111,102,32,50,41,46,
+    10,10,32,32,32,32,105,0,0,0,0,78,117,1,0,0,
+    0,46,40,8,0,0,0,117,11,0,0,0,95,103,99,100,
+    95,105,109,112,111,114,116,117,17,0,0,0,95,99,97,108,
+    99,95,95,95,112,97,99,107,97,103,101,95,95,117,9,0,
+    0,0,112,97,114,116,105,116,105,111,110,117,3,0,0,0,
+    108,101,110,117,3,0,0,0,115,121,115,117,7,0,0,0,
+    109,111,100,117,108,101,115,117,8,0,0,0,95,95,110,97,
+    109,101,95,95,117,16,0,0,0,95,104,97,110,100,108,101,
+    95,102,114,111,109,108,105,115,116,40,9,0,0,0,117,4,
+    0,0,0,110,97,109,101,117,7,0,0,0,103,108,111,98,
+    97,108,115,117,6,0,0,0,108,111,99,97,108,115,117,8,
+    0,0,0,102,114,111,109,108,105,115,116,117,5,0,0,0,
+    108,101,118,101,108,117,6,0,0,0,109,111,100,117,108,101,
+    117,8,0,0,0,103,108,111,98,97,108,115,95,117,7,0,
+    0,0,112,97,99,107,97,103,101,117,7,0,0,0,99,117,
+    116,95,111,102,102,40,0,0,0,0,40,0,0,0,0,117,
     29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
     114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
-    62,117,17,0,0,0,95,99,97,108,99,95,95,95,112,97,
-    99,107,97,103,101,95,95,96,6,0,0,115,12,0,0,0,
-    0,7,15,1,12,1,10,1,12,1,25,1,117,17,0,0,
-    0,95,99,97,108,99,95,95,95,112,97,99,107,97,103,101,
-    95,95,99,0,0,0,0,0,0,0,0,3,0,0,0,3,
-    0,0,0,67,0,0,0,115,55,0,0,0,116,0,0,116,
-    1,0,106,2,0,131,0,0,102,2,0,125,0,0,116,3,
-    0,116,4,0,102,2,0,125,1,0,116,5,0,116,6,0,
-    102,2,0,125,2,0,124,0,0,124,1,0,124,2,0,103,
-    3,0,83,40,1,0,0,0,117,111,0,0,0,82,101,116,
-    117,114,110,115,32,97,32,108,105,115,116,32,111,102,32,102,
-    105,108,101,45,98,97,115,101,100,32,109,111,100,117,108,101,
-    32,108,111,97,100,101,114,115,46,10,10,32,32,32,32,69,
-    97,99,104,32,105,116,101,109,32,105,115,32,97,32,116,117,
-    112,108,101,32,40,108,111,97,100,101,114,44,32,115,117,102,
-    102,105,120,101,115,44,32,97,108,108,111,119,95,112,97,99,
-    107,97,103,101,115,41,46,10,32,32,32,32,40,7,0,0,
-    0,117,19,0,0,0,69,120,116,101,110,115,105,111,110,70,
-    105,108,101,76,111,97,100,101,114,117,4,0,0,0,95,105,
-    109,112,117,18,0,0,0,101,120,116,101,110,115,105,111,110,
-    95,115,117,102,102,105,120,101,115,117,16,0,0,0,83,111,
-    117,114,99,101,70,105,108,101,76,111,97,100,101,114,117,15,
-    0,0,0,83,79,85,82,67,69,95,83,85,70,70,73,88,
-    69,83,117,20,0,0,0,83,111,117,114,99,101,108,101,115,
-    115,70,105,108,101,76,111,97,100,101,114,117,17,0,0,0,
-    66,89,84,69,67,79,68,69,95,83,85,70,70,73,88,69,
-    83,40,3,0,0,0,117,10,0,0,0,101,120,116,101,110,
-    115,105,111,110,115,117,6,0,0,0,115,111,117,114,99,101,
-    117,8,0,0,0,98,121,116,101,99,111,100,101,40,0,0,
-    0,0,40,0,0,0,0,117,29,0,0,0,60,102,114,111,
-    122,101,110,32,105,109,112,111,114,116,108,105,98,46,95,98,
-    111,111,116,115,116,114,97,112,62,117,27,0,0,0,95,103,
-    101,116,95,115,117,112,112,111,114,116,101,100,95,102,105,108,
-    101,95,108,111,97,100,101,114,115,111,6,0,0,115,8,0,
-    0,0,0,5,18,1,12,1,12,1,117,27,0,0,0,95,
-    103,101,116,95,115,117,112,112,111,114,116,101,100,95,102,105,
-    108,101,95,108,111,97,100,101,114,115,99,5,0,0,0,0,
-    0,0,0,9,0,0,0,5,0,0,0,67,0,0,0,115,
-    227,0,0,0,124,4,0,100,1,0,107,2,0,114,27,0,
-    116,0,0,124,0,0,131,1,0,125,5,0,110,54,0,124,
-    1,0,100,2,0,107,9,0,114,45,0,124,1,0,110,3,
-    0,105,0,0,125,6,0,116,1,0,124,6,0,131,1,0,
-    125,7,0,116,0,0,124,0,0,124,7,0,124,4,0,131,
-    3,0,125,5,0,124,3,0,115,207,0,124,4,0,100,1,
-    0,107,2,0,114,122,0,116,0,0,124,0,0,106,2,0,
-    100,3,0,131,1,0,100,1,0,25,131,1,0,83,124,0,
-    0,115,132,0,124,5,0,83,116,3,0,124,0,0,131,1,
-    0,116,3,0,124,0,0,106,2,0,100,3,0,131,1,0,
-    100,1,0,25,131,1,0,24,125,8,0,116,4,0,106,5,
-    0,124,5,0,106,6,0,100,2,0,116,3,0,124,5,0,
-    106,6,0,131,1,0,124,8,0,24,133,2,0,25,25,83,
-    110,16,0,116,7,0,124,5,0,124,3,0,116,0,0,131,
-    3,0,83,100,2,0,83,40,4,0,0,0,117,214,1,0,
-    0,73,109,112,111,114,116,32,97,32,109,111,100,117,108,101,
-    46,10,10,32,32,32,32,84,104,101,32,39,103,108,111,98,
-    97,108,115,39,32,97,114,103,117,109,101,110,116,32,105,115,
-    32,117,115,101,100,32,116,111,32,105,110,102,101,114,32,119,
-    104,101,114,101,32,116,104,101,32,105,109,112,111,114,116,32,
-    105,115,32,111,99,99,117,114,105,110,103,32,102,114,111,109,
-    10,32,32,32,32,116,111,32,104,97,110,100,108,101,32,114,
-    101,108,97,116,105,118,101,32,105,109,112,111,114,116,115,46,
-    32,84,104,101,32,39,108,111,99,97,108,115,39,32,97,114,
-    103,117,109,101,110,116,32,105,115,32,105,103,110,111,114,101,
-    100,46,32,84,104,101,10,32,32,32,32,39,102,114,111,109,
-    108,105,115,116,39,32,97,114,103,117,109,101,110,116,32,115,
-    112,101,99,105,102,105,101,115,32,119,104,97,116,32,115,104,
-    111,117,108,100,32,101,120,105,115,116,32,97,115,32,97,116,
-    116,114,105,98,117,116,101,115,32,111,110,32,116,104,101,32,
-    109,111,100,117,108,101,10,32,32,32,32,98,101,105,110,103,
-    32,105,109,112,111,114,116,101,100,32,40,101,46,103,46,32,
-    96,96,102,114,111,109,32,109,111,100,117,108,101,32,105,109,
-    112,111,114,116,32,60,102,114,111,109,108,105,115,116,62,96,
-    96,41,46,32,32,84,104,101,32,39,108,101,118,101,108,39,
-    10,32,32,32,32,97,114,103,117,109,101,110,116,32,114,101,
-    112,114,101,115,101,110,116,115,32,116,104,101,32,112,97,99,
-    107,97,103,101,32,108,111,99,97,116,105,111,110,32,116,111,
-    32,105,109,112,111,114,116,32,102,114,111,109,32,105,110,32,
-    97,32,114,101,108,97,116,105,118,101,10,32,32,32,32,105,
-    109,112,111,114,116,32,40,101,46,103,46,32,96,96,102,114,
-    111,109,32,46,46,112,107,103,32,105,109,112,111,114,116,32,
-    109,111,100,96,96,32,119,111,117,108,100,32,104,97,118,101,
-    32,97,32,39,108,101,118,101,108,39,32,111,102,32,50,41,
-    46,10,10,32,32,32,32,105,0,0,0,0,78,117,1,0,
-    0,0,46,40,8,0,0,0,117,11,0,0,0,95,103,99,
-    100,95,105,109,112,111,114,116,117,17,0,0,0,95,99,97,
-    108,99,95,95,95,112,97,99,107,97,103,101,95,95,117,9,
-    0,0,0,112,97,114,116,105,116,105,111,110,117,3,0,0,
-    0,108,101,110,117,3,0,0,0,115,121,115,117,7,0,0,
-    0,109,111,100,117,108,101,115,117,8,0,0,0,95,95,110,
-    97,109,101,95,95,117,16,0,0,0,95,104,97,110,100,108,
-    101,95,102,114,111,109,108,105,115,116,40,9,0,0,0,117,
-    4,0,0,0,110,97,109,101,117,7,0,0,0,103,108,111,
-    98,97,108,115,117,6,0,0,0,108,111,99,97,108,115,117,
-    8,0,0,0,102,114,111,109,108,105,115,116,117,5,0,0,
-    0,108,101,118,101,108,117,6,0,0,0,109,111,100,117,108,
-    101,117,8,0,0,0,103,108,111,98,97,108,115,95,117,7,
-    0,0,0,112,97,99,107,97,103,101,117,7,0,0,0,99,
-    117,116,95,111,102,102,40,0,0,0,0,40,0,0,0,0,
-    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
-    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
-    112,62,117,10,0,0,0,95,95,105,109,112,111,114,116,95,
-    95,122,6,0,0,115,26,0,0,0,0,11,12,1,15,2,
-    24,1,12,1,18,1,6,3,12,1,23,1,6,1,4,4,
-    35,3,40,2,117,10,0,0,0,95,95,105,109,112,111,114,
-    116,95,95,99,2,0,0,0,0,0,0,0,14,0,0,0,
-    13,0,0,0,67,0,0,0,115,141,2,0,0,124,1,0,
-    97,0,0,124,0,0,97,1,0,116,1,0,106,2,0,106,
-    3,0,114,33,0,116,4,0,97,5,0,110,6,0,116,6,
-    0,97,5,0,120,47,0,116,0,0,116,1,0,102,2,0,
-    68,93,33,0,125,2,0,116,7,0,124,2,0,100,1,0,
-    131,2,0,115,52,0,116,8,0,124,2,0,95,9,0,113,
-    52,0,113,52,0,87,116,1,0,106,10,0,116,11,0,25,
-    125,3,0,120,76,0,100,26,0,68,93,68,0,125,4,0,
-    124,4,0,116,1,0,106,10,0,107,7,0,114,148,0,116,
-    8,0,106,12,0,124,4,0,131,1,0,125,5,0,110,13,
-    0,116,1,0,106,10,0,124,4,0,25,125,5,0,116,13,
-    0,124,3,0,124,4,0,124,5,0,131,3,0,1,113,109,
-    0,87,100,6,0,100,7,0,103,1,0,102,2,0,100,8,
-    0,100,9,0,100,7,0,103,2,0,102,2,0,102,2,0,
-    125,6,0,120,149,0,124,6,0,68,93,129,0,92,2,0,
-    125,7,0,125,8,0,116,14,0,100,10,0,100,11,0,132,
-    0,0,124,8,0,68,131,1,0,131,1,0,115,8,1,116,
-    15,0,130,1,0,124,8,0,100,12,0,25,125,9,0,124,
-    7,0,116,1,0,106,10,0,107,6,0,114,50,1,116,1,
-    0,106,10,0,124,7,0,25,125,10,0,80,113,221,0,121,
-    20,0,116,8,0,106,12,0,124,7,0,131,1,0,125,10,
-    0,80,87,113,221,0,4,116,16,0,107,10,0,114,93,1,
-    1,1,1,119,221,0,89,113,221,0,88,113,221,0,87,116,
-    16,0,100,13,0,131,1,0,130,1,0,121,19,0,116,8,
-    0,106,12,0,100,14,0,131,1,0,125,11,0,87,110,24,
-    0,4,116,16,0,107,10,0,114,155,1,1,1,1,100,15,
-    0,125,11,0,89,110,1,0,88,116,8,0,106,12,0,100,
-    16,0,131,1,0,125,12,0,124,7,0,100,8,0,107,2,
-    0,114,217,1,116,8,0,106,12,0,100,17,0,131,1,0,
-    125,13,0,116,13,0,124,3,0,100,18,0,124,13,0,131,
-    3,0,1,110,0,0,116,13,0,124,3,0,100,19,0,124,
-    10,0,131,3,0,1,116,13,0,124,3,0,100,14,0,124,
-    11,0,131,3,0,1,116,13,0,124,3,0,100,16,0,124,
-    12,0,131,3,0,1,116,13,0,124,3,0,100,20,0,124,
-    9,0,131,3,0,1,116,13,0,124,3,0,100,21,0,116,
-    17,0,124,8,0,131,1,0,131,3,0,1,116,13,0,124,
-    3,0,100,22,0,116,18,0,131,0,0,131,3,0,1,116,
-    19,0,106,20,0,116,0,0,106,21,0,131,0,0,131,1,
-    0,1,124,7,0,100,8,0,107,2,0,114,137,2,116,22,
-    0,106,23,0,100,23,0,131,1,0,1,100,24,0,116,19,
-    0,107,6,0,114,137,2,100,25,0,116,24,0,95,25,0,
-    113,137,2,110,0,0,100,15,0,83,40,27,0,0,0,117,
-    250,0,0,0,83,101,116,117,112,32,105,109,112,111,114,116,
-    108,105,98,32,98,121,32,105,109,112,111,114,116,105,110,103,
-    32,110,101,101,100,101,100,32,98,117,105,108,116,45,105,110,
-    32,109,111,100,117,108,101,115,32,97,110,100,32,105,110,106,
-    101,99,116,105,110,103,32,116,104,101,109,10,32,32,32,32,
-    105,110,116,111,32,116,104,101,32,103,108,111,98,97,108,32,
-    110,97,109,101,115,112,97,99,101,46,10,10,32,32,32,32,
-    65,115,32,115,121,115,32,105,115,32,110,101,101,100,101,100,
-    32,102,111,114,32,115,121,115,46,109,111,100,117,108,101,115,
-    32,97,99,99,101,115,115,32,97,110,100,32,95,105,109,112,
-    32,105,115,32,110,101,101,100,101,100,32,116,111,32,108,111,
-    97,100,32,98,117,105,108,116,45,105,110,10,32,32,32,32,
-    109,111,100,117,108,101,115,44,32,116,104,111,115,101,32,116,
-    119,111,32,109,111,100,117,108,101,115,32,109,117,115,116,32,
-    98,101,32,101,120,112,108,105,99,105,116,108,121,32,112,97,
-    115,115,101,100,32,105,110,46,10,10,32,32,32,32,117,10,
-    0,0,0,95,95,108,111,97,100,101,114,95,95,117,3,0,
-    0,0,95,105,111,117,9,0,0,0,95,119,97,114,110,105,
-    110,103,115,117,8,0,0,0,98,117,105,108,116,105,110,115,
-    117,7,0,0,0,109,97,114,115,104,97,108,117,5,0,0,
-    0,112,111,115,105,120,117,1,0,0,0,47,117,2,0,0,
-    0,110,116,117,1,0,0,0,92,99,1,0,0,0,0,0,
-    0,0,2,0,0,0,3,0,0,0,115,0,0,0,115,33,
-    0,0,0,124,0,0,93,23,0,125,1,0,116,0,0,124,
-    1,0,131,1,0,100,0,0,107,2,0,86,1,113,3,0,
-    100,1,0,83,40,2,0,0,0,105,1,0,0,0,78,40,
-    1,0,0,0,117,3,0,0,0,108,101,110,40,2,0,0,
-    0,117,2,0,0,0,46,48,117,3,0,0,0,115,101,112,
-    40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,
-    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
-    46,95,98,111,111,116,115,116,114,97,112,62,117,9,0,0,
-    0,60,103,101,110,101,120,112,114,62,190,6,0,0,115,2,
-    0,0,0,6,0,117,25,0,0,0,95,115,101,116,117,112,
-    46,60,108,111,99,97,108,115,62,46,60,103,101,110,101,120,
-    112,114,62,105,0,0,0,0,117,30,0,0,0,105,109,112,
-    111,114,116,108,105,98,32,114,101,113,117,105,114,101,115,32,
-    112,111,115,105,120,32,111,114,32,110,116,117,7,0,0,0,
-    95,116,104,114,101,97,100,78,117,8,0,0,0,95,119,101,
-    97,107,114,101,102,117,6,0,0,0,119,105,110,114,101,103,
-    117,7,0,0,0,95,119,105,110,114,101,103,117,3,0,0,
-    0,95,111,115,117,8,0,0,0,112,97,116,104,95,115,101,
-    112,117,15,0,0,0,112,97,116,104,95,115,101,112,97,114,
-    97,116,111,114,115,117,11,0,0,0,95,114,101,108,97,120,
-    95,99,97,115,101,117,4,0,0,0,46,112,121,119,117,6,
-    0,0,0,95,100,46,112,121,100,84,40,4,0,0,0,117,
-    3,0,0,0,95,105,111,117,9,0,0,0,95,119,97,114,
-    110,105,110,103,115,117,8,0,0,0,98,117,105,108,116,105,
-    110,115,117,7,0,0,0,109,97,114,115,104,97,108,40,26,
-    0,0,0,117,4,0,0,0,95,105,109,112,117,3,0,0,
-    0,115,121,115,117,5,0,0,0,102,108,97,103,115,117,8,
-    0,0,0,111,112,116,105,109,105,122,101,117,27,0,0,0,
-    79,80,84,73,77,73,90,69,68,95,66,89,84,69,67,79,
-    68,69,95,83,85,70,70,73,88,69,83,117,17,0,0,0,
-    66,89,84,69,67,79,68,69,95,83,85,70,70,73,88,69,
-    83,117,23,0,0,0,68,69,66,85,71,95,66,89,84,69,
-    67,79,68,69,95,83,85,70,70,73,88,69,83,117,7,0,
-    0,0,104,97,115,97,116,116,114,117,15,0,0,0,66,117,
-    105,108,116,105,110,73,109,112,111,114,116,101,114,117,10,0,
-    0,0,95,95,108,111,97,100,101,114,95,95,117,7,0,0,
-    0,109,111,100,117,108,101,115,117,8,0,0,0,95,95,110,
-    97,109,101,95,95,117,11,0,0,0,108,111,97,100,95,109,
-    111,100,117,108,101,117,7,0,0,0,115,101,116,97,116,116,
-    114,117,3,0,0,0,97,108,108,117,14,0,0,0,65,115,
-    115,101,114,116,105,111,110,69,114,114,111,114,117,11,0,0,
-    0,73,109,112,111,114,116,69,114,114,111,114,117,3,0,0,
-    0,115,101,116,117,16,0,0,0,95,109,97,107,101,95,114,
-    101,108,97,120,95,99,97,115,101,117,18,0,0,0,69,88,
-    84,69,78,83,73,79,78,95,83,85,70,70,73,88,69,83,
-    117,6,0,0,0,101,120,116,101,110,100,117,18,0,0,0,
-    101,120,116,101,110,115,105,111,110,95,115,117,102,102,105,120,
-    101,115,117,15,0,0,0,83,79,85,82,67,69,95,83,85,
-    70,70,73,88,69,83,117,6,0,0,0,97,112,112,101,110,
-    100,117,21,0,0,0,87,105,110,100,111,119,115,82,101,103,
-    105,115,116,114,121,70,105,110,100,101,114,117,11,0,0,0,
-    68,69,66,85,71,95,66,85,73,76,68,40,14,0,0,0,
+    62,117,10,0,0,0,95,95,105,109,112,111,114,116,95,95,
+    210,6,0,0,115,26,0,0,0,0,11,12,1,15,2,24,
+    1,12,1,18,1,6,3,12,1,23,1,6,1,4,4,35,
+    3,40,2,117,10,0,0,0,95,95,105,109,112,111,114,116,
+    95,95,99,2,0,0,0,0,0,0,0,14,0,0,0,13,
+    0,0,0,67,0,0,0,115,141,2,0,0,124,1,0,97,
+    0,0,124,0,0,97,1,0,116,1,0,106,2,0,106,3,
+    0,114,33,0,116,4,0,97,5,0,110,6,0,116,6,0,
+    97,5,0,120,47,0,116,0,0,116,1,0,102,2,0,68,
+    93,33,0,125,2,0,116,7,0,124,2,0,100,1,0,131,
+    2,0,115,52,0,116,8,0,124,2,0,95,9,0,113,52,
+    0,113,52,0,87,116,1,0,106,10,0,116,11,0,25,125,
+    3,0,120,76,0,100,26,0,68,93,68,0,125,4,0,124,
+    4,0,116,1,0,106,10,0,107,7,0,114,148,0,116,8,
+    0,106,12,0,124,4,0,131,1,0,125,5,0,110,13,0,
+    116,1,0,106,10,0,124,4,0,25,125,5,0,116,13,0,
+    124,3,0,124,4,0,124,5,0,131,3,0,1,113,109,0,
+    87,100,6,0,100,7,0,103,1,0,102,2,0,100,8,0,
+    100,9,0,100,7,0,103,2,0,102,2,0,102,2,0,125,
+    6,0,120,149,0,124,6,0,68,93,129,0,92,2,0,125,
+    7,0,125,8,0,116,14,0,100,10,0,100,11,0,132,0,
+    0,124,8,0,68,131,1,0,131,1,0,115,8,1,116,15,
+    0,130,1,0,124,8,0,100,12,0,25,125,9,0,124,7,
+    0,116,1,0,106,10,0,107,6,0,114,50,1,116,1,0,
+    106,10,0,124,7,0,25,125,10,0,80,113,221,0,121,20,
+    0,116,8,0,106,12,0,124,7,0,131,1,0,125,10,0,
+    80,87,113,221,0,4,116,16,0,107,10,0,114,93,1,1,
+    1,1,119,221,0,89,113,221,0,88,113,221,0,87,116,16,
+    0,100,13,0,131,1,0,130,1,0,121,19,0,116,8,0,
+    106,12,0,100,14,0,131,1,0,125,11,0,87,110,24,0,
+    4,116,16,0,107,10,0,114,155,1,1,1,1,100,15,0,
+    125,11,0,89,110,1,0,88,116,8,0,106,12,0,100,16,
+    0,131,1,0,125,12,0,124,7,0,100,8,0,107,2,0,
+    114,217,1,116,8,0,106,12,0,100,17,0,131,1,0,125,
+    13,0,116,13,0,124,3,0,100,18,0,124,13,0,131,3,
+    0,1,110,0,0,116,13,0,124,3,0,100,19,0,124,10,
+    0,131,3,0,1,116,13,0,124,3,0,100,14,0,124,11,
+    0,131,3,0,1,116,13,0,124,3,0,100,16,0,124,12,
+    0,131,3,0,1,116,13,0,124,3,0,100,20,0,124,9,
+    0,131,3,0,1,116,13,0,124,3,0,100,21,0,116,17,
+    0,124,8,0,131,1,0,131,3,0,1,116,13,0,124,3,
+    0,100,22,0,116,18,0,131,0,0,131,3,0,1,116,19,
+    0,106,20,0,116,0,0,106,21,0,131,0,0,131,1,0,
+    1,124,7,0,100,8,0,107,2,0,114,137,2,116,22,0,
+    106,23,0,100,23,0,131,1,0,1,100,24,0,116,19,0,
+    107,6,0,114,137,2,100,25,0,116,24,0,95,25,0,113,
+    137,2,110,0,0,100,15,0,83,40,27,0,0,0,117,250,
+    0,0,0,83,101,116,117,112,32,105,109,112,111,114,116,108,
+    105,98,32,98,121,32,105,109,112,111,114,116,105,110,103,32,
+    110,101,101,100,101,100,32,98,117,105,108,116,45,105,110,32,
+    109,111,100,117,108,101,115,32,97,110,100,32,105,110,106,101,
+    99,116,105,110,103,32,116,104,101,109,10,32,32,32,32,105,
+    110,116,111,32,116,104,101,32,103,108,111,98,97,108,32,110,
+    97,109,101,115,112,97,99,101,46,10,10,32,32,32,32,65,
+    115,32,115,121,115,32,105,115,32,110,101,101,100,101,100,32,
+    102,111,114,32,115,121,115,46,109,111,100,117,108,101,115,32,
+    97,99,99,101,115,115,32,97,110,100,32,95,105,109,112,32,
+    105,115,32,110,101,101,100,101,100,32,116,111,32,108,111,97,
+    100,32,98,117,105,108,116,45,105,110,10,32,32,32,32,109,
+    111,100,117,108,101,115,44,32,116,104,111,115,101,32,116,119,
+    111,32,109,111,100,117,108,101,115,32,109,117,115,116,32,98,
+    101,32,101,120,112,108,105,99,105,116,108,121,32,112,97,115,
+    115,101,100,32,105,110,46,10,10,32,32,32,32,117,10,0,
+    0,0,95,95,108,111,97,100,101,114,95,95,117,3,0,0,
+    0,95,105,111,117,9,0,0,0,95,119,97,114,110,105,110,
+    103,115,117,8,0,0,0,98,117,105,108,116,105,110,115,117,
+    7,0,0,0,109,97,114,115,104,97,108,117,5,0,0,0,
+    112,111,115,105,120,117,1,0,0,0,47,117,2,0,0,0,
+    110,116,117,1,0,0,0,92,99,1,0,0,0,0,0,0,
+    0,2,0,0,0,3,0,0,0,115,0,0,0,115,33,0,
+    0,0,124,0,0,93,23,0,125,1,0,116,0,0,124,1,
+    0,131,1,0,100,0,0,107,2,0,86,1,113,3,0,100,
+    1,0,83,40,2,0,0,0,105,1,0,0,0,78,40,1,
+    0,0,0,117,3,0,0,0,108,101,110,40,2,0,0,0,
+    117,2,0,0,0,46,48,117,3,0,0,0,115,101,112,40,
+    0,0,0,0,40,0,0,0,0,117,29,0,0,0,60,102,
+    114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,46,
+    95,98,111,111,116,115,116,114,97,112,62,117,9,0,0,0,
+    60,103,101,110,101,120,112,114,62,22,7,0,0,115,2,0,
+    0,0,6,0,117,25,0,0,0,95,115,101,116,117,112,46,
+    60,108,111,99,97,108,115,62,46,60,103,101,110,101,120,112,
+    114,62,105,0,0,0,0,117,30,0,0,0,105,109,112,111,
+    114,116,108,105,98,32,114,101,113,117,105,114,101,115,32,112,
+    111,115,105,120,32,111,114,32,110,116,117,7,0,0,0,95,
+    116,104,114,101,97,100,78,117,8,0,0,0,95,119,101,97,
+    107,114,101,102,117,6,0,0,0,119,105,110,114,101,103,117,
+    7,0,0,0,95,119,105,110,114,101,103,117,3,0,0,0,
+    95,111,115,117,8,0,0,0,112,97,116,104,95,115,101,112,
+    117,15,0,0,0,112,97,116,104,95,115,101,112,97,114,97,
+    116,111,114,115,117,11,0,0,0,95,114,101,108,97,120,95,
+    99,97,115,101,117,4,0,0,0,46,112,121,119,117,6,0,
+    0,0,95,100,46,112,121,100,84,40,4,0,0,0,117,3,
+    0,0,0,95,105,111,117,9,0,0,0,95,119,97,114,110,
+    105,110,103,115,117,8,0,0,0,98,117,105,108,116,105,110,
+    115,117,7,0,0,0,109,97,114,115,104,97,108,40,26,0,
+    0,0,117,4,0,0,0,95,105,109,112,117,3,0,0,0,
+    115,121,115,117,5,0,0,0,102,108,97,103,115,117,8,0,
+    0,0,111,112,116,105,109,105,122,101,117,27,0,0,0,79,
+    80,84,73,77,73,90,69,68,95,66,89,84,69,67,79,68,
+    69,95,83,85,70,70,73,88,69,83,117,17,0,0,0,66,
+    89,84,69,67,79,68,69,95,83,85,70,70,73,88,69,83,
+    117,23,0,0,0,68,69,66,85,71,95,66,89,84,69,67,
+    79,68,69,95,83,85,70,70,73,88,69,83,117,7,0,0,
+    0,104,97,115,97,116,116,114,117,15,0,0,0,66,117,105,
+    108,116,105,110,73,109,112,111,114,116,101,114,117,10,0,0,
+    0,95,95,108,111,97,100,101,114,95,95,117,7,0,0,0,
+    109,111,100,117,108,101,115,117,8,0,0,0,95,95,110,97,
+    109,101,95,95,117,11,0,0,0,108,111,97,100,95,109,111,
+    100,117,108,101,117,7,0,0,0,115,101,116,97,116,116,114,
+    117,3,0,0,0,97,108,108,117,14,0,0,0,65,115,115,
+    101,114,116,105,111,110,69,114,114,111,114,117,11,0,0,0,
+    73,109,112,111,114,116,69,114,114,111,114,117,3,0,0,0,
+    115,101,116,117,16,0,0,0,95,109,97,107,101,95,114,101,
+    108,97,120,95,99,97,115,101,117,18,0,0,0,69,88,84,
+    69,78,83,73,79,78,95,83,85,70,70,73,88,69,83,117,
+    6,0,0,0,101,120,116,101,110,100,117,18,0,0,0,101,
+    120,116,101,110,115,105,111,110,95,115,117,102,102,105,120,101,
+    115,117,15,0,0,0,83,79,85,82,67,69,95,83,85,70,
+    70,73,88,69,83,117,6,0,0,0,97,112,112,101,110,100,
+    117,21,0,0,0,87,105,110,100,111,119,115,82,101,103,105,
+    115,116,114,121,70,105,110,100,101,114,117,11,0,0,0,68,
+    69,66,85,71,95,66,85,73,76,68,40,14,0,0,0,117,
+    10,0,0,0,115,121,115,95,109,111,100,117,108,101,117,11,
+    0,0,0,95,105,109,112,95,109,111,100,117,108,101,117,6,
+    0,0,0,109,111,100,117,108,101,117,11,0,0,0,115,101,
+    108,102,95,109,111,100,117,108,101,117,12,0,0,0,98,117,
+    105,108,116,105,110,95,110,97,109,101,117,14,0,0,0,98,
+    117,105,108,116,105,110,95,109,111,100,117,108,101,117,10,0,
+    0,0,111,115,95,100,101,116,97,105,108,115,117,10,0,0,
+    0,98,117,105,108,116,105,110,95,111,115,117,15,0,0,0,
+    112,97,116,104,95,115,101,112,97,114,97,116,111,114,115,117,
+    8,0,0,0,112,97,116,104,95,115,101,112,117,9,0,0,
+    0,111,115,95,109,111,100,117,108,101,117,13,0,0,0,116,
+    104,114,101,97,100,95,109,111,100,117,108,101,117,14,0,0,
+    0,119,101,97,107,114,101,102,95,109,111,100,117,108,101,117,
+    13,0,0,0,119,105,110,114,101,103,95,109,111,100,117,108,
+    101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,0,
+    60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,
+    98,46,95,98,111,111,116,115,116,114,97,112,62,117,6,0,
+    0,0,95,115,101,116,117,112,246,6,0,0,115,92,0,0,
+    0,0,9,6,1,6,2,12,1,9,2,6,2,19,1,15,
+    1,16,2,13,1,13,1,15,1,18,2,13,1,20,2,33,
+    1,19,2,31,1,10,1,15,1,13,1,4,2,3,1,15,
+    1,5,1,13,1,12,2,12,2,3,1,19,1,13,2,11,
+    1,15,2,12,1,15,1,19,2,16,1,16,1,16,1,16,
+    1,22,2,19,1,19,1,12,1,13,1,12,1,117,6,0,
+    0,0,95,115,101,116,117,112,99,2,0,0,0,0,0,0,
+    0,3,0,0,0,3,0,0,0,67,0,0,0,115,136,0,
+    0,0,116,0,0,124,0,0,124,1,0,131,2,0,1,116,
+    1,0,131,0,0,125,2,0,116,2,0,106,3,0,106,4,
+    0,116,5,0,106,6,0,124,2,0,140,0,0,103,1,0,
+    131,1,0,1,116,2,0,106,7,0,106,8,0,116,9,0,
+    131,1,0,1,116,2,0,106,7,0,106,8,0,116,10,0,
+    131,1,0,1,116,11,0,106,12,0,100,1,0,107,2,0,
+    114,116,0,116,2,0,106,7,0,106,8,0,116,13,0,131,
+    1,0,1,110,0,0,116,2,0,106,7,0,106,8,0,116,
+    14,0,131,1,0,1,100,2,0,83,40,3,0,0,0,117,
+    50,0,0,0,73,110,115,116,97,108,108,32,105,109,112,111,
+    114,116,108,105,98,32,97,115,32,116,104,101,32,105,109,112,
+    108,101,109,101,110,116,97,116,105,111,110,32,111,102,32,105,
+    109,112,111,114,116,46,117,2,0,0,0,110,116,78,40,15,
+    0,0,0,117,6,0,0,0,95,115,101,116,117,112,117,27,
+    0,0,0,95,103,101,116,95,115,117,112,112,111,114,116,101,
+    100,95,102,105,108,101,95,108,111,97,100,101,114,115,117,3,
+    0,0,0,115,121,115,117,10,0,0,0,112,97,116,104,95,
+    104,111,111,107,115,117,6,0,0,0,101,120,116,101,110,100,
+    117,10,0,0,0,70,105,108,101,70,105,110,100,101,114,117,
+    9,0,0,0,112,97,116,104,95,104,111,111,107,117,9,0,
+    0,0,109,101,116,97,95,112,97,116,104,117,6,0,0,0,
+    97,112,112,101,110,100,117,15,0,0,0,66,117,105,108,116,
+    105,110,73,109,112,111,114,116,101,114,117,14,0,0,0,70,
+    114,111,122,101,110,73,109,112,111,114,116,101,114,117,3,0,
+    0,0,95,111,115,117,8,0,0,0,95,95,110,97,109,101,
+    95,95,117,21,0,0,0,87,105,110,100,111,119,115,82,101,
+    103,105,115,116,114,121,70,105,110,100,101,114,117,10,0,0,
+    0,80,97,116,104,70,105,110,100,101,114,40,3,0,0,0,
     117,10,0,0,0,115,121,115,95,109,111,100,117,108,101,117,
     11,0,0,0,95,105,109,112,95,109,111,100,117,108,101,117,
-    6,0,0,0,109,111,100,117,108,101,117,11,0,0,0,115,
-    101,108,102,95,109,111,100,117,108,101,117,12,0,0,0,98,
-    117,105,108,116,105,110,95,110,97,109,101,117,14,0,0,0,
-    98,117,105,108,116,105,110,95,109,111,100,117,108,101,117,10,
-    0,0,0,111,115,95,100,101,116,97,105,108,115,117,10,0,
-    0,0,98,117,105,108,116,105,110,95,111,115,117,15,0,0,
-    0,112,97,116,104,95,115,101,112,97,114,97,116,111,114,115,
-    117,8,0,0,0,112,97,116,104,95,115,101,112,117,9,0,
-    0,0,111,115,95,109,111,100,117,108,101,117,13,0,0,0,
-    116,104,114,101,97,100,95,109,111,100,117,108,101,117,14,0,
-    0,0,119,101,97,107,114,101,102,95,109,111,100,117,108,101,
-    117,13,0,0,0,119,105,110,114,101,103,95,109,111,100,117,
-    108,101,40,0,0,0,0,40,0,0,0,0,117,29,0,0,
-    0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,108,
-    105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,6,
-    0,0,0,95,115,101,116,117,112,158,6,0,0,115,92,0,
-    0,0,0,9,6,1,6,2,12,1,9,2,6,2,19,1,
-    15,1,16,2,13,1,13,1,15,1,18,2,13,1,20,2,
-    33,1,19,2,31,1,10,1,15,1,13,1,4,2,3,1,
-    15,1,5,1,13,1,12,2,12,2,3,1,19,1,13,2,
-    11,1,15,2,12,1,15,1,19,2,16,1,16,1,16,1,
-    16,1,22,2,19,1,19,1,12,1,13,1,12,1,117,6,
-    0,0,0,95,115,101,116,117,112,99,2,0,0,0,0,0,
-    0,0,3,0,0,0,3,0,0,0,67,0,0,0,115,136,
-    0,0,0,116,0,0,124,0,0,124,1,0,131,2,0,1,
-    116,1,0,131,0,0,125,2,0,116,2,0,106,3,0,106,
-    4,0,116,5,0,106,6,0,124,2,0,140,0,0,103,1,
-    0,131,1,0,1,116,2,0,106,7,0,106,8,0,116,9,
-    0,131,1,0,1,116,2,0,106,7,0,106,8,0,116,10,
-    0,131,1,0,1,116,11,0,106,12,0,100,1,0,107,2,
-    0,114,116,0,116,2,0,106,7,0,106,8,0,116,13,0,
-    131,1,0,1,110,0,0,116,2,0,106,7,0,106,8,0,
-    116,14,0,131,1,0,1,100,2,0,83,40,3,0,0,0,
-    117,50,0,0,0,73,110,115,116,97,108,108,32,105,109,112,
-    111,114,116,108,105,98,32,97,115,32,116,104,101,32,105,109,
-    112,108,101,109,101,110,116,97,116,105,111,110,32,111,102,32,
-    105,109,112,111,114,116,46,117,2,0,0,0,110,116,78,40,
-    15,0,0,0,117,6,0,0,0,95,115,101,116,117,112,117,
-    27,0,0,0,95,103,101,116,95,115,117,112,112,111,114,116,
-    101,100,95,102,105,108,101,95,108,111,97,100,101,114,115,117,
-    3,0,0,0,115,121,115,117,10,0,0,0,112,97,116,104,
-    95,104,111,111,107,115,117,6,0,0,0,101,120,116,101,110,
-    100,117,10,0,0,0,70,105,108,101,70,105,110,100,101,114,
-    117,9,0,0,0,112,97,116,104,95,104,111,111,107,117,9,
-    0,0,0,109,101,116,97,95,112,97,116,104,117,6,0,0,
-    0,97,112,112,101,110,100,117,15,0,0,0,66,117,105,108,
-    116,105,110,73,109,112,111,114,116,101,114,117,14,0,0,0,
-    70,114,111,122,101,110,73,109,112,111,114,116,101,114,117,3,
-    0,0,0,95,111,115,117,8,0,0,0,95,95,110,97,109,
-    101,95,95,117,21,0,0,0,87,105,110,100,111,119,115,82,
-    101,103,105,115,116,114,121,70,105,110,100,101,114,117,10,0,
-    0,0,80,97,116,104,70,105,110,100,101,114,40,3,0,0,
-    0,117,10,0,0,0,115,121,115,95,109,111,100,117,108,101,
-    117,11,0,0,0,95,105,109,112,95,109,111,100,117,108,101,
-    117,17,0,0,0,115,117,112,112,111,114,116,101,100,95,108,
-    111,97,100,101,114,115,40,0,0,0,0,40,0,0,0,0,
-    117,29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,
-    111,114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,
-    112,62,117,8,0,0,0,95,105,110,115,116,97,108,108,229,
-    6,0,0,115,16,0,0,0,0,2,13,1,9,1,28,1,
-    16,1,16,1,15,1,19,1,117,8,0,0,0,95,105,110,
-    115,116,97,108,108,40,3,0,0,0,117,3,0,0,0,119,
-    105,110,117,6,0,0,0,99,121,103,119,105,110,117,6,0,
-    0,0,100,97,114,119,105,110,40,73,0,0,0,117,7,0,
-    0,0,95,95,100,111,99,95,95,117,27,0,0,0,95,67,
-    65,83,69,95,73,78,83,69,78,83,73,84,73,86,69,95,
-    80,76,65,84,70,79,82,77,83,117,16,0,0,0,95,109,
-    97,107,101,95,114,101,108,97,120,95,99,97,115,101,117,7,
-    0,0,0,95,119,95,108,111,110,103,117,7,0,0,0,95,
-    114,95,108,111,110,103,117,10,0,0,0,95,112,97,116,104,
-    95,106,111,105,110,117,11,0,0,0,95,112,97,116,104,95,
-    115,112,108,105,116,117,18,0,0,0,95,112,97,116,104,95,
-    105,115,95,109,111,100,101,95,116,121,112,101,117,12,0,0,
-    0,95,112,97,116,104,95,105,115,102,105,108,101,117,11,0,
-    0,0,95,112,97,116,104,95,105,115,100,105,114,117,13,0,
-    0,0,95,119,114,105,116,101,95,97,116,111,109,105,99,117,
-    5,0,0,0,95,119,114,97,112,117,4,0,0,0,116,121,
-    112,101,117,8,0,0,0,95,95,99,111,100,101,95,95,117,
-    10,0,0,0,95,99,111,100,101,95,116,121,112,101,117,10,
-    0,0,0,110,101,119,95,109,111,100,117,108,101,117,13,0,
-    0,0,95,109,111,100,117,108,101,95,108,111,99,107,115,117,
-    12,0,0,0,95,98,108,111,99,107,105,110,103,95,111,110,
-    117,12,0,0,0,82,117,110,116,105,109,101,69,114,114,111,
-    114,117,14,0,0,0,95,68,101,97,100,108,111,99,107,69,
-    114,114,111,114,117,11,0,0,0,95,77,111,100,117,108,101,
-    76,111,99,107,117,16,0,0,0,95,68,117,109,109,121,77,
-    111,100,117,108,101,76,111,99,107,117,16,0,0,0,95,103,
-    101,116,95,109,111,100,117,108,101,95,108,111,99,107,117,19,
-    0,0,0,95,108,111,99,107,95,117,110,108,111,99,107,95,
-    109,111,100,117,108,101,117,25,0,0,0,95,99,97,108,108,
-    95,119,105,116,104,95,102,114,97,109,101,115,95,114,101,109,
-    111,118,101,100,117,3,0,0,0,111,114,100,117,17,0,0,
-    0,95,82,65,87,95,77,65,71,73,67,95,78,85,77,66,
-    69,82,117,5,0,0,0,98,121,116,101,115,117,5,0,0,
-    0,114,97,110,103,101,117,12,0,0,0,95,77,65,71,73,
-    67,95,66,89,84,69,83,117,8,0,0,0,95,80,89,67,
-    65,67,72,69,117,15,0,0,0,83,79,85,82,67,69,95,
-    83,85,70,70,73,88,69,83,117,23,0,0,0,68,69,66,
-    85,71,95,66,89,84,69,67,79,68,69,95,83,85,70,70,
-    73,88,69,83,117,27,0,0,0,79,80,84,73,77,73,90,
-    69,68,95,66,89,84,69,67,79,68,69,95,83,85,70,70,
-    73,88,69,83,117,17,0,0,0,99,97,99,104,101,95,102,
-    114,111,109,95,115,111,117,114,99,101,117,17,0,0,0,115,
-    111,117,114,99,101,95,102,114,111,109,95,99,97,99,104,101,
-    117,15,0,0,0,95,103,101,116,95,115,111,117,114,99,101,
-    102,105,108,101,117,16,0,0,0,95,118,101,114,98,111,115,
-    101,95,109,101,115,115,97,103,101,117,11,0,0,0,115,101,
-    116,95,112,97,99,107,97,103,101,117,10,0,0,0,115,101,
-    116,95,108,111,97,100,101,114,117,17,0,0,0,109,111,100,
-    117,108,101,95,102,111,114,95,108,111,97,100,101,114,117,11,
-    0,0,0,95,99,104,101,99,107,95,110,97,109,101,117,17,
-    0,0,0,95,114,101,113,117,105,114,101,115,95,98,117,105,
-    108,116,105,110,117,16,0,0,0,95,114,101,113,117,105,114,
-    101,115,95,102,114,111,122,101,110,117,17,0,0,0,95,102,
-    105,110,100,95,109,111,100,117,108,101,95,115,104,105,109,117,
-    15,0,0,0,66,117,105,108,116,105,110,73,109,112,111,114,
-    116,101,114,117,14,0,0,0,70,114,111,122,101,110,73,109,
-    112,111,114,116,101,114,117,21,0,0,0,87,105,110,100,111,
-    119,115,82,101,103,105,115,116,114,121,70,105,110,100,101,114,
-    117,13,0,0,0,95,76,111,97,100,101,114,66,97,115,105,
-    99,115,117,12,0,0,0,83,111,117,114,99,101,76,111,97,
-    100,101,114,117,10,0,0,0,70,105,108,101,76,111,97,100,
-    101,114,117,16,0,0,0,83,111,117,114,99,101,70,105,108,
-    101,76,111,97,100,101,114,117,20,0,0,0,83,111,117,114,
-    99,101,108,101,115,115,70,105,108,101,76,111,97,100,101,114,
-    117,18,0,0,0,69,88,84,69,78,83,73,79,78,95,83,
-    85,70,70,73,88,69,83,117,19,0,0,0,69,120,116,101,
-    110,115,105,111,110,70,105,108,101,76,111,97,100,101,114,117,
-    14,0,0,0,95,78,97,109,101,115,112,97,99,101,80,97,
-    116,104,117,15,0,0,0,78,97,109,101,115,112,97,99,101,
-    76,111,97,100,101,114,117,10,0,0,0,80,97,116,104,70,
-    105,110,100,101,114,117,10,0,0,0,70,105,108,101,70,105,
-    110,100,101,114,117,18,0,0,0,95,73,109,112,111,114,116,
-    76,111,99,107,67,111,110,116,101,120,116,117,13,0,0,0,
-    95,114,101,115,111,108,118,101,95,110,97,109,101,117,12,0,
-    0,0,95,102,105,110,100,95,109,111,100,117,108,101,117,13,
-    0,0,0,95,115,97,110,105,116,121,95,99,104,101,99,107,
-    117,8,0,0,0,95,69,82,82,95,77,83,71,117,23,0,
-    0,0,95,102,105,110,100,95,97,110,100,95,108,111,97,100,
-    95,117,110,108,111,99,107,101,100,117,14,0,0,0,95,102,
-    105,110,100,95,97,110,100,95,108,111,97,100,117,11,0,0,
-    0,95,103,99,100,95,105,109,112,111,114,116,117,16,0,0,
-    0,95,104,97,110,100,108,101,95,102,114,111,109,108,105,115,
-    116,117,17,0,0,0,95,99,97,108,99,95,95,95,112,97,
-    99,107,97,103,101,95,95,117,27,0,0,0,95,103,101,116,
-    95,115,117,112,112,111,114,116,101,100,95,102,105,108,101,95,
-    108,111,97,100,101,114,115,117,10,0,0,0,95,95,105,109,
-    112,111,114,116,95,95,117,6,0,0,0,95,115,101,116,117,
-    112,117,8,0,0,0,95,105,110,115,116,97,108,108,40,0,
-    0,0,0,40,0,0,0,0,40,0,0,0,0,117,29,0,
-    0,0,60,102,114,111,122,101,110,32,105,109,112,111,114,116,
-    108,105,98,46,95,98,111,111,116,115,116,114,97,112,62,117,
-    8,0,0,0,60,109,111,100,117,108,101,62,8,0,0,0,
-    115,132,0,0,0,6,21,6,3,12,13,12,16,12,13,12,
-    12,12,12,12,10,12,6,12,7,15,22,12,8,15,3,12,
-    12,6,2,6,3,22,4,19,68,19,23,12,19,12,20,12,
-    100,34,1,37,2,6,2,9,2,9,1,9,2,15,27,12,
-    23,12,21,12,8,12,13,12,11,12,55,12,18,12,11,12,
-    11,12,17,19,57,19,54,19,50,19,82,22,140,19,29,25,
-    49,25,25,6,3,19,45,19,55,19,18,19,91,19,125,19,
-    13,12,9,12,17,12,17,6,2,12,50,12,13,18,24,12,
-    34,12,15,12,11,24,36,12,71,
+    17,0,0,0,115,117,112,112,111,114,116,101,100,95,108,111,
+    97,100,101,114,115,40,0,0,0,0,40,0,0,0,0,117,
+    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
+    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
+    62,117,8,0,0,0,95,105,110,115,116,97,108,108,61,7,
+    0,0,115,16,0,0,0,0,2,13,1,9,1,28,1,16,
+    1,16,1,15,1,19,1,117,8,0,0,0,95,105,110,115,
+    116,97,108,108,40,3,0,0,0,117,3,0,0,0,119,105,
+    110,117,6,0,0,0,99,121,103,119,105,110,117,6,0,0,
+    0,100,97,114,119,105,110,40,77,0,0,0,117,7,0,0,
+    0,95,95,100,111,99,95,95,117,27,0,0,0,95,67,65,
+    83,69,95,73,78,83,69,78,83,73,84,73,86,69,95,80,
+    76,65,84,70,79,82,77,83,117,16,0,0,0,95,109,97,
+    107,101,95,114,101,108,97,120,95,99,97,115,101,117,7,0,
+    0,0,95,119,95,108,111,110,103,117,7,0,0,0,95,114,
+    95,108,111,110,103,117,10,0,0,0,95,112,97,116,104,95,
+    106,111,105,110,117,11,0,0,0,95,112,97,116,104,95,115,
+    112,108,105,116,117,18,0,0,0,95,112,97,116,104,95,105,
+    115,95,109,111,100,101,95,116,121,112,101,117,12,0,0,0,
+    95,112,97,116,104,95,105,115,102,105,108,101,117,11,0,0,
+    0,95,112,97,116,104,95,105,115,100,105,114,117,13,0,0,
+    0,95,119,114,105,116,101,95,97,116,111,109,105,99,117,5,
+    0,0,0,95,119,114,97,112,117,4,0,0,0,116,121,112,
+    101,117,8,0,0,0,95,95,99,111,100,101,95,95,117,10,
+    0,0,0,95,99,111,100,101,95,116,121,112,101,117,10,0,
+    0,0,110,101,119,95,109,111,100,117,108,101,117,13,0,0,
+    0,95,109,111,100,117,108,101,95,108,111,99,107,115,117,12,
+    0,0,0,95,98,108,111,99,107,105,110,103,95,111,110,117,
+    12,0,0,0,82,117,110,116,105,109,101,69,114,114,111,114,
+    117,14,0,0,0,95,68,101,97,100,108,111,99,107,69,114,
+    114,111,114,117,11,0,0,0,95,77,111,100,117,108,101,76,
+    111,99,107,117,16,0,0,0,95,68,117,109,109,121,77,111,
+    100,117,108,101,76,111,99,107,117,16,0,0,0,95,103,101,
+    116,95,109,111,100,117,108,101,95,108,111,99,107,117,19,0,
+    0,0,95,108,111,99,107,95,117,110,108,111,99,107,95,109,
+    111,100,117,108,101,117,25,0,0,0,95,99,97,108,108,95,
+    119,105,116,104,95,102,114,97,109,101,115,95,114,101,109,111,
+    118,101,100,117,3,0,0,0,111,114,100,117,17,0,0,0,
+    95,82,65,87,95,77,65,71,73,67,95,78,85,77,66,69,
+    82,117,5,0,0,0,98,121,116,101,115,117,5,0,0,0,
+    114,97,110,103,101,117,12,0,0,0,95,77,65,71,73,67,
+    95,66,89,84,69,83,117,8,0,0,0,95,80,89,67,65,
+    67,72,69,117,15,0,0,0,83,79,85,82,67,69,95,83,
+    85,70,70,73,88,69,83,117,23,0,0,0,68,69,66,85,
+    71,95,66,89,84,69,67,79,68,69,95,83,85,70,70,73,
+    88,69,83,117,27,0,0,0,79,80,84,73,77,73,90,69,
+    68,95,66,89,84,69,67,79,68,69,95,83,85,70,70,73,
+    88,69,83,117,17,0,0,0,99,97,99,104,101,95,102,114,
+    111,109,95,115,111,117,114,99,101,117,17,0,0,0,115,111,
+    117,114,99,101,95,102,114,111,109,95,99,97,99,104,101,117,
+    15,0,0,0,95,103,101,116,95,115,111,117,114,99,101,102,
+    105,108,101,117,16,0,0,0,95,118,101,114,98,111,115,101,
+    95,109,101,115,115,97,103,101,117,11,0,0,0,115,101,116,
+    95,112,97,99,107,97,103,101,117,10,0,0,0,115,101,116,
+    95,108,111,97,100,101,114,117,17,0,0,0,109,111,100,117,
+    108,101,95,102,111,114,95,108,111,97,100,101,114,117,11,0,
+    0,0,95,99,104,101,99,107,95,110,97,109,101,117,17,0,
+    0,0,95,114,101,113,117,105,114,101,115,95,98,117,105,108,
+    116,105,110,117,16,0,0,0,95,114,101,113,117,105,114,101,
+    115,95,102,114,111,122,101,110,117,17,0,0,0,95,102,105,
+    110,100,95,109,111,100,117,108,101,95,115,104,105,109,117,15,
+    0,0,0,66,117,105,108,116,105,110,73,109,112,111,114,116,
+    101,114,117,14,0,0,0,70,114,111,122,101,110,73,109,112,
+    111,114,116,101,114,117,21,0,0,0,87,105,110,100,111,119,
+    115,82,101,103,105,115,116,114,121,70,105,110,100,101,114,117,
+    13,0,0,0,95,76,111,97,100,101,114,66,97,115,105,99,
+    115,117,12,0,0,0,83,111,117,114,99,101,76,111,97,100,
+    101,114,117,10,0,0,0,70,105,108,101,76,111,97,100,101,
+    114,117,16,0,0,0,83,111,117,114,99,101,70,105,108,101,
+    76,111,97,100,101,114,117,20,0,0,0,83,111,117,114,99,
+    101,108,101,115,115,70,105,108,101,76,111,97,100,101,114,117,
+    18,0,0,0,69,88,84,69,78,83,73,79,78,95,83,85,
+    70,70,73,88,69,83,117,19,0,0,0,69,120,116,101,110,
+    115,105,111,110,70,105,108,101,76,111,97,100,101,114,117,14,
+    0,0,0,95,78,97,109,101,115,112,97,99,101,80,97,116,
+    104,117,15,0,0,0,78,97,109,101,115,112,97,99,101,76,
+    111,97,100,101,114,117,17,0,0,0,95,80,65,84,72,95,
+    73,78,68,69,88,95,77,65,71,73,67,117,11,0,0,0,
+    95,112,97,116,104,95,105,110,100,101,120,117,20,0,0,0,
+    95,112,97,116,104,95,105,110,100,101,120,95,102,105,108,101,
+    110,97,109,101,117,15,0,0,0,95,103,101,116,95,112,97,
+    116,104,95,105,110,100,101,120,117,10,0,0,0,80,97,116,
+    104,70,105,110,100,101,114,117,10,0,0,0,70,105,108,101,
+    70,105,110,100,101,114,117,18,0,0,0,95,73,109,112,111,
+    114,116,76,111,99,107,67,111,110,116,101,120,116,117,13,0,
+    0,0,95,114,101,115,111,108,118,101,95,110,97,109,101,117,
+    12,0,0,0,95,102,105,110,100,95,109,111,100,117,108,101,
+    117,13,0,0,0,95,115,97,110,105,116,121,95,99,104,101,
+    99,107,117,8,0,0,0,95,69,82,82,95,77,83,71,117,
+    23,0,0,0,95,102,105,110,100,95,97,110,100,95,108,111,
+    97,100,95,117,110,108,111,99,107,101,100,117,14,0,0,0,
+    95,102,105,110,100,95,97,110,100,95,108,111,97,100,117,11,
+    0,0,0,95,103,99,100,95,105,109,112,111,114,116,117,16,
+    0,0,0,95,104,97,110,100,108,101,95,102,114,111,109,108,
+    105,115,116,117,17,0,0,0,95,99,97,108,99,95,95,95,
+    112,97,99,107,97,103,101,95,95,117,27,0,0,0,95,103,
+    101,116,95,115,117,112,112,111,114,116,101,100,95,102,105,108,
+    101,95,108,111,97,100,101,114,115,117,10,0,0,0,95,95,
+    105,109,112,111,114,116,95,95,117,6,0,0,0,95,115,101,
+    116,117,112,117,8,0,0,0,95,105,110,115,116,97,108,108,
+    40,0,0,0,0,40,0,0,0,0,40,0,0,0,0,117,
+    29,0,0,0,60,102,114,111,122,101,110,32,105,109,112,111,
+    114,116,108,105,98,46,95,98,111,111,116,115,116,114,97,112,
+    62,117,8,0,0,0,60,109,111,100,117,108,101,62,8,0,
+    0,0,115,140,0,0,0,6,21,6,3,12,13,12,16,12,
+    13,12,12,12,12,12,10,12,6,12,7,15,22,12,8,15,
+    3,12,12,6,2,6,3,22,4,19,68,19,23,12,19,12,
+    20,12,100,34,1,37,2,6,2,9,2,9,1,9,2,15,
+    27,12,23,12,21,12,8,12,13,12,11,12,55,12,18,12,
+    11,12,11,12,17,19,57,19,54,19,50,19,88,22,140,19,
+    29,25,49,25,29,6,3,19,45,19,55,19,25,6,2,6,
+    3,12,9,12,30,19,94,19,149,19,13,12,9,12,17,12,
+    17,6,2,12,50,12,13,18,24,12,34,12,15,12,11,24,
+    36,12,71,
 };
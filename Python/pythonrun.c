@@ -74,6 +74,8 @@ extern int _PyLong_Init(void);
 extern void PyLong_Fini(void);
 extern int _PyFaulthandler_Init(void);
 extern void _PyFaulthandler_Fini(void);
+extern int _PyTraceMalloc_Init(void);
+extern void _PyTraceMalloc_Fini(void);
 
 #ifdef WITH_THREAD
 extern void _PyGILState_Init(PyInterpreterState *, PyThreadState *);
@@ -369,6 +371,10 @@ _Py_InitializeEx_Private(int install_sigs, int install_importlib)
     if (_PyFaulthandler_Init())
         Py_FatalError("Py_Initialize: can't initialize faulthandler");
 
+    /* start tracing memory allocations if requested */
+    if (_PyTraceMalloc_Init() < 0)
+        Py_FatalError("Py_Initialize: can't initialize tracemalloc");
+
     _PyTime_Init();
 
     if (initfsencoding(interp) < 0)
@@ -565,6 +571,9 @@ Py_Finalize(void)
     /* unload faulthandler module */
     _PyFaulthandler_Fini();
 
+    /* stop tracing memory allocations */
+    _PyTraceMalloc_Fini();
+
     /* Debugging stuff */
 #ifdef COUNT_ALLOCS
     dump_counts(stdout);
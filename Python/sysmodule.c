@@ -1031,6 +1031,80 @@ In Py_DEBUG mode, also perform some expensive internal consistency\n\
 checks.\n\
 ");
 
+#ifdef WITH_PYMALLOC
+static int
+set_malloc_stat(PyObject *dict, const char *name, size_t value)
+{
+    PyObject *obj;
+    int res;
+
+    obj = PyLong_FromSize_t(value);
+    if (obj == NULL)
+        return -1;
+    res = PyDict_SetItemString(dict, name, obj);
+    Py_DECREF(obj);
+    return res;
+}
+
+static PyObject *
+sys_getmallocstats(PyObject *self)
+{
+    _PyObject_MallocStats stats;
+    PyObject *dict, *classes = NULL;
+    unsigned int i;
+
+    /* Take the snapshot before allocating the result, which may create
+       new pools. */
+    _PyObject_GetMallocStats(&stats);
+
+    dict = PyDict_New();
+    if (dict == NULL)
+        return NULL;
+    if (set_malloc_stat(dict, "arena_size", stats.arena_size) < 0
+        || set_malloc_stat(dict, "pool_size", stats.pool_size) < 0
+        || set_malloc_stat(dict, "arenas_allocated_total",
+                           stats.arenas_allocated_total) < 0
+        || set_malloc_stat(dict, "arenas_reclaimed",
+                           stats.arenas_reclaimed) < 0
+        || set_malloc_stat(dict, "arenas_highwater",
+                           stats.arenas_highwater) < 0
+        || set_malloc_stat(dict, "arenas_allocated_current",
+                           stats.arenas_allocated_current) < 0
+        || set_malloc_stat(dict, "free_pools", stats.free_pools) < 0)
+        goto error;
+
+    classes = PyList_New(stats.nclasses);
+    if (classes == NULL)
+        goto error;
+    for (i = 0; i < stats.nclasses; i++) {
+        PyObject *item = Py_BuildValue("(nnnn)",
+            (Py_ssize_t)stats.classes[i].block_size,
+            (Py_ssize_t)stats.classes[i].pools,
+            (Py_ssize_t)stats.classes[i].blocks,
+            (Py_ssize_t)stats.classes[i].free_blocks);
+        if (item == NULL)
+            goto error;
+        PyList_SET_ITEM(classes, i, item);
+    }
+    if (PyDict_SetItemString(dict, "size_classes", classes) < 0)
+        goto error;
+    Py_DECREF(classes);
+    return dict;
+
+error:
+    Py_XDECREF(classes);
+    Py_DECREF(dict);
+    return NULL;
+}
+PyDoc_STRVAR(getmallocstats_doc,
+"_getmallocstats() -> dict\n\
+\n\
+Return a dict describing the state of pymalloc's arenas and pools:\n\
+arena counters and, for each size class, a (block size, pools,\n\
+blocks in use, free blocks) tuple.\n\
+");
+#endif
+
 #ifdef Py_TRACE_REFS
 /* Defined in objects.c because it uses static globals if that file */
 extern PyObject *_Py_GetObjects(PyObject *, PyObject *);
@@ -1131,6 +1205,10 @@ static PyMethodDef sys_methods[] = {
     {"call_tracing", sys_call_tracing, METH_VARARGS, call_tracing_doc},
     {"_debugmallocstats", sys_debugmallocstats, METH_VARARGS,
      debugmallocstats_doc},
+#ifdef WITH_PYMALLOC
+    {"_getmallocstats", (PyCFunction)sys_getmallocstats, METH_NOARGS,
+     getmallocstats_doc},
+#endif
     {NULL,              NULL}           /* sentinel */
 };
 